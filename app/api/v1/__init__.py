@@ -22,6 +22,7 @@ from app.api.v1.namespaces.capacity import ns as capacity_ns
 from app.api.v1.namespaces.credentials import ns as credentials_ns
 from app.api.v1.namespaces.dashboard import ns as dashboard_ns
 from app.api.v1.namespaces.databases import ns as databases_ns
+from app.api.v1.namespaces.exports import ns as exports_ns
 from app.api.v1.namespaces.health import ns as health_ns
 from app.api.v1.namespaces.instances import ns as instances_ns
 from app.api.v1.namespaces.jumpserver import ns as jumpserver_ns
@@ -72,6 +73,7 @@ def create_api_v1_blueprint(settings: Settings) -> Blueprint:
     api.add_namespace(ad_domain_configs_ns, path="/ad-domain-configs")
     api.add_namespace(sessions_ns, path="/sync-sessions")
     api.add_namespace(task_runs_ns, path="/task-runs")
+    api.add_namespace(exports_ns, path="/exports")
     api.add_namespace(partition_ns, path="/partitions")
     api.add_namespace(scheduler_ns, path="/scheduler")
     api.add_namespace(users_ns, path="/users")
@@ -9,12 +9,14 @@ from flask_restx import Namespace, fields, marshal
 from app.api.v1.models.envelope import get_error_envelope_model, make_success_envelope_model
 from app.api.v1.resources.base import BaseResource
 from app.api.v1.resources.decorators import api_login_required, api_permission_required
-from app.api.v1.resources.query_parsers import new_parser
+from app.api.v1.resources.pagination import build_paginated_data
+from app.api.v1.resources.query_parsers import add_keyset_pagination_arguments, new_parser
 from app.api.v1.restx_models.account_change_logs import (
     ACCOUNT_CHANGE_LOG_DETAIL_FIELDS,
     ACCOUNT_CHANGE_LOG_LIST_ITEM_FIELDS,
     ACCOUNT_CHANGE_LOG_STATISTICS_FIELDS,
 )
+from app.api.v1.restx_models.listing import KEYSET_PAGINATION_FIELDS
 from app.core.exceptions import ValidationError
 from app.schemas.account_change_logs_query import AccountChangeLogsListQuery, AccountChangeLogStatisticsQuery
 from app.schemas.validation import validate_or_raise
@@ -36,6 +38,7 @@ AccountChangeLogsListData = ns.model(
         "page": fields.Integer(),
         "pages": fields.Integer(),
         "limit": fields.Integer(),
+        **KEYSET_PAGINATION_FIELDS,
     },
 )
 
@@ -76,6 +79,7 @@ _account_change_logs_list_query_parser.add_argument("db_type", type=str, locatio
 _account_change_logs_list_query_parser.add_argument("change_type", type=str, location="args")
 _account_change_logs_list_query_parser.add_argument("status", type=str, location="args")
 _account_change_logs_list_query_parser.add_argument("hours", type=int, location="args")
+add_keyset_pagination_arguments(_account_change_logs_list_query_parser)
 
 _account_change_logs_statistics_query_parser = new_parser()
 _account_change_logs_statistics_query_parser.add_argument("hours", type=int, location="args")
@@ -103,13 +107,7 @@ class AccountChangeLogsResource(BaseResource):
             result = HistoryAccountChangeLogsReadService().list_logs(filters)
             items = marshal(result.items, ACCOUNT_CHANGE_LOG_LIST_ITEM_FIELDS)
             return self.success(
-                data={
-                    "items": items,
-                    "total": result.total,
-                    "page": result.page,
-                    "pages": result.pages,
-                    "limit": result.limit,
-                },
+                data=build_paginated_data(result, items),
                 message="获取账户变更历史成功",
             )
 
@@ -10,7 +10,9 @@ from flask_restx import Namespace, fields, marshal
 from app.api.v1.models.envelope import get_error_envelope_model, make_success_envelope_model
 from app.api.v1.resources.base import BaseResource
 from app.api.v1.resources.decorators import api_login_required, api_permission_required
-from app.api.v1.resources.query_parsers import bool_with_default, new_parser
+from app.api.v1.resources.downloads import build_csv_download_response
+from app.api.v1.resources.pagination import build_paginated_data
+from app.api.v1.resources.query_parsers import add_keyset_pagination_arguments, bool_with_default, new_parser
 from app.api.v1.restx_models.accounts import (
     ACCOUNT_CLASSIFICATION_RULE_STAT_ITEM_FIELDS,
     ACCOUNT_LEDGER_ITEM_FIELDS,
@@ -22,6 +24,7 @@ from app.api.v1.restx_models.instances import (
     INSTANCE_ACCOUNT_CHANGE_HISTORY_RESPONSE_FIELDS,
     INSTANCE_ACCOUNT_CHANGE_LOG_FIELDS,
 )
+from app.api.v1.restx_models.listing import KEYSET_PAGINATION_FIELDS
 from app.core.exceptions import ValidationError
 from app.core.types.account_scope import parse_account_scope
 from app.core.types.accounts_ledgers import AccountFilters
@@ -82,6 +85,7 @@ AccountLedgersListData = ns.model(
         "page": fields.Integer(),
         "pages": fields.Integer(),
         "limit": fields.Integer(),
+        **KEYSET_PAGINATION_FIELDS,
     },
 )
 
@@ -237,6 +241,7 @@ for argument in _accounts_filters_query_parser.args:
     _accounts_ledgers_list_query_parser.args.append(argument)
 _accounts_ledgers_list_query_parser.add_argument("sort", type=str, default="username", location="args")
 _accounts_ledgers_list_query_parser.add_argument("order", type=str, default="asc", location="args")
+add_keyset_pagination_arguments(_accounts_ledgers_list_query_parser)
 
 _accounts_statistics_summary_query_parser = new_parser()
 _accounts_statistics_summary_query_parser.add_argument("db_type", type=str, location="args")
@@ -439,13 +444,7 @@ class AccountsLedgersResource(BaseResource):
             result = AccountsLedgerListService().list_accounts(filters, sort_field=sort_field, sort_order=sort_order)
             items = marshal(result.items, ACCOUNT_LEDGER_ITEM_FIELDS)
             return self.success(
-                data={
-                    "items": items,
-                    "total": result.total,
-                    "page": result.page,
-                    "pages": result.pages,
-                    "limit": result.limit,
-                },
+                data=build_paginated_data(result, items),
                 message="获取账户列表成功",
             )
 
@@ -554,11 +553,7 @@ class AccountsLedgersExportResource(BaseResource):
 
         def _execute() -> Response:
             result = _account_export_service.export_accounts_csv(filters)
-            return Response(
-                result.content,
-                mimetype=result.mimetype,
-                headers={"Content-Disposition": f"attachment; filename={result.filename}"},
-            )
+            return build_csv_download_response(result)
 
         return self.safe_call(
             _execute,
@@ -588,9 +583,14 @@ class AccountsStatisticsResource(BaseResource):
         """获取账户统计信息."""
 
         def _execute():
-            result = AccountsStatisticsReadService().build_statistics()
+            read_service = AccountsStatisticsReadService()
+            result = read_service.build_statistics()
             stats_payload = marshal(result, ACCOUNT_STATISTICS_FIELDS)
-            return self.success(data={"stats": stats_payload}, message="获取账户统计信息成功")
+            return self.success(
+                data={"stats": stats_payload},
+                message="获取账户统计信息成功",
+                meta={"cache_generation": read_service.cache_generation},
+            )
 
         return self.safe_call(
             _execute,
@@ -619,12 +619,17 @@ class AccountsStatisticsSummaryResource(BaseResource):
         account_scope = parse_account_scope(raw_account_scope)
 
         def _execute():
-            summary = AccountsStatisticsReadService().fetch_summary(
+            read_service = AccountsStatisticsReadService()
+            summary = read_service.fetch_summary(
                 instance_id=None,
                 db_type=db_type,
                 account_scope=account_scope,
             )
-            return self.success(data=summary, message="获取账户统计汇总成功")
+            return self.success(
+                data=summary,
+                message="获取账户统计汇总成功",
+                meta={"cache_generation": read_service.cache_generation},
+            )
 
         return self.safe_call(
             _execute,
@@ -649,8 +654,13 @@ class AccountsStatisticsByDbTypeResource(BaseResource):
         """获取数据库类型统计."""
 
         def _execute():
-            stats = AccountsStatisticsReadService().fetch_db_type_stats()
-            return self.success(data=stats, message="获取数据库类型统计成功")
+            read_service = AccountsStatisticsReadService()
+            stats = read_service.fetch_db_type_stats()
+            return self.success(
+                data=stats,
+                message="获取数据库类型统计成功",
+                meta={"cache_generation": read_service.cache_generation},
+            )
 
         return self.safe_call(
             _execute,
@@ -674,8 +684,13 @@ class AccountsStatisticsByClassificationResource(BaseResource):
         """获取账户分类统计."""
 
         def _execute():
-            stats = AccountsStatisticsReadService().fetch_classification_stats()
-            return self.success(data=stats, message="获取账户分类统计成功")
+            read_service = AccountsStatisticsReadService()
+            stats = read_service.fetch_classification_stats()
+            return self.success(
+                data=stats,
+                message="获取账户分类统计成功",
+                meta={"cache_generation": read_service.cache_generation},
+            )
 
         return self.safe_call(
             _execute,
@@ -12,6 +12,7 @@ import app.services.database_sync as database_sync_module
 from app.api.v1.models.envelope import get_error_envelope_model, make_success_envelope_model
 from app.api.v1.resources.base import BaseResource
 from app.api.v1.resources.decorators import api_login_required, api_permission_required
+from app.api.v1.resources.downloads import build_csv_download_response
 from app.api.v1.resources.query_parsers import bool_with_default, new_parser
 from app.api.v1.restx_models.databases import (
     DATABASE_OPTION_ITEM_FIELDS,
@@ -406,11 +407,7 @@ class DatabaseLedgersExportResource(BaseResource):
                 instance_id=query.instance_id,
                 tags=query.tags,
             )
-            return Response(
-                result.content,
-                mimetype=result.mimetype,
-                headers={"Content-Disposition": f"attachment; filename={result.filename}"},
-            )
+            return build_csv_download_response(result)
 
         return self.safe_call(
             _execute,
@@ -0,0 +1,139 @@
+"""Exports namespace (后台导出任务).
+
+Note:
+- 同步导出接口(如 `/accounts/ledgers/exports`)仍为流式直出; 本 namespace 用于超出网关超时的超大导出.
+- 导出进度在任务运行中心(`/task-runs`)查看, 完成后通过 `result_url` 下载.
+
+"""
+
+from __future__ import annotations
+
+from typing import ClassVar
+
+from flask import send_file
+from flask_login import current_user
+from flask_restx import Namespace, fields
+
+from app.api.v1.models.envelope import get_error_envelope_model, make_success_envelope_model
+from app.api.v1.resources.base import BaseResource, get_raw_payload
+from app.api.v1.resources.decorators import api_login_required, api_permission_required
+from app.schemas.export_jobs import ExportJobCreatePayload
+from app.schemas.validation import validate_or_raise
+from app.services.files.export_jobs_service import ExportJobsService, build_export_download_url
+from app.utils.decorators import require_csrf
+
+ns = Namespace("exports", description="后台导出")
+
+ErrorEnvelope = get_error_envelope_model(ns)
+
+ExportJobCreatePayloadModel = ns.model(
+    "ExportJobCreatePayload",
+    {
+        "export_type": fields.String(
+            required=True,
+            description="导出类型: accounts_ledger/database_ledger/instances",
+        ),
+        "filters": fields.Raw(required=False, description="筛选条件, 与对应同步导出接口的 query 参数一致"),
+    },
+)
+
+ExportJobCreateData = ns.model(
+    "ExportJobCreateData",
+    {
+        "run_id": fields.String(required=True),
+        "export_type": fields.String(required=True),
+        "download_url": fields.String(required=True),
+    },
+)
+ExportJobCreateSuccessEnvelope = make_success_envelope_model(
+    ns,
+    "ExportJobCreateSuccessEnvelope",
+    ExportJobCreateData,
+)
+
+_export_jobs_service = ExportJobsService()
+
+
+@ns.route("/jobs")
+class ExportJobsResource(BaseResource):
+    """后台导出任务资源."""
+
+    method_decorators: ClassVar[list] = [api_login_required]
+
+    @ns.expect(ExportJobCreatePayloadModel, validate=False)
+    @ns.response(200, "OK", ExportJobCreateSuccessEnvelope)
+    @ns.response(400, "Bad Request", ErrorEnvelope)
+    @ns.response(401, "Unauthorized", ErrorEnvelope)
+    @ns.response(403, "Forbidden", ErrorEnvelope)
+    @ns.response(500, "Internal Server Error", ErrorEnvelope)
+    @api_permission_required("view")
+    @require_csrf
+    def post(self):
+        """创建后台导出任务."""
+        payload = validate_or_raise(ExportJobCreatePayload, get_raw_payload())
+        created_by = current_user.id if current_user.is_authenticated else None
+        actions_service = _export_jobs_service
+        prepared = None
+
+        def _execute():
+            nonlocal prepared
+            prepared = actions_service.prepare_export_job(payload=payload, created_by=created_by)
+            return self.success(
+                data={
+                    "run_id": prepared.run_id,
+                    "export_type": prepared.export_type,
+                    "download_url": build_export_download_url(prepared.run_id),
+                },
+                message="导出任务已在后台启动,请稍后在运行中心查看进度.",
+            )
+
+        response = self.safe_call(
+            _execute,
+            module="exports",
+            action="create_export_job",
+            public_error="创建导出任务失败",
+            context={"export_type": payload.export_type},
+        )
+
+        if prepared is not None:
+            actions_service.launch_export_job(created_by=created_by, prepared=prepared)
+        return response
+
+
+@ns.route("/jobs/<string:run_id>/file")
+class ExportJobFileResource(BaseResource):
+    """后台导出文件下载资源."""
+
+    method_decorators: ClassVar[list] = [api_login_required]
+
+    @ns.response(200, "OK")
+    @ns.response(206, "Partial Content")
+    @ns.response(401, "Unauthorized", ErrorEnvelope)
+    @ns.response(403, "Forbidden", ErrorEnvelope)
+    @ns.response(404, "Not Found", ErrorEnvelope)
+    @ns.response(409, "Conflict", ErrorEnvelope)
+    @ns.response(500, "Internal Server Error", ErrorEnvelope)
+    @api_permission_required("view")
+    def get(self, run_id: str):
+        """下载导出文件(支持 Range 断点续传)."""
+        user_id = current_user.id if current_user.is_authenticated else None
+        is_admin = bool(current_user.is_authenticated and current_user.is_admin())
+
+        def _execute():
+            download = _export_jobs_service.resolve_download(run_id, user_id=user_id, is_admin=is_admin)
+            return send_file(
+                download.path,
+                mimetype=download.mimetype,
+                as_attachment=True,
+                download_name=download.filename,
+                conditional=True,
+                max_age=0,
+            )
+
+        return self.safe_call(
+            _execute,
+            module="exports",
+            action="download_export_file",
+            public_error="下载导出文件失败",
+            context={"run_id": run_id},
+        )
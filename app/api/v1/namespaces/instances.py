@@ -14,7 +14,9 @@ from flask_restx import Namespace, fields, marshal
 from app.api.v1.models.envelope import get_error_envelope_model, make_success_envelope_model
 from app.api.v1.resources.base import BaseResource, get_raw_payload
 from app.api.v1.resources.decorators import api_login_required, api_permission_required
-from app.api.v1.resources.query_parsers import bool_with_default, new_parser
+from app.api.v1.resources.downloads import build_csv_download_response
+from app.api.v1.resources.pagination import build_paginated_data
+from app.api.v1.resources.query_parsers import add_keyset_pagination_arguments, bool_with_default, new_parser
 from app.api.v1.restx_models.instances import (
     ACCOUNT_SCOPE_OPTION_ITEM_FIELDS,
     ACCOUNT_SCOPE_OPTIONS_RESPONSE_FIELDS,
@@ -32,6 +34,7 @@ from app.api.v1.restx_models.instances import (
     INSTANCE_TAG_FIELDS,
     INSTANCES_OPTIONS_RESPONSE_FIELDS,
 )
+from app.api.v1.restx_models.listing import KEYSET_PAGINATION_FIELDS
 from app.core.constants import HttpHeaders, HttpStatus
 from app.core.constants.import_templates import (
     INSTANCE_IMPORT_REQUIRED_FIELDS,
@@ -117,6 +120,7 @@ InstancesListData = ns.model(
         "page": fields.Integer(),
         "pages": fields.Integer(),
         "limit": fields.Integer(),
+        **KEYSET_PAGINATION_FIELDS,
     },
 )
 
@@ -393,6 +397,7 @@ _instances_list_query_parser.add_argument(
     default=False,
     location="args",
 )
+add_keyset_pagination_arguments(_instances_list_query_parser)
 
 _instances_options_query_parser = new_parser()
 _instances_options_query_parser.add_argument("db_type", type=str, action="append", location="args")
@@ -566,13 +571,7 @@ class InstancesResource(BaseResource):
             result = InstanceListService().list_instances(filters)
             items = marshal(result.items, INSTANCE_LIST_ITEM_FIELDS)
             return self.success(
-                data={
-                    "items": items,
-                    "total": result.total,
-                    "page": result.page,
-                    "pages": result.pages,
-                    "limit": result.limit,
-                },
+                data=build_paginated_data(result, items),
                 message="获取实例列表成功",
             )
 
@@ -654,11 +653,7 @@ class InstancesExportResource(BaseResource):
 
         def _execute() -> Response:
             result = _instances_export_service.export_instances_csv(filters)
-            return Response(
-                result.content,
-                mimetype=result.mimetype,
-                headers={"Content-Disposition": f"attachment; filename={result.filename}"},
-            )
+            return build_csv_download_response(result)
 
         return self.safe_call(
             _execute,
@@ -5,11 +5,12 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
-from typing import ClassVar, cast
+import json
+from collections.abc import Iterator, Mapping
+from typing import TYPE_CHECKING, ClassVar, cast
 from uuid import uuid4
 
-from flask import request
+from flask import Response, current_app, has_app_context, request, stream_with_context
 from flask_restx import fields
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -20,18 +21,30 @@ from app.api.v1.resources.decorators import api_login_required, api_permission_r
 from app.core.constants.system_constants import ErrorCategory, ErrorMessages, ErrorSeverity
 from app.core.exceptions import AppError, NotFoundError, ValidationError
 from app.core.types import JsonDict, JsonValue
-from app.infra.route_safety import log_with_context
+from app.infra.route_safety import log_with_context, safe_route_call
+from app.repositories.instances_repository import InstancesRepository
 from app.schemas.instances_connections import InstanceConnectionTestPayload
-from app.services.connection_adapters.connection_test_service import ConnectionTestService
+from app.services.connection_adapters.connection_test_service import (
+    ConnectionTestService,
+    TempConnectionTestInstance,
+)
+from app.services.connection_adapters.node_poller import ConcurrentNodePoller
 from app.services.connections.instance_connection_status_service import InstanceConnectionStatusService
 from app.services.connections.instance_connections_write_service import InstanceConnectionsWriteService
 from app.services.credentials import CredentialDetailReadService
 from app.services.instances.instance_detail_read_service import InstanceDetailReadService
+from app.settings import DEFAULT_CONNECTION_BATCH_TEST_DEADLINE_SECONDS
 from app.utils.decorators import require_csrf
 from app.utils.response_utils import unified_error_response, unified_success_response
+from app.utils.time_utils import time_utils
+
+if TYPE_CHECKING:
+    from app.models.instance import Instance
 
 ErrorEnvelope = get_error_envelope_model(ns)
 
+NDJSON_MIMETYPE = "application/x-ndjson"
+
 EmptySuccessEnvelope = make_success_envelope_model(ns, "InstancesConnectionsEmptySuccessEnvelope")
 
 ConnectionTestPayload = ns.model(
@@ -104,6 +117,19 @@ BatchTestSuccessEnvelope = make_success_envelope_model(
     BatchTestData,
 )
 
+ConnectionReachabilityData = ns.model(
+    "InstancesConnectionsReachabilityData",
+    {
+        "status": fields.String(description="后台探测可达性(up/down/unknown)", example="up"),
+        "last_checked_at": fields.String(required=False, description="最近探测时间(ISO8601, 可选)", example=None),
+        "last_latency_ms": fields.Float(required=False, description="最近一次 TCP 连接耗时(毫秒)", example=1.2),
+        "avg_latency_ms": fields.Float(required=False, description="滚动窗口平均连接耗时(毫秒)", example=1.5),
+        "availability_ratio": fields.Float(required=False, description="滚动窗口可用率(0-1)", example=1.0),
+        "consecutive_failures": fields.Integer(required=False, description="连续探测失败次数", example=0),
+        "last_error": fields.String(required=False, description="最近一次探测错误", example=None),
+    },
+)
+
 ConnectionStatusData = ns.model(
     "InstancesConnectionsConnectionStatusData",
     {
@@ -115,6 +141,7 @@ ConnectionStatusData = ns.model(
         "last_connected": fields.String(required=False, description="最后连接时间(ISO8601, 可选)", example=None),
         "status": fields.String(description="状态", example="ok"),
         "is_active": fields.Boolean(description="是否启用", example=True),
+        "reachability": fields.Nested(ConnectionReachabilityData, description="后台可达性探测状态"),
     },
 )
 
@@ -124,6 +151,7 @@ ConnectionStatusSuccessEnvelope = make_success_envelope_model(
     ConnectionStatusData,
 )
 
+
 BATCH_TEST_EXCEPTIONS: tuple[type[BaseException], ...] = (
     SQLAlchemyError,
     ConnectionError,
@@ -195,52 +223,131 @@ def _test_new_connection(
     return _build_connection_test_failed_response(result)
 
 
-def _execute_batch_tests(
-    connection_test_service: ConnectionTestService, instance_ids: list[int]
-) -> tuple[list[JsonDict], int, int]:
-    results: list[JsonDict] = []
-    success_count = 0
-    fail_count = 0
+def _batch_test_deadline_seconds() -> float:
+    if has_app_context():
+        config = current_app.config
+        return float(
+            config.get("CONNECTION_BATCH_TEST_DEADLINE_SECONDS", DEFAULT_CONNECTION_BATCH_TEST_DEADLINE_SECONDS)
+        )
+    return float(DEFAULT_CONNECTION_BATCH_TEST_DEADLINE_SECONDS)
+
+
+def _build_batch_test_failure(instance_id: int, exc: Exception) -> JsonDict:
+    error_id = uuid4().hex
+    is_timeout = isinstance(exc, TimeoutError)
+    log_with_context(
+        "warning",
+        "批量连接测试单实例失败",
+        module="connections",
+        action="batch_test_single",
+        context={"instance_id": instance_id},
+        extra={"error_id": error_id, "error_type": exc.__class__.__name__, "error_message": str(exc)},
+    )
+    return {
+        "instance_id": instance_id,
+        "success": False,
+        "message": ErrorMessages.DATABASE_CONNECTION_ERROR,
+        "error_code": "BATCH_TEST_TIMEOUT" if is_timeout else "BATCH_TEST_FAILED",
+        "error_id": error_id,
+    }
+
+
+def _build_connection_update(
+    snapshot: TempConnectionTestInstance,
+    outcome: Mapping[str, object] | Exception,
+) -> dict[str, object] | None:
+    # 超时实例的工作线程可能仍在连接, 以截止时刻作为最近一次尝试时间
+    last_connected = time_utils.now() if isinstance(outcome, TimeoutError) else snapshot.last_connected
+    if last_connected is None:
+        return None
+    row: dict[str, object] = {"id": snapshot.id, "last_connected": last_connected}
+    if isinstance(outcome, Mapping) and outcome.get("success"):
+        row["database_version"] = snapshot.database_version
+        row["main_version"] = snapshot.main_version
+        row["detailed_version"] = snapshot.detailed_version
+    return row
+
+
+def _iter_batch_tests(
+    connection_test_service: ConnectionTestService,
+    instance_ids: list[int],
+    connection_updates: list[dict[str, object]] | None = None,
+) -> Iterator[tuple[int, JsonDict]]:
+    """按完成顺序产出 (请求中的位置, 单实例结果); 连接时间写回行追加到 connection_updates."""
     instance_detail_service = InstanceDetailReadService()
-
-    for instance_id in instance_ids:
+    targets: list[tuple[int, int, str, TempConnectionTestInstance]] = []
+    for position, instance_id in enumerate(instance_ids):
         try:
             instance = instance_detail_service.get_instance_by_id(instance_id)
-            if instance is None:
-                results.append({"instance_id": instance_id, "success": False, "error": "实例不存在"})
-                fail_count += 1
-                continue
-
-            result = cast("JsonDict", connection_test_service.test_connection(instance))
-            result["instance_id"] = instance_id
-            result["instance_name"] = instance.name
-            if result.get("success"):
-                success_count += 1
-            else:
-                fail_count += 1
-            results.append(result)
         except BATCH_TEST_EXCEPTIONS as exc:
-            error_id = uuid4().hex
-            results.append(
-                {
-                    "instance_id": instance_id,
-                    "success": False,
-                    "message": ErrorMessages.DATABASE_CONNECTION_ERROR,
-                    "error_code": "BATCH_TEST_FAILED",
-                    "error_id": error_id,
-                },
-            )
+            yield position, _build_batch_test_failure(instance_id, cast("Exception", exc))
+            continue
+        if instance is None:
+            yield position, {"instance_id": instance_id, "success": False, "error": "实例不存在"}
+            continue
+        targets.append((position, instance_id, instance.name, TempConnectionTestInstance.from_instance(instance)))
+
+    def _probe(target: tuple[int, int, str, TempConnectionTestInstance]) -> JsonDict:
+        return cast("JsonDict", connection_test_service.test_connection(cast("Instance", target[3])))
+
+    poller = ConcurrentNodePoller.for_connection_batch_test()
+    for index, outcome in poller.iter_poll(_probe, targets, deadline_seconds=_batch_test_deadline_seconds()):
+        position, instance_id, instance_name, snapshot = targets[index]
+        if isinstance(outcome, Exception):
+            result = _build_batch_test_failure(instance_id, outcome)
+        else:
+            result = dict(outcome)
+            result["instance_id"] = instance_id
+            result["instance_name"] = instance_name
+        if connection_updates is not None:
+            update_row = _build_connection_update(snapshot, outcome)
+            if update_row is not None:
+                connection_updates.append(update_row)
+        yield position, result
+
+
+def _execute_batch_tests(
+    connection_test_service: ConnectionTestService,
+    instance_ids: list[int],
+    connection_updates: list[dict[str, object]] | None = None,
+) -> tuple[list[JsonDict], int, int]:
+    collected = sorted(
+        _iter_batch_tests(connection_test_service, instance_ids, connection_updates),
+        key=lambda item: item[0],
+    )
+    results = [result for _, result in collected]
+    success_count = sum(1 for result in results if result.get("success"))
+    return results, success_count, len(results) - success_count
+
+
+def _persist_connection_updates(connection_updates: list[dict[str, object]]) -> None:
+    InstancesRepository.bulk_update_connection_results(connection_updates)
+
+
+def _stream_batch_tests(connection_test_service: ConnectionTestService, instance_ids: list[int]) -> Iterator[str]:
+    connection_updates: list[dict[str, object]] = []
+    success_count = fail_count = 0
+    for _, result in _iter_batch_tests(connection_test_service, instance_ids, connection_updates):
+        if result.get("success"):
+            success_count += 1
+        else:
             fail_count += 1
-            log_with_context(
-                "warning",
-                "批量连接测试单实例失败",
-                module="connections",
-                action="batch_test_single",
-                context={"instance_id": instance_id},
-                extra={"error_id": error_id, "error_type": exc.__class__.__name__, "error_message": str(exc)},
-            )
+        yield json.dumps({"type": "result", "data": result}, ensure_ascii=False, default=str) + "\n"
+
+    # 响应头已发出, 写库失败时由 safe_route_call 记录日志并中断流, 客户端收不到 summary 行
+    safe_route_call(
+        lambda: _persist_connection_updates(connection_updates),
+        module="connections",
+        action="batch_test_connections_persist",
+        public_error="批量测试连接结果保存失败",
+        context={"updates": len(connection_updates)},
+    )
+    summary = {"total": len(instance_ids), "success": success_count, "failed": fail_count}
+    yield json.dumps({"type": "summary", "data": summary}, ensure_ascii=False) + "\n"
+
 
-    return results, success_count, fail_count
+def _wants_ndjson() -> bool:
+    return request.accept_mimetypes.best_match(["application/json", NDJSON_MIMETYPE]) == NDJSON_MIMETYPE
 
 
 @ns.route("/actions/test-connection")
@@ -326,14 +433,30 @@ class InstancesConnectionsBatchTestResource(BaseResource):
     @ns.response(500, "Internal Server Error", ErrorEnvelope)
     @require_csrf
     def post(self):
-        """执行批量连接测试."""
+        """执行批量连接测试.
+
+        请求头 `Accept: application/x-ndjson` 时按完成顺序逐行返回单实例结果, 最后一行为汇总.
+        """
         raw = _parse_json_payload()
         write_service = InstanceConnectionsWriteService()
 
         def _execute():
             parsed = write_service.parse_batch_test_payload(raw)
             instance_ids = parsed.instance_ids
-            results, success_count, fail_count = _execute_batch_tests(ConnectionTestService(), instance_ids)
+            if _wants_ndjson():
+                body = _stream_batch_tests(ConnectionTestService(), instance_ids)
+                return Response(
+                    stream_with_context(body),
+                    mimetype=NDJSON_MIMETYPE,
+                    headers={"X-Accel-Buffering": "no", "Cache-Control": "no-cache"},
+                )
+            connection_updates: list[dict[str, object]] = []
+            results, success_count, fail_count = _execute_batch_tests(
+                ConnectionTestService(),
+                instance_ids,
+                connection_updates,
+            )
+            _persist_connection_updates(connection_updates)
             summary = {"total": len(instance_ids), "success": success_count, "failed": fail_count}
             return self.success(
                 data={"results": results, "summary": summary},
@@ -9,13 +9,15 @@ from flask_restx import Namespace, fields, marshal
 from app.api.v1.models.envelope import get_error_envelope_model, make_success_envelope_model
 from app.api.v1.resources.base import BaseResource
 from app.api.v1.resources.decorators import api_login_required, api_permission_required
-from app.api.v1.resources.query_parsers import new_parser
+from app.api.v1.resources.pagination import build_paginated_data
+from app.api.v1.resources.query_parsers import add_keyset_pagination_arguments, new_parser
 from app.api.v1.restx_models.history import (
     HISTORY_LOG_ITEM_FIELDS,
     HISTORY_LOG_MODULES_FIELDS,
     HISTORY_LOG_STATISTICS_FIELDS,
     HISTORY_LOG_TOP_MODULE_FIELDS,
 )
+from app.api.v1.restx_models.listing import KEYSET_PAGINATION_FIELDS
 from app.core.exceptions import ValidationError
 from app.schemas.history_logs_query import HistoryLogsListQuery, HistoryLogStatisticsQuery
 from app.schemas.validation import validate_or_raise
@@ -37,6 +39,7 @@ HistoryLogsListData = ns.model(
         "page": fields.Integer(),
         "pages": fields.Integer(),
         "limit": fields.Integer(),
+        **KEYSET_PAGINATION_FIELDS,
     },
 )
 
@@ -89,6 +92,7 @@ _history_logs_list_query_parser.add_argument("search", type=str, default="", loc
 _history_logs_list_query_parser.add_argument("start_time", type=str, location="args")
 _history_logs_list_query_parser.add_argument("end_time", type=str, location="args")
 _history_logs_list_query_parser.add_argument("hours", type=int, location="args")
+add_keyset_pagination_arguments(_history_logs_list_query_parser)
 
 _history_log_statistics_query_parser = new_parser()
 _history_log_statistics_query_parser.add_argument("hours", type=int, default=24, location="args")
@@ -116,13 +120,7 @@ class HistoryLogsResource(BaseResource):
             result = HistoryLogsListService().list_logs(filters)
             items = marshal(result.items, HISTORY_LOG_ITEM_FIELDS)
             return self.success(
-                data={
-                    "items": items,
-                    "total": result.total,
-                    "page": result.page,
-                    "pages": result.pages,
-                    "limit": result.limit,
-                },
+                data=build_paginated_data(result, items),
                 message="日志列表获取成功",
             )
 
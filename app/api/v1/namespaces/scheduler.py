@@ -11,7 +11,12 @@ from flask_restx import Namespace, fields, marshal
 from app.api.v1.models.envelope import get_error_envelope_model, make_success_envelope_model
 from app.api.v1.resources.base import BaseResource
 from app.api.v1.resources.decorators import api_login_required, api_permission_required
-from app.api.v1.restx_models.scheduler import SCHEDULER_JOB_DETAIL_FIELDS, SCHEDULER_JOB_LIST_ITEM_FIELDS
+from app.api.v1.restx_models.scheduler import (
+    SCHEDULER_EXECUTOR_STATS_FIELDS,
+    SCHEDULER_JOB_DETAIL_FIELDS,
+    SCHEDULER_JOB_LIST_ITEM_FIELDS,
+    SCHEDULER_LEADER_STATUS_FIELDS,
+)
 from app.core.exceptions import ConflictError, NotFoundError, ValidationError
 from app.services.scheduler.scheduler_actions_service import SchedulerActionsService
 from app.services.scheduler.scheduler_job_write_service import SchedulerJobWriteService
@@ -27,6 +32,8 @@ SchedulerJobsListSuccessEnvelope = make_success_envelope_model(ns, "SchedulerJob
 SchedulerJobDetailSuccessEnvelope = make_success_envelope_model(ns, "SchedulerJobDetailSuccessEnvelope")
 SchedulerJobUpdateSuccessEnvelope = make_success_envelope_model(ns, "SchedulerJobUpdateSuccessEnvelope")
 SchedulerJobDeleteSuccessEnvelope = make_success_envelope_model(ns, "SchedulerJobDeleteSuccessEnvelope")
+SchedulerExecutorsSuccessEnvelope = make_success_envelope_model(ns, "SchedulerExecutorsSuccessEnvelope")
+SchedulerLeaderSuccessEnvelope = make_success_envelope_model(ns, "SchedulerLeaderSuccessEnvelope")
 
 SchedulerJobUpdatePayload = ns.model(
     "SchedulerJobUpdatePayload",
@@ -94,6 +101,64 @@ class SchedulerJobsResource(BaseResource):
         )
 
 
+@ns.route("/executors")
+class SchedulerExecutorsResource(BaseResource):
+    """调度执行器统计资源."""
+
+    method_decorators: ClassVar[list] = [api_login_required, api_permission_required("view")]
+
+    @ns.response(200, "OK", SchedulerExecutorsSuccessEnvelope)
+    @ns.response(401, "Unauthorized", ErrorEnvelope)
+    @ns.response(403, "Forbidden", ErrorEnvelope)
+    @ns.response(409, "Conflict", ErrorEnvelope)
+    @ns.response(500, "Internal Server Error", ErrorEnvelope)
+    def get(self):
+        """获取执行器排队深度与等待时间."""
+
+        def _execute():
+            executors = SchedulerJobsReadService().list_executors()
+            payload = marshal(executors, SCHEDULER_EXECUTOR_STATS_FIELDS)
+            return self.success(data=payload, message="执行器统计获取成功")
+
+        return self.safe_call(
+            _execute,
+            module="scheduler",
+            action="get_executors",
+            public_error="获取执行器统计失败",
+            context={"endpoint": "executors"},
+            expected_exceptions=(ConflictError,),
+        )
+
+
+@ns.route("/leader")
+class SchedulerLeaderResource(BaseResource):
+    """调度主节点状态资源."""
+
+    method_decorators: ClassVar[list] = [api_login_required, api_permission_required("view")]
+
+    @ns.response(200, "OK", SchedulerLeaderSuccessEnvelope)
+    @ns.response(401, "Unauthorized", ErrorEnvelope)
+    @ns.response(403, "Forbidden", ErrorEnvelope)
+    @ns.response(409, "Conflict", ErrorEnvelope)
+    @ns.response(500, "Internal Server Error", ErrorEnvelope)
+    def get(self):
+        """获取 jobstore 模式与调度主节点."""
+
+        def _execute():
+            status = SchedulerJobsReadService().get_leader_status()
+            payload = marshal(status, SCHEDULER_LEADER_STATUS_FIELDS)
+            return self.success(data=payload, message="调度主节点状态获取成功")
+
+        return self.safe_call(
+            _execute,
+            module="scheduler",
+            action="get_leader",
+            public_error="获取调度主节点状态失败",
+            context={"endpoint": "leader"},
+            expected_exceptions=(ConflictError,),
+        )
+
+
 @ns.route("/jobs/<string:job_id>")
 class SchedulerJobDetailResource(BaseResource):
     """调度任务详情资源."""
@@ -201,6 +266,7 @@ class SchedulerJobPauseResource(BaseResource):
 
         def _execute():
             scheduler = _ensure_scheduler_running()
+            SchedulerActionsService.ensure_job_pausable(scheduler, job_id)
             scheduler.pause_job(job_id)
             log_info("任务暂停成功", module="scheduler", job_id=job_id)
             return self.success(message="任务暂停成功")
@@ -232,6 +298,7 @@ class SchedulerJobResumeResource(BaseResource):
 
         def _execute():
             scheduler = _ensure_scheduler_running()
+            SchedulerActionsService.ensure_job_pausable(scheduler, job_id)
             scheduler.resume_job(job_id)
             log_info("任务恢复成功", module="scheduler", job_id=job_id)
             return self.success(message="任务恢复成功")
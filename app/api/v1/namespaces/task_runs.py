@@ -44,6 +44,7 @@ TaskRunsListSuccessEnvelope = make_success_envelope_model(ns, "TaskRunsListSucce
 
 TaskRunDetailSuccessEnvelope = make_success_envelope_model(ns, "TaskRunDetailSuccessEnvelope")
 TaskRunErrorLogsSuccessEnvelope = make_success_envelope_model(ns, "TaskRunErrorLogsSuccessEnvelope")
+TaskRunPipelineSuccessEnvelope = make_success_envelope_model(ns, "TaskRunPipelineSuccessEnvelope")
 TaskRunCancelSuccessEnvelope = make_success_envelope_model(ns, "TaskRunCancelSuccessEnvelope")
 
 _task_runs_list_query_parser = new_parser()
@@ -164,6 +165,34 @@ class TaskRunErrorLogsResource(BaseResource):
         )
 
 
+@ns.route("/<string:run_id>/pipeline")
+class TaskRunPipelineResource(BaseResource):
+    """任务运行依赖流水线资源."""
+
+    method_decorators: ClassVar[list] = [api_login_required, api_permission_required("view")]
+
+    @ns.response(200, "OK", TaskRunPipelineSuccessEnvelope)
+    @ns.response(401, "Unauthorized", ErrorEnvelope)
+    @ns.response(403, "Forbidden", ErrorEnvelope)
+    @ns.response(404, "Not Found", ErrorEnvelope)
+    @ns.response(500, "Internal Server Error", ErrorEnvelope)
+    def get(self, run_id: str):
+        """获取任务运行所在依赖流水线与关键路径耗时."""
+
+        def _execute():
+            result = TaskRunsReadService().get_run_pipeline(run_id)
+            return self.success(data=asdict(result), message="获取任务流水线成功")
+
+        return self.safe_call(
+            _execute,
+            module="task_runs",
+            action="get_run_pipeline",
+            public_error="获取任务流水线失败",
+            context={"run_id": run_id},
+            expected_exceptions=(NotFoundError,),
+        )
+
+
 @ns.route("/<string:run_id>/actions/cancel")
 class TaskRunCancelResource(BaseResource):
     """任务运行取消资源."""
@@ -15,7 +15,7 @@ from app.infra.route_safety import log_with_context
 from app.repositories.instances_repository import InstancesRepository
 from app.repositories.veeam_repository import VeeamRepository
 from app.schemas.validation import validate_or_raise
-from app.schemas.veeam import VeeamSourceBindingPayload
+from app.schemas.veeam import VeeamSourceBindingPayload, VeeamSyncActionPayload
 from app.services.veeam.source_service import VeeamSourceService
 from app.services.veeam.sync_actions_service import VeeamSyncActionsService
 from app.utils.decorators import require_csrf
@@ -63,6 +63,17 @@ VeeamSourceBindingPayloadModel = ns.model(
     },
 )
 
+VeeamSyncActionPayloadModel = ns.model(
+    "VeeamSyncActionPayloadModel",
+    {
+        "full_resync": fields.Boolean(
+            required=False,
+            description="忽略增量水位, 全量重拉全部 restorePoints/backupFiles",
+            example=False,
+        ),
+    },
+)
+
 VeeamSyncResultData = ns.model(
     "VeeamSyncResultData",
     {
@@ -339,14 +350,16 @@ class VeeamSyncActionResource(BaseResource):
     @ns.response(401, "Unauthorized", ErrorEnvelope)
     @ns.response(403, "Forbidden", ErrorEnvelope)
     @ns.response(500, "Internal Server Error", ErrorEnvelope)
+    @ns.expect(VeeamSyncActionPayloadModel, validate=False)
     @require_csrf
     def post(self):
-        """触发 Veeam 备份同步."""
+        """触发 Veeam 备份同步(默认增量, full_resync=true 时全量重拉)."""
         operator_id = getattr(current_user, "id", None)
 
         def _execute():
+            payload = validate_or_raise(VeeamSyncActionPayload, get_raw_payload() or {})
             service = VeeamSyncActionsService()
-            prepared = service.prepare_background_sync(created_by=operator_id)
+            prepared = service.prepare_background_sync(created_by=operator_id, full_resync=payload.full_resync)
             service.launch_background_sync(created_by=operator_id, prepared=prepared)
             return self.success(
                 data={"run_id": prepared.run_id},
@@ -0,0 +1,66 @@
+"""API v1 文件下载响应组装工具."""
+
+from __future__ import annotations
+
+import zlib
+from collections.abc import Iterator
+from itertools import chain
+
+from flask import Response, request, stream_with_context
+
+from app.services.files.csv_export_result import CsvExportResult, CsvStreamResult
+from app.utils.structlog_config import log_error
+
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+_GZIP_LEVEL = 6
+
+
+def _accepts_gzip() -> bool:
+    return request.accept_encodings["gzip"] > 0
+
+
+def _encode_chunks(chunks: Iterator[str], *, filename: str) -> Iterator[bytes]:
+    try:
+        for chunk in chunks:
+            yield chunk.encode("utf-8")
+    except Exception as exc:
+        # 响应头已发出, 无法再返回错误信封; 记录后中断连接, 客户端得到不完整文件.
+        log_error(
+            "流式导出中断",
+            module="api_downloads",
+            action="stream_csv",
+            exception=exc,
+            filename=filename,
+        )
+        raise
+
+
+def _gzip_chunks(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(_GZIP_LEVEL, zlib.DEFLATED, _GZIP_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def build_csv_download_response(result: CsvExportResult | CsvStreamResult) -> Response:
+    """组装 CSV 附件下载响应.
+
+    - CsvExportResult: 一次性返回完整内容
+    - CsvStreamResult: 生成器驱动的流式响应; 客户端声明 `Accept-Encoding: gzip` 时按 gzip 压缩输出
+
+    流式场景下会先同步取出首块(含表头与首批数据), 使查询错误仍在 `safe_call` 内按统一错误信封返回.
+    """
+    headers = {"Content-Disposition": f"attachment; filename={result.filename}"}
+    if isinstance(result, CsvExportResult):
+        return Response(result.content, mimetype=result.mimetype, headers=headers)
+
+    first_chunk = next(result.chunks, "")
+    body = _encode_chunks(chain([first_chunk], result.chunks), filename=result.filename)
+    headers["Vary"] = "Accept-Encoding"
+    headers["X-Accel-Buffering"] = "no"
+    if _accepts_gzip():
+        body = _gzip_chunks(body)
+        headers["Content-Encoding"] = "gzip"
+    return Response(stream_with_context(body), mimetype=result.mimetype, headers=headers)
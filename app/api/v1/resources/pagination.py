@@ -0,0 +1,31 @@
+"""API v1 列表分页响应组装工具."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from app.core.types.listing import PAGINATION_MODE_KEYSET, PaginatedResult
+
+
+def build_paginated_data(result: PaginatedResult[Any], items: object) -> dict[str, object]:
+    """组装列表响应 data.
+
+    offset 模式保持原有结构不变; keyset 模式额外返回 `next_cursor/has_more/total_mode`.
+    """
+    data: dict[str, object] = {
+        "items": items,
+        "total": result.total,
+        "page": result.page,
+        "pages": result.pages,
+        "limit": result.limit,
+    }
+    if result.pagination == PAGINATION_MODE_KEYSET:
+        data.update(
+            {
+                "pagination": result.pagination,
+                "next_cursor": result.next_cursor,
+                "has_more": result.has_more,
+                "total_mode": result.total_mode,
+            },
+        )
+    return data
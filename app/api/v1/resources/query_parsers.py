@@ -42,3 +42,22 @@ def split_comma_separated(values: list[str] | None) -> list[str]:
             if cleaned:
                 output.append(cleaned)
     return output
+
+
+def add_keyset_pagination_arguments(parser: reqparse.RequestParser) -> reqparse.RequestParser:
+    """为列表 parser 追加游标分页参数(pagination/cursor/total)."""
+    parser.add_argument(
+        "pagination",
+        type=str,
+        default="offset",
+        location="args",
+        help="分页模式: offset(默认)/keyset",
+    )
+    parser.add_argument("cursor", type=str, location="args", help="keyset 模式下一页游标(来自 next_cursor)")
+    parser.add_argument(
+        "total",
+        type=str,
+        location="args",
+        help="keyset 模式总数口径: estimate(默认)/exact/none",
+    )
+    return parser
@@ -0,0 +1,12 @@
+"""列表分页通用 Flask-RESTX marshal fields 定义."""
+
+from __future__ import annotations
+
+from flask_restx import fields
+
+KEYSET_PAGINATION_FIELDS = {
+    "pagination": fields.String(description="分页模式(offset/keyset)", example="keyset"),
+    "next_cursor": fields.String(description="下一页游标(为空表示末页)", example=None),
+    "has_more": fields.Boolean(description="是否还有下一页", example=False),
+    "total_mode": fields.String(description="总数口径(exact/estimate/none)", example="estimate"),
+}
@@ -18,6 +18,8 @@ SCHEDULER_JOB_LIST_ITEM_FIELDS: dict[str, fields.Raw] = {
     "func": fields.String(description="执行函数", example="app.tasks.accounts_sync_tasks:sync_accounts"),
     "args": fields.Raw(description="位置参数", example=[]),
     "kwargs": fields.Raw(description="关键字参数", example={}),
+    "executor": fields.String(description="执行器名称", example="io-threads"),
+    "max_instances": fields.Integer(description="最大并发实例数", example=1),
 }
 
 SCHEDULER_JOB_DETAIL_FIELDS: dict[str, fields.Raw] = {
@@ -31,4 +33,27 @@ SCHEDULER_JOB_DETAIL_FIELDS: dict[str, fields.Raw] = {
     "misfire_grace_time": fields.Integer(description="misfire 宽限(秒)", example=60),
     "max_instances": fields.Integer(description="最大并发实例数", example=1),
     "coalesce": fields.Boolean(description="是否合并错过的执行", example=True),
+    "executor": fields.String(description="执行器名称", example="io-threads"),
+}
+
+SCHEDULER_EXECUTOR_STATS_FIELDS: dict[str, fields.Raw] = {
+    "name": fields.String(description="执行器名称", example="io-threads"),
+    "type": fields.String(description="执行器类型(thread/process)", example="thread"),
+    "max_workers": fields.Integer(description="最大并发数", example=5),
+    "running": fields.Integer(description="执行中的任务数", example=1),
+    "queue_depth": fields.Integer(description="排队等待的任务数", example=0),
+    "submitted_total": fields.Integer(description="累计提交数", example=12),
+    "completed_total": fields.Integer(description="累计成功数", example=11),
+    "failed_total": fields.Integer(description="累计失败数", example=1),
+    "avg_wait_seconds": fields.Float(description="平均排队等待(秒)", example=0.01),
+    "max_wait_seconds": fields.Float(description="最大排队等待(秒)", example=0.5),
+    "last_wait_seconds": fields.Float(description="最近一次排队等待(秒, 可选)", example=0.01),
+}
+
+SCHEDULER_LEADER_STATUS_FIELDS: dict[str, fields.Raw] = {
+    "jobstore": fields.String(description="jobstore 模式(sqlite/database)", example="database"),
+    "node_id": fields.String(description="当前节点标识(可选)", example="web-1:4312"),
+    "is_leader": fields.Boolean(description="当前节点是否执行任务", example=True),
+    "leader_node_id": fields.String(description="主节点标识(可选)", example="web-1:4312"),
+    "leader_heartbeat_at": fields.String(description="主节点最近心跳时间(ISO8601, 可选)"),
 }
@@ -84,5 +84,6 @@ TASK_RUN_CATEGORIES: Final[list[dict[str, str]]] = [
     {"value": "classification", "label": "分类"},
     {"value": "cluster", "label": "群集"},
     {"value": "notification", "label": "告警"},
+    {"value": "export", "label": "导出"},
     {"value": "other", "label": "其他"},
 ]
@@ -53,6 +53,18 @@ BUILTIN_SCHEDULER_TASKS: dict[str, BuiltinSchedulerTask] = {
         function_target="app.tasks.cluster_status_sync_tasks:sync_cluster_status",
         description="每日检测 MySQL 主从状态与 SQL Server AG 数据库同步异常",
     ),
+    "poll_cluster_health": BuiltinSchedulerTask(
+        task_name="群集健康轮询",
+        function_name="poll_cluster_health",
+        function_target="app.tasks.cluster_status_sync_tasks:poll_cluster_health",
+        description="每分钟并发探测群集节点并刷新主从/AG 同步状态(不创建任务记录与告警)",
+    ),
+    "poll_instance_reachability": BuiltinSchedulerTask(
+        task_name="实例可达性探测",
+        function_name="poll_instance_reachability",
+        function_target="app.tasks.instance_reachability_tasks:poll_instance_reachability",
+        description="每分钟非阻塞探测全部启用实例的 TCP 可达性并刷新滚动延迟与可用率",
+    ),
     "email_alert": BuiltinSchedulerTask(
         task_name="邮件告警汇总",
         function_name="email_alert",
@@ -62,3 +74,54 @@ BUILTIN_SCHEDULER_TASKS: dict[str, BuiltinSchedulerTask] = {
 }
 
 BUILTIN_TASK_IDS: set[str] = set(BUILTIN_SCHEDULER_TASKS)
+
+# 依赖触发(DAG)模式: 上游 TaskRun 完成后触发下游任务
+DEPENDENCY_TRIGGER_TYPE = "dependency"
+DEPENDENCY_SCOPE_ALL = "all"
+DEPENDENCY_SCOPE_UPSTREAM_INSTANCES = "upstream_instances"
+DEPENDENCY_SCOPES: frozenset[str] = frozenset({DEPENDENCY_SCOPE_ALL, DEPENDENCY_SCOPE_UPSTREAM_INSTANCES})
+
+# 依赖触发产生的一次性 job id 前缀(`pipeline:<task_id>:<upstream_run_id>`)
+PIPELINE_JOB_ID_PREFIX = "pipeline:"
+# 共享 jobstore 下手动执行派发到主节点的一次性 job id 前缀(`manual:<task_id>:<token>`)
+MANUAL_JOB_ID_PREFIX = "manual:"
+# 一次性 job(执行后即移除), 不在任务列表展示
+TRANSIENT_JOB_ID_PREFIXES: tuple[str, ...] = (PIPELINE_JOB_ID_PREFIX, MANUAL_JOB_ID_PREFIX)
+
+# 执行器(并发类别): 调度配置按名称声明, 任务通过 executor 字段指定
+EXECUTOR_TYPE_THREAD = "thread"
+EXECUTOR_TYPE_PROCESS = "process"
+EXECUTOR_TYPES: frozenset[str] = frozenset({EXECUTOR_TYPE_THREAD, EXECUTOR_TYPE_PROCESS})
+DEFAULT_EXECUTOR_NAME = "io-threads"
+DEFAULT_EXECUTOR_MAX_WORKERS = 5
+MAX_EXECUTOR_WORKERS = 32
+
+
+@dataclass(frozen=True, slots=True)
+class ShardedTask:
+    """分片执行任务元数据: 子项由各节点认领后交给 handler 逐个处理.
+
+    prepare_target 可选, 指向分片预处理函数: 认领分片后先对整批子项做批量准备, 返回该分片使用的 handler.
+    """
+
+    handler_target: str
+    item_types: tuple[str, ...]
+    prepare_target: str | None = None
+
+
+# 实例(群集)列表按分片由多个节点并行处理的任务
+SHARDED_TASKS: dict[str, ShardedTask] = {
+    "sync_accounts": ShardedTask(
+        handler_target="app.tasks.accounts_sync_tasks:process_account_sync_shard_item",
+        item_types=("instance",),
+    ),
+    "sync_databases": ShardedTask(
+        handler_target="app.tasks.capacity_collection_tasks:process_capacity_shard_item",
+        item_types=("instance",),
+    ),
+    "sync_cluster_status": ShardedTask(
+        handler_target="app.tasks.cluster_status_sync_tasks:process_cluster_status_shard_item",
+        item_types=("mysql_cluster", "sqlserver_cluster"),
+        prepare_target="app.tasks.cluster_status_sync_tasks:prepare_cluster_status_shard",
+    ),
+}
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from app.core.types.listing import KeysetParams
+
 
 @dataclass(slots=True)
 class AccountChangeLogsListFilters:
@@ -19,6 +21,7 @@ class AccountChangeLogsListFilters:
     change_type: str | None
     status: str | None
     hours: int | None
+    keyset: KeysetParams | None = None
 
 
 @dataclass(slots=True)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from app.core.types.listing import KeysetParams
 from app.core.types.tags import TagSummary
 
 
@@ -27,6 +28,7 @@ class AccountFilters:
     owner_type: str | None
     owner_id: int | None
     ad_status: str | None
+    keyset: KeysetParams | None = None
 
 
 @dataclass(slots=True)
@@ -7,6 +7,7 @@ from datetime import datetime
 from typing import Any
 
 from app.core.constants.system_constants import LogLevel
+from app.core.types.listing import KeysetParams
 
 
 @dataclass(slots=True)
@@ -23,6 +24,7 @@ class LogSearchFilters:
     start_time: datetime | None
     end_time: datetime | None
     hours: int | None
+    keyset: KeysetParams | None = None
 
 
 @dataclass(slots=True)
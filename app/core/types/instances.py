@@ -5,6 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
 
+from app.core.types.listing import KeysetParams
 from app.core.types.tags import TagSummary
 
 
@@ -24,6 +25,7 @@ class InstanceListFilters:
     backup_status: str
     tags: list[str]
     include_deleted: bool
+    keyset: KeysetParams | None = None
 
 
 @dataclass(slots=True)
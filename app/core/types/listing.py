@@ -7,13 +7,41 @@ from typing import Generic, TypeVar
 
 T = TypeVar("T")
 
+PAGINATION_MODE_OFFSET = "offset"
+PAGINATION_MODE_KEYSET = "keyset"
+
+TOTAL_MODE_EXACT = "exact"
+TOTAL_MODE_ESTIMATE = "estimate"
+TOTAL_MODE_NONE = "none"
+TOTAL_MODES = (TOTAL_MODE_EXACT, TOTAL_MODE_ESTIMATE, TOTAL_MODE_NONE)
+
+
+@dataclass(slots=True)
+class KeysetParams:
+    """游标(keyset)分页参数.
+
+    - cursor 为空表示首页
+    - total_mode 控制总数口径: exact(精确 COUNT)/estimate(执行计划估算)/none(不统计)
+    """
+
+    cursor: str | None = None
+    total_mode: str = TOTAL_MODE_ESTIMATE
+
 
 @dataclass(slots=True)
 class PaginatedResult(Generic[T]):
-    """通用分页结果结构."""
+    """通用分页结果结构.
+
+    keyset 模式下 `page/pages` 不再具备跳页语义, 由 `next_cursor/has_more` 驱动翻页;
+    `total` 在 total_mode=none 时为 None.
+    """
 
     items: list[T]
-    total: int
+    total: int | None
     page: int
     pages: int
     limit: int
+    pagination: str = PAGINATION_MODE_OFFSET
+    next_cursor: str | None = None
+    has_more: bool = False
+    total_mode: str = TOTAL_MODE_EXACT
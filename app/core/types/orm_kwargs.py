@@ -32,6 +32,8 @@ class AccountPermissionOrmFields(TypedDict, total=False):
     last_sync_time: datetime
     last_change_type: str
     last_change_time: datetime
+    permission_fingerprint: str | None
+    permission_full_synced_at: datetime | None
 
 
 class InstanceAccountOrmFields(TypedDict, total=False):
@@ -72,6 +74,8 @@ class AdDomainConfigOrmFields(TypedDict, total=False):
     last_sync_status: str | None
     last_sync_run_id: str | None
     last_error: str | None
+    usn_watermarks: dict[str, dict[str, object]]
+    last_full_sync_at: datetime | None
     created_at: datetime
     updated_at: datetime
 
@@ -420,6 +424,25 @@ class InstanceConfigSnapshotOrmFields(TypedDict, total=False):
     updated_at: datetime
 
 
+class InstanceReachabilityOrmFields(TypedDict, total=False):
+    """Keyword arguments for creating/updating InstanceReachability ORM rows."""
+
+    id: int
+    instance_id: int
+    status: str
+    last_checked_at: datetime | None
+    last_up_at: datetime | None
+    last_down_at: datetime | None
+    last_latency_ms: float | None
+    last_error: str | None
+    consecutive_failures: int
+    recent_samples: list[list[float | None]]
+    availability_ratio: float | None
+    avg_latency_ms: float | None
+    created_at: datetime
+    updated_at: datetime
+
+
 class VeeamSourceBindingOrmFields(TypedDict, total=False):
     """Keyword arguments for creating/updating VeeamSourceBinding ORM rows."""
 
@@ -465,6 +488,36 @@ class VeeamMachineBackupSnapshotOrmFields(TypedDict, total=False):
     updated_at: datetime
 
 
+class VeeamBackupObjectWatermarkOrmFields(TypedDict, total=False):
+    """Keyword arguments for creating/updating VeeamBackupObjectWatermark ORM rows."""
+
+    id: int
+    source_binding_id: int
+    backup_object_id: str
+    machine_name: str | None
+    latest_restore_point_at: datetime
+    latest_restore_point_id: str | None
+    backup_id: str | None
+    latest_backup_file_id: str | None
+    full_synced_at: datetime
+    sync_run_id: str | None
+    created_at: datetime
+    updated_at: datetime
+
+
+class VeeamInstanceBackupMatchOrmFields(TypedDict, total=False):
+    """Keyword arguments for creating/updating VeeamInstanceBackupMatch ORM rows."""
+
+    id: int
+    instance_id: int
+    source_binding_id: int
+    snapshot_id: int
+    name_candidates: list[str]
+    ip_candidates: list[str]
+    created_at: datetime
+    updated_at: datetime
+
+
 class JumpServerSourceBindingOrmFields(TypedDict, total=False):
     """Keyword arguments for creating/updating JumpServerSourceBinding ORM rows."""
 
@@ -24,6 +24,8 @@ class SchedulerJobListItem:
     func: str
     args: tuple[object, ...]
     kwargs: dict[str, object] | None
+    executor: str | None = None
+    max_instances: int | None = None
 
 
 @dataclass(slots=True)
@@ -40,3 +42,49 @@ class SchedulerJobDetail:
     misfire_grace_time: int | None
     max_instances: int | None
     coalesce: bool | None
+    executor: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class TaskDependencySpec:
+    """依赖触发任务的上游声明."""
+
+    upstream: tuple[str, ...]
+    scope: str
+
+
+@dataclass(frozen=True, slots=True)
+class PipelineDispatch:
+    """一次依赖触发(下游任务 + 触发它的上游 run)."""
+
+    task_id: str
+    upstream_run_id: str
+    instance_ids: tuple[int, ...] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class SchedulerExecutorStats:
+    """执行器运行统计(自调度器启动起累计)."""
+
+    name: str
+    type: str
+    max_workers: int
+    running: int
+    queue_depth: int
+    submitted_total: int
+    completed_total: int
+    failed_total: int
+    avg_wait_seconds: float
+    max_wait_seconds: float
+    last_wait_seconds: float | None
+
+
+@dataclass(frozen=True, slots=True)
+class SchedulerLeaderStatus:
+    """调度器选主状态."""
+
+    jobstore: str
+    node_id: str | None
+    is_leader: bool
+    leader_node_id: str | None
+    leader_heartbeat_at: str | None
@@ -100,6 +100,8 @@ class CollectionSummary(TypedDict, total=False):
     processed_records: int
     errors: list[str]
     message: str
+    query_stats: JsonDict
+    fingerprint_unchanged: int
 
 
 class SyncStagesSummary(TypedDict):
@@ -42,6 +42,7 @@ class TaskRunListItem:
     error_message: str | None
     created_at: str | None
     updated_at: str | None
+    upstream_run_id: str | None = None
 
 
 @dataclass(slots=True)
@@ -62,6 +63,7 @@ class TaskRunItemItem:
     error_message: str | None
     created_at: str | None
     updated_at: str | None
+    claimed_by: str | None = None
 
 
 @dataclass(slots=True)
@@ -79,3 +81,24 @@ class TaskRunErrorLogsResult:
     run: TaskRunListItem
     items: list[TaskRunItemItem]
     error_count: int
+
+
+@dataclass(slots=True)
+class TaskRunPipelineNode:
+    """依赖流水线中的单次运行."""
+
+    run: TaskRunListItem
+    depth: int
+    duration_seconds: float | None
+    wait_seconds: float | None
+    on_critical_path: bool
+
+
+@dataclass(slots=True)
+class TaskRunPipelineResult:
+    """依赖流水线(关键路径)结果."""
+
+    root_run_id: str
+    nodes: list[TaskRunPipelineNode]
+    critical_path: list[str]
+    wall_clock_seconds: float | None
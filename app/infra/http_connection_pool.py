@@ -0,0 +1,309 @@
+"""HTTP keep-alive 连接池与 SSLContext 复用.
+
+职责:
+- 按 (scheme, host, port, ssl context, 代理) 复用 keep-alive 连接, 新建连接时复用 TLS 会话
+- 与 urlopen 一致: 读取 *_proxy/no_proxy 环境变量走 HTTP 代理(https 经 CONNECT 隧道), 并跟随 3xx 重定向
+- 按证书校验策略复用 SSLContext(连接池按 context 分组, TLS 会话也依赖同一 context)
+- 调用方式与 `urlopen(request, timeout=, context=)` 一致, 错误语义保持 TimeoutError/HTTPError/URLError
+- 不做限速/重试; 由各外部系统 provider 自行处理
+"""
+
+from __future__ import annotations
+
+import base64
+import http.client
+import io
+import ssl
+import threading
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import dataclass
+from urllib.error import HTTPError, URLError
+from urllib.parse import unquote, urljoin, urlsplit
+from urllib.request import HTTPRedirectHandler, Request, getproxies, proxy_bypass
+
+# (scheme, host, port, id(ssl context), 代理 URL; 直连为空串)
+_PoolKey = tuple[str, str, int, int, str]
+
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+_REDIRECT_SCHEMES = ("http", "https")
+
+
+@dataclass(frozen=True, slots=True)
+class _Proxy:
+    host: str
+    port: int
+    authorization: str | None
+
+
+def _parse_proxy(proxy_url: str) -> _Proxy:
+    parsed = urlsplit(proxy_url if "://" in proxy_url else f"http://{proxy_url}")
+    authorization = None
+    if parsed.username is not None:
+        credentials = f"{unquote(parsed.username)}:{unquote(parsed.password or '')}"
+        authorization = f"Basic {base64.b64encode(credentials.encode('utf-8')).decode('ascii')}"
+    return _Proxy(host=parsed.hostname or "", port=parsed.port or 80, authorization=authorization)
+
+
+class _StaleConnectionError(URLError):
+    """连接在发送/读取时被对端关闭(空闲 keep-alive 连接可能已被服务端回收)."""
+
+
+class _PooledResponse:
+    """与 urlopen 返回值兼容的最小响应对象(body 已读完, 连接已归还)."""
+
+    def __init__(self, *, body: bytes, status: int, reason: str, headers: http.client.HTTPMessage) -> None:
+        self._body = body
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+
+    def read(self) -> bytes:
+        """返回响应体."""
+        return self._body
+
+    def __enter__(self) -> _PooledResponse:
+        return self
+
+    def __exit__(self, *_exc: object) -> bool:
+        return False
+
+
+class _TlsSessionHTTPSConnection(http.client.HTTPSConnection):
+    """新建连接时复用同一目标最近一次的 TLS 会话(会话恢复, 省去完整握手)."""
+
+    def __init__(self, *args: object, session_holder: dict[str, ssl.SSLSession | None], **kwargs: object) -> None:
+        super().__init__(*args, **kwargs)  # type: ignore[arg-type]
+        self._session_holder = session_holder
+
+    def connect(self) -> None:
+        # 设置了代理隧道时, HTTPConnection.connect 会先完成 CONNECT, TLS 握手面向目标主机
+        http.client.HTTPConnection.connect(self)
+        self.sock = self._context.wrap_socket(  # type: ignore[attr-defined]
+            self.sock,
+            server_hostname=self._tunnel_host or self.host,  # type: ignore[attr-defined]
+            session=self._session_holder.get("session"),
+        )
+
+    def remember_session(self) -> None:
+        session = getattr(self.sock, "session", None)
+        if session is not None:
+            self._session_holder["session"] = session
+
+
+class HttpConnectionPool:
+    """keep-alive 连接池(按目标主机、ssl context 与代理分组, 线程安全)."""
+
+    def __init__(self, *, max_idle_per_host: int = 4, proxies: Mapping[str, str] | None = None) -> None:
+        """初始化连接池(max_idle_per_host 为每个目标保留的空闲连接数; proxies 默认读取环境变量)."""
+        self._max_idle_per_host = max(int(max_idle_per_host), 1)
+        # 与 urlopen 默认 opener 的 ProxyHandler 一致, 创建时读取一次 *_proxy 环境变量
+        self._proxies = dict(getproxies() if proxies is None else proxies)
+        self._idle: dict[_PoolKey, deque[http.client.HTTPConnection]] = {}
+        self._sessions: dict[_PoolKey, dict[str, ssl.SSLSession | None]] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, request: Request, *, timeout: int, context: ssl.SSLContext) -> _PooledResponse:
+        """发送请求并读取完整响应; 非 2xx 抛 HTTPError, 网络错误抛 URLError, 超时抛 TimeoutError.
+
+        3xx 按 urlopen 的规则跟随重定向(最多 HTTPRedirectHandler.max_redirections 次).
+        """
+        redirects = 0
+        while True:
+            response = self._open(request, timeout=timeout, context=context)
+            location = response.headers.get("Location") or response.headers.get("URI")
+            if response.status not in _REDIRECT_STATUSES or not location:
+                return response
+            redirected = self._redirect_request(request, response, location, redirects=redirects)
+            if redirected is None:
+                return response
+            request = redirected
+            redirects += 1
+
+    def close(self) -> None:
+        """关闭全部空闲连接."""
+        with self._lock:
+            idle = [connection for connections in self._idle.values() for connection in connections]
+            self._idle.clear()
+        for connection in idle:
+            connection.close()
+
+    @staticmethod
+    def _redirect_request(
+        request: Request,
+        response: _PooledResponse,
+        location: str,
+        *,
+        redirects: int,
+    ) -> Request | None:
+        new_url = urljoin(request.full_url, location)
+        message = None
+        if redirects >= HTTPRedirectHandler.max_redirections:
+            message = HTTPRedirectHandler.inf_msg + response.reason
+        elif urlsplit(new_url).scheme not in _REDIRECT_SCHEMES:
+            message = f"{response.reason} - Redirection to url '{new_url}' is not allowed"
+        if message is not None:
+            raise HTTPError(request.full_url, response.status, message, response.headers, io.BytesIO(response.read()))
+        # 复用 urllib 的重定向规则(方法改写/丢弃请求体与内容头, 不允许时抛 HTTPError)
+        return HTTPRedirectHandler().redirect_request(
+            request,
+            io.BytesIO(response.read()),
+            response.status,
+            response.reason,
+            response.headers,
+            new_url,
+        )
+
+    def _open(self, request: Request, *, timeout: int, context: ssl.SSLContext) -> _PooledResponse:
+        parsed = urlsplit(request.full_url)
+        scheme = parsed.scheme or "https"
+        host = parsed.hostname or ""
+        port = parsed.port or (443 if scheme == "https" else 80)
+        authority = parsed.netloc.rpartition("@")[2]
+        proxy_url = self._resolve_proxy_url(scheme, authority)
+        key: _PoolKey = (scheme, host, port, id(context), proxy_url)
+        path = parsed.path or "/"
+        if parsed.query:
+            path = f"{path}?{parsed.query}"
+        headers = dict(request.header_items())
+        if proxy_url and scheme == "http":
+            # 明文 HTTP 经代理转发: 请求行使用绝对 URL, 代理认证随请求发送
+            path = f"{scheme}://{authority}{path}"
+            authorization = _parse_proxy(proxy_url).authorization
+            if authorization:
+                headers["Proxy-Authorization"] = authorization
+        method = request.get_method()
+
+        connection, reused = self._checkout(key, timeout=timeout, context=context)
+        try:
+            sent = self._send_or_close(connection, method=method, path=path, body=request.data, headers=headers)
+        except _StaleConnectionError:
+            if not reused:
+                raise
+            # 复用的空闲连接已被服务端关闭, 使用新连接重试一次
+            connection, _ = self._checkout(key, timeout=timeout, context=context, fresh=True)
+            sent = self._send_or_close(connection, method=method, path=path, body=request.data, headers=headers)
+        return self._finish(key, connection, sent, url=request.full_url)
+
+    def _resolve_proxy_url(self, scheme: str, netloc: str) -> str:
+        proxy_url = self._proxies.get(scheme, "")
+        if not proxy_url or proxy_bypass(netloc):
+            return ""
+        return proxy_url
+
+    def _checkout(
+        self,
+        key: _PoolKey,
+        *,
+        timeout: int,
+        context: ssl.SSLContext,
+        fresh: bool = False,
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        if not fresh:
+            with self._lock:
+                connections = self._idle.get(key)
+                connection = connections.pop() if connections else None
+            if connection is not None:
+                connection.timeout = timeout
+                if connection.sock is not None:
+                    connection.sock.settimeout(timeout)
+                return connection, True
+        scheme, host, port, _, proxy_url = key
+        proxy = _parse_proxy(proxy_url) if proxy_url else None
+        connect_host, connect_port = (proxy.host, proxy.port) if proxy is not None else (host, port)
+        if scheme == "https":
+            with self._lock:
+                session_holder = self._sessions.setdefault(key, {"session": None})
+            connection = _TlsSessionHTTPSConnection(
+                connect_host,
+                connect_port,
+                timeout=timeout,
+                context=context,
+                session_holder=session_holder,
+            )
+            if proxy is not None:
+                tunnel_headers = {"Proxy-Authorization": proxy.authorization} if proxy.authorization else None
+                connection.set_tunnel(host, port, headers=tunnel_headers)
+            return connection, False
+        return http.client.HTTPConnection(connect_host, connect_port, timeout=timeout), False
+
+    def _send_or_close(
+        self,
+        connection: http.client.HTTPConnection,
+        *,
+        method: str,
+        path: str,
+        body: object,
+        headers: dict[str, str],
+    ) -> tuple[http.client.HTTPResponse, bytes]:
+        try:
+            return self._send(connection, method=method, path=path, body=body, headers=headers)
+        except BaseException:
+            connection.close()
+            raise
+
+    @staticmethod
+    def _send(
+        connection: http.client.HTTPConnection,
+        *,
+        method: str,
+        path: str,
+        body: object,
+        headers: dict[str, str],
+    ) -> tuple[http.client.HTTPResponse, bytes]:
+        try:
+            connection.request(method, path, body=body, headers=headers)  # type: ignore[arg-type]
+            response = connection.getresponse()
+            payload = response.read()
+        except TimeoutError:
+            raise
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as exc:
+            raise _StaleConnectionError(exc) from exc
+        except (OSError, http.client.HTTPException) as exc:
+            raise URLError(exc) from exc
+        return response, payload
+
+    def _finish(
+        self,
+        key: _PoolKey,
+        connection: http.client.HTTPConnection,
+        sent: tuple[http.client.HTTPResponse, bytes],
+        *,
+        url: str,
+    ) -> _PooledResponse:
+        response, payload = sent
+        if isinstance(connection, _TlsSessionHTTPSConnection):
+            connection.remember_session()
+        if response.will_close:
+            connection.close()
+        else:
+            self._checkin(key, connection)
+        if response.status >= 400:
+            raise HTTPError(url, response.status, response.reason, response.headers, io.BytesIO(payload))
+        return _PooledResponse(body=payload, status=response.status, reason=response.reason, headers=response.headers)
+
+    def _checkin(self, key: _PoolKey, connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            connections = self._idle.setdefault(key, deque())
+            if len(connections) < self._max_idle_per_host:
+                connections.append(connection)
+                return
+        connection.close()
+
+
+class SslContextCache:
+    """按证书校验策略缓存 SSLContext(线程安全)."""
+
+    def __init__(self) -> None:
+        """初始化空缓存."""
+        self._contexts: dict[bool, ssl.SSLContext] = {}
+        self._lock = threading.Lock()
+
+    def get(self, verify_ssl: bool) -> ssl.SSLContext:
+        """返回 verify_ssl 对应的 SSLContext(首次调用时创建)."""
+        with self._lock:
+            context = self._contexts.get(verify_ssl)
+            if context is None:
+                context = ssl.create_default_context() if verify_ssl else ssl._create_unverified_context()
+                self._contexts[verify_ssl] = context
+            return context
@@ -6,6 +6,8 @@ import contextlib
 import logging
 import threading
 import time
+from collections.abc import Callable
+from datetime import datetime
 from functools import lru_cache
 from importlib import import_module
 from queue import Empty, Full, Queue
@@ -46,6 +48,23 @@ def _get_logging_dependencies() -> tuple[SQLAlchemy, type[UnifiedLog], type[LogE
     return db, unified_log_cls, log_entry_params_cls
 
 
+@lru_cache(maxsize=1)
+def _get_metrics_dependencies() -> tuple[Any, str, Callable[[datetime], datetime]]:
+    """惰性加载仪表盘指标桶 Repository.
+
+    Returns:
+        包含 DashboardMetricsRepository、日志级别指标名与小时截断函数的元组.
+
+    """
+    repository_module = import_module("app.repositories.dashboard_metrics_repository")
+    model_module = import_module("app.models.dashboard_metric_bucket")
+    return (
+        repository_module.DashboardMetricsRepository,
+        model_module.DASHBOARD_METRIC_LOG_LEVEL,
+        repository_module.truncate_to_hour,
+    )
+
+
 class LogQueueWorker:
     """后台线程,按批次将日志写入数据库.
 
@@ -181,6 +200,7 @@ class LogQueueWorker:
                 models = [unified_log_cls.create_log_entry(payload) for payload in payloads]
                 if models:
                     db.session.add_all(models)
+                    self._increment_dashboard_buckets(db, models)
                     db.session.commit()
         except Exception as exc:
             queue_logger.exception(
@@ -198,6 +218,27 @@ class LogQueueWorker:
         finally:
             self._last_flush = time.time()
 
+    @staticmethod
+    def _increment_dashboard_buckets(db: SQLAlchemy, models: list[UnifiedLog]) -> None:
+        """随日志同事务累加仪表盘级别小时桶; 失败仅回滚保存点, 不影响日志落库."""
+        try:
+            repository, metric, truncate_to_hour = _get_metrics_dependencies()
+            counts: dict[tuple[str, datetime], int] = {}
+            for model in models:
+                key = (str(getattr(model.level, "value", model.level)), truncate_to_hour(model.timestamp))
+                counts[key] = counts.get(key, 0) + 1
+            with db.session.begin_nested():
+                repository.increment(metric, counts)
+        except Exception as exc:
+            queue_logger.warning(
+                "累加仪表盘日志指标桶失败",
+                extra={
+                    "fallback": True,
+                    "fallback_reason": "dashboard_metric_bucket_failed",
+                    "exception_type": exc.__class__.__name__,
+                },
+            )
+
     def __del__(self) -> None:
         """对象回收时仅标记关闭,避免在 GC 期间执行日志 IO."""
         shutdown = getattr(self, "_shutdown", None)
@@ -0,0 +1,157 @@
+"""APScheduler 执行器(带排队统计).
+
+职责:
+- 按调度配置构建线程池/进程池执行器(io-threads / cpu-processes 等并发类别)
+- 记录每个执行器的在途数、排队深度与排队等待时间, 供调度器页面展示
+- 不做任务编排、不访问数据库
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Any
+
+from apscheduler.events import EVENT_JOB_ERROR
+from apscheduler.executors.base import run_job
+from apscheduler.executors.pool import BasePoolExecutor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from app.core.constants.scheduler_jobs import EXECUTOR_TYPE_PROCESS, EXECUTOR_TYPE_THREAD
+from app.core.types.scheduler import SchedulerExecutorStats
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+    from datetime import datetime
+
+    from apscheduler.job import Job
+
+
+def run_job_with_start_time(
+    job: Job,
+    jobstore_alias: str,
+    run_times: list[datetime],
+    logger_name: str,
+) -> tuple[float, list[Any]]:
+    """在工作线程/子进程中执行 job, 并回传实际开始时间(用于计算排队等待)."""
+    started_at = time.time()
+    return started_at, run_job(job, jobstore_alias, run_times, logger_name)
+
+
+class ExecutorStatsCollector:
+    """执行器统计累加器(线程安全)."""
+
+    def __init__(self, *, name: str, executor_type: str, max_workers: int) -> None:
+        """初始化统计."""
+        self.name = name
+        self.executor_type = executor_type
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._wait_total = 0.0
+        self._wait_samples = 0
+        self._wait_max = 0.0
+        self._wait_last: float | None = None
+
+    def on_submit(self) -> None:
+        """记录一次提交."""
+        with self._lock:
+            self._in_flight += 1
+            self._submitted += 1
+
+    def on_finish(self, *, wait_seconds: float | None, failed: bool) -> None:
+        """记录一次结束(wait_seconds 为 None 表示未能取得开始时间)."""
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+            if failed:
+                self._failed += 1
+            else:
+                self._completed += 1
+            if wait_seconds is not None:
+                wait = max(0.0, wait_seconds)
+                self._wait_total += wait
+                self._wait_samples += 1
+                self._wait_max = max(self._wait_max, wait)
+                self._wait_last = wait
+
+    def snapshot(self) -> SchedulerExecutorStats:
+        """输出当前统计快照."""
+        with self._lock:
+            in_flight = self._in_flight
+            return SchedulerExecutorStats(
+                name=self.name,
+                type=self.executor_type,
+                max_workers=self.max_workers,
+                running=min(in_flight, self.max_workers),
+                queue_depth=max(0, in_flight - self.max_workers),
+                submitted_total=self._submitted,
+                completed_total=self._completed,
+                failed_total=self._failed,
+                avg_wait_seconds=(self._wait_total / self._wait_samples) if self._wait_samples else 0.0,
+                max_wait_seconds=self._wait_max,
+                last_wait_seconds=self._wait_last,
+            )
+
+
+class _InstrumentedPoolExecutor(BasePoolExecutor):
+    """在 APScheduler 池执行器的提交/回调处记录统计."""
+
+    stats: ExecutorStatsCollector
+
+    def _do_submit_job(self, job: Job, run_times: list[datetime]) -> None:
+        submitted_at = time.time()
+
+        def callback(future: Future[tuple[float, list[Any]]]) -> None:
+            exc = future.exception()
+            if exc is not None:
+                self.stats.on_finish(wait_seconds=None, failed=True)
+                self._run_job_error(job.id, exc, exc.__traceback__)
+                return
+            started_at, events = future.result()
+            failed = any(event.code == EVENT_JOB_ERROR for event in events)
+            self.stats.on_finish(wait_seconds=started_at - submitted_at, failed=failed)
+            self._run_job_success(job.id, events)
+
+        future = self._pool.submit(run_job_with_start_time, job, job._jobstore_alias, run_times, self._logger.name)
+        self.stats.on_submit()
+        future.add_done_callback(callback)
+
+
+class InstrumentedThreadPoolExecutor(ThreadPoolExecutor, _InstrumentedPoolExecutor):
+    """带统计的线程池执行器(I/O 密集型远端同步任务)."""
+
+    def __init__(self, *, name: str, max_workers: int) -> None:
+        """创建线程池."""
+        super().__init__(max_workers=max_workers)
+        self.stats = ExecutorStatsCollector(name=name, executor_type=EXECUTOR_TYPE_THREAD, max_workers=max_workers)
+
+
+class InstrumentedProcessPoolExecutor(ProcessPoolExecutor, _InstrumentedPoolExecutor):
+    """带统计的进程池执行器(纯 CPU 计算任务, 避免与 Flask 线程争抢 GIL).
+
+    子进程以 spawn 方式启动, 任务函数需自行 `create_app` 建立应用上下文.
+    """
+
+    def __init__(self, *, name: str, max_workers: int) -> None:
+        """创建进程池(子进程按需启动)."""
+        super().__init__(max_workers=max_workers)
+        self.stats = ExecutorStatsCollector(name=name, executor_type=EXECUTOR_TYPE_PROCESS, max_workers=max_workers)
+
+    def _do_submit_job(self, job: Job, run_times: list[datetime]) -> None:
+        # ProcessPoolExecutor 在进程池损坏时会重建后重试, 统计沿用同一累加器
+        try:
+            _InstrumentedPoolExecutor._do_submit_job(self, job, run_times)
+        except BrokenProcessPool:
+            self._logger.warning("Process pool is broken; replacing pool with a fresh instance")
+            self._pool = self._pool.__class__(self._pool._max_workers, **self.pool_kwargs)
+            _InstrumentedPoolExecutor._do_submit_job(self, job, run_times)
+
+
+def build_executor(*, name: str, executor_type: str, max_workers: int) -> _InstrumentedPoolExecutor:
+    """按类型构建执行器."""
+    if executor_type == EXECUTOR_TYPE_PROCESS:
+        return InstrumentedProcessPoolExecutor(name=name, max_workers=max_workers)
+    return InstrumentedThreadPoolExecutor(name=name, max_workers=max_workers)
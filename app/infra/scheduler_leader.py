@@ -0,0 +1,273 @@
+"""调度器多节点选主(PostgreSQL advisory lock + 心跳租约).
+
+职责:
+- 多个节点共享主库 jobstore 时, 通过会话级 advisory lock 保证只有一个节点执行任务
+- 主节点定期刷新租约心跳; 备用节点轮询抢锁, 主节点进程退出(连接断开)后即可接管
+- 主节点挂起但连接未断开时, 备用节点在租约过期后终止其数据库会话再接管
+- 不做任务编排; 成为主节点/失去主节点身份时通过回调通知调度器
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, create_engine, func, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.pool import NullPool
+
+from app.utils.structlog_config import get_system_logger
+from app.utils.time_utils import time_utils
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection, Engine
+
+logger = get_system_logger()
+
+# advisory lock 键(bigint), 所有节点必须一致
+SCHEDULER_LEADER_LOCK_KEY = 7_305_201_606_110_033
+SCHEDULER_LEADER_LEASE_NAME = "scheduler"
+
+_metadata = MetaData()
+scheduler_leader_leases = Table(
+    "scheduler_leader_leases",
+    _metadata,
+    Column("name", String(64), primary_key=True),
+    Column("node_id", String(255), nullable=False),
+    Column("backend_pid", Integer, nullable=False),
+    Column("acquired_at", DateTime(timezone=True), nullable=False),
+    Column("heartbeat_at", DateTime(timezone=True), nullable=False),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class SchedulerLeaderLease:
+    """主节点租约记录."""
+
+    node_id: str
+    backend_pid: int
+    acquired_at: datetime
+    heartbeat_at: datetime
+
+
+class SchedulerLeaderElector:
+    """调度器选主器(每个启用调度器的进程一个)."""
+
+    def __init__(
+        self,
+        *,
+        database_url: str,
+        node_id: str,
+        heartbeat_seconds: int,
+        lease_seconds: int,
+        on_elected: Callable[[], None],
+        on_demoted: Callable[[], None],
+        on_heartbeat: Callable[[], None] | None = None,
+        engine: Engine | None = None,
+    ) -> None:
+        """初始化选主器(选主连接独占, 不使用连接池)."""
+        self.node_id = node_id
+        self._engine = engine or create_engine(database_url, poolclass=NullPool, pool_pre_ping=True)
+        self._heartbeat_seconds = heartbeat_seconds
+        self._lease_seconds = lease_seconds
+        self._on_elected = on_elected
+        self._on_demoted = on_demoted
+        self._on_heartbeat = on_heartbeat
+        self._connection: Connection | None = None
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_leader(self) -> bool:
+        """当前进程是否为主节点."""
+        return self._connection is not None
+
+    def start(self) -> None:
+        """立即尝试一次选主, 随后在后台线程中按心跳周期轮询."""
+        self.run_once()
+        self._thread = threading.Thread(target=self._run_loop, name="scheduler-leader-elector", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """停止轮询并主动释放主节点身份."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self._heartbeat_seconds + 1)
+        with self._lock:
+            if self._connection is not None:
+                try:
+                    self._unlock(self._connection)
+                except SQLAlchemyError as unlock_error:
+                    logger.warning("释放调度主节点锁失败", node_id=self.node_id, error=str(unlock_error))
+                self._demote(reason="shutdown")
+
+    def run_once(self) -> bool:
+        """执行一轮选主: 主节点刷新心跳, 备用节点尝试抢锁; 返回当前是否为主节点."""
+        with self._lock:
+            if self._connection is not None:
+                self._heartbeat(self._connection)
+            else:
+                self._try_acquire()
+            leader = self._connection is not None
+        if leader and self._on_heartbeat is not None:
+            self._on_heartbeat()
+        return leader
+
+    def read_lease(self) -> SchedulerLeaderLease | None:
+        """读取当前主节点租约(用于状态展示)."""
+        try:
+            with self._engine.connect() as connection:
+                return self._read_lease(connection)
+        except SQLAlchemyError as read_error:
+            logger.warning("读取调度主节点租约失败", error=str(read_error))
+            return None
+
+    def _run_loop(self) -> None:
+        while not self._stop_event.wait(self._heartbeat_seconds):
+            self.run_once()
+
+    def _try_acquire(self) -> None:
+        connection: Connection | None = None
+        try:
+            connection = self._engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+            if not self._try_lock(connection):
+                self._take_over_stale_leader(connection)
+                connection.close()
+                return
+            backend_pid = self._backend_pid(connection)
+            self._write_lease(connection, backend_pid=backend_pid)
+        except SQLAlchemyError as acquire_error:
+            logger.warning("调度主节点选举失败", node_id=self.node_id, error=str(acquire_error))
+            if connection is not None:
+                connection.close()
+            return
+
+        self._connection = connection
+        logger.info("当前节点成为调度主节点", node_id=self.node_id, backend_pid=backend_pid)
+        self._on_elected()
+
+    def _heartbeat(self, connection: Connection) -> None:
+        try:
+            renewed = self._touch_lease(connection)
+        except SQLAlchemyError as heartbeat_error:
+            logger.warning("调度主节点心跳失败", node_id=self.node_id, error=str(heartbeat_error))
+            self._demote(reason="heartbeat_failed")
+            return
+        if not renewed:
+            self._demote(reason="lease_lost")
+
+    def _demote(self, *, reason: str) -> None:
+        connection = self._connection
+        self._connection = None
+        if connection is not None:
+            try:
+                connection.close()
+            except SQLAlchemyError:
+                logger.debug("关闭选主连接失败", node_id=self.node_id)
+        logger.warning("当前节点退出调度主节点", node_id=self.node_id, reason=reason)
+        self._on_demoted()
+
+    def _take_over_stale_leader(self, connection: Connection) -> None:
+        """租约超时(主节点挂起但连接未断开)时终止其数据库会话, 下一轮即可抢锁."""
+        lease = self._read_lease(connection)
+        if lease is None:
+            return
+        heartbeat_at = lease.heartbeat_at
+        if heartbeat_at.tzinfo is None:
+            heartbeat_at = heartbeat_at.replace(tzinfo=time_utils.now().tzinfo)
+        if time_utils.now() - heartbeat_at <= timedelta(seconds=self._lease_seconds):
+            return
+        terminated = self._terminate_backend(connection, lease.backend_pid)
+        logger.warning(
+            "调度主节点租约已过期,终止其数据库会话",
+            node_id=self.node_id,
+            stale_leader=lease.node_id,
+            backend_pid=lease.backend_pid,
+            terminated=terminated,
+        )
+
+    # ---- SQL ----
+
+    @staticmethod
+    def _try_lock(connection: Connection) -> bool:
+        result = connection.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": SCHEDULER_LEADER_LOCK_KEY})
+        return bool(result.scalar())
+
+    @staticmethod
+    def _unlock(connection: Connection) -> None:
+        connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": SCHEDULER_LEADER_LOCK_KEY})
+
+    @staticmethod
+    def _backend_pid(connection: Connection) -> int:
+        return int(connection.execute(text("SELECT pg_backend_pid()")).scalar() or 0)
+
+    def _write_lease(self, connection: Connection, *, backend_pid: int) -> None:
+        now = time_utils.now()
+        stmt = pg_insert(scheduler_leader_leases).values(
+            name=SCHEDULER_LEADER_LEASE_NAME,
+            node_id=self.node_id,
+            backend_pid=backend_pid,
+            acquired_at=now,
+            heartbeat_at=now,
+        )
+        connection.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[scheduler_leader_leases.c.name],
+                set_={
+                    "node_id": stmt.excluded.node_id,
+                    "backend_pid": stmt.excluded.backend_pid,
+                    "acquired_at": stmt.excluded.acquired_at,
+                    "heartbeat_at": stmt.excluded.heartbeat_at,
+                },
+            ),
+        )
+
+    def _touch_lease(self, connection: Connection) -> bool:
+        """刷新心跳; 租约已被其他节点改写时返回 False."""
+        result = connection.execute(
+            update(scheduler_leader_leases)
+            .where(
+                scheduler_leader_leases.c.name == SCHEDULER_LEADER_LEASE_NAME,
+                scheduler_leader_leases.c.node_id == self.node_id,
+                scheduler_leader_leases.c.backend_pid == func.pg_backend_pid(),
+            )
+            .values(heartbeat_at=time_utils.now()),
+        )
+        return bool(result.rowcount)
+
+    @staticmethod
+    def _read_lease(connection: Connection) -> SchedulerLeaderLease | None:
+        row = connection.execute(
+            select(
+                scheduler_leader_leases.c.node_id,
+                scheduler_leader_leases.c.backend_pid,
+                scheduler_leader_leases.c.acquired_at,
+                scheduler_leader_leases.c.heartbeat_at,
+            ).where(scheduler_leader_leases.c.name == SCHEDULER_LEADER_LEASE_NAME),
+        ).first()
+        if row is None:
+            return None
+        return SchedulerLeaderLease(
+            node_id=str(row.node_id),
+            backend_pid=int(row.backend_pid),
+            acquired_at=row.acquired_at,
+            heartbeat_at=row.heartbeat_at,
+        )
+
+    @staticmethod
+    def _terminate_backend(connection: Connection, backend_pid: int) -> bool:
+        # 仅终止确实持有调度选主锁的会话, 避免 pid 已被复用时误杀其它连接
+        result = connection.execute(
+            text(
+                "SELECT pg_terminate_backend(pid) FROM pg_locks "
+                "WHERE locktype = 'advisory' AND granted AND pid = :pid "
+                "AND ((classid::bigint << 32) | objid::bigint) = :key",
+            ),
+            {"pid": backend_pid, "key": SCHEDULER_LEADER_LOCK_KEY},
+        )
+        return bool(result.scalar())
@@ -28,6 +28,7 @@ __all__ = [
     "AdDomainConfig",
     "ClassificationRule",
     "Credential",
+    "DashboardMetricBucket",
     "DatabaseSizeAggregation",
     "DatabaseSizeStat",
     "EmailAlertEvent",
@@ -37,6 +38,7 @@ __all__ = [
     "InstanceAccount",
     "InstanceConfigSnapshot",
     "InstanceDatabase",
+    "InstanceReachability",
     "InstanceSizeAggregation",
     "InstanceSizeStat",
     "JumpServerAssetSnapshot",
@@ -52,6 +54,8 @@ __all__ = [
     "SyncInstanceRecord",
     "SyncSession",
     "User",
+    "VeeamBackupObjectWatermark",
+    "VeeamInstanceBackupMatch",
     "VeeamMachineBackupSnapshot",
     "VeeamSourceBinding",
 ]
@@ -65,6 +69,7 @@ _MODEL_MODULE_MAP: dict[str, str] = {
     "AccountPermission": "app.models.account_permission",
     "AdDomainConfig": "app.models.ad_domain_config",
     "Credential": "app.models.credential",
+    "DashboardMetricBucket": "app.models.dashboard_metric_bucket",
     "DatabaseSizeAggregation": "app.models.database_size_aggregation",
     "DatabaseSizeStat": "app.models.database_size_stat",
     "EmailAlertEvent": "app.models.email_alert_event",
@@ -74,6 +79,7 @@ _MODEL_MODULE_MAP: dict[str, str] = {
     "InstanceAccount": "app.models.instance_account",
     "InstanceConfigSnapshot": "app.models.instance_config_snapshot",
     "InstanceDatabase": "app.models.instance_database",
+    "InstanceReachability": "app.models.instance_reachability",
     "InstanceSizeAggregation": "app.models.instance_size_aggregation",
     "InstanceSizeStat": "app.models.instance_size_stat",
     "JumpServerAssetSnapshot": "app.models.jumpserver_asset_snapshot",
@@ -89,6 +95,8 @@ _MODEL_MODULE_MAP: dict[str, str] = {
     "SyncInstanceRecord": "app.models.sync_instance_record",
     "SyncSession": "app.models.sync_session",
     "User": "app.models.user",
+    "VeeamBackupObjectWatermark": "app.models.veeam_backup_object_watermark",
+    "VeeamInstanceBackupMatch": "app.models.veeam_instance_backup_match",
     "VeeamMachineBackupSnapshot": "app.models.veeam_machine_backup_snapshot",
     "VeeamSourceBinding": "app.models.veeam_source_binding",
 }
@@ -106,6 +114,7 @@ if TYPE_CHECKING:
     from app.models.account_permission import AccountPermission
     from app.models.ad_domain_config import AdDomainConfig
     from app.models.credential import Credential
+    from app.models.dashboard_metric_bucket import DashboardMetricBucket
     from app.models.database_size_aggregation import DatabaseSizeAggregation
     from app.models.database_size_stat import DatabaseSizeStat
     from app.models.email_alert_event import EmailAlertEvent
@@ -115,6 +124,7 @@ if TYPE_CHECKING:
     from app.models.instance_account import InstanceAccount
     from app.models.instance_config_snapshot import InstanceConfigSnapshot
     from app.models.instance_database import InstanceDatabase
+    from app.models.instance_reachability import InstanceReachability
     from app.models.instance_size_aggregation import InstanceSizeAggregation
     from app.models.instance_size_stat import InstanceSizeStat
     from app.models.jumpserver_asset_snapshot import JumpServerAssetSnapshot
@@ -127,6 +137,8 @@ if TYPE_CHECKING:
     from app.models.sync_instance_record import SyncInstanceRecord
     from app.models.sync_session import SyncSession
     from app.models.user import User
+    from app.models.veeam_backup_object_watermark import VeeamBackupObjectWatermark
+    from app.models.veeam_instance_backup_match import VeeamInstanceBackupMatch
     from app.models.veeam_machine_backup_snapshot import VeeamMachineBackupSnapshot
     from app.models.veeam_source_binding import VeeamSourceBinding
 
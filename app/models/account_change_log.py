@@ -50,7 +50,7 @@ class AccountChangeLog(db.Model):
         db.String(50),
         nullable=False,
     )  # 变更类型:add(新增)、modify_privilege(权限变更)、modify_other(其他修改)、delete(删除)
-    change_time = db.Column(db.DateTime(timezone=True), default=time_utils.now, index=True)
+    change_time = db.Column(db.DateTime(timezone=True), nullable=False, default=time_utils.now, index=True)
     session_id = db.Column(db.String(36), nullable=True)
     status = db.Column(db.String(20), default="success")
     message = db.Column(db.Text, nullable=True)
@@ -70,6 +70,7 @@ class AccountChangeLog(db.Model):
         db.Index("idx_change_type_time", "change_type", "change_time"),
         db.Index("idx_username_time", "username", "change_time"),
         db.Index("idx_account_change_log_owner_time", "owner_type", "owner_id", "change_time"),
+        db.Index("idx_account_change_log_time_id", "change_time", "id"),
     )
 
     # 关联实例
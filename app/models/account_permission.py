@@ -41,6 +41,8 @@ class AccountPermission(BaseSyncData):
         permission_snapshot: 权限快照(v4, jsonb).
         permission_facts: 权限事实(用于统计/查询, jsonb).
         last_sync_time: 最后同步时间.
+        permission_fingerprint: 远端权限指纹(未变化时跳过权限补全).
+        permission_full_synced_at: 最近一次全量补全并比对权限的时间.
 
     """
 
@@ -50,6 +52,7 @@ class AccountPermission(BaseSyncData):
         db.UniqueConstraint("owner_type", "owner_id", "db_type", "username", name="uq_account_permission_owner"),
         db.Index("idx_account_permission_instance_dbtype", "instance_id", "db_type"),
         db.Index("idx_account_permission_username", "username"),
+        db.Index("idx_account_permission_username_id", "username", "id"),
         db.Index("idx_account_permission_owner", "owner_type", "owner_id"),
         db.Index("idx_account_permission_instance_username", "instance_id", "db_type", "username"),
     )
@@ -86,6 +89,10 @@ class AccountPermission(BaseSyncData):
     last_change_type = db.Column(db.String(20), default="add")
     last_change_time = db.Column(db.DateTime(timezone=True), default=time_utils.now, index=True)
 
+    # 远端权限指纹 指纹未变化且全量比对未过期时跳过权限补全
+    permission_fingerprint = db.Column(db.String(64), nullable=True)
+    permission_full_synced_at = db.Column(db.DateTime(timezone=True), nullable=True)
+
     instance = db.relationship("Instance", backref="account_permissions")
     instance_account = db.relationship(
         "InstanceAccount",
@@ -33,6 +33,9 @@ class AdDomainConfig(db.Model):
     last_sync_status = db.Column(db.String(32), nullable=True)
     last_sync_run_id = db.Column(db.String(64), nullable=True)
     last_error = db.Column(db.Text, nullable=True)
+    # 各域控最近一次同步时的 highestCommittedUSN, 用于按 uSNChanged 增量拉取
+    usn_watermarks = db.Column(db.JSON().with_variant(postgresql.JSONB(), "postgresql"), nullable=False, default=dict)
+    last_full_sync_at = db.Column(db.DateTime(timezone=True), nullable=True)
     created_at = db.Column(db.DateTime(timezone=True), nullable=False, default=time_utils.now)
     updated_at = db.Column(db.DateTime(timezone=True), nullable=False, default=time_utils.now, onupdate=time_utils.now)
 
@@ -63,4 +66,5 @@ class AdDomainConfig(db.Model):
             "last_sync_status": self.last_sync_status,
             "last_sync_run_id": self.last_sync_run_id,
             "last_error": self.last_error,
+            "last_full_sync_at": self.last_full_sync_at.isoformat() if self.last_full_sync_at else None,
         }
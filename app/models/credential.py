@@ -7,6 +7,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, TypedDict, Unpack
 
 from app import db
+from app.utils.credential_secret_cache import credential_secret_cache
 from app.utils.password_crypto_utils import get_password_manager
 from app.utils.structlog_config import get_system_logger
 from app.utils.time_utils import time_utils
@@ -129,6 +130,8 @@ class Credential(db.Model):
         """
         # 使用新的加密方式存储密码
         self.password = get_password_manager().encrypt_password(password)
+        # updated_at 在 flush 时才变化, 先行失效避免读到旧密码
+        credential_secret_cache.invalidate(self.id)
 
     @classmethod
     def _filter_model_fields(cls, payload: Mapping[str, object]) -> dict[str, object]:
@@ -183,13 +186,24 @@ class Credential(db.Model):
         """获取原始密码(用于数据库连接).
 
         仅支持解密新格式密文,旧格式将返回空字符串.
+        解密结果按 (id, updated_at) 写入短期内存缓存, 同一凭据重复建连时跳过解密.
 
         Returns:
             解密后的原始密码,失败时返回空字符串.
 
         """
+        cached = credential_secret_cache.get(self.id, updated_at=self.updated_at)
+        if cached is not None and cached[0] == self.username:
+            return cached[1]
         if get_password_manager().is_encrypted(self.password):
-            return get_password_manager().decrypt_password(self.password)
+            plain_password = get_password_manager().decrypt_password(self.password)
+            credential_secret_cache.put(
+                self.id,
+                updated_at=self.updated_at,
+                username=self.username,
+                password=plain_password,
+            )
+            return plain_password
 
         system_logger = get_system_logger()
         system_logger.warning(
@@ -0,0 +1,40 @@
+"""仪表盘指标小时桶模型.
+
+按 (metric, dimension, 小时) 累加计数, 由写入方增量维护:
+- log_level: 统一日志按级别计数(日志队列 worker 批量落库时累加)
+- sync_session: 同步会话按分类计数(创建会话时累加)
+
+仪表盘趋势/分布只需扫描桶表, 不再对明细表做 COUNT/GROUP BY.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import BigInteger, Integer
+
+from app import db
+from app.utils.time_utils import time_utils
+
+DASHBOARD_METRIC_LOG_LEVEL = "log_level"
+DASHBOARD_METRIC_SYNC_SESSION = "sync_session"
+
+
+class DashboardMetricBucket(db.Model):
+    """仪表盘指标小时桶."""
+
+    __tablename__ = "dashboard_metric_buckets"
+
+    id = db.Column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        nullable=False,
+    )
+    metric = db.Column(db.String(32), nullable=False)
+    dimension = db.Column(db.String(64), nullable=False, default="")
+    bucket_start = db.Column(db.DateTime(timezone=True), nullable=False)
+    count = db.Column(BigInteger().with_variant(Integer, "sqlite"), nullable=False, default=0)
+    updated_at = db.Column(db.DateTime(timezone=True), nullable=False, default=time_utils.now, onupdate=time_utils.now)
+
+    __table_args__ = (
+        db.UniqueConstraint("metric", "dimension", "bucket_start", name="uq_dashboard_metric_buckets_key"),
+        db.Index("ix_dashboard_metric_buckets_metric_start", "metric", "bucket_start"),
+    )
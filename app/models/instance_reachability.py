@@ -0,0 +1,56 @@
+"""实例可达性状态模型.
+
+后台探测任务周期性对实例做 TCP(可选协议级)探测, 每个实例保留一行最新状态与滚动窗口样本,
+供连接状态、风险中心、仪表盘读取, 同步任务据此跳过已知不可达的实例.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Unpack
+
+from sqlalchemy.dialects import postgresql
+
+from app import db
+from app.utils.time_utils import time_utils
+
+if TYPE_CHECKING:
+    from app.core.types.orm_kwargs import InstanceReachabilityOrmFields
+
+
+class InstanceReachability(db.Model):
+    """实例可达性最新状态与滚动统计."""
+
+    __tablename__ = "instance_reachability"
+
+    id = db.Column(db.Integer, primary_key=True)
+    instance_id = db.Column(
+        db.Integer,
+        db.ForeignKey("instances.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    # up/down/unknown
+    status = db.Column(db.String(16), nullable=False, default="unknown", index=True)
+    last_checked_at = db.Column(db.DateTime(timezone=True), nullable=True)
+    last_up_at = db.Column(db.DateTime(timezone=True), nullable=True)
+    last_down_at = db.Column(db.DateTime(timezone=True), nullable=True)
+    last_latency_ms = db.Column(db.Float, nullable=True)
+    last_error = db.Column(db.String(255), nullable=True)
+    consecutive_failures = db.Column(db.Integer, nullable=False, default=0)
+    # 滚动窗口样本: [[epoch_seconds, latency_ms|null], ...], null 表示该次探测失败
+    recent_samples = db.Column(
+        db.JSON().with_variant(postgresql.JSONB(), "postgresql"),
+        nullable=False,
+        default=list,
+    )
+    availability_ratio = db.Column(db.Float, nullable=True)
+    avg_latency_ms = db.Column(db.Float, nullable=True)
+    created_at = db.Column(db.DateTime(timezone=True), nullable=False, default=time_utils.now)
+    updated_at = db.Column(db.DateTime(timezone=True), nullable=False, default=time_utils.now, onupdate=time_utils.now)
+
+    __table_args__ = (db.UniqueConstraint("instance_id", name="uq_instance_reachability_instance_id"),)
+
+    if TYPE_CHECKING:
+
+        def __init__(self, **orm_fields: Unpack[InstanceReachabilityOrmFields]) -> None:
+            """Type-checking helper for ORM keyword arguments."""
+            ...
@@ -36,6 +36,8 @@ class TaskRun(db.Model):
     completed_at = db.Column(db.DateTime(timezone=True), nullable=True)
 
     created_by = db.Column(db.Integer, nullable=True)
+    # 依赖触发时记录触发本次运行的上游 run(用于流水线关键路径展示)
+    upstream_run_id = db.Column(db.String(36), nullable=True, index=True)
 
     progress_total = db.Column(db.Integer, nullable=False, default=0)
     progress_completed = db.Column(db.Integer, nullable=False, default=0)
@@ -69,6 +71,7 @@ class TaskRun(db.Model):
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
             "created_by": self.created_by,
+            "upstream_run_id": self.upstream_run_id,
             "progress_total": self.progress_total,
             "progress_completed": self.progress_completed,
             "progress_failed": self.progress_failed,
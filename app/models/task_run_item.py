@@ -25,6 +25,7 @@ class TaskRunItem(db.Model):
     __table_args__ = (
         db.UniqueConstraint("run_id", "item_type", "item_key", name="uq_task_run_items_run_type_key"),
         db.Index("ix_task_run_items_run_id_status", "run_id", "status"),
+        db.Index("ix_task_run_items_status_heartbeat_at", "status", "heartbeat_at"),
     )
 
     id = db.Column(db.Integer, primary_key=True)
@@ -44,6 +45,11 @@ class TaskRunItem(db.Model):
 
     status = db.Column(db.String(32), nullable=False, default=TaskRunStatus.PENDING, index=True)
 
+    # 分片认领: 认领节点与心跳时间(心跳超时的 running 子项可被其他节点重新认领)
+    claimed_by = db.Column(db.String(255), nullable=True)
+    heartbeat_at = db.Column(db.DateTime(timezone=True), nullable=True)
+    claim_count = db.Column(db.Integer, nullable=False, default=0)
+
     started_at = db.Column(db.DateTime(timezone=True), nullable=True)
     completed_at = db.Column(db.DateTime(timezone=True), nullable=True)
 
@@ -67,6 +73,7 @@ class TaskRunItem(db.Model):
             "item_name": self.item_name,
             "instance_id": self.instance_id,
             "status": self.status,
+            "claimed_by": self.claimed_by,
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
             "metrics_json": self.metrics_json,
@@ -72,6 +72,7 @@ class UnifiedLog(db.Model):
         Index("idx_timestamp_level_module", "timestamp", "level", "module"),
         Index("idx_timestamp_module", "timestamp", "module"),
         Index("idx_level_timestamp", "level", "timestamp"),
+        Index("idx_unified_logs_timestamp_id", "timestamp", "id"),
     )
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
@@ -0,0 +1,48 @@
+"""Veeam backupObject 增量同步水位模型.
+
+每个数据源下每个 backupObject 记录已写入快照的最新 restorePoint 创建时间与 backupFile,
+下次同步只拉取更新的 restorePoints, 未变化的备份跳过 backupFiles 查询.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Unpack
+
+from app import db
+from app.utils.time_utils import time_utils
+
+if TYPE_CHECKING:
+    from app.core.types.orm_kwargs import VeeamBackupObjectWatermarkOrmFields
+
+
+class VeeamBackupObjectWatermark(db.Model):
+    """Veeam backupObject restorePoint 水位."""
+
+    __tablename__ = "veeam_backup_object_watermarks"
+
+    id = db.Column(db.Integer, primary_key=True)
+    source_binding_id = db.Column(db.Integer, db.ForeignKey("veeam_source_bindings.id"), nullable=False, index=True)
+    backup_object_id = db.Column(db.String(255), nullable=False)
+    machine_name = db.Column(db.String(255), nullable=True)
+    latest_restore_point_at = db.Column(db.DateTime(timezone=True), nullable=False)
+    latest_restore_point_id = db.Column(db.String(255), nullable=True)
+    backup_id = db.Column(db.String(255), nullable=True)
+    latest_backup_file_id = db.Column(db.String(255), nullable=True)
+    full_synced_at = db.Column(db.DateTime(timezone=True), nullable=False, default=time_utils.now)
+    sync_run_id = db.Column(db.String(64), nullable=True)
+    created_at = db.Column(db.DateTime(timezone=True), nullable=False, default=time_utils.now)
+    updated_at = db.Column(db.DateTime(timezone=True), nullable=False, default=time_utils.now, onupdate=time_utils.now)
+
+    __table_args__ = (
+        db.UniqueConstraint(
+            "source_binding_id",
+            "backup_object_id",
+            name="uq_veeam_watermark_source_backup_object",
+        ),
+    )
+
+    if TYPE_CHECKING:
+
+        def __init__(self, **orm_fields: Unpack[VeeamBackupObjectWatermarkOrmFields]) -> None:
+            """Type-checking helper for ORM keyword arguments."""
+            ...
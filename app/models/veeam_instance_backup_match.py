@@ -0,0 +1,69 @@
+"""Veeam 实例备份匹配模型.
+
+预先计算每个实例在每个 Veeam 数据源下匹配到的机器备份快照(机器名/IP 双通道),
+备份摘要读取时直接按实例 ID 关联快照, 无需逐请求展开候选名称/IP.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Unpack
+
+from sqlalchemy.dialects import postgresql
+
+from app import db
+from app.utils.time_utils import time_utils
+
+if TYPE_CHECKING:
+    from app.core.types.orm_kwargs import VeeamInstanceBackupMatchOrmFields
+
+
+class VeeamInstanceBackupMatch(db.Model):
+    """实例 → Veeam 机器备份快照匹配."""
+
+    __tablename__ = "veeam_instance_backup_matches"
+
+    id = db.Column(db.Integer, primary_key=True)
+    instance_id = db.Column(
+        db.Integer,
+        db.ForeignKey("instances.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    source_binding_id = db.Column(
+        db.Integer,
+        db.ForeignKey("veeam_source_bindings.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    snapshot_id = db.Column(
+        db.Integer,
+        db.ForeignKey("veeam_machine_backup_snapshots.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    name_candidates = db.Column(
+        db.JSON().with_variant(postgresql.JSONB(), "postgresql"),
+        nullable=False,
+        default=list,
+    )
+    ip_candidates = db.Column(
+        db.JSON().with_variant(postgresql.JSONB(), "postgresql"),
+        nullable=False,
+        default=list,
+    )
+    created_at = db.Column(db.DateTime(timezone=True), nullable=False, default=time_utils.now)
+    updated_at = db.Column(db.DateTime(timezone=True), nullable=False, default=time_utils.now, onupdate=time_utils.now)
+
+    __table_args__ = (
+        db.UniqueConstraint(
+            "instance_id",
+            "source_binding_id",
+            name="uq_veeam_instance_backup_match_instance_source",
+        ),
+    )
+
+    if TYPE_CHECKING:
+
+        def __init__(self, **orm_fields: Unpack[VeeamInstanceBackupMatchOrmFields]) -> None:
+            """Type-checking helper for ORM keyword arguments."""
+            ...
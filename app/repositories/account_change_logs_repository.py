@@ -20,8 +20,15 @@ from app.models.account_change_log import AccountChangeLog
 from app.models.account_permission import AccountPermission
 from app.models.instance import Instance
 from app.models.sqlserver_cluster import SQLServerAvailabilityGroup
+from app.repositories.keyset_pagination import paginate_keyset
 from app.utils.time_utils import time_utils
 
+# keyset 分页时可空排序列的 NULL 替代值, 保证游标比较覆盖 NULL 行;
+# change_time 为 NOT NULL, 直接按 (change_time, id) 排序以命中 idx_account_change_log_time_id
+_KEYSET_NULL_SORT_VALUES: dict[str, object] = {
+    "status": "",
+}
+
 
 class AccountChangeLogsRepository:
     """账户变更日志查询 Repository."""
@@ -43,7 +50,8 @@ class AccountChangeLogsRepository:
             "change_type": change_type_column,
             "status": status_column,
         }
-        sort_column = sortable_fields.get(filters.sort_field, change_time_column)
+        sort_field = filters.sort_field if filters.sort_field in sortable_fields else "change_time"
+        sort_column = sortable_fields[sort_field]
         ordering = sort_column.asc() if filters.sort_order == "asc" else sort_column.desc()
 
         instance_name_column = cast(ColumnElement[str], Instance.name)
@@ -117,6 +125,20 @@ class AccountChangeLogsRepository:
                 ),
             )
 
+        if filters.keyset is not None:
+            return paginate_keyset(
+                query,
+                keyset=filters.keyset,
+                limit=filters.limit,
+                sort_field=sort_field,
+                sort_column=sort_column,
+                id_column=cast(ColumnElement[int], AccountChangeLog.id),
+                sort_order=filters.sort_order,
+                sort_value_getter=lambda row: getattr(row[0], sort_field),
+                id_getter=lambda row: int(row[0].id),
+                null_sort_value=_KEYSET_NULL_SORT_VALUES.get(sort_field),
+            )
+
         query = query.order_by(ordering, AccountChangeLog.id.desc())
         pagination = cast(Any, query).paginate(page=filters.page, per_page=filters.limit, error_out=False)
         return PaginatedResult(
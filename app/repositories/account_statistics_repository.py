@@ -10,7 +10,7 @@ from __future__ import annotations
 from collections.abc import Sequence
 from typing import Any
 
-from sqlalchemy import and_, case, distinct, false, func, inspect, or_
+from sqlalchemy import and_, distinct, exists, func, inspect, or_
 
 from app import db
 from app.core.types.account_scope import AccountScope
@@ -51,70 +51,39 @@ class AccountStatisticsRepository:
         if resolved_scope is None and instance_id is not None:
             resolved_scope = AccountScope(owner_type="instance", owner_id=instance_id)
 
-        counts_query = (
-            db.session.query(
-                func.count(distinct(InstanceAccount.id)).label("total_accounts"),
-                func.count(
-                    distinct(case((InstanceAccount.is_active.is_(True), InstanceAccount.id), else_=None)),
-                ).label("active_accounts"),
-            )
-            .join(Instance, Instance.id == InstanceAccount.instance_id)
-            .filter(Instance.deleted_at.is_(None))
-        )
-        locked_query = (
-            db.session.query(func.count(distinct(InstanceAccount.id)).label("locked_accounts"))
-            .join(AccountPermission, AccountPermission.instance_account_id == InstanceAccount.id)
-            .join(Instance, Instance.id == InstanceAccount.instance_id)
-            .filter(
-                Instance.deleted_at.is_(None),
-                InstanceAccount.is_active.is_(True),
-                AccountPermission.is_locked.is_(True),
-            )
+        facet_rows = AccountStatisticsRepository._query_account_facet_rows(
+            db_type=db_type,
+            account_scope=resolved_scope,
         )
+        return AccountStatisticsRepository._build_summary(facet_rows, db_type=db_type, account_scope=resolved_scope)
 
-        if resolved_scope is not None:
-            counts_query = AccountStatisticsRepository._apply_instance_account_scope_filter(counts_query, resolved_scope)
-            locked_query = AccountStatisticsRepository._apply_instance_account_scope_filter(locked_query, resolved_scope)
-
-        if db_type:
-            counts_query = counts_query.filter(InstanceAccount.db_type == db_type)
-            locked_query = locked_query.filter(InstanceAccount.db_type == db_type)
-
-        counts_row = counts_query.one()
-        total_value = getattr(counts_row, "total_accounts", None)
-        total_accounts = int(total_value) if total_value is not None else 0
-
-        active_value = getattr(counts_row, "active_accounts", None)
-        active_accounts = int(active_value) if active_value is not None else 0
-
-        locked_value = locked_query.scalar()
-        locked_accounts = int(locked_value) if locked_value is not None else 0
+    @staticmethod
+    def fetch_statistics_snapshot() -> tuple[dict[str, Any], dict[str, dict[str, int]]]:
+        """一次分组扫描同时返回全局汇总与按数据库类型统计."""
+        facet_rows = AccountStatisticsRepository._query_account_facet_rows()
+        summary = AccountStatisticsRepository._build_summary(facet_rows, db_type=None, account_scope=None)
+        return summary, AccountStatisticsRepository._rollup_db_type_stats(facet_rows)
 
+    @staticmethod
+    def _build_summary(
+        facet_rows: list[Any],
+        *,
+        db_type: str | None,
+        account_scope: AccountScope | None,
+    ) -> dict[str, Any]:
+        total_accounts = sum(int(row.total or 0) for row in facet_rows)
+        active_accounts = sum(int(row.active or 0) for row in facet_rows)
+        locked_accounts = sum(int(row.locked or 0) for row in facet_rows)
         deleted_accounts = max(total_accounts - active_accounts, 0)
         normal_accounts = max(active_accounts - locked_accounts, 0)
 
-        base_instance_query = Instance.query
-        deleted_query = Instance.query
-        active_instance_query = base_instance_query.filter(Instance.deleted_at.is_(None))
-        if db_type:
-            active_instance_query = active_instance_query.filter(Instance.db_type == db_type)
-            deleted_query = deleted_query.filter(Instance.db_type == db_type)
-
-        if resolved_scope is not None:
-            if resolved_scope.owner_type == "instance":
-                active_instance_query = active_instance_query.filter(Instance.id == resolved_scope.owner_id)
-                deleted_query = deleted_query.filter(Instance.id == resolved_scope.owner_id)
-            else:
-                active_instance_query = active_instance_query.filter(false())
-                deleted_query = deleted_query.filter(false())
-
-        physical_active_instances = active_instance_query.filter(Instance.is_active.is_(True)).count()
-        disabled_instances = active_instance_query.filter(Instance.is_active.is_(False)).count()
-        deleted_instances = deleted_query.filter(Instance.deleted_at.isnot(None)).count()
+        physical_active_instances, disabled_instances, deleted_instances = (
+            AccountStatisticsRepository._count_instances_by_state(db_type=db_type, account_scope=account_scope)
+        )
         physical_instances = physical_active_instances + disabled_instances
         ag_virtual_instances = AccountStatisticsRepository._count_ag_virtual_instances(
             db_type=db_type,
-            account_scope=resolved_scope,
+            account_scope=account_scope,
         )
         total_instances = physical_instances + ag_virtual_instances
         active_instances = physical_active_instances + ag_virtual_instances
@@ -126,15 +95,11 @@ class AccountStatisticsRepository:
             "locked_accounts": locked_accounts,
             "normal_accounts": normal_accounts,
             "deleted_accounts": deleted_accounts,
-            "owner_type_stats": AccountStatisticsRepository.fetch_owner_type_stats(
-                db_type=db_type,
-                account_scope=resolved_scope,
+            "owner_type_stats": AccountStatisticsRepository._rollup_owner_type_stats(
+                facet_rows,
                 total_accounts=total_accounts,
             ),
-            "ad_status_stats": AccountStatisticsRepository.fetch_ad_status_stats(
-                db_type=db_type,
-                account_scope=resolved_scope,
-            ),
+            "ad_status_stats": AccountStatisticsRepository._rollup_ad_status_stats(facet_rows),
             "total_instances": total_instances,
             "physical_instances": physical_instances,
             "ag_virtual_instances": ag_virtual_instances,
@@ -144,6 +109,84 @@ class AccountStatisticsRepository:
             "deleted_instances": deleted_instances,
         }
 
+    @staticmethod
+    def _query_account_facet_rows(
+        *,
+        db_type: str | None = None,
+        account_scope: AccountScope | None = None,
+    ) -> list[Any]:
+        """单次扫描按 (owner_type, db_type) 分组, 用 FILTER 聚合出各统计维度.
+
+        每个账户只出现一行(锁定状态走 EXISTS), 因此无需 COUNT(DISTINCT);
+        汇总/来源/AD 状态/数据库类型均由分组结果在内存中归并.
+        """
+        is_active = InstanceAccount.is_active.is_(True)
+        is_locked = (
+            exists()
+            .where(
+                AccountPermission.instance_account_id == InstanceAccount.id,
+                AccountPermission.is_locked.is_(True),
+            )
+            .correlate(InstanceAccount)
+        )
+        ad_clean = and_(InstanceAccount.ad_disabled_at.is_(None), InstanceAccount.ad_orphaned_at.is_(None))
+        query = (
+            db.session.query(
+                InstanceAccount.owner_type.label("owner_type"),
+                InstanceAccount.db_type.label("db_type"),
+                func.count(InstanceAccount.id).label("total"),
+                func.count(InstanceAccount.id).filter(is_active).label("active"),
+                func.count(InstanceAccount.id).filter(and_(is_active, is_locked)).label("locked"),
+                func.count(InstanceAccount.id)
+                .filter(and_(is_active, InstanceAccount.ad_domain_config_id.isnot(None), ad_clean))
+                .label("ad_normal"),
+                func.count(InstanceAccount.id)
+                .filter(and_(is_active, InstanceAccount.ad_disabled_at.isnot(None)))
+                .label("ad_disabled"),
+                func.count(InstanceAccount.id)
+                .filter(
+                    and_(
+                        is_active,
+                        InstanceAccount.ad_disabled_at.is_(None),
+                        InstanceAccount.ad_orphaned_at.isnot(None),
+                    ),
+                )
+                .label("ad_orphaned"),
+                func.count(InstanceAccount.id)
+                .filter(and_(is_active, InstanceAccount.ad_domain_config_id.is_(None), ad_clean))
+                .label("ad_unmatched"),
+            )
+            .join(Instance, Instance.id == InstanceAccount.instance_id)
+            .filter(Instance.deleted_at.is_(None))
+        )
+        if account_scope is not None:
+            query = AccountStatisticsRepository._apply_instance_account_scope_filter(query, account_scope)
+        if db_type:
+            query = query.filter(InstanceAccount.db_type == db_type)
+        return query.group_by(InstanceAccount.owner_type, InstanceAccount.db_type).all()
+
+    @staticmethod
+    def _count_instances_by_state(
+        *,
+        db_type: str | None,
+        account_scope: AccountScope | None,
+    ) -> tuple[int, int, int]:
+        """单次查询返回 (启用, 停用, 已删除) 物理实例数."""
+        if account_scope is not None and account_scope.owner_type != "instance":
+            return 0, 0, 0
+        not_deleted = Instance.deleted_at.is_(None)
+        query = db.session.query(
+            func.count(Instance.id).filter(and_(not_deleted, Instance.is_active.is_(True))).label("active"),
+            func.count(Instance.id).filter(and_(not_deleted, Instance.is_active.is_(False))).label("disabled"),
+            func.count(Instance.id).filter(Instance.deleted_at.isnot(None)).label("deleted"),
+        )
+        if db_type:
+            query = query.filter(Instance.db_type == db_type)
+        if account_scope is not None:
+            query = query.filter(Instance.id == account_scope.owner_id)
+        row = query.one()
+        return int(row.active or 0), int(row.disabled or 0), int(row.deleted or 0)
+
     @staticmethod
     def _apply_account_scope_filter(query: Any, account_scope: AccountScope) -> Any:
         if account_scope.owner_type == "instance":
@@ -207,198 +250,82 @@ class AccountStatisticsRepository:
         return int(scalar_value) if scalar_value is not None else 0
 
     @staticmethod
-    def fetch_owner_type_stats(
+    def _rollup_owner_type_stats(
+        facet_rows: list[Any],
         *,
-        db_type: str | None = None,
-        account_scope: AccountScope | None = None,
-        total_accounts: int | None = None,
+        total_accounts: int,
     ) -> dict[str, dict[str, int | float]]:
-        """获取账户来源统计."""
-        query = (
-            db.session.query(
-                InstanceAccount.owner_type.label("owner_type"),
-                func.count(distinct(InstanceAccount.id)).label("total"),
-                func.count(
-                    distinct(case((InstanceAccount.is_active.is_(True), InstanceAccount.id), else_=None)),
-                ).label("active"),
-            )
-            .join(Instance, Instance.id == InstanceAccount.instance_id)
-            .filter(Instance.deleted_at.is_(None))
-        )
-        if account_scope is not None:
-            query = AccountStatisticsRepository._apply_instance_account_scope_filter(query, account_scope)
-        if db_type:
-            query = query.filter(InstanceAccount.db_type == db_type)
+        """按账户来源归并分组结果."""
+        totals: dict[str, tuple[int, int]] = {}
+        for row in facet_rows:
+            owner_type = str(row.owner_type or "instance")
+            total, active = totals.get(owner_type, (0, 0))
+            totals[owner_type] = (total + int(row.total or 0), active + int(row.active or 0))
 
         stats: dict[str, dict[str, int | float]] = {
             "instance": {"total": 0, "active": 0, "deleted": 0, "percent": 0.0},
             "sqlserver_ag": {"total": 0, "active": 0, "deleted": 0, "percent": 0.0},
         }
-        resolved_total = total_accounts
-        if resolved_total is None:
-            resolved_total = 0
-        for row in query.group_by(InstanceAccount.owner_type).all():
-            owner_type = str(getattr(row, "owner_type", "") or "instance")
-            if owner_type not in stats:
-                stats[owner_type] = {"total": 0, "active": 0, "deleted": 0, "percent": 0.0}
-            total = int(getattr(row, "total", 0) or 0)
-            active = int(getattr(row, "active", 0) or 0)
+        for owner_type, (total, active) in totals.items():
             stats[owner_type] = {
                 "total": total,
                 "active": active,
                 "deleted": max(total - active, 0),
-                "percent": round((total / resolved_total * 100), 1) if resolved_total else 0.0,
+                "percent": round((total / total_accounts * 100), 1) if total_accounts else 0.0,
             }
         return stats
 
     @staticmethod
-    def fetch_ad_status_stats(
-        *,
-        db_type: str | None = None,
-        account_scope: AccountScope | None = None,
-    ) -> dict[str, Any]:
-        """获取 AD 状态矩阵统计."""
-        query = (
-            db.session.query(
-                InstanceAccount.owner_type.label("owner_type"),
-                func.count(
-                    distinct(
-                        case(
-                            (
-                                and_(
-                                    InstanceAccount.ad_domain_config_id.isnot(None),
-                                    InstanceAccount.ad_disabled_at.is_(None),
-                                    InstanceAccount.ad_orphaned_at.is_(None),
-                                ),
-                                InstanceAccount.id,
-                            ),
-                            else_=None,
-                        ),
-                    ),
-                ).label("normal"),
-                func.count(
-                    distinct(case((InstanceAccount.ad_disabled_at.isnot(None), InstanceAccount.id), else_=None)),
-                ).label("disabled"),
-                func.count(
-                    distinct(
-                        case(
-                            (
-                                and_(
-                                    InstanceAccount.ad_disabled_at.is_(None),
-                                    InstanceAccount.ad_orphaned_at.isnot(None),
-                                ),
-                                InstanceAccount.id,
-                            ),
-                            else_=None,
-                        ),
-                    ),
-                ).label("orphaned"),
-                func.count(
-                    distinct(
-                        case(
-                            (
-                                and_(
-                                    InstanceAccount.ad_domain_config_id.is_(None),
-                                    InstanceAccount.ad_disabled_at.is_(None),
-                                    InstanceAccount.ad_orphaned_at.is_(None),
-                                ),
-                                InstanceAccount.id,
-                            ),
-                            else_=None,
-                        ),
-                    ),
-                ).label("unmatched"),
-            )
-            .join(Instance, Instance.id == InstanceAccount.instance_id)
-            .filter(
-                Instance.deleted_at.is_(None),
-                InstanceAccount.is_active.is_(True),
-            )
-        )
-        if account_scope is not None:
-            query = AccountStatisticsRepository._apply_instance_account_scope_filter(query, account_scope)
-        if db_type:
-            query = query.filter(InstanceAccount.db_type == db_type)
-
+    def _rollup_ad_status_stats(facet_rows: list[Any]) -> dict[str, Any]:
+        """按账户来源归并 AD 状态矩阵."""
         empty = {"normal": 0, "disabled": 0, "orphaned": 0, "unmatched": 0}
         by_owner_type: dict[str, dict[str, int]] = {
             "instance": dict(empty),
             "sqlserver_ag": dict(empty),
         }
         total = dict(empty)
-
-        for row in query.group_by(InstanceAccount.owner_type).all():
-            owner_type = str(getattr(row, "owner_type", "") or "instance")
-            counts = {
-                "normal": int(getattr(row, "normal", 0) or 0),
-                "disabled": int(getattr(row, "disabled", 0) or 0),
-                "orphaned": int(getattr(row, "orphaned", 0) or 0),
-                "unmatched": int(getattr(row, "unmatched", 0) or 0),
-            }
-            by_owner_type[owner_type] = counts
-            for key, value in counts.items():
+        for row in facet_rows:
+            owner_type = str(row.owner_type or "instance")
+            counts = by_owner_type.setdefault(owner_type, dict(empty))
+            for key in empty:
+                value = int(getattr(row, f"ad_{key}", 0) or 0)
+                counts[key] += value
                 total[key] += value
-
         return {
             "total": total,
             "by_owner_type": by_owner_type,
         }
 
     @staticmethod
-    def fetch_db_type_stats() -> dict[str, dict[str, int]]:
-        """获取按数据库类型统计."""
+    def _rollup_db_type_stats(facet_rows: list[Any]) -> dict[str, dict[str, int]]:
+        """按数据库类型归并分组结果(仅输出内置的四种类型)."""
         target_db_types = ["mysql", "postgresql", "oracle", "sqlserver"]
-
-        stats_query = (
-            db.session.query(
-                InstanceAccount.db_type.label("db_type"),
-                func.count(distinct(InstanceAccount.id)).label("total"),
-                func.count(
-                    distinct(case((InstanceAccount.is_active.is_(True), InstanceAccount.id), else_=None)),
-                ).label("active"),
-                func.count(
-                    distinct(
-                        case(
-                            (
-                                and_(
-                                    InstanceAccount.is_active.is_(True),
-                                    AccountPermission.is_locked.is_(True),
-                                ),
-                                InstanceAccount.id,
-                            ),
-                            else_=None,
-                        ),
-                    ),
-                ).label("locked"),
-            )
-            .outerjoin(AccountPermission, AccountPermission.instance_account_id == InstanceAccount.id)
-            .join(Instance, Instance.id == InstanceAccount.instance_id)
-            .filter(Instance.deleted_at.is_(None))
-            .group_by(InstanceAccount.db_type)
-        )
-
-        db_type_stats: dict[str, dict[str, int]] = {
-            db_type: {"total": 0, "active": 0, "normal": 0, "locked": 0, "deleted": 0} for db_type in target_db_types
-        }
-
-        for row in stats_query.all():
-            db_type = getattr(row, "db_type", None)
-            if db_type not in db_type_stats:
+        totals: dict[str, list[int]] = {db_type: [0, 0, 0] for db_type in target_db_types}
+        for row in facet_rows:
+            bucket = totals.get(row.db_type)
+            if bucket is None:
                 continue
-            total = int(getattr(row, "total", 0) or 0)
-            active = int(getattr(row, "active", 0) or 0)
-            locked = int(getattr(row, "locked", 0) or 0)
-            deleted = max(total - active, 0)
-            normal = max(active - locked, 0)
-            db_type_stats[db_type] = {
+            bucket[0] += int(row.total or 0)
+            bucket[1] += int(row.active or 0)
+            bucket[2] += int(row.locked or 0)
+
+        return {
+            db_type: {
                 "total": total,
                 "active": active,
-                "normal": normal,
+                "normal": max(active - locked, 0),
                 "locked": locked,
-                "deleted": deleted,
+                "deleted": max(total - active, 0),
             }
+            for db_type, (total, active, locked) in totals.items()
+        }
 
-        return db_type_stats
+    @staticmethod
+    def fetch_db_type_stats() -> dict[str, dict[str, int]]:
+        """获取按数据库类型统计."""
+        return AccountStatisticsRepository._rollup_db_type_stats(
+            AccountStatisticsRepository._query_account_facet_rows(),
+        )
 
     @staticmethod
     def fetch_classification_stats() -> dict[str, dict[str, Any]]:
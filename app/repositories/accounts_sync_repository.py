@@ -7,8 +7,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Collection
+from datetime import datetime
 from typing import Any, cast
 
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import contains_eager, load_only
 
 from app.models.account_permission import AccountPermission
@@ -60,14 +63,29 @@ class AccountsSyncRepository:
         return query.order_by(AccountPermission.username.asc()).all()
 
     @staticmethod
-    def list_instance_accounts(*, instance_id: int) -> list[InstanceAccount]:
-        """按实例获取 InstanceAccount 列表."""
-        return InstanceAccount.query.filter_by(instance_id=instance_id).all()
-
-    @staticmethod
-    def list_instance_accounts_by_owner(*, owner_type: str, owner_id: int | None) -> list[InstanceAccount]:
-        """按账户归属获取 InstanceAccount 列表."""
-        return InstanceAccount.query.filter_by(owner_type=owner_type, owner_id=owner_id).all()
+    def list_instance_accounts_for_sync(
+        *,
+        instance_id: int,
+        owners: Collection[tuple[str, int | None]] = (),
+        refresh: bool = False,
+    ) -> list[InstanceAccount]:
+        """一次查询获取实例自身及指定归属(如 AG)下的 InstanceAccount.
+
+        Args:
+            instance_id: 实例 ID.
+            owners: 额外的 (owner_type, owner_id) 归属范围.
+            refresh: 为 True 时用查询结果覆盖会话中已加载对象的属性(批量写入后重新读取).
+
+        """
+        conditions = [InstanceAccount.instance_id == instance_id]
+        conditions.extend(
+            and_(InstanceAccount.owner_type == owner_type, InstanceAccount.owner_id == owner_id)
+            for owner_type, owner_id in dict.fromkeys(owners)
+        )
+        query = InstanceAccount.query.filter(or_(*conditions)).order_by(InstanceAccount.id.asc())
+        if refresh:
+            query = query.execution_options(populate_existing=True)
+        return query.all()
 
     @staticmethod
     def get_permission_by_instance_account_id(instance_account_id: int) -> AccountPermission | None:
@@ -77,6 +95,30 @@ class AccountsSyncRepository:
             AccountPermission.query.filter_by(instance_account_id=instance_account_id).first(),
         )
 
+    @staticmethod
+    def list_permission_fingerprints(
+        instance_account_ids: Collection[int],
+    ) -> dict[int, tuple[str, datetime | None]]:
+        """按 instance_account_id 批量读取已记录的权限指纹与最近全量比对时间(无指纹的记录不返回)."""
+        if not instance_account_ids:
+            return {}
+        rows = (
+            AccountPermission.query.with_entities(
+                AccountPermission.instance_account_id,
+                AccountPermission.permission_fingerprint,
+                AccountPermission.permission_full_synced_at,
+            )
+            .filter(
+                AccountPermission.instance_account_id.in_(list(instance_account_ids)),
+                AccountPermission.permission_fingerprint.isnot(None),
+            )
+            .all()
+        )
+        return {
+            int(instance_account_id): (str(fingerprint), full_synced_at)
+            for instance_account_id, fingerprint, full_synced_at in rows
+        }
+
     @staticmethod
     def get_permission_by_instance_username(
         *,
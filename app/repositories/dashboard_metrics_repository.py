@@ -0,0 +1,140 @@
+"""仪表盘指标小时桶 Repository.
+
+职责:
+- 封装小时桶的增量 upsert(count = count + excluded.count)与区间读取
+- 不做业务编排、不返回 Response、不 commit
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from datetime import date, datetime, timedelta
+from typing import cast
+
+from sqlalchemy import Table, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.postgresql.dml import Insert as PostgresInsert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.dialects.sqlite.dml import Insert as SqliteInsert
+
+from app import db
+from app.models.dashboard_metric_bucket import DashboardMetricBucket
+from app.utils.time_utils import CHINA_TZ, UTC_TZ, time_utils
+
+InsertStatement = PostgresInsert | SqliteInsert
+BucketKey = tuple[str, datetime]
+
+
+def truncate_to_hour(value: datetime) -> datetime:
+    """将时间截断到 UTC 整点(桶起点)."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC_TZ)
+    return value.astimezone(UTC_TZ).replace(minute=0, second=0, microsecond=0)
+
+
+class DashboardMetricsRepository:
+    """仪表盘指标小时桶 Repository."""
+
+    @staticmethod
+    def _resolve_insert_stmt(table: Table) -> InsertStatement:
+        dialect = getattr(getattr(db.session, "bind", None), "dialect", None)
+        dialect_name = getattr(dialect, "name", "")
+        if dialect_name == "sqlite":
+            return sqlite_insert(table)
+        return pg_insert(table)
+
+    @classmethod
+    def increment(cls, metric: str, counts: Mapping[BucketKey, int]) -> None:
+        """按 (dimension, 桶起点) 累加计数."""
+        records = [
+            {
+                "metric": metric,
+                "dimension": dimension,
+                "bucket_start": truncate_to_hour(bucket_start),
+                "count": int(count),
+                "updated_at": time_utils.now(),
+            }
+            for (dimension, bucket_start), count in counts.items()
+            if count
+        ]
+        if not records:
+            return
+
+        table = cast(Table, DashboardMetricBucket.__table__)  # type: ignore[attr-defined]
+        insert_stmt = cls._resolve_insert_stmt(table).values(records)
+        stmt = insert_stmt.on_conflict_do_update(
+            index_elements=[table.c.metric, table.c.dimension, table.c.bucket_start],
+            set_={
+                "count": table.c.count + insert_stmt.excluded.count,
+                "updated_at": insert_stmt.excluded.updated_at,
+            },
+        )
+        db.session.execute(stmt)
+
+    @staticmethod
+    def fetch_buckets(
+        metric: str,
+        *,
+        start_utc: datetime,
+        end_utc: datetime,
+        dimensions: Iterable[str] | None = None,
+    ) -> list[tuple[str, datetime, int]]:
+        """读取区间内的桶, 返回 (dimension, bucket_start, count)."""
+        query = db.session.query(
+            DashboardMetricBucket.dimension,
+            DashboardMetricBucket.bucket_start,
+            DashboardMetricBucket.count,
+        ).filter(
+            DashboardMetricBucket.metric == metric,
+            DashboardMetricBucket.bucket_start >= start_utc,
+            DashboardMetricBucket.bucket_start < end_utc,
+        )
+        if dimensions is not None:
+            query = query.filter(DashboardMetricBucket.dimension.in_(list(dimensions)))
+        return [(str(dimension), bucket_start, int(count or 0)) for dimension, bucket_start, count in query.all()]
+
+    @staticmethod
+    def sum_by_dimension(metric: str, *, dimensions: Iterable[str] | None = None) -> dict[str, int]:
+        """按 dimension 汇总全部桶计数."""
+        query = db.session.query(
+            DashboardMetricBucket.dimension,
+            func.sum(DashboardMetricBucket.count),
+        ).filter(DashboardMetricBucket.metric == metric)
+        if dimensions is not None:
+            query = query.filter(DashboardMetricBucket.dimension.in_(list(dimensions)))
+        rows = query.group_by(DashboardMetricBucket.dimension).all()
+        return {str(dimension): int(total or 0) for dimension, total in rows}
+
+    @classmethod
+    def fetch_china_daily_counts(
+        cls,
+        metric: str,
+        *,
+        days: int,
+        dimensions: Iterable[str] | None = None,
+    ) -> tuple[list[date], dict[tuple[date, str], int]]:
+        """按东八区自然日汇总最近 N 天的桶计数.
+
+        东八区日界与 UTC 整点对齐, 小时桶可无损归并到自然日.
+
+        Returns:
+            (日期列表, {(日期, dimension): count}).
+
+        """
+        window_days = max(1, int(days))
+        end_day = time_utils.now_china().date()
+        day_list = [end_day - timedelta(days=window_days - 1 - offset) for offset in range(window_days)]
+        start_utc = datetime(day_list[0].year, day_list[0].month, day_list[0].day, tzinfo=CHINA_TZ).astimezone(UTC_TZ)
+        end_utc = start_utc + timedelta(days=window_days)
+
+        counts: dict[tuple[date, str], int] = {}
+        for dimension, bucket_start, count in cls.fetch_buckets(
+            metric,
+            start_utc=start_utc,
+            end_utc=end_utc,
+            dimensions=dimensions,
+        ):
+            bucket_utc = bucket_start if bucket_start.tzinfo else bucket_start.replace(tzinfo=UTC_TZ)
+            key = (bucket_utc.astimezone(CHINA_TZ).date(), dimension)
+            counts[key] = counts.get(key, 0) + count
+        return day_list, counts
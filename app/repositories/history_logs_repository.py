@@ -18,6 +18,7 @@ from app.core.constants.system_constants import LogLevel
 from app.core.types.history_logs import LogSearchFilters
 from app.core.types.listing import PaginatedResult
 from app.models.unified_log import UnifiedLog
+from app.repositories.keyset_pagination import paginate_keyset
 from app.utils.time_utils import time_utils
 
 
@@ -47,6 +48,20 @@ class HistoryLogsRepository:
             )
             query = query.filter(search_filter)
 
+        if filters.keyset is not None:
+            sort_field, sort_column = self._resolve_log_sort_column(filters.sort_field)
+            return paginate_keyset(
+                query,
+                keyset=filters.keyset,
+                limit=filters.limit,
+                sort_field=sort_field,
+                sort_column=sort_column,
+                id_column=UnifiedLog.id,
+                sort_order=filters.sort_order,
+                sort_value_getter=lambda log: getattr(log, sort_field),
+                id_getter=lambda log: int(log.id),
+            )
+
         query = self._apply_log_sorting(query, sort_field=filters.sort_field, sort_order=filters.sort_order)
 
         pagination = cast(Any, query).paginate(page=filters.page, per_page=filters.limit, error_out=False)
@@ -121,7 +136,7 @@ class HistoryLogsRepository:
         return updated_query
 
     @staticmethod
-    def _apply_log_sorting(query: Query[Any], *, sort_field: str, sort_order: str) -> Query[Any]:
+    def _resolve_log_sort_column(sort_field: str) -> tuple[str, Any]:
         sortable_fields = {
             "id": UnifiedLog.id,
             "timestamp": UnifiedLog.timestamp,
@@ -129,5 +144,11 @@ class HistoryLogsRepository:
             "module": UnifiedLog.module,
             "message": UnifiedLog.message,
         }
-        order_column = sortable_fields.get(sort_field, UnifiedLog.timestamp)
+        if sort_field in sortable_fields:
+            return sort_field, sortable_fields[sort_field]
+        return "timestamp", UnifiedLog.timestamp
+
+    @staticmethod
+    def _apply_log_sorting(query: Query[Any], *, sort_field: str, sort_order: str) -> Query[Any]:
+        _, order_column = HistoryLogsRepository._resolve_log_sort_column(sort_field)
         return query.order_by(asc(order_column)) if sort_order == "asc" else query.order_by(desc(order_column))
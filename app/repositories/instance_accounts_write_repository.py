@@ -1,15 +1,30 @@
 """实例账户写模型 Repository.
 
 职责:
-- 负责 InstanceAccount 的写入(add/flush)(不 commit)
+- 负责 InstanceAccount 的写入(add/flush/批量 upsert 与状态更新)(不 commit)
 - 不做业务编排、不返回 Response、不做序列化
 """
 
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from typing import cast
+
+from sqlalchemy import Table, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.postgresql.dml import Insert as PostgresInsert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.dialects.sqlite.dml import Insert as SqliteInsert
+
 from app import db
 from app.models.instance_account import InstanceAccount
 
+InsertStatement = PostgresInsert | SqliteInsert
+
+# 单条语句的行数/IN 列表上限, 避免超出驱动绑定参数个数限制
+_BULK_CHUNK_SIZE = 1000
+
 
 class InstanceAccountsWriteRepository:
     """InstanceAccount 写入仓储."""
@@ -24,3 +39,53 @@ class InstanceAccountsWriteRepository:
     def flush() -> None:
         """显式 flush,用于增量同步批量更新."""
         db.session.flush()
+
+    @staticmethod
+    def _resolve_insert_stmt(table: Table) -> InsertStatement:
+        dialect = getattr(getattr(db.session, "bind", None), "dialect", None)
+        if getattr(dialect, "name", "") == "sqlite":
+            return sqlite_insert(table)
+        return pg_insert(table)
+
+    @classmethod
+    def insert_missing(cls, rows: Sequence[Mapping[str, object]]) -> None:
+        """批量插入新账户, 已被并发同步写入的同归属账户(唯一键冲突)直接跳过."""
+        table = cast(Table, InstanceAccount.__table__)  # type: ignore[attr-defined]
+        for offset in range(0, len(rows), _BULK_CHUNK_SIZE):
+            insert_stmt = cls._resolve_insert_stmt(table).values(list(rows[offset : offset + _BULK_CHUNK_SIZE]))
+            db.session.execute(
+                insert_stmt.on_conflict_do_nothing(
+                    index_elements=[table.c.owner_type, table.c.owner_id, table.c.db_type, table.c.username],
+                ),
+            )
+
+    @staticmethod
+    def update_by_ids(ids: Sequence[int], values: Mapping[str, object]) -> None:
+        """按 ID 列表批量更新相同的列值."""
+        for offset in range(0, len(ids), _BULK_CHUNK_SIZE):
+            db.session.execute(
+                update(InstanceAccount)
+                .where(InstanceAccount.id.in_(ids[offset : offset + _BULK_CHUNK_SIZE]))
+                .values(dict(values)),
+            )
+
+    @staticmethod
+    def update_rows(rows: Sequence[Mapping[str, object]]) -> None:
+        """按主键批量更新各行不同的列值(每行需包含 id)."""
+        if rows:
+            db.session.execute(update(InstanceAccount), [dict(row) for row in rows])
+
+    @classmethod
+    def touch(cls, ids: Sequence[int], *, updated_at: datetime) -> None:
+        """刷新仍存在账户的更新时间."""
+        cls.update_by_ids(ids, {"updated_at": updated_at})
+
+    @classmethod
+    def reactivate(cls, ids: Sequence[int], *, updated_at: datetime) -> None:
+        """重新激活账户."""
+        cls.update_by_ids(ids, {"is_active": True, "deleted_at": None, "updated_at": updated_at})
+
+    @classmethod
+    def deactivate(cls, ids: Sequence[int], *, deleted_at: datetime) -> None:
+        """停用远端已不存在的账户."""
+        cls.update_by_ids(ids, {"is_active": False, "deleted_at": deleted_at, "updated_at": deleted_at})
@@ -0,0 +1,118 @@
+"""实例可达性 Repository.
+
+职责:
+- 读取探测目标与可达性状态, 批量写入探测周期结果(不 commit)
+- 不做业务编排、不返回 Response
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Any, cast
+
+from sqlalchemy import Table, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.postgresql.dml import Insert as PostgresInsert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.dialects.sqlite.dml import Insert as SqliteInsert
+
+from app import db
+from app.models.instance import Instance
+from app.models.instance_reachability import InstanceReachability
+
+InsertStatement = PostgresInsert | SqliteInsert
+
+# 单条语句的行数/IN 列表上限, 避免超出驱动绑定参数个数限制
+_BULK_CHUNK_SIZE = 1000
+
+
+class InstanceReachabilityRepository:
+    """实例可达性读写仓储."""
+
+    @staticmethod
+    def list_probe_targets() -> list[tuple[int, str, int]]:
+        """列出需要探测的启用实例 (id, host, port)."""
+        rows = db.session.execute(
+            select(Instance.id, Instance.host, Instance.port)
+            .where(
+                Instance.is_active.is_(True),
+                cast(Any, Instance.deleted_at).is_(None),
+            )
+            .order_by(Instance.id.asc()),
+        ).all()
+        return [(int(row[0]), str(row[1]), int(row[2])) for row in rows if row[1] and row[2]]
+
+    @staticmethod
+    def get_state(instance_id: int) -> InstanceReachability | None:
+        """按实例获取可达性状态."""
+        return db.session.execute(
+            select(InstanceReachability).where(InstanceReachability.instance_id == instance_id),
+        ).scalar_one_or_none()
+
+    @staticmethod
+    def map_states(instance_ids: Sequence[int] | None = None) -> dict[int, InstanceReachability]:
+        """按实例 ID 批量获取可达性状态(instance_ids 为 None 时返回全部)."""
+        if instance_ids is None:
+            states = db.session.execute(select(InstanceReachability)).scalars().all()
+            return {int(state.instance_id): state for state in states}
+        result: dict[int, InstanceReachability] = {}
+        ids = list(instance_ids)
+        for offset in range(0, len(ids), _BULK_CHUNK_SIZE):
+            chunk = ids[offset : offset + _BULK_CHUNK_SIZE]
+            states = (
+                db.session.execute(select(InstanceReachability).where(InstanceReachability.instance_id.in_(chunk)))
+                .scalars()
+                .all()
+            )
+            result.update({int(state.instance_id): state for state in states})
+        return result
+
+    @staticmethod
+    def _resolve_insert_stmt(table: Table) -> InsertStatement:
+        dialect = getattr(getattr(db.session, "bind", None), "dialect", None)
+        if getattr(dialect, "name", "") == "sqlite":
+            return sqlite_insert(table)
+        return pg_insert(table)
+
+    @classmethod
+    def insert_missing(cls, rows: Sequence[Mapping[str, object]]) -> None:
+        """批量插入新状态行, 已存在的实例(唯一键冲突)直接跳过."""
+        table = cast(Table, InstanceReachability.__table__)  # type: ignore[attr-defined]
+        for offset in range(0, len(rows), _BULK_CHUNK_SIZE):
+            insert_stmt = cls._resolve_insert_stmt(table).values(list(rows[offset : offset + _BULK_CHUNK_SIZE]))
+            db.session.execute(insert_stmt.on_conflict_do_nothing(index_elements=[table.c.instance_id]))
+
+    @staticmethod
+    def update_rows(rows: Sequence[Mapping[str, object]]) -> None:
+        """按主键批量更新状态行(每行需包含 id)."""
+        for offset in range(0, len(rows), _BULK_CHUNK_SIZE):
+            db.session.execute(update(InstanceReachability), list(rows[offset : offset + _BULK_CHUNK_SIZE]))
+
+    @staticmethod
+    def count_by_status() -> dict[str, int]:
+        """统计启用实例的可达性状态分布(无状态行的实例计为 unknown)."""
+        status_expr = func.coalesce(InstanceReachability.status, "unknown")
+        rows = db.session.execute(
+            select(status_expr, func.count(Instance.id))
+            .select_from(Instance)
+            .outerjoin(InstanceReachability, InstanceReachability.instance_id == Instance.id)
+            .where(
+                Instance.is_active.is_(True),
+                cast(Any, Instance.deleted_at).is_(None),
+            )
+            .group_by(status_expr),
+        ).all()
+        return {str(row[0]): int(row[1]) for row in rows}
+
+    @staticmethod
+    def average_availability() -> float | None:
+        """启用实例滚动窗口可用率的平均值."""
+        value = db.session.execute(
+            select(func.avg(InstanceReachability.availability_ratio))
+            .join(Instance, Instance.id == InstanceReachability.instance_id)
+            .where(
+                Instance.is_active.is_(True),
+                cast(Any, Instance.deleted_at).is_(None),
+            ),
+        ).scalar()
+        return float(value) if value is not None else None
@@ -23,6 +23,7 @@ from app.models.instance_size_stat import InstanceSizeStat
 from app.models.sync_instance_record import SyncInstanceRecord
 from app.models.tag import instance_tags
 from app.repositories.instances_repository import InstancesRepository
+from app.repositories.veeam_repository import VeeamRepository
 
 
 class InstancesBatchRepository:
@@ -58,6 +59,7 @@ class InstancesBatchRepository:
             "deleted_database_size_stats": 0,
             "deleted_database_size_aggregations": 0,
             "deleted_tag_links": 0,
+            "deleted_veeam_backup_matches": 0,
         }
 
         account_ids_subquery = (
@@ -110,6 +112,10 @@ class InstancesBatchRepository:
         rowcount_value = tag_delete_result.rowcount
         stats["deleted_tag_links"] += int(rowcount_value) if rowcount_value is not None else 0
 
+        stats["deleted_veeam_backup_matches"] += VeeamRepository.clear_instance_backup_matches(
+            instance_ids=[instance_id],
+        )
+
         return stats
 
     @staticmethod
@@ -118,6 +124,16 @@ class InstancesBatchRepository:
         db.session.add(instance)
         return instance
 
+    @staticmethod
+    def refresh_veeam_backup_matches(instances: list[Instance]) -> int:
+        """Flush 新建实例并重算其 Veeam 备份匹配(不 commit)."""
+        if not instances:
+            return 0
+        db.session.flush()
+        return VeeamRepository.refresh_instance_backup_matches(
+            instance_ids=[int(instance.id) for instance in instances],
+        )
+
     @staticmethod
     def save_instance(instance: Instance) -> Instance:
         """保存实例变更(不 commit)."""
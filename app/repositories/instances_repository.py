@@ -9,18 +9,20 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Iterator
 from datetime import datetime, timedelta
 from typing import Any, cast
 
-from sqlalchemy import false, func, inspect, or_
+from sqlalchemy import false, func, inspect, or_, update
 from sqlalchemy.orm import Query
 from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.sql.selectable import Subquery
 
 from app import db
 from app.core.constants import SyncStatus
+from app.core.exceptions import ValidationError
 from app.core.types.instances import InstanceListFilters, InstanceListMetrics
-from app.core.types.listing import PaginatedResult
+from app.core.types.listing import KeysetParams, PaginatedResult
 from app.core.types.tags import TagSummary
 from app.models.instance import Instance
 from app.models.instance_account import InstanceAccount
@@ -30,6 +32,8 @@ from app.models.jumpserver_asset_snapshot import JumpServerAssetSnapshot
 from app.models.sync_instance_record import SyncInstanceRecord
 from app.models.tag import Tag, instance_tags
 from app.repositories.jumpserver_repository import JumpServerRepository
+from app.repositories.keyset_pagination import paginate_keyset
+from app.repositories.query_streaming import DEFAULT_STREAM_CHUNK_SIZE, iter_query_chunks
 from app.repositories.veeam_repository import VeeamRepository
 from app.utils.time_utils import time_utils
 
@@ -127,11 +131,28 @@ class InstancesRepository:
         return instance
 
     @staticmethod
-    def list_instances_for_export(filters: InstanceListFilters) -> list[Instance]:
-        """导出场景使用的实例列表查询(不分页)."""
+    def bulk_update_connection_results(rows: list[dict[str, object]]) -> None:
+        """按主键批量写入连接测试结果(last_connected 及可选版本字段, 每行需包含 id)."""
+        if rows:
+            db.session.execute(update(Instance), rows)
+
+    @staticmethod
+    def count_instances_for_export(filters: InstanceListFilters) -> int:
+        """统计导出场景的实例数量."""
+        query: Query[Any] = cast(Query[Any], Instance.query)
+        return int(InstancesRepository._apply_instance_filters(query, filters).count())
+
+    @staticmethod
+    def iter_instance_chunks(
+        filters: InstanceListFilters,
+        *,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> Iterator[tuple[list[Instance], dict[int, list[TagSummary]]]]:
+        """导出场景使用的实例分块遍历(不分页), 每块附带本块实例的标签映射."""
         query: Query[Any] = cast(Query[Any], Instance.query)
         query = InstancesRepository._apply_instance_filters(query, filters)
-        return list(query.order_by(Instance.id.asc()).all())
+        for instances in iter_query_chunks(query.order_by(Instance.id.asc()), chunk_size=chunk_size):
+            yield instances, InstancesRepository.fetch_tags_map([instance.id for instance in instances])
 
     @staticmethod
     def fetch_tags_map(instance_ids: list[int]) -> dict[int, list[TagSummary]]:
@@ -174,22 +195,54 @@ class InstancesRepository:
         """按筛选条件返回实例分页列表."""
         query: Query[Any] = cast(Query[Any], Instance.query)
         query = self._apply_instance_filters(query, filters)
-        last_sync_subquery = self._build_last_sync_subquery()
-        query = self._apply_instance_sorting(query, filters, last_sync_subquery)
-
-        pagination = cast(Any, query).paginate(page=filters.page, per_page=filters.limit, error_out=False)
-        page_result = PaginatedResult(
-            items=list(pagination.items),
-            total=pagination.total,
-            page=pagination.page,
-            pages=pagination.pages,
-            limit=pagination.per_page,
-        )
+        if filters.keyset is not None:
+            page_result = self._paginate_instances_keyset(query, filters)
+        else:
+            last_sync_subquery = self._build_last_sync_subquery()
+            query = self._apply_instance_sorting(query, filters, last_sync_subquery)
+
+            pagination = cast(Any, query).paginate(page=filters.page, per_page=filters.limit, error_out=False)
+            page_result = PaginatedResult(
+                items=list(pagination.items),
+                total=pagination.total,
+                page=pagination.page,
+                pages=pagination.pages,
+                limit=pagination.per_page,
+            )
 
         instance_ids = [instance.id for instance in page_result.items]
         metrics = self._collect_instance_metrics(instance_ids)
         return page_result, metrics
 
+    @staticmethod
+    def _paginate_instances_keyset(query: Query[Any], filters: InstanceListFilters) -> PaginatedResult[Instance]:
+        """以游标方式分页(仅支持实例表自身的 NOT NULL 排序列)."""
+        keyset = cast("KeysetParams", filters.keyset)
+        sortable_fields = InstancesRepository._instance_sortable_columns()
+        if filters.sort_field == "last_sync_time":
+            raise ValidationError("keyset 分页不支持按 last_sync_time 排序")
+        sort_field = filters.sort_field if filters.sort_field in sortable_fields else "id"
+        return paginate_keyset(
+            query,
+            keyset=keyset,
+            limit=filters.limit,
+            sort_field=sort_field,
+            sort_column=sortable_fields[sort_field],
+            id_column=cast(ColumnElement[Any], Instance.id),
+            sort_order=filters.sort_order,
+            sort_value_getter=lambda instance: getattr(instance, sort_field),
+            id_getter=lambda instance: int(instance.id),
+        )
+
+    @staticmethod
+    def _instance_sortable_columns() -> dict[str, ColumnElement[Any]]:
+        return {
+            "id": cast(ColumnElement[Any], Instance.id),
+            "name": cast(ColumnElement[Any], Instance.name),
+            "db_type": cast(ColumnElement[Any], Instance.db_type),
+            "host": cast(ColumnElement[Any], Instance.host),
+        }
+
     @staticmethod
     def _build_last_sync_subquery() -> Subquery[Any]:
         """构建同步时间子查询."""
@@ -365,12 +418,7 @@ class InstancesRepository:
         last_sync_subquery: Subquery[Any],
     ) -> Query[Any]:
         """根据排序字段组装 SQLAlchemy 排序语句."""
-        sortable_fields: dict[str, ColumnElement[Any]] = {
-            "id": cast(ColumnElement[Any], Instance.id),
-            "name": cast(ColumnElement[Any], Instance.name),
-            "db_type": cast(ColumnElement[Any], Instance.db_type),
-            "host": cast(ColumnElement[Any], Instance.host),
-        }
+        sortable_fields = InstancesRepository._instance_sortable_columns()
         if filters.sort_field == "last_sync_time":
             query = query.outerjoin(last_sync_subquery, Instance.id == last_sync_subquery.c.instance_id)
             sortable_fields["last_sync_time"] = cast(ColumnElement[Any], last_sync_subquery.c.last_sync_time)
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Protocol
 
-from sqlalchemy import inspect
+from sqlalchemy import delete, insert, inspect, update
 
 from app import db
 from app.models.instance import Instance
@@ -36,6 +37,29 @@ class JumpServerAssetRecord(Protocol):
     def raw_payload(self) -> dict[str, object]: ...
 
 
+@dataclass(frozen=True, slots=True)
+class JumpServerAssetSnapshotDiff:
+    """快照按 external_id 对比后的写入统计."""
+
+    inserted_total: int = 0
+    updated_total: int = 0
+    deleted_total: int = 0
+    unchanged_total: int = 0
+
+    @property
+    def written_total(self) -> int:
+        """本次新增或更新的快照数."""
+        return self.inserted_total + self.updated_total
+
+    @property
+    def changed_total(self) -> int:
+        """本次新增、更新或删除的快照数."""
+        return self.inserted_total + self.updated_total + self.deleted_total
+
+
+# 参与变更比较的快照字段
+_SNAPSHOT_COMPARED_FIELDS = ("name", "db_type", "host", "port", "raw_payload")
+
 
 class JumpServerRepository:
     """JumpServer 绑定与快照访问."""
@@ -70,37 +94,73 @@ class JumpServerRepository:
         JumpServerAssetSnapshot.query.delete()
 
     @staticmethod
-    def replace_asset_snapshots(
+    def reconcile_asset_snapshots(
         assets: Iterable[JumpServerAssetRecord],
         *,
         sync_run_id: str,
         synced_at: datetime,
-    ) -> None:
-        """以本次同步结果替换快照内容."""
+    ) -> JumpServerAssetSnapshotDiff:
+        """按 external_id 对比快照, 仅批量写入新增/变更的资产并删除已下线资产."""
+        incoming = {asset.external_id: asset for asset in assets}
         existing = {
             row.external_id: row
-            for row in JumpServerAssetSnapshot.query.order_by(JumpServerAssetSnapshot.id.asc()).all()
+            for row in db.session.query(
+                JumpServerAssetSnapshot.id,
+                JumpServerAssetSnapshot.external_id,
+                *(getattr(JumpServerAssetSnapshot, field) for field in _SNAPSHOT_COMPARED_FIELDS),
+            )
         }
-        keep_external_ids: set[str] = set()
-        for asset in assets:
-            keep_external_ids.add(asset.external_id)
-            row = existing.get(asset.external_id)
-            if row is None:
-                row = JumpServerAssetSnapshot(external_id=asset.external_id, name=asset.name)
-            row.name = asset.name
-            row.db_type = asset.db_type
-            row.host = asset.host
-            row.port = asset.port
-            row.raw_payload = asset.raw_payload
-            row.sync_run_id = sync_run_id
-            row.synced_at = synced_at
-            db.session.add(row)
-
-        for external_id, row in existing.items():
-            if external_id not in keep_external_ids:
-                db.session.delete(row)
 
-        db.session.flush()
+        inserts: list[dict[str, object]] = []
+        updates: list[dict[str, object]] = []
+        for external_id, asset in incoming.items():
+            values: dict[str, object] = {
+                "name": asset.name,
+                "db_type": asset.db_type,
+                "host": asset.host,
+                "port": int(asset.port),
+                "raw_payload": dict(asset.raw_payload),
+            }
+            row = existing.get(external_id)
+            if row is None:
+                inserts.append(
+                    {
+                        "external_id": external_id,
+                        **values,
+                        "sync_run_id": sync_run_id,
+                        "synced_at": synced_at,
+                        "created_at": synced_at,
+                        "updated_at": synced_at,
+                    }
+                )
+            elif any(getattr(row, field) != values[field] for field in _SNAPSHOT_COMPARED_FIELDS):
+                updates.append(
+                    {
+                        "id": row.id,
+                        **values,
+                        "sync_run_id": sync_run_id,
+                        "synced_at": synced_at,
+                        "updated_at": synced_at,
+                    }
+                )
+        deleted_ids = [row.id for external_id, row in existing.items() if external_id not in incoming]
+
+        if inserts:
+            db.session.execute(insert(JumpServerAssetSnapshot), inserts)
+        if updates:
+            db.session.execute(update(JumpServerAssetSnapshot), updates)
+        if deleted_ids:
+            db.session.execute(
+                delete(JumpServerAssetSnapshot)
+                .where(JumpServerAssetSnapshot.id.in_(deleted_ids))
+                .execution_options(synchronize_session=False)
+            )
+        return JumpServerAssetSnapshotDiff(
+            inserted_total=len(inserts),
+            updated_total=len(updates),
+            deleted_total=len(deleted_ids),
+            unchanged_total=len(incoming) - len(inserts) - len(updates),
+        )
 
     @staticmethod
     def fetch_managed_instance_ids(instances: list[Instance]) -> set[int]:
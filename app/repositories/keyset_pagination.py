@@ -0,0 +1,260 @@
+"""游标(keyset)分页 Repository 工具.
+
+职责:
+- 基于 "排序键 + id" 组合游标拼装 WHERE/ORDER BY,替代 OFFSET 扫描
+- 提供可选的总数口径: 精确 COUNT / PostgreSQL 执行计划估算 / 不统计
+- 不做序列化、不返回 Response、不 commit
+
+约束:
+- 排序列需为 NOT NULL 列(NULL 不参与比较,会导致翻页漏行);可空列需传入 null_sort_value,
+  由 ORDER BY 与游标条件统一按 COALESCE(列, null_sort_value) 比较
+- 游标只承载位置信息,不承载筛选条件;筛选条件由调用方在每次请求中重新传入
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import math
+from collections.abc import Callable
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, TypeVar, cast
+
+from sqlalchemy import and_, func, literal, or_
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Query
+from sqlalchemy.sql.elements import ColumnElement
+
+from app import db
+from app.core.exceptions import ValidationError
+from app.core.types.listing import (
+    PAGINATION_MODE_KEYSET,
+    TOTAL_MODE_ESTIMATE,
+    TOTAL_MODE_NONE,
+    KeysetParams,
+    PaginatedResult,
+)
+from app.utils.structlog_config import log_fallback
+
+T = TypeVar("T")
+
+_CURSOR_VERSION = 1
+_VALUE_TYPE_DATETIME = "dt"
+_VALUE_TYPE_DATE = "d"
+_VALUE_TYPE_DECIMAL = "dec"
+_VALUE_TYPE_RAW = "raw"
+
+
+def _encode_sort_value(value: object) -> tuple[str, object]:
+    if isinstance(value, datetime):
+        return _VALUE_TYPE_DATETIME, value.isoformat()
+    if isinstance(value, date):
+        return _VALUE_TYPE_DATE, value.isoformat()
+    if isinstance(value, Decimal):
+        return _VALUE_TYPE_DECIMAL, str(value)
+    if isinstance(value, Enum):
+        return _VALUE_TYPE_RAW, value.value
+    return _VALUE_TYPE_RAW, value
+
+
+def _decode_sort_value(value_type: str, value: object) -> object:
+    if value_type == _VALUE_TYPE_DATETIME and isinstance(value, str):
+        return datetime.fromisoformat(value)
+    if value_type == _VALUE_TYPE_DATE and isinstance(value, str):
+        return date.fromisoformat(value)
+    if value_type == _VALUE_TYPE_DECIMAL and isinstance(value, str):
+        return Decimal(value)
+    if value_type == _VALUE_TYPE_RAW:
+        return value
+    raise ValueError("unsupported cursor value type")
+
+
+def encode_cursor(*, sort_field: str, sort_value: object, row_id: int) -> str:
+    """将最后一行的排序键与 id 编码为不透明游标."""
+    value_type, value = _encode_sort_value(sort_value)
+    payload = {"v": _CURSOR_VERSION, "f": sort_field, "t": value_type, "k": value, "id": int(row_id)}
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _parse_cursor_payload(cursor: str) -> dict[str, object]:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+    if not isinstance(payload, dict) or payload.get("v") != _CURSOR_VERSION:
+        raise ValueError("unsupported cursor version")
+    row_id = payload.get("id")
+    if isinstance(row_id, bool) or not isinstance(row_id, int):
+        raise TypeError("cursor id must be int")
+    return payload
+
+
+def decode_cursor(cursor: str, *, sort_field: str) -> tuple[object, int]:
+    """解析游标,返回 (sort_value, row_id).
+
+    游标与当前排序字段不一致时视为无效(排序变化后旧游标没有意义).
+    """
+    try:
+        payload = _parse_cursor_payload(cursor)
+        sort_value = _decode_sort_value(str(payload.get("t")), payload.get("k"))
+    except (binascii.Error, UnicodeError, ValueError, TypeError) as exc:
+        raise ValidationError("cursor 参数无效") from exc
+    if payload.get("f") != sort_field:
+        raise ValidationError("cursor 与当前排序字段不匹配, 请从首页重新加载")
+    return sort_value, cast(int, payload["id"])
+
+
+def build_keyset_condition(
+    *,
+    sort_column: ColumnElement[Any],
+    id_column: ColumnElement[Any],
+    sort_order: str,
+    sort_value: object,
+    row_id: int,
+) -> ColumnElement[bool]:
+    """构造 "位于游标之后" 的 WHERE 条件(排序键相同则按 id 决胜)."""
+    if sort_order == "asc":
+        return or_(sort_column > sort_value, and_(sort_column == sort_value, id_column > row_id))
+    return or_(sort_column < sort_value, and_(sort_column == sort_value, id_column < row_id))
+
+
+def count_query(query: Query[Any], *, total_mode: str) -> int | None:
+    """按 total_mode 统计查询总数."""
+    if total_mode == TOTAL_MODE_NONE:
+        return None
+    if total_mode == TOTAL_MODE_ESTIMATE:
+        return estimate_query_count(query)
+    return int(query.order_by(None).count())
+
+
+def _plan_rows(plan_payload: object) -> int:
+    estimated = plan_payload[0]["Plan"]["Plan Rows"] if isinstance(plan_payload, list) else None
+    if isinstance(estimated, bool) or not isinstance(estimated, (int, float)):
+        raise TypeError("EXPLAIN 结果缺少 Plan Rows")
+    return int(estimated)
+
+
+def estimate_query_count(query: Query[Any]) -> int:
+    """基于 PostgreSQL 执行计划估算行数(非 PostgreSQL 回退为精确 COUNT).
+
+    说明: 估算值来自 planner 统计信息, 适用于 "约 N 条" 展示; 需要精确值时使用 total=exact.
+    """
+    unordered = query.order_by(None)
+    bind = db.session.get_bind()
+    if bind.dialect.name != "postgresql":
+        return int(unordered.count())
+
+    compiled = unordered.statement.compile(dialect=bind.dialect)
+    try:
+        # savepoint: EXPLAIN 失败时不污染外层事务, 保证回退 COUNT 可继续执行.
+        with db.session.begin_nested():
+            row = (
+                db.session.connection()
+                .exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", cast(Any, compiled.params))
+                .first()
+            )
+        plan_payload = row[0] if row is not None else None
+        if isinstance(plan_payload, str):
+            plan_payload = json.loads(plan_payload)
+        return max(_plan_rows(plan_payload), 0)
+    except (SQLAlchemyError, ValueError, KeyError, IndexError, TypeError) as exc:
+        log_fallback(
+            "warning",
+            "keyset 总数估算失败, 回退精确 COUNT",
+            module="keyset_pagination",
+            action="estimate_query_count",
+            fallback_reason="explain_failed",
+            exception=exc,
+        )
+        return int(unordered.count())
+
+
+def paginate_keyset(
+    query: Query[Any],
+    *,
+    keyset: KeysetParams,
+    limit: int,
+    sort_field: str,
+    sort_column: ColumnElement[Any],
+    id_column: ColumnElement[Any],
+    sort_order: str,
+    sort_value_getter: Callable[[T], object],
+    id_getter: Callable[[T], int],
+    null_sort_value: object | None = None,
+) -> PaginatedResult[T]:
+    """执行游标分页.
+
+    Args:
+        query: 已应用筛选条件但尚未排序的查询.
+        keyset: 游标与总数口径参数.
+        limit: 每页条数.
+        sort_field: 对外排序字段名(写入游标,用于校验游标与排序一致).
+        sort_column: 排序列(可空时需同时传入 null_sort_value).
+        id_column: 唯一决胜列(通常为主键).
+        sort_order: asc/desc.
+        sort_value_getter: 从结果行读取排序键值.
+        id_getter: 从结果行读取 id.
+        null_sort_value: 排序列可空时 NULL 的替代值(排序与游标比较均使用 COALESCE).
+
+    Returns:
+        PaginatedResult,其中 `next_cursor` 为空表示已到末页.
+
+    """
+    total = count_query(query, total_mode=keyset.total_mode)
+
+    if null_sort_value is not None:
+        sort_column = func.coalesce(sort_column, literal(null_sort_value, type_=sort_column.type))
+
+    page_query = query
+    if keyset.cursor:
+        sort_value, row_id = decode_cursor(keyset.cursor, sort_field=sort_field)
+        page_query = page_query.filter(
+            build_keyset_condition(
+                sort_column=sort_column,
+                id_column=id_column,
+                sort_order=sort_order,
+                sort_value=sort_value,
+                row_id=row_id,
+            ),
+        )
+    if sort_order == "asc":
+        page_query = page_query.order_by(sort_column.asc(), id_column.asc())
+    else:
+        page_query = page_query.order_by(sort_column.desc(), id_column.desc())
+
+    rows = cast("list[T]", list(page_query.limit(limit + 1).all()))
+    has_more = len(rows) > limit
+    items = rows[:limit]
+    next_cursor = None
+    if has_more and items:
+        last = items[-1]
+        last_sort_value = sort_value_getter(last)
+        next_cursor = encode_cursor(
+            sort_field=sort_field,
+            sort_value=null_sort_value if last_sort_value is None else last_sort_value,
+            row_id=id_getter(last),
+        )
+
+    return PaginatedResult(
+        items=items,
+        total=total,
+        page=1,
+        pages=math.ceil(total / limit) if total else 0,
+        limit=limit,
+        pagination=PAGINATION_MODE_KEYSET,
+        next_cursor=next_cursor,
+        has_more=has_more,
+        total_mode=keyset.total_mode,
+    )
+
+
+__all__ = [
+    "build_keyset_condition",
+    "count_query",
+    "decode_cursor",
+    "encode_cursor",
+    "estimate_query_count",
+    "paginate_keyset",
+]
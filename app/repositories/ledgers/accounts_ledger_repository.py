@@ -8,6 +8,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Iterator
 from typing import Any, cast
 
 from sqlalchemy import func, or_
@@ -24,6 +25,8 @@ from app.models.account_permission import AccountPermission
 from app.models.instance import Instance
 from app.models.instance_account import InstanceAccount
 from app.models.tag import Tag, instance_tags
+from app.repositories.keyset_pagination import paginate_keyset
+from app.repositories.query_streaming import DEFAULT_STREAM_CHUNK_SIZE, iter_query_chunks
 from app.utils.structlog_config import log_warning
 
 
@@ -75,15 +78,29 @@ class AccountsLedgerRepository:
         sort_order: str,
     ) -> tuple[PaginatedResult[AccountPermission], AccountLedgerMetrics]:
         """分页查询账户台账."""
-        query = self._apply_sorting(self._build_account_query(filters), sort_field, sort_order)
-        pagination = cast(Any, query).paginate(page=filters.page, per_page=filters.limit, error_out=False)
-        page_result = PaginatedResult(
-            items=list(pagination.items),
-            total=pagination.total,
-            page=pagination.page,
-            pages=pagination.pages,
-            limit=pagination.per_page,
-        )
+        if filters.keyset is not None:
+            resolved_sort_field, sort_column = self._resolve_sort_column(sort_field)
+            page_result: PaginatedResult[AccountPermission] = paginate_keyset(
+                self._build_account_query(filters),
+                keyset=filters.keyset,
+                limit=filters.limit,
+                sort_field=resolved_sort_field,
+                sort_column=sort_column,
+                id_column=AccountPermission.id,
+                sort_order=sort_order,
+                sort_value_getter=lambda account: getattr(account, resolved_sort_field),
+                id_getter=lambda account: int(account.id),
+            )
+        else:
+            query = self._apply_sorting(self._build_account_query(filters), sort_field, sort_order)
+            pagination = cast(Any, query).paginate(page=filters.page, per_page=filters.limit, error_out=False)
+            page_result = PaginatedResult(
+                items=list(pagination.items),
+                total=pagination.total,
+                page=pagination.page,
+                pages=pagination.pages,
+                limit=pagination.per_page,
+            )
         account_ids = [account.id for account in page_result.items]
         instance_ids = [account.instance_id for account in page_result.items]
         metrics = AccountLedgerMetrics(
@@ -92,23 +109,35 @@ class AccountsLedgerRepository:
         )
         return page_result, metrics
 
-    def list_all_accounts(
+    def count_accounts(self, filters: AccountFilters) -> int:
+        """统计满足筛选条件的账户数量(不排序、不分页)."""
+        return int(self._build_account_query(filters).order_by(None).count())
+
+    def iter_account_chunks(
         self,
         filters: AccountFilters,
         *,
         sort_field: str,
         sort_order: str,
-    ) -> tuple[list[AccountPermission], AccountLedgerMetrics]:
-        """返回全部账户(用于导出等不分页场景)."""
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> Iterator[tuple[list[AccountPermission], AccountLedgerMetrics]]:
+        """分块遍历全部账户(用于导出等不分页场景).
+
+        每块只查询本块账户的分类; 实例标签按实例去重缓存, 已查询过的实例不再重复查询.
+        """
         query = self._apply_sorting(self._build_account_query(filters), sort_field, sort_order)
-        accounts = list(query.all())
-        account_ids = [account.id for account in accounts]
-        instance_ids = [account.instance_id for account in accounts]
-        metrics = AccountLedgerMetrics(
-            tags_map=self._fetch_instance_tags(instance_ids),
-            classifications_map=self._fetch_account_classifications(account_ids),
-        )
-        return accounts, metrics
+        query = query.order_by(AccountPermission.id.asc())
+        tags_cache: dict[int, list[TagSummary]] = {}
+        for accounts in iter_query_chunks(query, chunk_size=chunk_size):
+            missing_instance_ids = {account.instance_id for account in accounts} - tags_cache.keys()
+            if missing_instance_ids:
+                fetched = self._fetch_instance_tags(sorted(missing_instance_ids))
+                tags_cache.update({instance_id: fetched.get(instance_id, []) for instance_id in missing_instance_ids})
+            metrics = AccountLedgerMetrics(
+                tags_map=tags_cache,
+                classifications_map=self._fetch_account_classifications([account.id for account in accounts]),
+            )
+            yield accounts, metrics
 
     def _build_account_query(self, filters: AccountFilters) -> Query[Any]:
         base_query = cast(Query[Any], AccountPermission.query)
@@ -192,14 +221,20 @@ class AccountsLedgerRepository:
         return query
 
     @staticmethod
-    def _apply_sorting(query: Query[Any], sort_field: str, sort_order: str) -> Query[Any]:
+    def _resolve_sort_column(sort_field: str) -> tuple[str, Any]:
         sortable_fields = {
             "username": AccountPermission.username,
             "db_type": AccountPermission.db_type,
             "is_locked": AccountPermission.is_locked,
             "is_superuser": AccountPermission.is_superuser,
         }
-        order_column = sortable_fields.get(sort_field, AccountPermission.username)
+        if sort_field in sortable_fields:
+            return sort_field, sortable_fields[sort_field]
+        return "username", AccountPermission.username
+
+    @staticmethod
+    def _apply_sorting(query: Query[Any], sort_field: str, sort_order: str) -> Query[Any]:
+        _, order_column = AccountsLedgerRepository._resolve_sort_column(sort_field)
         return query.order_by(order_column.desc() if sort_order == "desc" else order_column.asc())
 
     @staticmethod
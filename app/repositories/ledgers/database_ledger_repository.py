@@ -8,6 +8,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Iterator
 from datetime import datetime
 from math import ceil
 from typing import Any, cast
@@ -24,6 +25,7 @@ from app.models.database_size_stat import DatabaseSizeStat
 from app.models.instance import Instance
 from app.models.instance_database import InstanceDatabase
 from app.models.tag import Tag, instance_tags
+from app.repositories.query_streaming import DEFAULT_STREAM_CHUNK_SIZE, iter_query_chunks
 
 SessionLike = Session | scoped_session[Any]
 
@@ -82,21 +84,31 @@ class DatabaseLedgerRepository:
 
         return PaginatedResult(items=rows, total=total, page=page, pages=pages, limit=per_page)
 
-    def iterate_all(self, filters: DatabaseLedgerFilters) -> list[DatabaseLedgerRowProjection]:
-        """导出用: 获取全部数据库台账行."""
+    def count_all(self, filters: DatabaseLedgerFilters) -> int:
+        """导出用: 统计数据库台账总行数."""
+        return int(self._apply_filters(self._base_query(), filters).count())
+
+    def iterate_all(
+        self,
+        filters: DatabaseLedgerFilters,
+        *,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> Iterator[DatabaseLedgerRowProjection]:
+        """导出用: 分块遍历全部数据库台账行(标签按块批量查询, 已查询实例复用)."""
         base_query = self._apply_filters(self._base_query(), filters)
-        results = (
-            self._with_latest_stats(base_query)
-            .order_by(Instance.name.asc(), InstanceDatabase.database_name.asc())
-            .all()
+        query = self._with_latest_stats(base_query).order_by(
+            Instance.name.asc(),
+            InstanceDatabase.database_name.asc(),
+            InstanceDatabase.id.asc(),
         )
-        instance_ids = [instance.id for _, instance, _, _ in results if instance]
-        tags_map = self._fetch_instance_tags(instance_ids)
-
-        return [
-            self._to_row_projection(record, instance, collected_at, size_mb, tags_map=tags_map)
-            for record, instance, collected_at, size_mb in results
-        ]
+        tags_map: dict[int, list[TagSummary]] = {}
+        for chunk in iter_query_chunks(query, chunk_size=chunk_size):
+            missing_instance_ids = {instance.id for _, instance, _, _ in chunk if instance} - tags_map.keys()
+            if missing_instance_ids:
+                fetched = self._fetch_instance_tags(sorted(missing_instance_ids))
+                tags_map.update({instance_id: fetched.get(instance_id, []) for instance_id in missing_instance_ids})
+            for record, instance, collected_at, size_mb in chunk:
+                yield self._to_row_projection(record, instance, collected_at, size_mb, tags_map=tags_map)
 
     def _base_query(self) -> Query[Any]:
         """构造基础查询."""
@@ -0,0 +1,42 @@
+"""大结果集分块读取 Repository 工具.
+
+职责:
+- 基于 `yield_per` 分块拉取结果(PostgreSQL 下使用服务端游标, 不一次性物化全部行)
+- 不做序列化、不返回 Response、不 commit
+
+约束:
+- 遍历期间不得在同一 session 上 commit/rollback, 否则服务端游标会被关闭
+- `yield_per` 不支持集合(一对多)的 joined eager loading, 仅可配合多对一 contains_eager
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from itertools import islice
+from typing import TypeVar
+
+from sqlalchemy.orm import Query
+
+T = TypeVar("T")
+
+DEFAULT_STREAM_CHUNK_SIZE = 1000
+
+
+def iter_query_chunks(query: Query[T], *, chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE) -> Iterator[list[T]]:
+    """按 chunk_size 分块遍历查询结果.
+
+    Args:
+        query: 已完成筛选与排序的查询.
+        chunk_size: 每块行数, 同时作为 `yield_per` 的游标抓取批量.
+
+    Yields:
+        list: 每块结果行(最后一块可能不足 chunk_size).
+
+    """
+    size = max(int(chunk_size), 1)
+    rows = iter(query.yield_per(size))
+    while chunk := list(islice(rows, size)):
+        yield chunk
+
+
+__all__ = ["DEFAULT_STREAM_CHUNK_SIZE", "iter_query_chunks"]
@@ -12,8 +12,9 @@ from datetime import datetime
 from apscheduler.schedulers.background import BackgroundScheduler
 
 from app.core.exceptions import ConflictError
+from app.core.types.scheduler import SchedulerExecutorStats, SchedulerLeaderStatus
 from app.models.task_run import TaskRun
-from app.scheduler import get_scheduler
+from app.scheduler import get_executor_stats, get_leader_status, get_scheduler, resolve_executor_name
 from app.utils.structlog_config import log_warning
 from app.utils.time_utils import UTC_TZ
 
@@ -29,6 +30,23 @@ class SchedulerJobsRepository:
             raise ConflictError("调度器未启动")
         return scheduler
 
+    @staticmethod
+    def list_executor_stats() -> list[SchedulerExecutorStats]:
+        """读取各执行器的运行统计."""
+        return get_executor_stats()
+
+    @staticmethod
+    def get_leader_status() -> SchedulerLeaderStatus:
+        """读取当前节点的调度选主状态."""
+        return get_leader_status()
+
+    @staticmethod
+    def resolve_executor_name(alias: str | None) -> str | None:
+        """将 job 上的执行器别名还原为配置中的执行器名称."""
+        if alias is None:
+            return None
+        return resolve_executor_name(alias)
+
     @staticmethod
     def lookup_job_last_run(*, job_id: str) -> str | None:
         """从 TaskRun 中查询任务上次运行时间(以 started_at 为准)."""
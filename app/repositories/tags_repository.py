@@ -9,17 +9,26 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from typing import TYPE_CHECKING, Any, cast
+from typing import Any, cast
 
+from sqlalchemy import DateTime, delete, literal, select, true
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.postgresql.dml import Insert as PostgresInsert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.dialects.sqlite.dml import Insert as SqliteInsert
 from sqlalchemy.sql.elements import ColumnElement
 
 from app import db
 from app.core.types.listing import PaginatedResult
 from app.core.types.tags import TagListFilters, TagListRowProjection, TagStats
+from app.models.instance import Instance
 from app.models.tag import Tag, instance_tags
+from app.utils.time_utils import time_utils
 
-if TYPE_CHECKING:
-    from app.models.instance import Instance
+InsertStatement = PostgresInsert | SqliteInsert
+
+# 单条语句的实例 ID 个数上限, 避免超出驱动绑定参数个数限制
+_BULK_CHUNK_SIZE = 1000
 
 
 class TagsRepository:
@@ -57,6 +66,62 @@ class TagsRepository:
             db.session.execute(instance_tags.delete().where(instance_tags.c.tag_id == tag.id))
         db.session.delete(tag)
 
+    @staticmethod
+    def _resolve_insert_stmt() -> InsertStatement:
+        dialect = getattr(getattr(db.session, "bind", None), "dialect", None)
+        if getattr(dialect, "name", "") == "sqlite":
+            return sqlite_insert(instance_tags)
+        return pg_insert(instance_tags)
+
+    @staticmethod
+    def _chunk_ids(ids: Sequence[int]) -> list[list[int]]:
+        normalized = list(dict.fromkeys(int(item) for item in ids if item))
+        return [
+            normalized[offset : offset + _BULK_CHUNK_SIZE] for offset in range(0, len(normalized), _BULK_CHUNK_SIZE)
+        ]
+
+    @classmethod
+    def bulk_assign_instance_tags(cls, instance_ids: Sequence[int], tag_ids: Sequence[int]) -> int:
+        """为实例集合批量关联标签集合(已存在的关联跳过), 返回新增关联数."""
+        normalized_tag_ids = list(dict.fromkeys(int(tag_id) for tag_id in tag_ids if tag_id))
+        if not normalized_tag_ids:
+            return 0
+        created_at = literal(time_utils.now(), type_=DateTime(timezone=True))
+        assigned = 0
+        for chunk in cls._chunk_ids(instance_ids):
+            # 实例 x 标签的显式笛卡尔积, 仅保留实际存在的实例与标签
+            pairs = (
+                select(Instance.id, Tag.id, created_at)
+                .select_from(Instance)
+                .join(Tag, true())
+                .where(
+                    Instance.id.in_(chunk),
+                    Tag.id.in_(normalized_tag_ids),
+                )
+            )
+            insert_stmt = cls._resolve_insert_stmt().from_select(
+                [instance_tags.c.instance_id, instance_tags.c.tag_id, instance_tags.c.created_at],
+                pairs,
+            )
+            result = db.session.execute(insert_stmt.on_conflict_do_nothing())
+            assigned += max(int(getattr(result, "rowcount", 0) or 0), 0)
+        return assigned
+
+    @classmethod
+    def bulk_remove_instance_tags(cls, instance_ids: Sequence[int], tag_ids: Sequence[int] | None = None) -> int:
+        """批量删除实例集合的标签关联(tag_ids 为 None 时删除全部标签), 返回删除关联数."""
+        normalized_tag_ids = None if tag_ids is None else [int(tag_id) for tag_id in tag_ids if tag_id]
+        if normalized_tag_ids is not None and not normalized_tag_ids:
+            return 0
+        removed = 0
+        for chunk in cls._chunk_ids(instance_ids):
+            delete_stmt = delete(instance_tags).where(instance_tags.c.instance_id.in_(chunk))
+            if normalized_tag_ids is not None:
+                delete_stmt = delete_stmt.where(instance_tags.c.tag_id.in_(normalized_tag_ids))
+            result = db.session.execute(delete_stmt)
+            removed += max(int(getattr(result, "rowcount", 0) or 0), 0)
+        return removed
+
     def sync_instance_tags(self, instance: Instance, tag_names: Sequence[str]) -> list[str]:
         """同步实例标签关系."""
         instance_id = getattr(instance, "id", None)
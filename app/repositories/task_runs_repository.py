@@ -7,10 +7,14 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from datetime import datetime
 from typing import Any, cast
 
+from sqlalchemy import and_, or_
 from sqlalchemy.sql.elements import ColumnElement
 
+from app.core.constants.status_types import TaskRunStatus
 from app.core.exceptions import NotFoundError
 from app.core.types.listing import PaginatedResult
 from app.core.types.task_runs import TaskRunsListFilters
@@ -75,3 +79,102 @@ class TaskRunsRepository:
     def list_run_items(run_id: str) -> list[TaskRunItem]:
         """列出某次任务运行的子项列表."""
         return TaskRunItem.query.filter_by(run_id=run_id).order_by(TaskRunItem.id.asc()).all()
+
+    @staticmethod
+    def _claimable_filter(stale_before: datetime) -> ColumnElement[bool]:
+        """Pending 子项, 或认领节点心跳已超时的 running 子项."""
+        return or_(
+            TaskRunItem.status == TaskRunStatus.PENDING,
+            and_(
+                TaskRunItem.status == TaskRunStatus.RUNNING,
+                TaskRunItem.claimed_by.isnot(None),
+                TaskRunItem.heartbeat_at < stale_before,
+            ),
+        )
+
+    @classmethod
+    def lock_claimable_items(
+        cls,
+        *,
+        run_id: str,
+        limit: int,
+        stale_before: datetime,
+        item_types: Sequence[str] | None = None,
+    ) -> list[TaskRunItem]:
+        """锁定一批可认领子项(FOR UPDATE SKIP LOCKED, 已被其他节点锁定的行直接跳过)."""
+        query = TaskRunItem.query.filter(TaskRunItem.run_id == run_id, cls._claimable_filter(stale_before))
+        if item_types:
+            query = query.filter(TaskRunItem.item_type.in_(list(item_types)))
+        return query.order_by(TaskRunItem.id.asc()).limit(limit).with_for_update(skip_locked=True).all()
+
+    @staticmethod
+    def count_unfinished_items(run_id: str, item_types: Sequence[str] | None = None) -> int:
+        """统计某次运行中尚未结束(pending/running)的子项数."""
+        query = TaskRunItem.query.filter(
+            TaskRunItem.run_id == run_id,
+            TaskRunItem.status.in_(TaskRunStatus.IN_PROGRESS),
+        )
+        if item_types:
+            query = query.filter(TaskRunItem.item_type.in_(list(item_types)))
+        return int(query.count())
+
+    @classmethod
+    def list_claimable_runs(cls, *, task_keys: Sequence[str], stale_before: datetime) -> list[TaskRun]:
+        """列出指定任务中仍在运行且存在可认领子项的运行记录."""
+        if not task_keys:
+            return []
+        claimable_run_ids = (
+            TaskRunItem.query.with_entities(TaskRunItem.run_id).filter(cls._claimable_filter(stale_before)).distinct()
+        )
+        return (
+            TaskRun.query.filter(
+                TaskRun.task_key.in_(list(task_keys)),
+                TaskRun.status == TaskRunStatus.RUNNING,
+                TaskRun.run_id.in_(claimable_run_ids),
+            )
+            .order_by(TaskRun.started_at.asc(), TaskRun.id.asc())
+            .all()
+        )
+
+    @staticmethod
+    def get_latest_run(task_key: str) -> TaskRun | None:
+        """获取某任务最近一次运行记录."""
+        return TaskRun.query.filter_by(task_key=task_key).order_by(TaskRun.started_at.desc(), TaskRun.id.desc()).first()
+
+    @staticmethod
+    def find_run_started_since(task_key: str, started_since: datetime) -> TaskRun | None:
+        """获取某任务在指定时间之后开始的最早一次运行记录."""
+        return (
+            TaskRun.query.filter(TaskRun.task_key == task_key, TaskRun.started_at >= started_since)
+            .order_by(TaskRun.started_at.asc(), TaskRun.id.asc())
+            .first()
+        )
+
+    @staticmethod
+    def list_completed_instance_ids(run_ids: Sequence[str]) -> list[int]:
+        """列出若干 run 中已成功完成的实例子项 instance_id(去重升序)."""
+        if not run_ids:
+            return []
+        rows = (
+            TaskRunItem.query.with_entities(TaskRunItem.instance_id)
+            .filter(
+                TaskRunItem.run_id.in_(list(run_ids)),
+                TaskRunItem.item_type == "instance",
+                TaskRunItem.status == TaskRunStatus.COMPLETED,
+                TaskRunItem.instance_id.isnot(None),
+            )
+            .distinct()
+            .all()
+        )
+        return sorted(int(instance_id) for (instance_id,) in rows)
+
+    @staticmethod
+    def list_downstream_runs(run_ids: Sequence[str]) -> list[TaskRun]:
+        """列出由指定 run 依赖触发的下游运行记录."""
+        if not run_ids:
+            return []
+        return (
+            TaskRun.query.filter(TaskRun.upstream_run_id.in_(list(run_ids)))
+            .order_by(TaskRun.started_at.asc(), TaskRun.id.asc())
+            .all()
+        )
@@ -4,12 +4,14 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import UTC, datetime
 
 from sqlalchemy import inspect
 
 from app import db
 from app.models.instance import Instance
+from app.models.veeam_backup_object_watermark import VeeamBackupObjectWatermark
+from app.models.veeam_instance_backup_match import VeeamInstanceBackupMatch
 from app.models.veeam_machine_backup_snapshot import VeeamMachineBackupSnapshot
 from app.models.veeam_source_binding import VeeamSourceBinding
 from app.services.veeam.matching import (
@@ -18,7 +20,7 @@ from app.services.veeam.matching import (
     normalize_ip_address,
     normalize_machine_name,
 )
-from app.services.veeam.provider import VeeamMachineBackupRecord
+from app.services.veeam.provider import VeeamBackupObjectWatermarkRecord, VeeamMachineBackupRecord
 
 
 @dataclass(frozen=True, slots=True)
@@ -59,6 +61,11 @@ def _normalize_string(value: object) -> str | None:
     return None
 
 
+def _as_utc(value: datetime) -> datetime:
+    # SQLite 读回的时间不带时区, 按写入时的 UTC 处理
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+
+
 def _resolve_snapshot_machine_ip(record: VeeamMachineBackupRecord) -> tuple[str | None, str | None]:
     normalized_machine_ip = normalize_ip_address(record.machine_ip) if record.machine_ip else None
     if normalized_machine_ip:
@@ -295,6 +302,43 @@ def _fetch_snapshot_rows_by_ips(
     ).all()
 
 
+def _match_snapshots_for_instances(
+    binding: VeeamSourceBinding,
+    instances: list[Instance],
+) -> dict[int, _SnapshotSummaryMatch]:
+    domains = binding.match_domains if isinstance(binding.match_domains, list) else []
+    candidate_batch = _build_snapshot_candidate_batch(instances, domains)
+    if not candidate_batch.all_names and not candidate_batch.all_ips:
+        return {}
+
+    binding_id = int(binding.id)
+    name_rows = _fetch_snapshot_rows_by_names(binding_id, candidate_batch.all_names)
+    ip_rows = _fetch_snapshot_rows_by_ips(binding_id, candidate_batch.all_ips)
+    name_row_map = {row.normalized_machine_name: row for row in name_rows}
+    ip_row_map = {row.normalized_machine_ip: row for row in ip_rows}
+
+    matches: dict[int, _SnapshotSummaryMatch] = {}
+    for instance in instances:
+        instance_id = int(instance.id)
+        name_candidates = candidate_batch.name_map.get(instance_id, [])
+        ip_candidates = candidate_batch.ip_map.get(instance_id, [])
+        matched_rows = _collect_matched_snapshot_rows(
+            name_candidates=name_candidates,
+            ip_candidates=ip_candidates,
+            name_row_map=name_row_map,
+            ip_row_map=ip_row_map,
+        )
+        if not matched_rows:
+            continue
+        matches[instance_id] = _SnapshotSummaryMatch(
+            row=max(matched_rows, key=lambda item: (item.latest_backup_at, item.id)),
+            binding=binding,
+            name_candidates=name_candidates,
+            ip_candidates=ip_candidates,
+        )
+    return matches
+
+
 def _collect_matched_snapshot_rows(
     *,
     name_candidates: list[str],
@@ -386,11 +430,22 @@ def _serialize_snapshot_match(
 class VeeamRepository:
     """Veeam 绑定与快照访问."""
 
+    # 表检查均使用当前 session 的连接, 避免在写事务中途借出/归还连接导致未提交的写入被回滚
     @staticmethod
     def _has_machine_backup_snapshot_table() -> bool:
-        inspector = inspect(db.engine)
+        inspector = inspect(db.session.connection())
         return inspector.has_table(VeeamMachineBackupSnapshot.__tablename__)
 
+    @staticmethod
+    def _has_backup_object_watermark_table() -> bool:
+        inspector = inspect(db.session.connection())
+        return inspector.has_table(VeeamBackupObjectWatermark.__tablename__)
+
+    @staticmethod
+    def _has_instance_backup_match_table() -> bool:
+        inspector = inspect(db.session.connection())
+        return inspector.has_table(VeeamInstanceBackupMatch.__tablename__)
+
     @staticmethod
     def get_binding() -> VeeamSourceBinding | None:
         """获取第一个绑定,兼容单源调用."""
@@ -436,7 +491,9 @@ class VeeamRepository:
 
     @staticmethod
     def clear_machine_backup_snapshots(source_binding_id: int | None = None) -> None:
-        """清空机器备份快照."""
+        """清空机器备份快照(同时清空增量同步水位与实例备份匹配)."""
+        VeeamRepository.clear_backup_object_watermarks(source_binding_id)
+        VeeamRepository.clear_instance_backup_matches(source_binding_id=source_binding_id)
         if not VeeamRepository._has_machine_backup_snapshot_table():
             return
         query = VeeamMachineBackupSnapshot.query
@@ -444,6 +501,87 @@ class VeeamRepository:
             query = query.filter(VeeamMachineBackupSnapshot.source_binding_id == int(source_binding_id))
         query.delete()
 
+    @staticmethod
+    def list_machine_backup_snapshots(source_binding_id: int) -> list[VeeamMachineBackupSnapshot]:
+        """获取数据源下全部机器备份快照."""
+        if not VeeamRepository._has_machine_backup_snapshot_table():
+            return []
+        return VeeamMachineBackupSnapshot.query.filter(
+            VeeamMachineBackupSnapshot.source_binding_id == int(source_binding_id)
+        ).all()
+
+    @staticmethod
+    def list_backup_object_watermarks(source_binding_id: int) -> list[VeeamBackupObjectWatermarkRecord]:
+        """获取数据源下 backupObject 增量同步水位."""
+        if not VeeamRepository._has_backup_object_watermark_table():
+            return []
+        rows = VeeamBackupObjectWatermark.query.filter(
+            VeeamBackupObjectWatermark.source_binding_id == int(source_binding_id)
+        ).all()
+        return [
+            VeeamBackupObjectWatermarkRecord(
+                backup_object_id=row.backup_object_id,
+                latest_restore_point_at=_as_utc(row.latest_restore_point_at),
+                machine_name=row.machine_name,
+                latest_restore_point_id=row.latest_restore_point_id,
+                backup_id=row.backup_id,
+                latest_backup_file_id=row.latest_backup_file_id,
+                full_synced_at=_as_utc(row.full_synced_at) if row.full_synced_at is not None else None,
+            )
+            for row in rows
+            if row.latest_restore_point_at is not None
+        ]
+
+    @staticmethod
+    def clear_backup_object_watermarks(source_binding_id: int | None = None) -> None:
+        """清空增量同步水位(下次同步按全量拉取)."""
+        if not VeeamRepository._has_backup_object_watermark_table():
+            return
+        query = VeeamBackupObjectWatermark.query
+        if source_binding_id is not None:
+            query = query.filter(VeeamBackupObjectWatermark.source_binding_id == int(source_binding_id))
+        query.delete()
+
+    @staticmethod
+    def replace_backup_object_watermarks(
+        watermarks: Iterable[VeeamBackupObjectWatermarkRecord],
+        *,
+        source_binding_id: int,
+        sync_run_id: str,
+        keep_backup_object_ids: Iterable[str] = (),
+    ) -> int:
+        """写入本次同步水位; 未写入且不在 keep_backup_object_ids 中的旧水位被删除."""
+        if not VeeamRepository._has_backup_object_watermark_table():
+            return 0
+        existing = {
+            row.backup_object_id: row
+            for row in VeeamBackupObjectWatermark.query.filter(
+                VeeamBackupObjectWatermark.source_binding_id == int(source_binding_id)
+            ).all()
+        }
+        kept = set(keep_backup_object_ids)
+        written = 0
+        for watermark in watermarks:
+            row = existing.pop(watermark.backup_object_id, None)
+            if row is None:
+                row = VeeamBackupObjectWatermark()
+                row.source_binding_id = int(source_binding_id)
+                row.backup_object_id = watermark.backup_object_id
+            row.machine_name = watermark.machine_name
+            row.latest_restore_point_at = watermark.latest_restore_point_at
+            row.latest_restore_point_id = watermark.latest_restore_point_id
+            row.backup_id = watermark.backup_id
+            row.latest_backup_file_id = watermark.latest_backup_file_id
+            row.full_synced_at = watermark.full_synced_at or datetime.now(UTC)
+            row.sync_run_id = sync_run_id
+            db.session.add(row)
+            written += 1
+        for backup_object_id, row in existing.items():
+            if backup_object_id not in kept:
+                db.session.delete(row)
+        db.session.flush()
+        return written
+
     @staticmethod
     def replace_machine_backup_snapshots(
         records: Iterable[VeeamMachineBackupRecord],
@@ -591,56 +729,118 @@ class VeeamRepository:
             return None
         return _serialize_snapshot_match(match, prefer_name_candidates_only=True)
 
+    @staticmethod
+    def clear_instance_backup_matches(
+        *,
+        source_binding_id: int | None = None,
+        instance_ids: Iterable[int] | None = None,
+    ) -> int:
+        """删除实例备份匹配(可按数据源或实例限定范围), 返回删除条数."""
+        if not VeeamRepository._has_instance_backup_match_table():
+            return 0
+        query = VeeamInstanceBackupMatch.query
+        if source_binding_id is not None:
+            query = query.filter(VeeamInstanceBackupMatch.source_binding_id == int(source_binding_id))
+        if instance_ids is not None:
+            scoped_instance_ids = sorted({int(instance_id) for instance_id in instance_ids})
+            if not scoped_instance_ids:
+                return 0
+            query = query.filter(VeeamInstanceBackupMatch.instance_id.in_(scoped_instance_ids))
+        return int(query.delete(synchronize_session=False) or 0)
+
+    @staticmethod
+    def refresh_instance_backup_matches(
+        *,
+        source_binding_id: int | None = None,
+        instance_ids: Iterable[int] | None = None,
+    ) -> int:
+        """重算实例 → 机器备份快照匹配(快照写入或实例名称/主机、数据源域名变更后调用), 返回写入条数."""
+        if not VeeamRepository._has_instance_backup_match_table():
+            return 0
+
+        scoped_instance_ids = None if instance_ids is None else sorted({int(item) for item in instance_ids})
+        if scoped_instance_ids is not None and not scoped_instance_ids:
+            return 0
+        instance_query = Instance.query
+        if scoped_instance_ids is not None:
+            instance_query = instance_query.filter(Instance.id.in_(scoped_instance_ids))
+        instances = instance_query.all()
+
+        if source_binding_id is None:
+            bindings = VeeamRepository.list_bindings()
+        else:
+            binding = VeeamRepository.get_binding_by_id(int(source_binding_id))
+            bindings = [binding] if binding is not None else []
+
+        VeeamRepository.clear_instance_backup_matches(
+            source_binding_id=source_binding_id,
+            instance_ids=scoped_instance_ids,
+        )
+        rows = [
+            VeeamInstanceBackupMatch(
+                instance_id=instance_id,
+                source_binding_id=int(binding.id),
+                snapshot_id=int(match.row.id),
+                name_candidates=list(match.name_candidates),
+                ip_candidates=list(match.ip_candidates),
+            )
+            for binding in bindings
+            for instance_id, match in _match_snapshots_for_instances(binding, instances).items()
+        ]
+        db.session.add_all(rows)
+        db.session.flush()
+        return len(rows)
+
     @staticmethod
     def fetch_backup_summary_map(instances: list[Instance]) -> dict[int, dict[str, object]]:
-        """批量按实例名称/主机匹配 Veeam 机器备份快照,支持机器名/IP 双通道."""
+        """批量获取实例的 Veeam 机器备份摘要(优先读取预计算的实例备份匹配)."""
         if not instances or not VeeamRepository._has_machine_backup_snapshot_table():
             return {}
-
-        bindings = VeeamRepository.list_enabled_bindings()
-        if not bindings:
-            return {}
-
+        if not VeeamRepository._has_instance_backup_matches():
+            return VeeamRepository._match_backup_summary_map(instances)
+
+        rows = (
+            db.session.query(VeeamInstanceBackupMatch, VeeamMachineBackupSnapshot, VeeamSourceBinding)
+            .join(VeeamMachineBackupSnapshot, VeeamMachineBackupSnapshot.id == VeeamInstanceBackupMatch.snapshot_id)
+            .join(VeeamSourceBinding, VeeamSourceBinding.id == VeeamInstanceBackupMatch.source_binding_id)
+            .filter(
+                VeeamInstanceBackupMatch.instance_id.in_(sorted({int(instance.id) for instance in instances})),
+                VeeamSourceBinding.is_enabled.is_(True),
+            )
+            .all()
+        )
         best_by_instance: dict[int, _SnapshotSummaryMatch] = {}
-
-        for binding in bindings:
-            domains = binding.match_domains if isinstance(binding.match_domains, list) else []
-            candidate_batch = _build_snapshot_candidate_batch(instances, domains)
-
-            if not candidate_batch.all_names and not candidate_batch.all_ips:
-                continue
-
-            binding_id = int(binding.id)
-            name_rows = _fetch_snapshot_rows_by_names(binding_id, candidate_batch.all_names)
-            ip_rows = _fetch_snapshot_rows_by_ips(binding_id, candidate_batch.all_ips)
-
-            name_row_map = {row.normalized_machine_name: row for row in name_rows}
-            ip_row_map = {row.normalized_machine_ip: row for row in ip_rows}
-
-            for instance in instances:
-                instance_id = int(instance.id)
-                name_candidates = candidate_batch.name_map.get(instance_id, [])
-                ip_candidates = candidate_batch.ip_map.get(instance_id, [])
-                matched_rows = _collect_matched_snapshot_rows(
-                    name_candidates=name_candidates,
-                    ip_candidates=ip_candidates,
-                    name_row_map=name_row_map,
-                    ip_row_map=ip_row_map,
+        for match_row, snapshot, binding in rows:
+            instance_id = int(match_row.instance_id)
+            if _is_newer_snapshot(snapshot, best_by_instance.get(instance_id)):
+                best_by_instance[instance_id] = _SnapshotSummaryMatch(
+                    row=snapshot,
+                    binding=binding,
+                    name_candidates=list(match_row.name_candidates or []),
+                    ip_candidates=list(match_row.ip_candidates or []),
                 )
+        return {
+            instance_id: _serialize_snapshot_match(match, prefer_name_candidates_only=False)
+            for instance_id, match in best_by_instance.items()
+        }
 
-                if not matched_rows:
-                    continue
-                row = max(matched_rows, key=lambda item: (item.latest_backup_at, item.id))
-                current = best_by_instance.get(instance_id)
-                if _is_newer_snapshot(row, current):
-                    best_by_instance[instance_id] = _SnapshotSummaryMatch(
-                        row=row,
-                        binding=binding,
-                        name_candidates=name_candidates,
-                        ip_candidates=ip_candidates,
-                    )
-
-        summary_map: dict[int, dict[str, object]] = {}
-        for instance_id, match in best_by_instance.items():
-            summary_map[instance_id] = _serialize_snapshot_match(match, prefer_name_candidates_only=False)
-        return summary_map
+    @staticmethod
+    def _has_instance_backup_matches() -> bool:
+        # 匹配表尚未创建或尚未完成首次刷新(如刚升级)时回退为按候选名称/IP 实时匹配
+        if not VeeamRepository._has_instance_backup_match_table():
+            return False
+        return db.session.query(VeeamInstanceBackupMatch.id).limit(1).first() is not None
+
+    @staticmethod
+    def _match_backup_summary_map(instances: list[Instance]) -> dict[int, dict[str, object]]:
+        """按实例名称/主机实时匹配 Veeam 机器备份快照,支持机器名/IP 双通道."""
+        best_by_instance: dict[int, _SnapshotSummaryMatch] = {}
+        for binding in VeeamRepository.list_enabled_bindings():
+            for instance_id, match in _match_snapshots_for_instances(binding, instances).items():
+                if _is_newer_snapshot(match.row, best_by_instance.get(instance_id)):
+                    best_by_instance[instance_id] = match
+
+        return {
+            instance_id: _serialize_snapshot_match(match, prefer_name_candidates_only=False)
+            for instance_id, match in best_by_instance.items()
+        }
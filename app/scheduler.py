@@ -7,15 +7,17 @@ from __future__ import annotations
 
 import os
 import time
+import uuid
 from collections.abc import Callable
+from datetime import datetime
 from importlib import import_module
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import yaml
 from apscheduler.events import EVENT_JOB_ERROR, EVENT_JOB_EXECUTED, JobExecutionEvent
-from apscheduler.executors.pool import ThreadPoolExecutor
-from apscheduler.jobstores.base import JobLookupError
+from apscheduler.jobstores.base import ConflictingIdError, JobLookupError
+from apscheduler.jobstores.memory import MemoryJobStore
 from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.base import BaseTrigger
@@ -24,9 +26,32 @@ from pydantic import ValidationError as PydanticValidationError
 from sqlalchemy.exc import SQLAlchemyError
 from yaml import YAMLError
 
-from app.core.constants.scheduler_jobs import BUILTIN_SCHEDULER_TASKS
-from app.schemas.yaml_configs import SchedulerTaskConfig, SchedulerTaskScheduleConfig, SchedulerTasksConfigFile
+from app.core.constants.scheduler_jobs import (
+    BUILTIN_SCHEDULER_TASKS,
+    DEFAULT_EXECUTOR_MAX_WORKERS,
+    DEFAULT_EXECUTOR_NAME,
+    DEPENDENCY_SCOPE_ALL,
+    DEPENDENCY_TRIGGER_TYPE,
+    MANUAL_JOB_ID_PREFIX,
+    PIPELINE_JOB_ID_PREFIX,
+)
+from app.core.types.scheduler import (
+    PipelineDispatch,
+    SchedulerExecutorStats,
+    SchedulerLeaderStatus,
+    TaskDependencySpec,
+)
+from app.infra.scheduler_executors import build_executor
+from app.infra.scheduler_leader import SchedulerLeaderElector
+from app.schemas.yaml_configs import (
+    SchedulerExecutorConfig,
+    SchedulerTaskConfig,
+    SchedulerTaskScheduleConfig,
+    SchedulerTasksConfigFile,
+)
+from app.settings import SCHEDULER_JOBSTORE_DATABASE, SCHEDULER_JOBSTORE_SQLITE
 from app.utils.structlog_config import get_system_logger
+from app.utils.time_utils import time_utils
 
 if TYPE_CHECKING:
     from apscheduler.job import Job
@@ -61,6 +86,18 @@ DEFAULT_TASK_CREATION_EXCEPTIONS: tuple[type[Exception], ...] = (
     TypeError,
 )
 CONFIG_IO_EXCEPTIONS: tuple[type[Exception], ...] = (OSError, YAMLError)
+PIPELINE_DISPATCH_EXCEPTIONS: tuple[type[Exception], ...] = (
+    SQLAlchemyError,
+    ConflictingIdError,
+    LookupError,
+    RuntimeError,
+    ValueError,
+)
+PIPELINE_JOBSTORE = "pipeline"
+# 默认执行器在 APScheduler 中注册为 "default", 兼容 jobstore 中未指定执行器的既有任务
+DEFAULT_EXECUTOR_ALIAS = "default"
+DEFAULT_JOBSTORE_ALIAS = "default"
+SHARED_JOBSTORE_TABLE = "apscheduler_jobs"
 CRON_FIELDS = ("second", "minute", "hour", "day", "month", "day_of_week", "year")
 TASK_CONFIG_PATH = Path(__file__).resolve().parent / "config" / "scheduler_tasks.yaml"
 TASK_FUNCTIONS: dict[str, str] = {
@@ -78,6 +115,149 @@ def _load_task_callable(function_name: str) -> JobFunc | None:
     return None
 
 
+def _load_db() -> Any:
+    """按需获取 SQLAlchemy 扩展(`app` 包初始化时会导入本模块)."""
+    return import_module("app").db
+
+
+def _load_pipeline_service() -> Any:
+    """按需加载依赖触发服务,避免导入阶段的循环依赖."""
+    module = import_module("app.services.scheduler.task_pipeline_service")
+    return module.TaskPipelineService()
+
+
+def _read_task_config_file() -> SchedulerTasksConfigFile:
+    """读取并校验调度任务配置文件."""
+    with TASK_CONFIG_PATH.open(encoding="utf-8") as config_buffer:
+        raw_config = yaml.safe_load(config_buffer)
+    try:
+        return SchedulerTasksConfigFile.model_validate(raw_config)
+    except PydanticValidationError as exc:
+        msg = f"配置文件格式错误: {exc}"
+        raise ValueError(msg) from exc
+
+
+def _read_executor_configs() -> tuple[dict[str, SchedulerExecutorConfig], str]:
+    """读取执行器配置; 配置不可用时回退为单个默认线程池."""
+    try:
+        parsed = _read_task_config_file()
+    except (ValueError, *CONFIG_IO_EXCEPTIONS) as config_error:
+        logger.warning("读取执行器配置失败,使用默认线程池", error=str(config_error))
+        fallback = SchedulerExecutorConfig(max_workers=DEFAULT_EXECUTOR_MAX_WORKERS)
+        return {DEFAULT_EXECUTOR_NAME: fallback}, DEFAULT_EXECUTOR_NAME
+    return dict(parsed.executors), parsed.default_executor
+
+
+class DependencyTrigger(BaseTrigger):
+    """依赖触发器: 不按时间触发, 由上游 TaskRun 完成时派发.
+
+    注册后 job 的 next_run_time 恒为 None; 实际执行由 `TaskScheduler` 在上游 job
+    执行完成后以一次性 job(`pipeline:<task_id>:<upstream_run_id>`) 派发.
+    """
+
+    __slots__ = ("scope", "upstream")
+
+    def __init__(self, upstream: list[str] | tuple[str, ...], scope: str = DEPENDENCY_SCOPE_ALL) -> None:
+        """记录上游任务与下游处理范围."""
+        self.upstream = tuple(upstream)
+        self.scope = scope
+
+    def get_next_fire_time(self, previous_fire_time: datetime | None, now: datetime) -> None:
+        """依赖触发任务没有基于时间的下次执行时间."""
+        del previous_fire_time, now
+
+    def __getstate__(self) -> dict[str, Any]:
+        """序列化(jobstore 持久化)."""
+        return {"version": 1, "upstream": self.upstream, "scope": self.scope}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """反序列化."""
+        self.upstream = tuple(state.get("upstream") or ())
+        self.scope = str(state.get("scope") or DEPENDENCY_SCOPE_ALL)
+
+    def __str__(self) -> str:
+        """展示上游依赖."""
+        return f"dependency[{', '.join(self.upstream)}]"
+
+    def __repr__(self) -> str:
+        """调试展示."""
+        return f"<DependencyTrigger (upstream={list(self.upstream)!r}, scope={self.scope!r})>"
+
+    @property
+    def spec(self) -> TaskDependencySpec:
+        """转换为依赖声明."""
+        return TaskDependencySpec(upstream=self.upstream, scope=self.scope)
+
+
+def is_dependency_job(job: object) -> bool:
+    """判断 job 是否为依赖触发任务."""
+    return isinstance(getattr(job, "trigger", None), DependencyTrigger)
+
+
+def resolve_pipeline_task_id(job_id: str) -> str:
+    """将依赖触发产生的一次性 job id 还原为任务 id."""
+    if not job_id.startswith(PIPELINE_JOB_ID_PREFIX):
+        return job_id
+    return job_id[len(PIPELINE_JOB_ID_PREFIX) :].split(":", 1)[0]
+
+
+def run_pipeline_task(
+    *,
+    task_id: str,
+    upstream_run_id: str,
+    instance_ids: list[int] | None = None,
+) -> object:
+    """执行依赖触发的下游任务.
+
+    可能运行在进程池子进程中(无 `scheduler.app`), upstream_run_id 由调度器进程在
+    job 结束事件中回写, 这里仅保留在 kwargs 中便于排查.
+    """
+    del upstream_run_id
+    task_meta = BUILTIN_SCHEDULER_TASKS.get(task_id)
+    func = _load_task_callable(task_meta.function_name) if task_meta else None
+    if func is None:
+        msg = f"未知的依赖触发任务: {task_id}"
+        raise LookupError(msg)
+
+    task_kwargs: dict[str, Any] = {"manual_run": False}
+    if instance_ids is not None:
+        task_kwargs["instance_ids"] = list(instance_ids)
+    return func(**task_kwargs)
+
+
+def parse_pipeline_job_id(job_id: str) -> tuple[str, str] | None:
+    """解析一次性 job id, 返回 (task_id, upstream_run_id)."""
+    if not job_id.startswith(PIPELINE_JOB_ID_PREFIX):
+        return None
+    task_id, _, upstream_run_id = job_id[len(PIPELINE_JOB_ID_PREFIX) :].partition(":")
+    if not task_id or not upstream_run_id:
+        return None
+    return task_id, upstream_run_id
+
+
+def _link_pipeline_run(*, task_id: str, upstream_run_id: str, started_since: datetime) -> None:
+    app = scheduler.app
+    if app is None:
+        return
+
+    db = _load_db()
+    with app.app_context():
+        try:
+            run_id = _load_pipeline_service().link_upstream_run(
+                task_id=task_id,
+                upstream_run_id=upstream_run_id,
+                started_since=started_since,
+            )
+            db.session.commit()
+        except SQLAlchemyError as link_error:
+            db.session.rollback()
+            logger.warning("回写上游运行记录失败", task_id=task_id, error=str(link_error))
+            return
+        finally:
+            db.session.remove()
+    logger.info("依赖触发任务执行结束", task_id=task_id, run_id=run_id, upstream_run_id=upstream_run_id)
+
+
 # 配置日志
 class TaskScheduler:
     """定时任务调度器."""
@@ -90,13 +270,18 @@ class TaskScheduler:
 
         """
         self.app = app
+        self.default_executor = DEFAULT_EXECUTOR_NAME
+        self.jobstore_kind = SCHEDULER_JOBSTORE_SQLITE
+        self.leader_elector: SchedulerLeaderElector | None = None
+        self.shard_worker: Any | None = None
+        self._executors: dict[str, Any] = {}
         self.scheduler: BackgroundScheduler = self._setup_scheduler()
 
     def _setup_scheduler(self) -> BackgroundScheduler:
         """配置 APScheduler 并注册事件监听.
 
-        准备 SQLite jobstore、线程执行器与默认任务参数,随后创建后台调度器实例并
-        绑定成功/失败事件,确保所有调度器行为集中在同一处完成.
+        准备 SQLite jobstore、按配置声明的执行器(线程池/进程池)与默认任务参数,
+        随后创建后台调度器实例并绑定成功/失败事件,确保所有调度器行为集中在同一处完成.
 
         Returns:
             BackgroundScheduler: APScheduler 后台调度器实例.
@@ -112,10 +297,19 @@ class TaskScheduler:
         sqlite_path = userdata_dir / "scheduler.db"
         database_url = f"sqlite:///{sqlite_path.absolute()}"
 
-        jobstores = {"default": SQLAlchemyJobStore(url=database_url)}
+        # pipeline: 依赖触发派发的一次性 job, 仅存于内存, 执行后即移除
+        jobstores = {
+            DEFAULT_JOBSTORE_ALIAS: SQLAlchemyJobStore(url=database_url),
+            PIPELINE_JOBSTORE: MemoryJobStore(),
+        }
 
-        # 执行器配置
-        executors = {"default": ThreadPoolExecutor(max_workers=5)}
+        # 执行器配置: 默认执行器注册为 "default", 其余按名称注册
+        executor_configs, self.default_executor = _read_executor_configs()
+        self._executors = {
+            name: build_executor(name=name, executor_type=config.type, max_workers=config.max_workers)
+            for name, config in executor_configs.items()
+        }
+        executors = {self.executor_alias(name): executor for name, executor in self._executors.items()}
 
         # 任务默认配置
         job_defaults = {
@@ -137,6 +331,124 @@ class TaskScheduler:
         scheduler.add_listener(self._job_error, EVENT_JOB_ERROR)
         return scheduler
 
+    @property
+    def is_shared_jobstore(self) -> bool:
+        """任务是否存于主库(多节点共享, 需选主)."""
+        return self.jobstore_kind == SCHEDULER_JOBSTORE_DATABASE
+
+    @property
+    def is_leader(self) -> bool:
+        """当前进程是否负责执行任务(单节点模式下调度器运行即为主节点)."""
+        if self.leader_elector is None:
+            return self.scheduler.running
+        return self.leader_elector.is_leader
+
+    def use_database_jobstore(self, database_url: str) -> None:
+        """将默认 jobstore 切换为主库(须在调度器启动前调用)."""
+        self.scheduler.remove_jobstore(DEFAULT_JOBSTORE_ALIAS)
+        self.scheduler.add_jobstore(
+            SQLAlchemyJobStore(
+                url=database_url,
+                tablename=SHARED_JOBSTORE_TABLE,
+                engine_options={"pool_pre_ping": True},
+            ),
+            DEFAULT_JOBSTORE_ALIAS,
+        )
+        self.jobstore_kind = SCHEDULER_JOBSTORE_DATABASE
+        logger.info("调度器使用主库共享 jobstore", table=SHARED_JOBSTORE_TABLE)
+
+    def start_leader_election(self, *, database_url: str, node_id: str, heartbeat_seconds: int, lease_seconds: int) -> None:
+        """启动选主: 成为主节点后恢复任务执行, 失去主节点身份后暂停."""
+        self.leader_elector = SchedulerLeaderElector(
+            database_url=database_url,
+            node_id=node_id,
+            heartbeat_seconds=heartbeat_seconds,
+            lease_seconds=lease_seconds,
+            on_elected=self._on_elected,
+            on_demoted=self._on_demoted,
+            on_heartbeat=self.scheduler.wakeup,
+        )
+        self.leader_elector.start()
+
+    def start_shard_worker(self, *, poll_seconds: int) -> None:
+        """启动任务分片工作线程(共享 jobstore 下所有节点都参与认领分片)."""
+        if self.app is None:
+            return
+        module = import_module("app.services.task_runs.task_run_shard_service")
+        shard_worker = module.TaskRunShardWorker(self.app, poll_seconds=poll_seconds)
+        shard_worker.start()
+        self.shard_worker = shard_worker
+        logger.info("任务分片工作线程已启动", poll_seconds=poll_seconds)
+
+    def _on_elected(self) -> None:
+        self.scheduler.resume()
+        logger.info("调度器开始执行任务(主节点)")
+
+    def _on_demoted(self) -> None:
+        if self.scheduler.running:
+            self.scheduler.pause()
+        logger.warning("调度器暂停执行任务(非主节点)")
+
+    def leader_status(self) -> SchedulerLeaderStatus:
+        """当前节点的选主状态."""
+        if self.leader_elector is None:
+            return SchedulerLeaderStatus(
+                jobstore=self.jobstore_kind,
+                node_id=None,
+                is_leader=self.is_leader,
+                leader_node_id=None,
+                leader_heartbeat_at=None,
+            )
+        lease = self.leader_elector.read_lease()
+        return SchedulerLeaderStatus(
+            jobstore=self.jobstore_kind,
+            node_id=self.leader_elector.node_id,
+            is_leader=self.leader_elector.is_leader,
+            leader_node_id=lease.node_id if lease else None,
+            leader_heartbeat_at=lease.heartbeat_at.isoformat() if lease else None,
+        )
+
+    def dispatch_manual_run(self, *, job_id: str, created_by: int | None) -> str:
+        """以一次性 job 写入共享 jobstore, 由主节点执行(任意节点均可调用)."""
+        job = self.scheduler.get_job(job_id)
+        if job is None:
+            msg = f"任务不存在: {job_id}"
+            raise LookupError(msg)
+
+        job_kwargs: dict[str, Any] = dict(job.kwargs or {})
+        if job_id in BUILTIN_SCHEDULER_TASKS:
+            job_kwargs["manual_run"] = True
+            job_kwargs["created_by"] = created_by
+        manual_job_id = f"{MANUAL_JOB_ID_PREFIX}{job_id}:{uuid.uuid4().hex[:12]}"
+        self.scheduler.add_job(
+            job.func_ref,
+            "date",
+            run_date=time_utils.now(),
+            id=manual_job_id,
+            name=job.name,
+            args=list(job.args),
+            kwargs=job_kwargs,
+            executor=job.executor,
+            jobstore=DEFAULT_JOBSTORE_ALIAS,
+            misfire_grace_time=None,
+        )
+        logger.info("手动执行已派发至调度主节点", job_id=job_id, manual_job_id=manual_job_id)
+        return manual_job_id
+
+    def executor_alias(self, name: str | None) -> str:
+        """将配置中的执行器名称转换为 APScheduler 执行器别名."""
+        if name is None or name == self.default_executor or name not in self._executors:
+            return DEFAULT_EXECUTOR_ALIAS
+        return name
+
+    def executor_name(self, alias: str) -> str:
+        """将 APScheduler 执行器别名还原为配置中的执行器名称."""
+        return self.default_executor if alias == DEFAULT_EXECUTOR_ALIAS else alias
+
+    def executor_stats(self) -> list[SchedulerExecutorStats]:
+        """各执行器的排队深度与等待时间统计."""
+        return [executor.stats.snapshot() for executor in self._executors.values()]
+
     def _job_executed(self, event: JobExecutionEvent) -> None:
         """处理任务成功事件.
 
@@ -152,6 +464,87 @@ class TaskScheduler:
             job_id=event.job_id,
             retval=str(event.retval),
         )
+        self._link_pipeline_job(event)
+        self._dispatch_dependents(resolve_pipeline_task_id(event.job_id))
+
+    def _link_pipeline_job(self, event: JobExecutionEvent) -> None:
+        """依赖触发的 job 结束后回写下游 run 的 upstream_run_id(在调度器进程内执行)."""
+        parsed = parse_pipeline_job_id(event.job_id)
+        if parsed is None:
+            return
+        task_id, upstream_run_id = parsed
+        _link_pipeline_run(
+            task_id=task_id,
+            upstream_run_id=upstream_run_id,
+            started_since=event.scheduled_run_time or time_utils.now(),
+        )
+
+    def _collect_dependents(self) -> dict[str, TaskDependencySpec]:
+        """从 jobstore 收集依赖触发任务(以 jobstore 为准, 兼容页面上改回 cron 的任务)."""
+        return {
+            job.id: job.trigger.spec for job in self.scheduler.get_jobs() if isinstance(job.trigger, DependencyTrigger)
+        }
+
+    def _dispatch_dependents(self, upstream_task_id: str) -> None:
+        """上游任务执行结束后派发满足依赖的下游任务.
+
+        Args:
+            upstream_task_id: 刚执行结束的任务 id.
+
+        Returns:
+            None: 派发结束或跳过后返回.
+
+        """
+        if self.app is None:
+            return
+        try:
+            dependents = self._collect_dependents()
+            if not any(upstream_task_id in spec.upstream for spec in dependents.values()):
+                return
+
+            db = _load_db()
+            with self.app.app_context():
+                try:
+                    dispatches = _load_pipeline_service().plan_dispatches(
+                        upstream_task_id=upstream_task_id,
+                        dependents=dependents,
+                    )
+                finally:
+                    db.session.remove()
+            for dispatch in dispatches:
+                self._submit_pipeline_job(dispatch)
+        except PIPELINE_DISPATCH_EXCEPTIONS as dispatch_error:
+            logger.exception("依赖触发派发失败", task_id=upstream_task_id, error=str(dispatch_error))
+
+    def _submit_pipeline_job(self, dispatch: PipelineDispatch) -> None:
+        """以一次性 job 派发下游任务(沿用下游任务的执行器与事件监听)."""
+        pending_prefix = f"{PIPELINE_JOB_ID_PREFIX}{dispatch.task_id}:"
+        if any(job.id.startswith(pending_prefix) for job in self.scheduler.get_jobs(jobstore=PIPELINE_JOBSTORE)):
+            logger.info("下游任务已在派发队列中,跳过重复派发", task_id=dispatch.task_id)
+            return
+
+        task_meta = BUILTIN_SCHEDULER_TASKS.get(dispatch.task_id)
+        downstream_job = self.scheduler.get_job(dispatch.task_id)
+        self.scheduler.add_job(
+            run_pipeline_task,
+            "date",
+            run_date=time_utils.now(),
+            id=f"{pending_prefix}{dispatch.upstream_run_id}",
+            name=task_meta.task_name if task_meta else dispatch.task_id,
+            jobstore=PIPELINE_JOBSTORE,
+            executor=downstream_job.executor if downstream_job is not None else DEFAULT_EXECUTOR_ALIAS,
+            kwargs={
+                "task_id": dispatch.task_id,
+                "upstream_run_id": dispatch.upstream_run_id,
+                "instance_ids": list(dispatch.instance_ids) if dispatch.instance_ids is not None else None,
+            },
+        )
+        logger.info(
+            "依赖触发下游任务",
+            task_id=dispatch.task_id,
+            upstream_run_id=dispatch.upstream_run_id,
+            instance_count=(len(dispatch.instance_ids) if dispatch.instance_ids is not None else None),
+        )
 
     def _job_error(self, event: JobExecutionEvent) -> None:
         """处理任务失败事件.
@@ -169,17 +562,21 @@ class TaskScheduler:
             job_id=event.job_id,
             error=exception_str,
         )
+        self._link_pipeline_job(event)
 
-    def start(self) -> None:
+    def start(self, *, paused: bool = False) -> None:
         """启动调度器.
 
+        Args:
+            paused: 是否以暂停状态启动(共享 jobstore 下等待选主后再执行任务).
+
         Returns:
             None: 调度器启动或确认已运行后返回.
 
         """
         if not self.scheduler.running:
-            self.scheduler.start()
-            logger.info("定时任务调度器已启动")
+            self.scheduler.start(paused=paused)
+            logger.info("定时任务调度器已启动", paused=paused)
         else:
             logger.warning("定时任务调度器已经在运行,跳过启动")
 
@@ -190,6 +587,10 @@ class TaskScheduler:
             None: 调度器关闭后返回.
 
         """
+        if self.leader_elector is not None:
+            self.leader_elector.stop()
+        if self.shard_worker is not None:
+            self.shard_worker.stop()
         if self.scheduler.running:
             self.scheduler.shutdown()
             logger.info("定时任务调度器已停止")
@@ -310,6 +711,26 @@ def get_scheduler() -> BackgroundScheduler | None:
     return scheduler.scheduler
 
 
+def get_executor_stats() -> list[SchedulerExecutorStats]:
+    """获取各执行器的运行统计."""
+    return scheduler.executor_stats()
+
+
+def get_leader_status() -> SchedulerLeaderStatus:
+    """获取当前节点的调度选主状态."""
+    return scheduler.leader_status()
+
+
+def dispatch_manual_run(*, job_id: str, created_by: int | None) -> str:
+    """将手动执行派发到调度主节点."""
+    return scheduler.dispatch_manual_run(job_id=job_id, created_by=created_by)
+
+
+def resolve_executor_name(alias: str) -> str:
+    """将 APScheduler 执行器别名还原为配置中的执行器名称."""
+    return scheduler.executor_name(alias)
+
+
 def _should_start_scheduler(settings: Settings) -> bool:
     """根据环境变量及进程角色判断是否需启动调度器.
 
@@ -360,16 +781,29 @@ def init_scheduler(app: Flask, settings: Settings) -> TaskScheduler | None:
     try:
         scheduler.app = app
 
-        sqlite_path = Path("userdata/scheduler.db")
-        if not sqlite_path.exists():
-            logger.info("创建SQLite调度器数据库文件")
-            sqlite_path.parent.mkdir(exist_ok=True)
-            sqlite_path.touch()
-
-        scheduler.start()
+        shared = settings.scheduler_jobstore == SCHEDULER_JOBSTORE_DATABASE
+        if shared:
+            scheduler.use_database_jobstore(settings.database_url)
+        else:
+            sqlite_path = Path("userdata/scheduler.db")
+            if not sqlite_path.exists():
+                logger.info("创建SQLite调度器数据库文件")
+                sqlite_path.parent.mkdir(exist_ok=True)
+                sqlite_path.touch()
+
+        # 共享 jobstore: 先以暂停状态启动(可读写任务), 当选主节点后再执行任务
+        scheduler.start(paused=shared)
         time.sleep(2)
         _load_existing_jobs()
         _load_tasks_from_config(force=False)
+        if shared:
+            scheduler.start_leader_election(
+                database_url=settings.database_url,
+                node_id=f"{settings.runtime_instance_id or 'node'}:{os.getpid()}",
+                heartbeat_seconds=settings.scheduler_leader_heartbeat_seconds,
+                lease_seconds=settings.scheduler_leader_lease_seconds,
+            )
+            scheduler.start_shard_worker(poll_seconds=settings.task_shard_heartbeat_seconds)
     except SCHEDULER_INIT_EXCEPTIONS as init_error:
         logger.exception("调度器初始化失败", error=str(init_error))
         return None
@@ -396,9 +830,9 @@ def _load_existing_jobs() -> None:
             logger.warning("调度器未完全就绪,跳过加载现有任务")
             return
 
-        # 检查SQLite数据库文件是否存在
+        # 检查SQLite数据库文件是否存在(共享 jobstore 存于主库)
         sqlite_path = Path("userdata/scheduler.db")
-        if not sqlite_path.exists():
+        if not scheduler.is_shared_jobstore and not sqlite_path.exists():
             logger.warning("SQLite数据库文件不存在,跳过加载现有任务")
             return
 
@@ -480,13 +914,7 @@ def _should_skip_default_task_creation(task_id: str) -> bool:
 
 def _read_default_task_configs() -> list[SchedulerTaskConfig]:
     """读取调度任务配置."""
-    with TASK_CONFIG_PATH.open(encoding="utf-8") as config_buffer:
-        raw_config = yaml.safe_load(config_buffer)
-    try:
-        parsed = SchedulerTasksConfigFile.model_validate(raw_config)
-    except PydanticValidationError as exc:
-        msg = f"配置文件格式错误: {exc}"
-        raise ValueError(msg) from exc
+    parsed = _read_task_config_file()
     return [_build_default_task_config(task_schedule) for task_schedule in parsed.default_tasks]
 
 
@@ -503,6 +931,10 @@ def _build_default_task_config(task_schedule: SchedulerTaskScheduleConfig) -> Sc
         function=task_meta.function_name,
         trigger_type=task_schedule.trigger_type,
         trigger_params=task_schedule.trigger_params,
+        depends_on=task_schedule.depends_on,
+        scope=task_schedule.scope,
+        executor=task_schedule.executor,
+        max_instances=task_schedule.max_instances,
         enabled=task_schedule.enabled,
         description=task_meta.description,
     )
@@ -525,13 +957,24 @@ def _register_task_from_config(task_config: SchedulerTaskConfig, *, force: bool)
         return
 
     if not force and _should_skip_default_task_creation(task_id):
+        _sync_job_execution_options(task_config)
         return
 
     if force:
         _remove_existing_job(task_id, task_name)
 
     try:
-        _schedule_job(func, task_id, task_name, trigger_type, trigger_params)
+        _schedule_job(
+            func,
+            task_id,
+            task_name,
+            trigger_type,
+            trigger_params,
+            depends_on=task_config.depends_on,
+            scope=task_config.scope,
+            executor=scheduler.executor_alias(task_config.executor),
+            max_instances=task_config.max_instances,
+        )
         logger.info("添加调度任务", task_name=task_name, task_id=task_id)
     except DEFAULT_TASK_CREATION_EXCEPTIONS as error:
         _log_task_creation_failure(
@@ -542,6 +985,27 @@ def _register_task_from_config(task_config: SchedulerTaskConfig, *, force: bool)
         )
 
 
+def _sync_job_execution_options(task_config: SchedulerTaskConfig) -> None:
+    """既有任务沿用 jobstore 中的触发器, 仅同步执行器与并发上限."""
+    changes: dict[str, Any] = {}
+    try:
+        job = scheduler.get_job(task_config.id)
+        if job is None:
+            return
+        executor_alias = scheduler.executor_alias(task_config.executor)
+        if job.executor != executor_alias:
+            changes["executor"] = executor_alias
+        if task_config.max_instances is not None and job.max_instances != task_config.max_instances:
+            changes["max_instances"] = task_config.max_instances
+        if changes:
+            scheduler.scheduler.modify_job(task_config.id, **changes)
+    except JOBSTORE_OPERATION_EXCEPTIONS as sync_error:
+        logger.warning("同步任务执行器配置失败", task_id=task_config.id, error=str(sync_error))
+        return
+    if changes:
+        logger.info("同步任务执行器配置", task_id=task_config.id, **changes)
+
+
 def _remove_existing_job(task_id: str, task_name: str) -> None:
     """在强制模式下删除已存在的任务."""
     try:
@@ -565,13 +1029,26 @@ def _schedule_job(
     task_name: str,
     trigger_type: str,
     trigger_params: dict[str, Any],
+    *,
+    depends_on: list[str] | None = None,
+    scope: str = DEPENDENCY_SCOPE_ALL,
+    executor: str | None = None,
+    max_instances: int | None = None,
 ) -> None:
     """将任务注册到调度器."""
+    job_options: dict[str, Any] = {"id": task_id, "name": task_name}
+    if executor is not None:
+        job_options["executor"] = executor
+    if max_instances is not None:
+        job_options["max_instances"] = max_instances
+    if trigger_type == DEPENDENCY_TRIGGER_TYPE:
+        scheduler.add_job(func, DependencyTrigger(depends_on or [], scope), **job_options)
+        return
     if trigger_type == "cron":
         trigger = _build_cron_trigger(trigger_params)
-        scheduler.add_job(func, trigger, id=task_id, name=task_name)
+        scheduler.add_job(func, trigger, **job_options)
         return
-    scheduler.add_job(func, trigger_type, id=task_id, name=task_name, **trigger_params)
+    scheduler.add_job(func, trigger_type, **job_options, **trigger_params)
 
 
 def _build_cron_trigger(trigger_params: dict[str, Any]) -> CronTrigger:
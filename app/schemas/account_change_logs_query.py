@@ -12,7 +12,7 @@ from typing import Any
 from pydantic import AliasChoices, Field, field_validator
 
 from app.core.types.account_change_logs import AccountChangeLogsListFilters
-from app.schemas.base import PayloadSchema
+from app.schemas.base import KeysetPaginationQuery, PayloadSchema
 from app.schemas.query_parsers import parse_int, parse_optional_int, parse_text
 
 _ALLOWED_SORT_ORDERS = {"asc", "desc"}
@@ -38,7 +38,7 @@ def _resolve_hours(value: Any) -> int | None:
     return parsed
 
 
-class AccountChangeLogsListQuery(PayloadSchema):
+class AccountChangeLogsListQuery(KeysetPaginationQuery):
     """账户变更日志列表 query 参数 schema."""
 
     page: int = _DEFAULT_PAGE
@@ -129,6 +129,7 @@ class AccountChangeLogsListQuery(PayloadSchema):
             change_type=self.change_type,
             status=self.status,
             hours=self.hours,
+            keyset=self.to_keyset_params(),
         )
 
 
@@ -7,12 +7,13 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 from typing import Any
 
 from pydantic import AliasChoices, Field, field_validator
 
 from app.core.types.accounts_ledgers import AccountFilters
-from app.schemas.base import PayloadSchema
+from app.schemas.base import KeysetPaginationQuery, PayloadSchema
 from app.schemas.query_parsers import parse_int, parse_tags, parse_text
 from app.utils.payload_converters import as_bool
 
@@ -136,7 +137,7 @@ class AccountsFiltersQuery(PayloadSchema):
         )
 
 
-class AccountsLedgersListQuery(AccountsFiltersQuery):
+class AccountsLedgersListQuery(AccountsFiltersQuery, KeysetPaginationQuery):
     """账户台账列表 query 参数 schema."""
 
     sort_field: str = Field(default="username", validation_alias=AliasChoices("sort", "sort_field"))
@@ -153,3 +154,7 @@ class AccountsLedgersListQuery(AccountsFiltersQuery):
     def _parse_sort_order(cls, value: Any) -> str:
         cleaned = parse_text(value).lower()
         return cleaned or "asc"
+
+    def to_filters(self) -> AccountFilters:
+        """转换为账户台账列表 filters 对象(含 keyset 分页参数)."""
+        return replace(super().to_filters(), keyset=self.to_keyset_params())
@@ -5,7 +5,16 @@ from __future__ import annotations
 from collections.abc import Mapping
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, model_validator
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, field_validator, model_validator
+
+from app.core.types.listing import (
+    PAGINATION_MODE_KEYSET,
+    PAGINATION_MODE_OFFSET,
+    TOTAL_MODE_ESTIMATE,
+    TOTAL_MODES,
+    KeysetParams,
+)
+from app.schemas.query_parsers import parse_text
 
 
 class PayloadSchema(BaseModel):
@@ -48,3 +57,48 @@ class QuerySchema(BaseModel):
             return mutable
 
         raise ValueError("不支持 offset")
+
+
+class KeysetPaginationQuery(PayloadSchema):
+    """列表接口的游标(keyset)分页 query 参数 mixin.
+
+    约定:
+    - `pagination=keyset` 时启用游标分页, `page` 被忽略
+    - `total` 取值 exact/estimate/none, keyset 模式默认 estimate
+    """
+
+    pagination: str = PAGINATION_MODE_OFFSET
+    cursor: str | None = None
+    total_mode: str = Field(default=TOTAL_MODE_ESTIMATE, validation_alias=AliasChoices("total", "total_mode"))
+
+    @field_validator("pagination", mode="before")
+    @classmethod
+    def _parse_pagination(cls, value: Any) -> str:
+        cleaned = parse_text(value).lower()
+        if not cleaned:
+            return PAGINATION_MODE_OFFSET
+        if cleaned in {PAGINATION_MODE_OFFSET, PAGINATION_MODE_KEYSET}:
+            return cleaned
+        raise ValueError("pagination 参数必须为 offset 或 keyset")
+
+    @field_validator("cursor", mode="before")
+    @classmethod
+    def _parse_cursor(cls, value: Any) -> str | None:
+        cleaned = parse_text(value)
+        return cleaned or None
+
+    @field_validator("total_mode", mode="before")
+    @classmethod
+    def _parse_total_mode(cls, value: Any) -> str:
+        cleaned = parse_text(value).lower()
+        if not cleaned:
+            return TOTAL_MODE_ESTIMATE
+        if cleaned in TOTAL_MODES:
+            return cleaned
+        raise ValueError("total 参数必须为 exact、estimate 或 none")
+
+    def to_keyset_params(self) -> KeysetParams | None:
+        """转换为 keyset 参数(offset 模式返回 None)."""
+        if self.pagination != PAGINATION_MODE_KEYSET:
+            return None
+        return KeysetParams(cursor=self.cursor, total_mode=self.total_mode)
@@ -0,0 +1,61 @@
+"""后台导出任务 schema."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from pydantic import BaseModel, Field, field_validator
+
+from app.schemas.accounts_query import AccountsFiltersQuery
+from app.schemas.base import PayloadSchema
+from app.schemas.databases_query import DatabaseLedgersExportQuery
+from app.schemas.instances_query import InstancesExportQuery
+from app.schemas.validation import validate_or_raise
+
+EXPORT_TYPE_ACCOUNTS_LEDGER = "accounts_ledger"
+EXPORT_TYPE_DATABASE_LEDGER = "database_ledger"
+EXPORT_TYPE_INSTANCES = "instances"
+
+EXPORT_TYPE_LABELS: dict[str, str] = {
+    EXPORT_TYPE_ACCOUNTS_LEDGER: "账户台账",
+    EXPORT_TYPE_DATABASE_LEDGER: "数据库台账",
+    EXPORT_TYPE_INSTANCES: "实例",
+}
+
+EXPORT_FILTER_SCHEMAS: dict[str, type[BaseModel]] = {
+    EXPORT_TYPE_ACCOUNTS_LEDGER: AccountsFiltersQuery,
+    EXPORT_TYPE_DATABASE_LEDGER: DatabaseLedgersExportQuery,
+    EXPORT_TYPE_INSTANCES: InstancesExportQuery,
+}
+
+
+class ExportJobCreatePayload(PayloadSchema):
+    """创建后台导出任务 payload.
+
+    filters 与对应同步导出接口的 query 参数一致(如 `/accounts/ledgers/exports`).
+    """
+
+    export_type: str
+    filters: dict[str, Any] = Field(default_factory=dict)
+
+    @field_validator("export_type", mode="before")
+    @classmethod
+    def _parse_export_type(cls, value: Any) -> str:
+        cleaned = str(value or "").strip().lower()
+        if cleaned not in EXPORT_TYPE_LABELS:
+            raise ValueError(f"不支持的导出类型: {value}")
+        return cleaned
+
+    @field_validator("filters", mode="before")
+    @classmethod
+    def _parse_filters(cls, value: Any) -> dict[str, Any]:
+        if value is None:
+            return {}
+        if not isinstance(value, dict):
+            raise ValueError("filters 必须为对象")  # noqa: TRY004
+        return value
+
+
+def parse_export_filters(export_type: str, filters: dict[str, Any]) -> Any:
+    """按导出类型校验筛选条件, 返回对应导出 query schema 实例."""
+    return validate_or_raise(EXPORT_FILTER_SCHEMAS[export_type], filters)
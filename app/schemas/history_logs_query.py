@@ -14,7 +14,7 @@ from pydantic import AliasChoices, Field, field_validator
 
 from app.core.constants.system_constants import LogLevel
 from app.core.types.history_logs import LogSearchFilters
-from app.schemas.base import PayloadSchema
+from app.schemas.base import KeysetPaginationQuery, PayloadSchema
 from app.schemas.query_parsers import parse_int, parse_text
 
 _ALLOWED_SORT_ORDERS = {"asc", "desc"}
@@ -45,7 +45,7 @@ def _resolve_hours(value: Any) -> int | None:
     return hours
 
 
-class HistoryLogsListQuery(PayloadSchema):
+class HistoryLogsListQuery(KeysetPaginationQuery):
     """日志列表 query 参数 schema."""
 
     page: int = _DEFAULT_PAGE
@@ -143,6 +143,7 @@ class HistoryLogsListQuery(PayloadSchema):
             start_time=self.start_time,
             end_time=self.end_time,
             hours=self.hours,
+            keyset=self.to_keyset_params(),
         )
 
 
@@ -12,7 +12,7 @@ from typing import Any
 from pydantic import AliasChoices, Field, field_validator
 
 from app.core.types.instances import InstanceListFilters
-from app.schemas.base import PayloadSchema
+from app.schemas.base import KeysetPaginationQuery, PayloadSchema
 from app.schemas.query_parsers import parse_int, parse_tags, parse_text, parse_text_list
 from app.utils.payload_converters import as_bool
 
@@ -38,7 +38,7 @@ def _parse_sort_order(value: Any, *, default: str) -> str:
     raise ValueError("sort_order 参数必须为 asc 或 desc")
 
 
-class InstanceListFiltersQuery(PayloadSchema):
+class InstanceListFiltersQuery(KeysetPaginationQuery):
     """实例列表 query 参数 schema.
 
     用于将 API 层 `parse_args()` 输出收敛为稳定的 `InstanceListFilters`.
@@ -115,6 +115,7 @@ class InstanceListFiltersQuery(PayloadSchema):
             backup_status=self.backup_status,
             tags=list(self.tags),
             include_deleted=self.include_deleted,
+            keyset=self.to_keyset_params(),
         )
 
 
@@ -9,6 +9,7 @@ from pydantic import Field, field_validator
 
 from app.core.constants.validation_limits import HOST_MAX_LENGTH, PORT_MAX, PORT_MIN
 from app.schemas.base import PayloadSchema
+from app.utils.payload_converters import as_bool
 
 
 def _normalize_domain(value: str) -> str:
@@ -108,3 +109,14 @@ class VeeamSourceBindingPayload(PayloadSchema):
             seen.add(normalized)
             cleaned.append(normalized)
         return cleaned
+
+
+class VeeamSyncActionPayload(PayloadSchema):
+    """Veeam 备份同步动作 payload."""
+
+    full_resync: bool = False
+
+    @field_validator("full_resync", mode="before")
+    @classmethod
+    def _parse_full_resync(cls, value: Any) -> bool:
+        return as_bool(value, default=False)
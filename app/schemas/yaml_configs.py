@@ -8,10 +8,20 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from typing import Any
+from typing import Any, Self
 
 from pydantic import ConfigDict, Field, field_validator, model_validator
 
+from app.core.constants.scheduler_jobs import (
+    DEFAULT_EXECUTOR_MAX_WORKERS,
+    DEFAULT_EXECUTOR_NAME,
+    DEPENDENCY_SCOPE_ALL,
+    DEPENDENCY_SCOPES,
+    DEPENDENCY_TRIGGER_TYPE,
+    EXECUTOR_TYPE_THREAD,
+    EXECUTOR_TYPES,
+    MAX_EXECUTOR_WORKERS,
+)
 from app.schemas.base import PayloadSchema
 
 
@@ -36,6 +46,19 @@ def _coerce_string_list(value: Any) -> list[str]:
     raise ValueError("必须为字符串列表")
 
 
+def _validate_task_dependencies(*, task_id: str, trigger_type: str, depends_on: list[str], scope: str) -> None:
+    if scope not in DEPENDENCY_SCOPES:
+        raise ValueError(f"scope 仅支持: {', '.join(sorted(DEPENDENCY_SCOPES))}")
+    if trigger_type == DEPENDENCY_TRIGGER_TYPE:
+        if not depends_on:
+            raise ValueError("dependency 触发的任务必须声明 depends_on")
+        if task_id in depends_on:
+            raise ValueError("任务不能依赖自身")
+        return
+    if depends_on:
+        raise ValueError("仅 trigger_type=dependency 的任务可以声明 depends_on")
+
+
 def _normalize_db_type_mapping_keys(value: Mapping[Any, Any]) -> dict[str, Any]:
     normalized: dict[str, Any] = {}
     for key, rule in value.items():
@@ -53,6 +76,10 @@ class SchedulerTaskConfig(PayloadSchema):
     function: str
     trigger_type: str
     trigger_params: dict[str, Any] = Field(default_factory=dict)
+    depends_on: list[str] = Field(default_factory=list)
+    scope: str = DEPENDENCY_SCOPE_ALL
+    executor: str | None = None
+    max_instances: int | None = Field(default=None, ge=1)
     enabled: bool = True
     description: str | None = None
 
@@ -72,6 +99,21 @@ class SchedulerTaskConfig(PayloadSchema):
             raise ValueError("trigger_params 必须为对象")  # noqa: TRY004
         return dict(value)
 
+    @field_validator("depends_on", mode="before")
+    @classmethod
+    def _coerce_depends_on(cls, value: Any) -> Any:
+        return _coerce_string_list(value)
+
+    @model_validator(mode="after")
+    def _validate_dependencies(self) -> Self:
+        _validate_task_dependencies(
+            task_id=self.id,
+            trigger_type=self.trigger_type,
+            depends_on=self.depends_on,
+            scope=self.scope,
+        )
+        return self
+
 
 class SchedulerTaskScheduleConfig(PayloadSchema):
     """单条 scheduler task 调度配置."""
@@ -81,6 +123,10 @@ class SchedulerTaskScheduleConfig(PayloadSchema):
     id: str
     trigger_type: str
     trigger_params: dict[str, Any] = Field(default_factory=dict)
+    depends_on: list[str] = Field(default_factory=list)
+    scope: str = DEPENDENCY_SCOPE_ALL
+    executor: str | None = None
+    max_instances: int | None = Field(default=None, ge=1)
     enabled: bool = True
 
     @field_validator("id", "trigger_type")
@@ -99,10 +145,48 @@ class SchedulerTaskScheduleConfig(PayloadSchema):
             raise ValueError("trigger_params 必须为对象")  # noqa: TRY004
         return dict(value)
 
+    @field_validator("depends_on", mode="before")
+    @classmethod
+    def _coerce_depends_on(cls, value: Any) -> Any:
+        return _coerce_string_list(value)
+
+    @model_validator(mode="after")
+    def _validate_dependencies(self) -> Self:
+        _validate_task_dependencies(
+            task_id=self.id,
+            trigger_type=self.trigger_type,
+            depends_on=self.depends_on,
+            scope=self.scope,
+        )
+        return self
+
+
+class SchedulerExecutorConfig(PayloadSchema):
+    """单个调度执行器(并发类别)配置."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    type: str = EXECUTOR_TYPE_THREAD
+    max_workers: int = Field(default=DEFAULT_EXECUTOR_MAX_WORKERS, ge=1, le=MAX_EXECUTOR_WORKERS)
+
+    @field_validator("type")
+    @classmethod
+    def _validate_type(cls, value: str) -> str:
+        normalized = value.strip().lower() if isinstance(value, str) else ""
+        if normalized not in EXECUTOR_TYPES:
+            raise ValueError(f"type 仅支持: {', '.join(sorted(EXECUTOR_TYPES))}")
+        return normalized
+
+
+def _default_executors() -> dict[str, SchedulerExecutorConfig]:
+    return {DEFAULT_EXECUTOR_NAME: SchedulerExecutorConfig()}
+
 
 class SchedulerTasksConfigFile(PayloadSchema):
     """`scheduler_tasks.yaml` 文件结构."""
 
+    executors: dict[str, SchedulerExecutorConfig] = Field(default_factory=_default_executors)
+    default_executor: str = DEFAULT_EXECUTOR_NAME
     default_tasks: list[SchedulerTaskScheduleConfig]
 
     @model_validator(mode="before")
@@ -110,6 +194,50 @@ class SchedulerTasksConfigFile(PayloadSchema):
     def _validate_root(cls, data: Any) -> Any:
         return _require_root_mapping(data)
 
+    @field_validator("executors", mode="before")
+    @classmethod
+    def _coerce_executors(cls, value: Any) -> Any:
+        if value is None:
+            return _default_executors()
+        if not isinstance(value, Mapping) or not value:
+            raise ValueError("executors 必须为非空对象")
+        return {str(name).strip(): config for name, config in value.items()}
+
+    @model_validator(mode="after")
+    def _validate_executor_refs(self) -> Self:
+        if self.default_executor not in self.executors:
+            raise ValueError(f"default_executor 未在 executors 中声明: {self.default_executor}")
+        for task in self.default_tasks:
+            if task.executor is not None and task.executor not in self.executors:
+                raise ValueError(f"任务 {task.id} 指定的执行器不存在: {task.executor}")
+        return self
+
+    @model_validator(mode="after")
+    def _validate_dependency_graph(self) -> Self:
+        upstreams = {task.id: task.depends_on for task in self.default_tasks}
+        for task_id, depends_on in upstreams.items():
+            missing = [upstream for upstream in depends_on if upstream not in upstreams]
+            if missing:
+                raise ValueError(f"任务 {task_id} 依赖的上游任务不存在: {', '.join(missing)}")
+
+        visiting: set[str] = set()
+        visited: set[str] = set()
+
+        def _visit(task_id: str) -> None:
+            if task_id in visited:
+                return
+            if task_id in visiting:
+                raise ValueError(f"任务依赖存在环: {task_id}")
+            visiting.add(task_id)
+            for upstream in upstreams[task_id]:
+                _visit(upstream)
+            visiting.discard(task_id)
+            visited.add(task_id)
+
+        for task_id in upstreams:
+            _visit(task_id)
+        return self
+
 
 class AccountFilterRuleConfig(PayloadSchema):
     """账户同步过滤规则（仅固化实际消费字段）."""
@@ -2,6 +2,7 @@
 
 职责:
 - 组织 repository 调用并输出稳定 DTO
+- 读取结果经 AccountStatisticsCache 按代缓存, `cache_generation` 记录本次命中的缓存代号
 - 不做 Query 细节、不做序列化/Response、不 commit
 """
 
@@ -12,20 +13,32 @@ from typing import Any, cast
 from app.core.types.account_scope import AccountScope
 from app.core.types.accounts_statistics import AccountStatisticsResult
 from app.repositories.account_statistics_repository import AccountStatisticsRepository
+from app.services.statistics.account_statistics_cache import AccountStatisticsCache
 
 
 class AccountsStatisticsReadService:
     """账户统计读取服务."""
 
-    def __init__(self, repository: AccountStatisticsRepository | None = None) -> None:
+    def __init__(
+        self,
+        repository: AccountStatisticsRepository | None = None,
+        cache: AccountStatisticsCache | None = None,
+    ) -> None:
         """初始化读取服务."""
         self._repository = repository or AccountStatisticsRepository()
+        self._cache = cache or AccountStatisticsCache()
+        self.cache_generation: int | None = None
 
     def build_statistics(self) -> AccountStatisticsResult:
         """构建账户统计结果."""
-        summary = self._repository.fetch_summary()
-        db_type_stats = self._repository.fetch_db_type_stats()
-        classification_stats = self._repository.fetch_classification_stats()
+        (summary, db_type_stats), self.cache_generation = self._cache.get_or_load(
+            "snapshot",
+            self._repository.fetch_statistics_snapshot,
+        )
+        classification_stats, _ = self._cache.get_or_load(
+            "classifications",
+            self._repository.fetch_classification_stats,
+        )
 
         return AccountStatisticsResult(
             total_accounts=summary["total_accounts"],
@@ -55,15 +68,34 @@ class AccountsStatisticsReadService:
         account_scope: AccountScope | None = None,
     ) -> dict[str, Any]:
         """获取账户统计汇总."""
-        return self._repository.fetch_summary(instance_id=instance_id, db_type=db_type, account_scope=account_scope)
+        summary, self.cache_generation = self._cache.get_or_load(
+            "summary",
+            lambda: self._repository.fetch_summary(
+                instance_id=instance_id,
+                db_type=db_type,
+                account_scope=account_scope,
+            ),
+            instance_id=instance_id,
+            db_type=db_type,
+            account_scope=account_scope,
+        )
+        return summary
 
     def fetch_db_type_stats(self) -> dict[str, dict[str, int]]:
         """获取按数据库类型统计."""
-        return self._repository.fetch_db_type_stats()
+        db_type_stats, self.cache_generation = self._cache.get_or_load(
+            "db_types",
+            self._repository.fetch_db_type_stats,
+        )
+        return db_type_stats
 
     def fetch_classification_stats(self) -> dict[str, dict[str, Any]]:
         """获取按分类统计."""
-        return self._repository.fetch_classification_stats()
+        classification_stats, self.cache_generation = self._cache.get_or_load(
+            "classifications",
+            self._repository.fetch_classification_stats,
+        )
+        return classification_stats
 
     @staticmethod
     def empty_statistics() -> AccountStatisticsResult:
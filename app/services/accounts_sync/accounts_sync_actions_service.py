@@ -20,6 +20,7 @@ from app.core.exceptions import NotFoundError, SystemError, ValidationError
 from app.infra.route_safety import log_with_context
 from app.models.instance import Instance
 from app.repositories.instances_repository import InstancesRepository
+from app.services.statistics.account_statistics_cache import invalidate_account_statistics_cache
 from app.services.task_runs.task_runs_write_service import TaskRunsWriteService
 
 
@@ -268,6 +269,7 @@ class AccountsSyncActionsService:
         if is_success:
             sync_count_value = cast("int | None", instance.sync_count)
             instance.sync_count = (0 if sync_count_value is None else sync_count_value) + 1
+            invalidate_account_statistics_cache(reason="sync_instance_accounts")
             log_with_context(
                 "info",
                 "实例账户同步成功",
@@ -7,8 +7,10 @@
 
 from __future__ import annotations
 
+from app.core.exceptions import NotFoundError
 from app.models.instance import Instance
 from app.repositories.filter_options_repository import FilterOptionsRepository
+from app.services.instances.instance_detail_read_service import InstanceDetailReadService
 
 
 class AccountsSyncTaskService:
@@ -21,3 +23,10 @@ class AccountsSyncTaskService:
     def list_active_instances(self) -> list[Instance]:
         """获取启用的数据库实例列表."""
         return self._repository.list_active_instances()
+
+    def get_active_instance(self, instance_id: int) -> Instance:
+        """获取单个可同步实例(分片子项恢复上下文时使用)."""
+        instance = InstanceDetailReadService().get_instance_by_id(instance_id)
+        if instance is None or not instance.is_active or instance.deleted_at is not None:
+            raise NotFoundError("实例不存在或未启用", extra={"instance_id": instance_id})
+        return instance
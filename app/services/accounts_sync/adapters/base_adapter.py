@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
+import hashlib
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from app.core.types import RawAccount, RemoteAccount
+    from app.core.types import JsonDict, RawAccount, RemoteAccount
     from app.models.instance import Instance
 
 
+def build_permission_fingerprint(parts: Iterable[object]) -> str:
+    """把单个主体的远端授权摘要片段合成为稳定指纹(与片段顺序无关)."""
+    payload = "\n".join(sorted(str(part) for part in parts))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
 class BaseAccountAdapter(ABC):
     """账户同步适配器基类,负责抽象远端账户数据抓取."""
 
@@ -61,6 +68,28 @@ class BaseAccountAdapter(ABC):
         del instance, connection, usernames
         return accounts
 
+    def fetch_permission_fingerprints(
+        self,
+        instance: Instance,
+        connection: object,
+        usernames: Sequence[str],
+    ) -> dict[str, str] | None:
+        """以少量聚合查询计算目标账户的远端权限指纹.
+
+        指纹只用于判断权限是否可能变化: 指纹与上次一致的账户可跳过 ``enrich_permissions``.
+        查询结果中缺失的账户视为需要补全.
+
+        Returns:
+            dict[str, str] | None: 用户名到指纹的映射; 不支持或查询失败时返回 None, 调用方全量补全.
+
+        """
+        del instance, connection, usernames
+        return None
+
+    def get_permission_query_stats(self) -> JsonDict | None:
+        """返回最近一次权限补全的查询统计, 未统计的适配器返回 None."""
+        return None
+
     @abstractmethod
     def _fetch_raw_accounts(self, instance: Instance, connection: object) -> list[RawAccount]:
         """具体数据库实现负责查询账户列表.
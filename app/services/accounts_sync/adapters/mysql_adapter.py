@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING, Any, Protocol, cast
 from app.core.constants import DatabaseType
 from app.schemas.external_contracts.mysql_account import MySQLRawAccountSchema
 from app.services.accounts_sync.accounts_sync_filters import DatabaseFilterManager
-from app.services.accounts_sync.adapters.base_adapter import BaseAccountAdapter
+from app.services.accounts_sync.adapters.base_adapter import BaseAccountAdapter, build_permission_fingerprint
 from app.services.connection_adapters.adapters.base import ConnectionAdapterError
 from app.utils.safe_query_builder import SafeQueryBuilder
 from app.utils.structlog_config import get_sync_logger, log_fallback
@@ -25,6 +25,25 @@ class _MySQLConnectionProtocol(Protocol):
     def execute_query(self, sql: str, params: Sequence[str] | None = None) -> Sequence[tuple[Any, ...]]: ...
 
 
+# 权限指纹来源表: (来源标签, mysql 库表名, 账户 user 列, 账户 host 列); 不存在的表(低版本)自动跳过.
+# role_edges/default_roles 同时按被授予方与角色方聚合, 覆盖 mysql_granted_roles 与 mysql_role_members
+_FINGERPRINT_GRANT_TABLES: tuple[tuple[str, str, str, str], ...] = (
+    ("user", "user", "User", "Host"),
+    ("db", "db", "User", "Host"),
+    ("tables_priv", "tables_priv", "User", "Host"),
+    ("columns_priv", "columns_priv", "User", "Host"),
+    ("procs_priv", "procs_priv", "User", "Host"),
+    ("proxies_priv", "proxies_priv", "User", "Host"),
+    ("global_grants", "global_grants", "USER", "HOST"),
+    ("role_edges", "role_edges", "TO_USER", "TO_HOST"),
+    ("role_members", "role_edges", "FROM_USER", "FROM_HOST"),
+    ("default_roles", "default_roles", "USER", "HOST"),
+    ("default_role_members", "default_roles", "DEFAULT_ROLE_USER", "DEFAULT_ROLE_HOST"),
+)
+# 授权时间戳变化不影响 SHOW GRANTS 输出
+_FINGERPRINT_IGNORED_COLUMNS = frozenset({"timestamp"})
+
+
 class MySQLAccountAdapter(BaseAccountAdapter):
     """负责拉取 MySQL 账户信息与权限快照.
 
@@ -745,6 +764,80 @@ class MySQLAccountAdapter(BaseAccountAdapter):
         )
         return accounts
 
+    def fetch_permission_fingerprints(
+        self,
+        instance: Instance,
+        connection: object,
+        usernames: Sequence[str],
+    ) -> dict[str, str] | None:
+        """按 user@host 聚合 mysql 授权表的行数与 CRC32 之和, 两条语句算出全部账户指纹.
+
+        mysql.user 只取 ``*_priv`` 列, 其余授权表取除账户列与时间戳外的全部列; 列清单来自
+        information_schema, 兼容不同版本的表结构.
+        """
+        conn = cast(_MySQLConnectionProtocol, connection)
+        try:
+            sql = self._build_permission_fingerprint_sql(conn)
+            rows = conn.execute_query(sql) if sql else None
+        except ConnectionAdapterError as exc:
+            log_fallback(
+                "warning",
+                "mysql_permission_fingerprints_fallback",
+                module="mysql_account_adapter",
+                action="fetch_permission_fingerprints",
+                fallback_reason="fingerprint_query_failed",
+                logger=self.logger,
+                exception=exc,
+                instance=instance.name,
+                user_count=len(usernames),
+            )
+            return None
+        if rows is None:
+            return None
+
+        parts_by_account: dict[str, list[str]] = {}
+        for source, account, grant_count, grant_checksum in rows:
+            account_key = account.decode() if isinstance(account, bytes) else str(account)
+            parts_by_account.setdefault(account_key, []).append(f"{source}|{grant_count}|{grant_checksum}")
+        return {username: build_permission_fingerprint(parts_by_account.get(username, [])) for username in usernames}
+
+    @staticmethod
+    def _build_permission_fingerprint_sql(conn: _MySQLConnectionProtocol) -> str:
+        table_names = sorted({table_name for _, table_name, _, _ in _FINGERPRINT_GRANT_TABLES})
+        placeholders = ", ".join(["%s"] * len(table_names))
+        column_rows = conn.execute_query(
+            "SELECT TABLE_NAME, COLUMN_NAME FROM information_schema.COLUMNS "
+            f"WHERE TABLE_SCHEMA = 'mysql' AND TABLE_NAME IN ({placeholders}) "
+            "ORDER BY TABLE_NAME, ORDINAL_POSITION",
+            table_names,
+        )
+        columns_by_table: dict[str, list[str]] = {}
+        for table_name, column_name in column_rows:
+            columns_by_table.setdefault(str(table_name).lower(), []).append(str(column_name))
+
+        fragments: list[str] = []
+        for source, table_name, user_column, host_column in _FINGERPRINT_GRANT_TABLES:
+            columns = columns_by_table.get(table_name)
+            if not columns:
+                continue
+            key_columns = {user_column.lower(), host_column.lower()}
+            hashed_columns = [
+                column
+                for column in columns
+                if column.lower() not in key_columns
+                and column.lower() not in _FINGERPRINT_IGNORED_COLUMNS
+                and (table_name != "user" or column.lower().endswith("_priv"))
+            ]
+            if not hashed_columns:
+                continue
+            hashed = ", ".join(f"`{column}`" for column in hashed_columns)
+            fragments.append(
+                f"SELECT '{source}', CONCAT({user_column}, '@', {host_column}), COUNT(*), "
+                f"SUM(CRC32(CONCAT_WS('|', {hashed}))) "
+                f"FROM mysql.{table_name} GROUP BY {user_column}, {host_column}",
+            )
+        return " UNION ALL ".join(fragments)
+
     def _parse_grant_statement(
         self,
         grant_statement: str,
@@ -5,9 +5,10 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, cast
 
 from app.core.constants import DatabaseType
+from app.infra.route_safety import log_fallback
 from app.schemas.external_contracts.oracle_account import OracleRawAccountSchema
 from app.services.accounts_sync.accounts_sync_filters import DatabaseFilterManager
-from app.services.accounts_sync.adapters.base_adapter import BaseAccountAdapter
+from app.services.accounts_sync.adapters.base_adapter import BaseAccountAdapter, build_permission_fingerprint
 from app.services.connection_adapters.adapters.base import ConnectionAdapterError
 from app.utils.structlog_config import get_sync_logger
 
@@ -34,6 +35,16 @@ ORACLE_ADAPTER_EXCEPTIONS: tuple[type[Exception], ...] = (
     *ORACLE_DRIVER_EXCEPTIONS,
 )
 
+# 批量采集: 每个字典视图一次查询拉取全部目标用户的授权, 大 arraysize 减少跨 WAN 的抓取往返
+ORACLE_BULK_FETCH_ARRAYSIZE = 1000
+# 驱动不支持集合绑定时退回 IN 列表绑定, Oracle 单个 IN 列表最多 1000 项(ORA-01795)
+ORACLE_BULK_IN_LIST_SIZE = 1000
+
+_BULK_GRANT_VIEWS: tuple[tuple[str, str, str], ...] = (
+    ("oracle_roles", "dba_role_privs", "granted_role"),
+    ("oracle_system_privileges", "dba_sys_privs", "privilege"),
+)
+
 
 class OracleAccountAdapter(BaseAccountAdapter):
     """Oracle 账户同步适配器.
@@ -245,6 +256,7 @@ class OracleAccountAdapter(BaseAccountAdapter):
         if not target_usernames:
             return accounts
 
+        bulk_permissions = self._get_bulk_permissions(instance, connection, sorted(target_usernames))
         processed = 0
         for account in accounts:
             username_value = account.get("username")
@@ -253,7 +265,11 @@ class OracleAccountAdapter(BaseAccountAdapter):
                 continue
             processed += 1
             try:
-                permissions = self._get_user_permissions(connection, username)
+                permissions = (
+                    bulk_permissions.get(username) or self._empty_permissions()
+                    if bulk_permissions is not None
+                    else self._get_user_permissions(connection, username)
+                )
                 account["permissions"] = permissions
             except ORACLE_ADAPTER_EXCEPTIONS as exc:
                 self.logger.exception(
@@ -279,9 +295,109 @@ class OracleAccountAdapter(BaseAccountAdapter):
             module="oracle_account_adapter",
             instance=instance.name,
             processed_accounts=processed,
+            bulk=bulk_permissions is not None,
         )
         return accounts
 
+    def fetch_permission_fingerprints(
+        self,
+        instance: Instance,
+        connection: object,
+        usernames: Sequence[str],
+    ) -> dict[str, str] | None:
+        """按 grantee 聚合 DBA_ROLE_PRIVS/DBA_SYS_PRIVS 的行数与 ORA_HASH 之和, 一条语句算出全部指纹."""
+        sql = " UNION ALL ".join(
+            f"SELECT grantee, '{view_name}', COUNT(*), SUM(ORA_HASH({column_name})) FROM {view_name} GROUP BY grantee"
+            for _, view_name, column_name in _BULK_GRANT_VIEWS
+        )
+        try:
+            rows = connection.execute_query(sql)  # type: ignore[attr-defined]
+        except ORACLE_ADAPTER_EXCEPTIONS as exc:
+            log_fallback(
+                "warning",
+                "oracle_permission_fingerprints_fallback",
+                module="oracle_account_adapter",
+                action="fetch_permission_fingerprints",
+                fallback_reason="fingerprint_query_failed",
+                context={"instance": instance.name, "user_count": len(usernames), "error": str(exc)},
+                logger_name="sync",
+            )
+            return None
+        parts_by_grantee: dict[str, list[str]] = {}
+        for grantee, view_name, grant_count, grant_hash in rows:
+            if grantee:
+                parts_by_grantee.setdefault(str(grantee), []).append(f"{view_name}|{grant_count}|{grant_hash}")
+        return {username: build_permission_fingerprint(parts_by_grantee.get(username, [])) for username in usernames}
+
+    @staticmethod
+    def _empty_permissions() -> PermissionSnapshot:
+        return cast(
+            "PermissionSnapshot",
+            {"oracle_roles": [], "oracle_system_privileges": [], "type_specific": {}},
+        )
+
+    def _get_bulk_permissions(
+        self,
+        instance: Instance,
+        connection: object,
+        usernames: Sequence[str],
+    ) -> dict[str, PermissionSnapshot] | None:
+        """每个字典视图一次查询拉取全部目标用户的角色与系统权限, 输出与逐用户查询相同的快照结构.
+
+        Returns:
+            dict[str, PermissionSnapshot] | None: 用户名到权限快照的映射, 批量查询失败时返回 None 以回退逐用户查询.
+
+        """
+        snapshots: dict[str, PermissionSnapshot] = {}
+        try:
+            for permission_key, view_name, column_name in _BULK_GRANT_VIEWS:
+                for grantee, granted in self._fetch_bulk_grants(connection, view_name, column_name, usernames):
+                    snapshot = snapshots.setdefault(grantee, self._empty_permissions())
+                    cast("list[str]", snapshot[permission_key]).append(granted)
+        except ORACLE_ADAPTER_EXCEPTIONS as exc:
+            log_fallback(
+                "warning",
+                "oracle_bulk_permissions_fallback",
+                module="oracle_account_adapter",
+                action="get_bulk_permissions",
+                fallback_reason="bulk_grant_query_failed",
+                context={"instance": instance.name, "user_count": len(usernames), "error": str(exc)},
+                logger_name="sync",
+            )
+            return None
+        return snapshots
+
+    def _fetch_bulk_grants(
+        self,
+        connection: object,
+        view_name: str,
+        column_name: str,
+        usernames: Sequence[str],
+    ) -> list[tuple[str, str]]:
+        """按名单批量查询授权行(grantee, 授权名).
+
+        连接支持集合绑定时使用 ``TABLE(:names)`` 单条语句, 否则按 IN 列表分块绑定.
+        """
+        create_collection = getattr(connection, "create_string_collection", None)
+        if callable(create_collection):
+            sql = (
+                f"SELECT grantee, {column_name} FROM {view_name} "
+                "WHERE grantee IN (SELECT column_value FROM TABLE(:names))"
+            )
+            rows = connection.execute_query(  # type: ignore[attr-defined]
+                sql,
+                {"names": create_collection(list(usernames))},
+                arraysize=ORACLE_BULK_FETCH_ARRAYSIZE,
+            )
+        else:
+            rows = []
+            for offset in range(0, len(usernames), ORACLE_BULK_IN_LIST_SIZE):
+                chunk = list(usernames[offset : offset + ORACLE_BULK_IN_LIST_SIZE])
+                placeholders = ",".join(f":{index}" for index in range(1, len(chunk) + 1))
+                sql = f"SELECT grantee, {column_name} FROM {view_name} WHERE grantee IN ({placeholders})"
+                rows.extend(connection.execute_query(sql, chunk))  # type: ignore[attr-defined]
+        return [(str(row[0]), str(row[1])) for row in rows if row and row[0] and row[1]]
+
     def _get_roles(self, connection: object, username: str) -> list[str]:
         """查询用户拥有的角色.
 
@@ -6,9 +6,10 @@ from datetime import date, datetime
 from typing import TYPE_CHECKING, cast
 
 from app.core.constants import DatabaseType
+from app.infra.route_safety import log_fallback
 from app.schemas.external_contracts.postgresql_account import PostgreSQLRawAccountSchema
 from app.services.accounts_sync.accounts_sync_filters import DatabaseFilterManager
-from app.services.accounts_sync.adapters.base_adapter import BaseAccountAdapter
+from app.services.accounts_sync.adapters.base_adapter import BaseAccountAdapter, build_permission_fingerprint
 from app.utils.safe_query_builder import SafeQueryBuilder
 from app.utils.structlog_config import get_sync_logger
 
@@ -19,6 +20,45 @@ if TYPE_CHECKING:
     from app.core.types.sync import SyncConnection
     from app.models.instance import Instance
 
+# 角色属性 + 直接/传递成员关系 + 各库 ACL 的摘要; has_database_privilege 结果只取决于这些输入
+_PERMISSION_FINGERPRINT_SQL = """
+    WITH RECURSIVE membership(member, roleid) AS (
+        SELECT member, roleid FROM pg_auth_members
+        UNION
+        SELECT membership.member, pg_auth_members.roleid
+        FROM membership
+        JOIN pg_auth_members ON pg_auth_members.member = membership.roleid
+    ),
+    database_acl AS (
+        SELECT COALESCE(
+            string_agg(datname || ':' || datdba::text || ':' || COALESCE(datacl::text, ''), ',' ORDER BY datname),
+            ''
+        ) AS acl
+        FROM pg_database
+        WHERE datallowconn = true
+    )
+    SELECT
+        r.rolname,
+        md5(concat_ws(
+            '|',
+            r.rolsuper, r.rolinherit, r.rolcreaterole, r.rolcreatedb, r.rolcanlogin,
+            r.rolreplication, r.rolbypassrls, r.rolvaliduntil,
+            (
+                SELECT string_agg(DISTINCT pg_get_userbyid(m.roleid), ',' ORDER BY pg_get_userbyid(m.roleid))
+                FROM pg_auth_members m
+                WHERE m.member = r.oid
+            ),
+            (
+                SELECT string_agg(DISTINCT ms.roleid::text, ',' ORDER BY ms.roleid::text)
+                FROM membership ms
+                WHERE ms.member = r.oid
+            ),
+            database_acl.acl
+        ))
+    FROM pg_roles r
+    CROSS JOIN database_acl
+"""
+
 
 class PostgreSQLAccountAdapter(BaseAccountAdapter):
     """PostgreSQL 账户同步适配器.
@@ -331,6 +371,31 @@ class PostgreSQLAccountAdapter(BaseAccountAdapter):
         )
         return accounts
 
+    def fetch_permission_fingerprints(
+        self,
+        instance: Instance,
+        connection: object,
+        usernames: Sequence[str],
+    ) -> dict[str, str] | None:
+        """一条语句对 pg_roles/pg_auth_members/pg_database ACL 求摘要, 得到全部角色的指纹."""
+        try:
+            rows = self._get_connection(connection).execute_query(_PERMISSION_FINGERPRINT_SQL)
+        except self.POSTGRES_ADAPTER_EXCEPTIONS as exc:
+            log_fallback(
+                "warning",
+                "postgresql_permission_fingerprints_fallback",
+                module="postgresql_account_adapter",
+                action="fetch_permission_fingerprints",
+                fallback_reason="fingerprint_query_failed",
+                context={"instance": instance.name, "user_count": len(usernames), "error": str(exc)},
+                logger_name="sync",
+            )
+            return None
+        digests = {str(rolname): str(digest) for rolname, digest in rows if rolname and digest}
+        return {
+            username: build_permission_fingerprint([digests[username]]) for username in usernames if username in digests
+        }
+
     def _merge_seed_permissions(
         self,
         permissions: PermissionSnapshot,
@@ -4,16 +4,29 @@ from __future__ import annotations
 
 import re
 import time
-from collections.abc import Iterable, Sequence
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from queue import SimpleQueue
 from typing import TYPE_CHECKING, Any, cast
 
+from flask import current_app, has_app_context
+
 from app.core.constants import DatabaseType
 from app.infra.route_safety import log_fallback
 from app.schemas.external_contracts.sqlserver_account import SQLServerRawAccountSchema
 from app.services.accounts_sync.accounts_sync_filters import DatabaseFilterManager
-from app.services.accounts_sync.adapters.base_adapter import BaseAccountAdapter
+from app.services.accounts_sync.adapters.base_adapter import BaseAccountAdapter, build_permission_fingerprint
+from app.services.accounts_sync.adapters.sqlserver_query_stats import (
+    SQLServerPermissionQueryStats,
+    TimedSQLServerConnection,
+)
 from app.services.connection_adapters.adapters.base import ConnectionAdapterError
+from app.services.connection_adapters.connection_factory import ConnectionFactory
+from app.settings import (
+    DEFAULT_SQLSERVER_PERMISSION_QUERY_CONCURRENCY,
+    DEFAULT_SQLSERVER_PERMISSION_TARGET_STAGING_ENABLED,
+)
 from app.utils.structlog_config import get_sync_logger
 
 if TYPE_CHECKING:
@@ -22,6 +35,7 @@ if TYPE_CHECKING:
     from app.core.types import JsonDict, JsonValue, PermissionSnapshot, RawAccount, RemoteAccount
     from app.core.types.sync import SyncConnection
     from app.models.instance import Instance
+    from app.services.connection_adapters.adapters.base import DatabaseConnection
 
 import pymssql  # type: ignore[import-not-found]
 
@@ -40,6 +54,69 @@ SQLSERVER_ADAPTER_EXCEPTIONS: tuple[type[Exception], ...] = (
 
 SQLSERVER_DATABASE_PERMISSION_BATCH_SIZE = 20
 
+_TARGET_LOGINS_TABLE = "#whalefall_target_logins"
+_TARGET_SIDS_TABLE = "#whalefall_target_sids"
+_TARGET_SIDS_PLACEHOLDER = "__TARGET_SIDS__"
+# SQL Server 单条 INSERT ... VALUES 最多 1000 行
+_STAGING_INSERT_CHUNK_SIZE = 1000
+
+# 权限指纹: 服务器级与各库级授权在服务端按主体聚合为行数 + CHECKSUM_AGG, 每个主体每个库只返回一行
+_SERVER_PERMISSION_FINGERPRINT_SQL = """
+    SELECT sp.name,
+           sp.sid,
+           CONVERT(varchar(33), sp.modify_date, 126) AS modify_date,
+           role_agg.role_count,
+           role_agg.role_checksum,
+           perm_agg.permission_count,
+           perm_agg.permission_checksum
+    FROM sys.server_principals sp
+    OUTER APPLY (
+        SELECT COUNT(*) AS role_count, CHECKSUM_AGG(CHECKSUM(role.name)) AS role_checksum
+        FROM sys.server_role_members rm
+        JOIN sys.server_principals role ON rm.role_principal_id = role.principal_id
+        WHERE rm.member_principal_id = sp.principal_id
+    ) AS role_agg
+    OUTER APPLY (
+        SELECT COUNT(*) AS permission_count,
+               CHECKSUM_AGG(
+                   CHECKSUM(perm.permission_name, perm.state, perm.class, perm.major_id, perm.minor_id)
+               ) AS permission_checksum
+        FROM sys.server_permissions perm
+        WHERE perm.grantee_principal_id = sp.principal_id
+    ) AS perm_agg
+    WHERE sp.type IN ('S', 'U', 'G')
+"""
+_DATABASE_PERMISSION_FINGERPRINT_TEMPLATE = """
+    SELECT '__DB_LITERAL__' AS db_name,
+           dp.sid,
+           role_agg.role_count,
+           role_agg.role_checksum,
+           perm_agg.permission_count,
+           perm_agg.permission_checksum
+    FROM __DB_IDENTIFIER__.sys.database_principals dp
+    OUTER APPLY (
+        SELECT COUNT(*) AS role_count, CHECKSUM_AGG(CHECKSUM(role.name)) AS role_checksum
+        FROM __DB_IDENTIFIER__.sys.database_role_members drm
+        JOIN __DB_IDENTIFIER__.sys.database_principals role ON drm.role_principal_id = role.principal_id
+        WHERE drm.member_principal_id = dp.principal_id
+    ) AS role_agg
+    OUTER APPLY (
+        SELECT COUNT(*) AS permission_count,
+               CHECKSUM_AGG(
+                   CHECKSUM(perm.permission_name, perm.class, perm.major_id, perm.minor_id)
+               ) AS permission_checksum
+        FROM __DB_IDENTIFIER__.sys.database_permissions perm
+        WHERE perm.grantee_principal_id = dp.principal_id
+          AND perm.state = 'G'
+    ) AS perm_agg
+    WHERE dp.type IN ('S', 'U', 'G')
+      AND dp.name != 'dbo'
+      AND dp.sid IS NOT NULL
+"""
+
+
+_BatchRows = tuple[list[tuple[Any, ...]], list[tuple[Any, ...]], list[tuple[Any, ...]]]
+
 
 @dataclass(frozen=True)
 class DatabasePermissionTemplates:
@@ -50,6 +127,22 @@ class DatabasePermissionTemplates:
     permissions: str
 
 
+@dataclass(frozen=True, slots=True)
+class _ParallelBatchTarget:
+    """并发执行数据库批次所需的上下文(实例、需暂存的登录名、主连接统计)."""
+
+    instance: Instance
+    staged_usernames: tuple[str, ...] | None
+    stats: SQLServerPermissionQueryStats
+
+
+@dataclass(frozen=True, slots=True)
+class _BatchConnection:
+    connection: DatabaseConnection
+    timed: TimedSQLServerConnection
+    stats: SQLServerPermissionQueryStats
+
+
 class SQLServerAccountAdapter(BaseAccountAdapter):
     """SQL Server 账户同步适配器.
 
@@ -72,6 +165,39 @@ class SQLServerAccountAdapter(BaseAccountAdapter):
         """初始化 SQL Server 适配器,配置日志与过滤管理器."""
         self.logger = get_sync_logger()
         self.filter_manager = DatabaseFilterManager()
+        self._permission_query_stats: JsonDict | None = None
+        self._database_batch_concurrency = self._resolve_database_batch_concurrency()
+        self._permission_target_staging_enabled = self._resolve_permission_target_staging_enabled()
+
+    @staticmethod
+    def _resolve_database_batch_concurrency() -> int:
+        if has_app_context():
+            return max(
+                int(
+                    current_app.config.get(
+                        "SQLSERVER_PERMISSION_QUERY_CONCURRENCY",
+                        DEFAULT_SQLSERVER_PERMISSION_QUERY_CONCURRENCY,
+                    ),
+                ),
+                1,
+            )
+        return DEFAULT_SQLSERVER_PERMISSION_QUERY_CONCURRENCY
+
+    @staticmethod
+    def _resolve_permission_target_staging_enabled() -> bool:
+        # 目标登录名/SID 预先载入会话临时表, 各库权限查询文本不再内联字面量, 执行计划可跨批次与同步复用
+        if has_app_context():
+            return bool(
+                current_app.config.get(
+                    "SQLSERVER_PERMISSION_TARGET_STAGING_ENABLED",
+                    DEFAULT_SQLSERVER_PERMISSION_TARGET_STAGING_ENABLED,
+                ),
+            )
+        return DEFAULT_SQLSERVER_PERMISSION_TARGET_STAGING_ENABLED
+
+    def get_permission_query_stats(self) -> JsonDict | None:
+        """返回最近一次权限补全的查询统计(目标暂存方式、编译/执行耗时)."""
+        return self._permission_query_stats
 
     @staticmethod
     def _normalize_str(value: object) -> str | None:
@@ -233,9 +359,11 @@ class SQLServerAccountAdapter(BaseAccountAdapter):
             return accounts
 
         usernames_list = list(target_usernames)
-        server_roles_map = self._get_server_roles_bulk(connection, usernames_list)
-        server_permissions_map = self._get_server_permissions_bulk(connection, usernames_list)
-        db_batch_permissions = self._get_all_users_database_permissions_batch(connection, usernames_list)
+        server_roles_map, server_permissions_map, db_batch_permissions = self._collect_permission_maps(
+            instance,
+            connection,
+            usernames_list,
+        )
         db_permissions_map: dict[str, JsonValue] = {
             login: cast(
                 "JsonValue",
@@ -304,6 +432,199 @@ class SQLServerAccountAdapter(BaseAccountAdapter):
         )
         return accounts
 
+    def fetch_permission_fingerprints(
+        self,
+        instance: Instance,
+        connection: object,
+        usernames: Sequence[str],
+    ) -> dict[str, str] | None:
+        """服务器级一条语句 + 每批数据库一条语句, 按 SID 合并出登录名的权限指纹.
+
+        服务器级包含 modify_date 与角色/权限聚合; 库级按数据库用户 SID 聚合角色成员与 GRANT 权限.
+        """
+        target_usernames = set(usernames)
+        if not target_usernames:
+            return {}
+        conn = self._get_connection(connection)
+        try:
+            server_rows = list(conn.execute_query(_SERVER_PERMISSION_FINGERPRINT_SQL))
+            database_list = self._get_accessible_databases(connection)
+            database_rows: list[tuple[Any, ...]] = []
+            for database_batch in self._split_database_batches(database_list, SQLSERVER_DATABASE_PERMISSION_BATCH_SIZE):
+                sql = self._compose_database_union(database_batch, _DATABASE_PERMISSION_FINGERPRINT_TEMPLATE)
+                database_rows.extend(tuple(row) for row in conn.execute_query(sql))
+        except SQLSERVER_ADAPTER_EXCEPTIONS as exc:
+            log_fallback(
+                "warning",
+                "sqlserver_permission_fingerprints_fallback",
+                module="sqlserver_account_adapter",
+                action="fetch_permission_fingerprints",
+                fallback_reason="fingerprint_query_failed",
+                context={"instance": instance.name, "user_count": len(target_usernames), "error": str(exc)},
+                logger_name="sync",
+            )
+            return None
+
+        parts_by_login: dict[str, list[str]] = {}
+        sid_to_logins: dict[bytes, list[str]] = {}
+        for login_name, raw_sid, *server_summary in server_rows:
+            normalized_login = self._normalize_str(login_name)
+            if not normalized_login or normalized_login not in target_usernames:
+                continue
+            parts_by_login[normalized_login] = ["server|" + "|".join(str(value) for value in server_summary)]
+            normalized_sid = self._normalize_sid(raw_sid)
+            if normalized_sid is not None:
+                sid_to_logins.setdefault(normalized_sid, []).append(normalized_login)
+        for db_name, raw_sid, *database_summary in database_rows:
+            normalized_sid = self._normalize_sid(raw_sid)
+            for login_name in sid_to_logins.get(normalized_sid, []) if normalized_sid is not None else []:
+                parts_by_login[login_name].append(
+                    f"db|{db_name}|" + "|".join(str(value) for value in database_summary),
+                )
+        return {login_name: build_permission_fingerprint(parts) for login_name, parts in parts_by_login.items()}
+
+    def _collect_permission_maps(
+        self,
+        instance: Instance,
+        connection: object,
+        usernames: list[str],
+    ) -> tuple[dict[str, list[str]], dict[str, list[str]], dict[str, JsonDict]]:
+        """查询服务器角色/权限与数据库权限, 并记录查询统计.
+
+        优先把目标登录名与 SID 载入会话临时表, 失败时回退为内联 CTE.
+        """
+        stats = SQLServerPermissionQueryStats()
+        with TimedSQLServerConnection(self._get_connection(connection), stats) as timed_connection:
+            staged_sid_to_logins = (
+                self._stage_permission_targets(timed_connection, usernames, stats)
+                if self._permission_target_staging_enabled
+                else None
+            )
+            staged = staged_sid_to_logins is not None
+            try:
+                server_roles_map = self._get_server_roles_bulk(timed_connection, usernames, staged=staged)
+                server_permissions_map = self._get_server_permissions_bulk(timed_connection, usernames, staged=staged)
+                db_batch_permissions = self._get_all_users_database_permissions_batch(
+                    timed_connection,
+                    usernames,
+                    staged_sid_to_logins=staged_sid_to_logins,
+                    parallel=_ParallelBatchTarget(
+                        instance=instance,
+                        staged_usernames=tuple(usernames) if staged else None,
+                        stats=stats,
+                    ),
+                )
+            finally:
+                if staged:
+                    self._drop_staged_targets(timed_connection)
+        self._permission_query_stats = stats.to_dict()
+        self.logger.info(
+            "sqlserver_permission_query_stats",
+            module="sqlserver_account_adapter",
+            instance=instance.name,
+            **stats.to_dict(),
+        )
+        return server_roles_map, server_permissions_map, db_batch_permissions
+
+    def _stage_permission_targets(
+        self,
+        connection: object,
+        usernames: Sequence[str],
+        stats: SQLServerPermissionQueryStats,
+    ) -> dict[bytes, list[str]] | None:
+        """把目标登录名与 SID 一次性载入会话临时表, 返回 SID 到登录名映射.
+
+        Returns:
+            dict[bytes, list[str]] | None: 暂存失败时返回 None, 调用方回退为内联 CTE.
+
+        """
+        unique_usernames = [name for name in dict.fromkeys(usernames) if name]
+        if not unique_usernames:
+            return None
+        sql, params = self._build_target_staging_batch(unique_usernames)
+        started_at = time.perf_counter()
+        try:
+            rows = self._get_connection(connection).execute_query(sql, params)
+        except SQLSERVER_ADAPTER_EXCEPTIONS as exc:
+            log_fallback(
+                "warning",
+                "sqlserver_permission_target_staging_failed",
+                module="sqlserver_account_adapter",
+                action="stage_permission_targets",
+                fallback_reason="temp_table_staging_failed",
+                context={"user_count": len(unique_usernames), "error": str(exc)},
+                logger_name="sync",
+            )
+            return None
+        stats.staging_ms += (time.perf_counter() - started_at) * 1000
+
+        sid_to_logins: dict[bytes, list[str]] = {}
+        for login_name, raw_sid in rows:
+            normalized_sid = self._normalize_sid(raw_sid)
+            normalized_login = self._normalize_str(login_name)
+            if not normalized_login or normalized_sid is None:
+                continue
+            sid_to_logins.setdefault(normalized_sid, []).append(normalized_login)
+        stats.target_mode = "temp_table"
+        stats.staged_logins = len(unique_usernames)
+        stats.staged_sids = len(sid_to_logins)
+        return sid_to_logins
+
+    @staticmethod
+    def _build_target_staging_batch(usernames: Sequence[str]) -> tuple[str, tuple[str, ...]]:
+        """构建暂存批: 建临时表, 参数化写入登录名, 由 server_principals 解析 SID, 返回登录名与 SID."""
+        inserts = [
+            f"INSERT INTO {_TARGET_LOGINS_TABLE} (login_name) VALUES "
+            + ", ".join(["(%s)"] * len(usernames[offset : offset + _STAGING_INSERT_CHUNK_SIZE]))
+            + ";"
+            for offset in range(0, len(usernames), _STAGING_INSERT_CHUNK_SIZE)
+        ]
+        sql = "\n".join(
+            [
+                "SET NOCOUNT ON;",
+                f"IF OBJECT_ID('tempdb..{_TARGET_LOGINS_TABLE}') IS NOT NULL DROP TABLE {_TARGET_LOGINS_TABLE};",
+                f"IF OBJECT_ID('tempdb..{_TARGET_SIDS_TABLE}') IS NOT NULL DROP TABLE {_TARGET_SIDS_TABLE};",
+                f"CREATE TABLE {_TARGET_LOGINS_TABLE} "
+                "(login_name NVARCHAR(128) COLLATE SQL_Latin1_General_CP1_CI_AS NOT NULL);",
+                f"CREATE TABLE {_TARGET_SIDS_TABLE} (sid_value VARBINARY(85) NOT NULL PRIMARY KEY);",
+                *inserts,
+                f"""
+                INSERT INTO {_TARGET_SIDS_TABLE} (sid_value)
+                SELECT DISTINCT sp.sid
+                FROM sys.server_principals sp
+                JOIN {_TARGET_LOGINS_TABLE} AS target_logins
+                  ON sp.name COLLATE SQL_Latin1_General_CP1_CI_AS = target_logins.login_name
+                WHERE sp.type IN ('S', 'U', 'G')
+                  AND sp.sid IS NOT NULL;
+                """.strip(),
+                f"""
+                SELECT DISTINCT sp.name, sp.sid
+                FROM sys.server_principals sp
+                JOIN {_TARGET_LOGINS_TABLE} AS target_logins
+                  ON sp.name COLLATE SQL_Latin1_General_CP1_CI_AS = target_logins.login_name
+                WHERE sp.type IN ('S', 'U', 'G')
+                """.strip(),
+            ],
+        )
+        return sql, tuple(usernames)
+
+    def _drop_staged_targets(self, connection: object) -> None:
+        """清理会话临时表(连接随同步结束关闭, 清理失败仅记录日志)."""
+        sql = f"""
+            SET NOCOUNT ON;
+            IF OBJECT_ID('tempdb..{_TARGET_LOGINS_TABLE}') IS NOT NULL DROP TABLE {_TARGET_LOGINS_TABLE};
+            IF OBJECT_ID('tempdb..{_TARGET_SIDS_TABLE}') IS NOT NULL DROP TABLE {_TARGET_SIDS_TABLE};
+            SELECT 1;
+        """
+        try:
+            self._get_connection(connection).execute_query(sql)
+        except SQLSERVER_ADAPTER_EXCEPTIONS as exc:
+            self.logger.warning(
+                "sqlserver_permission_target_cleanup_failed",
+                module="sqlserver_account_adapter",
+                error=str(exc),
+            )
+
     # ------------------------------------------------------------------
     # 查询逻辑来源于旧实现
     # ------------------------------------------------------------------
@@ -547,12 +868,19 @@ class SQLServerAccountAdapter(BaseAccountAdapter):
                 copied[db_name] = self._deduplicate_preserve_order(cast("Sequence[str]", perms))
         return copied
 
-    def _get_server_roles_bulk(self, connection: object, usernames: Sequence[str]) -> dict[str, list[str]]:
+    def _get_server_roles_bulk(
+        self,
+        connection: object,
+        usernames: Sequence[str],
+        *,
+        staged: bool = False,
+    ) -> dict[str, list[str]]:
         """批量查询服务器角色.
 
         Args:
             connection: SQL Server 连接.
             usernames: 登录名列表.
+            staged: 目标登录名已载入会话临时表时为 True.
 
         Returns:
             dict[str, list[str]]: 登录名到角色列表的映射.
@@ -563,13 +891,14 @@ class SQLServerAccountAdapter(BaseAccountAdapter):
             return {}
 
         sql = (
-            self._build_target_logins_cte(normalized)
-            + """
+            self._target_logins_prefix(normalized, staged=staged)
+            + f"""
             SELECT member.name AS login_name, role.name AS role_name
             FROM sys.server_role_members rm
             JOIN sys.server_principals role ON rm.role_principal_id = role.principal_id
             JOIN sys.server_principals member ON rm.member_principal_id = member.principal_id
-            JOIN target_logins ON member.name COLLATE SQL_Latin1_General_CP1_CI_AS = target_logins.login_name
+            JOIN {self._target_logins_source(staged=staged)} AS target_logins
+              ON member.name COLLATE SQL_Latin1_General_CP1_CI_AS = target_logins.login_name
         """
         )
         conn = self._get_connection(connection)
@@ -585,12 +914,19 @@ class SQLServerAccountAdapter(BaseAccountAdapter):
             result[login_name] = self._deduplicate_preserve_order(roles)
         return result
 
-    def _get_server_permissions_bulk(self, connection: object, usernames: Sequence[str]) -> dict[str, list[str]]:
+    def _get_server_permissions_bulk(
+        self,
+        connection: object,
+        usernames: Sequence[str],
+        *,
+        staged: bool = False,
+    ) -> dict[str, list[str]]:
         """批量查询服务器权限.
 
         Args:
             connection: SQL Server 连接.
             usernames: 登录名列表.
+            staged: 目标登录名已载入会话临时表时为 True.
 
         Returns:
             dict[str, list[str]]: 登录名到权限列表的映射.
@@ -601,12 +937,13 @@ class SQLServerAccountAdapter(BaseAccountAdapter):
             return {}
 
         sql = (
-            self._build_target_logins_cte(normalized)
-            + """
+            self._target_logins_prefix(normalized, staged=staged)
+            + f"""
             SELECT sp.name AS login_name, perm.permission_name
             FROM sys.server_permissions perm
             JOIN sys.server_principals sp ON perm.grantee_principal_id = sp.principal_id
-            JOIN target_logins ON sp.name COLLATE SQL_Latin1_General_CP1_CI_AS = target_logins.login_name
+            JOIN {self._target_logins_source(staged=staged)} AS target_logins
+              ON sp.name COLLATE SQL_Latin1_General_CP1_CI_AS = target_logins.login_name
         """
         )
         conn = self._get_connection(connection)
@@ -626,6 +963,9 @@ class SQLServerAccountAdapter(BaseAccountAdapter):
         self,
         connection: object,
         usernames: Sequence[str],
+        *,
+        staged_sid_to_logins: dict[bytes, list[str]] | None = None,
+        parallel: _ParallelBatchTarget | None = None,
     ) -> dict[str, JsonDict]:
         """批量查询所有用户的数据库权限(优化版).
 
@@ -635,6 +975,8 @@ class SQLServerAccountAdapter(BaseAccountAdapter):
         Args:
             connection: SQL Server 数据库连接对象.
             usernames: 用户名列表.
+            staged_sid_to_logins: 目标 SID 已载入会话临时表时传入其 SID 到登录名映射.
+            parallel: 允许按 SQLSERVER_PERMISSION_QUERY_CONCURRENCY 开启额外连接并发执行批次时传入.
 
         Returns:
             用户权限字典,键为登录名,值包含角色和权限信息.
@@ -661,24 +1003,30 @@ class SQLServerAccountAdapter(BaseAccountAdapter):
                 batch_size = len(database_list)
             database_batch_count = (len(database_list) + batch_size - 1) // batch_size
 
-            sid_to_logins, sid_literals = self._map_sids_to_logins(connection, usernames)
-            if sid_to_logins and sid_literals:
+            staged = staged_sid_to_logins is not None
+            if staged_sid_to_logins is not None:
+                sid_to_logins, sid_literals = staged_sid_to_logins, []
+            else:
+                sid_to_logins, sid_literals = self._map_sids_to_logins(connection, usernames)
+            if sid_to_logins and (staged or sid_literals):
                 unique_usernames = list(dict.fromkeys(usernames))
-                merged: dict[str, dict[str, Any]] = {
-                    login: {"roles": {}, "permissions": {}} for login in unique_usernames
-                }
-                for offset in range(0, len(database_list), batch_size):
-                    database_batch = database_list[offset : offset + batch_size]
-                    principal_sql, roles_sql, perms_sql = self._build_database_permission_queries(
-                        database_batch,
-                        sid_literals,
-                    )
-                    principal_rows, role_rows, permission_rows = self._fetch_principal_data(
-                        connection,
-                        principal_sql,
-                        roles_sql,
-                        perms_sql,
+                merged: dict[str, dict[str, Any]] = {login: {"roles": {}, "permissions": {}} for login in unique_usernames}
+
+                def _fetch_batch(batch_connection: object, database_batch: list[str]) -> _BatchRows:
+                    principal_sql, roles_sql, perms_sql = (
+                        self._build_staged_database_permission_queries(database_batch)
+                        if staged
+                        else self._build_database_permission_queries(database_batch, sid_literals)
                     )
+                    return self._fetch_principal_data(batch_connection, principal_sql, roles_sql, perms_sql)
+
+                batch_rows = self._run_database_batches(
+                    connection,
+                    self._split_database_batches(database_list, batch_size),
+                    _fetch_batch,
+                    parallel=parallel,
+                )
+                for principal_rows, role_rows, permission_rows in batch_rows:
                     principal_lookup = self._build_principal_lookup(principal_rows, sid_to_logins)
                     self._apply_role_rows(merged, role_rows, principal_lookup)
                     self._apply_permission_rows(merged, permission_rows, principal_lookup)
@@ -701,7 +1049,12 @@ class SQLServerAccountAdapter(BaseAccountAdapter):
                         },
                         logger_name="sync",
                     )
-                    result = self._get_database_permissions_by_name(connection, usernames, database_list)
+                    result = self._get_database_permissions_by_name(
+                        connection,
+                        usernames,
+                        database_list,
+                        parallel=replace(parallel, staged_usernames=None) if parallel is not None else None,
+                    )
             else:
                 # 回退到基于用户名的查询,避免因无法读取 SID 而导致权限为空
                 log_fallback(
@@ -718,7 +1071,12 @@ class SQLServerAccountAdapter(BaseAccountAdapter):
                     },
                     logger_name="sync",
                 )
-                result = self._get_database_permissions_by_name(connection, usernames, database_list)
+                result = self._get_database_permissions_by_name(
+                    connection,
+                    usernames,
+                    database_list,
+                    parallel=replace(parallel, staged_usernames=None) if parallel is not None else None,
+                )
 
             elapsed = time.perf_counter() - start_time
         except SQLSERVER_ADAPTER_EXCEPTIONS as exc:
@@ -741,6 +1099,103 @@ class SQLServerAccountAdapter(BaseAccountAdapter):
             )
             return result
 
+    @staticmethod
+    def _split_database_batches(database_list: list[str], batch_size: int) -> list[list[str]]:
+        return [database_list[offset : offset + batch_size] for offset in range(0, len(database_list), batch_size)]
+
+    def _run_database_batches(
+        self,
+        connection: object,
+        database_batches: list[list[str]],
+        fetch_batch: Callable[[object, list[str]], _BatchRows],
+        *,
+        parallel: _ParallelBatchTarget | None,
+    ) -> list[_BatchRows]:
+        """执行各数据库批次的权限查询, 结果按批次顺序返回.
+
+        并发时每个批次独占一条连接执行, 结果仍按批次顺序合并, 保证输出顺序与串行一致.
+        """
+        worker_count = min(self._database_batch_concurrency, len(database_batches))
+        extra_connections = (
+            self._open_batch_connections(parallel, worker_count - 1)
+            if parallel is not None and worker_count > 1
+            else []
+        )
+        if parallel is None or not extra_connections:
+            return [fetch_batch(connection, database_batch) for database_batch in database_batches]
+
+        available: SimpleQueue[object] = SimpleQueue()
+        available.put(connection)
+        for extra in extra_connections:
+            available.put(extra.timed)
+
+        def _run(database_batch: list[str]) -> _BatchRows:
+            batch_connection = available.get()
+            try:
+                return fetch_batch(batch_connection, database_batch)
+            finally:
+                available.put(batch_connection)
+
+        try:
+            with ThreadPoolExecutor(
+                max_workers=len(extra_connections) + 1,
+                thread_name_prefix="sqlserver-permission-batch",
+            ) as executor:
+                return list(executor.map(_run, database_batches))
+        finally:
+            self._close_batch_connections(extra_connections, parallel.stats)
+
+    def _open_batch_connections(self, parallel: _ParallelBatchTarget, count: int) -> list[_BatchConnection]:
+        """为并发批次额外打开连接(暂存模式下同步载入临时表), 打开失败时以已打开的连接数继续."""
+        opened: list[_BatchConnection] = []
+        for _ in range(count):
+            batch_connection = self._open_batch_connection(parallel)
+            if batch_connection is None:
+                break
+            opened.append(batch_connection)
+        if len(opened) < count:
+            log_fallback(
+                "warning",
+                "sqlserver_permission_batch_connections_limited",
+                module="sqlserver_account_adapter",
+                action="open_batch_connections",
+                fallback_reason="batch_connection_unavailable",
+                context={"instance": parallel.instance.name, "requested": count, "opened": len(opened)},
+                logger_name="sync",
+            )
+        return opened
+
+    def _open_batch_connection(self, parallel: _ParallelBatchTarget) -> _BatchConnection | None:
+        try:
+            connection = ConnectionFactory.create_connection(parallel.instance)
+            if connection is None or not connection.connect():
+                return None
+        except SQLSERVER_ADAPTER_EXCEPTIONS:
+            return None
+        stats = SQLServerPermissionQueryStats()
+        batch_connection = _BatchConnection(
+            connection=connection,
+            timed=TimedSQLServerConnection(connection, stats).start(),
+            stats=stats,
+        )
+        if parallel.staged_usernames is not None and (
+            self._stage_permission_targets(batch_connection.timed, parallel.staged_usernames, stats) is None
+        ):
+            self._close_batch_connections([batch_connection], None)
+            return None
+        return batch_connection
+
+    def _close_batch_connections(
+        self,
+        batch_connections: list[_BatchConnection],
+        stats: SQLServerPermissionQueryStats | None,
+    ) -> None:
+        for batch_connection in batch_connections:
+            batch_connection.timed.stop()
+            batch_connection.connection.disconnect()
+            if stats is not None:
+                stats.merge(batch_connection.stats)
+
     @staticmethod
     def _normalize_sid(raw_sid: object) -> bytes | None:
         """标准化 SID 字节串.
@@ -824,6 +1279,15 @@ class SQLServerAccountAdapter(BaseAccountAdapter):
             + "\n"
         )
 
+    @classmethod
+    def _target_logins_prefix(cls, usernames: Sequence[str], *, staged: bool) -> str:
+        """内联模式返回 target_logins CTE, 暂存模式无需前缀."""
+        return "" if staged else cls._build_target_logins_cte(usernames)
+
+    @staticmethod
+    def _target_logins_source(*, staged: bool) -> str:
+        return _TARGET_LOGINS_TABLE if staged else "target_logins"
+
     def _get_accessible_databases(self, connection: object) -> list[str]:
         """获取可访问数据库列表."""
         databases_sql = """
@@ -882,16 +1346,38 @@ class SQLServerAccountAdapter(BaseAccountAdapter):
     ) -> tuple[str, str, str]:
         """拼接查询数据库 principals/roles/permissions 的 SQL."""
         sid_cte = self._target_sid_cte(sid_literals)
-        templates = self._get_database_permission_templates()
-        principals_sql = self._compose_database_union(database_list, templates.principals)
-        roles_sql = self._compose_database_union(database_list, templates.roles)
-        perms_sql = self._compose_database_union(database_list, templates.permissions)
+        principals_sql, roles_sql, perms_sql = self._compose_database_permission_unions(database_list, "target_sids")
         return (
             sid_cte + "\n" + principals_sql,
             sid_cte + "\n" + roles_sql,
             sid_cte + "\n" + perms_sql,
         )
 
+    def _build_staged_database_permission_queries(self, database_list: list[str]) -> tuple[str, str, str]:
+        """拼接基于会话临时表的权限查询, SQL 文本只取决于数据库列表."""
+        return self._compose_database_permission_unions(database_list, _TARGET_SIDS_TABLE)
+
+    def _compose_database_permission_unions(
+        self,
+        database_list: list[str],
+        target_sids_source: str,
+    ) -> tuple[str, str, str]:
+        templates = self._get_database_permission_templates()
+        return (
+            self._compose_database_union(
+                database_list,
+                templates.principals.replace(_TARGET_SIDS_PLACEHOLDER, target_sids_source),
+            ),
+            self._compose_database_union(
+                database_list,
+                templates.roles.replace(_TARGET_SIDS_PLACEHOLDER, target_sids_source),
+            ),
+            self._compose_database_union(
+                database_list,
+                templates.permissions.replace(_TARGET_SIDS_PLACEHOLDER, target_sids_source),
+            ),
+        )
+
     @classmethod
     def _target_sid_cte(cls, sid_literals: Sequence[str]) -> str:
         """返回 target_sids 公共 CTE.
@@ -946,7 +1432,7 @@ class SQLServerAccountAdapter(BaseAccountAdapter):
                 FROM __DB_IDENTIFIER__.sys.database_principals
                 WHERE type IN ('S', 'U', 'G')
                   AND name != 'dbo'
-                  AND sid IN (SELECT sid_value FROM target_sids)
+                  AND sid IN (SELECT sid_value FROM __TARGET_SIDS__)
             """,
             roles="""
                 SELECT '__DB_LITERAL__' AS db_name,
@@ -957,7 +1443,7 @@ class SQLServerAccountAdapter(BaseAccountAdapter):
                   ON drm.role_principal_id = role.principal_id
                 JOIN __DB_IDENTIFIER__.sys.database_principals member
                   ON drm.member_principal_id = member.principal_id
-                WHERE member.sid IN (SELECT sid_value FROM target_sids)
+                WHERE member.sid IN (SELECT sid_value FROM __TARGET_SIDS__)
             """,
             permissions="""
                 SELECT '__DB_LITERAL__' AS db_name,
@@ -991,7 +1477,7 @@ class SQLServerAccountAdapter(BaseAccountAdapter):
                 JOIN __DB_IDENTIFIER__.sys.database_principals dp
                   ON perm.grantee_principal_id = dp.principal_id
                 WHERE perm.state = 'G'
-                  AND dp.sid IN (SELECT sid_value FROM target_sids)
+                  AND dp.sid IN (SELECT sid_value FROM __TARGET_SIDS__)
             """,
         )
 
@@ -1135,6 +1621,8 @@ class SQLServerAccountAdapter(BaseAccountAdapter):
         connection: object,
         usernames: Sequence[str],
         database_list: list[str],
+        *,
+        parallel: _ParallelBatchTarget | None = None,
     ) -> dict[str, JsonDict]:
         """基于用户名回退查询数据库权限,用于无法读取 SID 的场景."""
         unique_usernames = [name for name in dict.fromkeys(usernames) if name]
@@ -1146,18 +1634,21 @@ class SQLServerAccountAdapter(BaseAccountAdapter):
             batch_size = len(database_list)
 
         merged: dict[str, dict[str, Any]] = {login: {"roles": {}, "permissions": {}} for login in unique_usernames}
-        for offset in range(0, len(database_list), batch_size):
-            database_batch = database_list[offset : offset + batch_size]
+
+        def _fetch_batch(batch_connection: object, database_batch: list[str]) -> _BatchRows:
             principals_sql, roles_sql, perms_sql = self._build_db_permission_queries_by_name(
                 database_batch,
                 unique_usernames,
             )
-            principal_rows, role_rows, permission_rows = self._fetch_principal_data_by_name(
-                connection,
-                principals_sql,
-                roles_sql,
-                perms_sql,
-            )
+            return self._fetch_principal_data_by_name(batch_connection, principals_sql, roles_sql, perms_sql)
+
+        batch_rows = self._run_database_batches(
+            connection,
+            self._split_database_batches(database_list, batch_size),
+            _fetch_batch,
+            parallel=parallel,
+        )
+        for principal_rows, role_rows, permission_rows in batch_rows:
             principal_lookup = self._build_principal_lookup_by_name(principal_rows)
             self._apply_role_rows(merged, role_rows, principal_lookup)
             self._apply_permission_rows(merged, permission_rows, principal_lookup)
@@ -0,0 +1,166 @@
+"""SQL Server 权限采集查询统计(编译/执行耗时).
+
+职责:
+- 包装同步连接, 记录权限采集阶段的语句数与往返耗时
+- pymssql 连接可用时开启 ``SET STATISTICS TIME``, 解析服务端消息拆分编译与执行耗时
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from app.services.connection_adapters.adapters.sqlserver_adapter import SQLSERVER_CONNECTION_EXCEPTIONS
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from types import TracebackType
+
+    from app.core.types import JsonDict, JsonValue
+    from app.core.types.sync import SyncConnection
+    from app.services.connection_adapters.adapters.base import QueryParams
+
+_COMPILE_TIME_PATTERN = re.compile(
+    r"parse and compile time:\s*CPU time = (\d+) ms,\s*elapsed time = (\d+) ms",
+    re.IGNORECASE,
+)
+_EXECUTE_TIME_PATTERN = re.compile(
+    r"Execution Times:\s*CPU time = (\d+) ms,\s*elapsed time = (\d+) ms",
+    re.IGNORECASE,
+)
+
+
+@dataclass(slots=True)
+class SQLServerPermissionQueryStats:
+    """权限采集查询统计(target_mode 为 temp_table 或 inline)."""
+
+    target_mode: str = "inline"
+    connections: int = 1
+    staged_logins: int = 0
+    staged_sids: int = 0
+    staging_ms: float = 0.0
+    statements: int = 0
+    wall_ms: float = 0.0
+    compile_cpu_ms: int = 0
+    compile_elapsed_ms: int = 0
+    execute_cpu_ms: int = 0
+    execute_elapsed_ms: int = 0
+    statistics_captured: bool = False
+
+    def record_message(self, text: str) -> None:
+        """解析一条 STATISTICS TIME 消息."""
+        for cpu_ms, elapsed_ms in _COMPILE_TIME_PATTERN.findall(text):
+            self.compile_cpu_ms += int(cpu_ms)
+            self.compile_elapsed_ms += int(elapsed_ms)
+            self.statistics_captured = True
+        for cpu_ms, elapsed_ms in _EXECUTE_TIME_PATTERN.findall(text):
+            self.execute_cpu_ms += int(cpu_ms)
+            self.execute_elapsed_ms += int(elapsed_ms)
+            self.statistics_captured = True
+
+    def merge(self, other: SQLServerPermissionQueryStats) -> None:
+        """合并并发批次连接的统计."""
+        self.connections += other.connections
+        self.staging_ms += other.staging_ms
+        self.statements += other.statements
+        self.wall_ms += other.wall_ms
+        self.compile_cpu_ms += other.compile_cpu_ms
+        self.compile_elapsed_ms += other.compile_elapsed_ms
+        self.execute_cpu_ms += other.execute_cpu_ms
+        self.execute_elapsed_ms += other.execute_elapsed_ms
+        self.statistics_captured = self.statistics_captured or other.statistics_captured
+
+    def to_dict(self) -> JsonDict:
+        """输出为同步详情字段."""
+        return {
+            "target_mode": self.target_mode,
+            "connections": self.connections,
+            "staged_logins": self.staged_logins,
+            "staged_sids": self.staged_sids,
+            "staging_ms": round(self.staging_ms, 2),
+            "statements": self.statements,
+            "wall_ms": round(self.wall_ms, 2),
+            "compile_cpu_ms": self.compile_cpu_ms,
+            "compile_elapsed_ms": self.compile_elapsed_ms,
+            "execute_cpu_ms": self.execute_cpu_ms,
+            "execute_elapsed_ms": self.execute_elapsed_ms,
+            "statistics_captured": self.statistics_captured,
+        }
+
+
+class TimedSQLServerConnection:
+    """记录语句耗时并收集 STATISTICS TIME 消息的连接包装(上下文管理器)."""
+
+    def __init__(self, connection: SyncConnection, stats: SQLServerPermissionQueryStats) -> None:
+        """包装连接, 统计写入 stats."""
+        self._connection = connection
+        self._stats = stats
+        self._driver_connection: Any = None
+
+    def __enter__(self) -> TimedSQLServerConnection:
+        """开始统计."""
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """结束统计."""
+        self.stop()
+
+    def start(self) -> TimedSQLServerConnection:
+        """安装消息处理器并开启 STATISTICS TIME(驱动不支持时仅统计往返耗时)."""
+        driver_connection = getattr(getattr(self._connection, "connection", None), "_conn", None)
+        if driver_connection is None or not (
+            callable(getattr(driver_connection, "set_msghandler", None))
+            and callable(getattr(driver_connection, "execute_non_query", None))
+        ):
+            return self
+        driver_connection.set_msghandler(self._handle_message)
+        self._driver_connection = driver_connection
+        try:
+            driver_connection.execute_non_query("SET STATISTICS TIME ON")
+        except SQLSERVER_CONNECTION_EXCEPTIONS:
+            self._release()
+        return self
+
+    def stop(self) -> None:
+        """关闭 STATISTICS TIME 并卸载消息处理器."""
+        if self._driver_connection is None:
+            return
+        with suppress(*SQLSERVER_CONNECTION_EXCEPTIONS):
+            self._driver_connection.execute_non_query("SET STATISTICS TIME OFF")
+        self._release()
+
+    def connect(self) -> bool:
+        """建立连接(委托被包装连接)."""
+        return self._connection.connect()
+
+    def disconnect(self) -> None:
+        """断开连接(委托被包装连接)."""
+        self._connection.disconnect()
+
+    def execute_query(self, query: str, params: QueryParams = None) -> Iterable[Sequence[JsonValue]]:
+        """执行查询并累计语句数与往返耗时."""
+        started_at = time.perf_counter()
+        try:
+            if params is None:
+                return self._connection.execute_query(query)
+            return self._connection.execute_query(query, params)
+        finally:
+            self._stats.statements += 1
+            self._stats.wall_ms += (time.perf_counter() - started_at) * 1000
+
+    def _release(self) -> None:
+        self._driver_connection.set_msghandler(None)
+        self._driver_connection = None
+
+    def _handle_message(self, *args: object) -> None:
+        # pymssql 消息处理器参数: msgstate, severity, srvname, procname, line, msgtext
+        if args:
+            self._stats.record_message(str(args[-1]))
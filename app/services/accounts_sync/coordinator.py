@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
+import json
 from contextlib import AbstractContextManager
 from typing import TYPE_CHECKING, Self
 
+from app.services.accounts_sync.adapters.base_adapter import build_permission_fingerprint
 from app.services.accounts_sync.adapters.factory import get_account_adapter
 from app.services.accounts_sync.inventory_manager import AccountInventoryManager
 from app.services.accounts_sync.permission_manager import AccountPermissionManager, PermissionSyncError
 from app.services.connection_adapters.adapters.base import ConnectionAdapterError
 from app.services.connection_adapters.connection_factory import ConnectionFactory
 from app.utils.structlog_config import get_sync_logger
+from app.utils.time_utils import time_utils
 
 if TYPE_CHECKING:
     from types import TracebackType
@@ -67,6 +70,8 @@ class AccountSyncCoordinator(AbstractContextManager["AccountSyncCoordinator"]):
         self._cached_accounts: list[RemoteAccount] | None = None
         self._active_accounts_cache: list[InstanceAccount] | None = None
         self._enriched_usernames: set[str] = set()
+        self._permission_fingerprints: dict[str, str] = {}
+        self._fingerprint_unchanged_usernames: set[str] = set()
         self._connection_failed = False
         self._connection_error: str | None = None
 
@@ -256,6 +261,8 @@ class AccountSyncCoordinator(AbstractContextManager["AccountSyncCoordinator"]):
             raw_accounts = self._adapter.fetch_remote_accounts(self.instance, self._connection)
             self._cached_accounts = list(raw_accounts)
             self._enriched_usernames.clear()
+            self._permission_fingerprints.clear()
+            self._fingerprint_unchanged_usernames.clear()
             self.logger.info(
                 "accounts_sync_fetch_remote_accounts_completed",
                 module=MODULE,
@@ -318,7 +325,8 @@ class AccountSyncCoordinator(AbstractContextManager["AccountSyncCoordinator"]):
 
         如果清单阶段未执行,会先自动执行清单同步.
         只为活跃账户同步权限信息,跳过非活跃账户.
-        按需补全权限信息(enrich_permissions),避免重复获取.
+        按需补全权限信息(enrich_permissions),避免重复获取;
+        适配器支持权限指纹时, 指纹未变化且全量比对未过期的账户跳过补全与比对.
 
         Args:
             session_id: 可选的同步会话 ID,用于关联日志和错误追踪.
@@ -387,12 +395,17 @@ class AccountSyncCoordinator(AbstractContextManager["AccountSyncCoordinator"]):
             self._ensure_connection()
             if self._cached_accounts is None:
                 self._cached_accounts = remote_accounts
-            self._cached_accounts = self._adapter.enrich_permissions(
-                self.instance,
-                self._connection,
-                self._cached_accounts,
-                usernames=pending_usernames,
-            )
+            self._collect_permission_fingerprints(active_accounts, pending_usernames)
+            enrich_usernames = [
+                username for username in pending_usernames if username not in self._fingerprint_unchanged_usernames
+            ]
+            if enrich_usernames:
+                self._cached_accounts = self._adapter.enrich_permissions(
+                    self.instance,
+                    self._connection,
+                    self._cached_accounts,
+                    usernames=enrich_usernames,
+                )
             enriched_usernames.update(pending_usernames)
             self._enriched_usernames = enriched_usernames
 
@@ -402,6 +415,8 @@ class AccountSyncCoordinator(AbstractContextManager["AccountSyncCoordinator"]):
                 remote_accounts,
                 active_accounts,
                 session_id=session_id,
+                fingerprints=self._permission_fingerprints,
+                unchanged_usernames=self._fingerprint_unchanged_usernames,
             )
         except PermissionSyncError as exc:
             error_summary = exc.summary
@@ -429,6 +444,11 @@ class AccountSyncCoordinator(AbstractContextManager["AccountSyncCoordinator"]):
             "errors": summary.get("errors", []),
             "message": ("" if summary.get("message") is None else str(summary.get("message"))),
         }
+        if self._permission_fingerprints:
+            collection_summary["fingerprint_unchanged"] = len(self._fingerprint_unchanged_usernames)
+        query_stats = self._adapter.get_permission_query_stats()
+        if query_stats:
+            collection_summary["query_stats"] = query_stats
         self.logger.info(
             "accounts_sync_collection_completed",
             module=MODULE,
@@ -439,6 +459,45 @@ class AccountSyncCoordinator(AbstractContextManager["AccountSyncCoordinator"]):
         )
         return collection_summary
 
+    def _collect_permission_fingerprints(
+        self,
+        active_accounts: list[InstanceAccount],
+        usernames: list[str],
+    ) -> None:
+        """计算待补全账户的权限指纹, 并找出可跳过补全的账户.
+
+        记录的指纹 = 适配器远端授权摘要 + 补全前的账户清单字段(锁定状态、type_specific 等),
+        两者任一变化都会触发补全.
+        """
+        remote_fingerprints = self._adapter.fetch_permission_fingerprints(self.instance, self._connection, usernames)
+        if not remote_fingerprints:
+            return
+        remote_by_username = {account.get("username"): account for account in self._cached_accounts or []}
+        fingerprints: dict[str, str] = {}
+        for username, remote_fingerprint in remote_fingerprints.items():
+            remote = remote_by_username.get(username)
+            if remote is None:
+                continue
+            fingerprints[username] = build_permission_fingerprint(
+                [remote_fingerprint, json.dumps(remote, sort_keys=True, default=str)],
+            )
+        self._permission_fingerprints.update(fingerprints)
+        unchanged = self._permission_manager.find_unchanged_usernames(
+            active_accounts,
+            fingerprints,
+            now=time_utils.now(),
+        )
+        self._fingerprint_unchanged_usernames.update(unchanged)
+        self.logger.info(
+            "accounts_sync_permission_fingerprints_compared",
+            module=MODULE,
+            phase="collection",
+            instance_id=self.instance.id,
+            instance_name=self.instance.name,
+            fingerprinted=len(fingerprints),
+            unchanged=len(unchanged),
+        )
+
     def sync_all(self, *, session_id: str | None = None) -> SyncStagesSummary:
         """执行完整的两阶段同步流程.
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from sqlalchemy.exc import SQLAlchemyError
@@ -15,6 +16,7 @@ from app.utils.time_utils import time_utils
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
+    from datetime import datetime
 
     from app.core.types import RemoteAccount
     from app.models.instance import Instance
@@ -23,6 +25,36 @@ OwnerKey = tuple[str, int | None, str, str]
 OwnerScope = tuple[str, int | None, str]
 
 
+@dataclass(slots=True)
+class _PlannedAccount:
+    """单个账户键的同步计划(record_id 为 None 表示待新增)."""
+
+    record_id: int | None
+    username: str
+    is_active: bool
+    fields: dict[str, object] = field(default_factory=dict)
+    original_fields: dict[str, object] = field(default_factory=dict)
+    reactivated: bool = False
+
+    @property
+    def drifted(self) -> bool:
+        """归属字段是否与库中记录不一致."""
+        return self.fields != self.original_fields
+
+
+@dataclass(slots=True)
+class _InventoryPlan:
+    """一次清单同步的内存计划."""
+
+    accounts: dict[OwnerKey, _PlannedAccount] = field(default_factory=dict)
+    active_keys: list[OwnerKey] = field(default_factory=list)
+    seen_owner_keys: set[OwnerKey] = field(default_factory=set)
+    sync_owner_scopes: set[OwnerScope] = field(default_factory=set)
+    created_usernames: list[str] = field(default_factory=list)
+    reactivated_usernames: list[str] = field(default_factory=list)
+    refreshed: int = 0
+
+
 class AccountInventoryManager:
     """维护 InstanceAccount 清单同步的管理器.
 
@@ -44,7 +76,7 @@ class AccountInventoryManager:
         self._repository = repository or AccountsSyncRepository()
         self._write_repository = write_repository or InstanceAccountsWriteRepository()
 
-    def synchronize(  # noqa: PLR0915
+    def synchronize(
         self,
         instance: Instance,
         remote_accounts: Iterable[RemoteAccount],
@@ -85,81 +117,30 @@ class AccountInventoryManager:
         remote_accounts, now_ts = list(remote_accounts), time_utils.now()
 
         remote_owner_scopes = self._owner_scopes_from_remote_accounts(instance, remote_accounts)
-        existing_accounts = self._list_existing_accounts_for_sync(instance, remote_owner_scopes)
+        extra_owners = {
+            (owner_type, owner_id) for owner_type, owner_id, _ in remote_owner_scopes if owner_type != "instance"
+        }
+        existing_accounts = self._repository.list_instance_accounts_for_sync(
+            instance_id=instance.id,
+            owners=extra_owners,
+        )
         existing_map = {self._owner_key_from_record(instance, account): account for account in existing_accounts}
 
-        seen_owner_keys: set[OwnerKey] = set()
-        sync_owner_scopes: set[OwnerScope] = set()
-        created = reactivated = refreshed = deactivated = 0
-        created_usernames: list[str] = []
-        reactivated_usernames: list[str] = []
+        plan = self._plan_inventory_changes(instance, remote_accounts, existing_map)
+        deactivate_ids = self._collect_deactivated_ids(instance, existing_accounts, plan)
 
         active_accounts: list[InstanceAccount] = []
-
         try:
             with db.session.begin_nested():
-                for item in remote_accounts:
-                    username = str(item.get("username", "")).strip()
-                    if not username:
-                        continue
-
-                    is_active = bool(item.get("is_active", True))
-                    db_type = (item.get("db_type") or instance.db_type).lower()
-                    owner_type, owner_id, cluster_id, availability_group_id = self._owner_fields_from_remote(
-                        instance,
-                        item,
+                self._apply_inventory_plan(instance, plan, deactivate_ids, now_ts)
+                if plan.active_keys:
+                    reloaded = self._repository.list_instance_accounts_for_sync(
+                        instance_id=instance.id,
+                        owners=extra_owners,
+                        refresh=True,
                     )
-                    owner_key = (owner_type, owner_id, db_type, username)
-                    owner_scope = (owner_type, owner_id, db_type)
-                    seen_owner_keys.add(owner_key)
-                    sync_owner_scopes.add(owner_scope)
-
-                    record = existing_map.get(owner_key)
-                    if record:
-                        record.updated_at = now_ts
-                        record.db_type = db_type
-                        record.owner_type = owner_type
-                        record.owner_id = owner_id
-                        record.cluster_id = cluster_id
-                        record.availability_group_id = availability_group_id
-                        if not record.is_active and is_active:
-                            record.is_active = True
-                            record.deleted_at = None
-                            reactivated += 1
-                            reactivated_usernames.append(username)
-                        else:
-                            refreshed += 1
-                    else:
-                        record = InstanceAccount()
-                        record.instance_id = instance.id
-                        record.username = username
-                        record.db_type = db_type
-                        record.owner_type = owner_type
-                        record.owner_id = owner_id
-                        record.cluster_id = cluster_id
-                        record.availability_group_id = availability_group_id
-                        record.is_active = is_active
-                        self._write_repository.add(record)
-                        existing_map[owner_key] = record
-                        created += 1
-                        created_usernames.append(username)
-
-                    if is_active:
-                        active_accounts.append(record)
-
-                if not sync_owner_scopes:
-                    sync_owner_scopes.add(("instance", instance.id, instance.db_type.lower()))
-
-                for record in existing_accounts:
-                    record_scope = self._owner_scope_from_record(instance, record)
-                    record_key = self._owner_key_from_record(instance, record)
-                    if record_scope in sync_owner_scopes and record_key not in seen_owner_keys and record.is_active:
-                        record.is_active = False
-                        record.deleted_at = now_ts
-                        record.updated_at = now_ts
-                        deactivated += 1
-
-                self._write_repository.flush()
+                    reloaded_map = {self._owner_key_from_record(instance, account): account for account in reloaded}
+                    active_accounts = [reloaded_map[key] for key in plan.active_keys if key in reloaded_map]
         except SQLAlchemyError as exc:
             self.logger.exception(
                 "account_inventory_sync_flush_failed",
@@ -171,6 +152,8 @@ class AccountInventoryManager:
             )
             raise
 
+        created, reactivated = len(plan.created_usernames), len(plan.reactivated_usernames)
+        refreshed, deactivated = plan.refreshed, len(deactivate_ids)
         summary = {
             "created": created,
             "refreshed": refreshed,
@@ -179,8 +162,8 @@ class AccountInventoryManager:
             "active_count": len(active_accounts),
             "total_remote": len(remote_accounts),
             "processed_records": created + refreshed + reactivated,
-            "created_accounts": created_usernames,
-            "reactivated_accounts": reactivated_usernames,
+            "created_accounts": plan.created_usernames,
+            "reactivated_accounts": plan.reactivated_usernames,
         }
 
         self.logger.info(
@@ -215,29 +198,141 @@ class AccountInventoryManager:
             int(availability_group_id) if availability_group_id is not None else None,
         )
 
-    def _list_existing_accounts_for_sync(
-        self,
+    @classmethod
+    def _plan_inventory_changes(
+        cls,
         instance: Instance,
-        remote_owner_scopes: set[OwnerScope],
-    ) -> list[InstanceAccount]:
-        existing_accounts = self._repository.list_instance_accounts(instance_id=instance.id)
-        seen_ids = {account.id for account in existing_accounts if account.id is not None}
-
-        for owner_type, owner_id, _db_type in remote_owner_scopes:
-            if owner_type == "instance":
+        remote_accounts: list[RemoteAccount],
+        existing_map: dict[OwnerKey, InstanceAccount],
+    ) -> _InventoryPlan:
+        """在内存中按远端顺序计算新增/重新激活/刷新集合, 统计口径与逐条处理一致."""
+        plan = _InventoryPlan()
+        for item in remote_accounts:
+            username = str(item.get("username", "")).strip()
+            if not username:
                 continue
 
-            for account in self._repository.list_instance_accounts_by_owner(
-                owner_type=owner_type,
-                owner_id=owner_id,
-            ):
-                if account.id in seen_ids:
+            is_active = bool(item.get("is_active", True))
+            db_type = (item.get("db_type") or instance.db_type).lower()
+            owner_type, owner_id, cluster_id, availability_group_id = cls._owner_fields_from_remote(instance, item)
+            owner_key = (owner_type, owner_id, db_type, username)
+            plan.seen_owner_keys.add(owner_key)
+            plan.sync_owner_scopes.add((owner_type, owner_id, db_type))
+
+            fields = cls._owner_field_values(db_type, owner_type, owner_id, cluster_id, availability_group_id)
+            planned = plan.accounts.get(owner_key)
+            if planned is None:
+                record = existing_map.get(owner_key)
+                if record is None:
+                    plan.accounts[owner_key] = _PlannedAccount(
+                        record_id=None,
+                        username=username,
+                        is_active=is_active,
+                        fields=fields,
+                    )
+                    plan.created_usernames.append(username)
+                    if is_active:
+                        plan.active_keys.append(owner_key)
                     continue
-                existing_accounts.append(account)
-                if account.id is not None:
-                    seen_ids.add(account.id)
+                planned = _PlannedAccount(
+                    record_id=record.id,
+                    username=username,
+                    is_active=bool(record.is_active),
+                    original_fields=cls._owner_field_values(
+                        record.db_type,
+                        record.owner_type,
+                        record.owner_id,
+                        record.cluster_id,
+                        record.availability_group_id,
+                    ),
+                )
+                plan.accounts[owner_key] = planned
+
+            planned.fields = fields
+            if not planned.is_active and is_active:
+                planned.is_active = True
+                planned.reactivated = True
+                plan.reactivated_usernames.append(username)
+            else:
+                plan.refreshed += 1
+            if is_active:
+                plan.active_keys.append(owner_key)
+
+        if not plan.sync_owner_scopes:
+            plan.sync_owner_scopes.add(("instance", instance.id, instance.db_type.lower()))
+        return plan
 
-        return existing_accounts
+    @classmethod
+    def _collect_deactivated_ids(
+        cls,
+        instance: Instance,
+        existing_accounts: list[InstanceAccount],
+        plan: _InventoryPlan,
+    ) -> list[int]:
+        """本次同步范围内、远端已不存在的活跃账户."""
+        return [
+            record.id
+            for record in existing_accounts
+            if record.is_active
+            and cls._owner_scope_from_record(instance, record) in plan.sync_owner_scopes
+            and cls._owner_key_from_record(instance, record) not in plan.seen_owner_keys
+        ]
+
+    def _apply_inventory_plan(
+        self,
+        instance: Instance,
+        plan: _InventoryPlan,
+        deactivate_ids: list[int],
+        now_ts: datetime,
+    ) -> None:
+        """以批量语句写入清单变更(插入/字段更新/重新激活/刷新/停用)."""
+        insert_rows: list[dict[str, object]] = []
+        drift_rows: list[dict[str, object]] = []
+        reactivate_ids: list[int] = []
+        touch_ids: list[int] = []
+        for planned in plan.accounts.values():
+            if planned.record_id is None:
+                insert_rows.append(
+                    {
+                        "instance_id": instance.id,
+                        "username": planned.username,
+                        **planned.fields,
+                        "is_active": planned.is_active,
+                        "deleted_at": None,
+                        "created_at": now_ts,
+                        "updated_at": now_ts,
+                    },
+                )
+                continue
+            if planned.drifted:
+                drift_rows.append({"id": planned.record_id, **planned.fields, "updated_at": now_ts})
+            if planned.reactivated:
+                reactivate_ids.append(planned.record_id)
+            elif not planned.drifted:
+                touch_ids.append(planned.record_id)
+
+        if insert_rows:
+            self._write_repository.insert_missing(insert_rows)
+        self._write_repository.update_rows(drift_rows)
+        self._write_repository.reactivate(reactivate_ids, updated_at=now_ts)
+        self._write_repository.touch(touch_ids, updated_at=now_ts)
+        self._write_repository.deactivate(deactivate_ids, deleted_at=now_ts)
+
+    @staticmethod
+    def _owner_field_values(
+        db_type: str,
+        owner_type: str,
+        owner_id: int | None,
+        cluster_id: int | None,
+        availability_group_id: int | None,
+    ) -> dict[str, object]:
+        return {
+            "db_type": db_type,
+            "owner_type": owner_type,
+            "owner_id": owner_id,
+            "cluster_id": cluster_id,
+            "availability_group_id": availability_group_id,
+        }
 
     @classmethod
     def _owner_scopes_from_remote_accounts(
@@ -4,8 +4,10 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from dataclasses import dataclass
+from datetime import timedelta
 from typing import TYPE_CHECKING, cast
 
+from flask import current_app, has_app_context
 from sqlalchemy.exc import SQLAlchemyError
 
 from app import db
@@ -17,11 +19,13 @@ from app.schemas.internal_contracts.account_change_log_diff_v1 import wrap_entri
 from app.schemas.internal_contracts.type_specific_v1 import normalize_type_specific_v1
 from app.services.accounts_permissions.facts_builder import build_permission_facts
 from app.services.accounts_permissions.snapshot_view import build_permission_snapshot_view
+from app.settings import DEFAULT_ACCOUNT_PERMISSION_FULL_SYNC_INTERVAL_HOURS
 from app.utils.structlog_config import get_sync_logger
 from app.utils.time_utils import time_utils
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Sequence
+    from collections.abc import Collection, Iterable, Sequence
+    from datetime import datetime
 
     from app.core.types import (
         JsonDict,
@@ -103,6 +107,7 @@ class SyncContext:
     username: str
     session_id: str | None
     account: InstanceAccount | None = None
+    fingerprint: str | None = None
 
 
 OwnerKey = tuple[str, int | None, str, str]
@@ -151,6 +156,8 @@ class AccountPermissionManager:
         active_accounts: list[InstanceAccount],
         *,
         session_id: str | None = None,
+        fingerprints: Mapping[str, str] | None = None,
+        unchanged_usernames: Collection[str] = (),
     ) -> SyncSummary:
         """同步账户权限数据.
 
@@ -165,6 +172,8 @@ class AccountPermissionManager:
                 is_superuser、is_locked 等字段.
             active_accounts: 活跃的 InstanceAccount 对象列表.
             session_id: 同步会话 ID,可选.
+            fingerprints: 本次计算的远端权限指纹(用户名 -> 指纹),随权限一并写入记录.
+            unchanged_usernames: 指纹未变化、未补全权限的账户,只刷新同步时间并计入 skipped.
 
         Returns:
             同步统计信息字典,包含以下字段:
@@ -188,6 +197,7 @@ class AccountPermissionManager:
         }
         counts = {"created": 0, "updated": 0, "skipped": 0}
         errors: list[str] = []
+        unchanged_account_ids: list[int] = []
 
         try:
             with db.session.begin_nested():
@@ -196,12 +206,17 @@ class AccountPermissionManager:
                     if not remote:
                         counts["skipped"] += 1
                         continue
+                    if account.username in unchanged_usernames:
+                        unchanged_account_ids.append(account.id)
+                        counts["skipped"] += 1
+                        continue
 
                     context = SyncContext(
                         instance=instance,
                         account=account,
                         username=account.username,
                         session_id=session_id,
+                        fingerprint=self._resolve_fingerprint(remote, fingerprints),
                     )
                     outcome = self._sync_single_account(account, remote, context)
                     counts["created"] += outcome.created
@@ -210,6 +225,7 @@ class AccountPermissionManager:
                     if outcome.error:
                         errors.append(outcome.error)
 
+                self._mark_unchanged_synced(unchanged_account_ids)
                 db.session.flush()
         except SQLAlchemyError as exc:
             self.logger.exception(
@@ -224,9 +240,67 @@ class AccountPermissionManager:
 
         return self._finalize_summary(instance, session_id, counts, errors)
 
+    def find_unchanged_usernames(
+        self,
+        active_accounts: Iterable[InstanceAccount],
+        fingerprints: Mapping[str, str],
+        *,
+        now: datetime,
+    ) -> set[str]:
+        """返回指纹与记录一致且全量比对未过期的账户, 这些账户可跳过权限补全与比对."""
+        accounts_by_id = {account.id: account for account in active_accounts if account.username in fingerprints}
+        full_sync_interval = self._full_sync_interval()
+        unchanged: set[str] = set()
+        stored = self._repository.list_permission_fingerprints(list(accounts_by_id))
+        for instance_account_id, (fingerprint, full_synced_at) in stored.items():
+            account = accounts_by_id.get(instance_account_id)
+            if account is None or full_synced_at is None or fingerprints.get(account.username) != fingerprint:
+                continue
+            synced_at = full_synced_at if full_synced_at.tzinfo else full_synced_at.replace(tzinfo=now.tzinfo)
+            if now - synced_at < full_sync_interval:
+                unchanged.add(account.username)
+        return unchanged
+
     # ------------------------------------------------------------------
     # 内部工具
     # ------------------------------------------------------------------
+    @staticmethod
+    def _full_sync_interval() -> timedelta:
+        hours = (
+            current_app.config.get(
+                "ACCOUNT_PERMISSION_FULL_SYNC_INTERVAL_HOURS",
+                DEFAULT_ACCOUNT_PERMISSION_FULL_SYNC_INTERVAL_HOURS,
+            )
+            if has_app_context()
+            else DEFAULT_ACCOUNT_PERMISSION_FULL_SYNC_INTERVAL_HOURS
+        )
+        return timedelta(hours=max(int(hours), 1))
+
+    @staticmethod
+    def _resolve_fingerprint(remote: RemoteAccount, fingerprints: Mapping[str, str] | None) -> str | None:
+        """补全失败(permissions.errors 非空)的账户不记录指纹, 下次同步强制重新补全."""
+        if not fingerprints:
+            return None
+        permissions = remote.get("permissions")
+        if isinstance(permissions, dict) and permissions.get("errors"):
+            return None
+        return fingerprints.get(str(remote.get("username") or ""))
+
+    @staticmethod
+    def _apply_fingerprint(record: AccountPermission, context: SyncContext) -> None:
+        record.permission_fingerprint = context.fingerprint
+        record.permission_full_synced_at = time_utils.now() if context.fingerprint else None
+
+    @staticmethod
+    def _mark_unchanged_synced(instance_account_ids: list[int]) -> None:
+        """批量刷新指纹未变化账户的同步时间."""
+        if not instance_account_ids:
+            return
+        AccountPermission.query.filter(AccountPermission.instance_account_id.in_(instance_account_ids)).update(
+            {AccountPermission.last_sync_time: time_utils.now()},
+            synchronize_session=False,
+        )
+
     def _sync_single_account(
         self,
         account: InstanceAccount,
@@ -272,6 +346,7 @@ class AccountPermissionManager:
         snapshot: RemoteAccountSnapshot,
         context: SyncContext,
     ) -> SyncOutcome:
+        self._apply_fingerprint(record, context)
         diff = self._calculate_diff(
             record,
             snapshot.permissions,
@@ -329,6 +404,7 @@ class AccountPermissionManager:
         record.last_change_type = "add"
         record.last_change_time = time_utils.now()
         record.last_sync_time = time_utils.now()
+        self._apply_fingerprint(record, context)
         db.session.add(record)
 
         try:
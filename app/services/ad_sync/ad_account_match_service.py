@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import cast
 
-from sqlalchemy import func
+from sqlalchemy import func, or_
 
 from app.models.ad_domain_config import AdDomainConfig
 from app.models.instance_account import InstanceAccount
@@ -28,6 +29,7 @@ class AdAccountMatchService:
     """将 AD 主体状态更新到 SQL Server InstanceAccount 风险标记."""
 
     SUPPORTED_OWNER_TYPES = ("instance", "sqlserver_ag")
+    LOOKUP_BATCH_SIZE = 1000
 
     def match_and_update(
         self,
@@ -36,7 +38,54 @@ class AdAccountMatchService:
         principals: dict[str, AdPrincipal],
     ) -> AdDomainMatchResult:
         """匹配并更新该域的 SQL Server 域账户."""
-        accounts = self._list_domain_accounts(domain_config)
+        return self._apply_principals(
+            self._list_domain_accounts(domain_config),
+            domain_config=domain_config,
+            principals=principals,
+        )
+
+    def match_and_update_changes(
+        self,
+        *,
+        domain_config: AdDomainConfig,
+        principals: dict[str, AdPrincipal],
+        deleted_names: Iterable[str] = (),
+        lookup_names: Iterable[str] = (),
+    ) -> AdDomainMatchResult:
+        """增量匹配: 仅更新变更/删除/补查主体对应的域账户(principals 中不存在的名称视为已删除)."""
+        affected_names = {
+            str(name).strip().lower()
+            for name in (*principals.keys(), *deleted_names, *lookup_names)
+            if str(name).strip()
+        }
+        return self._apply_principals(
+            self._list_domain_accounts_by_names(domain_config, affected_names),
+            domain_config=domain_config,
+            principals=principals,
+        )
+
+    @classmethod
+    def list_unmatched_account_names(cls, domain_config: AdDomainConfig) -> set[str]:
+        """尚未与该域匹配过的域账户名称(增量同步时需按名称补查 AD 主体)."""
+        netbios_name = str(domain_config.netbios_name)
+        rows = InstanceAccount.query.with_entities(InstanceAccount.username).filter(
+            func.lower(InstanceAccount.db_type) == "sqlserver",
+            cls._domain_username_prefix_clause(netbios_name),
+            InstanceAccount.owner_type.in_(cls.SUPPORTED_OWNER_TYPES),
+            or_(
+                InstanceAccount.ad_domain_config_id.is_(None),
+                InstanceAccount.ad_domain_config_id != domain_config.id,
+            ),
+        )
+        return {cls._extract_name_part(str(username), netbios_name) for (username,) in rows}
+
+    def _apply_principals(
+        self,
+        accounts: list[InstanceAccount],
+        *,
+        domain_config: AdDomainConfig,
+        principals: dict[str, AdPrincipal],
+    ) -> AdDomainMatchResult:
         now = time_utils.now()
         normal = disabled = orphaned = updated = 0
 
@@ -84,6 +133,21 @@ class AdAccountMatchService:
             ).all(),
         )
 
+    @classmethod
+    def _list_domain_accounts_by_names(cls, domain_config: AdDomainConfig, names: set[str]) -> list[InstanceAccount]:
+        prefix = f"{str(domain_config.netbios_name).strip().lower()}\\"
+        usernames = sorted(f"{prefix}{name}" for name in names)
+        accounts: list[InstanceAccount] = []
+        for start in range(0, len(usernames), cls.LOOKUP_BATCH_SIZE):
+            accounts.extend(
+                InstanceAccount.query.filter(
+                    func.lower(InstanceAccount.db_type) == "sqlserver",
+                    func.lower(InstanceAccount.username).in_(usernames[start : start + cls.LOOKUP_BATCH_SIZE]),
+                    InstanceAccount.owner_type.in_(cls.SUPPORTED_OWNER_TYPES),
+                ).all()
+            )
+        return accounts
+
     @staticmethod
     def _domain_username_prefix_clause(netbios_name: str):
         prefix = f"{str(netbios_name).strip().lower()}\\"
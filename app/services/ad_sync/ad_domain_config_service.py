@@ -50,8 +50,13 @@ class AdDomainConfigService:
         config = self._get_or_error(config_id)
         self._ensure_credential(payload.credential_id)
         self._ensure_netbios_available(payload.netbios_name, exclude_id=config.id, is_enabled=payload.is_enabled)
+        previous_scope = (config.netbios_name, config.base_dn)
         for key, value in payload.model_dump().items():
             setattr(config, key, value)
+        if (config.netbios_name, config.base_dn) != previous_scope:
+            # 同步范围变化后 USN 水位不再可用, 下次同步全量对账
+            config.usn_watermarks = {}
+            config.last_full_sync_at = None
         db.session.commit()
         return config
 
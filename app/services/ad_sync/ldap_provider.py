@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
 from typing import Any
 
 from ldap3 import ALL, Connection, Server, Tls  # type: ignore[import-untyped]
+from ldap3.utils.conv import escape_filter_chars  # type: ignore[import-untyped]
 
 from app.core.exceptions import ValidationError
 from app.models.ad_domain_config import AdDomainConfig
@@ -15,6 +17,10 @@ from app.utils.structlog_config import log_warning
 UF_ACCOUNTDISABLE = 0x0002
 LDAP_PAGED_SIZE = 500
 LDAP_PAGED_RESULT_CONTROL = "1.2.840.113556.1.4.319"
+LDAP_SHOW_DELETED_CONTROL = "1.2.840.113556.1.4.417"
+LDAP_LOOKUP_BATCH_SIZE = 100
+USER_PRINCIPAL_FILTER = "(&(objectClass=user)(objectCategory=person))"
+GROUP_PRINCIPAL_FILTER = "(objectClass=group)"
 
 
 @dataclass(frozen=True, slots=True)
@@ -27,13 +33,47 @@ class AdPrincipal:
     attributes: dict[str, object]
 
 
+@dataclass(frozen=True, slots=True)
+class AdUsnWatermark:
+    """域控 highestCommittedUSN 水位(USN 仅在同一域控内有意义)."""
+
+    controller: str
+    highest_committed_usn: int
+    ds_service_name: str | None = None
+
+    def to_payload(self) -> dict[str, object]:
+        return {"usn": self.highest_committed_usn, "ds_service_name": self.ds_service_name}
+
+    @classmethod
+    def from_payload(cls, controller: str, payload: object) -> AdUsnWatermark | None:
+        if not isinstance(payload, dict):
+            return None
+        try:
+            usn = int(str(payload.get("usn")))
+        except (TypeError, ValueError):
+            return None
+        ds_service_name = str(payload.get("ds_service_name") or "").strip() or None
+        return cls(controller=controller, highest_committed_usn=usn, ds_service_name=ds_service_name)
+
+    def can_resume_to(self, current: AdUsnWatermark) -> bool:
+        """当前域控未被还原/替换(服务名一致且 USN 未回退)时才可从该水位增量拉取."""
+        return (
+            self.controller == current.controller
+            and self.ds_service_name == current.ds_service_name
+            and self.highest_committed_usn <= current.highest_committed_usn
+        )
+
+
 @dataclass(frozen=True, slots=True)
 class AdPrincipalsFetchResult:
-    """AD 主体拉取结果和计数."""
+    """AD 主体拉取结果和计数(增量拉取时仅包含变更/补查的主体与已删除的名称)."""
 
     principals: dict[str, AdPrincipal]
     users_total: int
     groups_total: int
+    incremental: bool = False
+    deleted_names: frozenset[str] = field(default_factory=frozenset)
+    watermark: AdUsnWatermark | None = None
 
     @property
     def principals_total(self) -> int:
@@ -49,6 +89,43 @@ class LdapProvider:
 
     def fetch_principals_with_stats(self, config: AdDomainConfig) -> AdPrincipalsFetchResult:
         """拉取域内用户/组,返回主体映射和分类型计数."""
+        return self._fetch_from_controllers(
+            config,
+            lambda connection, base_dn, controller: self._fetch_with_connection(
+                connection,
+                base_dn,
+                controller=controller,
+            ),
+        )
+
+    def fetch_principal_changes(
+        self,
+        config: AdDomainConfig,
+        *,
+        watermarks: Mapping[str, AdUsnWatermark],
+        lookup_names: Iterable[str] = (),
+    ) -> AdPrincipalsFetchResult:
+        """按域控 uSNChanged 水位拉取变更/删除的主体, 并按 sAMAccountName 补查 lookup_names.
+
+        连接到的域控没有可用水位(首次同步、故障切换到其它域控或域控被还原)时退化为全量拉取.
+        """
+        names = sorted({str(name).strip().lower() for name in lookup_names if str(name).strip()})
+        return self._fetch_from_controllers(
+            config,
+            lambda connection, base_dn, controller: self._fetch_changes_with_connection(
+                connection,
+                base_dn,
+                controller=controller,
+                watermark=watermarks.get(controller),
+                lookup_names=names,
+            ),
+        )
+
+    def _fetch_from_controllers(
+        self,
+        config: AdDomainConfig,
+        fetch: Callable[[Any, str, str], AdPrincipalsFetchResult],
+    ) -> AdPrincipalsFetchResult:
         controllers = self._normalize_controllers(config.domain_controllers)
         if not controllers:
             raise ValidationError("AD 域配置缺少域控地址")
@@ -82,7 +159,7 @@ class LdapProvider:
                     receive_timeout=30,
                 )
                 try:
-                    return self._fetch_with_connection(connection, base_dn)
+                    return fetch(connection, base_dn, controller)
                 finally:
                     connection.unbind()
             except Exception as exc:
@@ -105,23 +182,148 @@ class LdapProvider:
         raise RuntimeError(detail)
 
     @classmethod
-    def _fetch_with_connection(cls, connection: Any, base_dn: str) -> AdPrincipalsFetchResult:
+    def _fetch_with_connection(cls, connection: Any, base_dn: str, *, controller: str = "") -> AdPrincipalsFetchResult:
+        # 先读取 highestCommittedUSN 再查询, 查询期间发生的变更会在下次增量中再次拉取
+        watermark = cls._read_usn_watermark(connection, controller)
+        principals: dict[str, AdPrincipal] = {}
+        users_total = cls._search_principals(
+            connection,
+            base_dn,
+            USER_PRINCIPAL_FILTER,
+            object_kind="user",
+            target=principals,
+        )
+        groups_total = cls._search_principals(
+            connection,
+            base_dn,
+            GROUP_PRINCIPAL_FILTER,
+            object_kind="group",
+            target=principals,
+        )
+        return AdPrincipalsFetchResult(
+            principals=principals,
+            users_total=users_total,
+            groups_total=groups_total,
+            watermark=watermark,
+        )
+
+    @classmethod
+    def _fetch_changes_with_connection(
+        cls,
+        connection: Any,
+        base_dn: str,
+        *,
+        controller: str,
+        watermark: AdUsnWatermark | None,
+        lookup_names: list[str],
+    ) -> AdPrincipalsFetchResult:
+        current = cls._read_usn_watermark(connection, controller)
+        if watermark is None or current is None or not watermark.can_resume_to(current):
+            return cls._fetch_with_connection(connection, base_dn, controller=controller)
+
+        changed_filter = f"(uSNChanged>={watermark.highest_committed_usn + 1})"
         principals: dict[str, AdPrincipal] = {}
         users_total = cls._search_principals(
             connection,
             base_dn,
-            "(&(objectClass=user)(objectCategory=person))",
+            f"(&{USER_PRINCIPAL_FILTER}{changed_filter})",
             object_kind="user",
             target=principals,
         )
         groups_total = cls._search_principals(
             connection,
             base_dn,
-            "(objectClass=group)",
+            f"(&{GROUP_PRINCIPAL_FILTER}{changed_filter})",
             object_kind="group",
             target=principals,
         )
-        return AdPrincipalsFetchResult(principals=principals, users_total=users_total, groups_total=groups_total)
+        deleted_names = cls._search_deleted_names(
+            connection,
+            cls._default_naming_context(connection) or base_dn,
+            min_usn=watermark.highest_committed_usn + 1,
+        )
+
+        pending_names = [name for name in lookup_names if name not in principals]
+        for start in range(0, len(pending_names), LDAP_LOOKUP_BATCH_SIZE):
+            names_filter = "".join(
+                f"(sAMAccountName={escape_filter_chars(name)})"
+                for name in pending_names[start : start + LDAP_LOOKUP_BATCH_SIZE]
+            )
+            users_total += cls._search_principals(
+                connection,
+                base_dn,
+                f"(&{USER_PRINCIPAL_FILTER}(|{names_filter}))",
+                object_kind="user",
+                target=principals,
+            )
+            groups_total += cls._search_principals(
+                connection,
+                base_dn,
+                f"(&{GROUP_PRINCIPAL_FILTER}(|{names_filter}))",
+                object_kind="group",
+                target=principals,
+            )
+
+        return AdPrincipalsFetchResult(
+            principals=principals,
+            users_total=users_total,
+            groups_total=groups_total,
+            incremental=True,
+            deleted_names=frozenset(name for name in deleted_names if name not in principals),
+            watermark=current,
+        )
+
+    @classmethod
+    def _search_deleted_names(cls, connection: Any, naming_context: str, *, min_usn: int) -> set[str]:
+        # 删除的对象成为 tombstone 后保留 sAMAccountName, 需要 Show Deleted 控件才能查询
+        names: set[str] = set()
+        cookie: bytes | str | None = None
+        while True:
+            search_ok = connection.search(
+                naming_context,
+                f"(&(isDeleted=TRUE)(uSNChanged>={min_usn})(|(objectClass=user)(objectClass=group)))",
+                search_scope="SUBTREE",
+                attributes=["sAMAccountName"],
+                paged_size=LDAP_PAGED_SIZE,
+                paged_cookie=cookie,
+                controls=[(LDAP_SHOW_DELETED_CONTROL, True, None)],
+            )
+            if search_ok is False:
+                raise RuntimeError(f"LDAP 查询失败: {cls._search_error_detail(connection)}")
+            for entry in list(getattr(connection, "entries", []) or []):
+                raw_name = cls._first_value(entry.entry_attributes_as_dict.get("sAMAccountName"))
+                if raw_name:
+                    names.add(raw_name.lower())
+            next_cookie = cls._paged_cookie(connection)
+            if not next_cookie:
+                return names
+            if next_cookie == cookie:
+                raise RuntimeError("LDAP 查询失败: paged cookie 未推进")
+            cookie = next_cookie
+
+    @classmethod
+    def _read_usn_watermark(cls, connection: Any, controller: str) -> AdUsnWatermark | None:
+        root_dse = cls._root_dse(connection)
+        try:
+            usn = int(cls._first_value(root_dse.get("highestCommittedUSN")))
+        except (TypeError, ValueError):
+            return None
+        return AdUsnWatermark(
+            controller=controller,
+            highest_committed_usn=usn,
+            ds_service_name=cls._first_value(root_dse.get("dsServiceName")) or None,
+        )
+
+    @classmethod
+    def _default_naming_context(cls, connection: Any) -> str:
+        return cls._first_value(cls._root_dse(connection).get("defaultNamingContext"))
+
+    @staticmethod
+    def _root_dse(connection: Any) -> Mapping[str, object]:
+        # 绑定时(get_info=ALL)读取的 rootDSE 非标准属性, ldap3 以大小写不敏感的 Mapping 存放
+        info = getattr(getattr(connection, "server", None), "info", None)
+        other = getattr(info, "other", None)
+        return other if isinstance(other, Mapping) else {}
 
     @classmethod
     def _search_principals(
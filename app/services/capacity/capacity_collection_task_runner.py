@@ -341,6 +341,11 @@ class CapacityCollectionTaskRunner:
         finally:
             collector.disconnect()
 
+    @classmethod
+    def load_active_instance(cls, instance_id: int) -> Instance:
+        """加载活跃实例(分片子项恢复上下文时使用)."""
+        return cls._load_active_instance(instance_id)
+
     @staticmethod
     def _load_active_instance(instance_id: int) -> Instance:
         instance = InstanceDetailReadService().get_instance_by_id(instance_id)
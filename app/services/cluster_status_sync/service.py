@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
 from types import SimpleNamespace
 from typing import Any, Protocol, cast
 
@@ -10,10 +11,11 @@ from app import db
 from app.core.constants import DatabaseType
 from app.core.types import SyncConnection
 from app.models.instance import Instance
-from app.models.mysql_cluster import MySQLCluster
+from app.models.mysql_cluster import MySQLCluster, MySQLClusterInstance
 from app.models.sqlserver_ag_sync_state import SQLServerAgDatabaseSyncState, SQLServerAgReplicaSyncState
 from app.models.sqlserver_cluster import SQLServerAvailabilityGroup, SQLServerCluster, SQLServerClusterInstance
 from app.services.connection_adapters.connection_factory import ConnectionFactory
+from app.services.connection_adapters.node_poller import ConcurrentNodePoller
 from app.services.mysql_clusters.service import MySQLClusterManagementService
 from app.utils.structlog_config import log_info
 from app.utils.time_utils import time_utils
@@ -67,38 +69,108 @@ EXEC sys.sp_executesql @sql;
 """
 
 
+# 单个 AG 副本读取失败时记入 source_errors 并继续读取其他副本的异常类型
+_SQLSERVER_NODE_ERRORS: tuple[type[Exception], ...] = (
+    RuntimeError,
+    ValueError,
+    LookupError,
+    ConnectionError,
+    TimeoutError,
+    OSError,
+)
+
+SQLServerNodeProbes = Mapping[int, list[Any] | Exception]
+
+
 class _ConnectionFactoryProtocol(Protocol):
     def create_connection(self, instance: Instance) -> SyncConnection | None: ...
 
 
+@dataclass(slots=True)
+class ClusterNodeProbes:
+    """一批群集的节点探测结果(群集 id -> 绑定 id -> 结果或异常)."""
+
+    mysql: dict[int, dict[int, dict[str, Any] | Exception]] = field(default_factory=dict)
+    sqlserver: dict[int, dict[int, list[Any] | Exception]] = field(default_factory=dict)
+
+
 class ClusterStatusSyncService:
     """检测 MySQL 主从状态与 SQL Server AG 数据库同步健康状态."""
 
-    def __init__(self, *, connection_factory: _ConnectionFactoryProtocol | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        connection_factory: _ConnectionFactoryProtocol | None = None,
+        node_poller: ConcurrentNodePoller | None = None,
+    ) -> None:
         self._connection_factory = connection_factory or ConnectionFactory
+        self._node_poller = node_poller or ConcurrentNodePoller.for_cluster_status()
+
+    def probe_clusters(
+        self,
+        *,
+        mysql_cluster_ids: Sequence[int] = (),
+        sqlserver_cluster_ids: Sequence[int] = (),
+    ) -> ClusterNodeProbes:
+        """在同一个有界线程池中并发探测多个群集的全部节点(不写库)."""
+        nodes: list[tuple[str, int, int, Callable[[], Any]]] = []
+        if mysql_cluster_ids:
+            mysql_bindings = (
+                MySQLClusterInstance.query.filter(MySQLClusterInstance.cluster_id.in_(list(mysql_cluster_ids)))
+                .order_by(MySQLClusterInstance.cluster_id.asc(), MySQLClusterInstance.id.asc())
+                .all()
+            )
+            mysql_service = self._mysql_management_service()
+            for binding in mysql_bindings:
+                nodes.extend(
+                    ("mysql", int(binding.cluster_id), binding_id, probe)
+                    for binding_id, probe in mysql_service.build_topology_probes([binding])
+                )
+        if sqlserver_cluster_ids:
+            sqlserver_bindings = (
+                SQLServerClusterInstance.query.filter(
+                    SQLServerClusterInstance.cluster_id.in_(list(sqlserver_cluster_ids)),
+                )
+                .order_by(SQLServerClusterInstance.cluster_id.asc(), SQLServerClusterInstance.created_at.asc())
+                .all()
+            )
+            for binding in sqlserver_bindings:
+                nodes.extend(
+                    ("sqlserver", int(binding.cluster_id), binding_id, probe)
+                    for binding_id, probe in self._build_sqlserver_node_probes([binding])
+                )
 
-    def sync_mysql_cluster(self, cluster_id: int) -> dict[str, Any]:
-        return MySQLClusterManagementService(connection_factory=self._connection_factory).sync_topology(cluster_id)
+        probes = ClusterNodeProbes()
+        outcomes = self._node_poller.poll(lambda node: node[3](), nodes, node_id=lambda node: (node[0], node[2]))
+        for (kind, cluster_id, binding_id, _), outcome in zip(nodes, outcomes, strict=True):
+            target = probes.mysql if kind == "mysql" else probes.sqlserver
+            target.setdefault(cluster_id, {})[binding_id] = outcome
+        return probes
+
+    def sync_mysql_cluster(self, cluster_id: int, *, probes: ClusterNodeProbes | None = None) -> dict[str, Any]:
+        return self._mysql_management_service().sync_topology(
+            cluster_id,
+            detections=probes.mysql.get(cluster_id) if probes is not None else None,
+        )
 
-    def sync_sqlserver_cluster(self, cluster_id: int) -> dict[str, Any]:
+    def sync_sqlserver_cluster(self, cluster_id: int, *, probes: ClusterNodeProbes | None = None) -> dict[str, Any]:
         prepared = self._prepare_sqlserver_cluster(cluster_id)
         if isinstance(prepared, dict):
             return prepared
         cluster, bindings, ags = prepared
 
-        rows, source_instance_ids, source_errors = self._collect_sqlserver_status_rows(cluster, bindings)
+        rows, source_instance_ids, source_errors = self._collect_sqlserver_status_rows(
+            cluster,
+            bindings,
+            probed=probes.sqlserver.get(cluster_id) if probes is not None else None,
+        )
         if not source_instance_ids:
             error_message = "; ".join(source_errors) if source_errors else "已绑定实例均无法读取 SQL Server AG 状态"
             return self._mark_sqlserver_cluster_result(cluster, [], status="failed", error_message=error_message)
 
         known_ag = {ag.name: ag for ag in ags}
         known_rows = [row for row in rows if self._value(row, "ag_name", 0) in known_ag]
-        replica_states_by_scope = {
-            (state.ag_name, state.replica_server_name): state
-            for state in (self._upsert_sqlserver_replica_state(cluster, known_ag, row) for row in known_rows)
-        }
-        replica_states = list(replica_states_by_scope.values())
-        states = [self._upsert_sqlserver_state(cluster, known_ag, row) for row in known_rows]
+        states, replica_states = self._upsert_sqlserver_states(cluster, known_ag, known_rows)
         self._apply_sqlserver_cluster_status(
             cluster,
             status="completed",
@@ -132,7 +204,11 @@ class ClusterStatusSyncService:
         self,
         cluster: SQLServerCluster,
         bindings: list[SQLServerClusterInstance],
+        *,
+        probed: SQLServerNodeProbes | None = None,
     ) -> tuple[list[Any], list[int], list[str]]:
+        """汇总各副本的 AG 状态行; 未预先探测时并发探测全部副本."""
+        outcomes = probed if probed is not None else self.probe_sqlserver_bindings(bindings)
         rows: list[Any] = []
         source_instance_ids: list[int] = []
         source_errors: list[str] = []
@@ -141,21 +217,17 @@ class ClusterStatusSyncService:
             if source_instance is None:
                 source_errors.append(f"binding:{binding.id} 绑定实例不存在")
                 continue
-            target = self._build_sqlserver_status_target(source_instance)
-            connection = self._connection_factory.create_connection(target)
-            if connection is None:
-                source_errors.append(f"{source_instance.name} 无法创建 SQL Server 连接")
+            # 预先探测之后新增的绑定在此补测
+            outcome = (
+                outcomes[binding.id] if binding.id in outcomes else self.probe_sqlserver_bindings([binding])[binding.id]
+            )
+            if isinstance(outcome, _SQLSERVER_NODE_ERRORS):
+                source_errors.append(f"{source_instance.name} {outcome}")
                 continue
-            try:
-                if not connection.connect():
-                    source_errors.append(f"{source_instance.name} 无法连接 SQL Server 实例")
-                    continue
-                rows.extend(list(connection.execute_query(_AG_DATABASE_SYNC_STATUS_QUERY)))
-                source_instance_ids.append(source_instance.id)
-            except (RuntimeError, ValueError, LookupError, ConnectionError, TimeoutError, OSError) as exc:
-                source_errors.append(f"{source_instance.name} {exc}")
-            finally:
-                connection.disconnect()
+            if isinstance(outcome, Exception):
+                raise outcome
+            rows.extend(outcome)
+            source_instance_ids.append(source_instance.id)
         if source_errors:
             log_info(
                 "检测 SQL Server AG 数据库同步状态存在部分实例失败",
@@ -166,6 +238,51 @@ class ClusterStatusSyncService:
             )
         return rows, source_instance_ids, source_errors
 
+    def probe_sqlserver_bindings(self, bindings: list[SQLServerClusterInstance]) -> dict[int, list[Any] | Exception]:
+        """并发读取各副本的 AG 状态行(不写库), 按绑定 id 返回结果或异常."""
+        probes = self._build_sqlserver_node_probes(bindings)
+        outcomes = self._node_poller.poll(
+            lambda probe: probe[1](),
+            probes,
+            node_id=lambda probe: ("sqlserver", probe[0]),
+        )
+        return {binding_id: outcome for (binding_id, _), outcome in zip(probes, outcomes, strict=True)}
+
+    def _build_sqlserver_node_probes(
+        self,
+        bindings: list[SQLServerClusterInstance],
+    ) -> list[tuple[int, Callable[[], list[Any]]]]:
+        # 连接对象在当前线程创建并读取实例与凭据; 探测线程只做连接与查询
+        probes: list[tuple[int, Callable[[], list[Any]]]] = []
+        for binding in bindings:
+            source_instance = cast(Instance | None, binding.instance)
+            if source_instance is None:
+                continue
+            target = self._build_sqlserver_status_target(source_instance)
+            connection = self._connection_factory.create_connection(target)
+            probes.append((int(binding.id), self._sqlserver_node_probe(connection)))
+        return probes
+
+    @staticmethod
+    def _sqlserver_node_probe(connection: SyncConnection | None) -> Callable[[], list[Any]]:
+        def _probe() -> list[Any]:
+            if connection is None:
+                raise ConnectionError("无法创建 SQL Server 连接")
+            try:
+                if not connection.connect():
+                    raise ConnectionError("无法连接 SQL Server 实例")
+                return list(connection.execute_query(_AG_DATABASE_SYNC_STATUS_QUERY))
+            finally:
+                connection.disconnect()
+
+        return _probe
+
+    def _mysql_management_service(self) -> MySQLClusterManagementService:
+        return MySQLClusterManagementService(
+            connection_factory=self._connection_factory,
+            node_poller=self._node_poller,
+        )
+
     def _prepare_sqlserver_cluster(
         self,
         cluster_id: int,
@@ -264,27 +381,55 @@ class ClusterStatusSyncService:
             ),
         )
 
+    def _upsert_sqlserver_states(
+        self,
+        cluster: SQLServerCluster,
+        known_ag: Mapping[str, SQLServerAvailabilityGroup],
+        rows: list[Any],
+    ) -> tuple[list[SQLServerAgDatabaseSyncState], list[SQLServerAgReplicaSyncState]]:
+        """按群集一次性加载已有状态, 在内存中合并本次各副本读到的行后批量写入."""
+        existing_states = {
+            (state.ag_name, state.database_name, state.replica_server_name): state
+            for state in SQLServerAgDatabaseSyncState.query.filter_by(cluster_id=cluster.id).all()
+        }
+        existing_replica_states = {
+            (state.ag_name, state.replica_server_name): state
+            for state in SQLServerAgReplicaSyncState.query.filter_by(cluster_id=cluster.id).all()
+        }
+        checked_at = time_utils.now()
+        replica_states_by_scope: dict[tuple[str, str], SQLServerAgReplicaSyncState] = {}
+        for row in rows:
+            replica_state = self._upsert_sqlserver_replica_state(
+                cluster, known_ag, row, existing=existing_replica_states, checked_at=checked_at
+            )
+            replica_states_by_scope[(replica_state.ag_name, replica_state.replica_server_name)] = replica_state
+        states = [
+            self._upsert_sqlserver_state(cluster, known_ag, row, existing=existing_states, checked_at=checked_at)
+            for row in rows
+        ]
+        db.session.add_all([*replica_states_by_scope.values(), *states])
+        return states, list(replica_states_by_scope.values())
+
     def _upsert_sqlserver_state(
         self,
         cluster: SQLServerCluster,
         known_ag: Mapping[str, SQLServerAvailabilityGroup],
         row: Any,
+        *,
+        existing: dict[tuple[str, str, str], SQLServerAgDatabaseSyncState],
+        checked_at: Any,
     ) -> SQLServerAgDatabaseSyncState:
         ag_name = str(self._value(row, "ag_name", 0) or "").strip()
         database_name = str(self._value(row, "database_name", 1) or "").strip()
         replica_server_name = str(self._value(row, "replica_server_name", 2) or "").strip()
-        state = SQLServerAgDatabaseSyncState.query.filter_by(
-            cluster_id=cluster.id,
-            ag_name=ag_name,
-            database_name=database_name,
-            replica_server_name=replica_server_name,
-        ).first()
+        state = existing.get((ag_name, database_name, replica_server_name))
         if state is None:
             state = SQLServerAgDatabaseSyncState()
             state.cluster_id = cluster.id
             state.ag_name = ag_name
             state.database_name = database_name
             state.replica_server_name = replica_server_name
+            existing[(ag_name, database_name, replica_server_name)] = state
         ag = known_ag.get(ag_name)
         state.availability_group_id = ag.id if ag else None
         state.synchronization_state_desc = self._text_value(row, "synchronization_state_desc", 3)
@@ -295,8 +440,7 @@ class ClusterStatusSyncService:
         state.log_send_queue_size = self._int_value(row, "log_send_queue_size", 8)
         state.redo_queue_size = self._int_value(row, "redo_queue_size", 9)
         state.is_abnormal, state.error_summary = self._judge_sqlserver_state(state)
-        state.last_checked_at = time_utils.now()
-        db.session.add(state)
+        state.last_checked_at = checked_at
         return state
 
     def _upsert_sqlserver_replica_state(
@@ -304,19 +448,19 @@ class ClusterStatusSyncService:
         cluster: SQLServerCluster,
         known_ag: Mapping[str, SQLServerAvailabilityGroup],
         row: Any,
+        *,
+        existing: dict[tuple[str, str], SQLServerAgReplicaSyncState],
+        checked_at: Any,
     ) -> SQLServerAgReplicaSyncState:
         ag_name = str(self._value(row, "ag_name", 0) or "").strip()
         replica_server_name = str(self._value(row, "replica_server_name", 2) or "").strip()
-        state = SQLServerAgReplicaSyncState.query.filter_by(
-            cluster_id=cluster.id,
-            ag_name=ag_name,
-            replica_server_name=replica_server_name,
-        ).first()
+        state = existing.get((ag_name, replica_server_name))
         if state is None:
             state = SQLServerAgReplicaSyncState()
             state.cluster_id = cluster.id
             state.ag_name = ag_name
             state.replica_server_name = replica_server_name
+            existing[(ag_name, replica_server_name)] = state
         ag = known_ag.get(ag_name)
         state.availability_group_id = ag.id if ag else None
         state.role_desc = self._text_value(row, "replica_role_desc", 10)
@@ -331,8 +475,7 @@ class ClusterStatusSyncService:
         state.cluster_type_desc = self._text_value(row, "cluster_type_desc", 19)
         state.is_primary = (state.role_desc or "").upper() == "PRIMARY"
         state.is_abnormal, state.error_summary = self._judge_sqlserver_replica_state(state)
-        state.last_checked_at = time_utils.now()
-        db.session.add(state)
+        state.last_checked_at = checked_at
         return state
 
     @staticmethod
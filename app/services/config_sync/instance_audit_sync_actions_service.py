@@ -82,23 +82,37 @@ class InstanceAuditSyncActionsService:
         sync_session_service.start_instance_sync(record.id)
 
         try:
-            sync_payload = self._sync_service.sync_instance_audit(instance=instance)
+            existing = self._snapshot_repository.get_by_instance_and_key(
+                instance_id=instance.id,
+                config_key=AUDIT_INFO_CONFIG_KEY,
+            )
+            sync_payload = self._sync_service.sync_instance_audit(
+                instance=instance,
+                previous_snapshot=existing.snapshot if existing is not None else None,
+                previous_facts=existing.facts if existing is not None else None,
+            )
             summary = sync_payload.get("summary", {})
-            snapshot = sync_payload.get("snapshot")
-            facts = sync_payload.get("facts")
-            created = self._save_snapshot(instance=instance, snapshot=snapshot, facts=facts)
+            changed = bool(sync_payload.get("changed", True))
+            created = self._save_snapshot(
+                instance=instance,
+                existing=existing,
+                snapshot=sync_payload.get("snapshot"),
+                facts=sync_payload.get("facts"),
+                changed=changed,
+            )
             sync_session_service.complete_instance_sync(
                 record.id,
                 stats=SyncItemStats(
                     items_synced=int(summary.get("audit_count", 0)) + int(summary.get("specification_count", 0)),
                     items_created=1 if created else 0,
-                    items_updated=0 if created else 1,
+                    items_updated=1 if changed and not created else 0,
                     items_deleted=0,
                 ),
                 sync_details={
                     "version": 1,
                     "config_key": AUDIT_INFO_CONFIG_KEY,
                     "summary": dict(summary),
+                    "changed": changed,
                 },
             )
         except Exception as exc:
@@ -132,13 +146,16 @@ class InstanceAuditSyncActionsService:
         self,
         *,
         instance: Instance,
+        existing: InstanceConfigSnapshot | None,
         snapshot: object,
         facts: object,
+        changed: bool,
     ) -> bool:
-        existing = self._snapshot_repository.get_by_instance_and_key(
-            instance_id=instance.id,
-            config_key=AUDIT_INFO_CONFIG_KEY,
-        )
+        if existing is not None and not changed:
+            # 内容哈希未变化: 不重写快照与 facts, 仅刷新同步时间
+            existing.last_sync_time = time_utils.now()
+            self._snapshot_repository.flush()
+            return False
         created = existing is None
         row = existing or InstanceConfigSnapshot(
             instance_id=instance.id,
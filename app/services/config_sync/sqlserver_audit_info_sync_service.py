@@ -1,20 +1,34 @@
-"""SQL Server 审计信息采集服务."""
+"""SQL Server 审计信息采集服务.
+
+职责:
+- 采集服务器审计、服务器审计规范与各数据库审计规范, 构建快照与 facts
+- 先读取 modify_date/数量水位, 仅重新采集水位变化的部分, 其余沿用上一份快照
+- 多库审计规范合并为跨库 UNION ALL 查询分批执行, 批次失败时退回逐库查询定位失败库
+"""
 
 from __future__ import annotations
 
+import hashlib
+import json
 import re
 from collections.abc import Mapping
 from datetime import date, datetime
-from typing import Any
+from typing import Any, cast
 
 from app.core.constants import DatabaseType
 from app.services.connection_adapters.adapters.base import ConnectionAdapterError, DatabaseConnection
 from app.services.connection_adapters.connection_factory import ConnectionFactory
 from app.utils.database_type_utils import normalize_database_type
+from app.utils.structlog_config import log_fallback
 from app.utils.time_utils import time_utils
 
 AUDIT_INFO_CONFIG_KEY = "audit_info"
 
+# 单条跨库 UNION 查询覆盖的数据库数, 与账户权限采集的分批大小保持一致
+_DATABASE_UNION_BATCH_SIZE = 20
+# 参与内容哈希的快照分区(meta 中仅水位参与, 采集时间等运行信息不参与)
+_CONTENT_SECTIONS = ("server_audits", "audit_specifications", "database_audit_specifications", "errors")
+
 
 def _stringify(value: object) -> str | None:
     if value is None:
@@ -195,13 +209,40 @@ def build_sqlserver_audit_facts(snapshot: Mapping[str, object]) -> dict[str, Any
     }
 
 
+def build_sqlserver_audit_content_hash(snapshot: Mapping[str, object]) -> str:
+    """计算快照内容哈希(忽略采集时间等运行信息), 用于判断是否需要重写快照."""
+    meta_value = snapshot.get("meta")
+    meta = meta_value if isinstance(meta_value, Mapping) else {}
+    payload = {key: snapshot.get(key) for key in _CONTENT_SECTIONS}
+    payload["watermarks"] = meta.get("watermarks")
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _snapshot_meta(snapshot: Mapping[str, object] | None) -> Mapping[str, object]:
+    meta_value = snapshot.get("meta") if isinstance(snapshot, Mapping) else None
+    return meta_value if isinstance(meta_value, Mapping) else {}
+
+
+def _mapping_list(snapshot: Mapping[str, object], key: str) -> list[dict[str, Any]]:
+    value = snapshot.get(key)
+    return [dict(item) for item in value if isinstance(item, Mapping)] if isinstance(value, list) else []
+
+
 class SQLServerAuditInfoSyncService:
     """采集 SQL Server 实例的审计配置."""
 
     def __init__(self, connection_factory: type[ConnectionFactory] | None = None) -> None:
         self._connection_factory = connection_factory or ConnectionFactory
 
-    def sync_instance_audit(self, *, instance) -> dict[str, Any]:  # type: ignore[no-untyped-def]
+    def sync_instance_audit(  # type: ignore[no-untyped-def]
+        self,
+        *,
+        instance,
+        previous_snapshot: Mapping[str, object] | None = None,
+        previous_facts: Mapping[str, object] | None = None,
+    ) -> dict[str, Any]:
+        """采集审计快照; 传入上一份快照时按水位差量采集, 内容未变化时沿用上一份快照与 facts."""
         db_type = normalize_database_type(str(getattr(instance, "db_type", "") or ""))
         if db_type != DatabaseType.SQLSERVER:
             raise ValueError("当前仅支持 SQL Server 审计信息采集")
@@ -213,37 +254,92 @@ class SQLServerAuditInfoSyncService:
             raise ConnectionAdapterError("无法建立数据库连接")
 
         try:
-            snapshot = self._collect_snapshot(connection)
+            snapshot = self._collect_snapshot(connection, previous_snapshot)
         finally:
             connection.disconnect()
 
-        facts = build_sqlserver_audit_facts(snapshot)
-        snapshot_meta_value = snapshot.get("meta")
-        snapshot_meta = snapshot_meta_value if isinstance(snapshot_meta_value, Mapping) else {}
+        previous_hash = _snapshot_meta(previous_snapshot).get("content_hash")
+        changed = not previous_hash or previous_hash != _snapshot_meta(snapshot).get("content_hash")
+        if not changed and isinstance(previous_snapshot, Mapping):
+            snapshot = dict(previous_snapshot)
+        facts = (
+            dict(previous_facts)
+            if not changed and isinstance(previous_facts, Mapping)
+            else build_sqlserver_audit_facts(snapshot)
+        )
+        snapshot_meta = _snapshot_meta(snapshot)
         return {
             "snapshot": snapshot,
             "facts": facts,
+            "changed": changed,
             "summary": {
                 "audit_count": facts["audit_count"],
                 "enabled_audit_count": facts["enabled_audit_count"],
                 "specification_count": facts["specification_count"],
                 "covered_database_count": facts["covered_database_count"],
                 "partial_success": bool(snapshot_meta.get("partial_success")),
-                "collected_database_count": int(snapshot_meta.get("collected_database_count", 0) or 0),
-                "failed_database_count": int(snapshot_meta.get("failed_database_count", 0) or 0),
+                "collected_database_count": _intify(snapshot_meta.get("collected_database_count")) or 0,
+                "failed_database_count": _intify(snapshot_meta.get("failed_database_count")) or 0,
             },
         }
 
-    def _collect_snapshot(self, connection: DatabaseConnection) -> dict[str, Any]:
-        server_audits = self._collect_server_audits(connection)
-        audit_name_by_guid = {
-            audit_guid: audit["name"]
-            for audit in server_audits
-            for audit_guid in [_stringify(audit.get("audit_guid"))]
-            if audit_guid
-        }
-        server_specs = self._collect_server_audit_specifications(connection, audit_name_by_guid)
-        database_specs, database_errors = self._collect_database_audit_specifications(connection, audit_name_by_guid)
+    def _collect_snapshot(
+        self,
+        connection: DatabaseConnection,
+        previous_snapshot: Mapping[str, object] | None = None,
+    ) -> dict[str, Any]:
+        watermarks = self._collect_watermarks(connection)
+        previous_watermarks = _snapshot_meta(previous_snapshot).get("watermarks")
+        refreshed_databases: list[str] | None = None
+        if (
+            watermarks is not None
+            and isinstance(previous_snapshot, Mapping)
+            and isinstance(previous_watermarks, Mapping)
+            and previous_watermarks.get("server_audits") == watermarks["server_audits"]
+        ):
+            # 服务器审计未变化: 审计名映射可沿用, 仅重新采集水位变化的规范
+            server_audits = _mapping_list(previous_snapshot, "server_audits")
+            audit_name_by_guid = self._audit_name_by_guid(server_audits)
+            if previous_watermarks.get("server_specifications") == watermarks["server_specifications"]:
+                server_specs = _mapping_list(previous_snapshot, "audit_specifications")
+            else:
+                server_specs = self._collect_server_audit_specifications(connection, audit_name_by_guid)
+
+            current_databases: dict[str, str | None] = watermarks["databases"]
+            previous_database_marks = previous_watermarks.get("databases")
+            previous_database_marks = previous_database_marks if isinstance(previous_database_marks, Mapping) else {}
+            previously_failed = set(cast(list, _snapshot_meta(previous_snapshot).get("failed_databases") or []))
+            refreshed_databases = [
+                database_name
+                for database_name, mark in current_databases.items()
+                if mark is None
+                or previous_database_marks.get(database_name) != mark
+                or database_name in previously_failed
+            ]
+            refreshed = set(refreshed_databases)
+            database_specs = [
+                spec
+                for spec in _mapping_list(previous_snapshot, "database_audit_specifications")
+                if spec.get("database_name") in current_databases and spec.get("database_name") not in refreshed
+            ]
+            database_errors: list[dict[str, Any]] = []
+            if refreshed_databases:
+                new_specs, database_errors = self._collect_database_audit_specifications(
+                    connection,
+                    audit_name_by_guid,
+                    refreshed_databases,
+                )
+                database_specs.extend(new_specs)
+        else:
+            server_audits = self._collect_server_audits(connection)
+            audit_name_by_guid = self._audit_name_by_guid(server_audits)
+            server_specs = self._collect_server_audit_specifications(connection, audit_name_by_guid)
+            database_specs, database_errors = self._collect_database_audit_specifications(
+                connection,
+                audit_name_by_guid,
+            )
+        # 全量与差量结果统一按 (库名, 规范名) 排序, 保证内容哈希只随内容变化
+        database_specs.sort(key=lambda spec: (str(spec.get("database_name")), str(spec.get("name"))))
         failed_databases = sorted(
             {
                 database_name
@@ -253,7 +349,7 @@ class SQLServerAuditInfoSyncService:
                 if database_name
             },
         )
-        return {
+        snapshot: dict[str, Any] = {
             "version": 1,
             "supported": True,
             "db_type": DatabaseType.SQLSERVER,
@@ -276,8 +372,101 @@ class SQLServerAuditInfoSyncService:
                 ),
                 "failed_database_count": len(failed_databases),
                 "failed_databases": failed_databases,
+                "incremental": refreshed_databases is not None,
+                "refreshed_database_count": (len(refreshed_databases) if refreshed_databases is not None else None),
+                "watermarks": watermarks,
             },
         }
+        snapshot["meta"]["content_hash"] = build_sqlserver_audit_content_hash(snapshot)
+        return snapshot
+
+    @staticmethod
+    def _audit_name_by_guid(server_audits: list[dict[str, Any]]) -> dict[str, str]:
+        return {
+            audit_guid: audit["name"]
+            for audit in server_audits
+            for audit_guid in [_stringify(audit.get("audit_guid"))]
+            if audit_guid
+        }
+
+    def _collect_watermarks(self, connection: Any) -> dict[str, Any] | None:
+        """读取审计对象的数量/modify_date 水位; 读取失败时返回 None(按全量采集处理)."""
+        try:
+            rows = connection.execute_query(
+                """
+                SELECT
+                    (SELECT COUNT(*) FROM sys.server_audits),
+                    (SELECT SUM(CAST(is_state_enabled AS INT)) FROM sys.server_audits),
+                    (SELECT MAX(modify_date) FROM sys.server_audits),
+                    (SELECT COUNT(*) FROM sys.server_audit_specifications),
+                    (SELECT SUM(CAST(is_state_enabled AS INT)) FROM sys.server_audit_specifications),
+                    (SELECT MAX(modify_date) FROM sys.server_audit_specifications),
+                    (SELECT COUNT(*) FROM sys.server_audit_specification_details)
+                """,
+            )
+            row = rows[0] if rows else ()
+            values = [_isoformat(row[index] if len(row) > index else None) or "" for index in range(7)]
+            databases = self._collect_online_databases(connection)
+            return {
+                "server_audits": "|".join(values[0:3]),
+                "server_specifications": "|".join(values[3:7]),
+                "databases": self._collect_database_watermarks(connection, databases),
+            }
+        except Exception as exc:
+            log_fallback(
+                "warning",
+                "读取 SQL Server 审计水位失败,按全量采集处理",
+                module="config_sync",
+                action="collect_sqlserver_audit_watermarks",
+                fallback_reason="audit_watermarks_unavailable",
+                logger_name="sync",
+                exception=exc,
+            )
+            return None
+
+    def _collect_database_watermarks(self, connection: Any, databases: list[str]) -> dict[str, str | None]:
+        """按批次跨库读取数据库审计规范水位, 读取失败的库记为 None(视为已变化)."""
+        marks: dict[str, str | None] = dict.fromkeys(databases)
+        for batch in self._split_database_batches(databases):
+            try:
+                rows = connection.execute_query(
+                    " UNION ALL ".join(self._build_database_watermark_query(name) for name in batch),
+                )
+            except Exception:
+                rows = []
+                for database_name in batch:
+                    try:
+                        rows.extend(connection.execute_query(self._build_database_watermark_query(database_name)))
+                    except Exception:
+                        continue
+            for row in rows:
+                database_name = _stringify(row[0] if len(row) > 0 else None)
+                if database_name in marks:
+                    marks[database_name] = "|".join(
+                        _isoformat(row[index] if len(row) > index else None) or "" for index in range(1, 5)
+                    )
+        return marks
+
+    @staticmethod
+    def _build_database_watermark_query(database_name: str) -> str:
+        database_literal = _quote_literal(database_name)
+        database_identifier = _quote_identifier(database_name)
+        return f"""
+            SELECT
+                N'{database_literal}' AS database_name,
+                COUNT(*),
+                SUM(CAST(das.is_state_enabled AS INT)),
+                MAX(das.modify_date),
+                (SELECT COUNT(*) FROM {database_identifier}.sys.database_audit_specification_details)
+            FROM {database_identifier}.sys.database_audit_specifications das
+            """
+
+    @staticmethod
+    def _split_database_batches(databases: list[str]) -> list[list[str]]:
+        return [
+            databases[offset : offset + _DATABASE_UNION_BATCH_SIZE]
+            for offset in range(0, len(databases), _DATABASE_UNION_BATCH_SIZE)
+        ]
 
     @staticmethod
     def _collect_server_audits(connection: DatabaseConnection) -> list[dict[str, Any]]:
@@ -389,31 +578,46 @@ class SQLServerAuditInfoSyncService:
         self,
         connection: Any,
         audit_name_by_guid: Mapping[str, str],
+        databases: list[str] | None = None,
     ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
-        databases = self._collect_online_databases(connection)
+        database_names = self._collect_online_databases(connection) if databases is None else list(databases)
         collected: list[dict[str, Any]] = []
         errors: list[dict[str, Any]] = []
-        for database_name in databases:
-            try:
-                collected.extend(
-                    self._collect_single_database_audit_specifications(
-                        connection,
-                        database_name=database_name,
-                        audit_name_by_guid=audit_name_by_guid,
-                    ),
-                )
-            except Exception as exc:
-                message = str(exc)
-                error_code = _extract_sqlserver_error_code(message)
-                errors.append(
-                    {
-                        "scope": "database_audit_specification",
-                        "database_name": database_name,
-                        "error_code": error_code,
-                        "reason": _classify_database_audit_error(message, error_code),
-                        "error_message": message,
-                    },
-                )
+        for batch in self._split_database_batches(database_names):
+            if len(batch) > 1:
+                try:
+                    collected.extend(
+                        self._collect_batch_database_audit_specifications(
+                            connection,
+                            database_names=batch,
+                            audit_name_by_guid=audit_name_by_guid,
+                        ),
+                    )
+                    continue
+                except Exception:
+                    # 批次中任一库不可读会使整条 UNION 失败, 退回逐库查询以保留其余库结果并定位失败库
+                    pass
+            for database_name in batch:
+                try:
+                    collected.extend(
+                        self._collect_single_database_audit_specifications(
+                            connection,
+                            database_name=database_name,
+                            audit_name_by_guid=audit_name_by_guid,
+                        ),
+                    )
+                except Exception as exc:
+                    message = str(exc)
+                    error_code = _extract_sqlserver_error_code(message)
+                    errors.append(
+                        {
+                            "scope": "database_audit_specification",
+                            "database_name": database_name,
+                            "error_code": error_code,
+                            "reason": _classify_database_audit_error(message, error_code),
+                            "error_message": message,
+                        },
+                    )
         return collected, errors
 
     @staticmethod
@@ -435,48 +639,78 @@ class SQLServerAuditInfoSyncService:
         database_name: str,
         audit_name_by_guid: Mapping[str, str],
     ) -> list[dict[str, Any]]:
-        database_literal = _quote_literal(database_name)
-        database_identifier = _quote_identifier(database_name)
         try:
             rows = connection.execute_query(
-                f"""
-                SELECT
-                    N'{database_literal}' AS database_name,
-                    das.name,
-                    CAST(das.audit_guid AS NVARCHAR(36)) AS audit_guid,
-                    das.is_state_enabled,
-                    das.create_date,
-                    das.modify_date,
-                    dsd.audit_action_name,
-                    dsd.audited_result,
-                    dsd.class_desc,
-                    dsd.major_id,
-                    dsd.minor_id,
-                    object_schema.name AS object_schema_name,
-                    object_ref.name AS object_name,
-                    column_ref.name AS column_name,
-                    schema_ref.name AS schema_name
-                FROM {database_identifier}.sys.database_audit_specifications das
-                LEFT JOIN {database_identifier}.sys.database_audit_specification_details dsd
-                  ON dsd.database_specification_id = das.database_specification_id
-                LEFT JOIN {database_identifier}.sys.all_objects object_ref
-                  ON object_ref.object_id = dsd.major_id
-                LEFT JOIN {database_identifier}.sys.schemas object_schema
-                  ON object_schema.schema_id = object_ref.schema_id
-                LEFT JOIN {database_identifier}.sys.columns column_ref
-                  ON column_ref.object_id = object_ref.object_id
-                 AND column_ref.column_id = dsd.minor_id
-                LEFT JOIN {database_identifier}.sys.schemas schema_ref
-                  ON schema_ref.schema_id = dsd.major_id
-                ORDER BY das.name ASC, dsd.audit_action_name ASC
-                """,
+                SQLServerAuditInfoSyncService._build_database_audit_specifications_query(database_name)
+                + "ORDER BY das.name ASC, dsd.audit_action_name ASC\n",
             )
         except Exception as exc:
             raise RuntimeError(f"读取数据库 {database_name} 审计配置失败: {exc}") from exc
+        return SQLServerAuditInfoSyncService._group_database_audit_rows(rows, audit_name_by_guid)
+
+    @staticmethod
+    def _collect_batch_database_audit_specifications(
+        connection: Any,
+        *,
+        database_names: list[str],
+        audit_name_by_guid: Mapping[str, str],
+    ) -> list[dict[str, Any]]:
+        """以单条跨库 UNION ALL 查询读取一批数据库的审计规范."""
+        rows = connection.execute_query(
+            " UNION ALL ".join(
+                SQLServerAuditInfoSyncService._build_database_audit_specifications_query(database_name)
+                for database_name in database_names
+            )
+            + "ORDER BY database_name ASC, name ASC, audit_action_name ASC\n",
+        )
+        return SQLServerAuditInfoSyncService._group_database_audit_rows(rows, audit_name_by_guid)
 
+    @staticmethod
+    def _build_database_audit_specifications_query(database_name: str) -> str:
+        """单库审计规范查询(不含 ORDER BY); 字符列统一排序规则, 以便跨库 UNION ALL."""
+        database_literal = _quote_literal(database_name)
+        database_identifier = _quote_identifier(database_name)
+        return f"""
+            SELECT
+                N'{database_literal}' AS database_name,
+                das.name COLLATE SQL_Latin1_General_CP1_CI_AS AS name,
+                CAST(das.audit_guid AS NVARCHAR(36)) COLLATE SQL_Latin1_General_CP1_CI_AS AS audit_guid,
+                das.is_state_enabled,
+                das.create_date,
+                das.modify_date,
+                dsd.audit_action_name COLLATE SQL_Latin1_General_CP1_CI_AS AS audit_action_name,
+                dsd.audited_result COLLATE SQL_Latin1_General_CP1_CI_AS AS audited_result,
+                dsd.class_desc COLLATE SQL_Latin1_General_CP1_CI_AS AS class_desc,
+                dsd.major_id,
+                dsd.minor_id,
+                object_schema.name COLLATE SQL_Latin1_General_CP1_CI_AS AS object_schema_name,
+                object_ref.name COLLATE SQL_Latin1_General_CP1_CI_AS AS object_name,
+                column_ref.name COLLATE SQL_Latin1_General_CP1_CI_AS AS column_name,
+                schema_ref.name COLLATE SQL_Latin1_General_CP1_CI_AS AS schema_name
+            FROM {database_identifier}.sys.database_audit_specifications das
+            LEFT JOIN {database_identifier}.sys.database_audit_specification_details dsd
+              ON dsd.database_specification_id = das.database_specification_id
+            LEFT JOIN {database_identifier}.sys.all_objects object_ref
+              ON object_ref.object_id = dsd.major_id
+            LEFT JOIN {database_identifier}.sys.schemas object_schema
+              ON object_schema.schema_id = object_ref.schema_id
+            LEFT JOIN {database_identifier}.sys.columns column_ref
+              ON column_ref.object_id = object_ref.object_id
+             AND column_ref.column_id = dsd.minor_id
+            LEFT JOIN {database_identifier}.sys.schemas schema_ref
+              ON schema_ref.schema_id = dsd.major_id
+            """
+
+    @staticmethod
+    def _group_database_audit_rows(
+        rows: Any,
+        audit_name_by_guid: Mapping[str, str],
+    ) -> list[dict[str, Any]]:
         grouped: dict[tuple[str, str], dict[str, Any]] = {}
         for row in rows:
-            resolved_database_name = _stringify(row[0] if len(row) > 0 else None) or database_name
+            resolved_database_name = _stringify(row[0] if len(row) > 0 else None)
+            if not resolved_database_name:
+                continue
             name = _stringify(row[1] if len(row) > 1 else None)
             if not name:
                 continue
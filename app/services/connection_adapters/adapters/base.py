@@ -7,6 +7,7 @@ from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, TypeAlias
 
 from app.core.types import DBAPIConnection, JsonValue
+from app.utils.credential_secret_cache import credential_secret_cache
 from app.utils.database_type_utils import get_database_type_default_schema
 from app.utils.structlog_config import get_db_logger
 
@@ -48,6 +49,22 @@ class DatabaseConnection(ABC):
         self.connection: object | None = None
         self.is_connected = False
 
+    def _resolve_credentials(self) -> tuple[str, str]:
+        """解析连接使用的 (用户名, 密码).
+
+        credential 关系尚未加载时先按 credential_id 查凭据缓存, 命中则既不查库也不解密.
+        """
+        credential_id = getattr(self.instance, "credential_id", None)
+        loaded_state = getattr(self.instance, "__dict__", None)
+        if credential_id is not None and (loaded_state is None or "credential" not in loaded_state):
+            cached = credential_secret_cache.get(credential_id, check_version=False)
+            if cached is not None:
+                return cached
+        credential = self.instance.credential
+        if credential is None:
+            return "", ""
+        return str(credential.username or ""), credential.get_plain_password()
+
     @abstractmethod
     def connect(self) -> bool:
         """建立数据库连接."""
@@ -49,14 +49,14 @@ class MySQLConnection(DatabaseConnection):
             bool: 连接成功返回 True,失败返回 False.
 
         """
-        password = self.instance.credential.get_plain_password() if self.instance.credential else ""
+        username, password = self._resolve_credentials()
 
         try:
             self.connection = pymysql.connect(
                 host=self.instance.host,
                 port=self.instance.port,
                 database=self.instance.database_name or get_default_schema("mysql"),
-                user=(self.instance.credential.username if self.instance.credential else ""),
+                user=username,
                 password=password,
                 charset="utf8mb4",
                 autocommit=True,
@@ -57,8 +57,7 @@ class OracleConnection(DatabaseConnection):
         """
         username_for_connection = None
         try:
-            password = self.instance.credential.get_plain_password() if self.instance.credential else ""
-            username = self.instance.credential.username if self.instance.credential else ""
+            username, password = self._resolve_credentials()
             username_for_connection = username.split("/")[0] if "/" in username else username
             host = self.instance.host
             port = self.instance.port
@@ -198,12 +197,15 @@ class OracleConnection(DatabaseConnection):
         self,
         query: str,
         params: Sequence[object] | Mapping[str, object] | None = None,
+        *,
+        arraysize: int | None = None,
     ) -> QueryResult:
         """执行 SQL 查询并返回全部行.
 
         Args:
             query: SQL 语句.
             params: 查询参数,可为 tuple 或 dict.
+            arraysize: 可选的单次往返抓取行数(同时用作预取行数),大结果集可减少网络往返.
 
         Returns:
             list[tuple]: 游标 `fetchall` 的结果.
@@ -216,12 +218,29 @@ class OracleConnection(DatabaseConnection):
         conn = cast(DBAPIConnection, self.connection)
         cursor = cast(DBAPICursor, conn.cursor())
         try:
+            if arraysize:
+                cursor_options = cast(Any, cursor)
+                cursor_options.arraysize = arraysize
+                cursor_options.prefetchrows = arraysize
             cursor.execute(query, params or ())
             return cast(QueryResult, cursor.fetchall())
         finally:
             if hasattr(cursor, "close"):
                 cursor.close()
 
+    def create_string_collection(self, values: Sequence[str]) -> object:
+        """构建 SYS.ODCIVARCHAR2LIST 集合绑定变量, 供 ``TABLE(:names)`` 一次性按名单过滤.
+
+        Raises:
+            ConnectionAdapterError: 无法建立连接时抛出.
+
+        """
+        if not self.is_connected and not self.connect():
+            msg = "无法建立数据库连接"
+            raise ConnectionAdapterError(msg)
+        conn = cast(Any, self.connection)
+        return conn.gettype("SYS.ODCIVARCHAR2LIST").newobject(list(values))
+
     def get_version(self) -> str | None:
         """获取 Oracle 版本字符串.
 
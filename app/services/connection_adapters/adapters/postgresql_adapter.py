@@ -48,14 +48,14 @@ class PostgreSQLConnection(DatabaseConnection):
             bool: 连接成功返回 True,否则 False.
 
         """
-        password = self.instance.credential.get_plain_password() if self.instance.credential else ""
+        username, password = self._resolve_credentials()
 
         try:
             self.connection = psycopg.connect(
                 host=self.instance.host,
                 port=self.instance.port,
                 dbname=self.instance.database_name or get_default_schema("postgresql") or "postgres",
-                user=(self.instance.credential.username if self.instance.credential else ""),
+                user=username,
                 password=password,
                 connect_timeout=20,
                 options="-c statement_timeout=300000",
@@ -63,8 +63,7 @@ class SQLServerConnection(DatabaseConnection):
             bool: 连接成功返回 True,失败返回 False.
 
         """
-        password = self.instance.credential.get_plain_password() if self.instance.credential else ""
-        username = self.instance.credential.username if self.instance.credential else ""
+        username, password = self._resolve_credentials()
         database_name = self.instance.database_name or get_default_schema("sqlserver") or "master"
 
         try:
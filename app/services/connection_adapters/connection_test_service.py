@@ -52,6 +52,19 @@ class TempConnectionTestInstance:
     main_version: str | None = None
     detailed_version: str | None = None
 
+    @classmethod
+    def from_instance(cls, instance: Instance) -> TempConnectionTestInstance:
+        """复制实例的连接字段, 供工作线程并发测试时使用(不跨线程访问 ORM 对象)."""
+        return cls(
+            id=instance.id,
+            name=instance.name,
+            db_type=instance.db_type,
+            host=instance.host,
+            port=instance.port,
+            database_name=instance.database_name,
+            credential=instance.credential,
+        )
+
 
 class ConnectionTestService:
     """数据库连接测试服务.
@@ -0,0 +1,256 @@
+"""数据库节点并发探测.
+
+职责:
+- 以有界线程池并发执行各节点的探测(连接 + 查询), 按输入顺序返回结果或按完成顺序逐个产出
+- 单个节点从开始执行起超过超时时间即记为 TimeoutError, 不再等待其结果; 可选整体截止时间
+- 线程池随探测器长期复用, 超时节点的线程不会逐轮累积; 上一轮仍未结束的节点本轮直接跳过
+- 探测函数只做网络 I/O, 不访问 ORM session; 结果写库由调用方在当前线程完成
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections.abc import Callable, Hashable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, TypeVar, cast
+
+from flask import Flask, current_app, has_app_context
+
+from app.settings import (
+    DEFAULT_CLUSTER_STATUS_MAX_CONCURRENCY,
+    DEFAULT_CLUSTER_STATUS_NODE_TIMEOUT_SECONDS,
+    DEFAULT_CONNECTION_BATCH_TEST_MAX_CONCURRENCY,
+    DEFAULT_CONNECTION_BATCH_TEST_NODE_TIMEOUT_SECONDS,
+)
+
+_K = TypeVar("_K")
+_T = TypeVar("_T")
+
+# 等待节点完成时的轮询间隔上下限, 单位秒; 排队节点开始执行后也能及时判定超时
+_MIN_WAIT_SECONDS = 0.05
+_MAX_WAIT_SECONDS = 1.0
+
+# 按配置复用的探测器, 同一进程内的周期任务共享同一个线程池
+_SHARED_POLLERS: dict[tuple[str, int, float], ConcurrentNodePoller] = {}
+_SHARED_POLLERS_LOCK = threading.Lock()
+
+
+class ConcurrentNodePoller:
+    """有界线程池 + 单节点超时的并发探测器."""
+
+    def __init__(self, *, max_concurrency: int, node_timeout_seconds: float) -> None:
+        """初始化探测器(max_concurrency 为线程池上限, node_timeout_seconds 为单节点超时)."""
+        self._max_concurrency = max(int(max_concurrency), 1)
+        self._node_timeout_seconds = max(float(node_timeout_seconds), 0.001)
+        self._executor: ThreadPoolExecutor | None = None
+        self._in_flight: set[Hashable] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def max_concurrency(self) -> int:
+        """线程池上限."""
+        return self._max_concurrency
+
+    @classmethod
+    def for_cluster_status(cls) -> ConcurrentNodePoller:
+        """按群集状态检测配置获取共享探测器."""
+        if has_app_context():
+            config = current_app.config
+            return cls._shared(
+                "cluster_status",
+                max_concurrency=int(
+                    config.get("CLUSTER_STATUS_MAX_CONCURRENCY", DEFAULT_CLUSTER_STATUS_MAX_CONCURRENCY),
+                ),
+                node_timeout_seconds=float(
+                    config.get("CLUSTER_STATUS_NODE_TIMEOUT_SECONDS", DEFAULT_CLUSTER_STATUS_NODE_TIMEOUT_SECONDS),
+                ),
+            )
+        return cls._shared(
+            "cluster_status",
+            max_concurrency=DEFAULT_CLUSTER_STATUS_MAX_CONCURRENCY,
+            node_timeout_seconds=DEFAULT_CLUSTER_STATUS_NODE_TIMEOUT_SECONDS,
+        )
+
+    @classmethod
+    def for_connection_batch_test(cls) -> ConcurrentNodePoller:
+        """按批量连接测试配置获取共享探测器."""
+        if has_app_context():
+            config = current_app.config
+            return cls._shared(
+                "connection_batch_test",
+                max_concurrency=int(
+                    config.get("CONNECTION_BATCH_TEST_MAX_CONCURRENCY", DEFAULT_CONNECTION_BATCH_TEST_MAX_CONCURRENCY),
+                ),
+                node_timeout_seconds=float(
+                    config.get(
+                        "CONNECTION_BATCH_TEST_NODE_TIMEOUT_SECONDS",
+                        DEFAULT_CONNECTION_BATCH_TEST_NODE_TIMEOUT_SECONDS,
+                    ),
+                ),
+            )
+        return cls._shared(
+            "connection_batch_test",
+            max_concurrency=DEFAULT_CONNECTION_BATCH_TEST_MAX_CONCURRENCY,
+            node_timeout_seconds=DEFAULT_CONNECTION_BATCH_TEST_NODE_TIMEOUT_SECONDS,
+        )
+
+    @classmethod
+    def _shared(cls, name: str, *, max_concurrency: int, node_timeout_seconds: float) -> ConcurrentNodePoller:
+        cache_key = (name, max(int(max_concurrency), 1), max(float(node_timeout_seconds), 0.001))
+        with _SHARED_POLLERS_LOCK:
+            poller = _SHARED_POLLERS.get(cache_key)
+            if poller is None:
+                poller = cls(max_concurrency=max_concurrency, node_timeout_seconds=node_timeout_seconds)
+                _SHARED_POLLERS[cache_key] = poller
+            return poller
+
+    def poll(
+        self,
+        probe: Callable[[_K], _T],
+        keys: Sequence[_K],
+        *,
+        node_id: Callable[[_K], Hashable] | None = None,
+    ) -> list[_T | Exception]:
+        """并发执行探测, 按输入顺序返回结果或异常(超时为 TimeoutError)."""
+        results: list[_T | Exception | None] = [None] * len(keys)
+        for index, outcome in self.iter_poll(probe, keys, node_id=node_id):
+            results[index] = outcome
+        return cast(list[_T | Exception], results)
+
+    def iter_poll(
+        self,
+        probe: Callable[[_K], _T],
+        keys: Sequence[_K],
+        *,
+        deadline_seconds: float | None = None,
+        node_id: Callable[[_K], Hashable] | None = None,
+    ) -> Iterator[tuple[int, _T | Exception]]:
+        """并发执行探测, 按完成顺序逐个产出 (输入下标, 结果或异常).
+
+        deadline_seconds 为整体截止时间: 到期后仍未完成(含尚未开始)的节点统一记为 TimeoutError.
+        node_id 用于识别节点: 上一轮探测仍在执行的节点本轮不再提交, 直接记为 TimeoutError.
+        """
+        if not keys:
+            return
+        base_app = cast(Flask, cast(Any, current_app)._get_current_object()) if has_app_context() else None
+        started_at: dict[int, float] = {}
+        submitted_at = time.monotonic()
+        deadline_at = submitted_at + max(float(deadline_seconds), 0.001) if deadline_seconds is not None else None
+        # 所有节点都跑满单节点超时所需的时间; 超过仍未开始说明线程池被未结束的探测占满
+        queue_timeout_seconds = self._node_timeout_seconds * math.ceil(len(keys) / self._max_concurrency)
+
+        def _run(index: int, key: _K) -> _T:
+            started_at[index] = time.monotonic()
+            if base_app is None:
+                return probe(key)
+            with base_app.app_context():
+                return probe(key)
+
+        futures, skipped = self._submit(_run, keys, node_id)
+        try:
+            for index in skipped:
+                yield index, TimeoutError("上一轮节点检测仍未结束, 本轮跳过")
+            pending = set(futures)
+            while pending:
+                wait_seconds = self._next_wait_seconds(pending, futures, started_at)
+                if deadline_at is not None:
+                    wait_seconds = min(wait_seconds, max(deadline_at - time.monotonic(), 0.0))
+                done, pending = wait(pending, timeout=wait_seconds, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield futures[future], self._outcome(future)
+                now = time.monotonic()
+                if deadline_at is not None and now >= deadline_at:
+                    for future in sorted(pending, key=futures.__getitem__):
+                        future.cancel()
+                        yield futures[future], TimeoutError(f"超过整体截止时间({deadline_seconds:g}s)")
+                    pending = set()
+                    break
+                queue_expired = now - submitted_at >= queue_timeout_seconds
+                for future, error in self._expired(pending, futures, started_at, queue_expired=queue_expired):
+                    pending.discard(future)
+                    yield futures[future], error
+        finally:
+            # 超时节点的线程在底层驱动超时后自行归还线程池, 这里只取消尚未开始的节点
+            for future in futures:
+                future.cancel()
+
+    def _submit(
+        self,
+        run: Callable[[int, _K], _T],
+        keys: Sequence[_K],
+        node_id: Callable[[_K], Hashable] | None,
+    ) -> tuple[dict[Future[_T], int], list[int]]:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_concurrency,
+                    thread_name_prefix="node-poller",
+                )
+            executor = self._executor
+        futures: dict[Future[_T], int] = {}
+        skipped: list[int] = []
+        for index, key in enumerate(keys):
+            identity = node_id(key) if node_id is not None else None
+            if identity is not None and not self._claim(identity):
+                skipped.append(index)
+                continue
+            future = executor.submit(run, index, key)
+            if identity is not None:
+                # 节点线程真正结束(或排队中被取消)后才允许下一轮再次提交
+                future.add_done_callback(lambda _future, identity=identity: self._release(identity))
+            futures[future] = index
+        return futures, skipped
+
+    def _expired(
+        self,
+        pending: set[Future[_T]],
+        futures: dict[Future[_T], int],
+        started_at: dict[int, float],
+        *,
+        queue_expired: bool,
+    ) -> list[tuple[Future[_T], Exception]]:
+        now = time.monotonic()
+        expired: list[tuple[Future[_T], Exception]] = []
+        for future in sorted(pending, key=futures.__getitem__):
+            node_started_at = started_at.get(futures[future])
+            if node_started_at is not None and now - node_started_at >= self._node_timeout_seconds:
+                expired.append((future, TimeoutError(f"节点检测超时({self._node_timeout_seconds:g}s)")))
+            elif node_started_at is None and queue_expired and future.cancel():
+                expired.append((future, TimeoutError("节点排队超时, 线程池被未结束的探测占满")))
+        return expired
+
+    def _claim(self, identity: Hashable) -> bool:
+        with self._lock:
+            if identity in self._in_flight:
+                return False
+            self._in_flight.add(identity)
+            return True
+
+    def _release(self, identity: Hashable) -> None:
+        with self._lock:
+            self._in_flight.discard(identity)
+
+    def _next_wait_seconds(
+        self,
+        pending: set[Future[_T]],
+        futures: dict[Future[_T], int],
+        started_at: dict[int, float],
+    ) -> float:
+        now = time.monotonic()
+        remaining = [
+            self._node_timeout_seconds - (now - started_at[futures[future]])
+            for future in pending
+            if futures[future] in started_at
+        ]
+        if not remaining:
+            return _MAX_WAIT_SECONDS
+        return min(max(min(remaining), _MIN_WAIT_SECONDS), _MAX_WAIT_SECONDS)
+
+    @staticmethod
+    def _outcome(future: Future[_T]) -> _T | Exception:
+        try:
+            return future.result()
+        except Exception as exc:
+            return exc
@@ -0,0 +1,188 @@
+"""非阻塞 TCP 可达性探测.
+
+职责:
+- 单线程基于 selectors 同时维持大量在途的非阻塞 connect, 一个探测周期即可覆盖数千个端点
+- 在途连接数受 max_in_flight 限制(避免耗尽文件描述符), 单个端点超过超时时间记为失败
+- 只做 TCP 三次握手, 不发送任何协议数据; 协议级探测由调用方按需另行执行
+"""
+
+from __future__ import annotations
+
+import errno
+import os
+import selectors
+import socket
+import time
+from collections import deque
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass
+
+# connect_ex 返回这些错误码表示握手仍在进行, 需等待套接字可写
+_IN_PROGRESS_ERRNOS = frozenset(
+    code
+    for code in (
+        errno.EINPROGRESS,
+        errno.EWOULDBLOCK,
+        errno.EALREADY,
+        getattr(errno, "WSAEWOULDBLOCK", None),
+    )
+    if code is not None
+)
+
+
+@dataclass(frozen=True, slots=True)
+class TcpProbeTarget:
+    """探测目标, key 由调用方定义(通常为实例 ID)."""
+
+    key: Hashable
+    host: str
+    port: int
+
+
+@dataclass(frozen=True, slots=True)
+class TcpProbeResult:
+    """单个端点的探测结果."""
+
+    key: Hashable
+    reachable: bool
+    latency_ms: float | None = None
+    error: str | None = None
+
+
+@dataclass(slots=True)
+class _InFlight:
+    target: TcpProbeTarget
+    sock: socket.socket
+    started_at: float
+    deadline_at: float
+
+
+class NonBlockingTcpProber:
+    """单线程非阻塞 TCP 探测器."""
+
+    def __init__(self, *, timeout_seconds: float, max_in_flight: int) -> None:
+        """初始化探测器(timeout_seconds 为单端点超时, max_in_flight 为同时在途连接上限)."""
+        self._timeout_seconds = max(float(timeout_seconds), 0.001)
+        self._max_in_flight = max(int(max_in_flight), 1)
+
+    def probe(self, targets: Iterable[TcpProbeTarget]) -> dict[Hashable, TcpProbeResult]:
+        """探测全部目标, 返回 key -> 结果."""
+        queue = deque(targets)
+        results: dict[Hashable, TcpProbeResult] = {}
+        # 同一周期内多个实例常共用主机名, 解析结果按 (host, port) 缓存
+        address_cache: dict[tuple[str, int], tuple[int, tuple] | OSError] = {}
+        # 所有目标超时相同且按入队顺序发起, 字典插入顺序即截止时间顺序
+        in_flight: dict[int, _InFlight] = {}
+        selector = selectors.DefaultSelector()
+        try:
+            while queue or in_flight:
+                while queue and len(in_flight) < self._max_in_flight:
+                    target = queue.popleft()
+                    pending = self._start(target, address_cache, results)
+                    if pending is not None:
+                        in_flight[pending.sock.fileno()] = pending
+                        selector.register(pending.sock, selectors.EVENT_WRITE)
+                if not in_flight:
+                    continue
+
+                first = next(iter(in_flight.values()))
+                wait_seconds = max(first.deadline_at - time.monotonic(), 0.0)
+                for key, _ in selector.select(timeout=wait_seconds):
+                    pending = in_flight.pop(key.fd)
+                    selector.unregister(pending.sock)
+                    results[pending.target.key] = self._finish(pending)
+
+                now = time.monotonic()
+                for fd in list(in_flight):
+                    pending = in_flight[fd]
+                    if pending.deadline_at > now:
+                        break
+                    del in_flight[fd]
+                    selector.unregister(pending.sock)
+                    pending.sock.close()
+                    results[pending.target.key] = TcpProbeResult(
+                        key=pending.target.key,
+                        reachable=False,
+                        error=f"连接超时({self._timeout_seconds:g}s)",
+                    )
+        finally:
+            for pending in in_flight.values():
+                pending.sock.close()
+            selector.close()
+        return results
+
+    def _start(
+        self,
+        target: TcpProbeTarget,
+        address_cache: dict[tuple[str, int], tuple[int, tuple] | OSError],
+        results: dict[Hashable, TcpProbeResult],
+    ) -> _InFlight | None:
+        """发起非阻塞连接; 立即得出结果时写入 results 并返回 None."""
+        address = self._resolve(target, address_cache)
+        if isinstance(address, OSError):
+            results[target.key] = TcpProbeResult(key=target.key, reachable=False, error=f"地址解析失败: {address}")
+            return None
+
+        family, sockaddr = address
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.setblocking(False)
+        started_at = time.monotonic()
+        try:
+            code = sock.connect_ex(sockaddr)
+        except OSError as exc:
+            sock.close()
+            results[target.key] = TcpProbeResult(key=target.key, reachable=False, error=str(exc))
+            return None
+
+        if code == 0:
+            sock.close()
+            results[target.key] = TcpProbeResult(
+                key=target.key,
+                reachable=True,
+                latency_ms=round((time.monotonic() - started_at) * 1000, 3),
+            )
+            return None
+        if code not in _IN_PROGRESS_ERRNOS:
+            sock.close()
+            results[target.key] = TcpProbeResult(key=target.key, reachable=False, error=os.strerror(code))
+            return None
+        return _InFlight(
+            target=target,
+            sock=sock,
+            started_at=started_at,
+            deadline_at=started_at + self._timeout_seconds,
+        )
+
+    @staticmethod
+    def _finish(pending: _InFlight) -> TcpProbeResult:
+        """套接字可写后读取 SO_ERROR 判定握手结果."""
+        latency_ms = round((time.monotonic() - pending.started_at) * 1000, 3)
+        try:
+            code = pending.sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+        finally:
+            pending.sock.close()
+        if code == 0:
+            return TcpProbeResult(key=pending.target.key, reachable=True, latency_ms=latency_ms)
+        return TcpProbeResult(key=pending.target.key, reachable=False, error=os.strerror(code))
+
+    @staticmethod
+    def _resolve(
+        target: TcpProbeTarget,
+        address_cache: dict[tuple[str, int], tuple[int, tuple] | OSError],
+    ) -> tuple[int, tuple] | OSError:
+        cache_key = (target.host, int(target.port))
+        cached = address_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        try:
+            infos = socket.getaddrinfo(target.host, int(target.port), type=socket.SOCK_STREAM)
+        except OSError as exc:
+            resolved: tuple[int, tuple] | OSError = exc
+        else:
+            if infos:
+                family, _, _, _, sockaddr = infos[0]
+                resolved = (family, sockaddr)
+            else:
+                resolved = OSError(f"无可用地址: {target.host}")
+        address_cache[cache_key] = resolved
+        return resolved
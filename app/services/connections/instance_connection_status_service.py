@@ -13,22 +13,31 @@ from app.core.exceptions import NotFoundError
 from app.core.types import JsonDict
 from app.models.instance import Instance
 from app.repositories.instances_repository import InstancesRepository
+from app.services.connections.instance_reachability_service import InstanceReachabilityService
 from app.utils.time_utils import time_utils
 
 
 class InstanceConnectionStatusService:
     """实例连接状态读取服务."""
 
-    def __init__(self, repository: InstancesRepository | None = None) -> None:
-        """初始化服务并注入实例仓库."""
+    def __init__(
+        self,
+        repository: InstancesRepository | None = None,
+        reachability_service: InstanceReachabilityService | None = None,
+    ) -> None:
+        """初始化服务并注入实例仓库与可达性服务."""
         self._repository = repository or InstancesRepository()
+        self._reachability_service = reachability_service or InstanceReachabilityService()
 
     def get_status(self, instance_id: int) -> JsonDict:
         """获取实例连接状态."""
         instance = self._repository.get_instance(instance_id)
         if not instance:
             raise NotFoundError("实例不存在")
-        return self._build_connection_status_payload(instance)
+        payload = self._build_connection_status_payload(instance)
+        # last_connected 仅反映最近一次同步/测试, reachability 为后台探测的实时状态
+        payload["reachability"] = self._reachability_service.get_state_payload(int(instance.id))
+        return payload
 
     @staticmethod
     def _build_connection_status_payload(instance: Instance) -> JsonDict:
@@ -0,0 +1,251 @@
+"""实例可达性监控 Service.
+
+职责:
+- 周期性对全部启用实例做非阻塞 TCP 探测(可选协议级连接探测), 批量写入滚动延迟与可用率
+- 为连接状态、风险中心、仪表盘与同步任务提供"是否已知不可达"的判定
+- 不 commit, 由调用方(定时任务)负责事务边界
+"""
+
+from __future__ import annotations
+
+from contextlib import suppress
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, cast
+
+from flask import current_app, has_app_context
+from sqlalchemy.exc import SQLAlchemyError
+
+from app import db
+from app.core.types import JsonDict
+from app.models.instance import Instance
+from app.models.instance_reachability import InstanceReachability
+from app.repositories.instance_reachability_repository import InstanceReachabilityRepository
+from app.repositories.instances_repository import InstancesRepository
+from app.services.connection_adapters.connection_factory import ConnectionFactory
+from app.services.connection_adapters.connection_test_service import (
+    CONNECTION_TEST_EXCEPTIONS,
+    TempConnectionTestInstance,
+)
+from app.services.connection_adapters.node_poller import ConcurrentNodePoller
+from app.services.connection_adapters.tcp_prober import NonBlockingTcpProber, TcpProbeResult, TcpProbeTarget
+from app.settings import (
+    DEFAULT_REACHABILITY_DOWN_THRESHOLD,
+    DEFAULT_REACHABILITY_MAX_IN_FLIGHT,
+    DEFAULT_REACHABILITY_PROTOCOL_PING_ENABLED,
+    DEFAULT_REACHABILITY_SKIP_SYNC_ENABLED,
+    DEFAULT_REACHABILITY_STALE_SECONDS,
+    DEFAULT_REACHABILITY_TCP_TIMEOUT_SECONDS,
+    DEFAULT_REACHABILITY_WINDOW_SIZE,
+)
+from app.utils.structlog_config import log_fallback
+from app.utils.time_utils import time_utils
+
+REACHABILITY_UP = "up"
+REACHABILITY_DOWN = "down"
+REACHABILITY_UNKNOWN = "unknown"
+_ERROR_MAX_LENGTH = 255
+
+
+@dataclass(frozen=True, slots=True)
+class ReachabilityOptions:
+    """可达性监控配置."""
+
+    tcp_timeout_seconds: float = DEFAULT_REACHABILITY_TCP_TIMEOUT_SECONDS
+    max_in_flight: int = DEFAULT_REACHABILITY_MAX_IN_FLIGHT
+    window_size: int = DEFAULT_REACHABILITY_WINDOW_SIZE
+    down_threshold: int = DEFAULT_REACHABILITY_DOWN_THRESHOLD
+    stale_seconds: int = DEFAULT_REACHABILITY_STALE_SECONDS
+    skip_sync_enabled: bool = DEFAULT_REACHABILITY_SKIP_SYNC_ENABLED
+    protocol_ping_enabled: bool = DEFAULT_REACHABILITY_PROTOCOL_PING_ENABLED
+
+    @classmethod
+    def from_config(cls) -> ReachabilityOptions:
+        """从应用配置读取(无应用上下文时使用默认值)."""
+        if not has_app_context():
+            return cls()
+        config = current_app.config
+        return cls(
+            tcp_timeout_seconds=float(
+                config.get("REACHABILITY_TCP_TIMEOUT_SECONDS", DEFAULT_REACHABILITY_TCP_TIMEOUT_SECONDS),
+            ),
+            max_in_flight=int(config.get("REACHABILITY_MAX_IN_FLIGHT", DEFAULT_REACHABILITY_MAX_IN_FLIGHT)),
+            window_size=int(config.get("REACHABILITY_WINDOW_SIZE", DEFAULT_REACHABILITY_WINDOW_SIZE)),
+            down_threshold=int(config.get("REACHABILITY_DOWN_THRESHOLD", DEFAULT_REACHABILITY_DOWN_THRESHOLD)),
+            stale_seconds=int(config.get("REACHABILITY_STALE_SECONDS", DEFAULT_REACHABILITY_STALE_SECONDS)),
+            skip_sync_enabled=bool(
+                config.get("REACHABILITY_SKIP_SYNC_ENABLED", DEFAULT_REACHABILITY_SKIP_SYNC_ENABLED),
+            ),
+            protocol_ping_enabled=bool(
+                config.get("REACHABILITY_PROTOCOL_PING_ENABLED", DEFAULT_REACHABILITY_PROTOCOL_PING_ENABLED),
+            ),
+        )
+
+
+class InstanceReachabilityService:
+    """实例可达性监控服务."""
+
+    def __init__(
+        self,
+        repository: InstanceReachabilityRepository | None = None,
+        *,
+        options: ReachabilityOptions | None = None,
+        prober: NonBlockingTcpProber | None = None,
+    ) -> None:
+        """初始化服务并注入仓库、配置与探测器."""
+        self._repository = repository or InstanceReachabilityRepository()
+        self._options = options or ReachabilityOptions.from_config()
+        self._prober = prober or NonBlockingTcpProber(
+            timeout_seconds=self._options.tcp_timeout_seconds,
+            max_in_flight=self._options.max_in_flight,
+        )
+
+    def run_probe_cycle(self) -> dict[str, int]:
+        """执行一轮探测并批量写入状态(不 commit), 返回本轮汇总."""
+        targets = self._repository.list_probe_targets()
+        summary = {"total": len(targets), REACHABILITY_UP: 0, REACHABILITY_DOWN: 0, "failed_probes": 0}
+        if not targets:
+            return summary
+
+        results = self._prober.probe(
+            TcpProbeTarget(key=instance_id, host=host, port=port) for instance_id, host, port in targets
+        )
+        if self._options.protocol_ping_enabled:
+            results = self._apply_protocol_ping(results)
+
+        now = time_utils.now()
+        states = self._repository.map_states([instance_id for instance_id, _, _ in targets])
+        new_rows: list[dict[str, object]] = []
+        changed_rows: list[dict[str, object]] = []
+        for instance_id, _, _ in targets:
+            result = results.get(instance_id) or TcpProbeResult(key=instance_id, reachable=False, error="未完成探测")
+            previous = states.get(instance_id)
+            row = self._next_state(previous, result, now)
+            if previous is None:
+                new_rows.append({"instance_id": instance_id, "created_at": now, **row})
+            else:
+                changed_rows.append({"id": previous.id, **row})
+            if not result.reachable:
+                summary["failed_probes"] += 1
+            if row["status"] in (REACHABILITY_UP, REACHABILITY_DOWN):
+                summary[cast(str, row["status"])] += 1
+
+        self._repository.insert_missing(new_rows)
+        self._repository.update_rows(changed_rows)
+        return summary
+
+    def _next_state(
+        self,
+        previous: InstanceReachability | None,
+        result: TcpProbeResult,
+        now: datetime,
+    ) -> dict[str, object]:
+        """合并本次探测结果与历史窗口, 计算新的状态行."""
+        samples = list(previous.recent_samples or []) if previous is not None else []
+        samples.append([round(now.timestamp(), 3), result.latency_ms if result.reachable else None])
+        samples = samples[-max(self._options.window_size, 1) :]
+        latencies = [float(sample[1]) for sample in samples if sample[1] is not None]
+
+        previous_failures = int(previous.consecutive_failures or 0) if previous is not None else 0
+        consecutive_failures = 0 if result.reachable else previous_failures + 1
+        if result.reachable:
+            status = REACHABILITY_UP
+        elif consecutive_failures >= self._options.down_threshold:
+            status = REACHABILITY_DOWN
+        else:
+            # 未达到连续失败阈值前保持原状态, 避免单次抖动误判
+            status = previous.status if previous is not None else REACHABILITY_UNKNOWN
+
+        return {
+            "status": status,
+            "last_checked_at": now,
+            "last_up_at": now if result.reachable else (previous.last_up_at if previous is not None else None),
+            "last_down_at": (previous.last_down_at if previous is not None else None) if result.reachable else now,
+            "last_latency_ms": result.latency_ms if result.reachable else None,
+            "last_error": (result.error or "")[:_ERROR_MAX_LENGTH] or None,
+            "consecutive_failures": consecutive_failures,
+            "recent_samples": samples,
+            "availability_ratio": round(len(latencies) / len(samples), 4),
+            "avg_latency_ms": round(sum(latencies) / len(latencies), 3) if latencies else None,
+            "updated_at": now,
+        }
+
+    def _apply_protocol_ping(self, results: dict[Any, TcpProbeResult]) -> dict[Any, TcpProbeResult]:
+        """对 TCP 可达的实例再做一次协议级连接, 连接失败视为不可达."""
+        reachable_ids = [int(key) for key, result in results.items() if result.reachable]
+        if not reachable_ids:
+            return results
+        instances = [
+            TempConnectionTestInstance.from_instance(instance)
+            for instance in InstancesRepository.list_instances_by_ids(reachable_ids)
+        ]
+        outcomes = ConcurrentNodePoller.for_connection_batch_test().poll(self._protocol_ping, instances)
+        merged = dict(results)
+        for instance, outcome in zip(instances, outcomes, strict=True):
+            if outcome is True:
+                continue
+            error = str(outcome) if isinstance(outcome, Exception) else "协议级连接失败"
+            merged[instance.id] = TcpProbeResult(key=instance.id, reachable=False, error=f"协议探测失败: {error}")
+        return merged
+
+    @staticmethod
+    def _protocol_ping(instance: TempConnectionTestInstance) -> bool:
+        connection = ConnectionFactory.create_connection(cast(Instance, instance))
+        if connection is None:
+            return False
+        try:
+            return bool(connection.connect())
+        finally:
+            with suppress(*CONNECTION_TEST_EXCEPTIONS):
+                connection.disconnect()
+
+    def get_state(self, instance_id: int) -> InstanceReachability | None:
+        """读取实例可达性状态; 无应用上下文或读取失败(如表尚未迁移)时返回 None."""
+        if not has_app_context():
+            return None
+        try:
+            with db.session.begin_nested():
+                return self._repository.get_state(instance_id)
+        except SQLAlchemyError as exc:
+            log_fallback(
+                "warning",
+                "读取实例可达性状态失败,按未知处理",
+                module="instance_reachability",
+                action="get_state",
+                fallback_reason="reachability_state_unavailable",
+                instance_id=instance_id,
+                exception=exc,
+            )
+            return None
+
+    def known_down_reason(self, instance_id: int) -> str | None:
+        """实例已被探测判定不可达且状态未过期时返回原因, 否则返回 None."""
+        if not self._options.skip_sync_enabled:
+            return None
+        state = self.get_state(instance_id)
+        if state is None or state.status != REACHABILITY_DOWN or state.last_checked_at is None:
+            return None
+        checked_at = state.last_checked_at
+        if checked_at.tzinfo is None:
+            checked_at = checked_at.replace(tzinfo=time_utils.now().tzinfo)
+        if time_utils.now() - checked_at > timedelta(seconds=self._options.stale_seconds):
+            return None
+        reason = f"实例不可达(连续 {int(state.consecutive_failures or 0)} 次探测失败), 已跳过同步"
+        if state.last_error:
+            reason = f"{reason}: {state.last_error}"
+        return reason
+
+    def get_state_payload(self, instance_id: int) -> JsonDict:
+        """输出连接状态接口使用的可达性字段."""
+        state = self.get_state(instance_id)
+        if state is None:
+            return {"status": REACHABILITY_UNKNOWN, "last_checked_at": None}
+        return {
+            "status": state.status,
+            "last_checked_at": state.last_checked_at.isoformat() if state.last_checked_at else None,
+            "last_latency_ms": state.last_latency_ms,
+            "avg_latency_ms": state.avg_latency_ms,
+            "availability_ratio": state.availability_ratio,
+            "consecutive_failures": int(state.consecutive_failures or 0),
+            "last_error": state.last_error,
+        }
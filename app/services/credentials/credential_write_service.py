@@ -19,6 +19,7 @@ from app.models.credential import Credential, CredentialCreateParams
 from app.repositories.credentials_repository import CredentialsRepository
 from app.schemas.credentials import CredentialCreatePayload, CredentialUpdatePayload
 from app.schemas.validation import validate_or_raise
+from app.utils.credential_secret_cache import credential_secret_cache
 from app.utils.request_payload import parse_payload
 from app.utils.structlog_config import log_info
 
@@ -96,6 +97,8 @@ class CredentialWriteService:
         except SQLAlchemyError as exc:
             raise DatabaseError(self._normalize_db_error("更新凭据", exc), extra={"exception": str(exc)}) from exc
 
+        # 用户名/密码/启用状态可能变化, 立即失效本进程的明文缓存
+        credential_secret_cache.invalidate(credential.id)
         self._log_update(credential, operator_id=operator_id)
         return credential
 
@@ -114,6 +117,7 @@ class CredentialWriteService:
         except SQLAlchemyError as exc:
             raise DatabaseError(self._normalize_db_error("删除凭据", exc), extra={"exception": str(exc)}) from exc
 
+        credential_secret_cache.invalidate(outcome.credential_id)
         self._log_delete(outcome, operator_id=operator_id)
         return outcome
 
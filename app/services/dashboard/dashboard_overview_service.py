@@ -17,6 +17,7 @@ from app.core.types.capacity_instances import InstanceAggregationsSummaryFilters
 from app.repositories.account_statistics_repository import AccountStatisticsRepository
 from app.repositories.capacity_instances_repository import CapacityInstancesRepository
 from app.repositories.database_statistics_repository import DatabaseStatisticsRepository
+from app.repositories.instance_reachability_repository import InstanceReachabilityRepository
 from app.repositories.instance_statistics_repository import InstanceStatisticsRepository
 from app.repositories.users_repository import UsersRepository
 from app.services.health.health_checks_service import check_cache_health, check_database_health, get_system_uptime
@@ -47,6 +48,16 @@ def get_system_overview() -> dict:
             )
     except SQLAlchemyError as exc:
         log_warning("获取容量统计汇总失败,已使用兜底值", module="dashboard", exception=exc)
+    reachability_summary: dict[str, Any] = {"up": 0, "down": 0, "unknown": 0, "availability_percent": None}
+    try:
+        with db.session.begin_nested():
+            reachability_counts = InstanceReachabilityRepository.count_by_status()
+            average_availability = InstanceReachabilityRepository.average_availability()
+        reachability_summary.update({key: reachability_counts.get(key, 0) for key in ("up", "down", "unknown")})
+        if average_availability is not None:
+            reachability_summary["availability_percent"] = round(average_availability * 100, 2)
+    except SQLAlchemyError as exc:
+        log_warning("获取实例可达性汇总失败,已使用兜底值", module="dashboard", exception=exc)
     total_capacity_gb = float(total_size_mb) / 1024
     capacity_summary = {
         "total_gb": round(total_capacity_gb, 1),
@@ -128,6 +139,7 @@ def get_system_overview() -> dict:
         },
         "classified_accounts": classification_overview,
         "capacity": capacity_summary,
+        "reachability": reachability_summary,
         "databases": {
             "total": database_summary["total_databases"],
             "active": database_summary["active_databases"],
@@ -7,17 +7,17 @@
 
 from __future__ import annotations
 
-import csv
-import io
-from collections.abc import Sequence
+from collections.abc import Callable, Iterable, Iterator, Sequence
 
 from app.core.constants import DatabaseType
 from app.core.types.accounts_ledgers import AccountFilters, AccountLedgerMetrics
 from app.repositories.ledgers.accounts_ledger_repository import AccountsLedgerRepository
-from app.services.files.csv_export_result import CsvExportResult
+from app.services.files.csv_export_result import CsvStreamResult, iter_csv_lines
 from app.utils.spreadsheet_formula_safety import sanitize_csv_row
 from app.utils.time_utils import time_utils
 
+ACCOUNT_EXPORT_HEADERS = ["名称", "实例名称", "IP地址", "标签", "数据库类型", "分类", "锁定状态", "AD状态"]
+
 
 class AccountExportService:
     """账户导出读取服务."""
@@ -26,67 +26,71 @@ class AccountExportService:
         """初始化服务并注入台账仓库."""
         self._repository = repository or AccountsLedgerRepository()
 
-    def export_accounts_csv(self, filters: AccountFilters) -> CsvExportResult:
-        """导出账户列表为 CSV."""
-        accounts, metrics = self._repository.list_all_accounts(filters, sort_field="username", sort_order="asc")
-        csv_content = self._render_accounts_csv(accounts, metrics)
+    def count_accounts(self, filters: AccountFilters) -> int:
+        """统计导出行数(用于后台导出进度)."""
+        return self._repository.count_accounts(filters)
+
+    def export_accounts_csv(
+        self,
+        filters: AccountFilters,
+        *,
+        on_progress: Callable[[int], None] | None = None,
+    ) -> CsvStreamResult:
+        """导出账户列表为 CSV(分块读取、流式输出)."""
+        chunks = self._repository.iter_account_chunks(filters, sort_field="username", sort_order="asc")
         timestamp = time_utils.format_china_time(time_utils.now(), "%Y%m%d_%H%M%S")
         filename = f"accounts_export_{timestamp}.csv"
-        return CsvExportResult(filename=filename, content=csv_content)
+        csv_chunks = iter_csv_lines(ACCOUNT_EXPORT_HEADERS, self._iter_rows(chunks), on_progress=on_progress)
+        return CsvStreamResult(filename=filename, chunks=csv_chunks)
+
+    @staticmethod
+    def _iter_rows(
+        chunks: Iterable[tuple[Sequence[object], AccountLedgerMetrics]],
+    ) -> Iterator[list[object]]:
+        for accounts, metrics in chunks:
+            for account in accounts:
+                yield AccountExportService._build_row(account, metrics)
 
     @staticmethod
-    def _render_accounts_csv(accounts: Sequence[object], metrics: AccountLedgerMetrics) -> str:
-        output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerow(["名称", "实例名称", "IP地址", "标签", "数据库类型", "分类", "锁定状态", "AD状态"])
-
-        tags_map = metrics.tags_map
-        classifications_map = metrics.classifications_map
-
-        for account in accounts:
-            instance = getattr(account, "instance", None)
-            instance_db_type = getattr(instance, "db_type", None) if instance else None
-
-            account_classifications = classifications_map.get(getattr(account, "id", 0), [])
-            classification_names = [
-                label
-                for item in account_classifications
-                if (label := getattr(item, "display_name", None) or getattr(item, "code", None))
-            ]
-            classification_str = ", ".join(classification_names) if classification_names else "未分类"
-
-            username = getattr(account, "username", "")
-            instance_host = getattr(instance, "host", "%") if instance else "%"
-            if instance and instance_db_type in {DatabaseType.SQLSERVER, DatabaseType.ORACLE, DatabaseType.POSTGRESQL}:
-                username_display = username
-            else:
-                username_display = f"{username}@{instance_host}"
-
-            is_locked_flag = bool(getattr(account, "is_locked", False))
-            lock_status = "已锁定" if is_locked_flag else "正常"
-            ad_status = AccountExportService._format_ad_status(getattr(account, "instance_account", None))
-
-            tags_list = tags_map.get(getattr(account, "instance_id", 0), [])
-            tag_labels = [tag.display_name or tag.name for tag in tags_list]
-            tags_display = ", ".join([label for label in tag_labels if label]).strip(", ")
-
-            writer.writerow(
-                sanitize_csv_row(
-                    [
-                        username_display,
-                        getattr(instance, "name", "") if instance else "",
-                        instance_host if instance else "",
-                        tags_display,
-                        str(instance_db_type).upper() if instance_db_type is not None else "",
-                        classification_str,
-                        lock_status,
-                        ad_status,
-                    ],
-                ),
-            )
-
-        output.seek(0)
-        return output.getvalue()
+    def _build_row(account: object, metrics: AccountLedgerMetrics) -> list[object]:
+        instance = getattr(account, "instance", None)
+        instance_db_type = getattr(instance, "db_type", None) if instance else None
+
+        account_classifications = metrics.classifications_map.get(getattr(account, "id", 0), [])
+        classification_names = [
+            label
+            for item in account_classifications
+            if (label := getattr(item, "display_name", None) or getattr(item, "code", None))
+        ]
+        classification_str = ", ".join(classification_names) if classification_names else "未分类"
+
+        username = getattr(account, "username", "")
+        instance_host = getattr(instance, "host", "%") if instance else "%"
+        if instance and instance_db_type in {DatabaseType.SQLSERVER, DatabaseType.ORACLE, DatabaseType.POSTGRESQL}:
+            username_display = username
+        else:
+            username_display = f"{username}@{instance_host}"
+
+        is_locked_flag = bool(getattr(account, "is_locked", False))
+        lock_status = "已锁定" if is_locked_flag else "正常"
+        ad_status = AccountExportService._format_ad_status(getattr(account, "instance_account", None))
+
+        tags_list = metrics.tags_map.get(getattr(account, "instance_id", 0), [])
+        tag_labels = [tag.display_name or tag.name for tag in tags_list]
+        tags_display = ", ".join([label for label in tag_labels if label]).strip(", ")
+
+        return sanitize_csv_row(
+            [
+                username_display,
+                getattr(instance, "name", "") if instance else "",
+                instance_host if instance else "",
+                tags_display,
+                str(instance_db_type).upper() if instance_db_type is not None else "",
+                classification_str,
+                lock_status,
+                ad_status,
+            ],
+        )
 
     @staticmethod
     def _format_ad_status(instance_account: object | None) -> str:
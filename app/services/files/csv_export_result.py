@@ -5,8 +5,14 @@
 
 from __future__ import annotations
 
+import csv
+import io
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from dataclasses import dataclass
 
+CSV_MIMETYPE = "text/csv; charset=utf-8"
+CSV_STREAM_FLUSH_ROWS = 500
+
 
 @dataclass(frozen=True, slots=True)
 class CsvExportResult:
@@ -14,4 +20,51 @@ class CsvExportResult:
 
     filename: str
     content: str
-    mimetype: str = "text/csv; charset=utf-8"
+    mimetype: str = CSV_MIMETYPE
+
+
+@dataclass(frozen=True, slots=True)
+class CsvStreamResult:
+    """CSV 流式导出结果.
+
+    `chunks` 为惰性生成的 CSV 文本块, 只能消费一次; 由 API 层写入流式响应.
+    """
+
+    filename: str
+    chunks: Iterator[str]
+    mimetype: str = CSV_MIMETYPE
+
+
+def iter_csv_lines(
+    header: Sequence[object],
+    rows: Iterable[Sequence[object]],
+    *,
+    flush_rows: int = CSV_STREAM_FLUSH_ROWS,
+    on_progress: Callable[[int], None] | None = None,
+) -> Iterator[str]:
+    """将表头与数据行渲染为 CSV 文本块.
+
+    每累计 flush_rows 行产出一次, 避免逐行 yield 带来的过多小块写入;
+    表头与首批数据合并为第一块产出. on_progress 在每块产出前收到累计已渲染行数.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    pending = 0
+    written = 0
+    for row in rows:
+        writer.writerow(row)
+        pending += 1
+        written += 1
+        if pending >= flush_rows:
+            if on_progress is not None:
+                on_progress(written)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+            pending = 0
+    if on_progress is not None:
+        on_progress(written)
+    tail = buffer.getvalue()
+    if tail:
+        yield tail
@@ -7,16 +7,25 @@
 
 from __future__ import annotations
 
-import csv
-import io
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Iterator
 
 from app.core.types.ledgers import DatabaseLedgerItem
-from app.services.files.csv_export_result import CsvExportResult
+from app.services.files.csv_export_result import CsvStreamResult, iter_csv_lines
 from app.services.ledgers.database_ledger_service import DatabaseLedgerService
 from app.utils.spreadsheet_formula_safety import sanitize_csv_row
 from app.utils.time_utils import time_utils
 
+DATABASE_LEDGER_EXPORT_HEADERS = [
+    "数据库名称",
+    "实例名称",
+    "主机",
+    "数据库类型",
+    "标签",
+    "最新容量",
+    "最后采集时间",
+    "同步状态",
+]
+
 
 class DatabaseLedgerExportService:
     """数据库台账导出服务."""
@@ -30,6 +39,17 @@ class DatabaseLedgerExportService:
         """
         self._ledger_service = ledger_service or DatabaseLedgerService()
 
+    def count_rows(
+        self,
+        *,
+        search: str,
+        db_type: str,
+        instance_id: int | None,
+        tags: list[str],
+    ) -> int:
+        """统计导出行数(用于后台导出进度)."""
+        return self._ledger_service.count_all(search=search, db_type=db_type, instance_id=instance_id, tags=tags)
+
     def export_database_ledger_csv(
         self,
         *,
@@ -37,55 +57,36 @@ class DatabaseLedgerExportService:
         db_type: str,
         instance_id: int | None,
         tags: list[str],
-    ) -> CsvExportResult:
-        """导出数据库台账为 CSV."""
+        on_progress: Callable[[int], None] | None = None,
+    ) -> CsvStreamResult:
+        """导出数据库台账为 CSV(分块读取、流式输出)."""
         rows = self._ledger_service.iterate_all(
             search=search,
             db_type=db_type,
             instance_id=instance_id,
             tags=tags,
         )
-        csv_content = self._render_csv(rows)
         timestamp = time_utils.format_china_time(time_utils.now(), "%Y%m%d_%H%M%S")
         filename = f"database_ledger_{timestamp}.csv"
-        return CsvExportResult(filename=filename, content=csv_content)
+        csv_chunks = iter_csv_lines(DATABASE_LEDGER_EXPORT_HEADERS, self._iter_rows(rows), on_progress=on_progress)
+        return CsvStreamResult(filename=filename, chunks=csv_chunks)
 
     @staticmethod
-    def _render_csv(rows: Iterable[DatabaseLedgerItem]) -> str:
-        output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerow(
-            [
-                "数据库名称",
-                "实例名称",
-                "主机",
-                "数据库类型",
-                "标签",
-                "最新容量",
-                "最后采集时间",
-                "同步状态",
-            ],
-        )
-
+    def _iter_rows(rows: Iterable[DatabaseLedgerItem]) -> Iterator[list[object]]:
         for row in rows:
             instance = row.instance
             capacity = row.capacity
             status = row.sync_status
             tag_labels = ", ".join((tag.display_name or tag.name) for tag in row.tags).strip(", ")
-            writer.writerow(
-                sanitize_csv_row(
-                    [
-                        row.database_name or "-",
-                        instance.name or "-",
-                        instance.host or "-",
-                        row.db_type or "-",
-                        tag_labels or "-",
-                        capacity.label or "未采集",
-                        capacity.collected_at or "无",
-                        status.label or "未知",
-                    ],
-                ),
+            yield sanitize_csv_row(
+                [
+                    row.database_name or "-",
+                    instance.name or "-",
+                    instance.host or "-",
+                    row.db_type or "-",
+                    tag_labels or "-",
+                    capacity.label or "未采集",
+                    capacity.collected_at or "无",
+                    status.label or "未知",
+                ],
             )
-
-        output.seek(0)
-        return output.getvalue()
@@ -0,0 +1,100 @@
+"""后台导出文件存储.
+
+职责:
+- 管理 `userdata/exports` 下的导出文件路径与原子落盘(先写 .part 再 rename)
+- 按 TTL 清理过期文件
+- 不访问数据库、不返回 Response
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from app.utils.structlog_config import log_fallback
+
+DEFAULT_EXPORTS_DIR = Path("userdata") / "exports"
+_PART_SUFFIX = ".part"
+_SECONDS_PER_HOUR = 3600
+_RUN_ID_PATTERN = re.compile(r"^[0-9a-fA-F-]{1,64}$")
+
+
+@dataclass(frozen=True, slots=True)
+class ExportFileInfo:
+    """已落盘的导出文件信息."""
+
+    path: Path
+    size_bytes: int
+    modified_at: float
+
+
+class ExportFileStore:
+    """导出文件存储."""
+
+    def __init__(self, root: Path | None = None) -> None:
+        """初始化存储目录(默认 `userdata/exports`)."""
+        self._root = root or DEFAULT_EXPORTS_DIR
+
+    @property
+    def root(self) -> Path:
+        """导出文件目录."""
+        return self._root
+
+    def path_for(self, run_id: str) -> Path:
+        """返回 run 对应的导出文件路径(run_id 仅允许 uuid 字符, 防止路径穿越)."""
+        if not _RUN_ID_PATTERN.match(run_id):
+            raise ValueError("非法的 run_id")
+        return self._root / f"{run_id}.csv"
+
+    def write(self, run_id: str, chunks: Iterable[str]) -> ExportFileInfo:
+        """将 CSV 文本块写入文件; 写入完成后才对下载可见."""
+        target = self.path_for(run_id)
+        part = target.with_name(target.name + _PART_SUFFIX)
+        self._root.mkdir(parents=True, exist_ok=True)
+        try:
+            with part.open("w", encoding="utf-8", newline="") as handle:
+                for chunk in chunks:
+                    handle.write(chunk)
+            part.replace(target)
+        except BaseException:
+            part.unlink(missing_ok=True)
+            raise
+        stat = target.stat()
+        return ExportFileInfo(path=target, size_bytes=stat.st_size, modified_at=stat.st_mtime)
+
+    def stat(self, run_id: str) -> ExportFileInfo | None:
+        """读取导出文件信息, 不存在时返回 None."""
+        target = self.path_for(run_id)
+        try:
+            stat = target.stat()
+        except FileNotFoundError:
+            return None
+        return ExportFileInfo(path=target, size_bytes=stat.st_size, modified_at=stat.st_mtime)
+
+    def cleanup_expired(self, *, ttl_hours: int, now: float | None = None) -> int:
+        """删除修改时间早于 TTL 的导出文件(含中断遗留的 .part), 返回删除数量."""
+        if not self._root.is_dir():
+            return 0
+        deadline = (now if now is not None else time.time()) - ttl_hours * _SECONDS_PER_HOUR
+        removed = 0
+        for path in self._root.iterdir():
+            if not path.is_file() or path.suffix not in {".csv", _PART_SUFFIX}:
+                continue
+            try:
+                if path.stat().st_mtime < deadline:
+                    path.unlink()
+                    removed += 1
+            except OSError as exc:
+                log_fallback(
+                    "warning",
+                    "清理过期导出文件失败",
+                    module="export_jobs",
+                    action="cleanup_expired",
+                    fallback_reason="unlink_failed",
+                    exception=exc,
+                    path=str(path),
+                )
+        return removed
@@ -0,0 +1,196 @@
+"""后台导出任务 actions service.
+
+将“超大台账异步导出”的编排逻辑下沉到 service 层:
+- 校验导出类型与筛选条件, 创建 TaskRun 并返回 run_id
+- 启动后台线程执行 `run_export_job`
+- 校验下载权限并定位已落盘的导出文件
+"""
+
+from __future__ import annotations
+
+import importlib
+import threading
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any, cast
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.constants.status_types import TaskRunStatus
+from app.core.exceptions import ConflictError, NotFoundError, SystemError, ValidationError
+from app.infra.route_safety import log_with_context
+from app.repositories.task_runs_repository import TaskRunsRepository
+from app.schemas.export_jobs import EXPORT_TYPE_LABELS, ExportJobCreatePayload, parse_export_filters
+from app.services.files.csv_export_result import CSV_MIMETYPE
+from app.services.files.export_file_store import ExportFileStore
+from app.services.task_runs.task_run_summary_builders import build_export_csv_summary
+from app.services.task_runs.task_runs_write_service import TaskRunsWriteService
+
+EXPORT_TASK_KEY = "export_csv"
+EXPORT_TASK_CATEGORY = "export"
+
+BACKGROUND_EXCEPTIONS: tuple[type[Exception], ...] = (
+    ValidationError,
+    SystemError,
+    SQLAlchemyError,
+    RuntimeError,
+    OSError,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ExportJobPreparedRun:
+    """后台导出准备结果(已创建 TaskRun,尚未启动线程)."""
+
+    run_id: str
+    export_type: str
+
+
+@dataclass(frozen=True, slots=True)
+class ExportJobLaunchResult:
+    """后台导出启动结果."""
+
+    run_id: str
+    export_type: str
+    thread_name: str
+
+
+@dataclass(frozen=True, slots=True)
+class ExportJobDownload:
+    """可下载的导出文件."""
+
+    path: str
+    filename: str
+    size_bytes: int
+    mimetype: str = CSV_MIMETYPE
+
+
+def build_export_download_url(run_id: str) -> str:
+    """导出文件下载地址(写入 TaskRun.result_url)."""
+    return f"/api/v1/exports/jobs/{run_id}/file"
+
+
+def _resolve_default_task() -> Callable[..., Any]:
+    """惰性加载默认任务函数,避免导入期循环依赖."""
+    module = importlib.import_module("app.tasks.export_tasks")
+    return cast("Callable[..., Any]", module.run_export_job)
+
+
+def _launch_background_export(
+    *,
+    created_by: int | None,
+    run_id: str,
+    task: Callable[..., Any],
+) -> threading.Thread:
+    def _run_task(captured_created_by: int | None, captured_run_id: str) -> None:
+        try:
+            task(created_by=captured_created_by, run_id=captured_run_id)
+        except BACKGROUND_EXCEPTIONS as exc:
+            log_with_context(
+                "error",
+                "后台导出失败",
+                module="export_jobs",
+                action="run_export_job_background",
+                context={"created_by": captured_created_by, "run_id": captured_run_id},
+                extra={
+                    "error_type": exc.__class__.__name__,
+                    "error_message": str(exc),
+                },
+                include_actor=False,
+            )
+
+    thread = threading.Thread(
+        target=_run_task,
+        args=(created_by, run_id),
+        name="export_csv_manual",
+        daemon=True,
+    )
+    thread.start()
+    return thread
+
+
+class ExportJobsService:
+    """后台导出任务编排服务."""
+
+    def __init__(
+        self,
+        *,
+        task: Callable[..., Any] | None = None,
+        file_store: ExportFileStore | None = None,
+    ) -> None:
+        """初始化服务并允许注入 task/file_store(便于测试/替换执行入口)."""
+        self._task = task
+        self._file_store = file_store or ExportFileStore()
+
+    def prepare_export_job(
+        self,
+        *,
+        payload: ExportJobCreatePayload,
+        created_by: int | None,
+    ) -> ExportJobPreparedRun:
+        """校验筛选条件并创建 TaskRun(不启动线程, 由调用方 commit)."""
+        query = parse_export_filters(payload.export_type, payload.filters)
+        inputs: dict[str, Any] = {
+            "export_type": payload.export_type,
+            "filters": query.model_dump(mode="json"),
+        }
+        task_runs_service = TaskRunsWriteService()
+        run_id = task_runs_service.start_run(
+            task_key=EXPORT_TASK_KEY,
+            task_name=f"导出{EXPORT_TYPE_LABELS[payload.export_type]}",
+            task_category=EXPORT_TASK_CATEGORY,
+            trigger_source="manual",
+            created_by=created_by,
+            summary_json=build_export_csv_summary(
+                inputs=inputs,
+                export_type=payload.export_type,
+                rows_total=0,
+                rows_written=0,
+            ),
+        )
+        task_runs_service.set_result_url(run_id, build_export_download_url(run_id))
+        return ExportJobPreparedRun(run_id=run_id, export_type=payload.export_type)
+
+    def launch_export_job(
+        self,
+        *,
+        created_by: int | None,
+        prepared: ExportJobPreparedRun,
+    ) -> ExportJobLaunchResult:
+        """启动后台线程执行导出."""
+        thread = _launch_background_export(
+            created_by=created_by,
+            run_id=prepared.run_id,
+            task=self._task or _resolve_default_task(),
+        )
+        return ExportJobLaunchResult(
+            run_id=prepared.run_id,
+            export_type=prepared.export_type,
+            thread_name=thread.name,
+        )
+
+    def resolve_download(self, run_id: str, *, user_id: int | None, is_admin: bool) -> ExportJobDownload:
+        """定位可下载的导出文件(仅创建者或管理员可下载)."""
+        run = TaskRunsRepository.get_run(run_id)
+        if run.task_key != EXPORT_TASK_KEY:
+            raise NotFoundError("导出任务不存在")
+        if not is_admin and run.created_by != user_id:
+            raise NotFoundError("导出任务不存在")
+        if run.status in TaskRunStatus.IN_PROGRESS:
+            raise ConflictError("导出尚未完成,请稍后在运行中心查看进度")
+        if run.status != TaskRunStatus.COMPLETED:
+            raise ConflictError("导出任务未成功完成,无可下载文件")
+
+        info = self._file_store.stat(run_id)
+        if info is None:
+            raise NotFoundError("导出文件已过期或已被清理,请重新导出")
+
+        summary = run.summary_json if isinstance(run.summary_json, Mapping) else {}
+        ext = summary.get("ext")
+        ext_data = ext.get("data") if isinstance(ext, Mapping) else None
+        filename = ext_data.get("filename") if isinstance(ext_data, Mapping) else None
+        return ExportJobDownload(
+            path=str(info.path.resolve()),
+            filename=str(filename or info.path.name),
+            size_bytes=info.size_bytes,
+        )
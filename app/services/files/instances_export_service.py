@@ -7,15 +7,33 @@
 
 from __future__ import annotations
 
-import csv
-import io
+from collections.abc import Callable, Iterable, Iterator, Sequence
 
 from app.core.types.instances import InstanceListFilters
+from app.core.types.tags import TagSummary
+from app.models.instance import Instance
 from app.repositories.instances_repository import InstancesRepository
-from app.services.files.csv_export_result import CsvExportResult
+from app.services.files.csv_export_result import CsvStreamResult, iter_csv_lines
 from app.utils.spreadsheet_formula_safety import sanitize_csv_row
 from app.utils.time_utils import time_utils
 
+INSTANCE_EXPORT_HEADERS = [
+    "ID",
+    "实例名称",
+    "数据库类型",
+    "主机地址",
+    "端口",
+    "数据库名",
+    "标签",
+    "状态",
+    "描述",
+    "凭据ID",
+    "同步次数",
+    "最后连接时间",
+    "创建时间",
+    "更新时间",
+]
+
 
 class InstancesExportService:
     """实例导出读取服务."""
@@ -24,43 +42,38 @@ class InstancesExportService:
         """初始化服务并注入实例仓库."""
         self._repository = repository or InstancesRepository()
 
-    def export_instances_csv(self, filters: InstanceListFilters) -> CsvExportResult:
-        """导出实例列表为 CSV."""
-        instances = self._repository.list_instances_for_export(filters)
-        tags_map = self._repository.fetch_tags_map([instance.id for instance in instances])
+    def count_instances(self, filters: InstanceListFilters) -> int:
+        """统计导出行数(用于后台导出进度)."""
+        return self._repository.count_instances_for_export(filters)
 
-        output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerow(
-            [
-                "ID",
-                "实例名称",
-                "数据库类型",
-                "主机地址",
-                "端口",
-                "数据库名",
-                "标签",
-                "状态",
-                "描述",
-                "凭据ID",
-                "同步次数",
-                "最后连接时间",
-                "创建时间",
-                "更新时间",
-            ],
-        )
+    def export_instances_csv(
+        self,
+        filters: InstanceListFilters,
+        *,
+        on_progress: Callable[[int], None] | None = None,
+    ) -> CsvStreamResult:
+        """导出实例列表为 CSV(分块读取、流式输出)."""
+        chunks = self._repository.iter_instance_chunks(filters)
+        timestamp = time_utils.format_china_time(time_utils.now(), "%Y%m%d_%H%M%S")
+        filename = f"instances_export_{timestamp}.csv"
+        csv_chunks = iter_csv_lines(INSTANCE_EXPORT_HEADERS, self._iter_rows(chunks), on_progress=on_progress)
+        return CsvStreamResult(filename=filename, chunks=csv_chunks)
 
-        for instance in instances:
-            tags_display = ", ".join(
-                [
-                    tag.display_name or tag.name
-                    for tag in tags_map.get(instance.id, [])
-                    if (tag.display_name or tag.name)
-                ],
-            ).strip(", ")
+    @staticmethod
+    def _iter_rows(
+        chunks: Iterable[tuple[Sequence[Instance], dict[int, list[TagSummary]]]],
+    ) -> Iterator[list[object]]:
+        for instances, tags_map in chunks:
+            for instance in instances:
+                tags_display = ", ".join(
+                    [
+                        tag.display_name or tag.name
+                        for tag in tags_map.get(instance.id, [])
+                        if (tag.display_name or tag.name)
+                    ],
+                ).strip(", ")
 
-            writer.writerow(
-                sanitize_csv_row(
+                yield sanitize_csv_row(
                     [
                         instance.id,
                         instance.name,
@@ -77,10 +90,4 @@ class InstancesExportService:
                         (time_utils.format_china_time(instance.created_at) if instance.created_at else ""),
                         (time_utils.format_china_time(instance.updated_at) if instance.updated_at else ""),
                     ],
-                ),
-            )
-
-        output.seek(0)
-        timestamp = time_utils.format_china_time(time_utils.now(), "%Y%m%d_%H%M%S")
-        filename = f"instances_export_{timestamp}.csv"
-        return CsvExportResult(filename=filename, content=output.getvalue())
+                )
@@ -53,4 +53,8 @@ class HistoryLogsListService:
             page=page_result.page,
             pages=page_result.pages,
             limit=page_result.limit,
+            pagination=page_result.pagination,
+            next_cursor=page_result.next_cursor,
+            has_more=page_result.has_more,
+            total_mode=page_result.total_mode,
         )
@@ -37,6 +37,7 @@ def _init_deletion_stats() -> dict[str, int]:
         "deleted_database_size_stats": 0,
         "deleted_database_size_aggregations": 0,
         "deleted_tag_links": 0,
+        "deleted_veeam_backup_matches": 0,
     }
 
 
@@ -167,6 +168,7 @@ class InstanceBatchCreationService:
         """创建通过校验的实例并收集错误."""
         created_count = 0
         errors: list[str] = []
+        created_instances: list[Instance] = []
 
         for index, payload in enumerate(valid_data, start=1):
             name = payload.name
@@ -188,6 +190,7 @@ class InstanceBatchCreationService:
                 continue
 
             self._repository.add_instance(instance)
+            created_instances.append(instance)
             created_count += 1
             log_info(
                 "batch_create_instance",
@@ -198,6 +201,7 @@ class InstanceBatchCreationService:
                 host=instance.host,
             )
 
+        self._repository.refresh_veeam_backup_matches(created_instances)
         return created_count, errors
 
 
@@ -260,6 +264,7 @@ class InstanceBatchDeletionService:
                 'deleted_database_size_stats': 200,
                 'deleted_database_size_aggregations': 100,
                 'deleted_tag_links': 5,
+                'deleted_veeam_backup_matches': 1,
                 'missing_instance_ids': [],
                 'deleted_sync_data': 50
             }
@@ -17,6 +17,7 @@ from app.models.instance import Instance
 from app.repositories.credentials_repository import CredentialsRepository
 from app.repositories.instances_repository import InstancesRepository
 from app.repositories.tags_repository import TagsRepository
+from app.repositories.veeam_repository import VeeamRepository
 from app.schemas.instances import InstanceCreatePayload, InstanceUpdatePayload
 from app.schemas.validation import validate_or_raise
 from app.utils.request_payload import parse_payload
@@ -47,10 +48,12 @@ class InstanceWriteService:
         self,
         repository: InstancesRepository | None = None,
         credentials_repository: CredentialsRepository | None = None,
+        veeam_repository: VeeamRepository | None = None,
     ) -> None:
         """初始化写操作服务."""
         self._repository = repository or InstancesRepository()
         self._credentials_repository = credentials_repository or CredentialsRepository()
+        self._veeam_repository = veeam_repository or VeeamRepository()
 
     def create(self, payload: object | None, *, operator_id: int | None = None) -> Instance:
         """创建实例."""
@@ -79,6 +82,7 @@ class InstanceWriteService:
 
         self._repository.add(instance)
         self._sync_tags(instance, list(params.tag_names))
+        self._veeam_repository.refresh_instance_backup_matches(instance_ids=[int(instance.id)])
         log_info(
             "创建数据库实例",
             module="instances",
@@ -116,6 +120,7 @@ class InstanceWriteService:
         if existing_instance:
             raise ConflictError("实例名称已存在")
 
+        backup_match_changed = (instance.name, instance.host) != (params.name, params.host)
         instance.name = params.name
         instance.db_type = params.db_type
         instance.host = params.host
@@ -135,6 +140,8 @@ class InstanceWriteService:
 
         self._repository.add(instance)
         self._sync_tags(instance, list(params.tag_names))
+        if backup_match_changed:
+            self._veeam_repository.refresh_instance_backup_matches(instance_ids=[int(instance.id)])
         log_info(
             "更新数据库实例",
             module="instances",
@@ -3,6 +3,7 @@
 说明:
 - v1 认证方式约定为 Access Key, 对应凭据中的 username/password.
 - 按 JumpServer v3 文档使用 HTTP Signature 访问 `/api/v1/assets/assets/`.
+- 首页返回 count 后按 offset 并发拉取剩余分页, 共享同一个 keep-alive 连接池.
 """
 
 from __future__ import annotations
@@ -11,17 +12,19 @@ import base64
 import hashlib
 import hmac
 import json
-import ssl
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from email.utils import formatdate
 from typing import Any, Protocol
 from urllib.error import HTTPError, URLError
-from urllib.parse import urljoin, urlsplit
-from urllib.request import Request, urlopen
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+from urllib.request import Request
 
 from flask import current_app, has_app_context
 
 from app.core.constants.database_types import DatabaseType
+from app.infra.http_connection_pool import HttpConnectionPool, SslContextCache
 from app.settings import Settings
 from app.utils.database_type_utils import normalize_database_type
 
@@ -31,10 +34,6 @@ JUMPSERVER_ACCEPT_HEADER = "application/json"
 JUMPSERVER_SIGNATURE_HEADERS = "(request-target) accept date"
 
 
-def _default_open(request: Request, *, timeout: int, context: ssl.SSLContext):
-    return urlopen(request, timeout=timeout, context=context)
-
-
 def _safe_int(value: object, default: int = 0) -> int:
     if isinstance(value, (int, float, str)):
         try:
@@ -96,14 +95,21 @@ class HttpJumpServerProvider:
         org_id: str | None = None,
         timeout_seconds: int | None = None,
         verify_ssl: bool | None = None,
-        opener=_default_open,
+        opener=None,
+        max_concurrency: int | None = None,
     ) -> None:
         resolved_settings = self._resolve_settings()
         self._org_id = str(org_id or resolved_settings["org_id"]).strip()
         resolved_timeout = resolved_settings["timeout_seconds"]
         self._timeout_seconds = int(timeout_seconds) if timeout_seconds is not None else _safe_int(resolved_timeout)
         self._verify_ssl = bool(resolved_settings["verify_ssl"] if verify_ssl is None else verify_ssl)
-        self._opener = opener
+        self._max_concurrency = max(
+            max_concurrency if max_concurrency is not None else _safe_int(resolved_settings["max_concurrency"], 1),
+            1,
+        )
+        # 默认使用 keep-alive 连接池; 测试可注入与 urlopen 签名一致的 opener
+        self._opener = opener or HttpConnectionPool(max_idle_per_host=self._max_concurrency)
+        self._ssl_contexts = SslContextCache()
 
     @staticmethod
     def _resolve_settings() -> dict[str, object]:
@@ -120,12 +126,17 @@ class HttpJumpServerProvider:
                     "JUMPSERVER_VERIFY_SSL",
                     Settings.model_fields["jumpserver_verify_ssl"].default,
                 ),
+                "max_concurrency": current_app.config.get(
+                    "JUMPSERVER_MAX_CONCURRENCY",
+                    Settings.model_fields["jumpserver_max_concurrency"].default,
+                ),
             }
         settings = Settings.load()
         return {
             "org_id": settings.jumpserver_org_id,
             "timeout_seconds": settings.jumpserver_request_timeout_seconds,
             "verify_ssl": settings.jumpserver_verify_ssl,
+            "max_concurrency": settings.jumpserver_max_concurrency,
         }
 
     def is_configured(self) -> bool:
@@ -140,31 +151,54 @@ class HttpJumpServerProvider:
         org_id: str | None = None,
         verify_ssl: bool | None = None,
     ) -> JumpServerAssetCollection:
-        assets: list[JumpServerDatabaseAsset] = []
-        received_total = 0
-        skipped_unsupported = 0
-        skipped_invalid = 0
-        next_url = self._build_initial_url(base_url)
-        while next_url:
+        def _fetch_page(url: str) -> tuple[list[dict[str, Any]], object, int | None]:
             payload = self._request_json(
-                url=next_url,
+                url=url,
                 access_key_id=access_key_id,
                 access_key_secret=access_key_secret,
                 org_id=org_id,
                 verify_ssl=verify_ssl,
             )
-            page_items, raw_next_url = self._parse_page_payload(payload)
+            items, raw_next_url = self._parse_page_payload(payload)
+            return items, raw_next_url, self._parse_page_count(payload)
+
+        first_items, raw_next_url, total_count = _fetch_page(self._build_initial_url(base_url))
+        pages = [first_items]
+        next_url = self._resolve_next_url(base_url, raw_next_url)
+        offset_urls = self._build_offset_page_urls(next_url, total_count=total_count)
+        if offset_urls:
+            # 已知总数: 按 offset 并发拉取剩余分页(按 offset 顺序合并)
+            offset_pages = self._map_concurrently(_fetch_page, offset_urls)
+            pages.extend(items for items, _, _ in offset_pages)
+            next_url = self._resolve_next_url(base_url, offset_pages[-1][1])
+        while next_url:
+            # 未返回 count 或拉取期间资产增加时, 继续按 next 链接顺序拉取
+            items, raw_next_url, _ = _fetch_page(next_url)
+            pages.append(items)
+            next_url = self._resolve_next_url(base_url, raw_next_url)
+        return self._build_collection(pages)
+
+    @staticmethod
+    def _build_collection(pages: list[list[dict[str, Any]]]) -> JumpServerAssetCollection:
+        assets: list[JumpServerDatabaseAsset] = []
+        seen_external_ids: set[str] = set()
+        received_total = 0
+        skipped_unsupported = 0
+        skipped_invalid = 0
+        for page_items in pages:
             received_total += len(page_items)
             for item in page_items:
-                asset, reason = self._normalize_asset(item)
+                asset, reason = HttpJumpServerProvider._normalize_asset(item)
                 if asset is not None:
-                    assets.append(asset)
+                    # 并发分页期间资产位移可能导致同一资产出现在相邻两页
+                    if asset.external_id not in seen_external_ids:
+                        seen_external_ids.add(asset.external_id)
+                        assets.append(asset)
                     continue
                 if reason == "unsupported":
                     skipped_unsupported += 1
                 else:
                     skipped_invalid += 1
-            next_url = self._resolve_next_url(base_url, raw_next_url)
         return JumpServerAssetCollection(
             assets=assets,
             received_total=received_total,
@@ -173,6 +207,47 @@ class HttpJumpServerProvider:
             skipped_invalid=skipped_invalid,
         )
 
+    def _map_concurrently(
+        self,
+        func: Callable[[str], tuple[list[dict[str, Any]], object, int | None]],
+        urls: list[str],
+    ) -> list[tuple[list[dict[str, Any]], object, int | None]]:
+        """在线程池中并发拉取分页(并发数受 max_concurrency 限制), 按输入顺序返回; 任一分页失败即抛出."""
+        if self._max_concurrency <= 1 or len(urls) <= 1:
+            return [func(url) for url in urls]
+        with ThreadPoolExecutor(
+            max_workers=min(self._max_concurrency, len(urls)),
+            thread_name_prefix="jumpserver-http",
+        ) as executor:
+            return list(executor.map(func, urls))
+
+    @staticmethod
+    def _build_offset_page_urls(next_url: str | None, *, total_count: int | None) -> list[str]:
+        """按首页 next 链接中的 limit/offset(服务端可能下调 limit)生成剩余分页 URL."""
+        if not next_url or total_count is None:
+            return []
+        parsed = urlsplit(next_url)
+        query = parse_qsl(parsed.query, keep_blank_values=True)
+        params = dict(query)
+        limit = _safe_int(params.get("limit"), 0)
+        offset = _safe_int(params.get("offset"), -1)
+        if limit <= 0 or offset < 0:
+            return []
+        urls: list[str] = []
+        for page_offset in range(offset, total_count, limit):
+            page_query = [(key, str(page_offset) if key == "offset" else value) for key, value in query]
+            urls.append(urlunsplit(parsed._replace(query=urlencode(page_query))))
+        return urls
+
+    @staticmethod
+    def _parse_page_count(payload: object) -> int | None:
+        if not isinstance(payload, dict):
+            return None
+        count = payload.get("count")
+        if isinstance(count, bool) or not isinstance(count, int) or count < 0:
+            return None
+        return count
+
     @staticmethod
     def _build_initial_url(base_url: str) -> str:
         resolved_base_url = HttpJumpServerProvider._normalize_base_url(base_url)
@@ -239,7 +314,7 @@ class HttpJumpServerProvider:
             method="GET",
         )
         resolved_verify_ssl = self._verify_ssl if verify_ssl is None else bool(verify_ssl)
-        context = ssl.create_default_context() if resolved_verify_ssl else ssl._create_unverified_context()
+        context = self._ssl_contexts.get(resolved_verify_ssl)
         try:
             with self._opener(request, timeout=self._timeout_seconds, context=context) as response:
                 payload_bytes = response.read()
@@ -141,42 +141,40 @@ class JumpServerSyncActionsService:
                 org_id=self._source_service.resolve_binding_org_id(binding),
                 verify_ssl=self._source_service.resolve_binding_verify_ssl(binding),
             )
-            self._jumpserver_repository.replace_asset_snapshots(result.assets, sync_run_id=run_id, synced_at=synced_at)
+            diff = self._jumpserver_repository.reconcile_asset_snapshots(
+                result.assets,
+                sync_run_id=run_id,
+                synced_at=synced_at,
+            )
             binding.last_sync_at = synced_at
             binding.last_sync_status = "completed"
             binding.last_sync_run_id = run_id
             binding.last_error = None
             db.session.add(binding)
+            asset_counts = {
+                "received_total": result.received_total,
+                "supported_total": result.supported_total,
+                "snapshots_written_total": diff.written_total,
+                "snapshots_changed_total": diff.changed_total,
+                "snapshots_deleted_total": diff.deleted_total,
+                "snapshots_unchanged_total": diff.unchanged_total,
+                "skipped_unsupported": result.skipped_unsupported,
+                "skipped_invalid": result.skipped_invalid,
+            }
             task_runs_service.complete_item(
                 run_id,
                 item_type=_SYNC_ITEM_TYPE,
                 item_key=_SYNC_ITEM_KEY,
-                metrics_json={
-                    "received_total": result.received_total,
-                    "supported_total": result.supported_total,
-                    "snapshots_written_total": len(result.assets),
-                    "skipped_unsupported": result.skipped_unsupported,
-                    "skipped_invalid": result.skipped_invalid,
-                },
-                details_json={
-                    "received_total": result.received_total,
-                    "supported_total": result.supported_total,
-                    "snapshots_written_total": len(result.assets),
-                    "skipped_unsupported": result.skipped_unsupported,
-                    "skipped_invalid": result.skipped_invalid,
-                },
+                metrics_json=dict(asset_counts),
+                details_json=dict(asset_counts),
             )
             self._write_run_summary(
                 run_id=run_id,
                 payload=build_sync_jumpserver_assets_summary(
                     task_key="sync_jumpserver_assets",
                     inputs={"credential_id": int(binding.credential_id)},
-                    received_total=result.received_total,
-                    supported_total=result.supported_total,
-                    snapshots_written_total=len(result.assets),
-                    skipped_unsupported=result.skipped_unsupported,
-                    skipped_invalid=result.skipped_invalid,
                     error_message=None,
+                    **asset_counts,
                 ),
                 error_message=None,
             )
@@ -106,6 +106,18 @@ class DatabaseLedgerService:
             limit=page_result.limit,
         )
 
+    def count_all(
+        self,
+        *,
+        search: str = "",
+        db_type: str | None = None,
+        instance_id: int | None = None,
+        tags: list[str] | None = None,
+    ) -> int:
+        """统计导出范围内的台账记录数(参数同 `iterate_all`)."""
+        filters = self._build_export_filters(search=search, db_type=db_type, instance_id=instance_id, tags=tags)
+        return DatabaseLedgerRepository(session=self.session).count_all(filters)
+
     def iterate_all(
         self,
         *,
@@ -127,15 +139,7 @@ class DatabaseLedgerService:
 
         """
         try:
-            resolved_tags = tags if tags is not None else []
-            filters = DatabaseLedgerFilters(
-                search=search.strip(),
-                db_type=(db_type or "all"),
-                tags=[tag.strip() for tag in resolved_tags if tag.strip()],
-                instance_id=instance_id,
-                page=1,
-                per_page=self.DEFAULT_PAGINATION,
-            )
+            filters = self._build_export_filters(search=search, db_type=db_type, instance_id=instance_id, tags=tags)
             repository = DatabaseLedgerRepository(session=self.session)
             projections = repository.iterate_all(filters)
             for projection in projections:
@@ -150,6 +154,24 @@ class DatabaseLedgerService:
             msg = "导出数据库台账失败"
             raise SystemError(msg) from exc
 
+    def _build_export_filters(
+        self,
+        *,
+        search: str,
+        db_type: str | None,
+        instance_id: int | None,
+        tags: list[str] | None,
+    ) -> DatabaseLedgerFilters:
+        resolved_tags = tags if tags is not None else []
+        return DatabaseLedgerFilters(
+            search=search.strip(),
+            db_type=(db_type or "all"),
+            tags=[tag.strip() for tag in resolved_tags if tag.strip()],
+            instance_id=instance_id,
+            page=1,
+            per_page=self.DEFAULT_PAGINATION,
+        )
+
     def _build_item(self, projection: DatabaseLedgerRowProjection) -> DatabaseLedgerItem:
         collected_at = projection.collected_at
         size_mb = projection.size_mb
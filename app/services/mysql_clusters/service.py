@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
+from functools import partial
 from typing import Any, Protocol, cast
 
 from flask import current_app, has_app_context
@@ -25,12 +26,25 @@ from app.schemas.mysql_clusters import (
 )
 from app.schemas.validation import validate_or_raise
 from app.services.connection_adapters.connection_factory import ConnectionFactory
+from app.services.connection_adapters.node_poller import ConcurrentNodePoller
 from app.services.mysql_clusters.topology_detector import MySQLTopologyDetector
 from app.settings import DEFAULT_MYSQL_REPLICA_LAG_ABNORMAL_THRESHOLD_SECONDS
 from app.utils.request_payload import parse_payload
 from app.utils.structlog_config import log_info
 from app.utils.time_utils import time_utils
 
+# 单实例检测失败时记为 failed 并继续检测其他实例的异常类型
+_TOPOLOGY_DETECTION_ERRORS: tuple[type[Exception], ...] = (
+    RuntimeError,
+    ValueError,
+    LookupError,
+    ConnectionError,
+    TimeoutError,
+    OSError,
+)
+
+MySQLTopologyDetections = Mapping[int, dict[str, Any] | Exception]
+
 
 class _ConnectionFactoryProtocol(Protocol):
     def create_connection(self, instance: Instance) -> SyncConnection | None: ...
@@ -39,9 +53,15 @@ class _ConnectionFactoryProtocol(Protocol):
 class MySQLClusterManagementService:
     """MySQL 群集、实例绑定与传统 replication 拓扑检测服务."""
 
-    def __init__(self, *, connection_factory: _ConnectionFactoryProtocol | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        connection_factory: _ConnectionFactoryProtocol | None = None,
+        node_poller: ConcurrentNodePoller | None = None,
+    ) -> None:
         self._connection_factory = connection_factory or ConnectionFactory
         self._topology_detector = MySQLTopologyDetector()
+        self._node_poller = node_poller or ConcurrentNodePoller.for_cluster_status()
 
     def list_clusters(self, query_params: MySQLClusterListQuery) -> dict[str, Any]:
         clusters, total, pages = self._list_clusters(query_params)
@@ -156,12 +176,20 @@ class MySQLClusterManagementService:
             ],
         }
 
-    def sync_topology(self, cluster_id: int, *, operator_id: int | None = None) -> dict[str, Any]:
+    def sync_topology(
+        self,
+        cluster_id: int,
+        *,
+        operator_id: int | None = None,
+        detections: MySQLTopologyDetections | None = None,
+    ) -> dict[str, Any]:
+        """并发检测群集内各实例的复制拓扑并写入绑定(detections 为已预先探测的结果)."""
         cluster = self._get_cluster_or_error(cluster_id)
         bindings = self._list_bindings_for_cluster(cluster.id)
         if not bindings:
             raise ValidationError("请先绑定 MySQL 实例后再同步主从拓扑")
 
+        resolved_detections = detections if detections is not None else self.detect_bindings(bindings)
         now = time_utils.now()
         items: list[dict[str, Any]] = []
         failed = 0
@@ -171,9 +199,9 @@ class MySQLClusterManagementService:
             if instance is None:
                 continue
             try:
-                detected = self._detect_instance_topology(instance)
+                detected = self._resolve_detection(binding, instance, resolved_detections)
                 self._apply_detection(binding, detected, now)
-            except (RuntimeError, ValueError, LookupError, ConnectionError, TimeoutError, OSError) as exc:
+            except _TOPOLOGY_DETECTION_ERRORS as exc:
                 failed += 1
                 detected = {
                     "replication_role": "unknown",
@@ -320,7 +348,40 @@ class MySQLClusterManagementService:
                 extra={"instance_id": binding.instance_id, "cluster_id": binding.cluster_id},
             )
 
-    def _detect_instance_topology(self, instance: Instance) -> dict[str, Any]:
+    def build_topology_probes(
+        self,
+        bindings: list[MySQLClusterInstance],
+    ) -> list[tuple[int, Callable[[], dict[str, Any]]]]:
+        """为绑定实例构建拓扑探测函数(预加载凭据, 探测线程内不访问 ORM session)."""
+        probes: list[tuple[int, Callable[[], dict[str, Any]]]] = []
+        for binding in bindings:
+            instance = cast(Instance | None, binding.instance)
+            if instance is None:
+                continue
+            _ = instance.credential
+            probes.append((int(binding.id), partial(self.detect_instance_topology, instance)))
+        return probes
+
+    def detect_bindings(self, bindings: list[MySQLClusterInstance]) -> dict[int, dict[str, Any] | Exception]:
+        """并发探测绑定实例的复制拓扑(不写库), 按绑定 id 返回检测结果或异常."""
+        probes = self.build_topology_probes(bindings)
+        outcomes = self._node_poller.poll(lambda probe: probe[1](), probes, node_id=lambda probe: ("mysql", probe[0]))
+        return {binding_id: outcome for (binding_id, _), outcome in zip(probes, outcomes, strict=True)}
+
+    def _resolve_detection(
+        self,
+        binding: MySQLClusterInstance,
+        instance: Instance,
+        detections: MySQLTopologyDetections,
+    ) -> dict[str, Any]:
+        # 预先探测之后新增的绑定在此补测
+        detected = detections[binding.id] if binding.id in detections else self.detect_instance_topology(instance)
+        if isinstance(detected, Exception):
+            raise detected
+        return detected
+
+    def detect_instance_topology(self, instance: Instance) -> dict[str, Any]:
+        """连接实例并检测复制拓扑(只读, 不写库)."""
         connection = self._connection_factory.create_connection(instance)
         if connection is None:
             raise ExternalServiceError("无法创建 MySQL 连接", extra={"instance_id": instance.id})
@@ -19,6 +19,7 @@ from app.models.account_permission import AccountPermission
 from app.models.instance import Instance
 from app.models.instance_account import InstanceAccount
 from app.models.instance_config_snapshot import InstanceConfigSnapshot
+from app.models.instance_reachability import InstanceReachability
 from app.models.instance_size_aggregation import InstanceSizeAggregation
 from app.models.instance_size_stat import InstanceSizeStat
 from app.models.mysql_cluster import MySQLCluster, MySQLClusterInstance
@@ -26,6 +27,7 @@ from app.models.sqlserver_ag_sync_state import SQLServerAgDatabaseSyncState, SQL
 from app.models.sqlserver_cluster import SQLServerCluster, SQLServerClusterInstance
 from app.models.task_run import TaskRun
 from app.models.task_run_item import TaskRunItem
+from app.repositories.instance_reachability_repository import InstanceReachabilityRepository
 from app.repositories.instances_repository import InstancesRepository
 from app.repositories.jumpserver_repository import JumpServerRepository
 from app.repositories.veeam_repository import VeeamRepository
@@ -261,6 +263,7 @@ class RiskCenterReadService:
         access_map = self._access_summary_map(instance_ids, since=now - timedelta(hours=RECENT_WINDOW_HOURS))
         failed_task_map = self._failed_task_map(instance_ids, since=now - timedelta(hours=RECENT_WINDOW_HOURS))
         cluster_issue_map = self._cluster_issue_map(instances)
+        reachability_map = self._reachability_map(instance_ids)
         rule_map = RiskCenterRuleSettingsService().get_rule_map()
         tag_map = (
             InstancesRepository.fetch_tags_map(instance_ids)
@@ -280,6 +283,7 @@ class RiskCenterReadService:
                 access=access_map.get(int(instance.id), {}),
                 failed_task=failed_task_map.get(int(instance.id)),
                 cluster_issues=cluster_issue_map.get(int(instance.id), []),
+                reachability=reachability_map.get(int(instance.id)),
                 tags=tag_map.get(int(instance.id), []),
                 rule_map=rule_map,
             )
@@ -308,6 +312,7 @@ class RiskCenterReadService:
         access: dict[str, int],
         failed_task: TaskRunItem | None,
         cluster_issues: list[dict[str, object]],
+        reachability: InstanceReachability | None = None,
         tags: list[Any],
         rule_map: dict[str, dict[str, object]],
     ) -> dict[str, object]:
@@ -319,6 +324,8 @@ class RiskCenterReadService:
         access_metric, access_risks = self._build_access_metric(instance, access)
         task_metric, task_risks = self._build_task_metric(instance, failed_task)
         cluster_metric = self._build_cluster_metric(cluster_issues)
+        reachability_metric, reachability_risks = self._build_reachability_metric(instance, reachability)
+        risks.extend(reachability_risks)
         risks.extend(backup_risks)
         risks.extend(capacity_risks)
         risks.extend(audit_risks)
@@ -333,6 +340,7 @@ class RiskCenterReadService:
         access_metric["tone"] = self._resolve_metric_tone(access_metric, risks, "access")
         task_metric["tone"] = self._resolve_metric_tone(task_metric, risks, "task")
         cluster_metric["tone"] = self._resolve_metric_tone(cluster_metric, risks, "cluster")
+        reachability_metric["tone"] = self._resolve_metric_tone(reachability_metric, risks, "reachability")
         overall = self._resolve_overall_severity(risks)
         risk_score = min(sum(SEVERITY_SCORE.get(str(risk["severity"]), 0) for risk in risks), 999)
         risk_flags = self._build_visible_risk_flags(risks)
@@ -367,6 +375,7 @@ class RiskCenterReadService:
             "access": access_metric,
             "tasks": task_metric,
             "cluster": cluster_metric,
+            "reachability": reachability_metric,
             "status_band": status_band,
             "tags": tag_payload,
             "group": group,
@@ -766,6 +775,50 @@ class RiskCenterReadService:
             )
         ]
 
+    @staticmethod
+    def _build_reachability_metric(
+        instance: Instance,
+        reachability: InstanceReachability | None,
+    ) -> tuple[dict[str, object], list[dict[str, object]]]:
+        if reachability is None:
+            return {
+                "label": "未探测",
+                "detail": "可达性",
+                "tone": "muted",
+                "availability_ratio": None,
+                "avg_latency_ms": None,
+                "last_seen_at": None,
+            }, []
+        last_checked_at = _to_utc_datetime(reachability.last_checked_at)
+        metric: dict[str, object] = {
+            "label": "可达",
+            "detail": "可达性",
+            "tone": "success",
+            "availability_ratio": reachability.availability_ratio,
+            "avg_latency_ms": reachability.avg_latency_ms,
+            "last_seen_at": _iso(last_checked_at),
+        }
+        if reachability.status != "down":
+            if reachability.status != "up":
+                metric.update({"label": "未知", "tone": "muted"})
+            return metric, []
+        metric.update({"label": "不可达", "tone": "danger"})
+        failures = int(reachability.consecutive_failures or 0)
+        detail = f"连续 {failures} 次探测失败"
+        if reachability.last_error:
+            detail = f"{detail}: {reachability.last_error}"
+        return metric, [
+            _risk(
+                rule_key="instance_unreachable",
+                category="reachability",
+                severity="high",
+                label="实例不可达",
+                detail=detail,
+                occurred_at=_to_utc_datetime(reachability.last_down_at) or last_checked_at,
+                target_url=f"/instances/{int(instance.id)}",
+            )
+        ]
+
     @staticmethod
     def _build_cluster_metric(cluster_issues: list[dict[str, object]]) -> dict[str, object]:
         if not cluster_issues:
@@ -941,6 +994,12 @@ class RiskCenterReadService:
             output.setdefault(instance_id, row)
         return output
 
+    @staticmethod
+    def _reachability_map(instance_ids: list[int]) -> dict[int, InstanceReachability]:
+        if not instance_ids or not _table_exists(InstanceReachability.__tablename__):
+            return {}
+        return InstanceReachabilityRepository.map_states(instance_ids)
+
     @staticmethod
     def _cluster_issue_map(instances: list[Instance]) -> dict[int, list[dict[str, object]]]:
         instance_ids = [int(instance.id) for instance in instances]
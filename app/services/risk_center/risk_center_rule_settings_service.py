@@ -38,6 +38,7 @@ RISK_RULE_DEFINITIONS: tuple[RiskRuleDefinition, ...] = (
     RiskRuleDefinition("access_recent_change", "access", "权限近期变更", "最近 24 小时有账户变更", "medium"),
     RiskRuleDefinition("cluster_abnormal", "cluster", "群集异常", "副节点实例存在群集同步或复制异常", "medium"),
     RiskRuleDefinition("task_failed", "task", "定时任务失败", "最近 24 小时存在失败任务", "medium"),
+    RiskRuleDefinition("instance_unreachable", "reachability", "实例不可达", "后台可达性探测连续失败", "high"),
 )
 
 RISK_RULE_DEFINITION_MAP = {definition.rule_key: definition for definition in RISK_RULE_DEFINITIONS}
@@ -1,7 +1,7 @@
 """Scheduler actions service.
 
 将 scheduler namespace 中“动作编排/线程后台执行/循环删除”等逻辑下沉到 service：
-- run_job_in_background：启动后台线程执行指定 job
+- run_job_in_background：启动后台线程执行指定 job(共享 jobstore 时派发至调度主节点)
 - reload_jobs：删除现有任务并重新加载
 
 路由层仅保留鉴权/CSRF、参数读取与封套响应。
@@ -91,6 +91,12 @@ class SchedulerActionsService:
             raise ConflictError("调度器未启动")
         return cast(SupportsScheduler, scheduler)
 
+    @staticmethod
+    def ensure_job_pausable(scheduler: SupportsScheduler, job_id: str) -> None:
+        """依赖触发任务没有基于时间的执行计划,不支持暂停/恢复."""
+        if scheduler_module.is_dependency_job(scheduler.get_job(job_id)):
+            raise ConflictError("依赖触发任务由上游任务完成时派发,不支持暂停/恢复")
+
     def run_job_in_background(self, *, job_id: str, created_by: int | None) -> str:
         """启动后台线程执行指定任务,返回线程名."""
         scheduler = self.ensure_scheduler_running()
@@ -100,6 +106,10 @@ class SchedulerActionsService:
 
         log_info("开始立即执行任务", module="scheduler", job_id=job_id, job_name=getattr(job, "name", None))
 
+        if scheduler_module.scheduler.is_shared_jobstore:
+            # 多节点共享 jobstore: 写入一次性 job, 由调度主节点执行(本节点可能不是主节点)
+            return scheduler_module.dispatch_manual_run(job_id=job_id, created_by=created_by)
+
         def _run_job_in_background(captured_created_by: int | None = created_by) -> None:
             base_app = current_app if has_app_context() else create_app(init_scheduler_on_start=False)
             try:
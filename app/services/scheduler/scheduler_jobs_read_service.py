@@ -11,9 +11,18 @@ from typing import TYPE_CHECKING, cast
 
 from sqlalchemy.exc import SQLAlchemyError
 
-from app.core.constants.scheduler_jobs import BUILTIN_SCHEDULER_TASKS
+from app.core.constants.scheduler_jobs import (
+    BUILTIN_SCHEDULER_TASKS,
+    DEPENDENCY_TRIGGER_TYPE,
+    TRANSIENT_JOB_ID_PREFIXES,
+)
 from app.core.exceptions import NotFoundError, SystemError
-from app.core.types.scheduler import SchedulerJobDetail, SchedulerJobListItem
+from app.core.types.scheduler import (
+    SchedulerExecutorStats,
+    SchedulerJobDetail,
+    SchedulerJobListItem,
+    SchedulerLeaderStatus,
+)
 from app.repositories.scheduler_jobs_repository import SchedulerJobsRepository
 from app.utils.structlog_config import log_error
 
@@ -48,7 +57,12 @@ class SchedulerJobsReadService:
             log_error("获取任务列表失败", module="scheduler_jobs_read_service", exception=exc)
             raise SystemError("获取任务列表失败") from exc
 
-        items = [self._build_job_list_item(job, scheduler) for job in jobs]
+        # 依赖触发/手动派发的一次性 job 执行完即移除, 不在任务列表展示
+        items = [
+            self._build_job_list_item(job, scheduler)
+            for job in jobs
+            if not job.id.startswith(TRANSIENT_JOB_ID_PREFIXES)
+        ]
         items.sort(key=lambda item: item.id)
         return items
 
@@ -75,11 +89,25 @@ class SchedulerJobsReadService:
             misfire_grace_time=job.misfire_grace_time,
             max_instances=job.max_instances,
             coalesce=job.coalesce,
+            executor=self._repository.resolve_executor_name(getattr(job, "executor", None)),
         )
 
+    def list_executors(self) -> list[SchedulerExecutorStats]:
+        """列出执行器排队深度与等待时间统计."""
+        self._repository.ensure_scheduler_running()
+        return self._repository.list_executor_stats()
+
+    def get_leader_status(self) -> SchedulerLeaderStatus:
+        """获取 jobstore 模式与调度主节点状态."""
+        self._repository.ensure_scheduler_running()
+        return self._repository.get_leader_status()
+
     def _build_job_list_item(self, job: Job, scheduler: BackgroundScheduler) -> SchedulerJobListItem:
         trigger_type, trigger_args = self._collect_trigger_args(job)
-        state = "STATE_RUNNING" if scheduler.running and job.next_run_time else "STATE_PAUSED"
+        if trigger_type == DEPENDENCY_TRIGGER_TYPE:
+            state = "STATE_DEPENDENT" if scheduler.running else "STATE_PAUSED"
+        else:
+            state = "STATE_RUNNING" if scheduler.running and job.next_run_time else "STATE_PAUSED"
 
         last_run_time = self._repository.lookup_job_last_run(job_id=job.id)
         builtin_task = BUILTIN_SCHEDULER_TASKS.get(job.id)
@@ -102,6 +130,8 @@ class SchedulerJobsReadService:
             func=(job.func.__name__ if hasattr(job.func, "__name__") else str(job.func)),
             args=job.args,
             kwargs=job.kwargs,
+            executor=self._repository.resolve_executor_name(getattr(job, "executor", None)),
+            max_instances=getattr(job, "max_instances", None),
         )
 
     @staticmethod
@@ -0,0 +1,142 @@
+"""调度任务依赖触发(DAG)服务.
+
+职责:
+- 上游任务执行结束后, 根据 TaskRun 状态判断哪些下游任务可以触发
+- 为依赖触发的下游 run 回写 upstream_run_id, 供任务运行中心展示关键路径
+- 不做调度器操作、不 commit
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import datetime
+
+from app.core.constants.scheduler_jobs import DEPENDENCY_SCOPE_UPSTREAM_INSTANCES
+from app.core.constants.status_types import TaskRunStatus
+from app.core.types.scheduler import PipelineDispatch, TaskDependencySpec
+from app.models.task_run import TaskRun
+from app.repositories.task_runs_repository import TaskRunsRepository
+from app.utils.structlog_config import get_system_logger
+
+logger = get_system_logger()
+
+_SUCCESS_STATUSES = frozenset({TaskRunStatus.COMPLETED, TaskRunStatus.COMPLETED_WITH_ERRORS})
+
+
+def _is_successful(run: TaskRun) -> bool:
+    """上游 run 是否(部分)成功.
+
+    完成或部分完成(failed 但有子项成功且非整体异常)均视为成功; 部分完成时
+    按实例范围触发的下游只处理成功的实例.
+    """
+    if run.status in _SUCCESS_STATUSES:
+        return True
+    return run.status == TaskRunStatus.FAILED and not run.error_message and int(run.progress_completed or 0) > 0
+
+
+class TaskPipelineService:
+    """依赖触发判定服务."""
+
+    def __init__(self, repository: TaskRunsRepository | None = None) -> None:
+        """初始化服务并注入 repository."""
+        self._repository = repository or TaskRunsRepository()
+
+    def plan_dispatches(
+        self,
+        *,
+        upstream_task_id: str,
+        dependents: Mapping[str, TaskDependencySpec],
+    ) -> list[PipelineDispatch]:
+        """计算上游任务结束后需要触发的下游任务.
+
+        下游任务在其全部上游的最近一次 run 都已结束, 且均晚于下游自身最近一次
+        run 的开始时间时触发; 触发者(本次结束的上游 run)记为 upstream_run_id.
+        上游失败/取消不会阻断下游(避免一次上游失败让整条链当晚全部跳过),
+        此时记录告警并按全部实例触发, 与依赖触发前的独立 cron 行为一致.
+        """
+        trigger_run = self._repository.get_latest_run(upstream_task_id)
+        if trigger_run is None or trigger_run.status not in TaskRunStatus.TERMINAL:
+            return []
+
+        dispatches: list[PipelineDispatch] = []
+        for task_id, spec in sorted(dependents.items()):
+            if upstream_task_id not in spec.upstream:
+                continue
+            dispatch = self._plan_dispatch(task_id=task_id, spec=spec, trigger_run=trigger_run)
+            if dispatch is not None:
+                dispatches.append(dispatch)
+        return dispatches
+
+    def _plan_dispatch(
+        self,
+        *,
+        task_id: str,
+        spec: TaskDependencySpec,
+        trigger_run: TaskRun,
+    ) -> PipelineDispatch | None:
+        latest_downstream = self._repository.get_latest_run(task_id)
+        if latest_downstream is not None and latest_downstream.status in TaskRunStatus.IN_PROGRESS:
+            logger.info("下游任务仍在运行,跳过依赖触发", module="scheduler", task_id=task_id)
+            return None
+
+        upstream_runs: list[TaskRun] = []
+        for upstream_task_id in spec.upstream:
+            run = (
+                trigger_run
+                if upstream_task_id == trigger_run.task_key
+                else self._repository.get_latest_run(upstream_task_id)
+            )
+            if run is None or run.status not in TaskRunStatus.TERMINAL:
+                logger.info(
+                    "下游任务的上游尚未全部完成,等待其余上游",
+                    module="scheduler",
+                    task_id=task_id,
+                    pending_upstream=upstream_task_id,
+                )
+                return None
+            if latest_downstream is not None and not _finished_after(run, latest_downstream.started_at):
+                logger.info(
+                    "上游自下游上次运行后无新的完成记录,跳过依赖触发",
+                    module="scheduler",
+                    task_id=task_id,
+                    upstream_task_id=upstream_task_id,
+                )
+                return None
+            upstream_runs.append(run)
+
+        failed_upstream = [run for run in upstream_runs if not _is_successful(run)]
+        if failed_upstream:
+            logger.warning(
+                "上游任务未成功完成,仍按全部实例触发下游",
+                module="scheduler",
+                task_id=task_id,
+                failed_upstream_runs=[run.run_id for run in failed_upstream],
+                failed_upstream_statuses=[run.status for run in failed_upstream],
+            )
+
+        instance_ids: tuple[int, ...] | None = None
+        if spec.scope == DEPENDENCY_SCOPE_UPSTREAM_INSTANCES and not failed_upstream:
+            instance_ids = tuple(self._repository.list_completed_instance_ids([run.run_id for run in upstream_runs]))
+            if not instance_ids:
+                logger.info("上游未成功处理任何实例,跳过依赖触发", module="scheduler", task_id=task_id)
+                return None
+
+        return PipelineDispatch(task_id=task_id, upstream_run_id=trigger_run.run_id, instance_ids=instance_ids)
+
+    def link_upstream_run(self, *, task_id: str, upstream_run_id: str, started_since: datetime) -> str | None:
+        """为依赖触发产生的下游 run 回写 upstream_run_id, 返回下游 run_id."""
+        run = self._repository.find_run_started_since(task_id, started_since)
+        if run is None:
+            return None
+        if run.upstream_run_id is None:
+            run.upstream_run_id = upstream_run_id
+        return run.run_id
+
+
+def _finished_after(run: TaskRun, moment: datetime | None) -> bool:
+    if moment is None or run.completed_at is None:
+        return True
+    completed_at = run.completed_at
+    if (completed_at.tzinfo is None) != (moment.tzinfo is None):
+        completed_at = completed_at.replace(tzinfo=moment.tzinfo)
+    return completed_at >= moment
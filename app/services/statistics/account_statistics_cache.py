@@ -0,0 +1,93 @@
+"""账户统计缓存访问器.
+
+缓存键带"代"(generation): 账户同步/自动分类完成后递增代号, 旧代缓存自然失效,
+无需逐个删除(不同 db_type/account_scope 组合的 key 数量不可枚举).
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from typing import TypeVar, cast
+
+from flask import current_app, has_app_context
+
+from app.settings import DEFAULT_CACHE_ACCOUNT_STATISTICS_TTL_SECONDS
+from app.utils.cache_utils import CacheManagerRegistry
+from app.utils.structlog_config import get_system_logger, log_fallback
+
+T = TypeVar("T")
+
+_GENERATION_KEY = "account_statistics:generation"
+_SECTION_PREFIX = "account_statistics"
+
+
+def _statistics_ttl_seconds() -> int:
+    if has_app_context():
+        value = current_app.config.get("CACHE_ACCOUNT_STATISTICS_TTL", DEFAULT_CACHE_ACCOUNT_STATISTICS_TTL_SECONDS)
+        return int(value)
+    return DEFAULT_CACHE_ACCOUNT_STATISTICS_TTL_SECONDS
+
+
+def _new_generation() -> int:
+    return time.time_ns() // 1_000_000
+
+
+class AccountStatisticsCache:
+    """账户统计缓存封装."""
+
+    def current_generation(self) -> int:
+        """读取当前缓存代号(首次访问时初始化)."""
+        manager = CacheManagerRegistry.get()
+        cached = manager.get(_GENERATION_KEY)
+        if isinstance(cached, int):
+            return cached
+        generation = _new_generation()
+        manager.set(_GENERATION_KEY, generation, timeout=0)
+        return generation
+
+    def bump_generation(self) -> int:
+        """递增缓存代号, 使所有已缓存的账户统计失效."""
+        generation = max(_new_generation(), self.current_generation() + 1)
+        CacheManagerRegistry.get().set(_GENERATION_KEY, generation, timeout=0)
+        return generation
+
+    def get_or_load(self, section: str, loader: Callable[[], T], **params: object) -> tuple[T, int]:
+        """按当前代读取缓存, 未命中时执行 loader 并写入; 返回 (结果, 代号)."""
+        ttl = _statistics_ttl_seconds()
+        if ttl <= 0:
+            return loader(), 0
+
+        manager = CacheManagerRegistry.get()
+        generation = self.current_generation()
+        key = manager.build_key(f"{_SECTION_PREFIX}:{generation}:{section}", **params)
+        cached = manager.get(key)
+        if cached is not None:
+            return cast(T, cached), generation
+
+        value = loader()
+        manager.set(key, value, timeout=ttl)
+        return value, generation
+
+
+def invalidate_account_statistics_cache(*, reason: str) -> None:
+    """账户数据变更(同步/分类完成)后使账户统计缓存失效."""
+    try:
+        generation = AccountStatisticsCache().bump_generation()
+    except RuntimeError as exc:
+        log_fallback(
+            "warning",
+            "账户统计缓存失效失败",
+            module="account_statistics",
+            action="invalidate_cache",
+            fallback_reason="cache_manager_unavailable",
+            exception=exc,
+            reason=reason,
+        )
+        return
+    get_system_logger().debug(
+        "账户统计缓存已失效",
+        module="account_statistics",
+        reason=reason,
+        cache_generation=generation,
+    )
@@ -12,6 +12,7 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from app.core.exceptions import SystemError
 from app.repositories.account_statistics_repository import AccountStatisticsRepository
+from app.services.statistics.account_statistics_cache import AccountStatisticsCache
 from app.utils.structlog_config import log_error
 
 
@@ -160,7 +161,8 @@ def fetch_rule_match_stats(rule_ids: Sequence[int] | None = None) -> dict[int, i
 def build_aggregated_statistics() -> dict[str, Any]:
     """组装账户统计页面的完整数据.
 
-    汇总账户的基本统计、数据库类型分布和分类统计.
+    汇总账户的基本统计、数据库类型分布和分类统计; 汇总与数据库类型分布来自同一次分组扫描,
+    结果与 `/api/v1/accounts/statistics` 共用按代缓存.
 
     Returns:
         包含完整统计信息的字典,包含 fetch_summary、fetch_db_type_stats
@@ -170,9 +172,17 @@ def build_aggregated_statistics() -> dict[str, Any]:
         SystemError: 当数据库查询失败时抛出.
 
     """
-    summary = fetch_summary()
-    db_type_stats = fetch_db_type_stats()
-    classification_stats = fetch_classification_stats()
+    cache = AccountStatisticsCache()
+    try:
+        (summary, db_type_stats), _ = cache.get_or_load(
+            "snapshot",
+            AccountStatisticsRepository.fetch_statistics_snapshot,
+        )
+    except SQLAlchemyError as exc:
+        log_error("获取账户统计汇总失败", module="account_statistics", exception=exc)
+        msg = "获取账户统计汇总失败"
+        raise SystemError(msg) from exc
+    classification_stats, _ = cache.get_or_load("classifications", fetch_classification_stats)
 
     return {
         **summary,
@@ -1,15 +1,20 @@
-"""日志统计服务."""
+"""日志统计服务.
 
-from __future__ import annotations
+趋势与分布均读取 `dashboard_metric_buckets` 小时桶(由日志队列 worker 增量维护), 不扫描 unified_logs 明细.
+"""
 
-from datetime import datetime, timedelta
+from __future__ import annotations
 
 from sqlalchemy.exc import SQLAlchemyError
 
 from app import db
-from app.repositories.log_statistics_repository import LogStatisticsRepository, LogTrendBucketSpec
+from app.core.constants.system_constants import LogLevel
+from app.models.dashboard_metric_bucket import DASHBOARD_METRIC_LOG_LEVEL
+from app.repositories.dashboard_metrics_repository import DashboardMetricsRepository
 from app.utils.structlog_config import log_error
-from app.utils.time_utils import CHINA_TZ, time_utils
+
+ERROR_LEVELS = (LogLevel.ERROR.value, LogLevel.CRITICAL.value)
+TREND_LEVELS = (LogLevel.ERROR.value, LogLevel.WARNING.value, LogLevel.CRITICAL.value)
 
 
 def fetch_log_trend_data(*, days: int = 7) -> list[dict[str, int | str]]:
@@ -33,49 +38,21 @@ def fetch_log_trend_data(*, days: int = 7) -> list[dict[str, int | str]]:
         查询失败时返回空列表.
 
     """
-    trend_data: list[dict[str, int | str]] = []
     try:
-        china_today = time_utils.now_china().date()
-        start_date = china_today - timedelta(days=days - 1)
-
-        bucket_specs: list[LogTrendBucketSpec] = []
-        labels: list[tuple[datetime, str, str]] = []
-        for offset in range(days):
-            day = start_date + timedelta(days=offset)
-            start_dt = datetime(day.year, day.month, day.day, tzinfo=CHINA_TZ)
-            end_dt = start_dt + timedelta(days=1)
-            start_utc = time_utils.to_utc(start_dt)
-            end_utc = time_utils.to_utc(end_dt)
-            if start_utc is None or end_utc is None:
-                continue
-            suffix = time_utils.format_china_time(start_dt, "%Y%m%d")
-            error_label = f"error_{suffix}"
-            warning_label = f"warning_{suffix}"
-            bucket_specs.append(
-                LogTrendBucketSpec(
-                    start_utc=start_utc,
-                    end_utc=end_utc,
-                    error_label=error_label,
-                    warning_label=warning_label,
-                ),
-            )
-            labels.append((start_dt, error_label, warning_label))
-
-        if not bucket_specs:
-            return []
-
         with db.session.begin_nested():
-            result_mapping = LogStatisticsRepository.fetch_trend_counts(bucket_specs)
-
-        for day, error_label, warning_label in labels:
-            trend_data.append(
-                {
-                    "date": time_utils.format_china_time(day, "%Y-%m-%d"),
-                    "error_count": int(result_mapping.get(error_label, 0)),
-                    "warning_count": int(result_mapping.get(warning_label, 0)),
-                },
+            day_list, counts = DashboardMetricsRepository.fetch_china_daily_counts(
+                DASHBOARD_METRIC_LOG_LEVEL,
+                days=days,
+                dimensions=TREND_LEVELS,
             )
-
+        trend_data: list[dict[str, int | str]] = [
+            {
+                "date": day.isoformat(),
+                "error_count": sum(counts.get((day, level), 0) for level in ERROR_LEVELS),
+                "warning_count": counts.get((day, LogLevel.WARNING.value), 0),
+            }
+            for day in day_list
+        ]
     except (SQLAlchemyError, ValueError, TypeError) as exc:
         log_error("获取日志趋势数据失败", module="log_statistics", exception=exc)
         return []
@@ -100,8 +77,11 @@ def fetch_log_level_distribution() -> list[dict[str, int | str]]:
     """
     try:
         with db.session.begin_nested():
-            level_stats = LogStatisticsRepository.fetch_level_distribution()
-        return [{"level": stat.level.value, "count": stat.count} for stat in level_stats]
+            level_totals = DashboardMetricsRepository.sum_by_dimension(
+                DASHBOARD_METRIC_LOG_LEVEL,
+                dimensions=TREND_LEVELS,
+            )
+        return [{"level": level, "count": level_totals[level]} for level in TREND_LEVELS if level_totals.get(level)]
     except (SQLAlchemyError, ValueError, TypeError) as exc:
         log_error("获取日志级别分布失败", module="log_statistics", exception=exc)
         return []
@@ -7,14 +7,18 @@ from dataclasses import dataclass
 from datetime import date, datetime
 from typing import Any, cast
 
+from sqlalchemy.exc import SQLAlchemyError
+
 from app import db
 from app.core.constants import SyncSessionStatus, SyncStatus
 from app.core.exceptions import NotFoundError, ValidationError
+from app.models.dashboard_metric_bucket import DASHBOARD_METRIC_SYNC_SESSION
 from app.models.sync_instance_record import SyncInstanceRecord
 from app.models.sync_session import SyncSession
+from app.repositories.dashboard_metrics_repository import DashboardMetricsRepository
 from app.repositories.sync_sessions_repository import SyncSessionsRepository
 from app.schemas.internal_contracts.sync_details_v1 import normalize_sync_details_v1
-from app.utils.structlog_config import get_sync_logger, get_system_logger
+from app.utils.structlog_config import get_sync_logger, get_system_logger, log_fallback
 from app.utils.time_utils import time_utils
 
 
@@ -105,6 +109,7 @@ class SyncSessionService:
             session = SyncSession(sync_type=sync_type, sync_category=sync_category, created_by=created_by)
             with db.session.begin_nested():
                 self._repository.add_session(session)
+            self._increment_dashboard_bucket(session)
         except Exception as exc:
             self.sync_logger.exception(
                 "创建同步会话失败",
@@ -126,6 +131,25 @@ class SyncSessionService:
 
             return session
 
+    @staticmethod
+    def _increment_dashboard_bucket(session: SyncSession) -> None:
+        """累加仪表盘同步趋势小时桶; 失败仅回滚保存点, 不影响会话创建."""
+        try:
+            with db.session.begin_nested():
+                DashboardMetricsRepository.increment(
+                    DASHBOARD_METRIC_SYNC_SESSION,
+                    {(str(session.sync_category), session.created_at or time_utils.now()): 1},
+                )
+        except SQLAlchemyError as exc:
+            log_fallback(
+                "warning",
+                "累加仪表盘同步会话指标桶失败",
+                module="sync_session",
+                action="create_session",
+                fallback_reason="dashboard_metric_bucket_failed",
+                exception=exc,
+            )
+
     def add_instance_records(
         self,
         session_id: str,
@@ -400,6 +424,21 @@ class SyncSessionService:
             )
             raise
 
+    def resolve_instance_record(self, record_id: int) -> tuple[SyncSession, SyncInstanceRecord]:
+        """按实例记录 ID 获取记录及其会话(分片任务在其他节点恢复上下文时使用).
+
+        Raises:
+            NotFoundError: 记录或会话不存在时抛出.
+
+        """
+        record = self._repository.get_record_by_id(record_id)
+        if not record:
+            raise NotFoundError("实例同步记录不存在", extra={"record_id": record_id})
+        session = self._repository.get_session_by_session_id(record.session_id)
+        if not session:
+            raise NotFoundError("同步会话不存在", extra={"session_id": record.session_id})
+        return session, record
+
     def get_session_by_id(self, session_id: str) -> SyncSession | None:
         """根据 ID 获取会话.
 
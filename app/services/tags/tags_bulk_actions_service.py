@@ -171,15 +171,11 @@ class TagsBulkActionsService:
             user_id=actor_id,
         )
 
-        assigned_count = 0
-        for instance in instances:
-            tags_relation = cast(Any, instance.tags)
-            existing_tag_ids = {cast(int, existing.id) for existing in tags_relation.all()}
-            for tag in tags:
-                if tag.id not in existing_tag_ids:
-                    tags_relation.append(tag)
-                    existing_tag_ids.add(tag.id)
-                    assigned_count += 1
+        # 单条 INSERT ... SELECT ... ON CONFLICT DO NOTHING 完成全部关联, 已存在的关联不计数
+        assigned_count = TagsRepository.bulk_assign_instance_tags(
+            [cast(int, instance.id) for instance in instances],
+            [cast(int, tag.id) for tag in tags],
+        )
 
         log_info(
             "批量分配标签成功",
@@ -196,15 +192,10 @@ class TagsBulkActionsService:
         instances = self._get_instances(instance_ids)
         tags = self._get_tags(tag_ids)
 
-        removed_count = 0
-        for instance in instances:
-            tags_relation = cast(Any, instance.tags)
-            existing_tag_ids = {cast(int, existing.id) for existing in tags_relation.all()}
-            for tag in tags:
-                if tag.id in existing_tag_ids:
-                    tags_relation.remove(tag)
-                    existing_tag_ids.remove(tag.id)
-                    removed_count += 1
+        removed_count = TagsRepository.bulk_remove_instance_tags(
+            [cast(int, instance.id) for instance in instances],
+            [cast(int, tag.id) for tag in tags],
+        )
 
         log_info(
             "批量移除标签成功",
@@ -220,13 +211,7 @@ class TagsBulkActionsService:
         """为多实例批量移除全部标签."""
         instances = self._get_instances(instance_ids)
 
-        total_removed = 0
-        for instance in instances:
-            tags_relation = cast(Any, instance.tags)
-            current_tags = list(tags_relation.all())
-            for tag in current_tags:
-                tags_relation.remove(tag)
-            total_removed += len(current_tags)
+        total_removed = TagsRepository.bulk_remove_instance_tags([cast(int, instance.id) for instance in instances])
 
         log_info(
             "批量移除所有标签成功",
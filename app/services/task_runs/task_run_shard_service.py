@@ -0,0 +1,335 @@
+"""TaskRun 分片执行服务.
+
+职责:
+- 将一次运行的子项按分片(TASK_SHARD_SIZE 个)认领给当前节点(FOR UPDATE SKIP LOCKED)
+- 分片处理期间由后台线程刷新心跳; 心跳超时的分片可被其他节点重新认领
+- 协调者(调度触发的任务本身)处理完可认领分片后, 等待其他节点处理中的分片结束
+- 工作节点轮询运行中的分片任务并参与认领
+- 不负责创建 app context(工作节点线程除外); 子项的业务处理与结果写入由任务侧 handler 完成
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import threading
+import time
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import timedelta
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, cast
+
+from flask import current_app
+from sqlalchemy import select, update
+from sqlalchemy.exc import SQLAlchemyError
+
+from app import db
+from app.core.constants.scheduler_jobs import SHARDED_TASKS, ShardedTask
+from app.core.constants.status_types import TaskRunStatus
+from app.models.task_run import TaskRun
+from app.models.task_run_item import TaskRunItem
+from app.repositories.task_runs_repository import TaskRunsRepository
+from app.services.task_runs.task_runs_write_service import TaskRunsWriteService
+from app.settings import (
+    DEFAULT_TASK_SHARD_HEARTBEAT_SECONDS,
+    DEFAULT_TASK_SHARD_SIZE,
+    DEFAULT_TASK_SHARD_STALE_SECONDS,
+)
+from app.utils.structlog_config import get_system_logger, log_fallback
+from app.utils.time_utils import time_utils
+
+if TYPE_CHECKING:
+    from flask import Flask
+    from sqlalchemy.engine import Engine
+
+ShardItemHandler = Callable[[TaskRunItem], None]
+# 分片预处理: 认领分片后先对整批子项做一次批量准备(如并发探测), 返回本分片使用的子项 handler
+ShardPreparer = Callable[[list[TaskRunItem]], ShardItemHandler]
+
+# 协调者等待其他节点分片结束时的轮询间隔, 单位秒
+_WAIT_POLL_SECONDS = 2.0
+
+logger = get_system_logger()
+
+
+def current_node_id() -> str:
+    """当前进程的节点标识(运行实例标识 + pid)."""
+    runtime_instance_id = str(current_app.config.get("RUNTIME_INSTANCE_ID") or socket.gethostname())
+    return f"{runtime_instance_id}:{os.getpid()}"
+
+
+@dataclass(frozen=True, slots=True)
+class TaskShardOptions:
+    """分片执行参数."""
+
+    node_id: str
+    shard_size: int = DEFAULT_TASK_SHARD_SIZE
+    heartbeat_seconds: int = DEFAULT_TASK_SHARD_HEARTBEAT_SECONDS
+    stale_seconds: int = DEFAULT_TASK_SHARD_STALE_SECONDS
+
+    @classmethod
+    def from_app_config(cls) -> TaskShardOptions:
+        """从当前应用配置读取分片参数."""
+        config = current_app.config
+        return cls(
+            node_id=current_node_id(),
+            shard_size=int(config.get("TASK_SHARD_SIZE", DEFAULT_TASK_SHARD_SIZE)),
+            heartbeat_seconds=int(config.get("TASK_SHARD_HEARTBEAT_SECONDS", DEFAULT_TASK_SHARD_HEARTBEAT_SECONDS)),
+            stale_seconds=int(config.get("TASK_SHARD_STALE_SECONDS", DEFAULT_TASK_SHARD_STALE_SECONDS)),
+        )
+
+
+class _ShardHeartbeat:
+    """分片心跳线程(使用独立连接, 不占用任务线程的 session)."""
+
+    def __init__(self, *, engine: Engine, item_ids: Sequence[int], node_id: str, interval_seconds: int) -> None:
+        self._engine = engine
+        self._item_ids = list(item_ids)
+        self._node_id = node_id
+        self._interval_seconds = interval_seconds
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="task-shard-heartbeat", daemon=True)
+
+    def __enter__(self) -> _ShardHeartbeat:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self._stop_event.set()
+        self._thread.join(timeout=self._interval_seconds)
+
+    def _run(self) -> None:
+        table = cast(Any, TaskRunItem).__table__
+        while not self._stop_event.wait(self._interval_seconds):
+            stmt = (
+                update(table)
+                .where(
+                    table.c.id.in_(self._item_ids),
+                    table.c.claimed_by == self._node_id,
+                    table.c.status == TaskRunStatus.RUNNING,
+                )
+                .values(heartbeat_at=time_utils.now())
+            )
+            try:
+                with self._engine.begin() as connection:
+                    connection.execute(stmt)
+            except SQLAlchemyError as heartbeat_error:
+                logger.warning("任务分片心跳失败", node_id=self._node_id, error=str(heartbeat_error))
+
+
+class TaskRunShardService:
+    """按分片认领并处理 TaskRun 子项."""
+
+    def __init__(
+        self,
+        options: TaskShardOptions | None = None,
+        *,
+        task_runs_service: TaskRunsWriteService | None = None,
+        repository: TaskRunsRepository | None = None,
+    ) -> None:
+        """初始化服务(未指定参数时读取应用配置)."""
+        self._options = options or TaskShardOptions.from_app_config()
+        self._task_runs_service = task_runs_service or TaskRunsWriteService()
+        self._repository = repository or TaskRunsRepository()
+
+    @property
+    def options(self) -> TaskShardOptions:
+        """分片执行参数."""
+        return self._options
+
+    @property
+    def node_id(self) -> str:
+        """当前节点标识."""
+        return self._options.node_id
+
+    def run_shards(
+        self,
+        run_id: str,
+        handler: ShardItemHandler,
+        *,
+        item_types: Sequence[str] | None = None,
+        wait_for_others: bool = False,
+        prepare: ShardPreparer | None = None,
+    ) -> int:
+        """循环认领并处理分片, 返回本节点处理的子项数.
+
+        wait_for_others=True(协调者)时, 无可认领分片后继续等待其他节点处理中的分片,
+        期间心跳超时的分片会被本节点重新认领; 运行被取消/标记失败时提前退出.
+        prepare 非空时每个分片先调用 prepare(items) 得到该分片的 handler, 失败时退回 handler 逐项处理.
+        """
+        processed = 0
+        while self._is_running(run_id):
+            items = self._task_runs_service.claim_items(
+                run_id,
+                node_id=self._options.node_id,
+                limit=self._options.shard_size,
+                stale_seconds=self._options.stale_seconds,
+                item_types=tuple(item_types) if item_types else None,
+            )
+            item_ids = [int(item.id) for item in items]
+            db.session.commit()
+            if items:
+                processed += self._process_shard(run_id, items, item_ids, handler, prepare)
+                continue
+            if not wait_for_others or self._repository.count_unfinished_items(run_id, item_types) == 0:
+                break
+            time.sleep(_WAIT_POLL_SECONDS)
+        return processed
+
+    @staticmethod
+    def _is_running(run_id: str) -> bool:
+        # 独立连接读取最新已提交状态: 不提交/结束调用方 session 的事务, 也不受 identity map 缓存影响
+        table = cast(Any, TaskRun).__table__
+        with db.engine.connect() as connection:
+            status = connection.execute(select(table.c.status).where(table.c.run_id == run_id)).scalar_one_or_none()
+        return status == TaskRunStatus.RUNNING
+
+    def _process_shard(
+        self,
+        run_id: str,
+        items: list[TaskRunItem],
+        item_ids: list[int],
+        handler: ShardItemHandler,
+        prepare: ShardPreparer | None = None,
+    ) -> int:
+        processed = 0
+        with _ShardHeartbeat(
+            engine=db.engine,
+            item_ids=item_ids,
+            node_id=self._options.node_id,
+            interval_seconds=self._options.heartbeat_seconds,
+        ):
+            item_handler = self._prepare_shard(run_id, items, handler, prepare)
+            for item in items:
+                if not self._is_running(run_id):
+                    break
+                self._process_item(run_id, item, item_handler)
+                processed += 1
+        return processed
+
+    def _prepare_shard(
+        self,
+        run_id: str,
+        items: list[TaskRunItem],
+        handler: ShardItemHandler,
+        prepare: ShardPreparer | None,
+    ) -> ShardItemHandler:
+        if prepare is None:
+            return handler
+        try:
+            return prepare(items)
+        except Exception as exc:
+            db.session.rollback()
+            log_fallback(
+                "warning",
+                "任务分片预处理失败, 退回逐项处理",
+                module="task_runs",
+                action="prepare_shard",
+                run_id=run_id,
+                node_id=self._options.node_id,
+                fallback_reason="shard_prepare_failed",
+                exception=exc,
+            )
+            return handler
+
+    def _process_item(self, run_id: str, item: TaskRunItem, handler: ShardItemHandler) -> None:
+        item_type = item.item_type
+        item_key = item.item_key
+        try:
+            handler(item)
+        except Exception as exc:
+            db.session.rollback()
+            log_fallback(
+                "exception",
+                "任务分片子项处理异常(未分类)",
+                module="task_runs",
+                action="process_shard_item",
+                run_id=run_id,
+                item_type=item_type,
+                item_key=item_key,
+                node_id=self._options.node_id,
+                fallback_reason="shard_item_handler_failed",
+                exception=exc,
+            )
+            self._task_runs_service.fail_item(
+                run_id,
+                item_type=item_type,
+                item_key=item_key,
+                error_message=f"分片子项处理异常: {exc!s}",
+            )
+            db.session.commit()
+
+
+def resolve_shard_handler(task: ShardedTask) -> ShardItemHandler:
+    """按 `module:function` 解析分片任务的子项 handler."""
+    module_path, function_name = task.handler_target.split(":", 1)
+    return cast(ShardItemHandler, getattr(import_module(module_path), function_name))
+
+
+def resolve_shard_preparer(task: ShardedTask) -> ShardPreparer | None:
+    """按 `module:function` 解析分片任务的分片预处理函数(未声明时返回 None)."""
+    if not task.prepare_target:
+        return None
+    module_path, function_name = task.prepare_target.split(":", 1)
+    return cast(ShardPreparer, getattr(import_module(module_path), function_name))
+
+
+class TaskRunShardWorker:
+    """工作节点: 后台轮询运行中的分片任务并认领分片."""
+
+    def __init__(
+        self,
+        app: Flask,
+        *,
+        poll_seconds: int,
+        sharded_tasks: Mapping[str, ShardedTask] | None = None,
+    ) -> None:
+        """初始化工作节点(poll_seconds 为空闲时的轮询间隔)."""
+        self._app = app
+        self._poll_seconds = poll_seconds
+        self._sharded_tasks = dict(sharded_tasks if sharded_tasks is not None else SHARDED_TASKS)
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """启动后台线程."""
+        self._thread = threading.Thread(target=self._run_loop, name="task-shard-worker", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """停止轮询(处理中的分片在当前子项结束后退出)."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self._poll_seconds + 1)
+
+    def _run_loop(self) -> None:
+        while not self._stop_event.wait(self._poll_seconds):
+            with self._app.app_context():
+                try:
+                    self.run_once()
+                except SQLAlchemyError as poll_error:
+                    db.session.rollback()
+                    logger.warning("任务分片轮询失败", error=str(poll_error))
+                finally:
+                    db.session.remove()
+
+    def run_once(self) -> int:
+        """认领并处理当前所有可认领的分片, 返回处理的子项数(需在 app context 内调用)."""
+        shard_service = TaskRunShardService()
+        stale_before = time_utils.now() - timedelta(seconds=shard_service.options.stale_seconds)
+        runs = TaskRunsRepository.list_claimable_runs(task_keys=list(self._sharded_tasks), stale_before=stale_before)
+        processed = 0
+        for run in runs:
+            if self._stop_event.is_set():
+                break
+            task = self._sharded_tasks[run.task_key]
+            processed += shard_service.run_shards(
+                run.run_id,
+                resolve_shard_handler(task),
+                item_types=task.item_types,
+                prepare=resolve_shard_preparer(task),
+            )
+        if processed:
+            logger.info("工作节点完成任务分片", node_id=shard_service.node_id, processed=processed)
+        return processed
@@ -284,6 +284,9 @@ def build_sync_jumpserver_assets_summary(
     snapshots_written_total: int,
     skipped_unsupported: int,
     skipped_invalid: int,
+    snapshots_changed_total: int = 0,
+    snapshots_deleted_total: int = 0,
+    snapshots_unchanged_total: int = 0,
     skipped: bool = False,
     skip_reason: str | None = None,
     error_message: str | None = None,
@@ -292,7 +295,11 @@ def build_sync_jumpserver_assets_summary(
     metrics = [
         _metric(key="received_total", label="拉取资产", value=received_total, unit="个", tone="info"),
         _metric(key="supported_total", label="支持资产", value=supported_total, unit="个", tone="success"),
+        _metric(key="snapshots_changed_total", label="变更资产", value=snapshots_changed_total, unit="个", tone="info"),
         _metric(key="snapshots_written_total", label="写入快照", value=snapshots_written_total, unit="个", tone="info"),
+        _metric(
+            key="snapshots_deleted_total", label="删除快照", value=snapshots_deleted_total, unit="个", tone="warning"
+        ),
         _metric(key="skipped_unsupported", label="跳过非数据库", value=skipped_unsupported, unit="个", tone="warning"),
         _metric(key="skipped_invalid", label="跳过无效资产", value=skipped_invalid, unit="个", tone="warning"),
     ]
@@ -301,6 +308,9 @@ def build_sync_jumpserver_assets_summary(
             "received_total": received_total,
             "supported_total": supported_total,
             "snapshots_written_total": snapshots_written_total,
+            "snapshots_changed_total": snapshots_changed_total,
+            "snapshots_deleted_total": snapshots_deleted_total,
+            "snapshots_unchanged_total": snapshots_unchanged_total,
             "skipped_unsupported": skipped_unsupported,
             "skipped_invalid": skipped_invalid,
         },
@@ -335,6 +345,7 @@ def build_sync_veeam_backups_summary(
     backup_ids_partially_covered_total: int = 0,
     partial_success: bool = False,
     sources: list[dict[str, Any]] | None = None,
+    stage_timings: dict[str, Any] | None = None,
     skipped: bool = False,
     skip_reason: str | None = None,
     error_message: str | None = None,
@@ -469,6 +480,7 @@ def build_sync_veeam_backups_summary(
         },
         "sources": list(sources or []),
         "partial_success": partial_success,
+        "stage_timings": dict(stage_timings or {}),
         "error_message": error_message,
     }
     return TaskRunSummaryFactory.base(
@@ -678,3 +690,37 @@ def build_capacity_aggregate_current_summary(
         flags=_flags(skipped=skipped, skip_reason=skip_reason),
         ext_data=ext_data,
     )
+
+
+def build_export_csv_summary(
+    *,
+    inputs: dict[str, Any] | None = None,
+    export_type: str,
+    rows_total: int,
+    rows_written: int,
+    file_size_bytes: int | None = None,
+    filename: str | None = None,
+    expires_at: datetime | None = None,
+    task_key: str = "export_csv",
+) -> dict[str, Any]:
+    """构建 export_csv 的 summary_json(v1),运行中与完成时共用."""
+    metrics = [
+        _metric(key="rows_total", label="预计行数", value=rows_total, unit="行", tone="info"),
+        _metric(key="rows_written", label="已写入", value=rows_written, unit="行", tone="success"),
+    ]
+    if file_size_bytes is not None:
+        metrics.append(_metric(key="file_size_bytes", label="文件大小", value=file_size_bytes, unit="B", tone="info"))
+    ext_data = {
+        "export_type": export_type,
+        "rows_total": rows_total,
+        "rows_written": rows_written,
+        "file_size_bytes": file_size_bytes,
+        "filename": filename,
+        "expires_at": expires_at,
+    }
+    return TaskRunSummaryFactory.base(
+        task_key=task_key,
+        inputs=_inputs(inputs),
+        metrics=metrics,
+        ext_data=ext_data,
+    )
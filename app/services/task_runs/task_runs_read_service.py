@@ -7,18 +7,41 @@
 
 from __future__ import annotations
 
+from datetime import datetime
+
 from app.core.constants.status_types import TaskRunStatus
+from app.core.exceptions import NotFoundError
 from app.core.types.listing import PaginatedResult
 from app.core.types.task_runs import (
     TaskRunDetailResult,
     TaskRunErrorLogsResult,
     TaskRunItemItem,
     TaskRunListItem,
+    TaskRunPipelineNode,
+    TaskRunPipelineResult,
     TaskRunsListFilters,
 )
 from app.models.task_run import TaskRun
 from app.models.task_run_item import TaskRunItem
 from app.repositories.task_runs_repository import TaskRunsRepository
+from app.utils.time_utils import UTC_TZ, time_utils
+
+# 依赖流水线最多回溯/展开的层数, 防御异常数据形成环
+PIPELINE_MAX_DEPTH = 32
+
+
+def _as_aware(value: datetime | None) -> datetime | None:
+    if value is None:
+        return None
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC_TZ)
+
+
+def _seconds_between(start: datetime | None, end: datetime | None) -> float | None:
+    start_aware = _as_aware(start)
+    end_aware = _as_aware(end)
+    if start_aware is None or end_aware is None:
+        return None
+    return round((end_aware - start_aware).total_seconds(), 3)
 
 
 class TaskRunsReadService:
@@ -60,6 +83,79 @@ class TaskRunsReadService:
             error_count=len(failed),
         )
 
+    def get_run_pipeline(self, run_id: str) -> TaskRunPipelineResult:
+        """获取 run 所在依赖流水线的全部运行与关键路径.
+
+        每个下游 run 的 upstream_run_id 指向最后完成、真正触发它的上游, 因此从最晚
+        结束的 run 沿 upstream_run_id 回溯到根即为关键路径.
+        """
+        run = self._repository.get_run(run_id)
+        root = self._resolve_pipeline_root(run)
+
+        runs_by_id: dict[str, TaskRun] = {root.run_id: root}
+        depths: dict[str, int] = {root.run_id: 0}
+        level = [root]
+        for depth in range(1, PIPELINE_MAX_DEPTH + 1):
+            children = [
+                child
+                for child in self._repository.list_downstream_runs([item.run_id for item in level])
+                if child.run_id not in runs_by_id
+            ]
+            if not children:
+                break
+            for child in children:
+                runs_by_id[child.run_id] = child
+                depths[child.run_id] = depth
+            level = children
+
+        now = time_utils.now()
+        end_run = max(runs_by_id.values(), key=lambda item: _as_aware(item.completed_at) or now)
+        critical_path: list[str] = []
+        cursor: TaskRun | None = end_run
+        while cursor is not None and cursor.run_id not in critical_path:
+            critical_path.append(cursor.run_id)
+            cursor = runs_by_id.get(cursor.upstream_run_id) if cursor.upstream_run_id else None
+        critical_path.reverse()
+        critical_set = set(critical_path)
+
+        nodes = [
+            TaskRunPipelineNode(
+                run=self._to_run_item(item),
+                depth=depths[item.run_id],
+                duration_seconds=_seconds_between(item.started_at, item.completed_at),
+                wait_seconds=(
+                    _seconds_between(runs_by_id[item.upstream_run_id].completed_at, item.started_at)
+                    if item.upstream_run_id in runs_by_id
+                    else None
+                ),
+                on_critical_path=item.run_id in critical_set,
+            )
+            for item in sorted(
+                runs_by_id.values(),
+                key=lambda item: (depths[item.run_id], _as_aware(item.started_at) or now),
+            )
+        ]
+        return TaskRunPipelineResult(
+            root_run_id=root.run_id,
+            nodes=nodes,
+            critical_path=critical_path,
+            wall_clock_seconds=_seconds_between(root.started_at, end_run.completed_at),
+        )
+
+    def _resolve_pipeline_root(self, run: TaskRun) -> TaskRun:
+        root = run
+        visited = {run.run_id}
+        for _ in range(PIPELINE_MAX_DEPTH):
+            upstream_run_id = root.upstream_run_id
+            if not upstream_run_id or upstream_run_id in visited:
+                break
+            try:
+                root = self._repository.get_run(upstream_run_id)
+            except NotFoundError:
+                break
+            visited.add(root.run_id)
+        return root
+
     @staticmethod
     def _to_run_item(run: TaskRun) -> TaskRunListItem:
         return TaskRunListItem(
@@ -81,6 +177,7 @@ class TaskRunsReadService:
             error_message=run.error_message,
             created_at=(run.created_at.isoformat() if run.created_at else None),
             updated_at=(run.updated_at.isoformat() if run.updated_at else None),
+            upstream_run_id=run.upstream_run_id,
         )
 
     @staticmethod
@@ -100,4 +197,5 @@ class TaskRunsReadService:
             error_message=item.error_message,
             created_at=(item.created_at.isoformat() if item.created_at else None),
             updated_at=(item.updated_at.isoformat() if item.updated_at else None),
+            claimed_by=item.claimed_by,
         )
@@ -10,7 +10,7 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from dataclasses import dataclass
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from typing import Any
 from uuid import uuid4
 
@@ -32,6 +32,7 @@ class TaskRunItemInit:
     item_key: str
     item_name: str | None = None
     instance_id: int | None = None
+    details_json: dict[str, Any] | None = None
 
 
 class TaskRunsWriteService:
@@ -131,6 +132,8 @@ class TaskRunsWriteService:
             row.item_name = item.item_name
             row.instance_id = item.instance_id
             row.status = TaskRunStatus.PENDING
+            if item.details_json is not None:
+                row.details_json = self._ensure_json_serializable(item.details_json)
             to_create.append(row)
 
         if to_create:
@@ -142,6 +145,32 @@ class TaskRunsWriteService:
     def _get_item_or_error(*, run_id: str, item_type: str, item_key: str) -> TaskRunItem:
         return TaskRunsRepository.get_item(run_id=run_id, item_type=item_type, item_key=item_key)
 
+    def claim_items(
+        self,
+        run_id: str,
+        *,
+        node_id: str,
+        limit: int,
+        stale_seconds: int,
+        item_types: list[str] | tuple[str, ...] | None = None,
+    ) -> list[TaskRunItem]:
+        """为当前节点认领一个分片(至多 limit 个子项)并标记为 running."""
+        now = time_utils.now()
+        items = TaskRunsRepository.lock_claimable_items(
+            run_id=run_id,
+            limit=limit,
+            stale_before=now - timedelta(seconds=stale_seconds),
+            item_types=item_types,
+        )
+        for item in items:
+            item.status = TaskRunStatus.RUNNING
+            item.claimed_by = node_id
+            item.heartbeat_at = now
+            item.claim_count = int(item.claim_count or 0) + 1
+            if item.started_at is None:
+                item.started_at = now
+        return items
+
     def start_item(self, run_id: str, *, item_type: str, item_key: str) -> None:
         """将指定子项标记为 running，并写入 started_at."""
         self._get_run_or_error(run_id)
@@ -229,6 +258,16 @@ class TaskRunsWriteService:
 
         run.completed_at = time_utils.now()
 
+    def update_progress(self, run_id: str, *, total: int, completed: int) -> None:
+        """直接写入 run 的进度计数(无子项、按行计量进度的任务使用,如后台导出)."""
+        run = self._get_run_or_error(run_id)
+        run.progress_total = max(int(total), 0)
+        run.progress_completed = max(int(completed), 0)
+
+    def set_result_url(self, run_id: str, result_url: str | None) -> None:
+        """更新 run 的结果链接(run_id 生成后才能确定链接的场景)."""
+        self._get_run_or_error(run_id).result_url = result_url
+
     def is_cancelled(self, run_id: str) -> bool:
         """判断 TaskRun 是否已取消."""
         return self._get_run_or_error(run_id).status == TaskRunStatus.CANCELLED
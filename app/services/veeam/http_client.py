@@ -0,0 +1,140 @@
+"""Veeam HTTP 令牌桶限速与阶段耗时统计.
+
+职责:
+- 以令牌桶控制数据请求速率, 遇到 429/503 时降速并在后续成功请求中逐步恢复
+- 按阶段累计请求耗时直方图, 供 TaskRun summary 展示
+- keep-alive 连接池见 `app.infra.http_connection_pool`
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+
+# 耗时直方图桶上界, 单位毫秒; 超出最后一个上界的请求计入 "gt_30000"
+_TIMING_BUCKETS_MS: tuple[int, ...] = (100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+# 降速后每次成功请求恢复基准速率的 10%
+_RATE_RECOVERY_RATIO = 0.1
+# 降速不低于基准速率的 10%
+_MIN_RATE_RATIO = 0.1
+# 未返回 Retry-After 时的限流退避, 单位秒
+_DEFAULT_THROTTLE_BACKOFF_SECONDS = 2.0
+
+
+class VeeamTokenBucket:
+    """令牌桶限速器(线程安全), 429/503 时自适应降速."""
+
+    def __init__(self, *, rate_per_second: float, burst: int | None = None) -> None:
+        """初始化令牌桶(burst 默认与每秒速率相同)."""
+        self._base_rate = max(float(rate_per_second), 0.001)
+        self._rate = self._base_rate
+        self._capacity = float(max(burst if burst is not None else int(self._base_rate), 1))
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._throttled_total = 0
+        self._lock = threading.Lock()
+
+    @property
+    def rate_per_second(self) -> float:
+        """当前速率."""
+        with self._lock:
+            return self._rate
+
+    @property
+    def throttled_total(self) -> int:
+        """累计限流次数."""
+        with self._lock:
+            return self._throttled_total
+
+    def acquire(self) -> float:
+        """取得一个令牌, 返回等待秒数."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                wait_seconds = max(self._blocked_until - now, 0.0)
+                if wait_seconds <= 0 and self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                if wait_seconds <= 0:
+                    wait_seconds = (1 - self._tokens) / self._rate
+            time.sleep(wait_seconds)
+            waited += wait_seconds
+
+    def penalize(self, retry_after_seconds: float | None) -> float:
+        """服务端限流: 速率减半并暂停发放令牌, 返回暂停秒数."""
+        backoff = retry_after_seconds if retry_after_seconds and retry_after_seconds > 0 else None
+        with self._lock:
+            self._throttled_total += 1
+            self._rate = max(self._rate / 2, self._base_rate * _MIN_RATE_RATIO)
+            pause = backoff if backoff is not None else _DEFAULT_THROTTLE_BACKOFF_SECONDS
+            self._blocked_until = max(self._blocked_until, time.monotonic() + pause)
+            self._tokens = min(self._tokens, 0.0)
+            return pause
+
+    def reward(self) -> None:
+        """请求成功: 逐步恢复到基准速率."""
+        with self._lock:
+            if self._rate < self._base_rate:
+                self._rate = min(self._rate + self._base_rate * _RATE_RECOVERY_RATIO, self._base_rate)
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        if elapsed > 0:
+            self._tokens = min(self._tokens + elapsed * self._rate, self._capacity)
+
+
+@dataclass(slots=True)
+class _StageTiming:
+    requests_total: int = 0
+    total_ms: int = 0
+    max_ms: int = 0
+    buckets: dict[str, int] = field(default_factory=dict)
+    outcomes: dict[str, int] = field(default_factory=dict)
+
+
+class VeeamStageTimings:
+    """按阶段累计请求耗时直方图(线程安全)."""
+
+    def __init__(self) -> None:
+        """初始化空统计."""
+        self._lock = threading.Lock()
+        self._stages: dict[str, _StageTiming] = {}
+
+    def record(self, *, stage: str, elapsed_ms: int, outcome: str) -> None:
+        """记录一次请求."""
+        bucket = next(
+            (f"le_{bound}" for bound in _TIMING_BUCKETS_MS if elapsed_ms <= bound),
+            f"gt_{_TIMING_BUCKETS_MS[-1]}",
+        )
+        with self._lock:
+            stats = self._stages.setdefault(stage, _StageTiming())
+            stats.requests_total += 1
+            stats.total_ms += elapsed_ms
+            stats.max_ms = max(stats.max_ms, elapsed_ms)
+            stats.buckets[bucket] = stats.buckets.get(bucket, 0) + 1
+            stats.outcomes[outcome] = stats.outcomes.get(outcome, 0) + 1
+
+    def snapshot(self) -> dict[str, dict[str, object]]:
+        """输出各阶段统计(含平均耗时)."""
+        with self._lock:
+            return {
+                stage: {
+                    "requests_total": stats.requests_total,
+                    "total_ms": stats.total_ms,
+                    "avg_ms": stats.total_ms // stats.requests_total if stats.requests_total else 0,
+                    "max_ms": stats.max_ms,
+                    "buckets": dict(stats.buckets),
+                    "outcomes": dict(stats.outcomes),
+                }
+                for stage, stats in self._stages.items()
+            }
+
+    def reset(self) -> None:
+        """清空统计(每个数据源同步开始时调用)."""
+        with self._lock:
+            self._stages.clear()
@@ -0,0 +1,184 @@
+"""Veeam 增量同步规划(restorePoint 水位)."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+
+from app.models.veeam_machine_backup_snapshot import VeeamMachineBackupSnapshot
+from app.services.veeam.backup_file_metric_merger import extract_backup_metric_int
+from app.services.veeam.matching import normalize_machine_name
+from app.services.veeam.types import (
+    VeeamBackupObjectMatchResult,
+    VeeamBackupObjectWatermarkRecord,
+    VeeamMachineBackupCollection,
+    VeeamMachineBackupRecord,
+)
+from app.settings import DEFAULT_VEEAM_FULL_RESYNC_INTERVAL_HOURS
+from app.utils.time_utils import time_utils
+
+
+@dataclass(frozen=True, slots=True)
+class VeeamIncrementalSyncPlan:
+    """单个数据源本次同步的增量计划."""
+
+    full_resync: bool
+    created_after: dict[str, datetime] = field(default_factory=dict)
+    previous_watermarks: dict[str, VeeamBackupObjectWatermarkRecord] = field(default_factory=dict)
+    carried_records: list[VeeamMachineBackupRecord] = field(default_factory=list)
+    incremental_machine_names: list[str] = field(default_factory=list)
+
+    @property
+    def incremental_backup_objects_total(self) -> int:
+        """按水位增量拉取的 backupObject 数."""
+        return len(self.created_after)
+
+
+class VeeamIncrementalSyncPlanner:
+    """决定哪些 backupObject 可按水位增量拉取, 并维护水位与已有还原点历史."""
+
+    def __init__(self, *, full_resync_interval_hours: int = DEFAULT_VEEAM_FULL_RESYNC_INTERVAL_HOURS) -> None:
+        self._full_resync_interval = timedelta(hours=max(int(full_resync_interval_hours), 1))
+
+    def plan(
+        self,
+        *,
+        match_result: VeeamBackupObjectMatchResult,
+        snapshots: Iterable[VeeamMachineBackupSnapshot],
+        watermarks: Iterable[VeeamBackupObjectWatermarkRecord],
+        full_resync: bool,
+        now: datetime,
+    ) -> VeeamIncrementalSyncPlan:
+        """按机器分组: 同一机器的全部 backupObject 均有未过期水位且已有快照历史时才增量拉取."""
+        if full_resync:
+            return VeeamIncrementalSyncPlan(full_resync=True)
+
+        snapshots_by_name = {row.normalized_machine_name: row for row in snapshots if row.normalized_machine_name}
+        watermarks_by_object = {watermark.backup_object_id: watermark for watermark in watermarks}
+        object_ids_by_machine: dict[str, list[str]] = {}
+        for matched in match_result.matched_backup_objects:
+            normalized_machine_name = normalize_machine_name(matched.machine_name or "")
+            if normalized_machine_name:
+                object_ids_by_machine.setdefault(normalized_machine_name, []).append(matched.backup_object_id)
+
+        created_after: dict[str, datetime] = {}
+        carried_records: list[VeeamMachineBackupRecord] = []
+        incremental_machine_names: list[str] = []
+        for normalized_machine_name, backup_object_ids in object_ids_by_machine.items():
+            snapshot = snapshots_by_name.get(normalized_machine_name)
+            history = self.restore_records_from_snapshot(snapshot) if snapshot is not None else []
+            machine_watermarks = [watermarks_by_object.get(backup_object_id) for backup_object_id in backup_object_ids]
+            if not history or not all(
+                watermark is not None and self._is_fresh(watermark, now=now) for watermark in machine_watermarks
+            ):
+                continue
+            for watermark in machine_watermarks:
+                if watermark is not None:
+                    created_after[watermark.backup_object_id] = watermark.latest_restore_point_at
+            carried_records.extend(history)
+            incremental_machine_names.append(normalized_machine_name)
+
+        return VeeamIncrementalSyncPlan(
+            full_resync=False,
+            created_after=created_after,
+            previous_watermarks={
+                backup_object_id: watermarks_by_object[backup_object_id] for backup_object_id in created_after
+            },
+            carried_records=carried_records,
+            incremental_machine_names=incremental_machine_names,
+        )
+
+    @staticmethod
+    def merge_carried_records(
+        *,
+        plan: VeeamIncrementalSyncPlan,
+        records: list[VeeamMachineBackupRecord],
+    ) -> list[VeeamMachineBackupRecord]:
+        """把已写入快照的还原点历史与本次新拉取的记录合并(按 restorePoint id 去重)."""
+        if not plan.carried_records:
+            return records
+        fetched_ids = {record.source_record_id for record in records if record.source_record_id}
+        return [
+            *records,
+            *(record for record in plan.carried_records if record.source_record_id not in fetched_ids),
+        ]
+
+    def build_watermarks(
+        self,
+        *,
+        plan: VeeamIncrementalSyncPlan,
+        restore_points_result: VeeamMachineBackupCollection | object,
+        records: list[VeeamMachineBackupRecord],
+        now: datetime,
+    ) -> list[VeeamBackupObjectWatermarkRecord]:
+        """生成本次需要写入的水位(补齐 backupFiles 合并后的 backupFileId)."""
+        backup_file_ids = {
+            record.source_record_id: self._resolve_backup_file_id(record)
+            for record in records
+            if record.source_record_id
+        }
+        watermarks: list[VeeamBackupObjectWatermarkRecord] = []
+        for watermark in getattr(restore_points_result, "backup_object_watermarks", []) or []:
+            previous = plan.previous_watermarks.get(watermark.backup_object_id)
+            watermarks.append(
+                replace(
+                    watermark,
+                    latest_backup_file_id=backup_file_ids.get(watermark.latest_restore_point_id)
+                    or watermark.latest_backup_file_id,
+                    full_synced_at=previous.full_synced_at if previous is not None else now,
+                )
+            )
+        return watermarks
+
+    @staticmethod
+    def restore_records_from_snapshot(snapshot: VeeamMachineBackupSnapshot) -> list[VeeamMachineBackupRecord]:
+        """从快照 raw_payload.restore_points 还原历史 restorePoint 记录."""
+        raw_payload = snapshot.raw_payload if isinstance(snapshot.raw_payload, dict) else {}
+        restore_points = raw_payload.get("restore_points")
+        if not isinstance(restore_points, list):
+            return []
+
+        records: list[VeeamMachineBackupRecord] = []
+        for payload in restore_points:
+            if not isinstance(payload, dict):
+                continue
+            backup_at = time_utils.to_utc(str(payload.get("creationTime") or ""))
+            if backup_at is None:
+                continue
+            source_record_id = _pick_string(payload, "id")
+            is_latest = source_record_id is not None and source_record_id == snapshot.source_record_id
+            records.append(
+                VeeamMachineBackupRecord(
+                    machine_name=str(snapshot.machine_name),
+                    backup_at=backup_at,
+                    machine_ip=snapshot.machine_ip,
+                    backup_id=_pick_string(payload, "backupId"),
+                    backup_file_id=_pick_string(payload, "backupFileId"),
+                    job_name=snapshot.job_name,
+                    restore_point_name=_pick_string(payload, "name"),
+                    source_record_id=source_record_id,
+                    restore_point_size_bytes=(
+                        snapshot.restore_point_size_bytes
+                        if is_latest
+                        else extract_backup_metric_int(payload, ("dataSize", "data_size"))
+                    ),
+                    backup_chain_size_bytes=snapshot.backup_chain_size_bytes if is_latest else None,
+                    raw_payload=dict(payload),
+                )
+            )
+        return records
+
+    def _is_fresh(self, watermark: VeeamBackupObjectWatermarkRecord, *, now: datetime) -> bool:
+        return watermark.full_synced_at is not None and now - watermark.full_synced_at < self._full_resync_interval
+
+    @staticmethod
+    def _resolve_backup_file_id(record: VeeamMachineBackupRecord) -> str | None:
+        return record.backup_file_id or _pick_string(record.raw_payload, "backupFileId")
+
+
+def _pick_string(payload: dict[str, object], key: str) -> str | None:
+    value = payload.get(key)
+    if isinstance(value, str) and value.strip():
+        return value.strip()
+    return None
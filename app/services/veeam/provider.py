@@ -4,28 +4,34 @@ from __future__ import annotations
 
 import json
 import os
-import ssl
 import threading
 import time
-from datetime import datetime
-from typing import Any, Literal, Protocol, TypedDict
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, Literal, Protocol, TypedDict, TypeVar, cast
 from urllib.error import HTTPError, URLError
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
-from urllib.request import Request, urlopen
+from urllib.request import Request
 
-from flask import current_app, has_app_context
+from flask import Flask, current_app, has_app_context
 
 from app.core.types import JsonValue
+from app.infra.http_connection_pool import HttpConnectionPool, SslContextCache
 from app.infra.route_safety import log_with_context
+from app.services.veeam.http_client import VeeamStageTimings, VeeamTokenBucket
 from app.services.veeam.match_sampler import VeeamMatchSampler, resolve_backup_machine_ip
 from app.services.veeam.types import (
     VeeamBackupFileCollection,
     VeeamBackupFileRecord,
     VeeamBackupObjectMatchResult,
+    VeeamBackupObjectWatermarkRecord,
     VeeamMachineBackupCollection,
     VeeamMachineBackupRecord,
     VeeamMatchedBackupObject,
     VeeamProviderSession,
+    VeeamRequestThrottledError,
     VeeamRequestTimeoutError,
     VeeamRestorePointsFetchError,
 )
@@ -39,12 +45,19 @@ VEEAM_BACKUPS_PATH = "/api/v1/backups"
 VEEAM_ACCEPT_HEADER = "application/json"
 _VEEAM_DATA_REQUEST_ATTEMPTS = 2
 _VEEAM_DATA_REQUEST_INTERVAL_SECONDS = 1
+# 429/503 最大重试次数(退避时长由令牌桶按 Retry-After 控制)
+_VEEAM_THROTTLE_RETRY_ATTEMPTS = 4
+_VEEAM_THROTTLE_HTTP_STATUSES = frozenset({429, 503})
+
+_K = TypeVar("_K")
+_T = TypeVar("_T")
 
 __all__ = [
     "HttpVeeamProvider",
     "VeeamBackupFileCollection",
     "VeeamBackupFileRecord",
     "VeeamBackupObjectMatchResult",
+    "VeeamBackupObjectWatermarkRecord",
     "VeeamMachineBackupCollection",
     "VeeamMachineBackupRecord",
     "VeeamMatchedBackupObject",
@@ -62,10 +75,8 @@ class _ProviderSettings(TypedDict):
     token_retry_backoff_seconds: int
     backup_objects_limit: int
     verify_ssl: bool
-
-
-def _default_open(request: Request, *, timeout: int, context: ssl.SSLContext):
-    return urlopen(request, timeout=timeout, context=context)
+    max_concurrency: int
+    requests_per_second: float
 
 
 class VeeamProvider(Protocol):
@@ -107,8 +118,9 @@ class VeeamProvider(Protocol):
         *,
         session: VeeamProviderSession,
         match_result: VeeamBackupObjectMatchResult,
+        watermarks: Mapping[str, datetime] | None = None,
     ) -> VeeamMachineBackupCollection:
-        """按匹配结果拉取 restorePoints."""
+        """按匹配结果拉取 restorePoints(watermarks 中的 backupObject 只拉取晚于水位的记录)."""
         ...
 
     def fetch_backup_file_records(
@@ -134,6 +146,14 @@ class VeeamProvider(Protocol):
         """返回机器级备份列表与统计."""
         ...
 
+    def reset_stage_timings(self) -> None:
+        """清空分阶段请求耗时统计."""
+        ...
+
+    def stage_timings(self) -> dict[str, object]:
+        """返回分阶段请求耗时直方图与限速状态."""
+        ...
+
 
 class HttpVeeamProvider:
     """VBR HTTP Provider."""
@@ -146,7 +166,9 @@ class HttpVeeamProvider:
         token_retry_attempts: int | None = None,
         token_retry_backoff_seconds: int | None = None,
         verify_ssl: bool | None = None,
-        opener=_default_open,
+        opener=None,
+        max_concurrency: int | None = None,
+        rate_limiter: VeeamTokenBucket | None = None,
     ) -> None:
         resolved_settings = self._resolve_settings()
         self._timeout_seconds = int(timeout_seconds or resolved_settings["timeout_seconds"])
@@ -167,7 +189,17 @@ class HttpVeeamProvider:
         )
         self._backup_objects_limit = int(resolved_settings["backup_objects_limit"])
         self._verify_ssl = bool(resolved_settings["verify_ssl"] if verify_ssl is None else verify_ssl)
-        self._opener = opener
+        self._max_concurrency = max(
+            int(max_concurrency if max_concurrency is not None else resolved_settings["max_concurrency"]),
+            1,
+        )
+        # 默认使用 keep-alive 连接池; 测试可注入与 urlopen 签名一致的 opener
+        self._opener = opener or HttpConnectionPool(max_idle_per_host=self._max_concurrency)
+        self._rate_limiter = rate_limiter or VeeamTokenBucket(
+            rate_per_second=float(resolved_settings["requests_per_second"]),
+        )
+        self._stage_timings = VeeamStageTimings()
+        self._ssl_contexts = SslContextCache()
 
     @staticmethod
     def _resolve_settings() -> _ProviderSettings:
@@ -197,6 +229,14 @@ class HttpVeeamProvider:
                     "VEEAM_VERIFY_SSL",
                     Settings.model_fields["veeam_verify_ssl"].default,
                 )),
+                "max_concurrency": int(current_app.config.get(
+                    "VEEAM_MAX_CONCURRENCY",
+                    Settings.model_fields["veeam_max_concurrency"].default,
+                )),
+                "requests_per_second": float(current_app.config.get(
+                    "VEEAM_REQUESTS_PER_SECOND",
+                    Settings.model_fields["veeam_requests_per_second"].default,
+                )),
             }
         settings = Settings.load()
         return {
@@ -206,11 +246,27 @@ class HttpVeeamProvider:
             "token_retry_backoff_seconds": settings.veeam_token_retry_backoff_seconds,
             "backup_objects_limit": settings.veeam_backup_objects_limit,
             "verify_ssl": settings.veeam_verify_ssl,
+            "max_concurrency": settings.veeam_max_concurrency,
+            "requests_per_second": settings.veeam_requests_per_second,
         }
 
     def is_configured(self) -> bool:
         return self._timeout_seconds > 0
 
+    def reset_stage_timings(self) -> None:
+        self._stage_timings.reset()
+
+    def stage_timings(self) -> dict[str, object]:
+        stages = self._stage_timings.snapshot()
+        if not stages:
+            return {}
+        return {
+            "stages": stages,
+            "max_concurrency": self._max_concurrency,
+            "requests_per_second": round(self._rate_limiter.rate_per_second, 3),
+            "throttled_total": self._rate_limiter.throttled_total,
+        }
+
     def create_session(
         self,
         *,
@@ -265,7 +321,9 @@ class HttpVeeamProvider:
         *,
         session: VeeamProviderSession,
         match_result: VeeamBackupObjectMatchResult,
+        watermarks: Mapping[str, datetime] | None = None,
     ) -> VeeamMachineBackupCollection:
+        created_after_map = dict(watermarks or {})
         records: list[VeeamMachineBackupRecord] = []
         skipped_invalid = 0
         received_total = 0
@@ -281,53 +339,66 @@ class HttpVeeamProvider:
         failed_backup_objects_total = 0
         failed_backup_ids_sample: list[str] = []
         failed_machine_names_sample: list[str] = []
-
-        for matched_backup_object in match_result.matched_backup_objects:
+        incremental_backup_objects_total = 0
+        unchanged_backup_objects_total = 0
+        backup_object_watermarks: list[VeeamBackupObjectWatermarkRecord] = []
+
+        matched_backup_objects = list(match_result.matched_backup_objects)
+        outcomes = self._map_concurrently(
+            lambda matched: self._collect_paginated_items(
+                url=self._build_backup_restore_points_url(
+                    base_url=session.base_url,
+                    backup_object_id=matched.backup_object_id,
+                    created_after=created_after_map.get(matched.backup_object_id),
+                ),
+                access_token=session.access_token,
+                api_version=session.api_version,
+                verify_ssl=session.verify_ssl,
+                stage="restore_points",
+                created_after=created_after_map.get(matched.backup_object_id),
+            ),
+            matched_backup_objects,
+        )
+        for matched_backup_object, outcome in zip(matched_backup_objects, outcomes, strict=True):
             failed_url = self._build_backup_restore_points_url(
                 base_url=session.base_url,
                 backup_object_id=matched_backup_object.backup_object_id,
             )
-            try:
-                restore_point_items = self._collect_paginated_items(
-                    url=failed_url,
-                    access_token=session.access_token,
-                    api_version=session.api_version,
-                    verify_ssl=session.verify_ssl,
-                    stage="restore_points",
-                )
-            except VeeamRequestTimeoutError as exc:
+            if isinstance(outcome, VeeamRequestTimeoutError):
                 timed_out_backup_objects_total += 1
                 if len(timed_out_backup_ids_sample) < 20:
                     timed_out_backup_ids_sample.append(matched_backup_object.backup_object_id)
                 if matched_backup_object.machine_name and len(timed_out_machine_names_sample) < 20:
                     timed_out_machine_names_sample.append(str(matched_backup_object.machine_name))
                 self._append_timeout_diagnostics(
-                    error=exc,
+                    error=outcome,
                     urls_sample=timed_out_urls_sample,
                     reason_types_sample=timed_out_reason_types_sample,
                     elapsed_ms_sample=timed_out_elapsed_ms_sample,
                     fallback_url=failed_url,
                 )
                 continue
-            except Exception:
+            if isinstance(outcome, Exception):
                 failed_backup_objects_total += 1
                 if len(failed_backup_ids_sample) < 20:
                     failed_backup_ids_sample.append(matched_backup_object.backup_object_id)
                 if matched_backup_object.machine_name and len(failed_machine_names_sample) < 20:
                     failed_machine_names_sample.append(str(matched_backup_object.machine_name))
                 continue
+            restore_point_items = outcome
             received_total += len(restore_point_items)
             completed_backup_objects_total += 1
-            for item in restore_point_items:
-                record = self._normalize_backup_record(
-                    item,
-                    backup_item=matched_backup_object.backup_item,
-                    backup_machine_name=matched_backup_object.machine_name,
+            if matched_backup_object.backup_object_id in created_after_map:
+                incremental_backup_objects_total += 1
+                if not restore_point_items:
+                    unchanged_backup_objects_total += 1
+            object_records = self._normalize_restore_point_items(restore_point_items, matched_backup_object)
+            skipped_invalid += len(restore_point_items) - len(object_records)
+            records.extend(object_records)
+            if object_records:
+                backup_object_watermarks.append(
+                    self._build_backup_object_watermark(matched_backup_object, object_records)
                 )
-                if record is None:
-                    skipped_invalid += 1
-                    continue
-                records.append(record)
 
         return VeeamMachineBackupCollection(
             records=records,
@@ -354,6 +425,40 @@ class HttpVeeamProvider:
             failed_backup_objects_total=failed_backup_objects_total,
             failed_backup_ids_sample=failed_backup_ids_sample,
             failed_machine_names_sample=failed_machine_names_sample,
+            incremental_backup_objects_total=incremental_backup_objects_total,
+            unchanged_backup_objects_total=unchanged_backup_objects_total,
+            backup_object_watermarks=backup_object_watermarks,
+        )
+
+    def _normalize_restore_point_items(
+        self,
+        restore_point_items: list[dict[str, Any]],
+        matched_backup_object: VeeamMatchedBackupObject,
+    ) -> list[VeeamMachineBackupRecord]:
+        records: list[VeeamMachineBackupRecord] = []
+        for item in restore_point_items:
+            record = self._normalize_backup_record(
+                item,
+                backup_item=matched_backup_object.backup_item,
+                backup_machine_name=matched_backup_object.machine_name,
+            )
+            if record is not None:
+                records.append(record)
+        return records
+
+    @staticmethod
+    def _build_backup_object_watermark(
+        matched_backup_object: VeeamMatchedBackupObject,
+        object_records: list[VeeamMachineBackupRecord],
+    ) -> VeeamBackupObjectWatermarkRecord:
+        latest_record = max(object_records, key=lambda item: (item.backup_at, item.source_record_id or ""))
+        return VeeamBackupObjectWatermarkRecord(
+            backup_object_id=matched_backup_object.backup_object_id,
+            latest_restore_point_at=latest_record.backup_at,
+            machine_name=matched_backup_object.machine_name,
+            latest_restore_point_id=latest_record.source_record_id,
+            backup_id=latest_record.backup_id,
+            latest_backup_file_id=latest_record.backup_file_id,
         )
 
     def list_machine_backups(
@@ -405,33 +510,36 @@ class HttpVeeamProvider:
         failed_backup_ids_sample: list[str] = []
         failed_urls_sample: list[str] = []
 
-        for backup_id in normalized_backup_ids:
+        outcomes = self._map_concurrently(
+            lambda backup_id: self._collect_paginated_items(
+                url=self._build_backup_files_url(base_url=session.base_url, backup_id=backup_id),
+                access_token=session.access_token,
+                api_version=session.api_version,
+                verify_ssl=session.verify_ssl,
+                stage="backup_files",
+            ),
+            normalized_backup_ids,
+        )
+        for backup_id, outcome in zip(normalized_backup_ids, outcomes, strict=True):
             failed_url = self._build_backup_files_url(base_url=session.base_url, backup_id=backup_id)
-            try:
-                backup_file_items = self._collect_paginated_items(
-                    url=failed_url,
-                    access_token=session.access_token,
-                    api_version=session.api_version,
-                    verify_ssl=session.verify_ssl,
-                    stage="backup_files",
-                )
-            except VeeamRequestTimeoutError as exc:
+            if isinstance(outcome, VeeamRequestTimeoutError):
                 if len(timed_out_backup_ids_sample) < 20:
                     timed_out_backup_ids_sample.append(backup_id)
                 self._append_timeout_diagnostics(
-                    error=exc,
+                    error=outcome,
                     urls_sample=timed_out_urls_sample,
                     reason_types_sample=timed_out_reason_types_sample,
                     elapsed_ms_sample=timed_out_elapsed_ms_sample,
                     fallback_url=failed_url,
                 )
                 continue
-            except Exception:
+            if isinstance(outcome, Exception):
                 if len(failed_backup_ids_sample) < 20:
                     failed_backup_ids_sample.append(backup_id)
                 if len(failed_urls_sample) < 20:
                     failed_urls_sample.append(failed_url)
                 continue
+            backup_file_items = outcome
 
             received_total += len(backup_file_items)
             backup_ids_completed += 1
@@ -455,6 +563,32 @@ class HttpVeeamProvider:
             failed_urls_sample=failed_urls_sample,
         )
 
+    def _map_concurrently(self, func: Callable[[_K], _T], keys: list[_K]) -> list[_T | Exception]:
+        """在线程池中并发执行(并发数受 max_concurrency 限制), 按输入顺序返回结果或异常."""
+
+        def _call(key: _K) -> _T | Exception:
+            try:
+                return func(key)
+            except Exception as exc:
+                return exc
+
+        if self._max_concurrency <= 1 or len(keys) <= 1:
+            return [_call(key) for key in keys]
+
+        base_app = cast(Flask, cast(Any, current_app)._get_current_object()) if has_app_context() else None
+
+        def _call_in_app_context(key: _K) -> _T | Exception:
+            if base_app is None:
+                return _call(key)
+            with base_app.app_context():
+                return _call(key)
+
+        with ThreadPoolExecutor(
+            max_workers=min(self._max_concurrency, len(keys)),
+            thread_name_prefix="veeam-http",
+        ) as executor:
+            return list(executor.map(_call_in_app_context, keys))
+
     def _collect_paginated_items(
         self,
         *,
@@ -463,7 +597,9 @@ class HttpVeeamProvider:
         api_version: str,
         verify_ssl: bool,
         stage: str,
+        created_after: datetime | None = None,
     ) -> list[dict[str, Any]]:
+        """拉取全部分页; 指定 created_after 时丢弃不晚于水位的记录, 并在遇到这类记录后停止翻页."""
         items: list[dict[str, Any]] = []
         next_url: str | None = url
         while next_url:
@@ -475,10 +611,22 @@ class HttpVeeamProvider:
                 stage=stage,
             )
             page_items = self._parse_page_payload(payload)
-            items.extend(page_items)
+            if created_after is not None:
+                newer_items = [item for item in page_items if not self._is_at_or_before(item, created_after)]
+                items.extend(newer_items)
+                if len(newer_items) < len(page_items):
+                    # 请求按创建时间倒序, 出现已同步的记录说明之后的分页都更旧
+                    break
+            else:
+                items.extend(page_items)
             next_url = self._resolve_next_url(base_url=url, current_url=next_url, payload=payload)
         return items
 
+    @staticmethod
+    def _is_at_or_before(item: dict[str, Any], watermark: datetime) -> bool:
+        backup_at = HttpVeeamProvider._resolve_backup_at(item)
+        return backup_at is not None and backup_at <= watermark
+
     @staticmethod
     def _build_base_url(*, server_host: str, server_port: int) -> str:
         host = str(server_host or "").strip()
@@ -583,16 +731,43 @@ class HttpVeeamProvider:
             method="GET",
         )
         max_attempts = _VEEAM_DATA_REQUEST_ATTEMPTS
-        for attempt in range(1, max_attempts + 1):
+        timeout_attempts = 0
+        throttled_attempts = 0
+        while True:
+            # 令牌桶限速取代固定间隔; 并发线程共享同一令牌桶
+            self._rate_limiter.acquire()
+            attempt = timeout_attempts + throttled_attempts + 1
             try:
-                return self._read_json_response(
+                payload = self._read_json_response(
                     request=request,
                     verify_ssl=verify_ssl,
                     stage=stage,
                     attempt=attempt,
                 )
+            except VeeamRequestThrottledError as exc:
+                throttled_attempts += 1
+                if throttled_attempts > _VEEAM_THROTTLE_RETRY_ATTEMPTS:
+                    raise
+                pause_seconds = self._rate_limiter.penalize(exc.retry_after_seconds)
+                log_with_context(
+                    "warning",
+                    "Veeam API 限流，降速后重试",
+                    module="veeam",
+                    action="api_request_throttled",
+                    extra={
+                        "stage": stage,
+                        "url": url,
+                        "http_status": exc.http_status,
+                        "attempt": attempt,
+                        "retry_after_seconds": pause_seconds,
+                        "requests_per_second": round(self._rate_limiter.rate_per_second, 3),
+                    },
+                    include_actor=False,
+                )
+                continue
             except VeeamRequestTimeoutError as exc:
-                if attempt >= max_attempts:
+                timeout_attempts += 1
+                if timeout_attempts >= max_attempts:
                     raise
                 log_with_context(
                     "warning",
@@ -613,14 +788,25 @@ class HttpVeeamProvider:
                     },
                     include_actor=False,
                 )
-            finally:
-                self._pause_after_data_request()
-        raise RuntimeError("Veeam API 请求重试流程异常")
+                time.sleep(_VEEAM_DATA_REQUEST_INTERVAL_SECONDS)
+                continue
+            self._rate_limiter.reward()
+            return payload
 
     @staticmethod
-    def _pause_after_data_request() -> None:
-        if _VEEAM_DATA_REQUEST_INTERVAL_SECONDS > 0:
-            time.sleep(_VEEAM_DATA_REQUEST_INTERVAL_SECONDS)
+    def _parse_retry_after(error: HTTPError) -> float | None:
+        raw = str((error.headers or {}).get("Retry-After") or "").strip()
+        if not raw:
+            return None
+        try:
+            return max(float(raw), 0.0)
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(raw)
+        except (TypeError, ValueError):
+            return None
+        return max((retry_at - time_utils.now()).total_seconds(), 0.0)
 
     def _read_json_response(
         self,
@@ -631,7 +817,7 @@ class HttpVeeamProvider:
         stage: str,
         attempt: int = 1,
     ) -> object:
-        context = ssl.create_default_context() if verify_ssl else ssl._create_unverified_context()
+        context = self._ssl_contexts.get(verify_ssl)
         resolved_timeout_seconds = self._timeout_seconds if timeout_seconds is None else timeout_seconds
         started_at = time.monotonic()
         try:
@@ -664,6 +850,27 @@ class HttpVeeamProvider:
         except HTTPError as exc:
             elapsed_ms = int((time.monotonic() - started_at) * 1000)
             reason_type, reason_repr = self._describe_error_reason(exc)
+            if exc.code in _VEEAM_THROTTLE_HTTP_STATUSES:
+                self._log_api_request_completion(
+                    stage=stage,
+                    request=request,
+                    timeout_seconds=resolved_timeout_seconds,
+                    elapsed_ms=elapsed_ms,
+                    outcome="throttled",
+                    level="warning",
+                    exception=exc,
+                    reason_type=reason_type,
+                    reason_repr=reason_repr,
+                    classified_as_timeout=False,
+                    attempt=attempt,
+                    http_status=exc.code,
+                )
+                raise VeeamRequestThrottledError(
+                    self._build_http_error_message(exc),
+                    url=request.full_url,
+                    http_status=exc.code,
+                    retry_after_seconds=self._parse_retry_after(exc),
+                ) from exc
             self._log_api_request_completion(
                 stage=stage,
                 request=request,
@@ -744,8 +951,8 @@ class HttpVeeamProvider:
         if len(elapsed_ms_sample) < 20:
             elapsed_ms_sample.append(error.elapsed_ms)
 
-    @staticmethod
     def _log_api_request_completion(
+        self,
         *,
         stage: str,
         request: Request,
@@ -761,6 +968,7 @@ class HttpVeeamProvider:
         response_bytes: int | None = None,
         http_status: int | None = None,
     ) -> None:
+        self._stage_timings.record(stage=stage, elapsed_ms=elapsed_ms, outcome=outcome)
         extra: dict[str, JsonValue] = {
             "stage": stage,
             "url": request.full_url,
@@ -844,8 +1052,23 @@ class HttpVeeamProvider:
         raise ValueError("Veeam 备份列表响应格式不受支持")
 
     @staticmethod
-    def _build_backup_restore_points_url(*, base_url: str, backup_object_id: str) -> str:
-        return f"{base_url}{VEEAM_BACKUP_OBJECTS_PATH}/{str(backup_object_id).strip()}/restorePoints"
+    def _build_backup_restore_points_url(
+        *,
+        base_url: str,
+        backup_object_id: str,
+        created_after: datetime | None = None,
+    ) -> str:
+        url = f"{base_url}{VEEAM_BACKUP_OBJECTS_PATH}/{str(backup_object_id).strip()}/restorePoints"
+        if created_after is None:
+            return url
+        query = urlencode(
+            {
+                "createdAfterFilter": created_after.astimezone(UTC).isoformat().replace("+00:00", "Z"),
+                "orderColumn": "CreationTime",
+                "orderAsc": "false",
+            }
+        )
+        return f"{url}?{query}"
 
     @staticmethod
     def _build_backup_objects_url(*, base_url: str, limit: int) -> str:
@@ -26,14 +26,18 @@ class VeeamRunSummaryWriter:
         status: str,
         snapshots_written_total: int,
         error_message: str | None,
+        stage_timings: dict[str, object] | None = None,
     ) -> dict[str, object]:
-        return {
+        summary: dict[str, object] = {
             "source_binding_id": int(source_binding_id),
             "source_name": str(source_name or ""),
             "status": status,
             "snapshots_written_total": snapshots_written_total,
             "error_message": error_message,
         }
+        if stage_timings:
+            summary["stage_timings"] = dict(stage_timings)
+        return summary
 
     @staticmethod
     def build_backups_summary(
@@ -55,6 +59,7 @@ class VeeamRunSummaryWriter:
         backup_ids_partially_covered_total: int = 0,
         partial_success: bool = False,
         sources: list[dict[str, Any]] | None = None,
+        stage_timings: dict[str, Any] | None = None,
         error_message: str | None = None,
     ) -> dict[str, Any]:
         return build_sync_veeam_backups_summary(
@@ -76,6 +81,7 @@ class VeeamRunSummaryWriter:
             backup_ids_partially_covered_total=backup_ids_partially_covered_total,
             partial_success=partial_success,
             sources=sources,
+            stage_timings=stage_timings,
             error_message=error_message,
         )
 
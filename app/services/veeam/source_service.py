@@ -108,6 +108,7 @@ class VeeamSourceService:
         binding.match_domains = list(match_domains or [])
         binding.last_error = None
         self._veeam_repository.add_binding(binding)
+        self._veeam_repository.refresh_instance_backup_matches(source_binding_id=int(binding.id))
         db.session.commit()
         return binding
 
@@ -167,6 +168,7 @@ class VeeamSourceService:
             binding.is_enabled = True
             binding.last_error = None
         self._veeam_repository.add_binding(binding)
+        self._veeam_repository.refresh_instance_backup_matches(source_binding_id=int(binding.id))
         db.session.commit()
         return binding
 
@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import importlib
 import threading
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Any, cast
 
+from flask import current_app, has_app_context
 from sqlalchemy.exc import SQLAlchemyError
 
 from app import db
@@ -18,6 +20,7 @@ from app.repositories.instances_repository import InstancesRepository
 from app.repositories.veeam_repository import VeeamRepository
 from app.services.task_runs.task_runs_write_service import TaskRunItemInit, TaskRunsWriteService
 from app.services.veeam.backup_file_metric_merger import VeeamBackupFileMetricMerger, extract_backup_metric_int
+from app.services.veeam.incremental_sync_planner import VeeamIncrementalSyncPlan, VeeamIncrementalSyncPlanner
 from app.services.veeam.matching import (
     build_instance_ip_candidates,
     build_instance_match_candidates,
@@ -35,6 +38,7 @@ from app.services.veeam.provider import (
 )
 from app.services.veeam.run_summary_writer import VeeamRunSummaryWriter
 from app.services.veeam.source_service import VeeamSourceService
+from app.settings import DEFAULT_VEEAM_FULL_RESYNC_INTERVAL_HOURS
 from app.utils.time_utils import time_utils
 
 _SYNC_ITEM_TYPE = "step"
@@ -71,6 +75,7 @@ class VeeamSyncPreparedRun:
 
     run_id: str
     credential_id: int
+    full_resync: bool = False
 
 
 @dataclass(frozen=True, slots=True)
@@ -100,10 +105,16 @@ def _launch_background_sync(
     created_by: int | None,
     run_id: str,
     task: Callable[..., Any],
+    full_resync: bool = False,
 ) -> threading.Thread:
     def _run_task(captured_created_by: int | None, captured_run_id: str) -> None:
         try:
-            task(manual_run=True, created_by=captured_created_by, run_id=captured_run_id)
+            task(
+                manual_run=True,
+                created_by=captured_created_by,
+                run_id=captured_run_id,
+                full_resync=full_resync,
+            )
         except BACKGROUND_SYNC_EXCEPTIONS as exc:
             log_with_context(
                 "error",
@@ -144,6 +155,7 @@ class VeeamSyncActionsService:
         task: Callable[..., Any] | None = None,
         backup_file_metric_merger: VeeamBackupFileMetricMerger | None = None,
         run_summary_writer: VeeamRunSummaryWriter | None = None,
+        incremental_sync_planner: VeeamIncrementalSyncPlanner | None = None,
     ) -> None:
         self._source_service = source_service or VeeamSourceService(provider=provider)
         self._veeam_repository = veeam_repository or VeeamRepository()
@@ -152,6 +164,13 @@ class VeeamSyncActionsService:
         self._task = task or _resolve_default_task()
         self._backup_file_metric_merger = backup_file_metric_merger or VeeamBackupFileMetricMerger()
         self._run_summary_writer = run_summary_writer or VeeamRunSummaryWriter()
+        self._incremental_sync_planner = incremental_sync_planner or VeeamIncrementalSyncPlanner(
+            full_resync_interval_hours=int(
+                current_app.config.get("VEEAM_FULL_RESYNC_INTERVAL_HOURS", DEFAULT_VEEAM_FULL_RESYNC_INTERVAL_HOURS)
+            )
+            if has_app_context()
+            else DEFAULT_VEEAM_FULL_RESYNC_INTERVAL_HOURS
+        )
 
     def prepare_background_sync(
         self,
@@ -159,8 +178,9 @@ class VeeamSyncActionsService:
         created_by: int | None,
         trigger_source: str = "manual",
         result_url: str = "/admin/system-settings#system-settings-veeam",
+        full_resync: bool = False,
     ) -> VeeamSyncPreparedRun:
-        """创建 TaskRun 并校验同步前置条件."""
+        """创建 TaskRun 并校验同步前置条件(full_resync=True 时忽略增量水位全量重拉)."""
         if not self._provider.is_configured():
             raise ValidationError("Veeam Provider 尚未接入真实 API")
         bindings = self._veeam_repository.list_enabled_bindings()
@@ -185,7 +205,11 @@ class VeeamSyncActionsService:
             run_id,
             items=self._build_stage_items_for_bindings(bindings),
         )
-        return VeeamSyncPreparedRun(run_id=run_id, credential_id=int(bindings[0].credential_id))
+        return VeeamSyncPreparedRun(
+            run_id=run_id,
+            credential_id=int(bindings[0].credential_id),
+            full_resync=bool(full_resync),
+        )
 
     def launch_background_sync(
         self,
@@ -198,6 +222,7 @@ class VeeamSyncActionsService:
             created_by=created_by,
             run_id=prepared.run_id,
             task=self._task,
+            full_resync=prepared.full_resync,
         )
         return VeeamSyncLaunchResult(run_id=prepared.run_id, thread_name=thread.name)
 
@@ -330,6 +355,7 @@ class VeeamSyncActionsService:
                 sync_run_id=f"single_sync_{instance_id}",
                 synced_at=time_utils.now(),
             )
+            self._veeam_repository.refresh_instance_backup_matches(source_binding_id=int(binding.id))
             log_with_context(
                 "info",
                 "单实例 Veeam 备份同步完成",
@@ -362,6 +388,7 @@ class VeeamSyncActionsService:
         created_by: int | None,
         run_id: str,
         credential_id: int | None = None,
+        full_resync: bool = False,
     ) -> None:
         del credential_id
         bindings = self._veeam_repository.list_enabled_bindings()
@@ -381,6 +408,7 @@ class VeeamSyncActionsService:
                     binding=binding,
                     stage_key_prefix=self._source_stage_prefix(binding) if is_multi_source else "",
                     finalize_run=not is_multi_source,
+                    full_resync=full_resync,
                 )
                 source_results.append(
                     self._run_summary_writer.build_source_summary(
@@ -389,6 +417,7 @@ class VeeamSyncActionsService:
                         status="completed",
                         snapshots_written_total=snapshots_written_total,
                         error_message=None,
+                        stage_timings=self._provider.stage_timings(),
                     )
                 )
                 successes += 1
@@ -401,6 +430,7 @@ class VeeamSyncActionsService:
                         status="failed",
                         snapshots_written_total=0,
                         error_message=str(exc),
+                        stage_timings=self._provider.stage_timings(),
                     )
                 )
                 failures.append(exc)
@@ -423,6 +453,26 @@ class VeeamSyncActionsService:
         if successes <= 0 and failures:
             raise failures[0]
 
+    def _plan_incremental_sync(
+        self,
+        *,
+        binding: VeeamSourceBinding,
+        match_result: VeeamBackupObjectMatchResult,
+        full_resync: bool,
+        now: datetime,
+    ) -> VeeamIncrementalSyncPlan:
+        source_binding_id = int(binding.id)
+        watermarks = [] if full_resync else self._veeam_repository.list_backup_object_watermarks(source_binding_id)
+        if not watermarks:
+            return VeeamIncrementalSyncPlan(full_resync=full_resync)
+        return self._incremental_sync_planner.plan(
+            match_result=match_result,
+            snapshots=self._veeam_repository.list_machine_backup_snapshots(source_binding_id),
+            watermarks=watermarks,
+            full_resync=full_resync,
+            now=now,
+        )
+
     def _sync_source_once(  # noqa: PLR0915
         self,
         *,
@@ -431,6 +481,7 @@ class VeeamSyncActionsService:
         binding: VeeamSourceBinding,
         stage_key_prefix: str = "",
         finalize_run: bool = True,
+        full_resync: bool = False,
     ) -> int:
         credential = getattr(binding, "credential", None)
         if credential is None:
@@ -439,6 +490,7 @@ class VeeamSyncActionsService:
         task_runs_service = TaskRunsWriteService()
         synced_at = time_utils.now()
         sync_context = {"created_by": created_by, "run_id": run_id}
+        self._provider.reset_stage_timings()
         current_stage_key: str | None = None
         session: VeeamProviderSession | object | None = None
         backup_items: list[dict[str, object]] = []
@@ -592,9 +644,20 @@ class VeeamSyncActionsService:
                 run_id=run_id,
                 item_key=self._stage_item_key(current_stage_key, stage_key_prefix),
             )
+            sync_plan = self._plan_incremental_sync(
+                binding=binding,
+                match_result=cast("VeeamBackupObjectMatchResult", match_result),
+                full_resync=full_resync,
+                now=synced_at,
+            )
+            # 仅在存在水位时传入, 兼容未实现增量参数的自定义 provider
+            restore_points_kwargs: dict[str, Mapping[str, datetime]] = (
+                {"watermarks": sync_plan.created_after} if sync_plan.created_after else {}
+            )
             restore_points_result = self._provider.fetch_restore_point_records(
                 session=cast("VeeamProviderSession", session),
                 match_result=cast("VeeamBackupObjectMatchResult", match_result),
+                **restore_points_kwargs,
             )
             timed_out_backup_objects_total = int(
                 getattr(restore_points_result, "timed_out_backup_objects_total", 0) or 0
@@ -666,6 +729,11 @@ class VeeamSyncActionsService:
                     "skipped_invalid": getattr(restore_points_result, "skipped_invalid", 0),
                     "timed_out_backup_objects_total": timed_out_backup_objects_total,
                     "failed_backup_objects_total": failed_backup_objects_total,
+                    "full_resync": sync_plan.full_resync,
+                    "incremental_backup_objects_total": sync_plan.incremental_backup_objects_total,
+                    "unchanged_backup_objects_total": getattr(
+                        restore_points_result, "unchanged_backup_objects_total", 0
+                    ),
                 },
                 details_json=self._build_fetch_restore_points_details(
                     match_result=cast("VeeamBackupObjectMatchResult", match_result),
@@ -763,7 +831,12 @@ class VeeamSyncActionsService:
                 records=restore_point_records,
                 backup_files_result=cast("VeeamBackupFileCollection", backup_files_result),
             )
-            latest_records = self._select_latest_records(enriched_restore_point_records)
+            latest_records = self._select_latest_records(
+                self._incremental_sync_planner.merge_carried_records(
+                    plan=sync_plan,
+                    records=enriched_restore_point_records,
+                )
+            )
             log_with_context(
                 "info",
                 "Veeam 最新机器快照已筛选",
@@ -797,6 +870,20 @@ class VeeamSyncActionsService:
                     sync_run_id=run_id,
                     synced_at=synced_at,
                 )
+            instance_backup_matches_total = self._veeam_repository.refresh_instance_backup_matches(
+                source_binding_id=int(binding.id),
+            )
+            self._veeam_repository.replace_backup_object_watermarks(
+                self._incremental_sync_planner.build_watermarks(
+                    plan=sync_plan,
+                    restore_points_result=restore_points_result,
+                    records=enriched_restore_point_records,
+                    now=synced_at,
+                ),
+                source_binding_id=int(binding.id),
+                sync_run_id=run_id,
+                keep_backup_object_ids=sync_plan.created_after,
+            )
             binding.last_sync_at = synced_at
             binding.last_sync_status = "completed"
             binding.last_sync_run_id = run_id
@@ -814,6 +901,9 @@ class VeeamSyncActionsService:
                     if skipped_backup_objects_total > 0
                     else "replace_full",
                     "preserved_existing_due_to_partial_restore_points": skipped_backup_objects_total > 0,
+                    "full_resync": sync_plan.full_resync,
+                    "incremental_machine_count": len(sync_plan.incremental_machine_names),
+                    "instance_backup_matches_total": instance_backup_matches_total,
                 },
                 include_actor=False,
             )
@@ -824,6 +914,7 @@ class VeeamSyncActionsService:
                 metrics_json={
                     "latest_machine_count": len(latest_records),
                     "snapshots_written_total": snapshots_written_total,
+                    "instance_backup_matches_total": instance_backup_matches_total,
                     "preserved_existing_due_to_partial_restore_points": skipped_backup_objects_total > 0,
                 },
                 details_json=self._build_write_snapshots_details(
@@ -858,6 +949,7 @@ class VeeamSyncActionsService:
                             backup_file_coverage["backup_ids_partially_covered_total"]
                         ),
                         partial_success=(skipped_backup_objects_total > 0 or backup_files_partial_success),
+                        stage_timings=self._provider.stage_timings(),
                         error_message=None,
                     ),
                     clear_error=True,
@@ -945,6 +1037,7 @@ class VeeamSyncActionsService:
                         skipped_invalid=0,
                         timed_out_backup_objects_total=0,
                         partial_success=False,
+                        stage_timings=self._provider.stage_timings(),
                         error_message=str(exc),
                     ),
                     error_message=str(exc),
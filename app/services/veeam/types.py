@@ -25,6 +25,19 @@ class VeeamMachineBackupRecord:
     raw_payload: dict[str, object] = field(default_factory=dict)
 
 
+@dataclass(frozen=True, slots=True)
+class VeeamBackupObjectWatermarkRecord:
+    """backupObject 增量同步水位(已写入快照的最新 restorePoint)."""
+
+    backup_object_id: str
+    latest_restore_point_at: datetime
+    machine_name: str | None = None
+    latest_restore_point_id: str | None = None
+    backup_id: str | None = None
+    latest_backup_file_id: str | None = None
+    full_synced_at: datetime | None = None
+
+
 @dataclass(frozen=True, slots=True)
 class VeeamMachineBackupCollection:
     """本次备份拉取的标准化结果."""
@@ -53,6 +66,9 @@ class VeeamMachineBackupCollection:
     failed_backup_objects_total: int = 0
     failed_backup_ids_sample: list[str] = field(default_factory=list)
     failed_machine_names_sample: list[str] = field(default_factory=list)
+    incremental_backup_objects_total: int = 0
+    unchanged_backup_objects_total: int = 0
+    backup_object_watermarks: list[VeeamBackupObjectWatermarkRecord] = field(default_factory=list)
 
 
 @dataclass(frozen=True, slots=True)
@@ -164,3 +180,13 @@ class VeeamRequestTimeoutError(RuntimeError):
         self.elapsed_ms = elapsed_ms
         self.reason_type = reason_type
         self.reason_repr = reason_repr
+
+
+class VeeamRequestThrottledError(RuntimeError):
+    """Veeam 返回 429/503(限流或服务繁忙)."""
+
+    def __init__(self, message: str, *, url: str, http_status: int, retry_after_seconds: float | None) -> None:
+        super().__init__(message)
+        self.url = url
+        self.http_status = http_status
+        self.retry_after_seconds = retry_after_seconds
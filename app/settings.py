@@ -45,6 +45,7 @@ DEFAULT_CACHE_RULE_EVALUATION_TTL_SECONDS = 24 * 3600
 DEFAULT_CACHE_RULE_TTL_SECONDS = 2 * 3600
 DEFAULT_CACHE_ACCOUNT_TTL_SECONDS = 3600
 DEFAULT_CACHE_OPTIONS_TTL_SECONDS = 60
+DEFAULT_CACHE_ACCOUNT_STATISTICS_TTL_SECONDS = 600
 DEFAULT_CACHE_REDIS_URL = "redis://localhost:6379/0"
 
 DEFAULT_BCRYPT_LOG_ROUNDS = 12
@@ -70,6 +71,23 @@ DEFAULT_COLLECT_DB_SIZE_ENABLED = True
 DEFAULT_DB_SIZE_COLLECTION_INTERVAL_HOURS = 24
 DEFAULT_DB_SIZE_COLLECTION_TIMEOUT_SECONDS = 300
 DEFAULT_MYSQL_REPLICA_LAG_ABNORMAL_THRESHOLD_SECONDS = 600
+DEFAULT_CLUSTER_STATUS_MAX_CONCURRENCY = 8
+DEFAULT_CLUSTER_STATUS_NODE_TIMEOUT_SECONDS = 30
+DEFAULT_CONNECTION_BATCH_TEST_MAX_CONCURRENCY = 16
+DEFAULT_CONNECTION_BATCH_TEST_NODE_TIMEOUT_SECONDS = 15
+DEFAULT_CONNECTION_BATCH_TEST_DEADLINE_SECONDS = 60
+DEFAULT_REACHABILITY_TCP_TIMEOUT_SECONDS = 3
+DEFAULT_REACHABILITY_MAX_IN_FLIGHT = 512
+DEFAULT_REACHABILITY_WINDOW_SIZE = 60
+DEFAULT_REACHABILITY_DOWN_THRESHOLD = 2
+DEFAULT_REACHABILITY_STALE_SECONDS = 300
+DEFAULT_REACHABILITY_SKIP_SYNC_ENABLED = True
+DEFAULT_REACHABILITY_PROTOCOL_PING_ENABLED = False
+DEFAULT_CREDENTIAL_SECRET_CACHE_TTL_SECONDS = 300
+DEFAULT_SQLSERVER_PERMISSION_QUERY_CONCURRENCY = 1
+DEFAULT_SQLSERVER_PERMISSION_TARGET_STAGING_ENABLED = True
+DEFAULT_ACCOUNT_PERMISSION_FULL_SYNC_INTERVAL_HOURS = 24
+DEFAULT_EXPORT_FILE_TTL_HOURS = 24
 DEFAULT_MAIL_SMTP_PORT = 25
 DEFAULT_MAIL_TIMEOUT_SECONDS = 10
 DEFAULT_FEISHU_REQUEST_TIMEOUT_SECONDS = 10
@@ -78,9 +96,18 @@ DEFAULT_PROXY_FIX_TRUSTED_IPS = ("127.0.0.1", "::1")
 
 DEFAULT_API_V1_DOCS_ENABLED = True
 DEFAULT_ENABLE_SCHEDULER = True
+SCHEDULER_JOBSTORE_SQLITE = "sqlite"
+SCHEDULER_JOBSTORE_DATABASE = "database"
+DEFAULT_SCHEDULER_JOBSTORE = SCHEDULER_JOBSTORE_SQLITE
+DEFAULT_SCHEDULER_LEADER_HEARTBEAT_SECONDS = 5
+DEFAULT_SCHEDULER_LEADER_LEASE_SECONDS = 30
+DEFAULT_TASK_SHARD_SIZE = 5
+DEFAULT_TASK_SHARD_HEARTBEAT_SECONDS = 15
+DEFAULT_TASK_SHARD_STALE_SECONDS = 90
 DEFAULT_JUMPSERVER_ORG_ID = "00000000-0000-0000-0000-000000000002"
 DEFAULT_JUMPSERVER_REQUEST_TIMEOUT_SECONDS = 15
 DEFAULT_JUMPSERVER_VERIFY_SSL = True
+DEFAULT_JUMPSERVER_MAX_CONCURRENCY = 4
 DEFAULT_VEEAM_PORT = 9419
 DEFAULT_VEEAM_API_VERSION = "1.2-rev0"
 DEFAULT_VEEAM_REQUEST_TIMEOUT_SECONDS = 15
@@ -89,6 +116,10 @@ DEFAULT_VEEAM_TOKEN_RETRY_ATTEMPTS = 3
 DEFAULT_VEEAM_TOKEN_RETRY_BACKOFF_SECONDS = 10
 DEFAULT_VEEAM_BACKUP_OBJECTS_LIMIT = 2000
 DEFAULT_VEEAM_VERIFY_SSL = True
+DEFAULT_VEEAM_MAX_CONCURRENCY = 4
+DEFAULT_VEEAM_REQUESTS_PER_SECOND = 5.0
+DEFAULT_VEEAM_FULL_RESYNC_INTERVAL_HOURS = 168
+DEFAULT_AD_FULL_SYNC_INTERVAL_HOURS = 24
 
 _BUILD_HASH_PATTERN = re.compile(r"^[0-9a-fA-F]{7,64}$")
 
@@ -201,6 +232,10 @@ class Settings(BaseSettings):
         default=DEFAULT_CACHE_OPTIONS_TTL_SECONDS,
         validation_alias="CACHE_OPTIONS_TTL",
     )
+    cache_account_statistics_ttl_seconds: int = Field(
+        default=DEFAULT_CACHE_ACCOUNT_STATISTICS_TTL_SECONDS,
+        validation_alias="CACHE_ACCOUNT_STATISTICS_TTL",
+    )
 
     bcrypt_log_rounds: int = Field(default=DEFAULT_BCRYPT_LOG_ROUNDS, validation_alias="BCRYPT_LOG_ROUNDS")
     force_https: bool = Field(default=False, validation_alias="FORCE_HTTPS")
@@ -249,6 +284,24 @@ class Settings(BaseSettings):
     api_v1_docs_enabled: bool = Field(default=DEFAULT_API_V1_DOCS_ENABLED, validation_alias="API_V1_DOCS_ENABLED")
 
     enable_scheduler: bool = Field(default=DEFAULT_ENABLE_SCHEDULER, validation_alias="ENABLE_SCHEDULER")
+    scheduler_jobstore: str = Field(default=DEFAULT_SCHEDULER_JOBSTORE, validation_alias="SCHEDULER_JOBSTORE")
+    scheduler_leader_heartbeat_seconds: int = Field(
+        default=DEFAULT_SCHEDULER_LEADER_HEARTBEAT_SECONDS,
+        validation_alias="SCHEDULER_LEADER_HEARTBEAT_SECONDS",
+    )
+    scheduler_leader_lease_seconds: int = Field(
+        default=DEFAULT_SCHEDULER_LEADER_LEASE_SECONDS,
+        validation_alias="SCHEDULER_LEADER_LEASE_SECONDS",
+    )
+    task_shard_size: int = Field(default=DEFAULT_TASK_SHARD_SIZE, validation_alias="TASK_SHARD_SIZE")
+    task_shard_heartbeat_seconds: int = Field(
+        default=DEFAULT_TASK_SHARD_HEARTBEAT_SECONDS,
+        validation_alias="TASK_SHARD_HEARTBEAT_SECONDS",
+    )
+    task_shard_stale_seconds: int = Field(
+        default=DEFAULT_TASK_SHARD_STALE_SECONDS,
+        validation_alias="TASK_SHARD_STALE_SECONDS",
+    )
     server_software: str = Field(default="", validation_alias="SERVER_SOFTWARE")
     flask_run_from_cli: bool = Field(default=False, validation_alias="FLASK_RUN_FROM_CLI")
     werkzeug_run_main: bool = Field(default=False, validation_alias="WERKZEUG_RUN_MAIN")
@@ -261,6 +314,10 @@ class Settings(BaseSettings):
         default=DEFAULT_JUMPSERVER_VERIFY_SSL,
         validation_alias="JUMPSERVER_VERIFY_SSL",
     )
+    jumpserver_max_concurrency: int = Field(
+        default=DEFAULT_JUMPSERVER_MAX_CONCURRENCY,
+        validation_alias="JUMPSERVER_MAX_CONCURRENCY",
+    )
     veeam_port: int = Field(default=DEFAULT_VEEAM_PORT, validation_alias="VEEAM_PORT")
     veeam_api_version: str = Field(default=DEFAULT_VEEAM_API_VERSION, validation_alias="VEEAM_API_VERSION")
     veeam_request_timeout_seconds: int = Field(
@@ -284,6 +341,19 @@ class Settings(BaseSettings):
         validation_alias="VEEAM_BACKUP_OBJECTS_LIMIT",
     )
     veeam_verify_ssl: bool = Field(default=DEFAULT_VEEAM_VERIFY_SSL, validation_alias="VEEAM_VERIFY_SSL")
+    veeam_max_concurrency: int = Field(default=DEFAULT_VEEAM_MAX_CONCURRENCY, validation_alias="VEEAM_MAX_CONCURRENCY")
+    veeam_requests_per_second: float = Field(
+        default=DEFAULT_VEEAM_REQUESTS_PER_SECOND,
+        validation_alias="VEEAM_REQUESTS_PER_SECOND",
+    )
+    veeam_full_resync_interval_hours: int = Field(
+        default=DEFAULT_VEEAM_FULL_RESYNC_INTERVAL_HOURS,
+        validation_alias="VEEAM_FULL_RESYNC_INTERVAL_HOURS",
+    )
+    ad_full_sync_interval_hours: int = Field(
+        default=DEFAULT_AD_FULL_SYNC_INTERVAL_HOURS,
+        validation_alias="AD_FULL_SYNC_INTERVAL_HOURS",
+    )
 
     aggregation_enabled: bool = Field(default=DEFAULT_AGGREGATION_ENABLED, validation_alias="AGGREGATION_ENABLED")
     aggregation_hour: int = Field(default=DEFAULT_AGGREGATION_HOUR, validation_alias="AGGREGATION_HOUR")
@@ -294,6 +364,10 @@ class Settings(BaseSettings):
         default=DEFAULT_DATABASE_SIZE_RETENTION_MONTHS,
         validation_alias="DATABASE_SIZE_RETENTION_MONTHS",
     )
+    export_file_ttl_hours: int = Field(
+        default=DEFAULT_EXPORT_FILE_TTL_HOURS,
+        validation_alias="EXPORT_FILE_TTL_HOURS",
+    )
     db_size_collection_interval_hours: int = Field(
         default=DEFAULT_DB_SIZE_COLLECTION_INTERVAL_HOURS,
         validation_alias="DB_SIZE_COLLECTION_INTERVAL",
@@ -306,6 +380,70 @@ class Settings(BaseSettings):
         default=DEFAULT_MYSQL_REPLICA_LAG_ABNORMAL_THRESHOLD_SECONDS,
         validation_alias="MYSQL_REPLICA_LAG_ABNORMAL_THRESHOLD_SECONDS",
     )
+    cluster_status_max_concurrency: int = Field(
+        default=DEFAULT_CLUSTER_STATUS_MAX_CONCURRENCY,
+        validation_alias="CLUSTER_STATUS_MAX_CONCURRENCY",
+    )
+    cluster_status_node_timeout_seconds: int = Field(
+        default=DEFAULT_CLUSTER_STATUS_NODE_TIMEOUT_SECONDS,
+        validation_alias="CLUSTER_STATUS_NODE_TIMEOUT_SECONDS",
+    )
+    connection_batch_test_max_concurrency: int = Field(
+        default=DEFAULT_CONNECTION_BATCH_TEST_MAX_CONCURRENCY,
+        validation_alias="CONNECTION_BATCH_TEST_MAX_CONCURRENCY",
+    )
+    connection_batch_test_node_timeout_seconds: int = Field(
+        default=DEFAULT_CONNECTION_BATCH_TEST_NODE_TIMEOUT_SECONDS,
+        validation_alias="CONNECTION_BATCH_TEST_NODE_TIMEOUT_SECONDS",
+    )
+    connection_batch_test_deadline_seconds: int = Field(
+        default=DEFAULT_CONNECTION_BATCH_TEST_DEADLINE_SECONDS,
+        validation_alias="CONNECTION_BATCH_TEST_DEADLINE_SECONDS",
+    )
+    reachability_tcp_timeout_seconds: int = Field(
+        default=DEFAULT_REACHABILITY_TCP_TIMEOUT_SECONDS,
+        validation_alias="REACHABILITY_TCP_TIMEOUT_SECONDS",
+    )
+    reachability_max_in_flight: int = Field(
+        default=DEFAULT_REACHABILITY_MAX_IN_FLIGHT,
+        validation_alias="REACHABILITY_MAX_IN_FLIGHT",
+    )
+    reachability_window_size: int = Field(
+        default=DEFAULT_REACHABILITY_WINDOW_SIZE,
+        validation_alias="REACHABILITY_WINDOW_SIZE",
+    )
+    reachability_down_threshold: int = Field(
+        default=DEFAULT_REACHABILITY_DOWN_THRESHOLD,
+        validation_alias="REACHABILITY_DOWN_THRESHOLD",
+    )
+    reachability_stale_seconds: int = Field(
+        default=DEFAULT_REACHABILITY_STALE_SECONDS,
+        validation_alias="REACHABILITY_STALE_SECONDS",
+    )
+    reachability_skip_sync_enabled: bool = Field(
+        default=DEFAULT_REACHABILITY_SKIP_SYNC_ENABLED,
+        validation_alias="REACHABILITY_SKIP_SYNC_ENABLED",
+    )
+    reachability_protocol_ping_enabled: bool = Field(
+        default=DEFAULT_REACHABILITY_PROTOCOL_PING_ENABLED,
+        validation_alias="REACHABILITY_PROTOCOL_PING_ENABLED",
+    )
+    credential_secret_cache_ttl_seconds: int = Field(
+        default=DEFAULT_CREDENTIAL_SECRET_CACHE_TTL_SECONDS,
+        validation_alias="CREDENTIAL_SECRET_CACHE_TTL_SECONDS",
+    )
+    sqlserver_permission_query_concurrency: int = Field(
+        default=DEFAULT_SQLSERVER_PERMISSION_QUERY_CONCURRENCY,
+        validation_alias="SQLSERVER_PERMISSION_QUERY_CONCURRENCY",
+    )
+    sqlserver_permission_target_staging_enabled: bool = Field(
+        default=DEFAULT_SQLSERVER_PERMISSION_TARGET_STAGING_ENABLED,
+        validation_alias="SQLSERVER_PERMISSION_TARGET_STAGING_ENABLED",
+    )
+    account_permission_full_sync_interval_hours: int = Field(
+        default=DEFAULT_ACCOUNT_PERMISSION_FULL_SYNC_INTERVAL_HOURS,
+        validation_alias="ACCOUNT_PERMISSION_FULL_SYNC_INTERVAL_HOURS",
+    )
     mail_smtp_host: str | None = Field(default=None, validation_alias="MAIL_SMTP_HOST")
     mail_smtp_port: int = Field(default=DEFAULT_MAIL_SMTP_PORT, validation_alias="MAIL_SMTP_PORT")
     mail_smtp_username: str | None = Field(default=None, validation_alias="MAIL_SMTP_USERNAME")
@@ -418,6 +556,7 @@ class Settings(BaseSettings):
             "CACHE_RULE_TTL": self.cache_rule_ttl_seconds,
             "CACHE_ACCOUNT_TTL": self.cache_account_ttl_seconds,
             "CACHE_OPTIONS_TTL": self.cache_options_ttl_seconds,
+            "CACHE_ACCOUNT_STATISTICS_TTL": self.cache_account_statistics_ttl_seconds,
             "BCRYPT_LOG_ROUNDS": self.bcrypt_log_rounds,
             "PREFERRED_URL_SCHEME": self.preferred_url_scheme,
             "PROXY_FIX_X_FOR": self.proxy_fix_x_for,
@@ -439,9 +578,16 @@ class Settings(BaseSettings):
             "LOGIN_RATE_WINDOW": self.login_rate_window_seconds,
             "CORS_ORIGINS": ",".join(self.cors_origins),
             "API_V1_DOCS_ENABLED": self.api_v1_docs_enabled,
+            "SCHEDULER_JOBSTORE": self.scheduler_jobstore,
+            "SCHEDULER_LEADER_HEARTBEAT_SECONDS": self.scheduler_leader_heartbeat_seconds,
+            "SCHEDULER_LEADER_LEASE_SECONDS": self.scheduler_leader_lease_seconds,
+            "TASK_SHARD_SIZE": self.task_shard_size,
+            "TASK_SHARD_HEARTBEAT_SECONDS": self.task_shard_heartbeat_seconds,
+            "TASK_SHARD_STALE_SECONDS": self.task_shard_stale_seconds,
             "JUMPSERVER_ORG_ID": self.jumpserver_org_id,
             "JUMPSERVER_REQUEST_TIMEOUT_SECONDS": self.jumpserver_request_timeout_seconds,
             "JUMPSERVER_VERIFY_SSL": self.jumpserver_verify_ssl,
+            "JUMPSERVER_MAX_CONCURRENCY": self.jumpserver_max_concurrency,
             "VEEAM_PORT": self.veeam_port,
             "VEEAM_API_VERSION": self.veeam_api_version,
             "VEEAM_REQUEST_TIMEOUT_SECONDS": self.veeam_request_timeout_seconds,
@@ -450,13 +596,34 @@ class Settings(BaseSettings):
             "VEEAM_TOKEN_RETRY_BACKOFF_SECONDS": self.veeam_token_retry_backoff_seconds,
             "VEEAM_BACKUP_OBJECTS_LIMIT": self.veeam_backup_objects_limit,
             "VEEAM_VERIFY_SSL": self.veeam_verify_ssl,
+            "VEEAM_MAX_CONCURRENCY": self.veeam_max_concurrency,
+            "VEEAM_REQUESTS_PER_SECOND": self.veeam_requests_per_second,
+            "VEEAM_FULL_RESYNC_INTERVAL_HOURS": self.veeam_full_resync_interval_hours,
+            "AD_FULL_SYNC_INTERVAL_HOURS": self.ad_full_sync_interval_hours,
             "AGGREGATION_ENABLED": self.aggregation_enabled,
             "AGGREGATION_HOUR": self.aggregation_hour,
             "COLLECT_DB_SIZE_ENABLED": self.collect_db_size_enabled,
             "DATABASE_SIZE_RETENTION_MONTHS": self.database_size_retention_months,
             "DB_SIZE_COLLECTION_INTERVAL": self.db_size_collection_interval_hours,
+            "EXPORT_FILE_TTL_HOURS": self.export_file_ttl_hours,
             "DB_SIZE_COLLECTION_TIMEOUT": self.db_size_collection_timeout_seconds,
             "MYSQL_REPLICA_LAG_ABNORMAL_THRESHOLD_SECONDS": self.mysql_replica_lag_abnormal_threshold_seconds,
+            "CLUSTER_STATUS_MAX_CONCURRENCY": self.cluster_status_max_concurrency,
+            "CLUSTER_STATUS_NODE_TIMEOUT_SECONDS": self.cluster_status_node_timeout_seconds,
+            "CONNECTION_BATCH_TEST_MAX_CONCURRENCY": self.connection_batch_test_max_concurrency,
+            "CONNECTION_BATCH_TEST_NODE_TIMEOUT_SECONDS": self.connection_batch_test_node_timeout_seconds,
+            "CONNECTION_BATCH_TEST_DEADLINE_SECONDS": self.connection_batch_test_deadline_seconds,
+            "REACHABILITY_TCP_TIMEOUT_SECONDS": self.reachability_tcp_timeout_seconds,
+            "REACHABILITY_MAX_IN_FLIGHT": self.reachability_max_in_flight,
+            "REACHABILITY_WINDOW_SIZE": self.reachability_window_size,
+            "REACHABILITY_DOWN_THRESHOLD": self.reachability_down_threshold,
+            "REACHABILITY_STALE_SECONDS": self.reachability_stale_seconds,
+            "REACHABILITY_SKIP_SYNC_ENABLED": self.reachability_skip_sync_enabled,
+            "REACHABILITY_PROTOCOL_PING_ENABLED": self.reachability_protocol_ping_enabled,
+            "CREDENTIAL_SECRET_CACHE_TTL_SECONDS": self.credential_secret_cache_ttl_seconds,
+            "SQLSERVER_PERMISSION_QUERY_CONCURRENCY": self.sqlserver_permission_query_concurrency,
+            "SQLSERVER_PERMISSION_TARGET_STAGING_ENABLED": self.sqlserver_permission_target_staging_enabled,
+            "ACCOUNT_PERMISSION_FULL_SYNC_INTERVAL_HOURS": self.account_permission_full_sync_interval_hours,
             "MAIL_SMTP_HOST": self.mail_smtp_host,
             "MAIL_SMTP_PORT": self.mail_smtp_port,
             "MAIL_SMTP_USERNAME": self.mail_smtp_username,
@@ -605,6 +772,10 @@ class Settings(BaseSettings):
             ("CACHE_TYPE 仅支持 simple/redis", self.cache_type not in {"simple", "redis"}),
             ("CACHE_TYPE=redis 时必须提供 CACHE_REDIS_URL", self.cache_type == "redis" and not self.cache_redis_url),
             ("CACHE_OPTIONS_TTL 必须为非负整数(秒)", self.cache_options_ttl_seconds < 0),
+            (
+                "CACHE_ACCOUNT_STATISTICS_TTL 必须为非负整数(秒)",
+                self.cache_account_statistics_ttl_seconds < 0,
+            ),
             (
                 "LOG_HTTP_REQUEST_COMPLETED_MODE 仅支持 all/slow_or_error/errors_only/off",
                 self.log_http_request_completed_mode not in {"all", "slow_or_error", "errors_only", "off"},
@@ -625,14 +796,44 @@ class Settings(BaseSettings):
             ),
             ("DB_SIZE_COLLECTION_INTERVAL 必须为正整数(小时)", self.db_size_collection_interval_hours <= 0),
             ("DB_SIZE_COLLECTION_TIMEOUT 必须为正整数(秒)", self.db_size_collection_timeout_seconds <= 0),
+            ("EXPORT_FILE_TTL_HOURS 必须为正整数(小时)", self.export_file_ttl_hours <= 0),
             (
                 "MYSQL_REPLICA_LAG_ABNORMAL_THRESHOLD_SECONDS 必须为正整数(秒)",
                 self.mysql_replica_lag_abnormal_threshold_seconds <= 0,
             ),
+            ("CLUSTER_STATUS_MAX_CONCURRENCY 必须为正整数", self.cluster_status_max_concurrency <= 0),
+            ("CLUSTER_STATUS_NODE_TIMEOUT_SECONDS 必须为正整数(秒)", self.cluster_status_node_timeout_seconds <= 0),
+            ("CONNECTION_BATCH_TEST_MAX_CONCURRENCY 必须为正整数", self.connection_batch_test_max_concurrency <= 0),
+            (
+                "CONNECTION_BATCH_TEST_NODE_TIMEOUT_SECONDS 必须为正整数(秒)",
+                self.connection_batch_test_node_timeout_seconds <= 0,
+            ),
+            (
+                "CONNECTION_BATCH_TEST_DEADLINE_SECONDS 必须为正整数(秒)",
+                self.connection_batch_test_deadline_seconds <= 0,
+            ),
+            ("REACHABILITY_TCP_TIMEOUT_SECONDS 必须为正整数(秒)", self.reachability_tcp_timeout_seconds <= 0),
+            ("REACHABILITY_MAX_IN_FLIGHT 必须为正整数", self.reachability_max_in_flight <= 0),
+            ("REACHABILITY_WINDOW_SIZE 必须为正整数", self.reachability_window_size <= 0),
+            ("REACHABILITY_DOWN_THRESHOLD 必须为正整数", self.reachability_down_threshold <= 0),
+            ("REACHABILITY_STALE_SECONDS 必须为正整数(秒)", self.reachability_stale_seconds <= 0),
+            (
+                "CREDENTIAL_SECRET_CACHE_TTL_SECONDS 必须为非负整数(秒, 0 表示禁用)",
+                self.credential_secret_cache_ttl_seconds < 0,
+            ),
+            (
+                "SQLSERVER_PERMISSION_QUERY_CONCURRENCY 必须为正整数",
+                self.sqlserver_permission_query_concurrency <= 0,
+            ),
+            (
+                "ACCOUNT_PERMISSION_FULL_SYNC_INTERVAL_HOURS 必须为正整数(小时)",
+                self.account_permission_full_sync_interval_hours <= 0,
+            ),
             ("MAIL_SMTP_PORT 必须为正整数", self.mail_smtp_port <= 0),
             ("MAIL_TIMEOUT_SECONDS 必须为正整数(秒)", self.mail_timeout_seconds <= 0),
             ("FEISHU_REQUEST_TIMEOUT_SECONDS 必须为正整数(秒)", self.feishu_request_timeout_seconds <= 0),
             ("JUMPSERVER_REQUEST_TIMEOUT_SECONDS 必须为正整数(秒)", self.jumpserver_request_timeout_seconds <= 0),
+            ("JUMPSERVER_MAX_CONCURRENCY 必须为正整数", self.jumpserver_max_concurrency <= 0),
             ("VEEAM_PORT 必须为正整数", self.veeam_port <= 0),
             ("VEEAM_REQUEST_TIMEOUT_SECONDS 必须为正整数(秒)", self.veeam_request_timeout_seconds <= 0),
             ("VEEAM_TOKEN_TIMEOUT_SECONDS 必须为正整数(秒)", self.veeam_token_timeout_seconds <= 0),
@@ -642,6 +843,30 @@ class Settings(BaseSettings):
                 self.veeam_token_retry_backoff_seconds < 0,
             ),
             ("VEEAM_BACKUP_OBJECTS_LIMIT 必须为正整数", self.veeam_backup_objects_limit <= 0),
+            ("VEEAM_MAX_CONCURRENCY 必须为正整数", self.veeam_max_concurrency <= 0),
+            ("VEEAM_REQUESTS_PER_SECOND 必须为正数", self.veeam_requests_per_second <= 0),
+            ("VEEAM_FULL_RESYNC_INTERVAL_HOURS 必须为正整数(小时)", self.veeam_full_resync_interval_hours <= 0),
+            ("AD_FULL_SYNC_INTERVAL_HOURS 必须为正整数(小时)", self.ad_full_sync_interval_hours <= 0),
+            (
+                f"SCHEDULER_JOBSTORE 仅支持 {SCHEDULER_JOBSTORE_SQLITE}/{SCHEDULER_JOBSTORE_DATABASE}",
+                self.scheduler_jobstore not in {SCHEDULER_JOBSTORE_SQLITE, SCHEDULER_JOBSTORE_DATABASE},
+            ),
+            (
+                "SCHEDULER_JOBSTORE=database 时 DATABASE_URL 必须为 PostgreSQL(依赖 advisory lock 选主)",
+                self.scheduler_jobstore == SCHEDULER_JOBSTORE_DATABASE
+                and not self.database_url.startswith("postgresql"),
+            ),
+            ("SCHEDULER_LEADER_HEARTBEAT_SECONDS 必须为正整数(秒)", self.scheduler_leader_heartbeat_seconds <= 0),
+            (
+                "SCHEDULER_LEADER_LEASE_SECONDS 必须大于 SCHEDULER_LEADER_HEARTBEAT_SECONDS",
+                self.scheduler_leader_lease_seconds <= self.scheduler_leader_heartbeat_seconds,
+            ),
+            ("TASK_SHARD_SIZE 必须为正整数", self.task_shard_size <= 0),
+            ("TASK_SHARD_HEARTBEAT_SECONDS 必须为正整数(秒)", self.task_shard_heartbeat_seconds <= 0),
+            (
+                "TASK_SHARD_STALE_SECONDS 必须大于 TASK_SHARD_HEARTBEAT_SECONDS",
+                self.task_shard_stale_seconds <= self.task_shard_heartbeat_seconds,
+            ),
         ]
         for message, condition in checks:
             if condition:
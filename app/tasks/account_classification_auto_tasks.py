@@ -21,6 +21,7 @@ from app.services.account_classification.dsl_v4 import (
     collect_dsl_v4_validation_errors,
     is_dsl_v4_expression,
 )
+from app.services.statistics.account_statistics_cache import invalidate_account_statistics_cache
 from app.services.task_runs.task_run_summary_builders import build_auto_classify_accounts_summary
 from app.services.task_runs.task_runs_write_service import TaskRunItemInit, TaskRunsWriteService
 from app.utils.structlog_config import get_sync_logger
@@ -248,6 +249,7 @@ def _finalize_run_success(
         ),
     )
     db.session.commit()
+    invalidate_account_statistics_cache(reason="auto_classify_accounts")
 
     sync_logger.info(
         "自动分类完成",
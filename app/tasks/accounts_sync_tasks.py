@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import partial
 from typing import TYPE_CHECKING, Any, cast
 
 import structlog
 from sqlalchemy.exc import SQLAlchemyError
 
 from app import create_app, db
+from app.core.constants.scheduler_jobs import SHARDED_TASKS
 from app.core.constants.sync_constants import SyncCategory, SyncOperationType
 from app.core.exceptions import AppError, ValidationError
 from app.models.account_permission import AccountPermission
@@ -20,7 +22,10 @@ from app.services.accounts_sync.permission_manager import PermissionSyncError
 from app.services.accounts_sync.sqlserver_ag_accounts_sync_service import SQLServerAgAccountsSyncService
 from app.services.alerts.email_alert_event_service import EmailAlertEventService
 from app.services.connection_adapters.adapters.base import ConnectionAdapterError
+from app.services.connections.instance_reachability_service import InstanceReachabilityService
+from app.services.statistics.account_statistics_cache import invalidate_account_statistics_cache
 from app.services.sync_session_service import SyncItemStats, sync_session_service
+from app.services.task_runs.task_run_shard_service import TaskRunShardService
 from app.services.task_runs.task_run_summary_builders import build_sync_accounts_summary
 from app.services.task_runs.task_runs_write_service import TaskRunItemInit, TaskRunsWriteService
 from app.utils.structlog_config import get_sync_logger
@@ -31,6 +36,7 @@ if TYPE_CHECKING:
     from app.core.types.sync import CollectionSummary, InventorySummary, SyncStagesSummary
     from app.models.sync_instance_record import SyncInstanceRecord
     from app.models.sync_session import SyncSession
+    from app.models.task_run_item import TaskRunItem
 
 
 ACCOUNT_TASK_EXCEPTIONS: tuple[type[Exception], ...] = (
@@ -136,8 +142,10 @@ def _init_items(
     run_id: str,
     instances: list[Instance],
     ag_clusters: list[SQLServerCluster] | None = None,
+    shard_context: dict[int, dict[str, object]] | None = None,
 ) -> None:
     ag_clusters = ag_clusters or []
+    shard_context = shard_context or {}
     task_runs_service.init_items(
         run_id,
         items=[
@@ -146,6 +154,7 @@ def _init_items(
                 item_key=str(instance.id),
                 item_name=instance.name,
                 instance_id=instance.id,
+                details_json=shard_context.get(int(instance.id)),
             )
             for instance in instances
         ]
@@ -223,93 +232,128 @@ def _record_privileged_account_alerts(
         )
 
 
-def _sync_instances(
+def _record_shard_context(session: SyncSession, records: list[SyncInstanceRecord]) -> dict[int, dict[str, object]]:
+    """实例子项携带会话/记录 ID, 使其他节点认领分片后可恢复上下文."""
+    return {
+        int(record.instance_id): {"session_id": session.session_id, "record_id": int(record.id)} for record in records
+    }
+
+
+def _process_account_item(
+    item: TaskRunItem,
     *,
     sync_logger: structlog.BoundLogger,
     task_runs_service: TaskRunsWriteService,
     alert_event_service: EmailAlertEventService,
-    run_id: str,
-    session: SyncSession,
-    instances: list[Instance],
-    records: list[SyncInstanceRecord],
-) -> _AccountsSyncTotals:
-    totals = _AccountsSyncTotals()
+) -> None:
+    """同步单个实例账户并写入子项结果(分片 handler)."""
+    run_id = item.run_id
+    context = item.details_json if isinstance(item.details_json, dict) else {}
+    session, record = sync_session_service.resolve_instance_record(int(context.get("record_id") or 0))
+    instance = AccountsSyncTaskService().get_active_instance(int(item.instance_id or 0))
 
-    for i, instance in enumerate(instances):
-        if task_runs_service.is_cancelled(run_id):
-            sync_logger.info(
-                "任务已取消,提前退出实例循环",
-                module="accounts_sync",
-                phase="running",
-                operation="sync_accounts",
-                run_id=run_id,
-            )
-            break
+    sync_session_service.start_instance_sync(record.id)
+    db.session.commit()
 
-        record = records[i] if i < len(records) else None
-        if record is None:
-            continue
+    _sync_single_instance(
+        session=session,
+        record=record,
+        instance=instance,
+        sync_logger=sync_logger,
+        alert_event_service=alert_event_service,
+    )
+    db.session.commit()
 
-        task_runs_service.start_item(
+    metrics = {
+        "items_synced": record.items_synced or 0,
+        "items_created": record.items_created or 0,
+        "items_updated": record.items_updated or 0,
+        "items_deleted": record.items_deleted or 0,
+    }
+    details = record.sync_details if isinstance(record.sync_details, dict) else {}
+    if record.status == "completed":
+        task_runs_service.complete_item(
             run_id,
             item_type="instance",
             item_key=str(instance.id),
+            metrics_json=metrics,
+            details_json=details,
         )
-        db.session.commit()
+    else:
+        task_runs_service.fail_item(
+            run_id,
+            item_type="instance",
+            item_key=str(instance.id),
+            error_message=record.error_message or "实例同步失败",
+            details_json=details,
+        )
+        alert_event_service.record_sync_failure_event(
+            alert_type="account_sync_failure",
+            instance_id=instance.id,
+            instance_name=instance.name,
+            run_id=run_id,
+            session_id=session.session_id,
+            error_message=record.error_message or "实例同步失败",
+        )
+    db.session.commit()
 
-        sync_session_service.start_instance_sync(record.id)
-        db.session.commit()
 
-        synced, failed = _sync_single_instance(
-            session=session,
-            record=record,
-            instance=instance,
-            sync_logger=sync_logger,
-            alert_event_service=alert_event_service,
-        )
-        db.session.commit()
-        totals.instances_synced += synced
-        totals.instances_failed += failed
+def process_account_sync_shard_item(item: TaskRunItem) -> None:
+    """分片工作节点入口: 处理其他节点发起的实例账户同步子项."""
+    _process_account_item(
+        item,
+        sync_logger=get_sync_logger(),
+        task_runs_service=TaskRunsWriteService(),
+        alert_event_service=EmailAlertEventService(),
+    )
+
 
+def _collect_totals(session: SyncSession) -> _AccountsSyncTotals:
+    """按会话实例记录汇总(分片可能由多个节点完成)."""
+    totals = _AccountsSyncTotals()
+    for record in sync_session_service.get_session_records(session.session_id):
+        if record.status == "completed":
+            totals.instances_synced += 1
+        elif record.status == "failed":
+            totals.instances_failed += 1
+        else:
+            continue
         totals.accounts_synced += int(record.items_synced or 0)
         totals.accounts_created += int(record.items_created or 0)
         totals.accounts_updated += int(record.items_updated or 0)
         totals.accounts_deactivated += int(record.items_deleted or 0)
+    return totals
 
-        metrics = {
-            "items_synced": record.items_synced or 0,
-            "items_created": record.items_created or 0,
-            "items_updated": record.items_updated or 0,
-            "items_deleted": record.items_deleted or 0,
-        }
-        details = record.sync_details if isinstance(record.sync_details, dict) else {}
-        if record.status == "completed":
-            task_runs_service.complete_item(
-                run_id,
-                item_type="instance",
-                item_key=str(instance.id),
-                metrics_json=metrics,
-                details_json=details,
-            )
-        else:
-            task_runs_service.fail_item(
-                run_id,
-                item_type="instance",
-                item_key=str(instance.id),
-                error_message=record.error_message or "实例同步失败",
-                details_json=details,
-            )
-            alert_event_service.record_sync_failure_event(
-                alert_type="account_sync_failure",
-                instance_id=instance.id,
-                instance_name=instance.name,
-                run_id=run_id,
-                session_id=session.session_id,
-                error_message=record.error_message or "实例同步失败",
-            )
-        db.session.commit()
 
-    return totals
+def _sync_instances(
+    *,
+    sync_logger: structlog.BoundLogger,
+    task_runs_service: TaskRunsWriteService,
+    alert_event_service: EmailAlertEventService,
+    run_id: str,
+    session: SyncSession,
+) -> _AccountsSyncTotals:
+    """按分片处理实例子项(其他节点可并行认领), 结束后按会话记录汇总."""
+    TaskRunShardService(task_runs_service=task_runs_service).run_shards(
+        run_id,
+        partial(
+            _process_account_item,
+            sync_logger=sync_logger,
+            task_runs_service=task_runs_service,
+            alert_event_service=alert_event_service,
+        ),
+        item_types=SHARDED_TASKS["sync_accounts"].item_types,
+        wait_for_others=True,
+    )
+    if task_runs_service.is_cancelled(run_id):
+        sync_logger.info(
+            "任务已取消,提前退出实例循环",
+            module="accounts_sync",
+            phase="running",
+            operation="sync_accounts",
+            run_id=run_id,
+        )
+    return _collect_totals(session)
 
 
 def _sync_ag_clusters(
@@ -514,6 +558,21 @@ def _sync_single_instance(
 ) -> tuple[int, int]:
     """同步单个实例账户,返回(成功数,失败数)."""
     instance_session_id = f"{session.session_id}_{instance.id}"
+    unreachable_reason = InstanceReachabilityService().known_down_reason(instance.id)
+    if unreachable_reason:
+        # 可达性探测已判定不可达, 直接记失败, 不再等待连接超时
+        sync_session_service.fail_instance_sync(record.id, unreachable_reason)
+        sync_logger.warning(
+            "实例已判定不可达,跳过账户同步",
+            module="accounts_sync",
+            phase="connection",
+            operation="sync_accounts",
+            session_id=session.session_id,
+            instance_id=instance.id,
+            instance_name=instance.name,
+            error=unreachable_reason,
+        )
+        return 0, 1
     result: tuple[int, int] = (0, 1)
     try:
         sync_logger.info(
@@ -693,14 +752,15 @@ def sync_accounts(
             )
 
             ag_clusters = _resolve_ag_clusters(instances)
+            session = _resolve_session(manual_run=manual_run, created_by=created_by, session_id=session_id)
+            records = _create_records(session=session, instances=instances)
             _init_items(
                 task_runs_service=task_runs_service,
                 run_id=resolved_run_id,
                 instances=instances,
                 ag_clusters=ag_clusters,
+                shard_context=_record_shard_context(session, records),
             )
-            session = _resolve_session(manual_run=manual_run, created_by=created_by, session_id=session_id)
-            records = _create_records(session=session, instances=instances)
 
             totals = _sync_instances(
                 sync_logger=sync_logger,
@@ -708,8 +768,6 @@ def sync_accounts(
                 alert_event_service=alert_event_service,
                 run_id=resolved_run_id,
                 session=session,
-                instances=instances,
-                records=records,
             )
             ag_totals = (
                 _AgAccountsSyncTotals()
@@ -745,5 +803,6 @@ def sync_accounts(
             )
             raise
         finally:
+            invalidate_account_statistics_cache(reason="sync_accounts")
             db.session.remove()
             db.engine.dispose()
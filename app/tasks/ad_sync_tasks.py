@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 from dataclasses import asdict, dataclass
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import structlog
+from flask import current_app
 
 from app import create_app, db
 from app.core.constants.status_types import TaskRunStatus
@@ -13,9 +15,10 @@ from app.core.exceptions import ValidationError
 from app.models.ad_domain_config import AdDomainConfig
 from app.repositories.ad_domain_config_repository import AdDomainConfigRepository
 from app.services.ad_sync.ad_account_match_service import AdAccountMatchService, AdDomainMatchResult
-from app.services.ad_sync.ldap_provider import AdPrincipalsFetchResult, LdapProvider
+from app.services.ad_sync.ldap_provider import AdPrincipalsFetchResult, AdUsnWatermark, LdapProvider
 from app.services.task_runs.task_run_summary_builders import build_sync_ad_accounts_summary
 from app.services.task_runs.task_runs_write_service import TaskRunItemInit, TaskRunsWriteService
+from app.settings import DEFAULT_AD_FULL_SYNC_INTERVAL_HOURS
 from app.utils.structlog_config import get_sync_logger
 from app.utils.time_utils import time_utils
 
@@ -125,11 +128,51 @@ def _metrics(result: AdDomainMatchResult, fetch_result: AdPrincipalsFetchResult)
             "ad_users_total": fetch_result.users_total,
             "ad_groups_total": fetch_result.groups_total,
             "ad_principals_total": fetch_result.principals_total,
+            "incremental": fetch_result.incremental,
+            "ad_deleted_total": len(fetch_result.deleted_names),
         }
     )
     return metrics
 
 
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+
+
+def _stored_watermarks(domain: AdDomainConfig) -> dict[str, AdUsnWatermark]:
+    raw_watermarks = domain.usn_watermarks if isinstance(domain.usn_watermarks, dict) else {}
+    watermarks: dict[str, AdUsnWatermark] = {}
+    for controller, payload in raw_watermarks.items():
+        watermark = AdUsnWatermark.from_payload(str(controller), payload)
+        if watermark is not None:
+            watermarks[watermark.controller] = watermark
+    return watermarks
+
+
+def _needs_full_sync(
+    domain: AdDomainConfig,
+    *,
+    watermarks: dict[str, AdUsnWatermark],
+    now: datetime,
+    full_sync_interval: timedelta,
+) -> bool:
+    if not watermarks or domain.last_full_sync_at is None:
+        return True
+    return now - _as_utc(domain.last_full_sync_at) >= full_sync_interval
+
+
+def _store_watermark(domain: AdDomainConfig, watermark: AdUsnWatermark | None) -> None:
+    if watermark is None:
+        return
+    raw_watermarks = domain.usn_watermarks if isinstance(domain.usn_watermarks, dict) else {}
+    domain.usn_watermarks = {**raw_watermarks, watermark.controller: watermark.to_payload()}
+
+
+def _resolve_full_sync_interval() -> timedelta:
+    hours = current_app.config.get("AD_FULL_SYNC_INTERVAL_HOURS", DEFAULT_AD_FULL_SYNC_INTERVAL_HOURS)
+    return timedelta(hours=max(int(hours), 1))
+
+
 def _task_log_context(*, run_id: str) -> dict[str, object]:
     return {
         "module": "ad_sync",
@@ -178,6 +221,37 @@ def _fetch_result_log_context(fetch_result: AdPrincipalsFetchResult | AdFetchTot
     }
 
 
+def _fetch_and_match(
+    *,
+    domain: AdDomainConfig,
+    provider: LdapProvider,
+    matcher: AdAccountMatchService,
+    now: datetime,
+    full_sync_interval: timedelta,
+) -> tuple[AdDomainMatchResult, AdPrincipalsFetchResult]:
+    watermarks = _stored_watermarks(domain)
+    if _needs_full_sync(domain, watermarks=watermarks, now=now, full_sync_interval=full_sync_interval):
+        fetch_result = provider.fetch_principals_with_stats(domain)
+        lookup_names: set[str] = set()
+    else:
+        # 增量: 只拉取水位之后变更/删除的主体, 并补查尚未与该域匹配过的新账户
+        lookup_names = matcher.list_unmatched_account_names(domain)
+        fetch_result = provider.fetch_principal_changes(domain, watermarks=watermarks, lookup_names=lookup_names)
+
+    if fetch_result.incremental:
+        result = matcher.match_and_update_changes(
+            domain_config=domain,
+            principals=fetch_result.principals,
+            deleted_names=fetch_result.deleted_names,
+            lookup_names=lookup_names,
+        )
+    else:
+        result = matcher.match_and_update(domain_config=domain, principals=fetch_result.principals)
+        domain.last_full_sync_at = now
+    _store_watermark(domain, fetch_result.watermark)
+    return result, fetch_result
+
+
 def _sync_domain(
     *,
     domain: AdDomainConfig,
@@ -185,14 +259,21 @@ def _sync_domain(
     provider: LdapProvider,
     matcher: AdAccountMatchService,
     task_runs_service: TaskRunsWriteService,
+    full_sync_interval: timedelta,
 ) -> tuple[AdDomainMatchResult, AdPrincipalsFetchResult]:
     item_key = str(domain.id)
     task_runs_service.start_item(run_id, item_type="ad_domain", item_key=item_key)
     db.session.commit()
 
-    fetch_result = provider.fetch_principals_with_stats(domain)
-    result = matcher.match_and_update(domain_config=domain, principals=fetch_result.principals)
-    domain.last_sync_at = time_utils.now()
+    now = time_utils.now()
+    result, fetch_result = _fetch_and_match(
+        domain=domain,
+        provider=provider,
+        matcher=matcher,
+        now=now,
+        full_sync_interval=full_sync_interval,
+    )
+    domain.last_sync_at = now
     domain.last_sync_status = "success"
     domain.last_sync_run_id = run_id
     domain.last_error = None
@@ -292,6 +373,7 @@ def sync_ad_accounts(
         _init_items(task_runs_service=task_runs_service, run_id=resolved_run_id, domains=domains)
         provider = LdapProvider()
         matcher = AdAccountMatchService()
+        full_sync_interval = _resolve_full_sync_interval()
         totals = AdDomainMatchResult(total=0, normal=0, disabled=0, orphaned=0, updated=0)
         fetch_totals = AdFetchTotals()
         successful = failed = 0
@@ -303,6 +385,7 @@ def sync_ad_accounts(
                     provider=provider,
                     matcher=matcher,
                     task_runs_service=task_runs_service,
+                    full_sync_interval=full_sync_interval,
                 )
                 totals = _add_results(totals, result)
                 fetch_totals = _add_fetch_totals(fetch_totals, fetch_result)
@@ -312,6 +395,8 @@ def sync_ad_accounts(
                     **_domain_log_context(domain=domain, run_id=resolved_run_id),
                     **_match_result_log_context(result),
                     **_fetch_result_log_context(fetch_result),
+                    incremental=fetch_result.incremental,
+                    ad_deleted_total=len(fetch_result.deleted_names),
                 )
             except AD_SYNC_EXCEPTIONS as exc:
                 failed += 1
@@ -28,12 +28,17 @@ def _prepare_aggregation_run(
     sync_logger: Any,
     manual_run: bool,
     periods: list[str] | None,
+    instance_ids: list[int] | None = None,
 ) -> tuple[AggregationService, list[Any], list[str]] | dict[str, Any]:
     if not bool(app.config.get("AGGREGATION_ENABLED", True)):
         sync_logger.info("数据库大小统计聚合功能已禁用", module="aggregation_sync")
         return runner.build_skip_response("统计聚合功能已禁用")
 
     active_instances = runner.list_active_instances()
+    if instance_ids is not None:
+        # 依赖触发时仅聚合上游容量同步成功的实例
+        scoped_ids = set(instance_ids)
+        active_instances = [instance for instance in active_instances if instance.id in scoped_ids]
     if not active_instances:
         sync_logger.warning("没有找到活跃的数据库实例", module="aggregation_sync")
         return runner.build_skip_response("没有活跃的数据库实例需要聚合")
@@ -373,9 +378,13 @@ def calculate_database(
     periods: list[str] | None = None,
     created_by: int | None = None,
     run_id: str | None = None,
+    instance_ids: list[int] | None = None,
     **_: object,
 ) -> dict[str, Any]:
-    """计算数据库大小统计聚合(按日/周/月/季依次执行)."""
+    """计算数据库大小统计聚合(按日/周/月/季依次执行).
+
+    `instance_ids` 由依赖触发传入, 限定仅聚合上游同步成功的实例.
+    """
     app = create_app(init_scheduler_on_start=False)
     with app.app_context():
         sync_logger = get_sync_logger()
@@ -421,6 +430,7 @@ def calculate_database(
                 sync_logger=sync_logger,
                 manual_run=manual_run,
                 periods=periods,
+                instance_ids=instance_ids,
             )
             if isinstance(prepared, dict):
                 return _finalize_skip_run(
@@ -2,17 +2,24 @@
 
 from __future__ import annotations
 
+from functools import partial
 from typing import Any, cast
 
 from flask import has_app_context
 
 from app import create_app, db
+from app.core.constants.scheduler_jobs import SHARDED_TASKS
+from app.core.constants.status_types import TaskRunStatus
+from app.repositories.task_runs_repository import TaskRunsRepository
 from app.services.alerts.email_alert_event_service import EmailAlertEventService
 from app.services.capacity.capacity_collection_task_runner import (
     CAPACITY_TASK_EXCEPTIONS,
     CapacityCollectionTaskRunner,
     CapacitySyncTotals,
 )
+from app.services.connections.instance_reachability_service import InstanceReachabilityService
+from app.services.sync_session_service import sync_session_service
+from app.services.task_runs.task_run_shard_service import TaskRunShardService
 from app.services.task_runs.task_run_summary_builders import build_sync_databases_summary
 from app.services.task_runs.task_runs_write_service import TaskRunItemInit, TaskRunsWriteService
 from app.utils.structlog_config import get_sync_logger, log_fallback
@@ -62,6 +69,27 @@ def _process_instance_with_fallback(
 ) -> tuple[dict[str, object], CapacitySyncTotals]:
     runner.start_instance_sync(record.id)
     db.session.commit()
+    unreachable_reason = InstanceReachabilityService().known_down_reason(instance.id)
+    if unreachable_reason:
+        # 可达性探测已判定不可达, 直接记失败, 不再等待连接超时
+        sync_logger.warning(
+            "实例已判定不可达,跳过容量同步",
+            module="capacity_sync",
+            session_id=session_obj.session_id,
+            instance_id=instance.id,
+            instance_name=instance.name,
+            error=unreachable_reason,
+        )
+        runner.fail_instance_sync(record.id, unreachable_reason)
+        db.session.commit()
+        payload = {
+            "instance_id": instance.id,
+            "instance_name": instance.name,
+            "success": False,
+            "message": unreachable_reason,
+            "error": unreachable_reason,
+        }
+        return payload, CapacitySyncTotals(total_failed=1)
     try:
         payload, delta = runner.process_capacity_instance(
             session=session_obj,
@@ -126,99 +154,136 @@ def _finalize_no_active_instances(
     return {"run_id": run_id, **runner.no_active_instances_result()}
 
 
-def _sync_instances(
+def _record_shard_context(session_obj: Any, records: list[Any]) -> dict[int, dict[str, object]]:
+    """实例子项携带会话/记录 ID, 使其他节点认领分片后可恢复上下文."""
+    return {
+        int(record.instance_id): {"session_id": session_obj.session_id, "record_id": int(record.id)}
+        for record in records
+    }
+
+
+def _process_capacity_item(
+    item: Any,
     *,
     runner: CapacityCollectionTaskRunner,
     task_runs_service: TaskRunsWriteService,
     alert_event_service: EmailAlertEventService,
     sync_logger: Any,
-    run_id: str,
-    session_obj: Any,
-    active_instances: list[Any],
-    records: list[Any],
-    is_cancelled: Any,
-) -> tuple[CapacitySyncTotals, list[dict[str, object]]]:
-    totals = CapacitySyncTotals()
-    results: list[dict[str, object]] = []
+) -> None:
+    """采集单个实例容量并写入子项结果(分片 handler)."""
+    run_id = item.run_id
+    context = item.details_json if isinstance(item.details_json, dict) else {}
+    session_obj, record = sync_session_service.resolve_instance_record(int(context.get("record_id") or 0))
+    instance = runner.load_active_instance(int(item.instance_id))
+
+    payload, _ = _process_instance_with_fallback(
+        runner=runner,
+        session_obj=session_obj,
+        record=record,
+        instance=instance,
+        sync_logger=sync_logger,
+    )
 
-    for instance, record in zip(active_instances, records, strict=False):
-        if bool(is_cancelled and is_cancelled()):
-            sync_logger.info(
-                "任务已取消,提前退出实例循环",
-                module="capacity_sync",
-                task="sync_databases",
-                run_id=run_id,
+    metrics = {
+        "database_count": payload.get("database_count", 0),
+        "size_mb": payload.get("size_mb", 0),
+        "saved_count": payload.get("saved_count", 0),
+    }
+    if bool(payload.get("success")):
+        task_runs_service.complete_item(
+            run_id,
+            item_type="instance",
+            item_key=str(instance.id),
+            metrics_json=metrics,
+            details_json=dict(payload),
+        )
+        current_rows = []
+        raw_databases = payload.get("databases", [])
+        for row in cast("list[dict[str, object]]", raw_databases):
+            if not isinstance(row, dict):
+                continue
+            current_rows.append(
+                {
+                    "instance_id": instance.id,
+                    "instance_name": instance.name,
+                    "database_name": row.get("database_name"),
+                    "size_mb": row.get("size_mb"),
+                    "collected_date": row.get("collected_date"),
+                },
             )
-            break
-
-        task_runs_service.start_item(
+        alert_event_service.record_database_capacity_events(current_rows=current_rows)
+    else:
+        error_message = str(payload.get("message") or "实例容量同步失败")
+        task_runs_service.fail_item(
             run_id,
             item_type="instance",
             item_key=str(instance.id),
+            error_message=error_message,
+            details_json=dict(payload),
         )
-        db.session.commit()
+        alert_event_service.record_sync_failure_event(
+            alert_type="database_sync_failure",
+            instance_id=instance.id,
+            instance_name=instance.name,
+            run_id=run_id,
+            session_id=getattr(session_obj, "session_id", None),
+            error_message=error_message,
+        )
+    db.session.commit()
+
+
+def process_capacity_shard_item(item: Any) -> None:
+    """分片工作节点入口: 处理其他节点发起的实例容量采集子项."""
+    _process_capacity_item(
+        item,
+        runner=CapacityCollectionTaskRunner(),
+        task_runs_service=TaskRunsWriteService(),
+        alert_event_service=EmailAlertEventService(),
+        sync_logger=get_sync_logger(),
+    )
+
 
-        payload, delta = _process_instance_with_fallback(
+def _sync_instances(
+    *,
+    runner: CapacityCollectionTaskRunner,
+    task_runs_service: TaskRunsWriteService,
+    alert_event_service: EmailAlertEventService,
+    sync_logger: Any,
+    run_id: str,
+) -> tuple[CapacitySyncTotals, list[dict[str, object]]]:
+    """按分片处理实例子项(其他节点可并行认领), 结束后按子项结果汇总."""
+    TaskRunShardService(task_runs_service=task_runs_service).run_shards(
+        run_id,
+        partial(
+            _process_capacity_item,
             runner=runner,
-            session_obj=session_obj,
-            record=record,
-            instance=instance,
+            task_runs_service=task_runs_service,
+            alert_event_service=alert_event_service,
             sync_logger=sync_logger,
+        ),
+        item_types=SHARDED_TASKS["sync_databases"].item_types,
+        wait_for_others=True,
+    )
+    if task_runs_service.is_cancelled(run_id):
+        sync_logger.info(
+            "任务已取消,提前退出实例循环",
+            module="capacity_sync",
+            task="sync_databases",
+            run_id=run_id,
         )
 
-        totals.total_synced += delta.total_synced
-        totals.total_failed += delta.total_failed
-        totals.total_collected_size_mb += delta.total_collected_size_mb
-        results.append(payload)
-
-        payload_success = bool(payload.get("success"))
-        metrics = {
-            "database_count": payload.get("database_count", 0),
-            "size_mb": payload.get("size_mb", 0),
-            "saved_count": payload.get("saved_count", 0),
-        }
-        if payload_success:
-            task_runs_service.complete_item(
-                run_id,
-                item_type="instance",
-                item_key=str(instance.id),
-                metrics_json=metrics,
-                details_json=dict(payload),
-            )
-            current_rows = []
-            raw_databases = payload.get("databases", [])
-            for item in cast("list[dict[str, object]]", raw_databases):
-                if not isinstance(item, dict):
-                    continue
-                current_rows.append(
-                    {
-                        "instance_id": instance.id,
-                        "instance_name": instance.name,
-                        "database_name": item.get("database_name"),
-                        "size_mb": item.get("size_mb"),
-                        "collected_date": item.get("collected_date"),
-                    },
-                )
-            alert_event_service.record_database_capacity_events(current_rows=current_rows)
+    totals = CapacitySyncTotals()
+    results: list[dict[str, object]] = []
+    for item in TaskRunsRepository.list_run_items(run_id):
+        if item.item_type != "instance" or item.status not in {TaskRunStatus.COMPLETED, TaskRunStatus.FAILED}:
+            continue
+        if item.status == TaskRunStatus.COMPLETED:
+            totals.total_synced += 1
+            totals.total_collected_size_mb += int((item.metrics_json or {}).get("size_mb", 0) or 0)
         else:
-            error_message = str(payload.get("message") or "实例容量同步失败")
-            task_runs_service.fail_item(
-                run_id,
-                item_type="instance",
-                item_key=str(instance.id),
-                error_message=error_message,
-                details_json=dict(payload),
-            )
-            alert_event_service.record_sync_failure_event(
-                alert_type="database_sync_failure",
-                instance_id=instance.id,
-                instance_name=instance.name,
-                run_id=run_id,
-                session_id=getattr(session_obj, "session_id", None),
-                error_message=error_message,
-            )
-        db.session.commit()
-
+            totals.total_failed += 1
+        if isinstance(item.details_json, dict):
+            results.append(item.details_json)
     return totals, results
 
 
@@ -352,6 +417,10 @@ def sync_databases(
                 run_id=resolved_run_id,
             )
 
+            session_obj, records = runner.create_capacity_session(active_instances)
+            db.session.commit()
+
+            shard_context = _record_shard_context(session_obj, records)
             task_runs_service.init_items(
                 resolved_run_id,
                 items=[
@@ -360,25 +429,19 @@ def sync_databases(
                         item_key=str(instance.id),
                         item_name=instance.name,
                         instance_id=instance.id,
+                        details_json=shard_context.get(int(instance.id)),
                     )
                     for instance in active_instances
                 ],
             )
             db.session.commit()
 
-            session_obj, records = runner.create_capacity_session(active_instances)
-            db.session.commit()
-
             totals, results = _sync_instances(
                 runner=runner,
                 task_runs_service=task_runs_service,
                 alert_event_service=alert_event_service,
                 sync_logger=sync_logger,
                 run_id=resolved_run_id,
-                session_obj=session_obj,
-                active_instances=active_instances,
-                records=records,
-                is_cancelled=_is_cancelled,
             )
 
             _finalize_capacity_session(session_obj=session_obj, totals=totals)
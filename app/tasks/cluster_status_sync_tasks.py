@@ -3,25 +3,34 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.exc import SQLAlchemyError
 
 from app import create_app, db
+from app.core.constants.scheduler_jobs import SHARDED_TASKS
 from app.core.constants.status_types import TaskRunStatus
 from app.core.exceptions import AppError
 from app.models.mysql_cluster import MySQLCluster
 from app.models.sqlserver_cluster import SQLServerCluster
+from app.repositories.task_runs_repository import TaskRunsRepository
 from app.services.alerts.email_alert_event_service import EmailAlertEventService
 from app.services.cluster_status_sync import ClusterStatusSyncService
 from app.services.cluster_status_sync.issue_contract import (
     ClusterStatusDetectionResult,
     build_failed_cluster_status_result,
 )
+from app.services.cluster_status_sync.service import ClusterNodeProbes
+from app.services.task_runs.task_run_shard_service import TaskRunShardService
 from app.services.task_runs.task_run_summary_builders import build_sync_cluster_status_summary
 from app.services.task_runs.task_runs_write_service import TaskRunItemInit, TaskRunsWriteService
 from app.utils.structlog_config import get_sync_logger
 
+if TYPE_CHECKING:
+    from app.models.task_run_item import TaskRunItem
+    from app.services.task_runs.task_run_shard_service import ShardItemHandler
+
 CLUSTER_STATUS_TASK_EXCEPTIONS: tuple[type[Exception], ...] = (
     AppError,
     SQLAlchemyError,
@@ -105,7 +114,6 @@ def _record_result(
     cluster_id: int,
     cluster_name: str,
     result: dict[str, Any],
-    totals: _ClusterStatusTotals,
     alert_event_service: EmailAlertEventService,
 ) -> None:
     detection = ClusterStatusDetectionResult.from_result(
@@ -115,10 +123,7 @@ def _record_result(
         run_id=run_id,
         result=result,
     )
-    totals.abnormal_database_count += detection.abnormal_database_count
-    totals.abnormal_replica_count += detection.abnormal_replica_count
     if detection.is_failed:
-        totals.clusters_failed += 1
         task_runs_service.fail_item(
             run_id,
             item_type=item_type,
@@ -127,7 +132,6 @@ def _record_result(
             details_json=detection.to_details_json(),
         )
     else:
-        totals.clusters_successful += 1
         task_runs_service.complete_item(
             run_id,
             item_type=item_type,
@@ -153,7 +157,6 @@ def _record_cluster_exception(
     cluster_id: int,
     cluster_name: str,
     exc: Exception,
-    totals: _ClusterStatusTotals,
     alert_event_service: EmailAlertEventService,
 ) -> None:
     result = build_failed_cluster_status_result(cluster_id=cluster_id, error_message=str(exc))
@@ -164,11 +167,129 @@ def _record_cluster_exception(
         cluster_id=cluster_id,
         cluster_name=cluster_name,
         result=result,
-        totals=totals,
         alert_event_service=alert_event_service,
     )
 
 
+_CLUSTER_EXCEPTION_EVENTS: dict[str, str] = {
+    "mysql_cluster": "MySQL 群集同步状态检测异常",
+    "sqlserver_cluster": "SQL Server 群集同步状态检测异常",
+}
+
+
+def _process_cluster_item(
+    item: TaskRunItem,
+    *,
+    service: ClusterStatusSyncService,
+    alert_event_service: EmailAlertEventService,
+    task_runs_service: TaskRunsWriteService,
+    sync_logger: Any,
+    probes: ClusterNodeProbes | None = None,
+) -> None:
+    """检测单个群集并写入子项结果(分片 handler; probes 为分片预处理时并发探测的节点结果)."""
+    run_id = item.run_id
+    item_type = item.item_type
+    cluster_id = int(item.item_key)
+    cluster_name = str(item.item_name or "")
+    sync = service.sync_mysql_cluster if item_type == "mysql_cluster" else service.sync_sqlserver_cluster
+    try:
+        result = sync(cluster_id, probes=probes)
+    except Exception as exc:
+        db.session.rollback()
+        sync_logger.exception(
+            _CLUSTER_EXCEPTION_EVENTS.get(item_type, "群集同步状态检测异常"),
+            module="cluster_status_sync",
+            operation="sync_cluster_status",
+            run_id=run_id,
+            cluster_id=cluster_id,
+            cluster_name=cluster_name,
+            error=str(exc),
+        )
+        _record_cluster_exception(
+            task_runs_service=task_runs_service,
+            run_id=run_id,
+            item_type=item_type,
+            cluster_id=cluster_id,
+            cluster_name=cluster_name,
+            exc=exc,
+            alert_event_service=alert_event_service,
+        )
+        return
+    _record_result(
+        task_runs_service=task_runs_service,
+        run_id=run_id,
+        item_type=item_type,
+        cluster_id=cluster_id,
+        cluster_name=cluster_name,
+        result=result,
+        alert_event_service=alert_event_service,
+    )
+
+
+def process_cluster_status_shard_item(item: TaskRunItem) -> None:
+    """分片工作节点入口: 处理其他节点发起的群集检测子项."""
+    _process_cluster_item(
+        item,
+        service=ClusterStatusSyncService(),
+        alert_event_service=EmailAlertEventService(),
+        task_runs_service=TaskRunsWriteService(),
+        sync_logger=get_sync_logger(),
+    )
+
+
+def _prepare_cluster_shard(
+    items: list[TaskRunItem],
+    *,
+    service: ClusterStatusSyncService,
+    alert_event_service: EmailAlertEventService,
+    task_runs_service: TaskRunsWriteService,
+    sync_logger: Any,
+) -> ShardItemHandler:
+    """并发探测分片内全部群集的节点, 返回按探测结果逐个写库的子项 handler."""
+    probes = service.probe_clusters(
+        mysql_cluster_ids=[int(item.item_key) for item in items if item.item_type == "mysql_cluster"],
+        sqlserver_cluster_ids=[int(item.item_key) for item in items if item.item_type == "sqlserver_cluster"],
+    )
+    return partial(
+        _process_cluster_item,
+        service=service,
+        alert_event_service=alert_event_service,
+        task_runs_service=task_runs_service,
+        sync_logger=sync_logger,
+        probes=probes,
+    )
+
+
+def prepare_cluster_status_shard(items: list[TaskRunItem]) -> ShardItemHandler:
+    """分片工作节点入口: 并发探测认领到的群集节点."""
+    return _prepare_cluster_shard(
+        items,
+        service=ClusterStatusSyncService(),
+        alert_event_service=EmailAlertEventService(),
+        task_runs_service=TaskRunsWriteService(),
+        sync_logger=get_sync_logger(),
+    )
+
+
+def _collect_totals(run_id: str, *, mysql_clusters_total: int, sqlserver_clusters_total: int) -> _ClusterStatusTotals:
+    """按子项结果汇总(子项可能由多个节点处理)."""
+    totals = _ClusterStatusTotals(
+        mysql_clusters_total=mysql_clusters_total,
+        sqlserver_clusters_total=sqlserver_clusters_total,
+    )
+    for item in TaskRunsRepository.list_run_items(run_id):
+        if item.status == TaskRunStatus.COMPLETED:
+            totals.clusters_successful += 1
+        elif item.status == TaskRunStatus.FAILED:
+            totals.clusters_failed += 1
+        else:
+            continue
+        counts = item.metrics_json or item.details_json or {}
+        totals.abnormal_database_count += int(counts.get("abnormal_database_count", 0) or 0)
+        totals.abnormal_replica_count += int(counts.get("abnormal_replica_count", 0) or 0)
+    return totals
+
+
 def _finalize_run(task_runs_service: TaskRunsWriteService, run_id: str, totals: _ClusterStatusTotals) -> None:
     task_runs_service.finalize_run_with_summary(
         run_id,
@@ -208,92 +329,36 @@ def sync_cluster_status(
             alert_event_service = EmailAlertEventService()
             mysql_clusters = service.list_enabled_mysql_clusters()
             sqlserver_clusters = service.list_enabled_sqlserver_clusters()
-            totals = _ClusterStatusTotals(
-                mysql_clusters_total=len(mysql_clusters),
-                sqlserver_clusters_total=len(sqlserver_clusters),
-            )
             _init_items(
                 task_runs_service=task_runs_service,
                 run_id=resolved_run_id,
                 mysql_clusters=mysql_clusters,
                 sqlserver_clusters=sqlserver_clusters,
             )
-            for cluster in mysql_clusters:
-                item_key = str(cluster.id)
-                task_runs_service.start_item(resolved_run_id, item_type="mysql_cluster", item_key=item_key)
-                db.session.commit()
-                try:
-                    result = service.sync_mysql_cluster(int(cluster.id))
-                except Exception as exc:
-                    db.session.rollback()
-                    sync_logger.exception(
-                        "MySQL 群集同步状态检测异常",
-                        module="cluster_status_sync",
-                        operation="sync_cluster_status",
-                        run_id=resolved_run_id,
-                        cluster_id=int(cluster.id),
-                        cluster_name=str(cluster.name),
-                        error=str(exc),
-                    )
-                    _record_cluster_exception(
-                        task_runs_service=task_runs_service,
-                        run_id=resolved_run_id,
-                        item_type="mysql_cluster",
-                        cluster_id=int(cluster.id),
-                        cluster_name=str(cluster.name),
-                        exc=exc,
-                        totals=totals,
-                        alert_event_service=alert_event_service,
-                    )
-                    continue
-                _record_result(
-                    task_runs_service=task_runs_service,
-                    run_id=resolved_run_id,
-                    item_type="mysql_cluster",
-                    cluster_id=int(cluster.id),
-                    cluster_name=str(cluster.name),
-                    result=result,
-                    totals=totals,
+            TaskRunShardService(task_runs_service=task_runs_service).run_shards(
+                resolved_run_id,
+                partial(
+                    _process_cluster_item,
+                    service=service,
                     alert_event_service=alert_event_service,
-                )
-            for cluster in sqlserver_clusters:
-                item_key = str(cluster.id)
-                task_runs_service.start_item(resolved_run_id, item_type="sqlserver_cluster", item_key=item_key)
-                db.session.commit()
-                try:
-                    result = service.sync_sqlserver_cluster(int(cluster.id))
-                except Exception as exc:
-                    db.session.rollback()
-                    sync_logger.exception(
-                        "SQL Server 群集同步状态检测异常",
-                        module="cluster_status_sync",
-                        operation="sync_cluster_status",
-                        run_id=resolved_run_id,
-                        cluster_id=int(cluster.id),
-                        cluster_name=str(cluster.name),
-                        error=str(exc),
-                    )
-                    _record_cluster_exception(
-                        task_runs_service=task_runs_service,
-                        run_id=resolved_run_id,
-                        item_type="sqlserver_cluster",
-                        cluster_id=int(cluster.id),
-                        cluster_name=str(cluster.name),
-                        exc=exc,
-                        totals=totals,
-                        alert_event_service=alert_event_service,
-                    )
-                    continue
-                _record_result(
                     task_runs_service=task_runs_service,
-                    run_id=resolved_run_id,
-                    item_type="sqlserver_cluster",
-                    cluster_id=int(cluster.id),
-                    cluster_name=str(cluster.name),
-                    result=result,
-                    totals=totals,
+                    sync_logger=sync_logger,
+                ),
+                item_types=SHARDED_TASKS["sync_cluster_status"].item_types,
+                wait_for_others=True,
+                prepare=partial(
+                    _prepare_cluster_shard,
+                    service=service,
                     alert_event_service=alert_event_service,
-                )
+                    task_runs_service=task_runs_service,
+                    sync_logger=sync_logger,
+                ),
+            )
+            totals = _collect_totals(
+                resolved_run_id,
+                mysql_clusters_total=len(mysql_clusters),
+                sqlserver_clusters_total=len(sqlserver_clusters),
+            )
             _finalize_run(task_runs_service, resolved_run_id, totals)
             sync_logger.info(
                 "群集同步状态检测完成",
@@ -324,3 +389,88 @@ def sync_cluster_status(
                 run_id=resolved_run_id,
                 error=str(exc),
             )
+
+
+def _poll_cluster(
+    *,
+    service: ClusterStatusSyncService,
+    item_type: str,
+    cluster_id: int,
+    probes: ClusterNodeProbes,
+    totals: _ClusterStatusTotals,
+    sync_logger: Any,
+) -> None:
+    sync = service.sync_mysql_cluster if item_type == "mysql_cluster" else service.sync_sqlserver_cluster
+    try:
+        result = sync(cluster_id, probes=probes)
+        db.session.commit()
+    except Exception as exc:
+        db.session.rollback()
+        totals.clusters_failed += 1
+        sync_logger.warning(
+            "群集健康轮询单个群集失败",
+            module="cluster_status_sync",
+            operation="poll_cluster_health",
+            cluster_type=item_type,
+            cluster_id=cluster_id,
+            error=str(exc),
+        )
+        return
+    if result.get("status") == "failed":
+        totals.clusters_failed += 1
+    else:
+        totals.clusters_successful += 1
+    totals.abnormal_database_count += int(result.get("abnormal_database_count", 0) or 0)
+    totals.abnormal_replica_count += int(result.get("abnormal_replica_count", 0) or 0)
+
+
+def poll_cluster_health(**_: Any) -> None:
+    """分钟级群集健康轮询: 并发探测全部启用群集的节点并刷新同步状态.
+
+    轻量模式: 不创建 TaskRun, 不写告警事件(告警仍由每日 sync_cluster_status 汇总).
+    """
+    app = create_app(init_scheduler_on_start=False)
+    with app.app_context():
+        sync_logger = get_sync_logger()
+        try:
+            service = ClusterStatusSyncService()
+            mysql_cluster_ids = [int(cluster.id) for cluster in service.list_enabled_mysql_clusters()]
+            sqlserver_cluster_ids = [int(cluster.id) for cluster in service.list_enabled_sqlserver_clusters()]
+            probes = service.probe_clusters(
+                mysql_cluster_ids=mysql_cluster_ids,
+                sqlserver_cluster_ids=sqlserver_cluster_ids,
+            )
+            totals = _ClusterStatusTotals(
+                mysql_clusters_total=len(mysql_cluster_ids),
+                sqlserver_clusters_total=len(sqlserver_cluster_ids),
+            )
+            clusters = [("mysql_cluster", cluster_id) for cluster_id in mysql_cluster_ids] + [
+                ("sqlserver_cluster", cluster_id) for cluster_id in sqlserver_cluster_ids
+            ]
+            for item_type, cluster_id in clusters:
+                _poll_cluster(
+                    service=service,
+                    item_type=item_type,
+                    cluster_id=cluster_id,
+                    probes=probes,
+                    totals=totals,
+                    sync_logger=sync_logger,
+                )
+            sync_logger.info(
+                "群集健康轮询完成",
+                module="cluster_status_sync",
+                operation="poll_cluster_health",
+                mysql_clusters_total=totals.mysql_clusters_total,
+                sqlserver_clusters_total=totals.sqlserver_clusters_total,
+                clusters_failed=totals.clusters_failed,
+                abnormal_database_count=totals.abnormal_database_count,
+                abnormal_replica_count=totals.abnormal_replica_count,
+            )
+        except CLUSTER_STATUS_TASK_EXCEPTIONS as exc:
+            db.session.rollback()
+            sync_logger.exception(
+                "群集健康轮询失败",
+                module="cluster_status_sync",
+                operation="poll_cluster_health",
+                error=str(exc),
+            )
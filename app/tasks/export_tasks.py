@@ -0,0 +1,233 @@
+"""后台导出任务.
+
+用于超大台账的异步导出(由 `/api/v1/exports/jobs` 触发):
+- 复用各导出 service 的分块查询, 将 CSV 写入 `userdata/exports/<run_id>.csv`
+- 按已写入行数更新 TaskRun 进度, 完成后通过 result_url 下载
+- 每次执行前按 TTL 清理过期导出文件
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Mapping
+from datetime import timedelta
+from typing import Any, cast
+
+from flask import current_app
+from sqlalchemy import Table, select, update
+
+from app import create_app, db
+from app.core.constants.status_types import TaskRunStatus
+from app.models.task_run import TaskRun
+from app.repositories.task_runs_repository import TaskRunsRepository
+from app.schemas.export_jobs import (
+    EXPORT_TYPE_ACCOUNTS_LEDGER,
+    EXPORT_TYPE_DATABASE_LEDGER,
+    EXPORT_TYPE_INSTANCES,
+    parse_export_filters,
+)
+from app.services.files.account_export_service import AccountExportService
+from app.services.files.csv_export_result import CsvStreamResult
+from app.services.files.database_ledger_export_service import DatabaseLedgerExportService
+from app.services.files.export_file_store import ExportFileStore
+from app.services.files.instances_export_service import InstancesExportService
+from app.services.task_runs.task_run_summary_builders import build_export_csv_summary
+from app.services.task_runs.task_runs_write_service import TaskRunsWriteService
+from app.settings import Settings
+from app.utils.structlog_config import get_sync_logger
+from app.utils.time_utils import time_utils
+
+PROGRESS_REPORT_INTERVAL_SECONDS = 2.0
+
+ProgressCallback = Callable[[int], None]
+
+
+class ExportCancelledError(RuntimeError):
+    """导出过程中检测到 TaskRun 已被取消."""
+
+
+class _ProgressReporter:
+    """按行数回写 TaskRun 进度.
+
+    导出期间主 session 持有服务端游标, 不能 commit; 进度与取消状态通过独立连接读写.
+    """
+
+    def __init__(self, *, run_id: str) -> None:
+        self._run_id = run_id
+        self._last_reported_at = 0.0
+        self.rows_total = 0
+        self.rows_written = 0
+
+    def __call__(self, rows_written: int) -> None:
+        self.rows_written = rows_written
+        now = time.monotonic()
+        if now - self._last_reported_at < PROGRESS_REPORT_INTERVAL_SECONDS:
+            return
+        self._last_reported_at = now
+        table: Table = cast(Any, TaskRun).__table__
+        with db.engine.begin() as connection:
+            status = connection.execute(select(table.c.status).where(table.c.run_id == self._run_id)).scalar()
+            if status == TaskRunStatus.CANCELLED:
+                raise ExportCancelledError("导出任务已取消")
+            connection.execute(
+                update(table)
+                .where(table.c.run_id == self._run_id)
+                .values(progress_total=max(self.rows_total, rows_written), progress_completed=rows_written),
+            )
+
+
+def _resolve_ttl_hours() -> int:
+    return int(
+        current_app.config.get("EXPORT_FILE_TTL_HOURS", Settings.model_fields["export_file_ttl_hours"].default),
+    )
+
+
+def _read_inputs(run: TaskRun) -> tuple[str, dict[str, Any]]:
+    summary = run.summary_json if isinstance(run.summary_json, Mapping) else {}
+    common = summary.get("common")
+    inputs = common.get("inputs") if isinstance(common, Mapping) else None
+    if not isinstance(inputs, Mapping):
+        raise TypeError("导出任务缺少 inputs")
+    filters = inputs.get("filters")
+    return str(inputs.get("export_type") or ""), dict(filters) if isinstance(filters, Mapping) else {}
+
+
+def _open_export(
+    export_type: str,
+    filters_payload: dict[str, Any],
+    *,
+    on_progress: ProgressCallback,
+) -> tuple[int, Callable[[], CsvStreamResult]]:
+    """返回 (预计行数, 惰性导出入口)."""
+    query = parse_export_filters(export_type, filters_payload)
+    if export_type == EXPORT_TYPE_ACCOUNTS_LEDGER:
+        account_service = AccountExportService()
+        account_filters = query.to_filters()
+        return account_service.count_accounts(account_filters), lambda: account_service.export_accounts_csv(
+            account_filters,
+            on_progress=on_progress,
+        )
+    if export_type == EXPORT_TYPE_INSTANCES:
+        instances_service = InstancesExportService()
+        instance_filters = query.to_filters()
+        return instances_service.count_instances(instance_filters), lambda: instances_service.export_instances_csv(
+            instance_filters,
+            on_progress=on_progress,
+        )
+    if export_type == EXPORT_TYPE_DATABASE_LEDGER:
+        ledger_service = DatabaseLedgerExportService()
+        ledger_kwargs: dict[str, Any] = {
+            "search": query.search,
+            "db_type": query.db_type,
+            "instance_id": query.instance_id,
+            "tags": query.tags,
+        }
+        return ledger_service.count_rows(**ledger_kwargs), lambda: ledger_service.export_database_ledger_csv(
+            **ledger_kwargs,
+            on_progress=on_progress,
+        )
+    raise ValueError(f"不支持的导出类型: {export_type}")
+
+
+def _execute_export(
+    *,
+    task_runs_service: TaskRunsWriteService,
+    store: ExportFileStore,
+    run: TaskRun,
+    ttl_hours: int,
+) -> dict[str, Any]:
+    run_id = run.run_id
+    export_type, filters_payload = _read_inputs(run)
+    inputs = {"export_type": export_type, "filters": filters_payload}
+    reporter = _ProgressReporter(run_id=run_id)
+    rows_total, open_stream = _open_export(export_type, filters_payload, on_progress=reporter)
+    reporter.rows_total = rows_total
+
+    task_runs_service.update_progress(run_id, total=rows_total, completed=0)
+    task_runs_service.write_summary(
+        run_id,
+        build_export_csv_summary(inputs=inputs, export_type=export_type, rows_total=rows_total, rows_written=0),
+    )
+    db.session.commit()
+
+    result = open_stream()
+    info = store.write(run_id, result.chunks)
+    # 服务端游标已读尽, 主 session 结束只读事务后再写最终状态.
+    db.session.rollback()
+
+    expires_at = time_utils.now() + timedelta(hours=ttl_hours)
+    task_runs_service.finalize_run_with_summary(
+        run_id,
+        summary_json=build_export_csv_summary(
+            inputs=inputs,
+            export_type=export_type,
+            rows_total=rows_total,
+            rows_written=reporter.rows_written,
+            file_size_bytes=info.size_bytes,
+            filename=result.filename,
+            expires_at=expires_at,
+        ),
+    )
+    task_runs_service.update_progress(run_id, total=reporter.rows_written, completed=reporter.rows_written)
+    db.session.commit()
+    return {
+        "success": True,
+        "run_id": run_id,
+        "rows_written": reporter.rows_written,
+        "file_size_bytes": info.size_bytes,
+    }
+
+
+def run_export_job(
+    *,
+    run_id: str,
+    created_by: int | None = None,
+    **_: object,
+) -> dict[str, Any]:
+    """执行后台导出,并写入 TaskRun."""
+    app = create_app(init_scheduler_on_start=False)
+    with app.app_context():
+        sync_logger = get_sync_logger()
+        task_runs_service = TaskRunsWriteService()
+        store = ExportFileStore()
+        try:
+            removed = store.cleanup_expired(ttl_hours=_resolve_ttl_hours())
+            if removed:
+                sync_logger.info("已清理过期导出文件", module="export_jobs", task="export_csv", removed=removed)
+
+            run = TaskRunsRepository.get_run(run_id)
+            if run.status == TaskRunStatus.CANCELLED:
+                return {"success": True, "message": "任务已取消", "run_id": run_id}
+
+            started_at = time.perf_counter()
+            result = _execute_export(
+                task_runs_service=task_runs_service,
+                store=store,
+                run=run,
+                ttl_hours=_resolve_ttl_hours(),
+            )
+        except ExportCancelledError:
+            db.session.rollback()
+            sync_logger.info("导出任务已取消,已丢弃未完成文件", module="export_jobs", task="export_csv", run_id=run_id)
+            return {"success": True, "message": "任务已取消", "run_id": run_id}
+        except Exception as exc:
+            db.session.rollback()
+            task_runs_service.mark_run_failed(run_id, error_message=str(exc) or exc.__class__.__name__)
+            db.session.commit()
+            raise
+        else:
+            sync_logger.info(
+                "后台导出完成",
+                module="export_jobs",
+                task="export_csv",
+                run_id=run_id,
+                created_by=created_by,
+                rows_written=result["rows_written"],
+                file_size_bytes=result["file_size_bytes"],
+                duration_ms=round((time.perf_counter() - started_at) * 1000),
+            )
+            return result
+        finally:
+            # 后台任务尽快释放连接池中的空闲连接，避免占满 Postgres max_connections。
+            db.session.remove()
+            db.engine.dispose()
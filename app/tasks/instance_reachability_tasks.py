@@ -0,0 +1,48 @@
+"""实例可达性探测定时任务."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from app import create_app, db
+from app.core.exceptions import AppError
+from app.services.connections.instance_reachability_service import InstanceReachabilityService
+from app.utils.structlog_config import get_sync_logger
+
+REACHABILITY_TASK_EXCEPTIONS: tuple[type[Exception], ...] = (
+    AppError,
+    SQLAlchemyError,
+    RuntimeError,
+    ValueError,
+    TypeError,
+    OSError,
+)
+
+
+def poll_instance_reachability(**_: Any) -> None:
+    """分钟级实例可达性探测: 单线程非阻塞探测全部启用实例并刷新滚动延迟/可用率.
+
+    轻量模式: 不创建 TaskRun, 不写告警事件(不可达实例由风险中心展示).
+    """
+    app = create_app(init_scheduler_on_start=False)
+    with app.app_context():
+        sync_logger = get_sync_logger()
+        try:
+            summary = InstanceReachabilityService().run_probe_cycle()
+            db.session.commit()
+            sync_logger.info(
+                "实例可达性探测完成",
+                module="instance_reachability",
+                operation="poll_instance_reachability",
+                **summary,
+            )
+        except REACHABILITY_TASK_EXCEPTIONS as exc:
+            db.session.rollback()
+            sync_logger.exception(
+                "实例可达性探测失败",
+                module="instance_reachability",
+                operation="poll_instance_reachability",
+                error=str(exc),
+            )
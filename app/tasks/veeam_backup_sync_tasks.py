@@ -15,9 +15,10 @@ def sync_veeam_backups(
     manual_run: bool = False,
     created_by: int | None = None,
     run_id: str | None = None,
+    full_resync: bool = False,
     **_: object,
 ) -> None:
-    """同步 Veeam 备份快照."""
+    """同步 Veeam 备份快照(默认按 restorePoint 水位增量同步, full_resync=True 时全量重拉)."""
     app = create_app(init_scheduler_on_start=False)
     with app.app_context():
         trigger_source = "manual" if manual_run else "scheduled"
@@ -27,6 +28,7 @@ def sync_veeam_backups(
             prepared = service.prepare_background_sync(
                 created_by=created_by if manual_run else None,
                 trigger_source=trigger_source,
+                full_resync=full_resync,
             )
             resolved_run_id = prepared.run_id
             db.session.commit()
@@ -39,6 +41,7 @@ def sync_veeam_backups(
                 "manual_run": manual_run,
                 "trigger_source": trigger_source,
                 "run_id": resolved_run_id,
+                "full_resync": full_resync,
                 "pid": os.getpid(),
                 "thread_name": threading.current_thread().name,
             },
@@ -47,4 +50,5 @@ def sync_veeam_backups(
         service._sync_once(
             created_by=created_by if manual_run else None,
             run_id=resolved_run_id,
+            full_resync=full_resync,
         )
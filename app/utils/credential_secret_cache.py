@@ -0,0 +1,147 @@
+"""凭据明文短期缓存.
+
+职责:
+- 进程内缓存已解密的凭据 (用户名, 密码), 连接热路径命中时跳过 credential 关系加载与 Fernet 解密
+- 条目按 (credential_id, updated_at) 校验版本, 严格 TTL 到期失效, 凭据写操作显式失效
+- 密码以 bytearray 保存, 淘汰/失效时先逐字节清零再丢弃
+
+说明: 返回给驱动的 str 为不可变副本, 无法清零; 缓存只保证自身持有的明文不会超期驻留.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+
+from flask import current_app, has_app_context
+
+from app.settings import DEFAULT_CREDENTIAL_SECRET_CACHE_TTL_SECONDS
+
+# 缓存条目上限, 超出时淘汰最早写入的条目
+_MAX_ENTRIES = 1024
+
+
+@dataclass(slots=True)
+class _SecretEntry:
+    version: str | None
+    username: str
+    secret: bytearray
+    expires_at: float
+
+    def wipe(self) -> None:
+        for index in range(len(self.secret)):
+            self.secret[index] = 0
+
+
+def _version_key(updated_at: datetime | str | None) -> str | None:
+    if updated_at is None:
+        return None
+    if isinstance(updated_at, datetime):
+        return updated_at.isoformat()
+    return str(updated_at)
+
+
+class CredentialSecretCache:
+    """线程安全的凭据明文 TTL 缓存."""
+
+    def __init__(self, *, ttl_seconds: float | None = None, max_entries: int = _MAX_ENTRIES) -> None:
+        """初始化缓存(ttl_seconds 为 None 时按应用配置解析, 0 表示禁用缓存)."""
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max(int(max_entries), 1)
+        self._entries: dict[int, _SecretEntry] = {}
+        self._lock = threading.Lock()
+
+    def _resolve_ttl_seconds(self) -> float:
+        if self._ttl_seconds is not None:
+            return max(float(self._ttl_seconds), 0.0)
+        if has_app_context():
+            return max(
+                float(
+                    current_app.config.get(
+                        "CREDENTIAL_SECRET_CACHE_TTL_SECONDS",
+                        DEFAULT_CREDENTIAL_SECRET_CACHE_TTL_SECONDS,
+                    ),
+                ),
+                0.0,
+            )
+        return float(DEFAULT_CREDENTIAL_SECRET_CACHE_TTL_SECONDS)
+
+    def get(
+        self,
+        credential_id: int | None,
+        *,
+        updated_at: datetime | str | None = None,
+        check_version: bool = True,
+    ) -> tuple[str, str] | None:
+        """读取 (用户名, 密码); 过期或版本不符时淘汰并返回 None.
+
+        check_version=False 仅按 credential_id 查找(调用方未加载凭据对象时使用, 依赖 TTL 与显式失效).
+        """
+        if credential_id is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(int(credential_id))
+            if entry is None:
+                return None
+            if entry.expires_at <= time.monotonic() or (check_version and entry.version != _version_key(updated_at)):
+                self._evict_locked(int(credential_id))
+                return None
+            return entry.username, entry.secret.decode()
+
+    def put(
+        self,
+        credential_id: int | None,
+        *,
+        updated_at: datetime | str | None,
+        username: str,
+        password: str,
+    ) -> None:
+        """写入解密后的凭据(TTL 为 0 或缺少 ID 时不缓存)."""
+        ttl_seconds = self._resolve_ttl_seconds()
+        if credential_id is None or ttl_seconds <= 0 or not password:
+            return
+        entry = _SecretEntry(
+            version=_version_key(updated_at),
+            username=username,
+            secret=bytearray(password.encode()),
+            expires_at=time.monotonic() + ttl_seconds,
+        )
+        with self._lock:
+            self._evict_locked(int(credential_id))
+            self._evict_expired_locked()
+            while len(self._entries) >= self._max_entries:
+                self._evict_locked(next(iter(self._entries)))
+            self._entries[int(credential_id)] = entry
+
+    def invalidate(self, credential_id: int | None) -> None:
+        """显式失效指定凭据(凭据更新/删除后调用)."""
+        if credential_id is None:
+            return
+        with self._lock:
+            self._evict_locked(int(credential_id))
+
+    def clear(self) -> None:
+        """清空并清零全部条目."""
+        with self._lock:
+            for credential_id in list(self._entries):
+                self._evict_locked(credential_id)
+
+    def __len__(self) -> int:
+        """当前条目数(含尚未清理的过期条目)."""
+        return len(self._entries)
+
+    def _evict_locked(self, credential_id: int) -> None:
+        entry = self._entries.pop(credential_id, None)
+        if entry is not None:
+            entry.wipe()
+
+    def _evict_expired_locked(self) -> None:
+        now = time.monotonic()
+        for credential_id in [key for key, entry in self._entries.items() if entry.expires_at <= now]:
+            self._evict_locked(credential_id)
+
+
+# 进程级全局实例
+credential_secret_cache = CredentialSecretCache()
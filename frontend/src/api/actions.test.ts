@@ -54,6 +54,7 @@ import {
   syncInstanceCapacity,
   triggerCapacityAggregation,
   autoClassifyAccounts,
+  createExportJob,
   updateAccountClassification,
   updateAccountClassificationRule,
   updateInstance,
@@ -91,6 +92,7 @@ describe("console action api", () => {
 
     await triggerCapacityAggregation("database", client);
     await autoClassifyAccounts(client);
+    await createExportJob({ export_type: "accounts_ledger", filters: { db_type: "mysql" } }, client);
     await syncDatabases(client);
     await syncAccounts(client);
     await createSqlServerCluster({ name: "sql-ag", domain_name: "corp.local", description: "primary", is_enabled: true }, client);
@@ -199,6 +201,7 @@ describe("console action api", () => {
     await saveJumpServerSource({ credential_id: 3, base_url: "https://jump.example", org_id: "org-1", verify_ssl: true }, client);
     await unbindJumpServer(client);
     await syncVeeam(client);
+    await syncVeeam(client, { fullResync: true });
     await createVeeamSource(
       {
         name: "veeam-main",
@@ -336,6 +339,10 @@ describe("console action api", () => {
 
     expect(client.post).toHaveBeenCalledWith("/api/v1/capacity/aggregations/current", { scope: "database" });
     expect(client.post).toHaveBeenCalledWith("/api/v1/accounts/classifications/actions/auto-classify", {});
+    expect(client.post).toHaveBeenCalledWith("/api/v1/exports/jobs", {
+      export_type: "accounts_ledger",
+      filters: { db_type: "mysql" },
+    });
     expect(client.post).toHaveBeenCalledWith("/api/v1/databases/ledgers/actions/sync-all", {});
     expect(client.post).toHaveBeenCalledWith("/api/v1/instances/actions/sync-accounts", {});
     expect(client.post).toHaveBeenCalledWith("/api/v1/sqlserver-clusters", {
@@ -452,6 +459,7 @@ describe("console action api", () => {
     });
     expect(client.delete).toHaveBeenCalledWith("/api/v1/integrations/jumpserver/source");
     expect(client.post).toHaveBeenCalledWith("/api/v1/integrations/veeam/actions/sync", {});
+    expect(client.post).toHaveBeenCalledWith("/api/v1/integrations/veeam/actions/sync", { full_resync: true });
     expect(client.post).toHaveBeenCalledWith("/api/v1/integrations/veeam/sources", {
       name: "veeam-main",
       credential_id: 4,
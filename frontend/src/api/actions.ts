@@ -131,6 +131,15 @@ export function autoClassifyAccounts(client: ApiActionClient = apiClient) {
   return client.post("/api/v1/accounts/classifications/actions/auto-classify", {});
 }
 
+export type ExportJobPayload = {
+  export_type: "accounts_ledger" | "database_ledger" | "instances";
+  filters?: Record<string, unknown>;
+};
+
+export function createExportJob(payload: ExportJobPayload, client: ApiActionClient = apiClient) {
+  return client.post("/api/v1/exports/jobs", payload);
+}
+
 export function deleteAccountClassification(classificationId: number, client: ApiActionClient = apiClient) {
   return client.delete(`/api/v1/accounts/classifications/${classificationId}`);
 }
@@ -402,8 +411,8 @@ export function unbindJumpServer(client: ApiActionClient = apiClient) {
   return client.delete("/api/v1/integrations/jumpserver/source");
 }
 
-export function syncVeeam(client: ApiActionClient = apiClient) {
-  return client.post("/api/v1/integrations/veeam/actions/sync", {});
+export function syncVeeam(client: ApiActionClient = apiClient, options: { fullResync?: boolean } = {}) {
+  return client.post("/api/v1/integrations/veeam/actions/sync", options.fullResync ? { full_resync: true } : {});
 }
 
 export function createVeeamSource(payload: VeeamSourcePayload, client: ApiActionClient = apiClient) {
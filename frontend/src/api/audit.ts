@@ -7,6 +7,9 @@ export type AuditPaginationQuery = {
   limit?: number;
   page?: number;
   search?: string;
+  pagination?: "offset" | "keyset";
+  cursor?: string;
+  total?: "exact" | "estimate" | "none";
 };
 
 export type HistoryLogsQuery = AuditPaginationQuery & {
@@ -30,6 +33,10 @@ export type PaginatedAuditList<TItem> = {
   page: number;
   pages: number;
   limit: number;
+  pagination?: "offset" | "keyset";
+  next_cursor?: string | null;
+  has_more?: boolean;
+  total_mode?: "exact" | "estimate" | "none";
 };
 
 export type HistoryLogItem = {
@@ -121,17 +128,23 @@ function queryPath(path: string, entries: Array<[string, string | number | undef
   return query ? `${path}?${query}` : path;
 }
 
+function keysetEntries(query: AuditPaginationQuery): Array<[string, string | undefined]> {
+  if (query.pagination !== "keyset") return [];
+  return [["pagination", "keyset"], ["cursor", query.cursor], ["total", query.total]];
+}
+
 function historyLogsPath(query: HistoryLogsQuery): string {
   return queryPath("/api/v1/logs", [
     ["page", query.page ?? 1], ["limit", query.limit ?? DEFAULT_LIST_LIMIT], ["search", query.search],
-    ["level", query.level], ["module", query.module], ["hours", query.hours]
+    ["level", query.level], ["module", query.module], ["hours", query.hours], ...keysetEntries(query)
   ]);
 }
 
 function accountChangeLogsPath(query: AccountChangeLogsQuery): string {
   return queryPath("/api/v1/account-change-logs", [
     ["page", query.page ?? 1], ["limit", query.limit ?? DEFAULT_LIST_LIMIT], ["search", query.search],
-    ["instance_id", query.instanceId], ["db_type", query.dbType], ["change_type", query.changeType], ["hours", query.hours]
+    ["instance_id", query.instanceId], ["db_type", query.dbType], ["change_type", query.changeType], ["hours", query.hours],
+    ...keysetEntries(query)
   ]);
 }
 
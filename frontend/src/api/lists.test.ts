@@ -37,6 +37,17 @@ describe("list api", () => {
     expect(result.items[0]?.name).toBe("mysql-prod");
   });
 
+  it("loads instances with keyset pagination", async () => {
+    const client = {
+      get: vi.fn().mockResolvedValueOnce({ items: [], total: null, page: 1, pages: 0, limit: 50, pagination: "keyset", next_cursor: null, has_more: false, total_mode: "none" })
+    };
+
+    const result = await fetchInstances({ limit: 50, pagination: "keyset", cursor: "abc", total: "none" }, client);
+
+    expect(client.get).toHaveBeenCalledWith("/api/v1/instances?page=1&limit=50&pagination=keyset&cursor=abc&total=none");
+    expect(result.has_more).toBe(false);
+  });
+
   it("loads a filtered page of database ledgers", async () => {
     const client = {
       get: vi.fn().mockResolvedValueOnce({ items: [{ id: 1, database_name: "app_db" }], total: 1, page: 1, limit: 20 })
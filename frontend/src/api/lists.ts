@@ -3,7 +3,13 @@ import { apiClient, type ApiClient } from "./client";
 type ApiReader = Pick<ApiClient, "get">;
 const DEFAULT_LIST_LIMIT = 200;
 
-export type PaginatedQuery = {
+export type KeysetPaginationQuery = {
+  pagination?: "offset" | "keyset";
+  cursor?: string;
+  total?: "exact" | "estimate" | "none";
+};
+
+export type PaginatedQuery = KeysetPaginationQuery & {
   page?: number;
   limit?: number;
   search?: string;
@@ -55,6 +61,10 @@ export type PaginatedList<TItem> = {
   page: number;
   pages?: number;
   limit: number;
+  pagination?: "offset" | "keyset";
+  next_cursor?: string | null;
+  has_more?: boolean;
+  total_mode?: "exact" | "estimate" | "none";
 };
 
 export type InstanceListItem = {
@@ -319,6 +329,13 @@ function firstPagePath(path: string, limit = DEFAULT_LIST_LIMIT): string {
   return `${path}?${params.toString()}`;
 }
 
+function keysetEntries(query: KeysetPaginationQuery): Array<[string, string | undefined]> {
+  if (query.pagination !== "keyset") {
+    return [];
+  }
+  return [["pagination", "keyset"], ["cursor", query.cursor], ["total", query.total]];
+}
+
 function queryPath(path: string, entries: Array<[string, string | number | boolean | string[] | undefined]>): string {
   const params = new URLSearchParams();
   entries.forEach(([key, value]) => {
@@ -338,7 +355,8 @@ export async function fetchInstances(query: InstanceListQuery = {}, client: ApiR
   return client.get<PaginatedList<InstanceListItem>>(queryPath("/api/v1/instances", [
     ["page", query.page ?? 1], ["limit", query.limit ?? 20], ["search", query.search], ["db_type", query.dbType],
     ["status", query.status], ["audit_status", query.auditStatus], ["managed_status", query.managedStatus],
-    ["backup_status", query.backupStatus], ["tags", query.tags], ["include_deleted", query.includeDeleted || undefined]
+    ["backup_status", query.backupStatus], ["tags", query.tags], ["include_deleted", query.includeDeleted || undefined],
+    ...keysetEntries(query)
   ]));
 }
 
@@ -369,7 +387,7 @@ export async function fetchAccountLedgers(query: AccountLedgerQuery = {}, client
     ["page", query.page ?? 1], ["limit", query.limit ?? 20], ["search", query.search], ["instance_id", query.instanceId],
     ["tags", query.tags], ["classification", query.classification], ["db_type", query.dbType], ["ad_status", query.adStatus],
     ["owner_type", query.ownerType], ["owner_id", query.ownerId], ["include_roles", query.includeRoles || undefined],
-    ["sort", "username"], ["order", "asc"]
+    ["sort", "username"], ["order", "asc"], ...keysetEntries(query)
   ]));
 }
 
@@ -13,10 +13,13 @@ import {
   fetchSqlServerClusterDetail,
   fetchCredentialsSnapshot,
   fetchPartitionsSnapshot,
+  fetchSchedulerExecutors,
+  fetchSchedulerLeader,
   fetchSchedulerSnapshot,
   fetchSchedulerJobDetail,
   fetchTaskRunDetail,
   fetchTaskRunErrorLogs,
+  fetchTaskRunPipeline,
   fetchSettingsSnapshot,
   fetchTaskRunsSnapshot,
   fetchTagBulkOptions,
@@ -288,6 +291,28 @@ describe("read-only api", () => {
     expect(job.trigger).toContain("cron");
   });
 
+  it("loads scheduler executor stats", async () => {
+    const client = {
+      get: vi.fn().mockResolvedValueOnce([{ name: "cpu-processes", type: "process", max_workers: 2, queue_depth: 1 }])
+    };
+
+    const executors = await fetchSchedulerExecutors(client);
+
+    expect(client.get).toHaveBeenCalledWith("/api/v1/scheduler/executors");
+    expect(executors[0]?.queue_depth).toBe(1);
+  });
+
+  it("loads scheduler leader status", async () => {
+    const client = {
+      get: vi.fn().mockResolvedValueOnce({ jobstore: "database", is_leader: false, leader_node_id: "web-1:17" })
+    };
+
+    const leader = await fetchSchedulerLeader(client);
+
+    expect(client.get).toHaveBeenCalledWith("/api/v1/scheduler/leader");
+    expect(leader.leader_node_id).toBe("web-1:17");
+  });
+
   it("loads sync session detail and error logs", async () => {
     const client = {
       get: vi
@@ -305,6 +330,22 @@ describe("read-only api", () => {
     expect(errors.error_count).toBe(1);
   });
 
+  it("loads task run pipeline critical path", async () => {
+    const client = {
+      get: vi.fn().mockResolvedValueOnce({
+        root_run_id: "r-1",
+        nodes: [{ run: { run_id: "r-1" }, depth: 0, duration_seconds: 60, wait_seconds: null, on_critical_path: true }],
+        critical_path: ["r-1"],
+        wall_clock_seconds: 60
+      })
+    };
+
+    const pipeline = await fetchTaskRunPipeline("r 1", client);
+
+    expect(client.get).toHaveBeenCalledWith("/api/v1/task-runs/r%201/pipeline");
+    expect(pipeline.critical_path).toEqual(["r-1"]);
+  });
+
   it("loads system administration snapshots", async () => {
     const client = {
       get: vi
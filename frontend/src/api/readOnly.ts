@@ -231,6 +231,30 @@ export type SchedulerJobItem = {
   is_builtin?: boolean;
   editable_fields?: string[];
   func?: string;
+  executor?: string | null;
+  max_instances?: number | null;
+};
+
+export type SchedulerExecutorStats = {
+  name: string;
+  type: string;
+  max_workers: number;
+  running: number;
+  queue_depth: number;
+  submitted_total: number;
+  completed_total: number;
+  failed_total: number;
+  avg_wait_seconds: number;
+  max_wait_seconds: number;
+  last_wait_seconds?: number | null;
+};
+
+export type SchedulerLeaderStatus = {
+  jobstore: string;
+  node_id?: string | null;
+  is_leader: boolean;
+  leader_node_id?: string | null;
+  leader_heartbeat_at?: string | null;
 };
 
 export type SchedulerSnapshot = {
@@ -242,7 +266,6 @@ export type SchedulerJobDetail = SchedulerJobItem & {
   args?: unknown;
   kwargs?: unknown;
   misfire_grace_time?: number | null;
-  max_instances?: number | null;
   coalesce?: boolean | null;
 };
 
@@ -260,6 +283,7 @@ export type TaskRunItem = {
   progress_completed: number;
   progress_failed: number;
   error_message?: string | null;
+  upstream_run_id?: string | null;
 };
 
 export type TaskRunChildItem = {
@@ -275,6 +299,7 @@ export type TaskRunChildItem = {
   error_message?: string | null;
   metrics_json?: Record<string, unknown> | null;
   details_json?: Record<string, unknown> | null;
+  claimed_by?: string | null;
 };
 
 export type TaskRunDetail = {
@@ -288,6 +313,21 @@ export type TaskRunErrorLogs = {
   error_count: number;
 };
 
+export type TaskRunPipelineNode = {
+  run: TaskRunItem;
+  depth: number;
+  duration_seconds?: number | null;
+  wait_seconds?: number | null;
+  on_critical_path: boolean;
+};
+
+export type TaskRunPipeline = {
+  root_run_id: string;
+  nodes: TaskRunPipelineNode[];
+  critical_path: string[];
+  wall_clock_seconds?: number | null;
+};
+
 export type TaskRunsQuery = {
   limit?: number;
   page?: number;
@@ -636,6 +676,14 @@ export function fetchSchedulerJobDetail(jobId: string, client: ApiReader = apiCl
   return client.get<SchedulerJobDetail>(`/api/v1/scheduler/jobs/${encodeURIComponent(jobId)}`);
 }
 
+export function fetchSchedulerExecutors(client: ApiReader = apiClient): Promise<SchedulerExecutorStats[]> {
+  return client.get<SchedulerExecutorStats[]>("/api/v1/scheduler/executors");
+}
+
+export function fetchSchedulerLeader(client: ApiReader = apiClient): Promise<SchedulerLeaderStatus> {
+  return client.get<SchedulerLeaderStatus>("/api/v1/scheduler/leader");
+}
+
 export async function fetchTaskRunsSnapshot(
   query: TaskRunsQuery = {},
   client: ApiReader = apiClient
@@ -661,6 +709,13 @@ export async function fetchTaskRunErrorLogs(
   return client.get<TaskRunErrorLogs>(`/api/v1/task-runs/${encodeURIComponent(runId)}/error-logs`);
 }
 
+export async function fetchTaskRunPipeline(
+  runId: string,
+  client: ApiReader = apiClient
+): Promise<TaskRunPipeline> {
+  return client.get<TaskRunPipeline>(`/api/v1/task-runs/${encodeURIComponent(runId)}/pipeline`);
+}
+
 export async function fetchUsersSnapshot(query: UsersListQuery = {}, client: ApiReader = apiClient): Promise<UsersSnapshot> {
   const [list, stats] = await Promise.all([
     client.get<PaginatedReadOnlyList<UserItem>>(queryPath("/api/v1/users", [
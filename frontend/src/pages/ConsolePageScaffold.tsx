@@ -156,6 +156,8 @@ export function schedulerStatusLabel(state: string | undefined | null): string {
       return "运行中";
     case "STATE_PAUSED":
       return "已暂停";
+    case "STATE_DEPENDENT":
+      return "依赖触发";
     case "STATE_ERROR":
       return "失败";
     default:
@@ -203,7 +205,14 @@ export function syncDuration(item: TaskRunItem): string {
   if (!Number.isFinite(started) || !Number.isFinite(completed) || completed < started) {
     return "-";
   }
-  const seconds = Math.round((completed - started) / 1000);
+  return formatDurationSeconds((completed - started) / 1000);
+}
+
+export function formatDurationSeconds(value: number | null | undefined): string {
+  if (value === null || value === undefined || !Number.isFinite(value) || value < 0) {
+    return "-";
+  }
+  const seconds = Math.round(value);
   if (seconds < 60) {
     return `${seconds}s`;
   }
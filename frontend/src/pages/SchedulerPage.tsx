@@ -139,7 +139,9 @@ import {
   fetchCredentialsSnapshot,
   fetchMySqlClusterDetail,
   fetchPartitionsSnapshot,
+  fetchSchedulerExecutors,
   fetchSchedulerJobDetail,
+  fetchSchedulerLeader,
   fetchSchedulerSnapshot,
   fetchSettingsSnapshot,
   fetchSqlServerAvailabilityGroupDashboard,
@@ -164,6 +166,8 @@ import {
   type MySqlClusterDetail,
   type PartitionMetricsFilters,
   type PartitionItem,
+  type SchedulerExecutorStats,
+  type SchedulerLeaderStatus,
   type SchedulerJobDetail,
   type SchedulerJobItem,
   type SettingsSnapshot,
@@ -196,6 +200,7 @@ import {
   asText,
   canManageCatalog,
   endpointHost,
+  formatDurationSeconds,
   formatNumber,
   formatPercent,
   isRunningState,
@@ -260,6 +265,8 @@ function SchedulerJobDetailDialog({
             <DetailBlock label="触发器"><span className="font-mono">{asText(detail.trigger ?? detail.trigger_type)}</span></DetailBlock>
             <DetailBlock label="下次运行"><span className="font-mono">{detail.next_run_time ? formatDateTime(detail.next_run_time) : "未计划"}</span></DetailBlock>
             <DetailBlock label="上次运行"><span className="font-mono">{detail.last_run_time ? formatDateTime(detail.last_run_time) : "从未运行"}</span></DetailBlock>
+            <DetailBlock label="执行器"><span className="font-mono">{asText(detail.executor)}</span></DetailBlock>
+            <DetailBlock label="最大并发实例"><span className="font-mono">{asText(detail.max_instances)}</span></DetailBlock>
           </div>
         ) : null}
       </DialogContent>
@@ -419,6 +426,14 @@ function SchedulerJobFormDialog({
 }
 
 
+function isDependentJob(job: SchedulerJobItem): boolean {
+  return job.state === "STATE_DEPENDENT";
+}
+
+function isActiveSchedulerJob(job: SchedulerJobItem): boolean {
+  return isRunningState(job.state) || isDependentJob(job);
+}
+
 function SchedulerJobCard({
   job,
   onEdit,
@@ -440,7 +455,7 @@ function SchedulerJobCard({
             <h3 className="truncate text-base font-semibold">{name}</h3>
             <p className="mt-1 font-mono text-xs text-muted-foreground">{job.func ?? job.trigger_type ?? "-"}</p>
           </div>
-          <Badge variant={isRunningState(job.state) ? "secondary" : "outline"}>{schedulerStatusLabel(job.state)}</Badge>
+          <Badge variant={isActiveSchedulerJob(job) ? "secondary" : "outline"}>{schedulerStatusLabel(job.state)}</Badge>
         </div>
         <dl className="grid gap-3 text-sm">
           <div className="flex items-center justify-between gap-3">
@@ -455,9 +470,13 @@ function SchedulerJobCard({
             <dt className="text-muted-foreground">任务 ID</dt>
             <dd className="font-mono text-xs">{job.task_id ?? job.id}</dd>
           </div>
+          <div className="flex items-center justify-between gap-3">
+            <dt className="text-muted-foreground">执行器</dt>
+            <dd className="font-mono text-xs">{job.executor ?? "-"}</dd>
+          </div>
         </dl>
         <div className="flex flex-wrap items-center gap-1">
-          {isRunningState(job.state) ? (
+          {isDependentJob(job) ? null : isRunningState(job.state) ? (
             <Button
               aria-label={`暂停任务 ${name}`}
               onClick={() => {
@@ -539,15 +558,80 @@ function SchedulerJobSection({
   );
 }
 
+function formatWaitSeconds(value: number | null | undefined): string {
+  if (value === null || value === undefined || !Number.isFinite(value)) {
+    return "-";
+  }
+  return value < 60 ? `${value.toFixed(2)}s` : formatDurationSeconds(value);
+}
+
+function SchedulerExecutorsPanel({ executors }: { executors: SchedulerExecutorStats[] }) {
+  return (
+    <ListPanel title="执行器" description="按并发类别展示执行中、排队深度与排队等待时间（自调度器启动起累计）。" count={executors.length}>
+      <Table>
+        <TableHeader>
+          <TableRow>
+            <TableHead>执行器</TableHead>
+            <TableHead>类型</TableHead>
+            <TableHead className="text-right">执行中 / 上限</TableHead>
+            <TableHead className="text-right">排队</TableHead>
+            <TableHead className="text-right">提交 / 成功 / 失败</TableHead>
+            <TableHead className="text-right">平均等待</TableHead>
+            <TableHead className="text-right">最大等待</TableHead>
+            <TableHead className="text-right">最近等待</TableHead>
+          </TableRow>
+        </TableHeader>
+        <TableBody>
+          {executors.map((executor) => (
+            <TableRow key={executor.name}>
+              <TableCell className="font-mono text-xs">{executor.name}</TableCell>
+              <TableCell>
+                <Badge variant="outline">{executor.type === "process" ? "进程池" : "线程池"}</Badge>
+              </TableCell>
+              <TableCell className="text-right font-mono text-xs">
+                {formatNumber(executor.running)} / {formatNumber(executor.max_workers)}
+              </TableCell>
+              <TableCell className="text-right">
+                <Badge variant={executor.queue_depth > 0 ? "secondary" : "outline"}>{formatNumber(executor.queue_depth)}</Badge>
+              </TableCell>
+              <TableCell className="text-right font-mono text-xs">
+                {formatNumber(executor.submitted_total)} / {formatNumber(executor.completed_total)} / {formatNumber(executor.failed_total)}
+              </TableCell>
+              <TableCell className="text-right font-mono text-xs">{formatWaitSeconds(executor.avg_wait_seconds)}</TableCell>
+              <TableCell className="text-right font-mono text-xs">{formatWaitSeconds(executor.max_wait_seconds)}</TableCell>
+              <TableCell className="text-right font-mono text-xs">{formatWaitSeconds(executor.last_wait_seconds)}</TableCell>
+            </TableRow>
+          ))}
+        </TableBody>
+      </Table>
+    </ListPanel>
+  );
+}
+
+function SchedulerLeaderNotice({ leader }: { leader: SchedulerLeaderStatus }) {
+  return (
+    <Alert>
+      <AlertDescription>
+        共享 jobstore（多节点）：主节点 <span className="font-mono">{leader.leader_node_id ?? "选举中"}</span>
+        {leader.leader_heartbeat_at ? <>，最近心跳 <span className="font-mono">{formatDateTime(leader.leader_heartbeat_at)}</span></> : null}
+        ；当前节点 <span className="font-mono">{leader.node_id ?? "-"}</span>
+        {leader.is_leader ? "（主节点，负责执行任务）" : "（备用节点，立即执行将派发至主节点）"}
+      </AlertDescription>
+    </Alert>
+  );
+}
 
 export function SchedulerPage() {
   const query = useQuery({ queryKey: ["read-only", "scheduler"], queryFn: () => fetchSchedulerSnapshot() });
+  const executorsQuery = useQuery({ queryKey: ["read-only", "scheduler-executors"], queryFn: () => fetchSchedulerExecutors() });
+  const leaderQuery = useQuery({ queryKey: ["read-only", "scheduler-leader"], queryFn: () => fetchSchedulerLeader() });
   const [editingJob, setEditingJob] = useState<SchedulerJobItem | null>(null);
   const [viewingJob, setViewingJob] = useState<SchedulerJobItem | null>(null);
 
   return (
     <main className="grid max-w-[var(--layout-max-width-wide)] gap-[var(--page-spacing-dense)] p-5">
       <PageHeader eyebrow="Automation jobs" title="定时任务" description="只读展示调度任务和运行状态，暂停、恢复、立即执行仍保留在旧版。" />
+      {leaderQuery.data?.jobstore === "database" ? <SchedulerLeaderNotice leader={leaderQuery.data} /> : null}
       <QueryFrame data={query.data} isLoading={query.isLoading} isError={query.isError} errorLabel="定时任务" onRetry={() => void query.refetch()}>
         {(snapshot) => (
             <ListPanel
@@ -571,14 +655,14 @@ export function SchedulerPage() {
               <div className="grid gap-6">
                 <SchedulerJobSection
                   title="运行中的任务"
-                  jobs={snapshot.jobs.filter((job) => isRunningState(job.state))}
+                  jobs={snapshot.jobs.filter(isActiveSchedulerJob)}
                   onEdit={setEditingJob}
                   onJobChanged={() => void query.refetch()}
                   onView={setViewingJob}
                 />
                 <SchedulerJobSection
                   title="已暂停的任务"
-                  jobs={snapshot.jobs.filter((job) => !isRunningState(job.state))}
+                  jobs={snapshot.jobs.filter((job) => !isActiveSchedulerJob(job))}
                   onEdit={setEditingJob}
                   onJobChanged={() => void query.refetch()}
                   onView={setViewingJob}
@@ -587,6 +671,7 @@ export function SchedulerPage() {
             </ListPanel>
         )}
       </QueryFrame>
+      {executorsQuery.data && executorsQuery.data.length > 0 ? <SchedulerExecutorsPanel executors={executorsQuery.data} /> : null}
       <SchedulerJobDetailDialog
         item={viewingJob}
         onOpenChange={(open) => {
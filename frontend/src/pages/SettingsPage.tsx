@@ -933,6 +933,9 @@ function SettingsEditor({ onRefresh, snapshot }: { onRefresh: () => void; snapsh
                 <Button onClick={() => void runAction(syncVeeam(), { success: "Veeam 同步已触发" }).then(onRefresh)} size="sm" type="button">
                   同步 Veeam 备份
                 </Button>
+                <Button onClick={() => void runAction(syncVeeam(undefined, { fullResync: true }), { success: "Veeam 全量同步已触发" }).then(onRefresh)} size="sm" type="button" variant="outline">
+                  全量重新同步
+                </Button>
               </div>
             </SettingsSubsection>
           </SettingsCard>
@@ -148,6 +148,7 @@ import {
   fetchSqlServerClusterDetail,
   fetchTaskRunDetail,
   fetchTaskRunErrorLogs,
+  fetchTaskRunPipeline,
   fetchTaskRunsSnapshot,
   fetchTagBulkOptions,
   fetchTagsSnapshot,
@@ -175,6 +176,7 @@ import {
   type TaskRunDetail,
   type TaskRunErrorLogs,
   type TaskRunItem,
+  type TaskRunPipeline,
   type TagBulkOptions,
   type TagItem,
   type TagOptionItem,
@@ -201,6 +203,7 @@ import {
   asText,
   canManageCatalog,
   endpointHost,
+  formatDurationSeconds,
   formatNumber,
   formatPercent,
   isRunningState,
@@ -383,6 +386,37 @@ function SyncSessionRecordTable({
   );
 }
 
+function SyncPipelineTimeline({ pipeline }: { pipeline: TaskRunPipeline }) {
+  return (
+    <section className="grid gap-2 rounded-md border p-3">
+      <div className="flex items-center justify-between gap-2 text-sm">
+        <span className="font-medium">依赖流水线</span>
+        <span className="font-mono text-xs text-muted-foreground">
+          总耗时 {formatDurationSeconds(pipeline.wall_clock_seconds)} · 关键路径 {pipeline.critical_path.length} 步
+        </span>
+      </div>
+      <ol className="grid gap-1">
+        {pipeline.nodes.map((node) => (
+          <li
+            className={`flex items-center justify-between gap-2 rounded-md px-2 py-1 text-sm ${node.on_critical_path ? "bg-secondary/40" : ""}`}
+            key={node.run.run_id}
+            style={{ paddingLeft: `${0.5 + node.depth * 1.25}rem` }}
+          >
+            <div className="flex min-w-0 items-center gap-2">
+              <span className="truncate">{syncTaskName(node.run)}</span>
+              <StatusBadge value={node.run.status} />
+              {node.on_critical_path ? <Badge variant="outline">关键路径</Badge> : null}
+            </div>
+            <span className="shrink-0 font-mono text-xs text-muted-foreground">
+              等待 {formatDurationSeconds(node.wait_seconds)} · 执行 {formatDurationSeconds(node.duration_seconds)}
+            </span>
+          </li>
+        ))}
+      </ol>
+    </section>
+  );
+}
+
 function SyncSessionDetailDialog({
   onOpenChange,
   open,
@@ -412,7 +446,18 @@ function SyncSessionDetailDialog({
       return fetchTaskRunErrorLogs(sessionId);
     }
   });
+  const pipelineQuery = useQuery<TaskRunPipeline>({
+    enabled: open && sessionId !== null,
+    queryKey: ["read-only", "sync-session-pipeline", sessionId],
+    queryFn: () => {
+      if (sessionId === null) {
+        throw new Error("Missing sync session id");
+      }
+      return fetchTaskRunPipeline(sessionId);
+    }
+  });
   const session = detailQuery.data?.run;
+  const pipeline = pipelineQuery.data;
   const progress = session ? syncProgress(session) : null;
   const progressPercent = progress?.percent ?? 0;
   const errorRecords = errorsQuery.data?.items ?? [];
@@ -480,6 +525,7 @@ function SyncSessionDetailDialog({
               </div>
               <Progress value={progressPercent} />
             </div>
+            {pipeline && pipeline.nodes.length > 1 ? <SyncPipelineTimeline pipeline={pipeline} /> : null}
             <SyncSessionRecordTable emptyLabel="暂无实例执行记录" records={detailQuery.data?.items ?? []} title="实例执行记录" />
             <SyncSessionRecordTable emptyLabel="暂无错误日志" records={errorRecords} title="错误日志" />
           </div>
@@ -514,7 +560,7 @@ export function SyncSessionsPage() {
                 data={snapshot.items}
                 filters={[
                   { columnId: "trigger_source", label: "来源", options: [{ label: "定时", value: "scheduled" }, { label: "手动", value: "manual" }, { label: "API", value: "api" }], value: table.filters.triggerSource, onValueChange: (value) => table.setFilter("triggerSource", value) },
-                  { columnId: "task_category", label: "分类", options: [{ label: "账户", value: "account" }, { label: "容量", value: "capacity" }, { label: "聚合", value: "aggregation" }, { label: "分类", value: "classification" }, { label: "群集", value: "cluster" }, { label: "告警", value: "notification" }, { label: "其他", value: "other" }], value: table.filters.taskCategory, onValueChange: (value) => table.setFilter("taskCategory", value) },
+                  { columnId: "task_category", label: "分类", options: [{ label: "账户", value: "account" }, { label: "容量", value: "capacity" }, { label: "聚合", value: "aggregation" }, { label: "分类", value: "classification" }, { label: "群集", value: "cluster" }, { label: "告警", value: "notification" }, { label: "导出", value: "export" }, { label: "其他", value: "other" }], value: table.filters.taskCategory, onValueChange: (value) => table.setFilter("taskCategory", value) },
                   { columnId: "status", label: "状态", options: [{ label: "运行中", value: "running" }, { label: "已完成", value: "completed" }, { label: "部分完成", value: "partial" }, { label: "失败", value: "failed" }, { label: "已取消", value: "cancelled" }], value: table.filters.status, onValueChange: (value) => table.setFilter("status", value) }
                 ]}
                 onResetFilters={table.reset}
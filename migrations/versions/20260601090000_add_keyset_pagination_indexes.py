@@ -0,0 +1,27 @@
+"""add keyset pagination indexes.
+
+Revision ID: 20260601090000
+Revises: 20260528100000
+Create Date: 2026-06-01 09:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "20260601090000"
+down_revision = "20260528100000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("idx_unified_logs_timestamp_id", "unified_logs", ["timestamp", "id"])
+    op.create_index("idx_account_change_log_time_id", "account_change_log", ["change_time", "id"])
+    op.create_index("idx_account_permission_username_id", "account_permission", ["username", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_account_permission_username_id", table_name="account_permission")
+    op.drop_index("idx_account_change_log_time_id", table_name="account_change_log")
+    op.drop_index("idx_unified_logs_timestamp_id", table_name="unified_logs")
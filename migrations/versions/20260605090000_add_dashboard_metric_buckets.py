@@ -0,0 +1,63 @@
+"""Add dashboard metric hourly buckets.
+
+Revision ID: 20260605090000
+Revises: 20260601090000
+Create Date: 2026-06-05
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20260605090000"
+down_revision = "20260601090000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Execute upgrade migration."""
+    op.create_table(
+        "dashboard_metric_buckets",
+        sa.Column("id", sa.BigInteger(), primary_key=True, nullable=False),
+        sa.Column("metric", sa.String(length=32), nullable=False),
+        sa.Column("dimension", sa.String(length=64), nullable=False, server_default=""),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.UniqueConstraint("metric", "dimension", "bucket_start", name="uq_dashboard_metric_buckets_key"),
+    )
+    op.create_index(
+        "ix_dashboard_metric_buckets_metric_start",
+        "dashboard_metric_buckets",
+        ["metric", "bucket_start"],
+    )
+
+    # 以历史明细回填小时桶, 之后由写入方增量维护.
+    op.execute(
+        """
+        INSERT INTO dashboard_metric_buckets (metric, dimension, bucket_start, count, updated_at)
+        SELECT 'log_level', level::text, date_trunc('hour', timestamp AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+               COUNT(*), now()
+        FROM unified_logs
+        GROUP BY 2, 3
+        """,
+    )
+    op.execute(
+        """
+        INSERT INTO dashboard_metric_buckets (metric, dimension, bucket_start, count, updated_at)
+        SELECT 'sync_session', sync_category, date_trunc('hour', created_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+               COUNT(*), now()
+        FROM sync_sessions
+        WHERE created_at IS NOT NULL
+        GROUP BY 2, 3
+        """,
+    )
+
+
+def downgrade() -> None:
+    """Execute downgrade migration."""
+    op.drop_index("ix_dashboard_metric_buckets_metric_start", table_name="dashboard_metric_buckets")
+    op.drop_table("dashboard_metric_buckets")
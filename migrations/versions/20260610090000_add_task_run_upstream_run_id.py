@@ -0,0 +1,26 @@
+"""add task_runs.upstream_run_id for dependency pipelines.
+
+Revision ID: 20260610090000
+Revises: 20260605090000
+Create Date: 2026-06-10 09:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20260610090000"
+down_revision = "20260605090000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("task_runs", sa.Column("upstream_run_id", sa.String(length=36), nullable=True))
+    op.create_index("ix_task_runs_upstream_run_id", "task_runs", ["upstream_run_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_task_runs_upstream_run_id", table_name="task_runs")
+    op.drop_column("task_runs", "upstream_run_id")
@@ -0,0 +1,42 @@
+"""add shared scheduler jobstore and leader lease tables.
+
+Revision ID: 20260615090000
+Revises: 20260610090000
+Create Date: 2026-06-15 09:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20260615090000"
+down_revision = "20260610090000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 与 APScheduler SQLAlchemyJobStore 的表结构一致(SCHEDULER_JOBSTORE=database 时使用)
+    op.create_table(
+        "apscheduler_jobs",
+        sa.Column("id", sa.Unicode(length=191), primary_key=True),
+        sa.Column("next_run_time", sa.Float(precision=25), nullable=True),
+        sa.Column("job_state", sa.LargeBinary(), nullable=False),
+    )
+    op.create_index("ix_apscheduler_jobs_next_run_time", "apscheduler_jobs", ["next_run_time"])
+
+    op.create_table(
+        "scheduler_leader_leases",
+        sa.Column("name", sa.String(length=64), primary_key=True),
+        sa.Column("node_id", sa.String(length=255), nullable=False),
+        sa.Column("backend_pid", sa.Integer(), nullable=False),
+        sa.Column("acquired_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("heartbeat_at", sa.DateTime(timezone=True), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("scheduler_leader_leases")
+    op.drop_index("ix_apscheduler_jobs_next_run_time", table_name="apscheduler_jobs")
+    op.drop_table("apscheduler_jobs")
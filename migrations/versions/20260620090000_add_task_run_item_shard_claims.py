@@ -0,0 +1,33 @@
+"""add shard claim columns to task_run_items.
+
+Revision ID: 20260620090000
+Revises: 20260615090000
+Create Date: 2026-06-20 09:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20260620090000"
+down_revision = "20260615090000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("task_run_items", sa.Column("claimed_by", sa.String(length=255), nullable=True))
+    op.add_column("task_run_items", sa.Column("heartbeat_at", sa.DateTime(timezone=True), nullable=True))
+    op.add_column(
+        "task_run_items",
+        sa.Column("claim_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+    op.create_index("ix_task_run_items_status_heartbeat_at", "task_run_items", ["status", "heartbeat_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_task_run_items_status_heartbeat_at", table_name="task_run_items")
+    op.drop_column("task_run_items", "claim_count")
+    op.drop_column("task_run_items", "heartbeat_at")
+    op.drop_column("task_run_items", "claimed_by")
@@ -0,0 +1,57 @@
+"""add veeam backup object watermarks.
+
+Revision ID: 20260625090000
+Revises: 20260620090000
+Create Date: 2026-06-25 09:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20260625090000"
+down_revision = "20260620090000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "veeam_backup_object_watermarks",
+        sa.Column("id", sa.Integer(), primary_key=True, nullable=False),
+        sa.Column(
+            "source_binding_id",
+            sa.Integer(),
+            sa.ForeignKey("veeam_source_bindings.id"),
+            nullable=False,
+        ),
+        sa.Column("backup_object_id", sa.String(length=255), nullable=False),
+        sa.Column("machine_name", sa.String(length=255), nullable=True),
+        sa.Column("latest_restore_point_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("latest_restore_point_id", sa.String(length=255), nullable=True),
+        sa.Column("backup_id", sa.String(length=255), nullable=True),
+        sa.Column("latest_backup_file_id", sa.String(length=255), nullable=True),
+        sa.Column("full_synced_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.Column("sync_run_id", sa.String(length=64), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.UniqueConstraint(
+            "source_binding_id",
+            "backup_object_id",
+            name="uq_veeam_watermark_source_backup_object",
+        ),
+    )
+    op.create_index(
+        "ix_veeam_backup_object_watermarks_source_binding_id",
+        "veeam_backup_object_watermarks",
+        ["source_binding_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_veeam_backup_object_watermarks_source_binding_id",
+        table_name="veeam_backup_object_watermarks",
+    )
+    op.drop_table("veeam_backup_object_watermarks")
@@ -0,0 +1,92 @@
+"""add veeam instance backup matches.
+
+Revision ID: 20260701090000
+Revises: 20260625090000
+Create Date: 2026-07-01 09:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "20260701090000"
+down_revision = "20260625090000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "veeam_instance_backup_matches",
+        sa.Column("id", sa.Integer(), primary_key=True, nullable=False),
+        sa.Column(
+            "instance_id",
+            sa.Integer(),
+            sa.ForeignKey("instances.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "source_binding_id",
+            sa.Integer(),
+            sa.ForeignKey("veeam_source_bindings.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "snapshot_id",
+            sa.Integer(),
+            sa.ForeignKey("veeam_machine_backup_snapshots.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "name_candidates",
+            sa.JSON().with_variant(postgresql.JSONB(), "postgresql"),
+            nullable=False,
+            server_default=sa.text("'[]'"),
+        ),
+        sa.Column(
+            "ip_candidates",
+            sa.JSON().with_variant(postgresql.JSONB(), "postgresql"),
+            nullable=False,
+            server_default=sa.text("'[]'"),
+        ),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.UniqueConstraint(
+            "instance_id",
+            "source_binding_id",
+            name="uq_veeam_instance_backup_match_instance_source",
+        ),
+    )
+    op.create_index(
+        "ix_veeam_instance_backup_matches_instance_id",
+        "veeam_instance_backup_matches",
+        ["instance_id"],
+    )
+    op.create_index(
+        "ix_veeam_instance_backup_matches_source_binding_id",
+        "veeam_instance_backup_matches",
+        ["source_binding_id"],
+    )
+    op.create_index(
+        "ix_veeam_instance_backup_matches_snapshot_id",
+        "veeam_instance_backup_matches",
+        ["snapshot_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_veeam_instance_backup_matches_snapshot_id",
+        table_name="veeam_instance_backup_matches",
+    )
+    op.drop_index(
+        "ix_veeam_instance_backup_matches_source_binding_id",
+        table_name="veeam_instance_backup_matches",
+    )
+    op.drop_index(
+        "ix_veeam_instance_backup_matches_instance_id",
+        table_name="veeam_instance_backup_matches",
+    )
+    op.drop_table("veeam_instance_backup_matches")
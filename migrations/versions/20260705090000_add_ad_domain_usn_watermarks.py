@@ -0,0 +1,38 @@
+"""add ad domain usn watermarks.
+
+Revision ID: 20260705090000
+Revises: 20260701090000
+Create Date: 2026-07-05 09:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "20260705090000"
+down_revision = "20260701090000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "ad_domain_configs",
+        sa.Column(
+            "usn_watermarks",
+            sa.JSON().with_variant(postgresql.JSONB(), "postgresql"),
+            nullable=False,
+            server_default=sa.text("'{}'"),
+        ),
+    )
+    op.add_column(
+        "ad_domain_configs",
+        sa.Column("last_full_sync_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("ad_domain_configs", "last_full_sync_at")
+    op.drop_column("ad_domain_configs", "usn_watermarks")
@@ -0,0 +1,32 @@
+"""add account permission fingerprint.
+
+Revision ID: 20260710090000
+Revises: 20260705090000
+Create Date: 2026-07-10 09:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20260710090000"
+down_revision = "20260705090000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "account_permission",
+        sa.Column("permission_fingerprint", sa.String(length=64), nullable=True),
+    )
+    op.add_column(
+        "account_permission",
+        sa.Column("permission_full_synced_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("account_permission", "permission_full_synced_at")
+    op.drop_column("account_permission", "permission_fingerprint")
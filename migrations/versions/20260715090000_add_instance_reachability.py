@@ -0,0 +1,54 @@
+"""add instance reachability.
+
+Revision ID: 20260715090000
+Revises: 20260710090000
+Create Date: 2026-07-15 09:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "20260715090000"
+down_revision = "20260710090000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "instance_reachability",
+        sa.Column("id", sa.Integer(), primary_key=True, nullable=False),
+        sa.Column(
+            "instance_id",
+            sa.Integer(),
+            sa.ForeignKey("instances.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("status", sa.String(length=16), nullable=False, server_default="unknown"),
+        sa.Column("last_checked_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_up_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_down_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_latency_ms", sa.Float(), nullable=True),
+        sa.Column("last_error", sa.String(length=255), nullable=True),
+        sa.Column("consecutive_failures", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "recent_samples",
+            sa.JSON().with_variant(postgresql.JSONB(), "postgresql"),
+            nullable=False,
+            server_default=sa.text("'[]'"),
+        ),
+        sa.Column("availability_ratio", sa.Float(), nullable=True),
+        sa.Column("avg_latency_ms", sa.Float(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.UniqueConstraint("instance_id", name="uq_instance_reachability_instance_id"),
+    )
+    op.create_index("ix_instance_reachability_status", "instance_reachability", ["status"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_instance_reachability_status", table_name="instance_reachability")
+    op.drop_table("instance_reachability")
@@ -0,0 +1,38 @@
+"""make account_change_log.change_time not null.
+
+Revision ID: 20260720090000
+Revises: 20260715090000
+Create Date: 2026-07-20 09:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20260720090000"
+down_revision = "20260715090000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # keyset 分页按 (change_time, id) 排序, 列非空时 idx_account_change_log_time_id 可直接提供顺序
+    op.execute("UPDATE account_change_log SET change_time = to_timestamp(0) WHERE change_time IS NULL")
+    op.alter_column(
+        "account_change_log",
+        "change_time",
+        existing_type=sa.DateTime(timezone=True),
+        existing_server_default=sa.text("now()"),
+        nullable=False,
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "account_change_log",
+        "change_time",
+        existing_type=sa.DateTime(timezone=True),
+        existing_server_default=sa.text("now()"),
+        nullable=True,
+    )
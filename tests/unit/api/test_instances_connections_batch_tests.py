@@ -8,12 +8,18 @@ from app.api.v1.namespaces import instances_connections as instances_connections
 @pytest.mark.unit
 def test_execute_batch_tests_marks_instance_failed_when_test_raises(monkeypatch) -> None:
     class DummyInstance:
-        def __init__(self, name: str) -> None:
+        def __init__(self, instance_id: int, name: str) -> None:
+            self.id = instance_id
             self.name = name
+            self.db_type = "mysql"
+            self.host = "127.0.0.1"
+            self.port = 3306
+            self.database_name = None
+            self.credential = None
 
     class DummyDetailService:
         def get_instance_by_id(self, instance_id: int):
-            return DummyInstance(name=f"instance-{instance_id}")
+            return DummyInstance(instance_id, name=f"instance-{instance_id}")
 
     class DummyConnTestService:
         def test_connection(self, _instance):
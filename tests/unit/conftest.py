@@ -6,6 +6,8 @@
 
 import pytest
 
+from app.utils.credential_secret_cache import credential_secret_cache
+
 
 @pytest.fixture(autouse=True)
 def _unit_test_env(monkeypatch):
@@ -20,3 +22,5 @@ def _unit_test_env(monkeypatch):
     monkeypatch.delenv("CACHE_REDIS_URL", raising=False)
     # Block `.env` from injecting an invalid key; let PasswordManager fall back to a temp key.
     monkeypatch.setenv("PASSWORD_ENCRYPTION_KEY", "")
+    # 进程级凭据明文缓存跨用例共享, 每个用例从空缓存开始
+    credential_secret_cache.clear()
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import json
+import ssl
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.error import HTTPError, URLError
+from urllib.request import Request
+
+import pytest
+
+from app.infra.http_connection_pool import HttpConnectionPool, SslContextCache
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections: set[tuple[str, int]] = set()
+    tunnels: list[tuple[str, str | None]] = []
+
+    def do_GET(self) -> None:
+        type(self).connections.add(self.client_address)
+        if self.path.startswith("/redirect"):
+            self.send_response(302)
+            self.send_header("Location", "/items?page=redirected")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        status = 429 if self.path.startswith("/throttled") else 200
+        body = json.dumps(
+            {
+                "path": self.path,
+                "host": self.headers.get("Host"),
+                "proxy_authorization": self.headers.get("Proxy-Authorization"),
+            },
+        ).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if status == 429:
+            self.send_header("Retry-After", "3")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_CONNECT(self) -> None:
+        # 记录隧道目标后关闭连接, 客户端随后的 TLS 握手失败
+        type(self).tunnels.append((self.path, self.headers.get("Proxy-Authorization")))
+        self.send_response(200)
+        self.end_headers()
+        self.close_connection = True
+
+    def log_message(self, format: str, *args: object) -> None:
+        del format, args
+
+
+@pytest.fixture
+def http_server(monkeypatch):
+    for name in ("http_proxy", "https_proxy", "no_proxy", "HTTP_PROXY", "HTTPS_PROXY", "NO_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+    _KeepAliveHandler.connections = set()
+    _KeepAliveHandler.tunnels = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.unit
+def test_connection_pool_reuses_keep_alive_connection(http_server: str) -> None:
+    pool = HttpConnectionPool(max_idle_per_host=2)
+    context = ssl.create_default_context()
+
+    payloads = []
+    for page in range(3):
+        with pool(Request(f"{http_server}/items?page={page}"), timeout=5, context=context) as response:
+            payloads.append(json.loads(response.read()))
+    pool.close()
+
+    assert [payload["path"] for payload in payloads] == ["/items?page=0", "/items?page=1", "/items?page=2"]
+    assert len(_KeepAliveHandler.connections) == 1
+
+
+@pytest.mark.unit
+def test_connection_pool_raises_http_error_with_retry_after(http_server: str) -> None:
+    pool = HttpConnectionPool()
+
+    with pytest.raises(HTTPError) as exc_info:
+        pool(Request(f"{http_server}/throttled"), timeout=5, context=ssl.create_default_context())
+    pool.close()
+
+    assert exc_info.value.code == 429
+    assert exc_info.value.headers["Retry-After"] == "3"
+
+
+@pytest.mark.unit
+def test_ssl_context_cache_reuses_context_per_verify_policy() -> None:
+    cache = SslContextCache()
+
+    verified = cache.get(True)
+    unverified = cache.get(False)
+
+    assert cache.get(True) is verified
+    assert cache.get(False) is unverified
+    assert verified.verify_mode == ssl.CERT_REQUIRED
+    assert unverified.verify_mode == ssl.CERT_NONE
+
+
+@pytest.mark.unit
+def test_connection_pool_follows_redirects_like_urlopen(http_server: str) -> None:
+    pool = HttpConnectionPool(proxies={})
+
+    response = pool(Request(f"{http_server}/redirect"), timeout=5, context=ssl.create_default_context())
+    payload = json.loads(response.read())
+    pool.close()
+
+    assert response.status == 200
+    assert payload["path"] == "/items?page=redirected"
+
+
+@pytest.mark.unit
+def test_connection_pool_sends_http_requests_through_proxy(http_server: str) -> None:
+    proxy_url = http_server.replace("http://", "http://user:secret@")
+    pool = HttpConnectionPool(proxies={"http": proxy_url})
+
+    response = pool(Request("http://veeam.invalid:9419/items"), timeout=5, context=ssl.create_default_context())
+    payload = json.loads(response.read())
+    pool.close()
+
+    assert payload["path"] == "http://veeam.invalid:9419/items"
+    assert payload["host"] == "veeam.invalid:9419"
+    assert payload["proxy_authorization"] == "Basic dXNlcjpzZWNyZXQ="
+
+
+@pytest.mark.unit
+def test_connection_pool_skips_proxy_for_no_proxy_hosts(monkeypatch, http_server: str) -> None:
+    monkeypatch.setenv("no_proxy", "127.0.0.1")
+    pool = HttpConnectionPool(proxies={"http": "http://127.0.0.1:9"})
+
+    response = pool(Request(f"{http_server}/items"), timeout=5, context=ssl.create_default_context())
+    payload = json.loads(response.read())
+    pool.close()
+
+    assert payload["path"] == "/items"
+
+
+@pytest.mark.unit
+def test_connection_pool_tunnels_https_through_proxy(http_server: str) -> None:
+    proxy_url = http_server.replace("http://", "http://user:secret@")
+    pool = HttpConnectionPool(proxies={"https": proxy_url})
+
+    with pytest.raises(URLError):
+        pool(Request("https://veeam.invalid:9419/items"), timeout=5, context=ssl.create_default_context())
+    pool.close()
+
+    assert _KeepAliveHandler.tunnels == [("veeam.invalid:9419", "Basic dXNlcjpzZWNyZXQ=")]
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import math
+import threading
+from datetime import UTC, datetime
+
+import pytest
+from apscheduler.events import EVENT_JOB_EXECUTED
+from apscheduler.schedulers.background import BackgroundScheduler
+
+from app.infra.scheduler_executors import ExecutorStatsCollector, build_executor
+
+
+@pytest.mark.unit
+def test_executor_stats_collector_reports_queue_depth_and_wait() -> None:
+    stats = ExecutorStatsCollector(name="io-threads", executor_type="thread", max_workers=2)
+
+    for _ in range(3):
+        stats.on_submit()
+    queued = stats.snapshot()
+    stats.on_finish(wait_seconds=0.2, failed=False)
+    stats.on_finish(wait_seconds=1.0, failed=True)
+    stats.on_finish(wait_seconds=None, failed=True)
+    drained = stats.snapshot()
+
+    assert (queued.running, queued.queue_depth, queued.submitted_total) == (2, 1, 3)
+    assert (drained.running, drained.queue_depth) == (0, 0)
+    assert (drained.completed_total, drained.failed_total) == (1, 2)
+    assert math.isclose(drained.avg_wait_seconds, 0.6)
+    assert math.isclose(drained.max_wait_seconds, 1.0)
+    assert drained.last_wait_seconds is not None
+    assert math.isclose(drained.last_wait_seconds, 1.0)
+
+
+def _blocking_job(gate: threading.Event) -> str:
+    gate.wait(timeout=5)
+    return "ok"
+
+
+@pytest.mark.unit
+def test_instrumented_thread_executor_tracks_jobs_through_scheduler() -> None:
+    executor = build_executor(name="io-threads", executor_type="thread", max_workers=1)
+    scheduler = BackgroundScheduler(executors={"default": executor}, timezone="UTC")
+    gate = threading.Event()
+    finished = threading.Semaphore(0)
+    scheduler.add_listener(lambda _event: finished.release(), EVENT_JOB_EXECUTED)
+    scheduler.start()
+    try:
+        for index in range(2):
+            scheduler.add_job(_blocking_job, "date", run_date=datetime.now(UTC), args=[gate], id=f"job-{index}")
+        for _ in range(50):
+            if executor.stats.snapshot().submitted_total == 2:
+                break
+            threading.Event().wait(0.05)
+        busy = executor.stats.snapshot()
+        gate.set()
+        assert finished.acquire(timeout=5)
+        assert finished.acquire(timeout=5)
+    finally:
+        scheduler.shutdown()
+
+    done = executor.stats.snapshot()
+    assert (busy.running, busy.queue_depth) == (1, 1)
+    assert (done.completed_total, done.failed_total, done.queue_depth) == (2, 0, 0)
+    assert done.last_wait_seconds is not None
+    assert done.max_wait_seconds >= done.avg_wait_seconds >= 0
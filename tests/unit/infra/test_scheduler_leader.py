@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from itertools import count
+from typing import cast
+
+import pytest
+from sqlalchemy.engine import Connection, Engine
+
+from app.infra.scheduler_leader import SchedulerLeaderElector, SchedulerLeaderLease
+from app.utils.time_utils import time_utils
+
+
+class _FakeDatabase:
+    """模拟 advisory lock 与租约表(会话断开即释放锁)."""
+
+    def __init__(self) -> None:
+        self.lock_holder: int | None = None
+        self.lease: SchedulerLeaderLease | None = None
+        self._pids = count(100)
+
+    def new_pid(self) -> int:
+        return next(self._pids)
+
+
+class _FakeConnection:
+    def __init__(self, database: _FakeDatabase, terminated: list[int]) -> None:
+        self.database = database
+        self.terminated = terminated
+        self.pid = database.new_pid()
+        self.closed = False
+
+    def execution_options(self, **_: object) -> _FakeConnection:
+        return self
+
+    def close(self) -> None:
+        self.closed = True
+        if self.database.lock_holder == self.pid:
+            self.database.lock_holder = None
+
+
+class _FakeEngine:
+    def __init__(self, database: _FakeDatabase, terminated: list[int]) -> None:
+        self.database = database
+        self.terminated = terminated
+
+    def connect(self) -> _FakeConnection:
+        return _FakeConnection(self.database, self.terminated)
+
+
+def _fake(connection: Connection) -> _FakeConnection:
+    return cast(_FakeConnection, connection)
+
+
+class _FakeElector(SchedulerLeaderElector):
+    def __init__(self, database: _FakeDatabase, node_id: str) -> None:
+        self.events: list[str] = []
+        self.terminated: list[int] = []
+        super().__init__(
+            database_url="postgresql://unused",
+            node_id=node_id,
+            heartbeat_seconds=5,
+            lease_seconds=30,
+            on_elected=lambda: self.events.append("elected"),
+            on_demoted=lambda: self.events.append("demoted"),
+            engine=cast(Engine, _FakeEngine(database, self.terminated)),
+        )
+
+    @staticmethod
+    def _try_lock(connection: Connection) -> bool:
+        fake = _fake(connection)
+        if fake.database.lock_holder is None:
+            fake.database.lock_holder = fake.pid
+        return fake.database.lock_holder == fake.pid
+
+    @staticmethod
+    def _unlock(connection: Connection) -> None:
+        fake = _fake(connection)
+        if fake.database.lock_holder == fake.pid:
+            fake.database.lock_holder = None
+
+    @staticmethod
+    def _backend_pid(connection: Connection) -> int:
+        return _fake(connection).pid
+
+    def _write_lease(self, connection: Connection, *, backend_pid: int) -> None:
+        now = time_utils.now()
+        _fake(connection).database.lease = SchedulerLeaderLease(
+            node_id=self.node_id,
+            backend_pid=backend_pid,
+            acquired_at=now,
+            heartbeat_at=now,
+        )
+
+    def _touch_lease(self, connection: Connection) -> bool:
+        fake = _fake(connection)
+        lease = fake.database.lease
+        if lease is None or lease.node_id != self.node_id or lease.backend_pid != fake.pid:
+            return False
+        fake.database.lease = SchedulerLeaderLease(
+            node_id=lease.node_id,
+            backend_pid=lease.backend_pid,
+            acquired_at=lease.acquired_at,
+            heartbeat_at=time_utils.now(),
+        )
+        return True
+
+    @staticmethod
+    def _read_lease(connection: Connection) -> SchedulerLeaderLease | None:
+        return _fake(connection).database.lease
+
+    @staticmethod
+    def _terminate_backend(connection: Connection, backend_pid: int) -> bool:
+        fake = _fake(connection)
+        fake.terminated.append(backend_pid)
+        if fake.database.lock_holder == backend_pid:
+            fake.database.lock_holder = None
+            return True
+        return False
+
+
+@pytest.mark.unit
+def test_only_one_node_is_elected_and_standby_takes_over_after_leader_exits() -> None:
+    database = _FakeDatabase()
+    node_a = _FakeElector(database, "web-1:1")
+    node_b = _FakeElector(database, "web-2:1")
+
+    assert node_a.run_once() is True
+    assert node_b.run_once() is False
+    assert node_a.run_once() is True
+    assert database.lease is not None
+    assert database.lease.node_id == "web-1:1"
+
+    node_a.stop()
+    assert node_b.run_once() is True
+
+    assert node_a.events == ["elected", "demoted"]
+    assert node_b.events == ["elected"]
+    assert database.lease.node_id == "web-2:1"
+
+
+@pytest.mark.unit
+def test_leader_demotes_itself_when_lease_was_rewritten() -> None:
+    database = _FakeDatabase()
+    node_a = _FakeElector(database, "web-1:1")
+    assert node_a.run_once() is True
+
+    lease = database.lease
+    assert lease is not None
+    database.lease = SchedulerLeaderLease(
+        node_id="web-2:1",
+        backend_pid=999,
+        acquired_at=lease.acquired_at,
+        heartbeat_at=lease.heartbeat_at,
+    )
+
+    assert node_a.run_once() is False
+    assert node_a.events == ["elected", "demoted"]
+    assert node_a.is_leader is False
+
+
+@pytest.mark.unit
+def test_standby_terminates_hung_leader_session_after_lease_expires() -> None:
+    database = _FakeDatabase()
+    node_a = _FakeElector(database, "web-1:1")
+    node_b = _FakeElector(database, "web-2:1")
+    assert node_a.run_once() is True
+    leader_pid = database.lock_holder
+
+    # 心跳仍新鲜时不终止主节点会话
+    assert node_b.run_once() is False
+    assert node_b.terminated == []
+
+    lease = database.lease
+    assert lease is not None
+    database.lease = SchedulerLeaderLease(
+        node_id=lease.node_id,
+        backend_pid=lease.backend_pid,
+        acquired_at=lease.acquired_at,
+        heartbeat_at=time_utils.now() - timedelta(seconds=31),
+    )
+
+    assert node_b.run_once() is False
+    assert node_b.terminated == [leader_pid]
+    assert node_b.run_once() is True
+    assert node_b.events == ["elected"]
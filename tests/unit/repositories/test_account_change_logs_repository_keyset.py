@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import update
+
+from app import create_app, db
+from app.core.constants import DatabaseType
+from app.core.types.account_change_logs import AccountChangeLogsListFilters
+from app.core.types.listing import KeysetParams
+from app.models.account_change_log import AccountChangeLog
+from app.models.instance import Instance
+from app.repositories.account_change_logs_repository import AccountChangeLogsRepository
+from app.settings import Settings
+
+
+@pytest.fixture(scope="function")
+def app(monkeypatch):
+    monkeypatch.setenv("FLASK_ENV", "testing")
+    monkeypatch.setenv("CACHE_TYPE", "simple")
+    monkeypatch.delenv("CACHE_REDIS_URL", raising=False)
+
+    app = create_app(init_scheduler_on_start=False, settings=Settings.load())
+    app.config["TESTING"] = True
+    return app
+
+
+def _filters(*, sort_field: str, sort_order: str, cursor: str | None) -> AccountChangeLogsListFilters:
+    return AccountChangeLogsListFilters(
+        page=1,
+        limit=2,
+        sort_field=sort_field,
+        sort_order=sort_order,
+        search_term="",
+        instance_id=None,
+        db_type=None,
+        change_type=None,
+        status=None,
+        hours=None,
+        keyset=KeysetParams(cursor=cursor, total_mode="none"),
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("sort_field", "sort_order"),
+    [("change_time", "desc"), ("change_time", "asc"), ("status", "asc"), ("status", "desc")],
+)
+def test_account_change_logs_keyset_pages_through_null_sort_values(app, sort_field: str, sort_order: str) -> None:
+    with app.app_context():
+        db.metadata.create_all(
+            bind=db.engine,
+            tables=[
+                db.metadata.tables["instances"],
+                db.metadata.tables["instance_accounts"],
+                db.metadata.tables["account_permission"],
+                db.metadata.tables["account_change_log"],
+                db.metadata.tables["sqlserver_clusters"],
+                db.metadata.tables["sqlserver_cluster_instances"],
+                db.metadata.tables["sqlserver_availability_groups"],
+            ],
+        )
+        instance = Instance(name="mysql-1", db_type=DatabaseType.MYSQL, host="127.0.0.1", port=3306, is_active=True)
+        db.session.add(instance)
+        db.session.flush()
+        logs = [
+            AccountChangeLog(
+                instance_id=instance.id,
+                db_type=DatabaseType.MYSQL,
+                username=f"user-{index}",
+                owner_type="instance",
+                owner_id=instance.id,
+                change_type="add",
+                change_time=datetime(2026, 5, 20, 9, index % 2, tzinfo=UTC),
+                status="success" if index % 2 else "failed",
+            )
+            for index in range(6)
+        ]
+        db.session.add_all(logs)
+        db.session.flush()
+        # 一半行的 status 为 NULL, 且 NULL 行跨越多页; change_time 为 NOT NULL, 仅覆盖重复值翻页
+        null_ids = [logs[0].id, logs[2].id, logs[3].id]
+        db.session.execute(update(AccountChangeLog).where(AccountChangeLog.id.in_(null_ids)).values(status=None))
+        db.session.commit()
+
+        repository = AccountChangeLogsRepository()
+        seen: list[int] = []
+        cursor: str | None = None
+        for _ in range(10):
+            page = repository.list_logs(_filters(sort_field=sort_field, sort_order=sort_order, cursor=cursor))
+            seen.extend(int(row[0].id) for row in page.items)
+            cursor = page.next_cursor
+            if not page.has_more:
+                break
+
+        assert sorted(seen) == sorted(log.id for log in logs)
+        assert len(seen) == len(set(seen))
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import pytest
+
+from app import create_app, db
+from app.models.account_permission import AccountPermission
+from app.models.instance import Instance
+from app.models.instance_account import InstanceAccount
+from app.repositories.account_statistics_repository import AccountStatisticsRepository
+from app.settings import Settings
+from app.utils.time_utils import time_utils
+
+
+@pytest.fixture(scope="function")
+def app(monkeypatch):
+    monkeypatch.setenv("FLASK_ENV", "testing")
+    monkeypatch.setenv("CACHE_TYPE", "simple")
+    monkeypatch.delenv("CACHE_REDIS_URL", raising=False)
+
+    app = create_app(init_scheduler_on_start=False, settings=Settings.load())
+    app.config["TESTING"] = True
+    return app
+
+
+def _seed() -> None:
+    mysql = Instance(name="mysql-1", db_type="mysql", host="10.0.0.1", port=3306, is_active=True)
+    oracle = Instance(name="oracle-1", db_type="oracle", host="10.0.0.2", port=1521, is_active=False)
+    gone = Instance(
+        name="mysql-gone",
+        db_type="mysql",
+        host="10.0.0.3",
+        port=3306,
+        is_active=True,
+        deleted_at=time_utils.now(),
+    )
+    db.session.add_all([mysql, oracle, gone])
+    db.session.flush()
+
+    locked = InstanceAccount(instance_id=mysql.id, username="locked", db_type="mysql", is_active=True)
+    removed = InstanceAccount(instance_id=mysql.id, username="removed", db_type="mysql", is_active=False)
+    ad_user = InstanceAccount(
+        instance_id=oracle.id,
+        username="ad_user",
+        db_type="oracle",
+        is_active=True,
+        ad_domain_config_id=1,
+    )
+    ghost = InstanceAccount(instance_id=gone.id, username="ghost", db_type="mysql", is_active=True)
+    db.session.add_all([locked, removed, ad_user, ghost])
+    db.session.flush()
+
+    # 同一账户两条锁定权限记录, 不应被重复计数.
+    for owner_id in (mysql.id, None):
+        db.session.add(
+            AccountPermission(
+                instance_id=mysql.id,
+                instance_account_id=locked.id,
+                owner_type="instance",
+                owner_id=owner_id,
+                db_type="mysql",
+                username="locked",
+                permission_facts={"capabilities": ["LOCKED"]},
+            ),
+        )
+    db.session.commit()
+
+
+@pytest.mark.unit
+def test_statistics_snapshot_rolls_up_facets_from_single_scan(app) -> None:
+    with app.app_context():
+        db.metadata.create_all(
+            bind=db.engine,
+            tables=[
+                db.metadata.tables["instances"],
+                db.metadata.tables["instance_accounts"],
+                db.metadata.tables["account_permission"],
+            ],
+        )
+        _seed()
+
+        summary, db_type_stats = AccountStatisticsRepository.fetch_statistics_snapshot()
+
+        assert summary["total_accounts"] == 3
+        assert summary["active_accounts"] == 2
+        assert summary["locked_accounts"] == 1
+        assert summary["normal_accounts"] == 1
+        assert summary["deleted_accounts"] == 1
+        assert summary["owner_type_stats"]["instance"] == {"total": 3, "active": 2, "deleted": 1, "percent": 100.0}
+        assert summary["ad_status_stats"]["total"] == {"normal": 1, "disabled": 0, "orphaned": 0, "unmatched": 1}
+        assert summary["physical_instances"] == 2
+        assert summary["active_instances"] == 1
+        assert summary["disabled_instances"] == 1
+        assert summary["deleted_instances"] == 1
+
+        assert db_type_stats["mysql"] == {"total": 2, "active": 1, "normal": 0, "locked": 1, "deleted": 1}
+        assert db_type_stats["oracle"] == {"total": 1, "active": 1, "normal": 1, "locked": 0, "deleted": 0}
+        assert db_type_stats == AccountStatisticsRepository.fetch_db_type_stats()
+
+        mysql_summary = AccountStatisticsRepository.fetch_summary(db_type="mysql")
+        assert mysql_summary["total_accounts"] == 2
+        assert mysql_summary["physical_instances"] == 1
+        assert mysql_summary["deleted_instances"] == 1
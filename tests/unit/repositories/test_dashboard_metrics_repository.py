@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+
+from app import create_app, db
+from app.models.dashboard_metric_bucket import DASHBOARD_METRIC_LOG_LEVEL, DASHBOARD_METRIC_SYNC_SESSION
+from app.repositories.dashboard_charts_repository import DashboardChartsRepository
+from app.repositories.dashboard_metrics_repository import DashboardMetricsRepository
+from app.services.statistics.log_statistics_service import fetch_log_level_distribution, fetch_log_trend_data
+from app.settings import Settings
+from app.utils.time_utils import time_utils
+
+
+@pytest.fixture(scope="function")
+def app(monkeypatch):
+    monkeypatch.setenv("FLASK_ENV", "testing")
+    monkeypatch.setenv("CACHE_TYPE", "simple")
+    monkeypatch.delenv("CACHE_REDIS_URL", raising=False)
+
+    app = create_app(init_scheduler_on_start=False, settings=Settings.load())
+    app.config["TESTING"] = True
+    return app
+
+
+@pytest.mark.unit
+def test_dashboard_metric_buckets_accumulate_per_hour(app) -> None:
+    with app.app_context():
+        db.metadata.create_all(bind=db.engine, tables=[db.metadata.tables["dashboard_metric_buckets"]])
+        now = time_utils.now()
+
+        DashboardMetricsRepository.increment(DASHBOARD_METRIC_LOG_LEVEL, {("ERROR", now): 2, ("WARNING", now): 1})
+        DashboardMetricsRepository.increment(
+            DASHBOARD_METRIC_LOG_LEVEL,
+            {("ERROR", now + timedelta(seconds=1)): 3, ("INFO", now): 0},
+        )
+        db.session.commit()
+
+        assert DashboardMetricsRepository.sum_by_dimension(DASHBOARD_METRIC_LOG_LEVEL) == {"ERROR": 5, "WARNING": 1}
+        rows = DashboardMetricsRepository.fetch_buckets(
+            DASHBOARD_METRIC_LOG_LEVEL,
+            start_utc=now - timedelta(hours=1),
+            end_utc=now + timedelta(hours=1),
+            dimensions=["ERROR"],
+        )
+        assert [count for _, _, count in rows] == [5]
+
+
+@pytest.mark.unit
+def test_dashboard_trends_read_from_buckets(app) -> None:
+    with app.app_context():
+        db.metadata.create_all(bind=db.engine, tables=[db.metadata.tables["dashboard_metric_buckets"]])
+        now = time_utils.now()
+        yesterday = now - timedelta(days=1)
+        DashboardMetricsRepository.increment(
+            DASHBOARD_METRIC_LOG_LEVEL,
+            {("ERROR", now): 2, ("CRITICAL", now): 1, ("WARNING", yesterday): 4, ("INFO", now): 9},
+        )
+        DashboardMetricsRepository.increment(
+            DASHBOARD_METRIC_SYNC_SESSION,
+            {("account", now): 1, ("capacity", now): 2, ("account", now - timedelta(days=30)): 5},
+        )
+        db.session.commit()
+
+        trend = fetch_log_trend_data(days=7)
+        assert len(trend) == 7
+        assert trend[-1] == {
+            "date": time_utils.now_china().date().isoformat(),
+            "error_count": 3,
+            "warning_count": 0,
+        }
+        assert sum(int(item["warning_count"]) for item in trend) == 4
+
+        assert fetch_log_level_distribution() == [
+            {"level": "ERROR", "count": 2},
+            {"level": "WARNING", "count": 4},
+            {"level": "CRITICAL", "count": 1},
+        ]
+
+        sync_trend = DashboardChartsRepository().fetch_sync_trend(days=7)
+        assert len(sync_trend) == 7
+        assert sync_trend[-1]["count"] == 3
+        assert sum(int(item["count"]) for item in sync_trend) == 3
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+
+from app import create_app, db
+from app.core.constants.system_constants import LogLevel
+from app.core.exceptions import ValidationError
+from app.core.types.history_logs import LogSearchFilters
+from app.core.types.listing import KeysetParams
+from app.models.unified_log import UnifiedLog
+from app.repositories.history_logs_repository import HistoryLogsRepository
+from app.settings import Settings
+from app.utils.time_utils import time_utils
+
+
+@pytest.fixture(scope="function")
+def app(monkeypatch):
+    monkeypatch.setenv("FLASK_ENV", "testing")
+    monkeypatch.setenv("CACHE_TYPE", "simple")
+    monkeypatch.delenv("CACHE_REDIS_URL", raising=False)
+
+    app = create_app(init_scheduler_on_start=False, settings=Settings.load())
+    app.config["TESTING"] = True
+    return app
+
+
+def _filters(*, keyset: KeysetParams | None, limit: int = 2) -> LogSearchFilters:
+    return LogSearchFilters(
+        page=1,
+        limit=limit,
+        sort_field="timestamp",
+        sort_order="desc",
+        level=None,
+        module=None,
+        search_term="",
+        start_time=None,
+        end_time=None,
+        hours=24,
+        keyset=keyset,
+    )
+
+
+@pytest.mark.unit
+def test_history_logs_keyset_pagination_walks_all_rows_without_gaps(app) -> None:
+    with app.app_context():
+        db.metadata.create_all(bind=db.engine, tables=[db.metadata.tables["unified_logs"]])
+        now = time_utils.now()
+        # 两条同一时间戳, 验证 id 决胜不会漏行/重复.
+        timestamps = [now - timedelta(minutes=1), now - timedelta(minutes=2), now - timedelta(minutes=2), now]
+        for index, timestamp in enumerate(timestamps):
+            db.session.add(
+                UnifiedLog(timestamp=timestamp, level=LogLevel.INFO, module="tests", message=f"log-{index}"),
+            )
+        db.session.commit()
+
+        repository = HistoryLogsRepository()
+        seen: list[str] = []
+        cursor: str | None = None
+        for _ in range(5):
+            result = repository.list_logs(_filters(keyset=KeysetParams(cursor=cursor, total_mode="exact")))
+            assert result.pagination == "keyset"
+            assert result.total == 4
+            seen.extend(log.message for log in result.items)
+            cursor = result.next_cursor
+            if not result.has_more:
+                break
+
+        assert seen == ["log-3", "log-0", "log-2", "log-1"]
+        assert cursor is None
+
+
+@pytest.mark.unit
+def test_history_logs_keyset_total_none_and_invalid_cursor(app) -> None:
+    with app.app_context():
+        db.metadata.create_all(bind=db.engine, tables=[db.metadata.tables["unified_logs"]])
+        repository = HistoryLogsRepository()
+
+        result = repository.list_logs(_filters(keyset=KeysetParams(cursor=None, total_mode="none")))
+        assert result.total is None
+        assert result.items == []
+
+        with pytest.raises(ValidationError):
+            repository.list_logs(_filters(keyset=KeysetParams(cursor="not-a-cursor", total_mode="none")))
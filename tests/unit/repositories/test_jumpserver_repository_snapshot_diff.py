@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+
+from app import create_app, db
+from app.models.jumpserver_asset_snapshot import JumpServerAssetSnapshot
+from app.repositories.jumpserver_repository import JumpServerRepository
+from app.services.jumpserver.provider import JumpServerDatabaseAsset
+
+
+def _asset(external_id: str, *, host: str, port: int = 3306) -> JumpServerDatabaseAsset:
+    return JumpServerDatabaseAsset(
+        external_id=external_id,
+        name=f"mysql-{external_id}",
+        db_type="mysql",
+        host=host,
+        port=port,
+        raw_payload={"id": external_id, "address": host},
+    )
+
+
+@pytest.mark.unit
+def test_reconcile_asset_snapshots_writes_only_changed_assets() -> None:
+    app = create_app(init_scheduler_on_start=False)
+    app.config["TESTING"] = True
+
+    with app.app_context():
+        db.metadata.create_all(bind=db.engine, tables=[db.metadata.tables["jumpserver_asset_snapshots"]])
+        first_synced_at = datetime(2026, 7, 1, 8, 0, tzinfo=UTC)
+        second_synced_at = datetime(2026, 7, 2, 8, 0, tzinfo=UTC)
+
+        first = JumpServerRepository.reconcile_asset_snapshots(
+            [_asset("a-1", host="10.0.0.1"), _asset("a-2", host="10.0.0.2"), _asset("a-3", host="10.0.0.3")],
+            sync_run_id="run-1",
+            synced_at=first_synced_at,
+        )
+        db.session.commit()
+
+        assert (first.inserted_total, first.updated_total, first.deleted_total) == (3, 0, 0)
+        assert first.changed_total == 3
+
+        second = JumpServerRepository.reconcile_asset_snapshots(
+            [_asset("a-1", host="10.0.0.1"), _asset("a-2", host="10.0.0.22"), _asset("a-4", host="10.0.0.4")],
+            sync_run_id="run-2",
+            synced_at=second_synced_at,
+        )
+        db.session.commit()
+
+        assert (second.inserted_total, second.updated_total, second.deleted_total) == (1, 1, 1)
+        assert second.unchanged_total == 1
+        assert second.written_total == 2
+        assert second.changed_total == 3
+
+        rows = {row.external_id: row for row in JumpServerAssetSnapshot.query.all()}
+        assert sorted(rows) == ["a-1", "a-2", "a-4"]
+        assert rows["a-1"].sync_run_id == "run-1"
+        assert rows["a-2"].host == "10.0.0.22"
+        assert rows["a-2"].raw_payload == {"id": "a-2", "address": "10.0.0.22"}
+        assert rows["a-2"].sync_run_id == "run-2"
+        assert rows["a-4"].sync_run_id == "run-2"
+
+        unchanged = JumpServerRepository.reconcile_asset_snapshots(
+            [_asset("a-1", host="10.0.0.1"), _asset("a-2", host="10.0.0.22"), _asset("a-4", host="10.0.0.4")],
+            sync_run_id="run-3",
+            synced_at=second_synced_at,
+        )
+
+        assert unchanged.changed_total == 0
+        assert unchanged.unchanged_total == 3
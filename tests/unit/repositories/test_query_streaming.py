@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import pytest
+
+from app import create_app, db
+from app.core.constants.system_constants import LogLevel
+from app.models.unified_log import UnifiedLog
+from app.repositories.query_streaming import iter_query_chunks
+from app.settings import Settings
+from app.utils.time_utils import time_utils
+
+
+@pytest.fixture(scope="function")
+def app(monkeypatch):
+    monkeypatch.setenv("FLASK_ENV", "testing")
+    monkeypatch.setenv("CACHE_TYPE", "simple")
+    monkeypatch.delenv("CACHE_REDIS_URL", raising=False)
+
+    app = create_app(init_scheduler_on_start=False, settings=Settings.load())
+    app.config["TESTING"] = True
+    return app
+
+
+@pytest.mark.unit
+def test_iter_query_chunks_splits_rows_in_order(app) -> None:
+    with app.app_context():
+        db.metadata.create_all(bind=db.engine, tables=[db.metadata.tables["unified_logs"]])
+        now = time_utils.now()
+        for index in range(5):
+            db.session.add(UnifiedLog(timestamp=now, level=LogLevel.INFO, module="tests", message=f"log-{index}"))
+        db.session.commit()
+
+        query = UnifiedLog.query.order_by(UnifiedLog.id.asc())
+        chunks = [[log.message for log in chunk] for chunk in iter_query_chunks(query, chunk_size=2)]
+
+        assert chunks == [["log-0", "log-1"], ["log-2", "log-3"], ["log-4"]]
@@ -4,7 +4,11 @@ from datetime import UTC, datetime
 
 import pytest
 
+import app.repositories.veeam_repository as veeam_repository_module
 from app import create_app, db
+from app.core.constants import DatabaseType
+from app.models.instance import Instance
+from app.models.veeam_instance_backup_match import VeeamInstanceBackupMatch
 from app.models.veeam_machine_backup_snapshot import VeeamMachineBackupSnapshot
 from app.models.veeam_source_binding import VeeamSourceBinding
 from app.repositories.veeam_repository import VeeamRepository
@@ -334,3 +338,77 @@ def test_find_best_backup_for_instance_name_matches_ip_when_name_does_not_match(
         assert payload["matched_machine_name"] == "renamed-vm.domain.com"
         assert payload["matched_machine_ip"] == "10.0.0.8"
         assert payload["match_candidates"] == ["db02", "db02.domain.com", "10.0.0.8"]
+
+
+@pytest.mark.unit
+def test_refresh_instance_backup_matches_serves_summary_from_precomputed_matches(monkeypatch) -> None:
+    app = create_app(init_scheduler_on_start=False)
+    app.config["TESTING"] = True
+
+    with app.app_context():
+        db.metadata.create_all(
+            bind=db.engine,
+            tables=[
+                db.metadata.tables["credentials"],
+                db.metadata.tables["instances"],
+                db.metadata.tables["veeam_source_bindings"],
+                db.metadata.tables["veeam_machine_backup_snapshots"],
+                db.metadata.tables["veeam_instance_backup_matches"],
+            ],
+        )
+        instance = Instance(name="db01", db_type=DatabaseType.MYSQL, host="10.0.0.8", port=3306, is_active=True)
+        source_a = _binding("Veeam A", credential_id=1)
+        source_b = _binding("Veeam B", credential_id=2)
+        db.session.add_all([instance, source_a, source_b])
+        db.session.flush()
+        ip_row = _snapshot(
+            machine_name="renamed-vm.domain.com",
+            backup_at=datetime(2026, 3, 25, 3, 0, tzinfo=UTC),
+            source_binding_id=source_b.id,
+            raw_payload_id="rp-b",
+            sync_run_id="run-b",
+        )
+        ip_row.machine_ip = "10.0.0.8"
+        ip_row.normalized_machine_ip = "10.0.0.8"
+        db.session.add_all(
+            [
+                _snapshot(
+                    machine_name="db01.domain.com",
+                    backup_at=datetime(2026, 3, 25, 2, 0, tzinfo=UTC),
+                    source_binding_id=source_a.id,
+                    raw_payload_id="rp-a",
+                    sync_run_id="run-a",
+                ),
+                ip_row,
+            ]
+        )
+        db.session.commit()
+
+        assert VeeamRepository.refresh_instance_backup_matches() == 2
+        db.session.commit()
+
+        def _fail_candidate_lookup(*_args: object, **_kwargs: object) -> list[VeeamMachineBackupSnapshot]:
+            raise AssertionError("backup summary should be read from precomputed matches")
+
+        monkeypatch.setattr(veeam_repository_module, "_fetch_snapshot_rows_by_names", _fail_candidate_lookup)
+        monkeypatch.setattr(veeam_repository_module, "_fetch_snapshot_rows_by_ips", _fail_candidate_lookup)
+
+        summary = VeeamRepository.fetch_backup_summary_map([instance])[instance.id]
+        assert summary["source_binding_id"] == source_b.id
+        assert summary["matched_machine_ip"] == "10.0.0.8"
+        assert summary["match_candidates"] == ["db01", "db01.domain.com", "10.0.0.8"]
+
+        source_b.is_enabled = False
+        db.session.commit()
+        summary = VeeamRepository.fetch_backup_summary_map([instance])[instance.id]
+        assert summary["source_binding_id"] == source_a.id
+        assert summary["matched_machine_name"] == "db01.domain.com"
+
+        monkeypatch.undo()
+        instance.name = "db09"
+        instance.host = "10.0.0.99"
+        db.session.flush()
+
+        assert VeeamRepository.refresh_instance_backup_matches(instance_ids=[instance.id]) == 0
+        assert VeeamInstanceBackupMatch.query.count() == 0
+        assert VeeamRepository.fetch_backup_summary_map([instance]) == {}
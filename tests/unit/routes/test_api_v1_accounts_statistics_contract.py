@@ -58,6 +58,9 @@ def test_api_v1_accounts_statistics_endpoints_contract(app, auth_client) -> None
     statistics_data = statistics_payload.get("data")
     assert isinstance(statistics_data, dict)
     assert isinstance(statistics_data.get("stats"), dict)
+    statistics_meta = statistics_payload.get("meta")
+    assert isinstance(statistics_meta, dict)
+    assert isinstance(statistics_meta.get("cache_generation"), int)
 
     summary_response = auth_client.get("/api/v1/accounts/statistics/summary")
     assert summary_response.status_code == 200
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 
 from app import db
@@ -212,7 +214,9 @@ def test_api_v1_connections_status_contract(app, auth_client) -> None:
         "last_connected",
         "status",
         "is_active",
+        "reachability",
     }.issubset(data.keys())
+    assert data["reachability"]["status"] == "unknown"
 
 
 @pytest.mark.unit
@@ -329,3 +333,58 @@ def test_api_v1_connections_test_connection_success_contract(app, auth_client, m
     assert isinstance(data, dict)
     assert data.get("success") is True
     assert "result" not in data
+
+
+@pytest.mark.unit
+def test_api_v1_connections_batch_test_streams_ndjson_and_bulk_updates_last_connected(
+    app,
+    auth_client,
+    monkeypatch,
+) -> None:
+    with app.app_context():
+        db.metadata.create_all(bind=db.engine, tables=[db.metadata.tables["instances"]])
+        instances = [
+            Instance(name=f"instance-{index}", db_type="mysql", host=f"10.0.0.{index}", port=3306, is_active=True)
+            for index in (1, 2)
+        ]
+        db.session.add_all(instances)
+        db.session.commit()
+        ok_id, down_id = (int(instance.id) for instance in instances)
+
+    def _fake_test_connection(_self, instance):  # type: ignore[no-untyped-def]
+        instance.last_connected = time_utils.now()
+        if instance.host == "10.0.0.2":
+            return {"success": False, "message": ErrorMessages.DATABASE_CONNECTION_ERROR}
+        instance.database_version = "8.0.36"
+        instance.main_version = "8.0"
+        instance.detailed_version = "8.0.36"
+        return {"success": True, "message": "OK"}
+
+    monkeypatch.setattr(ConnectionTestService, "test_connection", _fake_test_connection)
+
+    csrf_token = _get_csrf_token(auth_client)
+    response = auth_client.post(
+        "/api/v1/instances/actions/batch-test-connections",
+        json={"instance_ids": [ok_id, down_id, 999]},
+        headers={HttpHeaders.X_CSRF_TOKEN: csrf_token, "Accept": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    results = {line["data"]["instance_id"]: line["data"] for line in lines if line["type"] == "result"}
+    assert set(results) == {ok_id, down_id, 999}
+    assert results[ok_id]["success"] is True
+    assert results[ok_id]["instance_name"] == "instance-1"
+    assert results[down_id]["success"] is False
+    assert lines[-1] == {"type": "summary", "data": {"total": 3, "success": 1, "failed": 2}}
+
+    with app.app_context():
+        ok_instance = db.session.get(Instance, ok_id)
+        down_instance = db.session.get(Instance, down_id)
+        assert ok_instance is not None
+        assert down_instance is not None
+        assert ok_instance.last_connected is not None
+        assert ok_instance.main_version == "8.0"
+        assert down_instance.last_connected is not None
+        assert down_instance.main_version is None
@@ -18,6 +18,7 @@ def _ensure_dashboard_tables(app) -> None:
                 db.metadata.tables["instance_databases"],
                 db.metadata.tables["unified_logs"],
                 db.metadata.tables["sync_sessions"],
+                db.metadata.tables["dashboard_metric_buckets"],
             ],
         )
 
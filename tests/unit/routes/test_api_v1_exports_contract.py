@@ -0,0 +1,91 @@
+import pytest
+
+
+def _csrf_headers(client) -> dict[str, str]:
+    csrf_response = client.get("/api/v1/auth/csrf-token")
+    assert csrf_response.status_code == 200
+    csrf_payload = csrf_response.get_json()
+    assert isinstance(csrf_payload, dict)
+    csrf_token = csrf_payload.get("data", {}).get("csrf_token")
+    assert isinstance(csrf_token, str)
+    return {"X-CSRFToken": csrf_token}
+
+
+@pytest.mark.unit
+def test_api_v1_exports_requires_auth(client) -> None:
+    response = client.post("/api/v1/exports/jobs", json={"export_type": "instances"}, headers=_csrf_headers(client))
+    assert response.status_code == 401
+    payload = response.get_json()
+    assert isinstance(payload, dict)
+    assert payload.get("message_code") == "AUTHENTICATION_REQUIRED"
+
+    download_response = client.get("/api/v1/exports/jobs/r-1/file")
+    assert download_response.status_code == 401
+
+
+@pytest.mark.unit
+def test_api_v1_exports_create_job_contract(auth_client, monkeypatch) -> None:
+    import app.api.v1.namespaces.exports as exports_api
+    from app.services.files.export_jobs_service import ExportJobLaunchResult, ExportJobPreparedRun
+
+    captured: dict[str, object] = {}
+
+    def _dummy_prepare(*, payload, created_by):
+        captured["filters"] = payload.filters
+        captured["created_by"] = created_by
+        return ExportJobPreparedRun(run_id="abc-123", export_type=payload.export_type)
+
+    def _dummy_launch(*, created_by, prepared):
+        captured["launched"] = prepared.run_id
+        return ExportJobLaunchResult(run_id=prepared.run_id, export_type=prepared.export_type, thread_name="t")
+
+    monkeypatch.setattr(exports_api._export_jobs_service, "prepare_export_job", _dummy_prepare)
+    monkeypatch.setattr(exports_api._export_jobs_service, "launch_export_job", _dummy_launch)
+
+    headers = _csrf_headers(auth_client)
+    response = auth_client.post(
+        "/api/v1/exports/jobs",
+        json={"export_type": "accounts_ledger", "filters": {"db_type": "mysql"}},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    payload = response.get_json()
+    assert isinstance(payload, dict)
+    assert payload.get("success") is True
+    data = payload.get("data")
+    assert isinstance(data, dict)
+    assert {"run_id", "export_type", "download_url"}.issubset(data.keys())
+    assert data["download_url"] == "/api/v1/exports/jobs/abc-123/file"
+    assert captured["filters"] == {"db_type": "mysql"}
+    assert captured["launched"] == "abc-123"
+
+    invalid_response = auth_client.post("/api/v1/exports/jobs", json={"export_type": "unknown"}, headers=headers)
+    assert invalid_response.status_code == 400
+
+
+@pytest.mark.unit
+def test_api_v1_exports_download_supports_range(auth_client, monkeypatch, tmp_path) -> None:
+    import app.api.v1.namespaces.exports as exports_api
+    from app.services.files.export_jobs_service import ExportJobDownload
+
+    file_path = tmp_path / "abc-123.csv"
+    file_path.write_text("a,b\n1,2\n", encoding="utf-8")
+
+    def _dummy_resolve(run_id, *, user_id, is_admin):
+        del user_id
+        assert run_id == "abc-123"
+        assert is_admin is True
+        return ExportJobDownload(path=str(file_path), filename="accounts.csv", size_bytes=file_path.stat().st_size)
+
+    monkeypatch.setattr(exports_api._export_jobs_service, "resolve_download", _dummy_resolve)
+
+    response = auth_client.get("/api/v1/exports/jobs/abc-123/file")
+    assert response.status_code == 200
+    assert "attachment" in response.headers.get("Content-Disposition", "")
+    assert response.get_data(as_text=True) == "a,b\n1,2\n"
+    response.close()
+
+    partial = auth_client.get("/api/v1/exports/jobs/abc-123/file", headers={"Range": "bytes=4-"})
+    assert partial.status_code == 206
+    assert partial.get_data(as_text=True) == "1,2\n"
+    partial.close()
@@ -1,7 +1,10 @@
+import gzip
+
 import pytest
 
 import app.api.v1.namespaces.accounts as accounts_api
 import app.api.v1.namespaces.instances as instances_api
+from app.services.files.csv_export_result import CsvStreamResult
 from app.services.ledgers.database_ledger_service import DatabaseLedgerService
 
 
@@ -22,22 +25,20 @@ def test_api_v1_files_requires_auth(client) -> None:
 
 @pytest.mark.unit
 def test_api_v1_files_endpoints_contract(auth_client, monkeypatch) -> None:
-    class _DummyExportResult:
-        content = b"id,name\n1,alice\n"
-        mimetype = "text/csv; charset=utf-8"
-        filename = "export.csv"
+    def _dummy_export_result() -> CsvStreamResult:
+        return CsvStreamResult(filename="export.csv", chunks=iter(["id,name\n", "1,alice\n"]))
 
     class _DummyAccountExportService:
         @staticmethod
         def export_accounts_csv(filters):
             del filters
-            return _DummyExportResult()
+            return _dummy_export_result()
 
     class _DummyInstancesExportService:
         @staticmethod
         def export_instances_csv(filters):
             del filters
-            return _DummyExportResult()
+            return _dummy_export_result()
 
     monkeypatch.setattr(accounts_api, "_account_export_service", _DummyAccountExportService())
     monkeypatch.setattr(instances_api, "_instances_export_service", _DummyInstancesExportService())
@@ -52,13 +53,18 @@ def test_api_v1_files_endpoints_contract(auth_client, monkeypatch) -> None:
     assert "attachment" in (response.headers.get("Content-Disposition") or "")
     assert response.mimetype in {"text/csv", "text/plain"}
 
-    response = auth_client.get("/api/v1/instances/exports")
+    assert response.get_data() == b"id,name\n1,alice\n"
+
+    response = auth_client.get("/api/v1/instances/exports", headers={"Accept-Encoding": "gzip"})
     assert response.status_code == 200
     assert "attachment" in (response.headers.get("Content-Disposition") or "")
+    assert response.headers.get("Content-Encoding") == "gzip"
+    assert gzip.decompress(response.get_data()) == b"id,name\n1,alice\n"
 
     response = auth_client.get("/api/v1/databases/ledgers/exports")
     assert response.status_code == 200
     assert "attachment" in (response.headers.get("Content-Disposition") or "")
+    assert response.get_data(as_text=True).startswith("数据库名称")
 
     response = auth_client.get("/api/v1/instances/imports/template")
     assert response.status_code == 200
@@ -1,7 +1,12 @@
 import pytest
 
 import app.scheduler as scheduler_module
-from app.core.types.scheduler import SchedulerJobDetail, SchedulerJobListItem
+from app.core.types.scheduler import (
+    SchedulerExecutorStats,
+    SchedulerJobDetail,
+    SchedulerJobListItem,
+    SchedulerLeaderStatus,
+)
 from app.services.scheduler.scheduler_job_write_service import SchedulerJobWriteService
 from app.services.scheduler.scheduler_jobs_read_service import SchedulerJobsReadService
 
@@ -102,7 +107,37 @@ def test_api_v1_scheduler_endpoints_contract(auth_client, monkeypatch) -> None:
             coalesce=None,
         )
 
+    def _dummy_list_executors(self):
+        del self
+        return [
+            SchedulerExecutorStats(
+                name="cpu-processes",
+                type="process",
+                max_workers=2,
+                running=2,
+                queue_depth=1,
+                submitted_total=3,
+                completed_total=0,
+                failed_total=0,
+                avg_wait_seconds=0.0,
+                max_wait_seconds=0.0,
+                last_wait_seconds=None,
+            ),
+        ]
+
     monkeypatch.setattr(SchedulerJobsReadService, "list_jobs", _dummy_list_jobs)
+    monkeypatch.setattr(SchedulerJobsReadService, "list_executors", _dummy_list_executors)
+    monkeypatch.setattr(
+        SchedulerJobsReadService,
+        "get_leader_status",
+        lambda self: SchedulerLeaderStatus(
+            jobstore="database",
+            node_id="web-2:41",
+            is_leader=False,
+            leader_node_id="web-1:17",
+            leader_heartbeat_at="2026-06-15T09:00:00+00:00",
+        ),
+    )
     monkeypatch.setattr(SchedulerJobsReadService, "get_job", _dummy_get_job)
     monkeypatch.setattr(SchedulerJobWriteService, "load", lambda self, resource_id: object())
     monkeypatch.setattr(SchedulerJobWriteService, "upsert", lambda self, payload, resource=None: resource)
@@ -129,6 +164,27 @@ def test_api_v1_scheduler_endpoints_contract(auth_client, monkeypatch) -> None:
     assert data[0]["task_name"] == "job-1"
     assert data[0]["editable_fields"] == ["trigger"]
 
+    executors_response = auth_client.get("/api/v1/scheduler/executors")
+    assert executors_response.status_code == 200
+    payload = executors_response.get_json()
+    assert isinstance(payload, dict)
+    assert payload.get("success") is True
+    data = payload.get("data")
+    assert isinstance(data, list)
+    assert data[0]["name"] == "cpu-processes"
+    assert data[0]["queue_depth"] == 1
+    assert data[0]["last_wait_seconds"] is None
+
+    leader_response = auth_client.get("/api/v1/scheduler/leader")
+    assert leader_response.status_code == 200
+    payload = leader_response.get_json()
+    assert isinstance(payload, dict)
+    data = payload.get("data")
+    assert isinstance(data, dict)
+    assert data["jobstore"] == "database"
+    assert data["is_leader"] is False
+    assert data["leader_node_id"] == "web-1:17"
+
     detail_response = auth_client.get("/api/v1/scheduler/jobs/job-1")
     assert detail_response.status_code == 200
     payload = detail_response.get_json()
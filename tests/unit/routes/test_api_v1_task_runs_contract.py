@@ -27,7 +27,14 @@ def test_api_v1_task_runs_requires_auth(client) -> None:
 @pytest.mark.unit
 def test_api_v1_task_runs_endpoints_contract(auth_client, monkeypatch) -> None:
     from app.core.types.listing import PaginatedResult
-    from app.core.types.task_runs import TaskRunDetailResult, TaskRunErrorLogsResult, TaskRunItemItem, TaskRunListItem
+    from app.core.types.task_runs import (
+        TaskRunDetailResult,
+        TaskRunErrorLogsResult,
+        TaskRunItemItem,
+        TaskRunListItem,
+        TaskRunPipelineNode,
+        TaskRunPipelineResult,
+    )
     from app.services.task_runs.task_runs_read_service import TaskRunsReadService
     from app.services.task_runs.task_runs_write_service import TaskRunsWriteService
 
@@ -142,7 +149,13 @@ def test_api_v1_task_runs_endpoints_contract(auth_client, monkeypatch) -> None:
         )
         return TaskRunErrorLogsResult(run=run, items=[item], error_count=1)
 
+    def _dummy_pipeline(self, run_id: str):
+        run = _dummy_detail(self, run_id).run
+        node = TaskRunPipelineNode(run=run, depth=0, duration_seconds=None, wait_seconds=None, on_critical_path=True)
+        return TaskRunPipelineResult(root_run_id=run_id, nodes=[node], critical_path=[run_id], wall_clock_seconds=None)
+
     monkeypatch.setattr(TaskRunsReadService, "list_runs", _dummy_list_runs)
+    monkeypatch.setattr(TaskRunsReadService, "get_run_pipeline", _dummy_pipeline)
     monkeypatch.setattr(TaskRunsReadService, "get_run_detail", _dummy_detail)
     monkeypatch.setattr(TaskRunsReadService, "get_run_error_logs", _dummy_errors)
     monkeypatch.setattr(TaskRunsWriteService, "cancel_run", lambda _self, run_id: True)
@@ -180,6 +193,15 @@ def test_api_v1_task_runs_endpoints_contract(auth_client, monkeypatch) -> None:
     assert payload.get("success") is True
     assert payload.get("data", {}).get("error_count") == 1
 
+    pipeline_response = auth_client.get("/api/v1/task-runs/r-1/pipeline")
+    assert pipeline_response.status_code == 200
+    payload = pipeline_response.get_json()
+    assert isinstance(payload, dict)
+    assert payload.get("success") is True
+    pipeline_data = payload.get("data", {})
+    assert pipeline_data.get("critical_path") == ["r-1"]
+    assert pipeline_data.get("nodes", [{}])[0].get("run", {}).get("upstream_run_id") is None
+
     cancel_response = auth_client.post("/api/v1/task-runs/r-1/actions/cancel", json={}, headers=headers)
     assert cancel_response.status_code == 200
     payload = cancel_response.get_json()
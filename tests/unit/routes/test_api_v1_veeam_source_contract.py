@@ -280,11 +280,13 @@ def test_api_v1_veeam_sync_action_contract(monkeypatch) -> None:
             created_by: int | None,
             trigger_source: str = "manual",
             result_url: str = "/admin/system-settings#system-settings-veeam",
+            full_resync: bool = False,
         ):
             captured["created_by"] = created_by
             captured["trigger_source"] = trigger_source
             captured["result_url"] = result_url
-            return VeeamSyncPreparedRun(run_id="run-veeam-sync-1", credential_id=1)
+            captured["full_resync"] = full_resync
+            return VeeamSyncPreparedRun(run_id="run-veeam-sync-1", credential_id=1, full_resync=full_resync)
 
         def _fake_launch(_self, *, created_by: int | None, prepared: VeeamSyncPreparedRun):
             captured["launch_created_by"] = created_by
@@ -315,6 +317,15 @@ def test_api_v1_veeam_sync_action_contract(monkeypatch) -> None:
         assert payload.get("data", {}).get("run_id") == "run-veeam-sync-1"
         assert captured["trigger_source"] == "manual"
         assert captured["result_url"] == "/admin/system-settings#system-settings-veeam"
+        assert captured["full_resync"] is False
+
+        response = client.post(
+            "/api/v1/integrations/veeam/actions/sync",
+            json={"full_resync": True},
+            headers={"X-CSRFToken": csrf_token},
+        )
+        assert response.status_code == 200
+        assert captured["full_resync"] is True
 
 
 @pytest.mark.unit
@@ -70,3 +70,20 @@ def test_history_logs_list_query_rejects_out_of_range_hours() -> None:
 def test_history_log_statistics_query_defaults_to_24_hours() -> None:
     query = validate_or_raise(HistoryLogStatisticsQuery, {})
     assert query.hours == 24
+
+
+@pytest.mark.unit
+def test_history_logs_list_query_keyset_params() -> None:
+    offset_filters = validate_or_raise(HistoryLogsListQuery, {"cursor": "abc"}).to_filters()
+    assert offset_filters.keyset is None
+
+    filters = validate_or_raise(
+        HistoryLogsListQuery,
+        {"pagination": " KEYSET ", "cursor": " abc ", "total": None},
+    ).to_filters()
+    assert filters.keyset is not None
+    assert filters.keyset.cursor == "abc"
+    assert filters.keyset.total_mode == "estimate"
+
+    with pytest.raises(ValidationError):
+        validate_or_raise(HistoryLogsListQuery, {"pagination": "keyset", "total": "maybe"})
@@ -1,4 +1,5 @@
 import pytest
+from sqlalchemy import event
 
 from app import create_app, db
 from app.core.constants import DatabaseType
@@ -348,3 +349,71 @@ def test_permission_sync_scopes_same_username_by_account_owner() -> None:
         ]
         assert permissions["sqlserver_ag"].permission_snapshot["categories"]["sqlserver_server_roles"] == ["sysadmin"]
         assert [(log.owner_type, log.owner_id) for log in logs] == [("instance", instance.id), ("sqlserver_ag", ag.id)]
+
+
+@pytest.mark.unit
+def test_inventory_sync_applies_changes_with_set_based_statements() -> None:
+    app = create_app(init_scheduler_on_start=False)
+    app.config["TESTING"] = True
+
+    with app.app_context():
+        db.metadata.create_all(
+            bind=db.engine,
+            tables=[
+                db.metadata.tables["instances"],
+                db.metadata.tables["instance_accounts"],
+                db.metadata.tables["sqlserver_clusters"],
+                db.metadata.tables["sqlserver_availability_groups"],
+            ],
+        )
+        instance = Instance(name="pg-1", db_type=DatabaseType.POSTGRESQL, host="10.0.0.31", port=5432, is_active=True)
+        db.session.add(instance)
+        db.session.flush()
+        for username, is_active in (("kept", True), ("revived", False), ("dropped", True), ("gone", False)):
+            db.session.add(
+                InstanceAccount(
+                    instance_id=instance.id,
+                    username=username,
+                    db_type=DatabaseType.POSTGRESQL,
+                    owner_type="instance",
+                    owner_id=instance.id,
+                    is_active=is_active,
+                ),
+            )
+        db.session.commit()
+        db.session.refresh(instance)
+
+        statements: list[str] = []
+
+        def _record(_conn, _cursor, statement, *_args) -> None:
+            statements.append(statement.split(None, 1)[0].upper())
+
+        event.listen(db.engine, "before_cursor_execute", _record)
+        try:
+            summary, active_accounts = AccountInventoryManager().synchronize(
+                instance,
+                [
+                    cast(RemoteAccount, {"username": name, "db_type": DatabaseType.POSTGRESQL, "is_active": True})
+                    for name in ("kept", "revived", "new_a", "new_b", "new_c")
+                ],
+            )
+        finally:
+            event.remove(db.engine, "before_cursor_execute", _record)
+
+        assert (summary["created"], summary["reactivated"], summary["refreshed"], summary["deactivated"]) == (3, 1, 1, 1)
+        assert summary["created_accounts"] == ["new_a", "new_b", "new_c"]
+        assert summary["reactivated_accounts"] == ["revived"]
+        assert summary["active_count"] == 5
+        assert summary["processed_records"] == 5
+        assert [account.username for account in active_accounts] == ["kept", "revived", "new_a", "new_b", "new_c"]
+        assert all(account.is_active for account in active_accounts)
+        # 一次读取 + 一条插入 + 重新激活/刷新/停用各一条 + 一次回读, 不随账户数增长
+        assert statements.count("INSERT") == 1
+        assert statements.count("UPDATE") == 3
+        assert statements.count("SELECT") == 2
+
+        rows = {row.username: row for row in InstanceAccount.query.all()}
+        assert rows["dropped"].is_active is False
+        assert rows["dropped"].deleted_at is not None
+        assert rows["gone"].is_active is False
+        assert rows["revived"].deleted_at is None
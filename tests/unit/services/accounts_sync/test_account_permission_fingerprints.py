@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import Any, cast
+
+import pytest
+
+import app.models.sqlserver_cluster  # noqa: F401  # register SQLAlchemy relationship targets
+from app import create_app, db
+from app.models.account_permission import AccountPermission
+from app.models.instance import Instance
+from app.services.accounts_sync import coordinator as coordinator_module
+from app.services.accounts_sync.adapters.mysql_adapter import MySQLAccountAdapter
+from app.services.accounts_sync.adapters.oracle_adapter import OracleAccountAdapter
+from app.services.accounts_sync.adapters.sqlserver_adapter import SQLServerAccountAdapter
+from app.services.accounts_sync.coordinator import AccountSyncCoordinator
+from app.services.accounts_sync.permission_manager import AccountPermissionManager
+from app.utils.time_utils import time_utils
+
+
+def _instance(db_type: str) -> Instance:
+    return Instance(name=f"{db_type}-1", db_type=db_type, host="127.0.0.1", port=1, description=None, is_active=True)
+
+
+class _FingerprintAdapter:
+    def __init__(self) -> None:
+        self.enriched: list[list[str]] = []
+
+    def fetch_remote_accounts(self, *_: Any) -> list[dict[str, Any]]:
+        return [
+            {"username": "alice", "is_superuser": False, "permissions": {"type_specific": {"plugin": "a"}}},
+            {"username": "bob", "is_superuser": False, "permissions": {"type_specific": {"plugin": "b"}}},
+        ]
+
+    def fetch_permission_fingerprints(self, _instance: Any, _connection: Any, usernames: list[str]) -> dict[str, str]:
+        return {username: f"remote-{username}" for username in usernames}
+
+    def enrich_permissions(self, _instance: Any, _connection: Any, accounts: list[Any], *, usernames: list[str]):
+        self.enriched.append(sorted(usernames))
+        return accounts
+
+    def get_permission_query_stats(self) -> None:
+        return None
+
+
+class _RecordingPermissionManager:
+    def __init__(self) -> None:
+        self.fingerprints: dict[str, str] = {}
+        self.kwargs: dict[str, Any] = {}
+
+    def find_unchanged_usernames(self, _accounts: Any, fingerprints: dict[str, str], **_: Any) -> set[str]:
+        self.fingerprints = dict(fingerprints)
+        return {"alice"}
+
+    def synchronize(self, *_: Any, **kwargs: Any) -> dict[str, Any]:
+        self.kwargs = kwargs
+        return {"created": 0, "updated": 1, "skipped": 1, "errors": [], "message": "ok"}
+
+
+@pytest.mark.unit
+def test_coordinator_enriches_only_accounts_with_changed_fingerprints(monkeypatch: pytest.MonkeyPatch) -> None:
+    adapter = _FingerprintAdapter()
+    monkeypatch.setattr(coordinator_module, "get_account_adapter", lambda _db_type: adapter)
+    coordinator = AccountSyncCoordinator(_instance("mysql"))
+    manager = _RecordingPermissionManager()
+    coordinator._permission_manager = cast(Any, manager)
+    coordinator._connection = cast(Any, SimpleNamespace(is_connected=True))
+    coordinator._active_accounts_cache = cast(
+        Any,
+        [SimpleNamespace(id=1, username="alice"), SimpleNamespace(id=2, username="bob")],
+    )
+
+    summary = coordinator.synchronize_permissions(session_id="s-1")
+
+    assert adapter.enriched == [["bob"]]
+    assert summary.get("fingerprint_unchanged") == 1
+    assert manager.kwargs["unchanged_usernames"] == {"alice"}
+    fingerprints = manager.kwargs["fingerprints"]
+    assert set(fingerprints) == {"alice", "bob"}
+    assert fingerprints == manager.fingerprints
+    # 记录的指纹同时包含远端授权摘要与补全前的清单字段
+    assert fingerprints["alice"] != fingerprints["bob"]
+    assert all(len(value) == 64 for value in fingerprints.values())
+
+
+@pytest.mark.unit
+def test_find_unchanged_usernames_requires_matching_fingerprint_and_fresh_full_sync() -> None:
+    app = create_app(init_scheduler_on_start=False)
+    app.config["TESTING"] = True
+    app.config["ACCOUNT_PERMISSION_FULL_SYNC_INTERVAL_HOURS"] = 24
+
+    with app.app_context():
+        db.metadata.create_all(bind=db.engine, tables=[db.metadata.tables["account_permission"]])
+        now = time_utils.now()
+        for account_id, username, fingerprint, full_synced_at in (
+            (1, "fresh", "fp-fresh", now - timedelta(hours=1)),
+            (2, "stale", "fp-stale", now - timedelta(hours=30)),
+            (3, "changed", "fp-old", now - timedelta(hours=1)),
+        ):
+            db.session.add(
+                AccountPermission(
+                    instance_id=1,
+                    db_type="mysql",
+                    instance_account_id=account_id,
+                    username=username,
+                    owner_type="instance",
+                    owner_id=1,
+                    permission_fingerprint=fingerprint,
+                    permission_full_synced_at=full_synced_at,
+                ),
+            )
+        db.session.commit()
+
+        accounts = [
+            SimpleNamespace(id=1, username="fresh"),
+            SimpleNamespace(id=2, username="stale"),
+            SimpleNamespace(id=3, username="changed"),
+            SimpleNamespace(id=4, username="new"),
+        ]
+        unchanged = AccountPermissionManager().find_unchanged_usernames(
+            cast(Any, accounts),
+            {"fresh": "fp-fresh", "stale": "fp-stale", "changed": "fp-new", "new": "fp-any"},
+            now=now,
+        )
+
+        assert unchanged == {"fresh"}
+
+
+@pytest.mark.unit
+def test_resolve_fingerprint_skips_accounts_with_enrichment_errors() -> None:
+    fingerprints = {"alice": "fp-a", "bob": "fp-b"}
+
+    assert AccountPermissionManager._resolve_fingerprint(cast(Any, {"username": "alice"}), fingerprints) == "fp-a"
+    assert (
+        AccountPermissionManager._resolve_fingerprint(
+            cast(Any, {"username": "bob", "permissions": {"errors": ["timeout"]}}),
+            fingerprints,
+        )
+        is None
+    )
+    assert AccountPermissionManager._resolve_fingerprint(cast(Any, {"username": "alice"}), None) is None
+
+
+class _OracleFingerprintConnection:
+    def __init__(self, rows: list[tuple[Any, ...]]) -> None:
+        self.rows = rows
+        self.queries: list[str] = []
+
+    def execute_query(self, sql: str) -> list[tuple[Any, ...]]:
+        self.queries.append(sql)
+        return self.rows
+
+
+@pytest.mark.unit
+def test_oracle_fingerprints_aggregate_grant_views_in_one_statement() -> None:
+    adapter = OracleAccountAdapter()
+    rows: list[tuple[Any, ...]] = [
+        ("APP_USER", "dba_role_privs", 2, 1234),
+        ("APP_USER", "dba_sys_privs", 1, 99),
+        ("REPORTER", "dba_role_privs", 1, 77),
+    ]
+    connection = _OracleFingerprintConnection(rows)
+
+    first = adapter.fetch_permission_fingerprints(_instance("oracle"), connection, ["APP_USER", "REPORTER", "NOBODY"])
+    connection.rows = [("APP_USER", "dba_role_privs", 3, 4321), *rows[1:]]
+    second = adapter.fetch_permission_fingerprints(_instance("oracle"), connection, ["APP_USER", "REPORTER", "NOBODY"])
+
+    assert first is not None
+    assert second is not None
+    assert len(connection.queries) == 2
+    assert "GROUP BY grantee" in connection.queries[0]
+    assert set(first) == {"APP_USER", "REPORTER", "NOBODY"}
+    assert first["APP_USER"] != second["APP_USER"]
+    assert first["REPORTER"] == second["REPORTER"]
+
+
+class _SQLServerFingerprintConnection:
+    def __init__(self, database_rows: list[tuple[Any, ...]]) -> None:
+        self.database_rows = database_rows
+        self.queries: list[str] = []
+
+    def execute_query(self, sql: str, _params: Any = None) -> list[tuple[Any, ...]]:
+        self.queries.append(sql)
+        if "sys.server_principals sp" in sql and "OUTER APPLY" in sql:
+            return [
+                ("app_login", b"\x01", "2026-07-01T08:00:00", 1, 11, 2, 22),
+                ("report_login", b"\x02", "2026-07-01T08:00:00", 0, None, 1, 33),
+            ]
+        if "FROM sys.databases" in sql:
+            return [("AppDb",), ("ReportDb",)]
+        return self.database_rows
+
+
+@pytest.mark.unit
+def test_sqlserver_fingerprints_merge_database_rows_by_sid() -> None:
+    adapter = SQLServerAccountAdapter()
+    connection = _SQLServerFingerprintConnection([("AppDb", b"\x01", 1, 5, 3, 7)])
+
+    first = adapter.fetch_permission_fingerprints(_instance("sqlserver"), connection, ["app_login", "report_login"])
+    connection.database_rows = [("AppDb", b"\x01", 1, 5, 4, 8)]
+    second = adapter.fetch_permission_fingerprints(_instance("sqlserver"), connection, ["app_login", "report_login"])
+
+    assert first is not None
+    assert second is not None
+    assert set(first) == {"app_login", "report_login"}
+    assert first["app_login"] != second["app_login"]
+    assert first["report_login"] == second["report_login"]
+    database_queries = [sql for sql in connection.queries if "database_principals dp" in sql]
+    assert len(database_queries) == 2
+    assert "[AppDb].sys.database_principals" in database_queries[0]
+    assert "[ReportDb].sys.database_principals" in database_queries[0]
+
+
+class _MySQLFingerprintConnection:
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+
+    def execute_query(self, sql: str, _params: Any = None) -> list[tuple[Any, ...]]:
+        self.queries.append(sql)
+        if "information_schema.COLUMNS" in sql:
+            return [
+                ("user", "Host"),
+                ("user", "User"),
+                ("user", "Select_priv"),
+                ("user", "authentication_string"),
+                ("db", "Host"),
+                ("db", "Db"),
+                ("db", "User"),
+                ("db", "Select_priv"),
+                ("tables_priv", "Host"),
+                ("tables_priv", "User"),
+                ("tables_priv", "Table_priv"),
+                ("tables_priv", "Timestamp"),
+            ]
+        return [
+            ("user", "app@%", 1, 100),
+            ("db", "app@%", 2, 200),
+            ("user", "report@%", 1, 100),
+        ]
+
+
+@pytest.mark.unit
+def test_mysql_fingerprints_hash_existing_grant_tables_only() -> None:
+    adapter = MySQLAccountAdapter()
+    connection = _MySQLFingerprintConnection()
+
+    fingerprints = adapter.fetch_permission_fingerprints(_instance("mysql"), connection, ["app@%", "report@%"])
+
+    assert fingerprints is not None
+    assert set(fingerprints) == {"app@%", "report@%"}
+    assert fingerprints["app@%"] != fingerprints["report@%"]
+    aggregate_sql = connection.queries[1]
+    assert "FROM mysql.user" in aggregate_sql
+    assert "FROM mysql.db" in aggregate_sql
+    assert "FROM mysql.tables_priv" in aggregate_sql
+    assert "mysql.role_edges" not in aggregate_sql
+    assert "authentication_string" not in aggregate_sql
+    assert "`Timestamp`" not in aggregate_sql
+    assert "`Db`, `Select_priv`" in aggregate_sql
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from typing import Any, cast
+
+import oracledb  # type: ignore[import-not-found]
+import pytest
+
+from app.models.instance import Instance
+from app.services.accounts_sync.adapters.oracle_adapter import OracleAccountAdapter
+
+_ROLE_GRANTS = {"APP_USER": ["CONNECT", "RESOURCE"], "REPORTER": ["CONNECT"]}
+_SYS_GRANTS = {"APP_USER": ["CREATE SESSION"], "AUDITOR": ["SELECT ANY DICTIONARY"]}
+
+
+def _grant_rows(sql: str, usernames: list[str]) -> list[tuple[str, str]]:
+    grants = _ROLE_GRANTS if "dba_role_privs" in sql else _SYS_GRANTS
+    return [(user, granted) for user in usernames for granted in grants.get(user, [])]
+
+
+class _PerUserOracleConnection:
+    def execute_query(self, sql: str, params: dict[str, str]) -> list[tuple[str]]:
+        return [(granted,) for _user, granted in _grant_rows(sql, [params[":1"]])]
+
+
+class _CollectionBindOracleConnection:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, object, int | None]] = []
+
+    def create_string_collection(self, values: list[str]) -> list[str]:
+        return list(values)
+
+    def execute_query(self, sql: str, params: dict[str, list[str]], *, arraysize: int | None = None) -> list[tuple]:
+        self.calls.append((sql, params, arraysize))
+        return _grant_rows(sql, params["names"])
+
+
+class _InListOracleConnection:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, list[str]]] = []
+
+    def execute_query(self, sql: str, params: list[str]) -> list[tuple]:
+        self.calls.append((sql, list(params)))
+        return _grant_rows(sql, list(params))
+
+
+class _FailingBulkOracleConnection(_PerUserOracleConnection):
+    def create_string_collection(self, values: list[str]) -> list[str]:
+        del values
+        raise oracledb.DatabaseError("ORA-04043: object SYS.ODCIVARCHAR2LIST does not exist")
+
+
+def _instance() -> Instance:
+    return Instance(name="ora", db_type="oracle", host="127.0.0.1", port=1521, description=None, is_active=True)
+
+
+def _accounts() -> list[dict[str, Any]]:
+    return [
+        {"username": name, "permissions": {"oracle_roles": [], "oracle_system_privileges": [], "type_specific": {}}}
+        for name in ("APP_USER", "AUDITOR", "REPORTER", "NOBODY")
+    ]
+
+
+def _per_user_permissions() -> dict[str, object]:
+    adapter = OracleAccountAdapter()
+    return {
+        name: adapter._get_user_permissions(_PerUserOracleConnection(), name)
+        for name in ("APP_USER", "AUDITOR", "REPORTER", "NOBODY")
+    }
+
+
+@pytest.mark.unit
+def test_enrich_permissions_uses_one_collection_bind_query_per_view() -> None:
+    connection = _CollectionBindOracleConnection()
+
+    enriched = OracleAccountAdapter().enrich_permissions(_instance(), connection, cast(Any, _accounts()))
+
+    assert len(connection.calls) == 2
+    assert all("TABLE(:names)" in sql and arraysize == 1000 for sql, _params, arraysize in connection.calls)
+    assert {account["username"]: account["permissions"] for account in enriched} == _per_user_permissions()
+
+
+@pytest.mark.unit
+def test_enrich_permissions_bulk_falls_back_to_in_list_binds(monkeypatch: pytest.MonkeyPatch) -> None:
+    from app.services.accounts_sync.adapters import oracle_adapter
+
+    monkeypatch.setattr(oracle_adapter, "ORACLE_BULK_IN_LIST_SIZE", 3)
+    connection = _InListOracleConnection()
+
+    enriched = OracleAccountAdapter().enrich_permissions(_instance(), connection, cast(Any, _accounts()))
+
+    assert [params for _sql, params in connection.calls] == [
+        ["APP_USER", "AUDITOR", "NOBODY"],
+        ["REPORTER"],
+        ["APP_USER", "AUDITOR", "NOBODY"],
+        ["REPORTER"],
+    ]
+    assert "IN (:1,:2,:3)" in connection.calls[0][0]
+    assert {account["username"]: account["permissions"] for account in enriched} == _per_user_permissions()
+
+
+@pytest.mark.unit
+def test_enrich_permissions_falls_back_to_per_user_queries_when_bulk_fails() -> None:
+    enriched = OracleAccountAdapter().enrich_permissions(
+        _instance(),
+        _FailingBulkOracleConnection(),
+        cast(Any, _accounts()),
+    )
+
+    assert {account["username"]: account["permissions"] for account in enriched} == _per_user_permissions()
@@ -76,6 +76,7 @@ class _PagedConnection:
         self.entries: list[_Entry] = []
         self.result: dict[str, object] = {}
         self.calls: list[tuple[str, bytes | None]] = []
+        self.server: SimpleNamespace | None = None
 
     def search(
         self,
@@ -239,3 +240,83 @@ def test_ldap_provider_rejects_base_dn_with_dotted_dc_before_connecting(monkeypa
 
     with pytest.raises(ValidationError, match="Base DN 的 DC 片段不能包含点号"):
         LdapProvider().fetch_principals(cast(AdDomainConfig, config))
+
+
+@pytest.mark.unit
+def test_ldap_provider_fetches_changes_after_usn_watermark_and_looks_up_unmatched_names() -> None:
+    class _IncrementalConnection:
+        def __init__(self) -> None:
+            self.server = SimpleNamespace(
+                info=SimpleNamespace(
+                    other={
+                        "highestCommittedUSN": ["250"],
+                        "dsServiceName": ["CN=NTDS Settings,CN=DC01"],
+                        "defaultNamingContext": ["DC=corp,DC=example,DC=com"],
+                    }
+                )
+            )
+            self.entries: list[_Entry] = []
+            self.result: dict[str, object] = {}
+            self.searches: list[tuple[str, str, object]] = []
+
+        def search(self, base_dn: str, search_filter: str, *, attributes: list[str], **kwargs: object) -> bool:
+            assert "sAMAccountName" in attributes
+            self.searches.append((base_dn, search_filter, kwargs.get("controls")))
+            self.entries = []
+            if "isDeleted=TRUE" in search_filter:
+                self.entries = [_Entry({"sAMAccountName": ["Bob"]}), _Entry({"sAMAccountName": ["alice"]})]
+            elif "objectCategory=person" in search_filter and "uSNChanged>=201" in search_filter:
+                self.entries = [_Entry({"sAMAccountName": ["alice"], "userAccountControl": [514]})]
+            elif "objectCategory=person" in search_filter and "sAMAccountName=dave" in search_filter:
+                self.entries = [_Entry({"sAMAccountName": ["dave"], "userAccountControl": [512]})]
+            return True
+
+    connection = _IncrementalConnection()
+
+    result = LdapProvider._fetch_changes_with_connection(
+        connection,
+        "OU=Users,DC=corp,DC=example,DC=com",
+        controller="dc01.corp.example.com",
+        watermark=ldap_provider.AdUsnWatermark("dc01.corp.example.com", 200, "CN=NTDS Settings,CN=DC01"),
+        lookup_names=["alice", "dave", "ghost"],
+    )
+
+    assert result.incremental is True
+    assert set(result.principals) == {"alice", "dave"}
+    assert result.principals["alice"].is_disabled is True
+    assert result.deleted_names == frozenset({"bob"})
+    assert result.watermark == ldap_provider.AdUsnWatermark("dc01.corp.example.com", 250, "CN=NTDS Settings,CN=DC01")
+    assert connection.searches[:3] == [
+        (
+            "OU=Users,DC=corp,DC=example,DC=com",
+            "(&(&(objectClass=user)(objectCategory=person))(uSNChanged>=201))",
+            None,
+        ),
+        ("OU=Users,DC=corp,DC=example,DC=com", "(&(objectClass=group)(uSNChanged>=201))", None),
+        (
+            "DC=corp,DC=example,DC=com",
+            "(&(isDeleted=TRUE)(uSNChanged>=201)(|(objectClass=user)(objectClass=group)))",
+            [("1.2.840.113556.1.4.417", True, None)],
+        ),
+    ]
+    assert connection.searches[3][1] == (
+        "(&(&(objectClass=user)(objectCategory=person))(|(sAMAccountName=dave)(sAMAccountName=ghost)))"
+    )
+
+
+@pytest.mark.unit
+def test_ldap_provider_falls_back_to_full_fetch_when_controller_usn_rolled_back() -> None:
+    connection = _PagedConnection()
+    connection.server = SimpleNamespace(info=SimpleNamespace(other={"highestCommittedUSN": ["90"]}))
+
+    result = LdapProvider._fetch_changes_with_connection(
+        connection,
+        "DC=corp,DC=example,DC=com",
+        controller="dc01.corp.example.com",
+        watermark=ldap_provider.AdUsnWatermark("dc01.corp.example.com", 200),
+        lookup_names=[],
+    )
+
+    assert result.incremental is False
+    assert set(result.principals) == {"first", "second", "domain admins"}
+    assert result.watermark == ldap_provider.AdUsnWatermark("dc01.corp.example.com", 90)
@@ -16,10 +16,10 @@ class _Repository:
         self.account = account
         self.metrics = metrics or AccountLedgerMetrics(tags_map={}, classifications_map={})
 
-    def list_all_accounts(self, _filters: AccountFilters, *, sort_field: str, sort_order: str):
+    def iter_account_chunks(self, _filters: AccountFilters, *, sort_field: str, sort_order: str):
         assert sort_field == "username"
         assert sort_order == "asc"
-        return [self.account], self.metrics
+        yield [self.account], self.metrics
 
 
 def _filters() -> AccountFilters:
@@ -59,7 +59,7 @@ def test_account_export_csv_includes_ad_status_column() -> None:
     )
 
     result = AccountExportService(repository=cast(Any, _Repository(account))).export_accounts_csv(_filters())
-    rows = list(csv.reader(io.StringIO(result.content)))
+    rows = list(csv.reader(io.StringIO("".join(result.chunks))))
 
     assert rows[0] == ["名称", "实例名称", "IP地址", "标签", "数据库类型", "分类", "锁定状态", "AD状态"]
     assert rows[1][-1] == "AD已停用"
@@ -81,6 +81,36 @@ def test_account_export_csv_uses_classification_display_name() -> None:
     )
 
     result = AccountExportService(repository=cast(Any, _Repository(account, metrics))).export_accounts_csv(_filters())
-    rows = list(csv.reader(io.StringIO(result.content)))
+    rows = list(csv.reader(io.StringIO("".join(result.chunks))))
 
     assert rows[1][5] == "高权限账户"
+
+
+@pytest.mark.unit
+def test_account_export_csv_streams_rows_per_chunk() -> None:
+    accounts = [
+        SimpleNamespace(
+            id=index,
+            instance_id=1,
+            username=f"user_{index}",
+            is_locked=False,
+            instance=SimpleNamespace(name="mysql-prod", host="127.0.0.1", db_type="mysql"),
+            instance_account=None,
+        )
+        for index in range(3)
+    ]
+    fetched: list[int] = []
+
+    class _ChunkedRepository:
+        def iter_account_chunks(self, _filters: AccountFilters, *, sort_field: str, sort_order: str):
+            del sort_field, sort_order
+            for account in accounts:
+                fetched.append(account.id)
+                yield [account], AccountLedgerMetrics(tags_map={}, classifications_map={})
+
+    result = AccountExportService(repository=cast(Any, _ChunkedRepository())).export_accounts_csv(_filters())
+
+    assert fetched == []
+    rows = list(csv.reader(io.StringIO("".join(result.chunks))))
+    assert fetched == [0, 1, 2]
+    assert [row[0] for row in rows[1:]] == ["user_0@127.0.0.1", "user_1@127.0.0.1", "user_2@127.0.0.1"]
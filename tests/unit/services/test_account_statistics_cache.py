@@ -0,0 +1,73 @@
+import pytest
+
+from app import create_app
+from app.services.statistics.account_statistics_cache import (
+    AccountStatisticsCache,
+    invalidate_account_statistics_cache,
+)
+from app.settings import Settings
+
+
+@pytest.fixture(scope="function")
+def app(monkeypatch):
+    monkeypatch.setenv("FLASK_ENV", "testing")
+    monkeypatch.setenv("CACHE_TYPE", "simple")
+    monkeypatch.delenv("CACHE_REDIS_URL", raising=False)
+
+    app = create_app(init_scheduler_on_start=False, settings=Settings.load())
+    app.config["TESTING"] = True
+    return app
+
+
+@pytest.mark.unit
+def test_account_statistics_cache_reuses_value_within_generation(app) -> None:
+    calls: list[int] = []
+
+    def _loader() -> dict[str, int]:
+        calls.append(1)
+        return {"total_accounts": len(calls)}
+
+    with app.app_context():
+        cache = AccountStatisticsCache()
+        first, generation = cache.get_or_load("summary", _loader, db_type="mysql")
+        second, same_generation = cache.get_or_load("summary", _loader, db_type="mysql")
+        other, _ = cache.get_or_load("summary", _loader, db_type="oracle")
+
+    assert first == second == {"total_accounts": 1}
+    assert same_generation == generation
+    assert other == {"total_accounts": 2}
+    assert len(calls) == 2
+
+
+@pytest.mark.unit
+def test_account_statistics_cache_invalidation_bumps_generation(app) -> None:
+    calls: list[int] = []
+
+    def _loader() -> int:
+        calls.append(1)
+        return len(calls)
+
+    with app.app_context():
+        cache = AccountStatisticsCache()
+        value, generation = cache.get_or_load("snapshot", _loader)
+        invalidate_account_statistics_cache(reason="sync_accounts")
+        refreshed, new_generation = cache.get_or_load("snapshot", _loader)
+
+    assert value == 1
+    assert refreshed == 2
+    assert new_generation > generation
+
+
+@pytest.mark.unit
+def test_account_statistics_cache_disabled_when_ttl_is_zero(app) -> None:
+    calls: list[int] = []
+
+    def _loader() -> int:
+        calls.append(1)
+        return len(calls)
+
+    app.config["CACHE_ACCOUNT_STATISTICS_TTL"] = 0
+    with app.app_context():
+        cache = AccountStatisticsCache()
+        assert cache.get_or_load("snapshot", _loader) == (1, 0)
+        assert cache.get_or_load("snapshot", _loader) == (2, 0)
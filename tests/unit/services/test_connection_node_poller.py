@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from app.services.connection_adapters.node_poller import ConcurrentNodePoller
+
+
+@pytest.mark.unit
+def test_node_poller_returns_results_and_errors_in_input_order() -> None:
+    poller = ConcurrentNodePoller(max_concurrency=3, node_timeout_seconds=5)
+
+    def _probe(key: int) -> int:
+        if key == 2:
+            raise ConnectionError("node 2 down")
+        time.sleep(0.01 * (5 - key))
+        return key * 10
+
+    results = poller.poll(_probe, [1, 2, 3, 4])
+
+    assert results[0] == 10
+    assert isinstance(results[1], ConnectionError)
+    assert results[2:] == [30, 40]
+
+
+@pytest.mark.unit
+def test_node_poller_bounds_concurrency() -> None:
+    poller = ConcurrentNodePoller(max_concurrency=2, node_timeout_seconds=5)
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def _probe(key: int) -> int:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+        return key
+
+    assert poller.poll(_probe, list(range(6))) == list(range(6))
+    assert peak == 2
+
+
+@pytest.mark.unit
+def test_node_poller_times_out_slow_node_without_blocking_others() -> None:
+    poller = ConcurrentNodePoller(max_concurrency=2, node_timeout_seconds=0.1)
+    release = threading.Event()
+
+    def _probe(key: str) -> str:
+        if key == "slow":
+            release.wait(2)
+        return key
+
+    started = time.monotonic()
+    results = poller.poll(_probe, ["slow", "fast"])
+    release.set()
+
+    assert time.monotonic() - started < 1.0
+    assert isinstance(results[0], TimeoutError)
+    assert results[1] == "fast"
+
+
+@pytest.mark.unit
+def test_node_poller_iter_poll_yields_in_completion_order_and_honours_deadline() -> None:
+    poller = ConcurrentNodePoller(max_concurrency=3, node_timeout_seconds=5)
+    release = threading.Event()
+
+    def _probe(key: str) -> str:
+        if key == "hung":
+            release.wait(2)
+        elif key == "slow":
+            time.sleep(0.05)
+        return key
+
+    started = time.monotonic()
+    outcomes = list(poller.iter_poll(_probe, ["hung", "slow", "fast"], deadline_seconds=0.2))
+    release.set()
+
+    assert time.monotonic() - started < 1.0
+    assert [index for index, _ in outcomes] == [2, 1, 0]
+    assert outcomes[0][1] == "fast"
+    assert outcomes[1][1] == "slow"
+    assert isinstance(outcomes[2][1], TimeoutError)
+
+
+@pytest.mark.unit
+def test_node_poller_skips_nodes_whose_previous_probe_is_still_running() -> None:
+    poller = ConcurrentNodePoller(max_concurrency=2, node_timeout_seconds=0.05)
+    release = threading.Event()
+    calls: list[str] = []
+
+    def _probe(key: str) -> str:
+        calls.append(key)
+        if key == "stuck":
+            release.wait(2)
+        return key
+
+    first = poller.poll(_probe, ["stuck", "ok"], node_id=lambda key: key)
+    second = poller.poll(_probe, ["stuck", "ok"], node_id=lambda key: key)
+    release.set()
+    time.sleep(0.05)
+    third = poller.poll(_probe, ["stuck", "ok"], node_id=lambda key: key)
+
+    assert isinstance(first[0], TimeoutError)
+    assert isinstance(second[0], TimeoutError)
+    assert "本轮跳过" in str(second[0])
+    assert first[1] == second[1] == "ok"
+    assert third == ["stuck", "ok"]
+    assert calls.count("stuck") == 2
+
+
+@pytest.mark.unit
+def test_node_poller_reuses_bounded_pool_when_probes_hang() -> None:
+    poller = ConcurrentNodePoller(max_concurrency=1, node_timeout_seconds=0.05)
+    release = threading.Event()
+
+    def _probe(key: str) -> str:
+        if key == "hung":
+            release.wait(2)
+        return key
+
+    baseline = threading.active_count()
+    first = poller.poll(_probe, ["hung"])
+    started = time.monotonic()
+    second = poller.poll(_probe, ["queued"])
+    elapsed = time.monotonic() - started
+    threads_while_hung = threading.active_count() - baseline
+    release.set()
+
+    assert isinstance(first[0], TimeoutError)
+    assert isinstance(second[0], TimeoutError)
+    assert "排队超时" in str(second[0])
+    assert elapsed < 2.0
+    assert threads_while_hung <= 1
+    assert poller.poll(_probe, ["after"]) == ["after"]
+
+
+@pytest.mark.unit
+def test_node_poller_factory_shares_one_poller_per_config() -> None:
+    assert ConcurrentNodePoller.for_cluster_status() is ConcurrentNodePoller.for_cluster_status()
+    assert ConcurrentNodePoller.for_cluster_status() is not ConcurrentNodePoller.for_connection_batch_test()
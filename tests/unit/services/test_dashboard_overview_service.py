@@ -79,6 +79,16 @@ def test_dashboard_overview_uses_instance_total_that_includes_deleted(monkeypatc
             {"summarize_latest_stats": staticmethod(lambda _filters: ([], 0, 0, 0))},
         )(),
     )
+    monkeypatch.setattr(
+        dashboard_module.InstanceReachabilityRepository,
+        "count_by_status",
+        staticmethod(lambda: {"up": 80, "down": 2}),
+    )
+    monkeypatch.setattr(
+        dashboard_module.InstanceReachabilityRepository,
+        "average_availability",
+        staticmethod(lambda: 0.98765),
+    )
     monkeypatch.setattr(dashboard_module, "log_info", lambda *args, **kwargs: None)
     monkeypatch.setattr(dashboard_module, "log_warning", lambda *args, **kwargs: None)
 
@@ -114,3 +124,4 @@ def test_dashboard_overview_uses_instance_total_that_includes_deleted(monkeypatc
         "inactive": 1,
         "deleted": 1,
     }
+    assert overview["reachability"] == {"up": 80, "down": 2, "unknown": 0, "availability_percent": 98.77}
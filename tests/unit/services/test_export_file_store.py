@@ -0,0 +1,59 @@
+import os
+
+import pytest
+
+from app.services.files.export_file_store import ExportFileStore
+
+
+@pytest.mark.unit
+def test_export_file_store_writes_atomically(tmp_path) -> None:
+    store = ExportFileStore(root=tmp_path / "exports")
+
+    info = store.write("abc-123", iter(["a,b\n", "1,2\n"]))
+
+    assert info.path.read_text(encoding="utf-8") == "a,b\n1,2\n"
+    assert info.size_bytes == len("a,b\n1,2\n")
+    assert store.stat("abc-123") is not None
+    assert store.stat("def-456") is None
+    assert not list((tmp_path / "exports").glob("*.part"))
+
+
+@pytest.mark.unit
+def test_export_file_store_removes_part_file_on_failure(tmp_path) -> None:
+    store = ExportFileStore(root=tmp_path)
+
+    def _chunks():
+        yield "a,b\n"
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        store.write("abc-123", _chunks())
+
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.unit
+def test_export_file_store_rejects_path_traversal(tmp_path) -> None:
+    store = ExportFileStore(root=tmp_path)
+
+    with pytest.raises(ValueError):
+        store.path_for("../etc/passwd")
+
+
+@pytest.mark.unit
+def test_export_file_store_cleanup_expired(tmp_path) -> None:
+    store = ExportFileStore(root=tmp_path)
+    old = store.write("aaa-1", ["x\n"]).path
+    fresh = store.write("bbb-2", ["y\n"]).path
+    unrelated = tmp_path / "keep.txt"
+    unrelated.write_text("z", encoding="utf-8")
+
+    now = fresh.stat().st_mtime
+    os.utime(old, (now - 3 * 3600, now - 3 * 3600))
+
+    removed = store.cleanup_expired(ttl_hours=2, now=now)
+
+    assert removed == 1
+    assert not old.exists()
+    assert fresh.exists()
+    assert unrelated.exists()
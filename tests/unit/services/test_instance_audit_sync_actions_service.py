@@ -54,7 +54,7 @@ def test_instance_audit_sync_actions_service_persists_snapshot_and_session(app)
         db.session.commit()
 
         class _FakeAuditSyncService:
-            def sync_instance_audit(self, *, instance):  # type: ignore[no-untyped-def]
+            def sync_instance_audit(self, *, instance, **_kwargs):  # type: ignore[no-untyped-def]
                 del instance
                 return {
                     "snapshot": {
@@ -147,7 +147,7 @@ def test_instance_audit_sync_actions_service_keeps_completed_session_for_partial
         db.session.commit()
 
         class _FakeAuditSyncService:
-            def sync_instance_audit(self, *, instance):  # type: ignore[no-untyped-def]
+            def sync_instance_audit(self, *, instance, **_kwargs):  # type: ignore[no-untyped-def]
                 del instance
                 return {
                     "snapshot": {
@@ -233,7 +233,7 @@ def test_instance_audit_sync_actions_service_allows_disabled_instance_for_manual
         db.session.commit()
 
         class _FakeAuditSyncService:
-            def sync_instance_audit(self, *, instance):  # type: ignore[no-untyped-def]
+            def sync_instance_audit(self, *, instance, **_kwargs):  # type: ignore[no-untyped-def]
                 del instance
                 return {
                     "snapshot": {
@@ -271,3 +271,62 @@ def test_instance_audit_sync_actions_service_allows_disabled_instance_for_manual
 
         assert result.success is True
         assert result.http_status == 200
+
+
+@pytest.mark.unit
+def test_instance_audit_sync_actions_service_keeps_snapshot_when_content_unchanged(app) -> None:
+    _ensure_tables(app)
+
+    with app.app_context():
+        instance = Instance(
+            name="sqlserver-unchanged",
+            db_type="sqlserver",
+            host="127.0.0.1",
+            port=1433,
+            is_active=True,
+        )
+        db.session.add(instance)
+        db.session.commit()
+        previous_snapshot = {"server_audits": [{"name": "audit-main"}], "meta": {"content_hash": "hash-1"}}
+        db.session.add(
+            InstanceConfigSnapshot(
+                instance_id=instance.id,
+                db_type="sqlserver",
+                config_key="audit_info",
+                snapshot=previous_snapshot,
+                facts={"has_audit": True},
+            ),
+        )
+        db.session.commit()
+
+        received: dict[str, object] = {}
+
+        class _FakeAuditSyncService:
+            def sync_instance_audit(self, *, instance, previous_snapshot=None, previous_facts=None):  # type: ignore[no-untyped-def]
+                del instance
+                received["previous_snapshot"] = previous_snapshot
+                received["previous_facts"] = previous_facts
+                return {
+                    "snapshot": {"server_audits": [{"name": "should-not-be-written"}], "meta": {}},
+                    "facts": {"has_audit": False},
+                    "changed": False,
+                    "summary": {"audit_count": 1, "specification_count": 0},
+                }
+
+        service = InstanceAuditSyncActionsService(sync_service=_FakeAuditSyncService())
+        result = service.sync_instance_audit_info(instance_id=instance.id)
+
+        assert result.success is True
+        assert received["previous_snapshot"] == previous_snapshot
+        assert received["previous_facts"] == {"has_audit": True}
+
+        row = InstanceConfigSnapshot.query.filter_by(instance_id=instance.id, config_key="audit_info").one()
+        assert row.snapshot == previous_snapshot
+        assert row.facts == {"has_audit": True}
+        assert row.last_sync_time is not None
+
+        record = SyncInstanceRecord.query.filter_by(
+            session_id=result.result["session_id"], instance_id=instance.id
+        ).one()
+        assert record.items_updated == 0
+        assert record.sync_details["changed"] is False
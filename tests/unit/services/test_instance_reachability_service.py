@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Hashable, Iterable
+from datetime import timedelta
+from typing import cast
+
+import pytest
+
+from app import create_app, db
+from app.models.instance import Instance
+from app.models.instance_reachability import InstanceReachability
+from app.services.connection_adapters.tcp_prober import TcpProbeResult, TcpProbeTarget
+from app.services.connections.instance_reachability_service import InstanceReachabilityService, ReachabilityOptions
+from app.utils.time_utils import time_utils
+
+
+class _ScriptedProber:
+    """按轮次返回预设的可达结果."""
+
+    def __init__(self, rounds: list[dict[int, bool]]) -> None:
+        self._rounds = list(rounds)
+        self.probed_keys: list[list[Hashable]] = []
+
+    def probe(self, targets: Iterable[TcpProbeTarget]) -> dict[Hashable, TcpProbeResult]:
+        keys = [target.key for target in targets]
+        self.probed_keys.append(keys)
+        outcome = self._rounds.pop(0)
+        return {
+            key: TcpProbeResult(key=key, reachable=True, latency_ms=2.0)
+            if outcome.get(cast(int, key), True)
+            else TcpProbeResult(key=key, reachable=False, error="Connection refused")
+            for key in keys
+        }
+
+
+@pytest.mark.unit
+def test_reachability_probe_cycles_track_window_and_debounce_down_state() -> None:
+    app = create_app(init_scheduler_on_start=False)
+    app.config["TESTING"] = True
+
+    with app.app_context():
+        db.metadata.create_all(
+            bind=db.engine,
+            tables=[db.metadata.tables["instances"], db.metadata.tables["instance_reachability"]],
+        )
+        stable = Instance(name="stable", db_type="mysql", host="10.0.0.1", port=3306, is_active=True)
+        flaky = Instance(name="flaky", db_type="mysql", host="10.0.0.2", port=3306, is_active=True)
+        disabled = Instance(name="disabled", db_type="mysql", host="10.0.0.3", port=3306, is_active=False)
+        db.session.add_all([stable, flaky, disabled])
+        db.session.commit()
+        stable_id, flaky_id = int(stable.id), int(flaky.id)
+
+        prober = _ScriptedProber([{flaky_id: False}, {flaky_id: False}, {flaky_id: False}, {}])
+        service = InstanceReachabilityService(
+            options=ReachabilityOptions(window_size=3, down_threshold=2),
+            prober=prober,  # type: ignore[arg-type]
+        )
+
+        first = service.run_probe_cycle()
+        db.session.commit()
+        assert first == {"total": 2, "up": 1, "down": 0, "failed_probes": 1}
+        assert prober.probed_keys == [[stable_id, flaky_id]]
+        assert service.get_state(flaky_id).status == "unknown"  # type: ignore[union-attr]
+        assert service.known_down_reason(flaky_id) is None
+
+        service.run_probe_cycle()
+        db.session.commit()
+        state = service.get_state(flaky_id)
+        assert state is not None
+        assert state.status == "down"
+        assert state.consecutive_failures == 2
+        reason = service.known_down_reason(flaky_id)
+        assert reason is not None
+        assert "Connection refused" in reason
+        assert service.known_down_reason(stable_id) is None
+
+        service.run_probe_cycle()
+        service.run_probe_cycle()
+        db.session.commit()
+        db.session.expire_all()
+        flaky_state = service.get_state(flaky_id)
+        stable_state = service.get_state(stable_id)
+        assert flaky_state is not None
+        assert stable_state is not None
+        assert flaky_state.status == "up"
+        assert flaky_state.consecutive_failures == 0
+        assert len(flaky_state.recent_samples) == 3
+        assert flaky_state.availability_ratio is not None
+        assert math.isclose(flaky_state.availability_ratio, 1 / 3, abs_tol=1e-4)
+        assert flaky_state.last_down_at is not None
+        assert stable_state.availability_ratio == 1.0
+        assert stable_state.avg_latency_ms == 2.0
+        assert db.session.query(InstanceReachability).count() == 2
+
+
+@pytest.mark.unit
+def test_reachability_known_down_ignores_stale_state_and_disabled_skip() -> None:
+    app = create_app(init_scheduler_on_start=False)
+    app.config["TESTING"] = True
+
+    with app.app_context():
+        db.metadata.create_all(
+            bind=db.engine,
+            tables=[db.metadata.tables["instances"], db.metadata.tables["instance_reachability"]],
+        )
+        instance = Instance(name="down", db_type="mysql", host="10.0.0.9", port=3306, is_active=True)
+        db.session.add(instance)
+        db.session.flush()
+        state = InstanceReachability(
+            instance_id=instance.id,
+            status="down",
+            last_checked_at=time_utils.now(),
+            consecutive_failures=5,
+            recent_samples=[],
+        )
+        db.session.add(state)
+        db.session.commit()
+        instance_id = int(instance.id)
+
+        assert InstanceReachabilityService(options=ReachabilityOptions()).known_down_reason(instance_id)
+        assert (
+            InstanceReachabilityService(options=ReachabilityOptions(skip_sync_enabled=False)).known_down_reason(
+                instance_id
+            )
+            is None
+        )
+
+        state.last_checked_at = time_utils.now() - timedelta(seconds=600)
+        db.session.commit()
+        assert (
+            InstanceReachabilityService(options=ReachabilityOptions(stale_seconds=300)).known_down_reason(instance_id)
+            is None
+        )
@@ -272,3 +272,46 @@ def test_http_jumpserver_provider_surfaces_url_error_with_request_url_and_reason
             access_key_id="ak-id",
             access_key_secret="ak-secret",
         )
+
+
+@pytest.mark.unit
+def test_http_jumpserver_provider_fetches_remaining_pages_concurrently_by_offset() -> None:
+    captured_urls: list[str] = []
+
+    def _asset(index: int) -> dict[str, object]:
+        return {
+            "id": f"asset-{index}",
+            "name": f"mysql-{index}",
+            "address": f"10.0.0.{index}",
+            "port": 3306,
+            "platform": {"name": "MySQL"},
+        }
+
+    def _fake_opener(request, *, timeout: int, context) -> _FakeResponse:
+        _ = (timeout, context)
+        captured_urls.append(request.full_url)
+        offset = int(request.full_url.rsplit("offset=", 1)[1])
+        next_url = "/api/v1/assets/assets/?limit=2&offset=2" if offset == 0 else None
+        return _FakeResponse(
+            {
+                "count": 5,
+                "next": next_url,
+                "results": [_asset(index) for index in range(offset, min(offset + 2, 5))],
+            }
+        )
+
+    provider = HttpJumpServerProvider(opener=_fake_opener, max_concurrency=4)
+
+    result = provider.list_database_assets(
+        base_url="https://demo.jumpserver.org",
+        access_key_id="ak-id",
+        access_key_secret="ak-secret",
+    )
+
+    assert captured_urls[0] == "https://demo.jumpserver.org/api/v1/assets/assets/?limit=200&offset=0"
+    assert sorted(captured_urls[1:]) == [
+        "https://demo.jumpserver.org/api/v1/assets/assets/?limit=2&offset=2",
+        "https://demo.jumpserver.org/api/v1/assets/assets/?limit=2&offset=4",
+    ]
+    assert [asset.external_id for asset in result.assets] == [f"asset-{index}" for index in range(5)]
+    assert result.received_total == 5
@@ -178,6 +178,7 @@ def test_sync_once_writes_snapshots_updates_binding_and_finalizes_task_run() ->
         assert item is not None
         assert item.status == "completed"
         assert item.metrics_json["snapshots_written_total"] == 1
+        assert item.metrics_json["snapshots_changed_total"] == 1
 
 
 @pytest.mark.unit
@@ -47,3 +47,54 @@ def test_oracle_connection_is_thin_probe_failure_logs_fallback(monkeypatch) -> N
     assert event == "oracle_is_thin_check_failed_fallback"
     assert payload.get("fallback_reason") == "oracledb_is_thin_check_failed"
     assert isinstance(payload.get("exception"), RuntimeError)
+
+
+class _StubCursor:
+    def __init__(self) -> None:
+        self.arraysize = 100
+        self.prefetchrows = 2
+        self.executed: list[tuple[str, object]] = []
+
+    def execute(self, query: str, params: object) -> None:
+        self.executed.append((query, params))
+
+    def fetchall(self) -> list[tuple]:
+        return [("APP_USER", "CONNECT")]
+
+    def close(self) -> None:
+        return None
+
+
+class _StubCollectionType:
+    def newobject(self, values: list[str]) -> tuple[str, ...]:
+        return tuple(values)
+
+
+class _StubOracleDriverConnection:
+    def __init__(self) -> None:
+        self.cursor_obj = _StubCursor()
+        self.type_names: list[str] = []
+
+    def cursor(self) -> _StubCursor:
+        return self.cursor_obj
+
+    def gettype(self, name: str) -> _StubCollectionType:
+        self.type_names.append(name)
+        return _StubCollectionType()
+
+
+@pytest.mark.unit
+def test_oracle_connection_bulk_helpers_set_arraysize_and_build_collection_bind() -> None:
+    connection = oracle_adapter.OracleConnection(_StubInstance())  # type: ignore[arg-type]
+    driver_connection = _StubOracleDriverConnection()
+    connection.connection = driver_connection
+    connection.is_connected = True
+
+    names = connection.create_string_collection(["APP_USER", "REPORTER"])
+    rows = connection.execute_query("SELECT 1 FROM dual", {"names": names}, arraysize=1000)
+
+    assert driver_connection.type_names == ["SYS.ODCIVARCHAR2LIST"]
+    assert names == ("APP_USER", "REPORTER")
+    assert rows == [("APP_USER", "CONNECT")]
+    assert driver_connection.cursor_obj.arraysize == 1000
+    assert driver_connection.cursor_obj.prefetchrows == 1000
@@ -13,6 +13,7 @@ from app.models.credential import Credential
 from app.models.instance import Instance
 from app.models.instance_account import InstanceAccount
 from app.models.instance_config_snapshot import InstanceConfigSnapshot
+from app.models.instance_reachability import InstanceReachability
 from app.models.instance_size_aggregation import InstanceSizeAggregation
 from app.models.instance_size_stat import InstanceSizeStat
 from app.models.jumpserver_asset_snapshot import JumpServerAssetSnapshot
@@ -874,6 +875,57 @@ def test_risk_center_marks_mysql_replica_abnormal_on_replica_instance(app) -> No
         assert "cluster_abnormal" in replica_risks
 
 
+@pytest.mark.unit
+def test_risk_center_marks_instance_unreachable_from_reachability_probe(app) -> None:
+    now = datetime.now(UTC)
+    with app.app_context():
+        _create_tables()
+        db.metadata.create_all(bind=db.engine, tables=[db.metadata.tables["instance_reachability"]])
+        source = _create_veeam_source()
+        reachable = Instance(name="mysql-up", db_type="mysql", host="10.0.0.81", port=3306, is_active=True)
+        unreachable = Instance(name="mysql-down", db_type="mysql", host="10.0.0.82", port=3306, is_active=True)
+        db.session.add_all([reachable, unreachable])
+        db.session.flush()
+        for index, instance in enumerate([reachable, unreachable], start=1):
+            _add_recent_backup(source, instance, now)
+            _add_capacity(instance, now, index)
+            _add_audit_snapshot(instance, now, has_audit=True, enabled_count=1)
+        db.session.add_all(
+            [
+                InstanceReachability(
+                    instance_id=reachable.id,
+                    status="up",
+                    last_checked_at=now,
+                    consecutive_failures=0,
+                    recent_samples=[],
+                    availability_ratio=1.0,
+                ),
+                InstanceReachability(
+                    instance_id=unreachable.id,
+                    status="down",
+                    last_checked_at=now,
+                    last_down_at=now,
+                    last_error="Connection refused",
+                    consecutive_failures=3,
+                    recent_samples=[],
+                    availability_ratio=0.25,
+                ),
+            ]
+        )
+        db.session.commit()
+
+        cards = {card["name"]: card for card in _card_items(RiskCenterReadService().list_cards())}
+
+        assert "mysql-up" not in cards
+        card = cards["mysql-down"]
+        assert card["overall_severity"] == "high"
+        assert card["reachability"]["label"] == "不可达"
+        assert card["reachability"]["tone"] == "danger"
+        flags = [item for item in card["risk_flags"] if item["rule_key"] == "instance_unreachable"]
+        assert len(flags) == 1
+        assert flags[0]["detail"] == "连续 3 次探测失败: Connection refused"
+
+
 @pytest.mark.unit
 def test_risk_center_marks_mysql_failed_unknown_role_as_cluster_abnormal(app) -> None:
     now = datetime.now(UTC)
@@ -70,6 +70,8 @@ def test_scheduler_builtin_task_ids_and_functions_use_short_names() -> None:
 def test_scheduler_default_task_loading_adds_missing_tasks_without_replacing_existing(monkeypatch) -> None:
     class _ExistingJob:
         id = "sync_accounts"
+        executor = "default"
+        max_instances = 1
 
     class _FakeScheduler:
         def __init__(self) -> None:
@@ -81,6 +83,10 @@ def test_scheduler_default_task_loading_adds_missing_tasks_without_replacing_exi
         def get_job(self, job_id: str) -> _ExistingJob | None:
             return _ExistingJob() if job_id == "sync_accounts" else None
 
+        @staticmethod
+        def executor_alias(_name: str | None) -> str:
+            return "default"
+
         def add_job(self, _func, _trigger, **kwargs) -> None:
             self.added_job_ids.append(str(kwargs["id"]))
 
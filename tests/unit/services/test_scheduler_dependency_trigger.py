@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import pickle
+from typing import Any, cast
+
+import pytest
+from apscheduler.events import EVENT_JOB_EXECUTED, JobExecutionEvent
+
+from app import scheduler
+from app.core.types.scheduler import PipelineDispatch
+
+
+@pytest.mark.unit
+def test_dependency_trigger_never_fires_by_time_and_survives_pickle() -> None:
+    trigger = scheduler.DependencyTrigger(["sync_databases"], "upstream_instances")
+
+    restored = pickle.loads(pickle.dumps(trigger))
+
+    assert restored.get_next_fire_time(None, None) is None
+    assert restored.upstream == ("sync_databases",)
+    assert restored.scope == "upstream_instances"
+    assert str(restored) == "dependency[sync_databases]"
+    assert scheduler.resolve_pipeline_task_id("pipeline:calculate_database:r-1") == "calculate_database"
+    assert scheduler.resolve_pipeline_task_id("sync_accounts") == "sync_accounts"
+
+
+@pytest.mark.unit
+def test_schedule_job_registers_dependency_trigger(monkeypatch) -> None:
+    added: list[tuple[object, dict[str, object]]] = []
+
+    class _FakeScheduler:
+        def add_job(self, _func, trigger, **kwargs) -> None:
+            added.append((trigger, kwargs))
+
+    monkeypatch.setattr(scheduler, "scheduler", _FakeScheduler())
+
+    scheduler._schedule_job(
+        lambda: None,
+        "calculate_account",
+        "统计账户分类",
+        "dependency",
+        {},
+        depends_on=["sync_accounts"],
+    )
+
+    trigger, kwargs = added[0]
+    assert isinstance(trigger, scheduler.DependencyTrigger)
+    assert trigger.upstream == ("sync_accounts",)
+    assert kwargs == {"id": "calculate_account", "name": "统计账户分类"}
+
+
+@pytest.mark.unit
+def test_submit_pipeline_job_skips_when_downstream_already_queued() -> None:
+    class _Job:
+        def __init__(self, job_id: str) -> None:
+            self.id = job_id
+            self.executor = "default"
+
+    class _FakeApScheduler:
+        def __init__(self) -> None:
+            self.jobs: list[_Job] = []
+            self.added: list[dict[str, object]] = []
+
+        def get_jobs(self, jobstore: str | None = None) -> list[_Job]:
+            assert jobstore == scheduler.PIPELINE_JOBSTORE
+            return self.jobs
+
+        def get_job(self, job_id: str) -> _Job | None:
+            job = _Job(job_id)
+            job.executor = "cpu-processes"
+            return job
+
+        def add_job(self, func, trigger, **kwargs) -> None:
+            assert func is scheduler.run_pipeline_task
+            assert trigger == "date"
+            self.added.append(kwargs)
+            self.jobs.append(_Job(str(kwargs["id"])))
+
+    task_scheduler = scheduler.TaskScheduler.__new__(scheduler.TaskScheduler)
+    fake_scheduler = _FakeApScheduler()
+    task_scheduler.scheduler = cast(Any, fake_scheduler)
+    dispatch = PipelineDispatch(task_id="calculate_database", upstream_run_id="r-sync", instance_ids=(1, 3))
+
+    task_scheduler._submit_pipeline_job(dispatch)
+    task_scheduler._submit_pipeline_job(dispatch)
+
+    assert len(fake_scheduler.added) == 1
+    job_kwargs = fake_scheduler.added[0]
+    assert job_kwargs["id"] == "pipeline:calculate_database:r-sync"
+    assert job_kwargs["jobstore"] == scheduler.PIPELINE_JOBSTORE
+    assert job_kwargs["executor"] == "cpu-processes"
+    assert job_kwargs["kwargs"] == {
+        "task_id": "calculate_database",
+        "upstream_run_id": "r-sync",
+        "instance_ids": [1, 3],
+    }
+
+
+@pytest.mark.unit
+def test_pipeline_job_end_links_upstream_run_in_scheduler_process(monkeypatch) -> None:
+    linked: list[dict[str, object]] = []
+    monkeypatch.setattr(scheduler, "_link_pipeline_run", lambda **kwargs: linked.append(kwargs))
+
+    task_scheduler = scheduler.TaskScheduler.__new__(scheduler.TaskScheduler)
+    scheduled_at = scheduler.time_utils.now()
+
+    task_scheduler._link_pipeline_job(
+        JobExecutionEvent(EVENT_JOB_EXECUTED, "pipeline:calculate_database:r-sync", "pipeline", scheduled_at),
+    )
+    task_scheduler._link_pipeline_job(JobExecutionEvent(EVENT_JOB_EXECUTED, "sync_accounts", "default", scheduled_at))
+
+    assert linked == [
+        {"task_id": "calculate_database", "upstream_run_id": "r-sync", "started_since": scheduled_at},
+    ]
+    assert scheduler.parse_pipeline_job_id("pipeline:calculate_database") is None
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from typing import Any, cast
+
+import pytest
+
+from app import scheduler
+
+
+class _Job:
+    def __init__(self) -> None:
+        self.id = "sync_accounts"
+        self.name = "账户同步"
+        self.func_ref = "app.tasks.accounts_sync_tasks:sync_accounts"
+        self.args = ()
+        self.kwargs = {"limit": 10}
+        self.executor = "default"
+
+
+class _FakeApScheduler:
+    def __init__(self) -> None:
+        self.added: list[tuple[str, str, dict[str, object]]] = []
+
+    def get_job(self, job_id: str) -> _Job | None:
+        return _Job() if job_id == "sync_accounts" else None
+
+    def add_job(self, func, trigger, **kwargs) -> None:
+        self.added.append((func, trigger, kwargs))
+
+
+@pytest.mark.unit
+def test_dispatch_manual_run_writes_one_off_job_to_shared_jobstore() -> None:
+    task_scheduler = scheduler.TaskScheduler.__new__(scheduler.TaskScheduler)
+    fake_scheduler = _FakeApScheduler()
+    task_scheduler.scheduler = cast(Any, fake_scheduler)
+    task_scheduler.jobstore_kind = "database"
+
+    manual_job_id = task_scheduler.dispatch_manual_run(job_id="sync_accounts", created_by=7)
+
+    func, trigger, kwargs = fake_scheduler.added[0]
+    assert task_scheduler.is_shared_jobstore is True
+    assert manual_job_id.startswith("manual:sync_accounts:")
+    assert func == "app.tasks.accounts_sync_tasks:sync_accounts"
+    assert trigger == "date"
+    assert kwargs["id"] == manual_job_id
+    assert kwargs["jobstore"] == scheduler.DEFAULT_JOBSTORE_ALIAS
+    assert kwargs["kwargs"] == {"limit": 10, "manual_run": True, "created_by": 7}
+    assert kwargs["misfire_grace_time"] is None
+
+
+@pytest.mark.unit
+def test_dispatch_manual_run_rejects_unknown_job() -> None:
+    task_scheduler = scheduler.TaskScheduler.__new__(scheduler.TaskScheduler)
+    task_scheduler.scheduler = cast(Any, _FakeApScheduler())
+
+    with pytest.raises(LookupError):
+        task_scheduler.dispatch_manual_run(job_id="missing", created_by=None)
@@ -1,3 +1,4 @@
+import time
 from typing import Any, cast
 
 import pymssql  # type: ignore[import-not-found]
@@ -5,6 +6,7 @@ import pytest
 
 import app.models.sqlserver_cluster  # noqa: F401  # register SQLAlchemy relationship targets
 from app.models.instance import Instance
+from app.services.accounts_sync.adapters import sqlserver_adapter as sqlserver_adapter_module
 from app.services.accounts_sync.adapters.sqlserver_adapter import SQLServerAccountAdapter
 
 
@@ -266,3 +268,193 @@ def test_normalize_account_does_not_infer_sqlserver_is_locked_from_is_disabled()
     )
 
     assert normalized["is_locked"] is False
+
+
+class _FakeMSSQLDriverConnection:
+    def __init__(self) -> None:
+        self.msghandler: Any = None
+        self.non_queries: list[str] = []
+
+    def set_msghandler(self, handler: Any) -> None:
+        self.msghandler = handler
+
+    def execute_non_query(self, sql: str) -> None:
+        self.non_queries.append(sql)
+
+    def emit(self, text: str) -> None:
+        if self.msghandler is not None:
+            self.msghandler(0, 0, "srv", "", 0, text)
+
+
+class _StagingSQLServerConnection(_OpenJsonUnsupportedSQLServerConnection):
+    def __init__(self, *, fail_staging: bool = False) -> None:
+        super().__init__()
+        self.fail_staging = fail_staging
+        self.driver = _FakeMSSQLDriverConnection()
+        self.connection = type("_PymssqlConnection", (), {"_conn": self.driver})()
+
+    def execute_query(self, sql: str, params: object = None) -> list[tuple]:
+        if "CREATE TABLE #whalefall_target_logins" in sql and self.fail_staging:
+            raise pymssql.OperationalError("tempdb unavailable")
+        self.driver.emit(
+            "SQL Server parse and compile time: \n   CPU time = 3 ms, elapsed time = 4 ms.",
+        )
+        self.driver.emit(" SQL Server Execution Times:\n   CPU time = 1 ms,  elapsed time = 2 ms.")
+        return super().execute_query(sql, params)
+
+
+def _sqlserver_instance() -> Instance:
+    return Instance(
+        name="inst",
+        db_type="sqlserver",
+        host="127.0.0.1",
+        port=1433,
+        description=None,
+        is_active=True,
+    )
+
+
+@pytest.mark.unit
+def test_enrich_permissions_stages_targets_in_temp_tables_and_records_query_stats() -> None:
+    adapter = SQLServerAccountAdapter()
+    conn = _StagingSQLServerConnection()
+
+    enriched = adapter.enrich_permissions(
+        _sqlserver_instance(),
+        conn,
+        cast(Any, [{"username": "login1", "permissions": {"type_specific": {}}}]),
+    )
+
+    permissions = cast(dict[str, object], enriched[0]["permissions"])
+    assert permissions["sqlserver_server_roles"] == ["sysadmin"]
+    assert permissions["sqlserver_database_roles"] == {"DB1": ["db_owner"]}
+    staging_sql = conn.queries[0]
+    assert "CREATE TABLE #whalefall_target_sids" in staging_sql
+    assert "login1" not in staging_sql
+    permission_queries = [sql for sql in conn.queries[1:] if "sys.databases" not in sql and "DROP TABLE" not in sql]
+    assert permission_queries
+    assert all("login1" not in sql and "0x01" not in sql for sql in permission_queries)
+    assert any("FROM #whalefall_target_sids" in sql for sql in permission_queries)
+    assert "DROP TABLE #whalefall_target_sids" in conn.queries[-1]
+    assert conn.driver.non_queries == ["SET STATISTICS TIME ON", "SET STATISTICS TIME OFF"]
+    assert conn.driver.msghandler is None
+
+    stats = adapter.get_permission_query_stats()
+    assert stats is not None
+    assert stats["target_mode"] == "temp_table"
+    assert stats["staged_logins"] == 1
+    assert stats["staged_sids"] == 1
+    assert stats["statements"] == len(conn.queries)
+    assert stats["compile_cpu_ms"] == 3 * len(conn.queries)
+    assert stats["execute_elapsed_ms"] == 2 * len(conn.queries)
+    assert stats["statistics_captured"] is True
+
+
+@pytest.mark.unit
+def test_enrich_permissions_falls_back_to_inline_targets_when_staging_fails() -> None:
+    adapter = SQLServerAccountAdapter()
+    conn = _StagingSQLServerConnection(fail_staging=True)
+
+    enriched = adapter.enrich_permissions(
+        _sqlserver_instance(),
+        conn,
+        cast(Any, [{"username": "login1", "permissions": {"type_specific": {}}}]),
+    )
+
+    permissions = cast(dict[str, object], enriched[0]["permissions"])
+    assert permissions["sqlserver_database_roles"] == {"DB1": ["db_owner"]}
+    assert all("#whalefall_target" not in sql for sql in conn.queries)
+    stats = adapter.get_permission_query_stats()
+    assert stats is not None
+    assert stats["target_mode"] == "inline"
+
+
+@pytest.mark.unit
+def test_staged_database_permission_queries_do_not_depend_on_targets() -> None:
+    adapter = SQLServerAccountAdapter()
+
+    staged = adapter._build_staged_database_permission_queries(["DB1", "DB2"])
+    inline = adapter._build_database_permission_queries(["DB1", "DB2"], ["0x01"])
+
+    assert all("#whalefall_target_sids" in sql and "0x01" not in sql for sql in staged)
+    assert all("WITH target_sids" in sql and "FROM target_sids" in sql for sql in inline)
+    assert staged == adapter._build_staged_database_permission_queries(["DB1", "DB2"])
+
+
+class _MultiDatabaseSQLServerConnection:
+    databases = ("DB1", "DB2", "DB3", "DB4")
+
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+        self.connected = False
+
+    def connect(self) -> bool:
+        self.connected = True
+        return True
+
+    def disconnect(self) -> None:
+        self.connected = False
+
+    def execute_query(self, sql: str, params: object = None) -> list[tuple]:
+        del params
+        self.queries.append(sql)
+        if "CREATE TABLE #whalefall_target_logins" in sql:
+            return [("login1", b"\x01")]
+        if "FROM sys.databases" in sql:
+            return [(name,) for name in self.databases]
+        for index, name in enumerate(self.databases):
+            if f"FROM [{name}].sys." not in sql:
+                continue
+            # 越靠前的库越慢返回, 并发时完成顺序与批次顺序相反
+            time.sleep(0.01 * (len(self.databases) - index))
+            if "sys.database_role_members" in sql:
+                return [(name, f"role_{name}", 10)]
+            if "sys.database_permissions" in sql:
+                return [(name, "SELECT", 10, 1, 0, "OBJECT", "dbo", f"t_{name}", None)]
+            return [(name, "login1", 10, b"\x01")]
+        return []
+
+
+def _enrich_multi_database(
+    monkeypatch: pytest.MonkeyPatch, *, concurrency: int
+) -> tuple[
+    dict[str, object],
+    SQLServerAccountAdapter,
+    list[_MultiDatabaseSQLServerConnection],
+]:
+    monkeypatch.setattr(sqlserver_adapter_module, "SQLSERVER_DATABASE_PERMISSION_BATCH_SIZE", 1)
+    opened: list[_MultiDatabaseSQLServerConnection] = []
+
+    def _create_connection(_instance: object) -> _MultiDatabaseSQLServerConnection:
+        connection = _MultiDatabaseSQLServerConnection()
+        opened.append(connection)
+        return connection
+
+    monkeypatch.setattr(sqlserver_adapter_module.ConnectionFactory, "create_connection", _create_connection)
+    adapter = SQLServerAccountAdapter()
+    adapter._database_batch_concurrency = concurrency
+    enriched = adapter.enrich_permissions(
+        _sqlserver_instance(),
+        _MultiDatabaseSQLServerConnection(),
+        cast(Any, [{"username": "login1", "permissions": {"type_specific": {}}}]),
+    )
+    return cast(dict[str, object], enriched[0]["permissions"]), adapter, opened
+
+
+@pytest.mark.unit
+def test_enrich_permissions_runs_database_batches_concurrently_with_stable_ordering(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    serial_permissions, _, serial_opened = _enrich_multi_database(monkeypatch, concurrency=1)
+    parallel_permissions, adapter, parallel_opened = _enrich_multi_database(monkeypatch, concurrency=3)
+
+    assert serial_opened == []
+    assert len(parallel_opened) == 2
+    assert all(not connection.connected for connection in parallel_opened)
+    assert all("CREATE TABLE #whalefall_target_logins" in connection.queries[0] for connection in parallel_opened)
+    assert list(cast(dict, parallel_permissions["sqlserver_database_roles"])) == ["DB1", "DB2", "DB3", "DB4"]
+    assert list(cast(dict, parallel_permissions["sqlserver_database_permissions"])) == ["DB1", "DB2", "DB3", "DB4"]
+    assert parallel_permissions == serial_permissions
+    stats = adapter.get_permission_query_stats()
+    assert stats is not None
+    assert stats["connections"] == 3
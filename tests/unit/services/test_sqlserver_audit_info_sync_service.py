@@ -1,3 +1,5 @@
+from types import SimpleNamespace
+
 import pytest
 
 from app.services.config_sync.sqlserver_audit_info_sync_service import (
@@ -231,3 +233,104 @@ def test_collect_snapshot_keeps_server_level_data_when_one_database_fails(monkey
     assert snapshot["meta"]["failed_databases"] == ["AzureDevOps_AI-Lab"]
     assert snapshot["errors"][0]["reason"] == "DATABASE_NOT_READABLE"
     assert facts["warnings"] == ["DATABASE_AUDIT_SPECIFICATIONS_PARTIAL:AzureDevOps_AI-Lab"]
+
+
+class _FakeAuditServer:
+    """按 SQL 特征返回结果的 SQL Server 审计元数据桩."""
+
+    def __init__(self) -> None:
+        self.database_marks = {"db_a": 1, "db_b": 1}
+        self.database_actions = {"db_a": "SELECT", "db_b": "DELETE"}
+        self.unreadable: set[str] = set()
+        self.queries: list[str] = []
+
+    def connect(self) -> bool:
+        return True
+
+    def disconnect(self) -> None:
+        return None
+
+    def _database_names(self, sql: str) -> list[str]:
+        return [name for name in self.database_marks if f"N'{name}' AS database_name" in sql]
+
+    def execute_query(self, sql: str):  # type: ignore[no-untyped-def]
+        self.queries.append(sql)
+        names = self._database_names(sql)
+        if any(name in self.unreadable for name in names):
+            raise RuntimeError("(978, b'database is not readable')")
+        if "FROM sys.server_audits)" in sql:
+            return [(1, 1, "2026-01-01T00:00:00", 1, 1, "2026-01-01T00:00:00", 1)]
+        if "FROM sys.databases" in sql:
+            return [(name,) for name in self.database_marks]
+        if "MAX(das.modify_date)" in sql:
+            return [(name, 1, 1, f"2026-01-0{self.database_marks[name]}T00:00:00", 1) for name in names]
+        if "FROM sys.server_audits sa" in sql:
+            return [(1, "SIEM", "guid-1", "FILE", "CONTINUE", 1000, 1, None, None, "D:\\SQLAudit\\", 128, 10, 0)]
+        if "FROM sys.server_audit_specifications sas" in sql:
+            return [("server-spec", "guid-1", 1, None, None, "FAILED_LOGIN_GROUP", "SUCCESS AND FAILURE", "SERVER")]
+        return [
+            (name, f"{name}-spec", "guid-1", 1, None, None, self.database_actions[name], "SUCCESS", "DATABASE")
+            for name in names
+        ]
+
+
+def _spec_queries(server: _FakeAuditServer) -> list[str]:
+    return [sql for sql in server.queries if "dsd.audit_action_name" in sql or "sys.server_audits sa" in sql]
+
+
+@pytest.mark.unit
+def test_sync_instance_audit_skips_unchanged_parts_by_watermark() -> None:
+    server = _FakeAuditServer()
+    factory = SimpleNamespace(create_connection=lambda _instance: server)
+    service = SQLServerAuditInfoSyncService(connection_factory=factory)  # type: ignore[arg-type]
+    instance = SimpleNamespace(db_type="sqlserver")
+
+    first = service.sync_instance_audit(instance=instance)
+    assert first["changed"] is True
+    assert [spec["database_name"] for spec in first["snapshot"]["database_audit_specifications"]] == ["db_a", "db_b"]
+    # 两个库的审计规范合并为一条跨库 UNION 查询
+    database_spec_queries = [sql for sql in server.queries if "dsd.audit_action_name" in sql]
+    assert len(database_spec_queries) == 1
+    assert "UNION ALL" in database_spec_queries[0]
+
+    server.queries.clear()
+    second = service.sync_instance_audit(
+        instance=instance,
+        previous_snapshot=first["snapshot"],
+        previous_facts=first["facts"],
+    )
+    assert second["changed"] is False
+    assert _spec_queries(server) == []
+    assert second["snapshot"]["meta"]["collected_at"] == first["snapshot"]["meta"]["collected_at"]
+    assert second["facts"] == first["facts"]
+
+    server.queries.clear()
+    server.database_marks["db_b"] = 2
+    server.database_actions["db_b"] = "UPDATE"
+    third = service.sync_instance_audit(
+        instance=instance,
+        previous_snapshot=second["snapshot"],
+        previous_facts=second["facts"],
+    )
+    assert third["changed"] is True
+    spec_queries = _spec_queries(server)
+    assert len(spec_queries) == 1
+    assert "N'db_b' AS database_name" in spec_queries[0]
+    assert "N'db_a' AS database_name" not in spec_queries[0]
+    specs = {spec["database_name"]: spec for spec in third["snapshot"]["database_audit_specifications"]}
+    assert specs["db_a"]["actions"][0]["name"] == "SELECT"
+    assert specs["db_b"]["actions"][0]["name"] == "UPDATE"
+    assert third["snapshot"]["meta"]["refreshed_database_count"] == 1
+
+
+@pytest.mark.unit
+def test_collect_database_audit_specifications_falls_back_per_database_when_union_fails() -> None:
+    server = _FakeAuditServer()
+    server.unreadable.add("db_b")
+    service = SQLServerAuditInfoSyncService()
+
+    specs, errors = service._collect_database_audit_specifications(server, {"guid-1": "SIEM"})
+
+    assert [spec["database_name"] for spec in specs] == ["db_a"]
+    assert errors[0]["database_name"] == "db_b"
+    assert errors[0]["reason"] == "DATABASE_NOT_READABLE"
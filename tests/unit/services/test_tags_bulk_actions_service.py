@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import event
+
+from app import create_app, db
+from app.models.instance import Instance
+from app.models.tag import Tag, instance_tags
+from app.services.tags.tags_bulk_actions_service import TagsBulkActionsService
+
+
+@pytest.mark.unit
+def test_tags_bulk_actions_use_set_based_statements_and_return_affected_rows() -> None:
+    app = create_app(init_scheduler_on_start=False)
+    app.config["TESTING"] = True
+
+    with app.app_context():
+        db.metadata.create_all(
+            bind=db.engine,
+            tables=[db.metadata.tables["instances"], db.metadata.tables["tags"], instance_tags],
+        )
+        instances = [
+            Instance(name=f"mysql-{index}", db_type="mysql", host="127.0.0.1", port=3306 + index) for index in range(3)
+        ]
+        tags = [
+            Tag(name="prod", display_name="生产", category="env"),
+            Tag(name="core", display_name="核心", category="biz"),
+        ]
+        db.session.add_all([*instances, *tags])
+        db.session.flush()
+        db.session.execute(instance_tags.insert().values(instance_id=instances[0].id, tag_id=tags[0].id))
+        db.session.commit()
+
+        instance_ids = [instance.id for instance in instances]
+        tag_ids = [tag.id for tag in tags]
+        statements: list[str] = []
+
+        def _record(_conn, _cursor, statement, _parameters, _context, _executemany) -> None:  # type: ignore[no-untyped-def]
+            if "instance_tags" in statement and statement.lstrip().upper().startswith(("INSERT", "DELETE")):
+                statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", _record)
+        try:
+            service = TagsBulkActionsService()
+            assert service.assign(instance_ids=instance_ids, tag_ids=tag_ids, actor_id=None).assigned_count == 5
+            assert service.assign(instance_ids=instance_ids, tag_ids=tag_ids, actor_id=None).assigned_count == 0
+            assert service.remove(instance_ids=instance_ids, tag_ids=[tag_ids[1]], actor_id=None).removed_count == 3
+            assert service.remove_all(instance_ids=instance_ids[:2], actor_id=None).removed_count == 2
+        finally:
+            event.remove(db.engine, "before_cursor_execute", _record)
+
+        # 每个操作只发出一条写语句, 与实例数量无关
+        assert len(statements) == 4
+        remaining = db.session.execute(instance_tags.select()).all()
+        assert [(row.instance_id, row.tag_id) for row in remaining] == [(instance_ids[2], tag_ids[0])]
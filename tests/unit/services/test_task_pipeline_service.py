@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app import create_app, db
+from app.core.constants.scheduler_jobs import DEPENDENCY_SCOPE_ALL, DEPENDENCY_SCOPE_UPSTREAM_INSTANCES
+from app.core.types.scheduler import PipelineDispatch, TaskDependencySpec
+from app.models.task_run import TaskRun
+from app.models.task_run_item import TaskRunItem
+from app.services.scheduler.task_pipeline_service import TaskPipelineService
+from app.settings import Settings
+from app.utils.time_utils import UTC_TZ
+
+BASE = datetime(2026, 6, 1, 17, 0, tzinfo=UTC_TZ)
+
+
+@pytest.fixture(scope="function")
+def app(monkeypatch):
+    monkeypatch.setenv("FLASK_ENV", "testing")
+    monkeypatch.setenv("CACHE_TYPE", "simple")
+    monkeypatch.delenv("CACHE_REDIS_URL", raising=False)
+
+    app = create_app(init_scheduler_on_start=False, settings=Settings.load())
+    app.config["TESTING"] = True
+    with app.app_context():
+        db.metadata.create_all(
+            bind=db.engine,
+            tables=[db.metadata.tables["task_runs"], db.metadata.tables["task_run_items"]],
+        )
+    return app
+
+
+def _add_run(run_id: str, task_key: str, *, status: str, start_min: int, end_min: int | None) -> None:
+    run = TaskRun()
+    run.run_id = run_id
+    run.task_key = task_key
+    run.task_name = task_key
+    run.task_category = "capacity"
+    run.trigger_source = "scheduled"
+    run.status = status
+    run.started_at = BASE + timedelta(minutes=start_min)
+    run.completed_at = (BASE + timedelta(minutes=end_min)) if end_min is not None else None
+    run.progress_completed = 1
+    db.session.add(run)
+
+
+def _add_instance_item(run_id: str, instance_id: int, status: str) -> None:
+    item = TaskRunItem()
+    item.run_id = run_id
+    item.item_type = "instance"
+    item.item_key = str(instance_id)
+    item.item_name = f"inst-{instance_id}"
+    item.instance_id = instance_id
+    item.status = status
+    db.session.add(item)
+
+
+@pytest.mark.unit
+def test_plan_dispatches_scopes_downstream_to_completed_upstream_instances(app) -> None:
+    with app.app_context():
+        _add_run("r-agg-old", "calculate_database", status="completed", start_min=-1440, end_min=-1400)
+        _add_run("r-sync", "sync_databases", status="failed", start_min=0, end_min=30)
+        _add_instance_item("r-sync", 1, "completed")
+        _add_instance_item("r-sync", 2, "failed")
+        _add_instance_item("r-sync", 3, "completed")
+        db.session.commit()
+
+        dispatches = TaskPipelineService().plan_dispatches(
+            upstream_task_id="sync_databases",
+            dependents={
+                "calculate_database": TaskDependencySpec(
+                    upstream=("sync_databases",),
+                    scope=DEPENDENCY_SCOPE_UPSTREAM_INSTANCES,
+                ),
+                "calculate_account": TaskDependencySpec(upstream=("sync_accounts",), scope=DEPENDENCY_SCOPE_ALL),
+            },
+        )
+
+    assert dispatches == [
+        PipelineDispatch(task_id="calculate_database", upstream_run_id="r-sync", instance_ids=(1, 3)),
+    ]
+
+
+@pytest.mark.unit
+def test_plan_dispatches_waits_for_all_upstreams_and_skips_running_downstream(app) -> None:
+    spec = TaskDependencySpec(upstream=("sync_accounts", "sync_databases"), scope=DEPENDENCY_SCOPE_ALL)
+    with app.app_context():
+        _add_run("r-accounts", "sync_accounts", status="completed", start_min=0, end_min=20)
+        _add_run("r-databases", "sync_databases", status="running", start_min=0, end_min=None)
+        db.session.commit()
+
+        service = TaskPipelineService()
+        assert service.plan_dispatches(upstream_task_id="sync_accounts", dependents={"veeam": spec}) == []
+
+        run = TaskRun.query.filter_by(run_id="r-databases").one()
+        run.status = "completed"
+        run.completed_at = BASE + timedelta(minutes=40)
+        db.session.commit()
+        assert service.plan_dispatches(upstream_task_id="sync_databases", dependents={"veeam": spec}) == [
+            PipelineDispatch(task_id="veeam", upstream_run_id="r-databases"),
+        ]
+
+        _add_run("r-veeam", "veeam", status="running", start_min=41, end_min=None)
+        db.session.commit()
+        assert service.plan_dispatches(upstream_task_id="sync_databases", dependents={"veeam": spec}) == []
+
+
+@pytest.mark.unit
+def test_plan_dispatches_still_triggers_downstream_on_failed_upstream_and_links_run(app) -> None:
+    spec = TaskDependencySpec(upstream=("sync_accounts",), scope=DEPENDENCY_SCOPE_ALL)
+    with app.app_context():
+        _add_run("r-accounts", "sync_accounts", status="failed", start_min=0, end_min=5)
+        TaskRun.query.session.flush()
+        TaskRun.query.filter_by(run_id="r-accounts").one().error_message = "boom"
+        db.session.commit()
+
+        service = TaskPipelineService()
+        assert service.plan_dispatches(upstream_task_id="sync_accounts", dependents={"calculate_account": spec}) == [
+            PipelineDispatch(task_id="calculate_account", upstream_run_id="r-accounts"),
+        ]
+
+        _add_run("r-classify", "calculate_account", status="completed", start_min=6, end_min=7)
+        db.session.commit()
+        linked = service.link_upstream_run(
+            task_id="calculate_account",
+            upstream_run_id="r-accounts",
+            started_since=BASE + timedelta(minutes=5),
+        )
+        db.session.commit()
+
+        assert linked == "r-classify"
+        assert TaskRun.query.filter_by(run_id="r-classify").one().upstream_run_id == "r-accounts"
+
+
+@pytest.mark.unit
+def test_plan_dispatches_falls_back_to_all_instances_when_upstream_failed(app) -> None:
+    spec = TaskDependencySpec(upstream=("sync_databases",), scope=DEPENDENCY_SCOPE_UPSTREAM_INSTANCES)
+    with app.app_context():
+        _add_run("r-sync", "sync_databases", status="failed", start_min=0, end_min=30)
+        TaskRun.query.session.flush()
+        TaskRun.query.filter_by(run_id="r-sync").one().error_message = "boom"
+        _add_instance_item("r-sync", 1, "completed")
+        _add_instance_item("r-sync", 2, "failed")
+        db.session.commit()
+
+        dispatches = TaskPipelineService().plan_dispatches(
+            upstream_task_id="sync_databases",
+            dependents={"calculate_database": spec},
+        )
+
+    assert dispatches == [PipelineDispatch(task_id="calculate_database", upstream_run_id="r-sync", instance_ids=None)]
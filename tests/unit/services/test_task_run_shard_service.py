@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+
+from app import create_app, db
+from app.settings import Settings
+
+
+@pytest.fixture(scope="function")
+def app(monkeypatch):
+    monkeypatch.setenv("FLASK_ENV", "testing")
+    monkeypatch.setenv("CACHE_TYPE", "simple")
+    monkeypatch.delenv("CACHE_REDIS_URL", raising=False)
+
+    settings = Settings.load()
+    app = create_app(init_scheduler_on_start=False, settings=settings)
+    app.config["TESTING"] = True
+    with app.app_context():
+        db.metadata.create_all(
+            bind=db.engine,
+            tables=[
+                db.metadata.tables["task_runs"],
+                db.metadata.tables["task_run_items"],
+            ],
+        )
+    return app
+
+
+def _start_run(*, task_key: str = "sync_databases", item_count: int = 3) -> str:
+    from app.services.task_runs.task_runs_write_service import TaskRunItemInit, TaskRunsWriteService
+
+    service = TaskRunsWriteService()
+    run_id = service.start_run(
+        task_key=task_key,
+        task_name="数据库同步",
+        task_category="capacity",
+        trigger_source="scheduled",
+        created_by=None,
+        summary_json=None,
+        result_url=None,
+    )
+    service.init_items(
+        run_id,
+        items=[
+            TaskRunItemInit(item_type="instance", item_key=str(i), item_name=f"inst-{i}", instance_id=i)
+            for i in range(1, item_count + 1)
+        ],
+    )
+    db.session.commit()
+    return run_id
+
+
+def _options(node_id: str, *, shard_size: int = 2):
+    from app.services.task_runs.task_run_shard_service import TaskShardOptions
+
+    return TaskShardOptions(node_id=node_id, shard_size=shard_size, heartbeat_seconds=60, stale_seconds=90)
+
+
+@pytest.mark.unit
+def test_claim_items_claims_one_shard_for_node(app) -> None:
+    from app.models.task_run_item import TaskRunItem
+    from app.services.task_runs.task_runs_write_service import TaskRunsWriteService
+
+    with app.app_context():
+        run_id = _start_run()
+        service = TaskRunsWriteService()
+
+        first = service.claim_items(run_id, node_id="node-a:1", limit=2, stale_seconds=90)
+        second = service.claim_items(run_id, node_id="node-b:1", limit=2, stale_seconds=90)
+        db.session.commit()
+
+        assert [item.item_key for item in first] == ["1", "2"]
+        assert [item.item_key for item in second] == ["3"]
+        items = TaskRunItem.query.filter_by(run_id=run_id).order_by(TaskRunItem.id.asc()).all()
+        assert [item.claimed_by for item in items] == ["node-a:1", "node-a:1", "node-b:1"]
+        assert all(item.status == "running" and item.heartbeat_at is not None for item in items)
+        assert service.claim_items(run_id, node_id="node-c:1", limit=2, stale_seconds=90) == []
+
+
+@pytest.mark.unit
+def test_claim_items_reclaims_shard_with_stale_heartbeat(app) -> None:
+    from app.models.task_run_item import TaskRunItem
+    from app.services.task_runs.task_runs_write_service import TaskRunsWriteService
+    from app.utils.time_utils import time_utils
+
+    with app.app_context():
+        run_id = _start_run(item_count=1)
+        service = TaskRunsWriteService()
+        service.claim_items(run_id, node_id="node-a:1", limit=5, stale_seconds=90)
+        db.session.commit()
+
+        item = TaskRunItem.query.filter_by(run_id=run_id).one()
+        item.heartbeat_at = time_utils.now() - timedelta(seconds=120)
+        db.session.commit()
+
+        reclaimed = service.claim_items(run_id, node_id="node-b:1", limit=5, stale_seconds=90)
+        db.session.commit()
+
+        assert [row.item_key for row in reclaimed] == ["1"]
+        assert reclaimed[0].claimed_by == "node-b:1"
+        assert reclaimed[0].claim_count == 2
+
+
+@pytest.mark.unit
+def test_run_shards_processes_all_items_and_fails_item_when_handler_raises(app) -> None:
+    from app.models.task_run_item import TaskRunItem
+    from app.services.task_runs.task_run_shard_service import TaskRunShardService
+    from app.services.task_runs.task_runs_write_service import TaskRunsWriteService
+
+    with app.app_context():
+        run_id = _start_run()
+        task_runs_service = TaskRunsWriteService()
+
+        def _handler(item: TaskRunItem) -> None:
+            if item.item_key == "2":
+                raise RuntimeError("boom")
+            task_runs_service.complete_item(run_id, item_type="instance", item_key=item.item_key)
+            db.session.commit()
+
+        shard_service = TaskRunShardService(_options("node-a:1"), task_runs_service=task_runs_service)
+        processed = shard_service.run_shards(run_id, _handler, wait_for_others=True)
+
+        assert processed == 3
+        items = TaskRunItem.query.filter_by(run_id=run_id).order_by(TaskRunItem.id.asc()).all()
+        assert [item.status for item in items] == ["completed", "failed", "completed"]
+        assert "boom" in (items[1].error_message or "")
+
+
+@pytest.mark.unit
+def test_shard_worker_run_once_processes_claimable_runs(app) -> None:
+    from app.core.constants.scheduler_jobs import ShardedTask
+    from app.models.task_run_item import TaskRunItem
+    from app.services.task_runs.task_run_shard_service import TaskRunShardWorker
+
+    with app.app_context():
+        run_id = _start_run(task_key="sync_test_shards", item_count=2)
+        worker = TaskRunShardWorker(
+            app,
+            poll_seconds=1,
+            sharded_tasks={
+                "sync_test_shards": ShardedTask(
+                    handler_target=f"{__name__}:_complete_item_handler",
+                    item_types=("instance",),
+                ),
+            },
+        )
+
+        assert worker.run_once() == 2
+        items = TaskRunItem.query.filter_by(run_id=run_id).all()
+        assert all(item.status == "completed" for item in items)
+        assert worker.run_once() == 0
+
+
+def _complete_item_handler(item) -> None:
+    from app.services.task_runs.task_runs_write_service import TaskRunsWriteService
+
+    TaskRunsWriteService().complete_item(item.run_id, item_type=item.item_type, item_key=item.item_key)
+    db.session.commit()
@@ -70,3 +70,52 @@ def test_task_runs_read_service_list_runs_returns_paginated_items(app) -> None:
         assert result.pages == 1
         assert len(result.items) == 1
         assert result.items[0].run_id == run_id
+
+
+@pytest.mark.unit
+def test_task_runs_read_service_pipeline_reports_critical_path(app) -> None:
+    from datetime import datetime, timedelta
+
+    from app.models.task_run import TaskRun
+    from app.services.task_runs.task_runs_read_service import TaskRunsReadService
+    from app.utils.time_utils import UTC_TZ
+
+    _ensure_task_run_tables(app)
+    base = datetime(2026, 6, 1, 17, 0, tzinfo=UTC_TZ)
+
+    def _run(run_id: str, task_key: str, start_min: int, end_min: int, upstream: str | None) -> TaskRun:
+        run = TaskRun()
+        run.run_id = run_id
+        run.task_key = task_key
+        run.task_name = task_key
+        run.task_category = "account"
+        run.trigger_source = "scheduled"
+        run.status = "completed"
+        run.started_at = base + timedelta(minutes=start_min)
+        run.completed_at = base + timedelta(minutes=end_min)
+        run.upstream_run_id = upstream
+        return run
+
+    with app.app_context():
+        db.session.add_all(
+            [
+                _run("r-accounts", "sync_accounts", 0, 30, None),
+                _run("r-classify", "calculate_account", 30, 35, "r-accounts"),
+                _run("r-databases", "sync_databases", 31, 70, "r-accounts"),
+                _run("r-aggregate", "calculate_database", 71, 90, "r-databases"),
+            ],
+        )
+        db.session.commit()
+
+        result = TaskRunsReadService().get_run_pipeline("r-classify")
+
+    assert result.root_run_id == "r-accounts"
+    assert result.critical_path == ["r-accounts", "r-databases", "r-aggregate"]
+    assert result.wall_clock_seconds == 90 * 60
+    nodes = {node.run.run_id: node for node in result.nodes}
+    assert result.nodes[0].run.run_id == "r-accounts"
+    assert nodes["r-aggregate"].depth == 2
+    assert nodes["r-databases"].wait_seconds == 60
+    assert nodes["r-databases"].duration_seconds == 39 * 60
+    assert nodes["r-classify"].on_critical_path is False
+    assert nodes["r-aggregate"].on_critical_path is True
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import socket
+
+import pytest
+
+from app.services.connection_adapters.tcp_prober import NonBlockingTcpProber, TcpProbeTarget
+
+
+def _closed_port() -> int:
+    probe = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    probe.bind(("127.0.0.1", 0))
+    port = int(probe.getsockname()[1])
+    probe.close()
+    return port
+
+
+@pytest.mark.unit
+def test_tcp_prober_reports_open_and_closed_ports() -> None:
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(16)
+    open_port = int(listener.getsockname()[1])
+    closed_port = _closed_port()
+    try:
+        prober = NonBlockingTcpProber(timeout_seconds=2, max_in_flight=2)
+        results = prober.probe(
+            [
+                TcpProbeTarget(key=1, host="127.0.0.1", port=open_port),
+                TcpProbeTarget(key=2, host="127.0.0.1", port=closed_port),
+                TcpProbeTarget(key=3, host="127.0.0.1", port=open_port),
+                TcpProbeTarget(key=4, host="127.0.0.1", port=open_port),
+            ]
+        )
+    finally:
+        listener.close()
+
+    assert set(results) == {1, 2, 3, 4}
+    for key in (1, 3, 4):
+        assert results[key].reachable is True
+        assert results[key].latency_ms is not None
+        assert results[key].error is None
+    assert results[2].reachable is False
+    assert results[2].latency_ms is None
+    assert results[2].error
+
+
+@pytest.mark.unit
+def test_tcp_prober_reports_resolution_failure_without_connecting() -> None:
+    prober = NonBlockingTcpProber(timeout_seconds=1, max_in_flight=4)
+
+    results = prober.probe([TcpProbeTarget(key="bad", host="", port=0)])
+
+    assert results["bad"].reachable is False
+    assert results["bad"].error
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import pytest
+
+from app.services.veeam.http_client import VeeamStageTimings, VeeamTokenBucket
+
+
+@pytest.mark.unit
+def test_token_bucket_halves_rate_on_throttle_and_recovers_gradually() -> None:
+    bucket = VeeamTokenBucket(rate_per_second=10)
+
+    assert bucket.acquire() == 0
+    assert bucket.penalize(0.01) == 0.01
+    assert bucket.rate_per_second == 5
+    assert bucket.throttled_total == 1
+
+    bucket.reward()
+    assert bucket.rate_per_second == 6
+    for _ in range(10):
+        bucket.reward()
+    assert bucket.rate_per_second == 10
+
+
+@pytest.mark.unit
+def test_stage_timings_builds_histogram_per_stage() -> None:
+    timings = VeeamStageTimings()
+    timings.record(stage="restore_points", elapsed_ms=80, outcome="success")
+    timings.record(stage="restore_points", elapsed_ms=1200, outcome="success")
+    timings.record(stage="restore_points", elapsed_ms=45000, outcome="timeout")
+
+    snapshot = timings.snapshot()["restore_points"]
+
+    assert snapshot["requests_total"] == 3
+    assert snapshot["max_ms"] == 45000
+    assert snapshot["avg_ms"] == (80 + 1200 + 45000) // 3
+    assert snapshot["buckets"] == {"le_100": 1, "le_2500": 1, "gt_30000": 1}
+    assert snapshot["outcomes"] == {"success": 2, "timeout": 1}
+
+    timings.reset()
+    assert timings.snapshot() == {}
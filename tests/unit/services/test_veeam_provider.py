@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json
-from typing import Any
+from typing import Any, cast
 from urllib.error import URLError
 
 import pytest
@@ -148,7 +148,7 @@ def test_http_veeam_provider_requests_backups_first_then_restore_points_across_n
         )
         return _FakeResponse(payloads[len(captured_requests) - 1])
 
-    provider = HttpVeeamProvider(timeout_seconds=12, verify_ssl=True, opener=_fake_opener)
+    provider = HttpVeeamProvider(timeout_seconds=12, verify_ssl=True, opener=_fake_opener, max_concurrency=1)
 
     result = provider.list_machine_backups(
         server_host="veeam.example.com",
@@ -646,7 +646,7 @@ def test_http_veeam_provider_fetch_restore_point_records_skips_timeout_and_prese
             raise TimeoutError("The read operation timed out")
         return _FakeResponse(payloads[len(captured_urls) - 1])
 
-    provider = HttpVeeamProvider(opener=_fake_opener)
+    provider = HttpVeeamProvider(opener=_fake_opener, max_concurrency=1)
     session = VeeamProviderSession(
         base_url="https://veeam.example.com:9419",
         access_token="token-1",
@@ -748,7 +748,8 @@ def test_http_veeam_provider_retries_restore_points_timeout_once_after_delay(mon
         "https://veeam.example.com:9419/api/v1/backupObjects/backup-object-1/restorePoints",
         "https://veeam.example.com:9419/api/v1/backupObjects/backup-object-1/restorePoints",
     ]
-    assert sleep_calls == [1, 1]
+    # 仅超时重试前等待一次, 请求间隔改由令牌桶控制
+    assert sleep_calls == [1]
 
 
 @pytest.mark.unit
@@ -938,7 +939,7 @@ def test_http_veeam_provider_fetch_backup_file_items_tracks_progress_and_normali
         captured_urls.append(request.full_url)
         return _FakeResponse(payloads[len(captured_urls) - 1])
 
-    provider = HttpVeeamProvider(opener=_fake_opener)
+    provider = HttpVeeamProvider(opener=_fake_opener, max_concurrency=1)
     session = VeeamProviderSession(
         base_url="https://veeam.example.com:9419",
         access_token="token-1",
@@ -996,7 +997,7 @@ def test_http_veeam_provider_fetch_backup_file_items_skips_timeout_and_preserves
             raise TimeoutError("The read operation timed out")
         return _FakeResponse(payloads[len(captured_urls) - 1])
 
-    provider = HttpVeeamProvider(opener=_fake_opener)
+    provider = HttpVeeamProvider(opener=_fake_opener, max_concurrency=1)
     session = VeeamProviderSession(
         base_url="https://veeam.example.com:9419",
         access_token="token-1",
@@ -1018,3 +1019,158 @@ def test_http_veeam_provider_fetch_backup_file_items_skips_timeout_and_preserves
         "https://veeam.example.com:9419/api/v1/backups/backup-2/backupFiles",
         "https://veeam.example.com:9419/api/v1/backups/backup-2/backupFiles",
     ]
+
+
+@pytest.mark.unit
+def test_http_veeam_provider_fetches_restore_points_concurrently_and_keeps_input_order() -> None:
+    import threading
+
+    barrier = threading.Barrier(3, timeout=5)
+
+    def _fake_opener(request, *, timeout: int, context) -> _FakeResponse:
+        _ = (timeout, context)
+        barrier.wait()
+        backup_object_id = request.full_url.rsplit("/", 2)[-2]
+        index = backup_object_id.rsplit("-", 1)[-1]
+        return _FakeResponse(
+            {
+                "items": [
+                    {
+                        "machineName": f"db0{index}.domain.com",
+                        "creationTime": "2026-03-25T01:00:00Z",
+                        "id": f"rp-{index}",
+                        "backupId": f"backup-{index}",
+                    }
+                ],
+                "next": None,
+            }
+        )
+
+    provider = HttpVeeamProvider(opener=_fake_opener, max_concurrency=3)
+    session = VeeamProviderSession(
+        base_url="https://veeam.example.com:9419",
+        access_token="token-1",
+        api_version="1.3-rev1",
+        verify_ssl=True,
+    )
+    match_result = VeeamBackupObjectMatchResult(
+        matched_backup_objects=[
+            VeeamMatchedBackupObject(
+                backup_object_id=f"backup-object-{index}",
+                machine_name=f"db0{index}.domain.com",
+                backup_item={"id": f"backup-object-{index}", "name": f"db0{index}.domain.com"},
+            )
+            for index in (1, 2, 3)
+        ],
+        backups_received_total=3,
+        backups_matched_total=3,
+        backups_unmatched_total=0,
+        backups_missing_machine_name=0,
+    )
+
+    result = provider.fetch_restore_point_records(session=session, match_result=match_result)
+
+    assert result.restore_points_backup_objects_completed == 3
+    assert [record.machine_name for record in result.records] == ["db01.domain.com", "db02.domain.com", "db03.domain.com"]
+    timings = cast(dict[str, Any], provider.stage_timings())
+    assert timings["max_concurrency"] == 3
+    assert timings["stages"]["restore_points"]["requests_total"] == 3
+
+
+@pytest.mark.unit
+def test_http_veeam_provider_backs_off_and_retries_on_throttle() -> None:
+    import io
+    from email.message import Message
+    from urllib.error import HTTPError
+
+    from app.services.veeam.http_client import VeeamTokenBucket
+
+    calls: list[str] = []
+
+    def _fake_opener(request, *, timeout: int, context) -> _FakeResponse:
+        _ = (timeout, context)
+        calls.append(request.full_url)
+        if len(calls) == 1:
+            headers = Message()
+            headers["Retry-After"] = "0"
+            raise HTTPError(request.full_url, 429, "Too Many Requests", headers, io.BytesIO(b"{}"))
+        return _FakeResponse({"items": [{"id": "file-1", "backupId": "backup-1"}], "next": None})
+
+    rate_limiter = VeeamTokenBucket(rate_per_second=100)
+    provider = HttpVeeamProvider(opener=_fake_opener, rate_limiter=rate_limiter)
+    session = VeeamProviderSession(
+        base_url="https://veeam.example.com:9419",
+        access_token="token-1",
+        api_version="1.3-rev1",
+        verify_ssl=True,
+    )
+
+    result = provider.fetch_backup_file_records(session=session, backup_ids=["backup-1"])
+
+    assert result.backup_ids_completed == 1
+    assert result.failed_backup_ids_total == 0
+    assert len(calls) == 2
+    assert rate_limiter.throttled_total == 1
+    timings = cast(dict[str, Any], provider.stage_timings())
+    assert timings["stages"]["backup_files"]["outcomes"] == {"throttled": 1, "success": 1}
+
+
+@pytest.mark.unit
+def test_http_veeam_provider_fetches_restore_points_after_watermark_and_stops_paging() -> None:
+    from datetime import UTC, datetime
+    from urllib.parse import parse_qs, urlsplit
+
+    calls: list[str] = []
+    pages = {
+        "backup-object-1": [
+            {
+                "items": [
+                    {"creationTime": "2026-03-26T02:00:00Z", "id": "rp-3", "backupId": "backup-1"},
+                    {"creationTime": "2026-03-25T02:00:00Z", "id": "rp-2", "backupId": "backup-1"},
+                ],
+                "next": "/api/v1/backupObjects/backup-object-1/restorePoints?skip=2",
+            },
+        ],
+        "backup-object-2": [{"items": [], "next": None}],
+    }
+
+    def _fake_opener(request, *, timeout: int, context) -> _FakeResponse:
+        _ = (timeout, context)
+        calls.append(request.full_url)
+        backup_object_id = urlsplit(request.full_url).path.rsplit("/", 2)[-2]
+        return _FakeResponse(pages[backup_object_id].pop(0))
+
+    provider = HttpVeeamProvider(opener=_fake_opener, max_concurrency=1)
+    session = VeeamProviderSession(
+        base_url="https://veeam.example.com:9419",
+        access_token="token-1",
+        api_version="1.3-rev1",
+        verify_ssl=True,
+    )
+    match_result = VeeamBackupObjectMatchResult(
+        matched_backup_objects=[
+            VeeamMatchedBackupObject(backup_object_id=f"backup-object-{index}", machine_name=f"db0{index}.domain.com")
+            for index in (1, 2)
+        ],
+        backups_received_total=2,
+        backups_matched_total=2,
+        backups_unmatched_total=0,
+        backups_missing_machine_name=0,
+    )
+    watermark = datetime(2026, 3, 25, 2, 0, tzinfo=UTC)
+
+    result = provider.fetch_restore_point_records(
+        session=session,
+        match_result=match_result,
+        watermarks={"backup-object-1": watermark, "backup-object-2": watermark},
+    )
+
+    assert len(calls) == 2
+    query = parse_qs(urlsplit(calls[0]).query)
+    assert query["createdAfterFilter"] == ["2026-03-25T02:00:00Z"]
+    assert query["orderAsc"] == ["false"]
+    assert [record.source_record_id for record in result.records] == ["rp-3"]
+    assert result.incremental_backup_objects_total == 2
+    assert result.unchanged_backup_objects_total == 1
+    assert [item.backup_object_id for item in result.backup_object_watermarks] == ["backup-object-1"]
+    assert result.backup_object_watermarks[0].latest_restore_point_id == "rp-3"
@@ -25,12 +25,20 @@ from app.services.veeam.provider import (
 from app.services.veeam.sync_actions_service import VeeamSyncActionsService
 
 
+class _StageTimingsStub:
+    def reset_stage_timings(self) -> None:
+        return None
+
+    def stage_timings(self) -> dict[str, object]:
+        return {}
+
+
 @pytest.mark.unit
 def test_prepare_background_sync_uses_system_settings_anchor(monkeypatch) -> None:
     captured: dict[str, object] = {}
     captured_items: list[tuple[str, str, str]] = []
 
-    class _StubProvider:
+    class _StubProvider(_StageTimingsStub):
         def is_configured(self) -> bool:
             return True
 
@@ -101,7 +109,8 @@ def test_launch_background_sync_runs_sync_task_with_prepared_run_id(monkeypatch)
     class _DummyThread:
         name = "sync_veeam_backups_manual"
 
-    def _fake_launch_background_sync(*, created_by: int | None, run_id: str, task):
+    def _fake_launch_background_sync(*, created_by: int | None, run_id: str, task, full_resync: bool = False):
+        captured["full_resync"] = full_resync
         task(manual_run=True, created_by=created_by, run_id=run_id)
         return _DummyThread()
 
@@ -119,6 +128,7 @@ def test_launch_background_sync_runs_sync_task_with_prepared_run_id(monkeypatch)
         "manual_run": True,
         "created_by": 1,
         "run_id": "run-veeam-1",
+        "full_resync": False,
     }
 
 
@@ -196,9 +206,10 @@ def test_sync_once_iterates_enabled_sources(monkeypatch) -> None:
             binding: VeeamSourceBinding,
             stage_key_prefix: str = "",
             finalize_run: bool = True,
+            full_resync: bool = False,
         ) -> int:
             del self
-            _ = (stage_key_prefix, finalize_run)
+            _ = (stage_key_prefix, finalize_run, full_resync)
             assert created_by == 7
             assert run_id == expected_run_id
             synced_source_ids.append(int(binding.id))
@@ -215,7 +226,7 @@ def test_sync_once_iterates_enabled_sources(monkeypatch) -> None:
 def test_prepare_background_sync_initializes_source_scoped_items_for_multiple_sources(monkeypatch) -> None:
     captured_items: list[tuple[str, str, str]] = []
 
-    class _StubProvider:
+    class _StubProvider(_StageTimingsStub):
         def is_configured(self) -> bool:
             return True
 
@@ -342,7 +353,7 @@ def test_sync_once_completes_partial_success_with_source_scoped_items() -> None:
         db.session.add_all([failed_source, success_source, disabled_source])
         db.session.commit()
 
-        class _StubProvider:
+        class _StubProvider(_StageTimingsStub):
             def is_configured(self) -> bool:
                 return True
 
@@ -522,7 +533,7 @@ def test_sync_once_raises_first_error_when_all_sources_fail() -> None:
         db.session.add_all([source_a, source_b])
         db.session.commit()
 
-        class _FailingProvider:
+        class _FailingProvider(_StageTimingsStub):
             def is_configured(self) -> bool:
                 return True
 
@@ -608,7 +619,7 @@ def test_sync_instance_now_uses_service_pipeline_and_upserts_latest_snapshot() -
             api_version = "1.3-rev1"
             verify_ssl = False
 
-        class _FakeProvider:
+        class _FakeProvider(_StageTimingsStub):
             def is_configured(self) -> bool:
                 return True
 
@@ -751,6 +762,10 @@ def test_sync_instance_now_uses_service_pipeline_and_upserts_latest_snapshot() -
                 captured["upsert_synced_at"] = synced_at
                 return len(records_list)
 
+            def refresh_instance_backup_matches(self, *, source_binding_id: int) -> int:
+                captured["refresh_matches_source_binding_id"] = source_binding_id
+                return 1
+
             def find_best_backup_for_instance_name(
                 self,
                 instance_name: str,
@@ -781,6 +796,7 @@ def test_sync_instance_now_uses_service_pipeline_and_upserts_latest_snapshot() -
         assert captured["match_machine_ips"] == {"10.0.0.1"}
         assert captured["backup_ids"] == ["backup-db01"]
         assert captured["upsert_source_binding_id"] == binding.id
+        assert captured["refresh_matches_source_binding_id"] == binding.id
         assert captured["upsert_sync_run_id"] == f"single_sync_{instance.id}"
         assert captured["lookup_instance_name"] == "db01"
         assert captured["lookup_instance_host"] == "10.0.0.1"
@@ -848,7 +864,7 @@ def test_sync_once_writes_latest_machine_snapshots_updates_binding_and_finalizes
 
         captured: dict[str, object] = {}
 
-        class _StubProvider:
+        class _StubProvider(_StageTimingsStub):
             def is_configured(self) -> bool:
                 return True
 
@@ -1186,7 +1202,7 @@ def test_sync_once_logs_candidate_pool_and_unmatched_backup_summary(monkeypatch)
 
         monkeypatch.setattr(sync_actions_service_module, "log_with_context", _fake_log_with_context)
 
-        class _StubProvider:
+        class _StubProvider(_StageTimingsStub):
             def is_configured(self) -> bool:
                 return True
 
@@ -1333,7 +1349,7 @@ def test_sync_once_accepts_snapshot_without_enrichment_fields() -> None:
         db.session.add(binding)
         db.session.commit()
 
-        class _StubProvider:
+        class _StubProvider(_StageTimingsStub):
             def is_configured(self) -> bool:
                 return True
 
@@ -1488,7 +1504,7 @@ def test_sync_once_completes_with_partial_success_when_restore_points_timeout_is
         db.session.add(binding)
         db.session.commit()
 
-        class _StubProvider:
+        class _StubProvider(_StageTimingsStub):
             def is_configured(self) -> bool:
                 return True
 
@@ -1711,7 +1727,7 @@ def test_sync_once_preserves_existing_snapshots_when_restore_points_partially_ti
         db.session.add(old_snapshot)
         db.session.commit()
 
-        class _StubProvider:
+        class _StubProvider(_StageTimingsStub):
             def is_configured(self) -> bool:
                 return True
 
@@ -1872,7 +1888,7 @@ def test_sync_once_completes_when_backup_files_timeout_is_skipped() -> None:
         db.session.add(binding)
         db.session.commit()
 
-        class _StubProvider:
+        class _StubProvider(_StageTimingsStub):
             def is_configured(self) -> bool:
                 return True
 
@@ -2065,7 +2081,7 @@ def test_sync_once_marks_restore_points_stage_failed_with_progress_details() ->
                 self.failed_machine_name = "db02.domain.com"
                 self.failed_url = "https://10.0.0.10:9419/api/v1/backupObjects/backup-2/restorePoints"
 
-        class _StubProvider:
+        class _StubProvider(_StageTimingsStub):
             def is_configured(self) -> bool:
                 return True
 
@@ -2166,3 +2182,147 @@ def test_sync_once_marks_restore_points_stage_failed_with_progress_details() ->
         assert items["fetch_restore_points"].details_json["failed_url"].endswith("/backup-2/restorePoints")
         assert items["fetch_backup_files"].status == "cancelled"
         assert items["write_snapshots"].status == "cancelled"
+
+
+@pytest.mark.unit
+def test_sync_once_fetches_only_restore_points_after_watermark_and_keeps_history() -> None:
+    from app.models.veeam_backup_object_watermark import VeeamBackupObjectWatermark
+    from app.services.veeam.provider import VeeamBackupObjectWatermarkRecord, VeeamProviderSession
+
+    app = create_app(init_scheduler_on_start=False)
+    app.config["TESTING"] = True
+
+    with app.app_context():
+        db.metadata.create_all(
+            bind=db.engine,
+            tables=[
+                db.metadata.tables["credentials"],
+                db.metadata.tables["instances"],
+                db.metadata.tables["veeam_source_bindings"],
+                db.metadata.tables["veeam_machine_backup_snapshots"],
+                db.metadata.tables["veeam_backup_object_watermarks"],
+                db.metadata.tables["task_runs"],
+                db.metadata.tables["task_run_items"],
+            ],
+        )
+        credential = Credential(
+            name="veeam-admin",
+            credential_type="veeam",
+            username="backup-admin",
+            password="VeeamPass123",
+            is_active=True,
+        )
+        instance = Instance(name="db01", db_type="mysql", host="10.1.1.1", port=3306, is_active=True)
+        db.session.add_all([credential, instance])
+        db.session.flush()
+        db.session.add(
+            VeeamSourceBinding(
+                credential_id=credential.id,
+                server_host="10.0.0.10",
+                server_port=9419,
+                api_version="1.3-rev1",
+                verify_ssl=False,
+                match_domains=["domain.com"],
+            )
+        )
+        db.session.commit()
+
+        def _record(restore_point_id: str, hour: int, day: int = 25) -> VeeamMachineBackupRecord:
+            return VeeamMachineBackupRecord(
+                machine_name="db01.domain.com",
+                backup_at=datetime(2026, 3, day, hour, 0, tzinfo=UTC),
+                backup_id=f"backup-{day}",
+                source_record_id=restore_point_id,
+                raw_payload={"id": restore_point_id, "backupSize": 100},
+            )
+
+        calls: list[dict[str, object]] = []
+
+        class _StubProvider(_StageTimingsStub):
+            def __init__(self, records: list[VeeamMachineBackupRecord]) -> None:
+                self._records = records
+
+            def is_configured(self) -> bool:
+                return True
+
+            def create_session(self, **_: object) -> VeeamProviderSession:
+                return VeeamProviderSession(
+                    base_url="https://veeam", access_token="t", api_version="1.3", verify_ssl=False
+                )
+
+            def fetch_backup_objects(self, **_: object) -> list[dict[str, object]]:
+                return [{"id": "object-1", "name": "db01.domain.com"}]
+
+            def match_backup_objects(self, *, backup_items: list[dict[str, object]], **_: object):
+                return VeeamBackupObjectMatchResult(
+                    matched_backup_objects=[
+                        VeeamMatchedBackupObject(backup_object_id="object-1", machine_name="db01.domain.com")
+                    ],
+                    backups_received_total=len(backup_items),
+                    backups_matched_total=1,
+                    backups_unmatched_total=0,
+                    backups_missing_machine_name=0,
+                )
+
+            def fetch_restore_point_records(self, *, watermarks=None, **_: object):
+                calls.append({"watermarks": dict(watermarks or {})})
+                latest = max(self._records, key=lambda item: item.backup_at) if self._records else None
+                return VeeamMachineBackupCollection(
+                    records=list(self._records),
+                    received_total=len(self._records),
+                    snapshots_written_total=len(self._records),
+                    skipped_invalid=0,
+                    restore_points_backup_objects_total=1,
+                    restore_points_backup_objects_completed=1,
+                    backup_object_watermarks=(
+                        [
+                            VeeamBackupObjectWatermarkRecord(
+                                backup_object_id="object-1",
+                                latest_restore_point_at=latest.backup_at,
+                                machine_name="db01.domain.com",
+                                latest_restore_point_id=latest.source_record_id,
+                                backup_id=latest.backup_id,
+                            )
+                        ]
+                        if latest is not None
+                        else []
+                    ),
+                )
+
+            def fetch_backup_file_records(self, *, backup_ids: list[str], **_: object):
+                calls[-1]["backup_ids"] = list(backup_ids)
+                return VeeamBackupFileCollection(
+                    records=[], received_total=0, backup_ids_total=len(backup_ids), backup_ids_completed=len(backup_ids)
+                )
+
+        def _run(records: list[VeeamMachineBackupRecord], *, full_resync: bool = False) -> VeeamMachineBackupSnapshot:
+            service = VeeamSyncActionsService(provider=_StubProvider(records))
+            prepared = service.prepare_background_sync(created_by=1, full_resync=full_resync)
+            db.session.commit()
+            service._sync_once(created_by=1, run_id=prepared.run_id, full_resync=prepared.full_resync)
+            db.session.commit()
+            return VeeamMachineBackupSnapshot.query.one()
+
+        snapshot = _run([_record("rp-1", 1), _record("rp-2", 2)])
+        assert calls[0]["watermarks"] == {}
+        assert snapshot.restore_point_count == 2
+        watermark = VeeamBackupObjectWatermark.query.one()
+        assert watermark.backup_object_id == "object-1"
+        assert watermark.latest_restore_point_id == "rp-2"
+
+        snapshot = _run([_record("rp-3", 1, day=26)])
+        assert calls[1]["watermarks"] == {"object-1": datetime(2026, 3, 25, 2, 0, tzinfo=UTC)}
+        assert calls[1]["backup_ids"] == ["backup-26"]
+        assert snapshot.source_record_id == "rp-3"
+        assert snapshot.restore_point_count == 3
+        assert snapshot.backup_chain_size_bytes == 300
+        assert snapshot.raw_payload["restore_point_ids"] == ["rp-3", "rp-2", "rp-1"]
+        assert VeeamBackupObjectWatermark.query.one().latest_restore_point_id == "rp-3"
+
+        snapshot = _run([])
+        assert calls[2]["backup_ids"] == []
+        assert snapshot.restore_point_count == 3
+
+        snapshot = _run([_record("rp-3", 1, day=26)], full_resync=True)
+        assert calls[3]["watermarks"] == {}
+        assert snapshot.restore_point_count == 1
@@ -107,3 +107,143 @@ def test_read_default_task_configs_raises_value_error_when_schema_invalid(tmp_pa
 
     with pytest.raises(ValueError):
         scheduler._read_default_task_configs()
+
+
+@pytest.mark.unit
+def test_read_default_task_configs_parses_dependency_tasks(tmp_path, monkeypatch) -> None:
+    """dependency 任务声明上游与处理范围, 不需要 trigger_params."""
+    config_path = tmp_path / "scheduler_tasks.yaml"
+    config_path.write_text(
+        "\n".join(
+            [
+                "default_tasks:",
+                "  - id: sync_databases",
+                "    trigger_type: cron",
+                "    trigger_params: {hour: 1}",
+                "  - id: calculate_database",
+                "    trigger_type: dependency",
+                "    depends_on: [sync_databases]",
+                "    scope: upstream_instances",
+            ],
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+
+    monkeypatch.setattr(scheduler, "TASK_CONFIG_PATH", config_path)
+
+    tasks = {task.id: task for task in scheduler._read_default_task_configs()}
+
+    assert tasks["calculate_database"].trigger_type == "dependency"
+    assert tasks["calculate_database"].depends_on == ["sync_databases"]
+    assert tasks["calculate_database"].scope == "upstream_instances"
+    assert tasks["sync_databases"].depends_on == []
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "lines",
+    [
+        # 上游不存在
+        [
+            "  - id: calculate_database",
+            "    trigger_type: dependency",
+            "    depends_on: [sync_databases]",
+        ],
+        # 依赖成环
+        [
+            "  - id: sync_databases",
+            "    trigger_type: dependency",
+            "    depends_on: [calculate_database]",
+            "  - id: calculate_database",
+            "    trigger_type: dependency",
+            "    depends_on: [sync_databases]",
+        ],
+        # cron 任务不能声明 depends_on
+        [
+            "  - id: sync_accounts",
+            "    trigger_type: cron",
+            "  - id: calculate_account",
+            "    trigger_type: cron",
+            "    depends_on: [sync_accounts]",
+        ],
+    ],
+)
+def test_read_default_task_configs_rejects_invalid_dependencies(tmp_path, monkeypatch, lines) -> None:
+    """依赖图必须引用已声明的任务且无环."""
+    config_path = tmp_path / "scheduler_tasks.yaml"
+    config_path.write_text("\n".join(["default_tasks:", *lines]) + "\n", encoding="utf-8")
+
+    monkeypatch.setattr(scheduler, "TASK_CONFIG_PATH", config_path)
+
+    with pytest.raises(ValueError):
+        scheduler._read_default_task_configs()
+
+
+@pytest.mark.unit
+def test_read_task_config_file_parses_executors_and_task_assignment(tmp_path, monkeypatch) -> None:
+    """执行器按名称声明, 任务可指定执行器与最大并发实例数."""
+    config_path = tmp_path / "scheduler_tasks.yaml"
+    config_path.write_text(
+        "\n".join(
+            [
+                "executors:",
+                "  io-threads: {type: thread, max_workers: 4}",
+                "  cpu-processes: {type: Process, max_workers: 2}",
+                "default_executor: io-threads",
+                "default_tasks:",
+                "  - id: calculate_account",
+                "    trigger_type: cron",
+                "    trigger_params: {hour: 2}",
+                "    executor: cpu-processes",
+                "    max_instances: 2",
+                "  - id: sync_accounts",
+                "    trigger_type: cron",
+                "    trigger_params: {hour: 1}",
+            ],
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+
+    monkeypatch.setattr(scheduler, "TASK_CONFIG_PATH", config_path)
+
+    executors, default_executor = scheduler._read_executor_configs()
+    tasks = {task.id: task for task in scheduler._read_default_task_configs()}
+
+    assert default_executor == "io-threads"
+    assert executors["cpu-processes"].type == "process"
+    assert executors["io-threads"].max_workers == 4
+    assert tasks["calculate_account"].executor == "cpu-processes"
+    assert tasks["calculate_account"].max_instances == 2
+    assert tasks["sync_accounts"].executor is None
+
+
+@pytest.mark.unit
+def test_read_default_task_configs_rejects_unknown_executor(tmp_path, monkeypatch) -> None:
+    """任务引用未声明的执行器时应拒绝加载."""
+    config_path = tmp_path / "scheduler_tasks.yaml"
+    config_path.write_text(
+        "\n".join(
+            [
+                "executors:",
+                "  io-threads: {type: thread, max_workers: 4}",
+                "default_tasks:",
+                "  - id: calculate_account",
+                "    trigger_type: cron",
+                "    trigger_params: {hour: 2}",
+                "    executor: gpu-pool",
+            ],
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+
+    monkeypatch.setattr(scheduler, "TASK_CONFIG_PATH", config_path)
+
+    with pytest.raises(ValueError, match="gpu-pool"):
+        scheduler._read_default_task_configs()
+
+    executors, default_executor = scheduler._read_executor_configs()
+    assert list(executors) == ["io-threads"]
+    assert default_executor == "io-threads"
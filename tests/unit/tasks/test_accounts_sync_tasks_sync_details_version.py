@@ -90,3 +90,37 @@ def test_accounts_sync_task_single_instance_success_adds_sync_details_version(mo
     assert dummy_sync_session_service.complete_calls
     sync_details = cast(dict[str, Any], dummy_sync_session_service.complete_calls[0]["sync_details"])
     assert sync_details.get("version") == 1
+
+
+@pytest.mark.unit
+def test_accounts_sync_task_single_instance_skips_known_unreachable_instance(monkeypatch) -> None:
+    dummy_sync_session_service = _DummySyncSessionService()
+    monkeypatch.setattr(accounts_tasks_module, "sync_session_service", dummy_sync_session_service)
+
+    class _UnreachableService:
+        def known_down_reason(self, _instance_id: int) -> str:
+            return "实例不可达(连续 3 次探测失败), 已跳过同步"
+
+    class _FailingCoordinator(_DummyCoordinator):
+        def __enter__(self) -> _DummyCoordinator:
+            raise AssertionError("不可达实例不应建立连接")
+
+    class _WarningLogger(_DummyLogger):
+        def warning(self, *_args: object, **_kwargs: object) -> None:
+            return None
+
+    monkeypatch.setattr(accounts_tasks_module, "InstanceReachabilityService", _UnreachableService)
+    monkeypatch.setattr(accounts_tasks_module, "AccountSyncCoordinator", _FailingCoordinator)
+
+    result = accounts_tasks_module._sync_single_instance(
+        session=cast(Any, _DummySession(session_id="s1")),
+        record=cast(Any, _DummyRecord(id=7)),
+        instance=cast(Any, _DummyInstance(id=3, name="down")),
+        sync_logger=cast(Any, _WarningLogger()),
+    )
+
+    assert result == (0, 1)
+    assert dummy_sync_session_service.fail_calls == [
+        {"record_id": 7, "error_message": "实例不可达(连续 3 次探测失败), 已跳过同步"}
+    ]
+    assert dummy_sync_session_service.complete_calls == []
@@ -11,7 +11,7 @@ from app.models.instance_account import InstanceAccount
 from app.models.task_run import TaskRun
 from app.models.task_run_item import TaskRunItem
 from app.tasks import ad_sync_tasks
-from app.services.ad_sync.ldap_provider import AdPrincipal, AdPrincipalsFetchResult
+from app.services.ad_sync.ldap_provider import AdPrincipal, AdPrincipalsFetchResult, AdUsnWatermark
 
 
 def _create_tables() -> None:
@@ -258,6 +258,8 @@ def test_sync_ad_accounts_records_ad_fetch_counts_in_summary_and_item_metrics(mo
             "ad_users_total": 2,
             "ad_groups_total": 1,
             "ad_principals_total": 3,
+            "incremental": False,
+            "ad_deleted_total": 0,
         }
         assert info_events["ad_sync_run_completed"] == {
             "module": "ad_sync",
@@ -278,3 +280,104 @@ def test_sync_ad_accounts_records_ad_fetch_counts_in_summary_and_item_metrics(mo
             "ad_groups_total": 1,
             "ad_principals_total": 3,
         }
+
+
+@pytest.mark.unit
+def test_sync_ad_accounts_updates_only_changed_principals_after_usn_watermark(monkeypatch) -> None:
+    app = create_app(init_scheduler_on_start=False)
+    calls: list[dict[str, object]] = []
+
+    class _FakeProvider:
+        def fetch_principals_with_stats(self, _config: AdDomainConfig) -> AdPrincipalsFetchResult:
+            calls.append({"mode": "full"})
+            return AdPrincipalsFetchResult(
+                principals={
+                    "alice": AdPrincipal("alice", "user", False, {}),
+                    "bob": AdPrincipal("bob", "user", False, {}),
+                    "carol": AdPrincipal("carol", "user", False, {}),
+                },
+                users_total=3,
+                groups_total=0,
+                watermark=AdUsnWatermark("dc01.corp.example.com", 100, "CN=NTDS Settings,CN=DC01"),
+            )
+
+        def fetch_principal_changes(
+            self,
+            _config: AdDomainConfig,
+            *,
+            watermarks: dict[str, AdUsnWatermark],
+            lookup_names: set[str],
+        ) -> AdPrincipalsFetchResult:
+            calls.append({"mode": "incremental", "watermarks": dict(watermarks), "lookup_names": set(lookup_names)})
+            return AdPrincipalsFetchResult(
+                principals={
+                    "alice": AdPrincipal("alice", "user", True, {}),
+                    "dave": AdPrincipal("dave", "user", False, {}),
+                },
+                users_total=2,
+                groups_total=0,
+                incremental=True,
+                deleted_names=frozenset({"bob"}),
+                watermark=AdUsnWatermark("dc01.corp.example.com", 180, "CN=NTDS Settings,CN=DC01"),
+            )
+
+    monkeypatch.setattr(ad_sync_tasks, "create_app", lambda **_: app)
+    monkeypatch.setattr(ad_sync_tasks, "LdapProvider", _FakeProvider)
+    monkeypatch.setattr(ad_sync_tasks, "get_sync_logger", _FakeSyncLogger)
+
+    with app.app_context():
+        _create_tables()
+        domain = _create_domain(name="corp.example.com", netbios_name="CORP")
+        instance = _create_instance()
+        accounts = {
+            name: InstanceAccount(
+                instance_id=instance.id,
+                db_type="sqlserver",
+                username=f"CORP\\{name}",
+                owner_type="instance",
+                owner_id=instance.id,
+            )
+            for name in ("alice", "bob", "carol")
+        }
+        db.session.add_all(accounts.values())
+        db.session.commit()
+
+        ad_sync_tasks.sync_ad_accounts(manual_run=True, created_by=1)
+
+        assert calls == [{"mode": "full"}]
+        assert domain.last_full_sync_at is not None
+        assert domain.usn_watermarks == {
+            "dc01.corp.example.com": {"usn": 100, "ds_service_name": "CN=NTDS Settings,CN=DC01"},
+        }
+
+        accounts["dave"] = InstanceAccount(
+            instance_id=instance.id,
+            db_type="sqlserver",
+            username="CORP\\dave",
+            owner_type="instance",
+            owner_id=instance.id,
+        )
+        db.session.add(accounts["dave"])
+        db.session.commit()
+
+        ad_sync_tasks.sync_ad_accounts(manual_run=True, created_by=1)
+
+        assert calls[1] == {
+            "mode": "incremental",
+            "watermarks": {
+                "dc01.corp.example.com": AdUsnWatermark("dc01.corp.example.com", 100, "CN=NTDS Settings,CN=DC01"),
+            },
+            "lookup_names": {"dave"},
+        }
+        assert accounts["alice"].ad_disabled_at is not None
+        assert accounts["bob"].ad_orphaned_at is not None
+        assert accounts["carol"].ad_disabled_at is None
+        assert accounts["carol"].ad_orphaned_at is None
+        assert accounts["dave"].ad_domain_config_id == domain.id
+        assert accounts["dave"].ad_orphaned_at is None
+        assert domain.usn_watermarks["dc01.corp.example.com"]["usn"] == 180
+
+        item = TaskRunItem.query.filter_by(item_type="ad_domain", run_id=domain.last_sync_run_id).one()
+        assert item.metrics_json["incremental"] is True
+        assert item.metrics_json["ad_deleted_total"] == 1
+        assert item.metrics_json["total"] == 3
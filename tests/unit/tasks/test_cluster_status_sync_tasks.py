@@ -11,6 +11,7 @@ from app.models.mysql_cluster import MySQLCluster
 from app.models.sqlserver_cluster import SQLServerCluster
 from app.models.task_run import TaskRun
 from app.models.task_run_item import TaskRunItem
+from app.services.cluster_status_sync.service import ClusterNodeProbes
 
 
 def _create_schema() -> None:
@@ -30,16 +31,19 @@ class _StubClusterStatusSyncService:
     mysql_results: dict[int, dict[str, Any]]
     sqlserver_results: dict[int, dict[str, Any]]
 
+    def probe_clusters(self, **_: Any) -> ClusterNodeProbes:
+        return ClusterNodeProbes()
+
     def list_enabled_mysql_clusters(self) -> list[MySQLCluster]:
         return MySQLCluster.query.order_by(MySQLCluster.id.asc()).all()
 
     def list_enabled_sqlserver_clusters(self) -> list[SQLServerCluster]:
         return SQLServerCluster.query.order_by(SQLServerCluster.id.asc()).all()
 
-    def sync_mysql_cluster(self, cluster_id: int) -> dict[str, Any]:
+    def sync_mysql_cluster(self, cluster_id: int, **_: Any) -> dict[str, Any]:
         return self.mysql_results[cluster_id]
 
-    def sync_sqlserver_cluster(self, cluster_id: int) -> dict[str, Any]:
+    def sync_sqlserver_cluster(self, cluster_id: int, **_: Any) -> dict[str, Any]:
         return self.sqlserver_results[cluster_id]
 
 
@@ -50,19 +54,22 @@ class _MixedClusterStatusSyncService:
     mysql_results: dict[int, dict[str, Any] | Exception]
     sqlserver_results: dict[int, dict[str, Any] | Exception]
 
+    def probe_clusters(self, **_: Any) -> ClusterNodeProbes:
+        return ClusterNodeProbes()
+
     def list_enabled_mysql_clusters(self) -> list[MySQLCluster]:
         return self.mysql_clusters
 
     def list_enabled_sqlserver_clusters(self) -> list[SQLServerCluster]:
         return self.sqlserver_clusters
 
-    def sync_mysql_cluster(self, cluster_id: int) -> dict[str, Any]:
+    def sync_mysql_cluster(self, cluster_id: int, **_: Any) -> dict[str, Any]:
         result = self.mysql_results[cluster_id]
         if isinstance(result, Exception):
             raise result
         return result
 
-    def sync_sqlserver_cluster(self, cluster_id: int) -> dict[str, Any]:
+    def sync_sqlserver_cluster(self, cluster_id: int, **_: Any) -> dict[str, Any]:
         result = self.sqlserver_results[cluster_id]
         if isinstance(result, Exception):
             raise result
@@ -74,17 +81,20 @@ class _ListClustersError(RuntimeError):
 
 
 class _ListFailingClusterStatusSyncService:
+    def probe_clusters(self, **_: Any) -> ClusterNodeProbes:
+        return ClusterNodeProbes()
+
     def list_enabled_mysql_clusters(self) -> list[MySQLCluster]:
         raise _ListClustersError("list clusters boom")
 
     def list_enabled_sqlserver_clusters(self) -> list[SQLServerCluster]:
         return []
 
-    def sync_mysql_cluster(self, cluster_id: int) -> dict[str, Any]:
+    def sync_mysql_cluster(self, cluster_id: int, **_: Any) -> dict[str, Any]:
         del cluster_id
         raise AssertionError("should not sync when listing failed")
 
-    def sync_sqlserver_cluster(self, cluster_id: int) -> dict[str, Any]:
+    def sync_sqlserver_cluster(self, cluster_id: int, **_: Any) -> dict[str, Any]:
         del cluster_id
         raise AssertionError("should not sync when listing failed")
 
@@ -277,3 +287,55 @@ def test_sync_cluster_status_marks_run_failed_when_listing_clusters_crashes(monk
         run = TaskRun.query.filter_by(task_key="sync_cluster_status").one()
         assert run.status == TaskRunStatus.FAILED
         assert "list clusters boom" in (run.error_message or "")
+
+
+@pytest.mark.unit
+def test_poll_cluster_health_refreshes_states_without_task_run_or_alerts(monkeypatch) -> None:
+    from app.tasks import cluster_status_sync_tasks
+
+    app = create_app(init_scheduler_on_start=False)
+    app.config["TESTING"] = True
+    monkeypatch.setattr(cluster_status_sync_tasks, "create_app", lambda **_: app)
+
+    with app.app_context():
+        _create_schema()
+        broken = SQLServerCluster(name="sql-broken", domain_name="wz.dc", description="")
+        healthy = SQLServerCluster(name="sql-healthy", domain_name="wz.dc", description="")
+        db.session.add_all([broken, healthy])
+        db.session.commit()
+
+        stub = _MixedClusterStatusSyncService(
+            mysql_clusters=[],
+            sqlserver_clusters=[broken, healthy],
+            mysql_results={},
+            sqlserver_results={
+                broken.id: Exception("driver boom sqlserver"),
+                healthy.id: {
+                    "status": "completed",
+                    "abnormal_database_count": 1,
+                    "abnormal_replica_count": 0,
+                },
+            },
+        )
+        probe_calls: list[dict[str, Any]] = []
+
+        def _probe_clusters(self: _MixedClusterStatusSyncService, **kwargs: Any) -> ClusterNodeProbes:
+            del self
+            probe_calls.append(dict(kwargs))
+            return ClusterNodeProbes()
+
+        monkeypatch.setattr(_MixedClusterStatusSyncService, "probe_clusters", _probe_clusters)
+        monkeypatch.setattr(cluster_status_sync_tasks, "ClusterStatusSyncService", lambda: stub)
+
+        class _FailingEmailAlertEventService:
+            def record_cluster_status_event(self, **_: Any) -> bool:
+                raise AssertionError("health poll should not record alerts")
+
+        monkeypatch.setattr(
+            cluster_status_sync_tasks, "EmailAlertEventService", lambda: _FailingEmailAlertEventService()
+        )
+
+        cluster_status_sync_tasks.poll_cluster_health()
+
+        assert probe_calls == [{"mysql_cluster_ids": [], "sqlserver_cluster_ids": [broken.id, healthy.id]}]
+        assert TaskRun.query.count() == 0
@@ -33,8 +33,9 @@ def test_sync_veeam_backups_commits_prepared_run_before_sync_once(monkeypatch) -
             created_by: int | None,
             trigger_source: str = "manual",
             result_url: str = "/admin/system-settings#system-settings-veeam",
+            full_resync: bool = False,
         ):
-            _ = (self, trigger_source, result_url)
+            _ = (self, trigger_source, result_url, full_resync)
             task_runs_service = TaskRunsWriteService()
             run_id = task_runs_service.start_run(
                 task_key="sync_veeam_backups",
@@ -53,8 +54,8 @@ def test_sync_veeam_backups_commits_prepared_run_before_sync_once(monkeypatch) -
 
         observed: dict[str, object] = {}
 
-        def _fake_sync_once(self, *, created_by: int | None, run_id: str) -> None:
-            _ = (self, created_by)
+        def _fake_sync_once(self, *, created_by: int | None, run_id: str, full_resync: bool = False) -> None:
+            _ = (self, created_by, full_resync)
             db.session.rollback()
             observed["run_id"] = run_id
             observed["run_exists_after_rollback"] = TaskRun.query.filter_by(run_id=run_id).first() is not None
@@ -82,8 +83,8 @@ def test_sync_veeam_backups_logs_entry_context(monkeypatch) -> None:
             _ = init_scheduler_on_start
             return app
 
-        def _fake_sync_once(self, *, created_by: int | None, run_id: str) -> None:
-            _ = (self, created_by, run_id)
+        def _fake_sync_once(self, *, created_by: int | None, run_id: str, full_resync: bool = False) -> None:
+            _ = (self, created_by, run_id, full_resync)
 
         calls: list[dict[str, object]] = []
 
@@ -47,3 +47,193 @@ def test_settings_loads_veeam_token_timeout_and_retry_controls(monkeypatch) -> N
     assert flask_config["VEEAM_TOKEN_TIMEOUT_SECONDS"] == 7
     assert flask_config["VEEAM_TOKEN_RETRY_ATTEMPTS"] == 4
     assert flask_config["VEEAM_TOKEN_RETRY_BACKOFF_SECONDS"] == 0
+
+
+@pytest.mark.unit
+def test_settings_loads_shared_scheduler_jobstore(monkeypatch) -> None:
+    monkeypatch.setenv("DATABASE_URL", "postgresql+psycopg://user:pass@db:5432/whalefall")
+    monkeypatch.setenv("SCHEDULER_JOBSTORE", "database")
+    monkeypatch.setenv("SCHEDULER_LEADER_HEARTBEAT_SECONDS", "3")
+    monkeypatch.setenv("SCHEDULER_LEADER_LEASE_SECONDS", "15")
+
+    settings = Settings.load()
+    flask_config = settings.to_flask_config()
+
+    assert settings.scheduler_jobstore == "database"
+    assert flask_config["SCHEDULER_LEADER_HEARTBEAT_SECONDS"] == 3
+    assert flask_config["SCHEDULER_LEADER_LEASE_SECONDS"] == 15
+
+
+@pytest.mark.unit
+def test_settings_rejects_shared_scheduler_jobstore_without_postgresql(monkeypatch) -> None:
+    monkeypatch.setenv("FLASK_ENV", "development")
+    monkeypatch.setenv("DATABASE_URL", "")
+    monkeypatch.setenv("SCHEDULER_JOBSTORE", "database")
+
+    with pytest.raises(ValueError, match=r"SCHEDULER_JOBSTORE=database"):
+        Settings.load()
+
+
+@pytest.mark.unit
+def test_settings_rejects_scheduler_lease_not_longer_than_heartbeat(monkeypatch) -> None:
+    monkeypatch.setenv("SCHEDULER_LEADER_HEARTBEAT_SECONDS", "10")
+    monkeypatch.setenv("SCHEDULER_LEADER_LEASE_SECONDS", "10")
+
+    with pytest.raises(ValueError, match=r"SCHEDULER_LEADER_LEASE_SECONDS"):
+        Settings.load()
+
+
+@pytest.mark.unit
+def test_settings_loads_task_shard_options(monkeypatch) -> None:
+    monkeypatch.setenv("TASK_SHARD_SIZE", "8")
+    monkeypatch.setenv("TASK_SHARD_HEARTBEAT_SECONDS", "5")
+    monkeypatch.setenv("TASK_SHARD_STALE_SECONDS", "30")
+
+    flask_config = Settings.load().to_flask_config()
+
+    assert flask_config["TASK_SHARD_SIZE"] == 8
+    assert flask_config["TASK_SHARD_HEARTBEAT_SECONDS"] == 5
+    assert flask_config["TASK_SHARD_STALE_SECONDS"] == 30
+
+
+@pytest.mark.unit
+def test_settings_rejects_task_shard_stale_not_longer_than_heartbeat(monkeypatch) -> None:
+    monkeypatch.setenv("TASK_SHARD_HEARTBEAT_SECONDS", "30")
+    monkeypatch.setenv("TASK_SHARD_STALE_SECONDS", "30")
+
+    with pytest.raises(ValueError, match=r"TASK_SHARD_STALE_SECONDS"):
+        Settings.load()
+
+
+@pytest.mark.unit
+def test_settings_loads_veeam_concurrency_and_rate_limit(monkeypatch) -> None:
+    monkeypatch.setenv("VEEAM_MAX_CONCURRENCY", "8")
+    monkeypatch.setenv("VEEAM_REQUESTS_PER_SECOND", "2.5")
+
+    flask_config = Settings.load().to_flask_config()
+
+    assert flask_config["VEEAM_MAX_CONCURRENCY"] == 8
+    assert flask_config["VEEAM_REQUESTS_PER_SECOND"] == 2.5
+
+
+@pytest.mark.unit
+def test_settings_loads_veeam_full_resync_interval(monkeypatch) -> None:
+    monkeypatch.setenv("VEEAM_FULL_RESYNC_INTERVAL_HOURS", "24")
+
+    assert Settings.load().to_flask_config()["VEEAM_FULL_RESYNC_INTERVAL_HOURS"] == 24
+
+    monkeypatch.setenv("VEEAM_FULL_RESYNC_INTERVAL_HOURS", "0")
+    with pytest.raises(ValueError, match=r"VEEAM_FULL_RESYNC_INTERVAL_HOURS"):
+        Settings.load()
+
+
+@pytest.mark.unit
+def test_settings_loads_ad_full_sync_interval(monkeypatch) -> None:
+    monkeypatch.setenv("AD_FULL_SYNC_INTERVAL_HOURS", "6")
+
+    assert Settings.load().to_flask_config()["AD_FULL_SYNC_INTERVAL_HOURS"] == 6
+
+    monkeypatch.setenv("AD_FULL_SYNC_INTERVAL_HOURS", "-1")
+    with pytest.raises(ValueError, match=r"AD_FULL_SYNC_INTERVAL_HOURS"):
+        Settings.load()
+
+
+@pytest.mark.unit
+def test_settings_loads_jumpserver_max_concurrency(monkeypatch) -> None:
+    monkeypatch.setenv("JUMPSERVER_MAX_CONCURRENCY", "6")
+
+    assert Settings.load().to_flask_config()["JUMPSERVER_MAX_CONCURRENCY"] == 6
+
+    monkeypatch.setenv("JUMPSERVER_MAX_CONCURRENCY", "0")
+    with pytest.raises(ValueError, match=r"JUMPSERVER_MAX_CONCURRENCY"):
+        Settings.load()
+
+
+@pytest.mark.unit
+def test_settings_loads_cluster_status_polling_limits(monkeypatch) -> None:
+    monkeypatch.setenv("CLUSTER_STATUS_MAX_CONCURRENCY", "12")
+    monkeypatch.setenv("CLUSTER_STATUS_NODE_TIMEOUT_SECONDS", "15")
+
+    config = Settings.load().to_flask_config()
+    assert config["CLUSTER_STATUS_MAX_CONCURRENCY"] == 12
+    assert config["CLUSTER_STATUS_NODE_TIMEOUT_SECONDS"] == 15
+
+    monkeypatch.setenv("CLUSTER_STATUS_NODE_TIMEOUT_SECONDS", "0")
+    with pytest.raises(ValueError, match=r"CLUSTER_STATUS_NODE_TIMEOUT_SECONDS"):
+        Settings.load()
+
+
+@pytest.mark.unit
+def test_settings_loads_sqlserver_permission_query_concurrency(monkeypatch) -> None:
+    monkeypatch.setenv("SQLSERVER_PERMISSION_QUERY_CONCURRENCY", "4")
+
+    assert Settings.load().to_flask_config()["SQLSERVER_PERMISSION_QUERY_CONCURRENCY"] == 4
+
+    monkeypatch.setenv("SQLSERVER_PERMISSION_QUERY_CONCURRENCY", "0")
+    with pytest.raises(ValueError, match=r"SQLSERVER_PERMISSION_QUERY_CONCURRENCY"):
+        Settings.load()
+
+
+@pytest.mark.unit
+def test_settings_loads_sqlserver_permission_target_staging_flag(monkeypatch) -> None:
+    monkeypatch.delenv("SQLSERVER_PERMISSION_TARGET_STAGING_ENABLED", raising=False)
+    assert Settings.load().to_flask_config()["SQLSERVER_PERMISSION_TARGET_STAGING_ENABLED"] is True
+
+    monkeypatch.setenv("SQLSERVER_PERMISSION_TARGET_STAGING_ENABLED", "false")
+    assert Settings.load().to_flask_config()["SQLSERVER_PERMISSION_TARGET_STAGING_ENABLED"] is False
+
+
+@pytest.mark.unit
+def test_settings_loads_account_permission_full_sync_interval(monkeypatch) -> None:
+    monkeypatch.setenv("ACCOUNT_PERMISSION_FULL_SYNC_INTERVAL_HOURS", "6")
+
+    assert Settings.load().to_flask_config()["ACCOUNT_PERMISSION_FULL_SYNC_INTERVAL_HOURS"] == 6
+
+    monkeypatch.setenv("ACCOUNT_PERMISSION_FULL_SYNC_INTERVAL_HOURS", "0")
+    with pytest.raises(ValueError, match=r"ACCOUNT_PERMISSION_FULL_SYNC_INTERVAL_HOURS"):
+        Settings.load()
+
+
+@pytest.mark.unit
+def test_settings_loads_connection_batch_test_limits(monkeypatch) -> None:
+    monkeypatch.setenv("CONNECTION_BATCH_TEST_MAX_CONCURRENCY", "32")
+    monkeypatch.setenv("CONNECTION_BATCH_TEST_NODE_TIMEOUT_SECONDS", "5")
+    monkeypatch.setenv("CONNECTION_BATCH_TEST_DEADLINE_SECONDS", "20")
+
+    config = Settings.load().to_flask_config()
+    assert config["CONNECTION_BATCH_TEST_MAX_CONCURRENCY"] == 32
+    assert config["CONNECTION_BATCH_TEST_NODE_TIMEOUT_SECONDS"] == 5
+    assert config["CONNECTION_BATCH_TEST_DEADLINE_SECONDS"] == 20
+
+    monkeypatch.setenv("CONNECTION_BATCH_TEST_DEADLINE_SECONDS", "0")
+    with pytest.raises(ValueError, match=r"CONNECTION_BATCH_TEST_DEADLINE_SECONDS"):
+        Settings.load()
+
+
+@pytest.mark.unit
+def test_settings_loads_reachability_monitor_options(monkeypatch) -> None:
+    monkeypatch.setenv("REACHABILITY_MAX_IN_FLIGHT", "2048")
+    monkeypatch.setenv("REACHABILITY_DOWN_THRESHOLD", "3")
+    monkeypatch.setenv("REACHABILITY_SKIP_SYNC_ENABLED", "false")
+
+    config = Settings.load().to_flask_config()
+    assert config["REACHABILITY_MAX_IN_FLIGHT"] == 2048
+    assert config["REACHABILITY_DOWN_THRESHOLD"] == 3
+    assert config["REACHABILITY_SKIP_SYNC_ENABLED"] is False
+    assert config["REACHABILITY_PROTOCOL_PING_ENABLED"] is False
+
+    monkeypatch.setenv("REACHABILITY_WINDOW_SIZE", "0")
+    with pytest.raises(ValueError, match=r"REACHABILITY_WINDOW_SIZE"):
+        Settings.load()
+
+
+@pytest.mark.unit
+def test_settings_loads_credential_secret_cache_ttl(monkeypatch) -> None:
+    monkeypatch.setenv("CREDENTIAL_SECRET_CACHE_TTL_SECONDS", "0")
+
+    config = Settings.load().to_flask_config()
+    assert config["CREDENTIAL_SECRET_CACHE_TTL_SECONDS"] == 0
+
+    monkeypatch.setenv("CREDENTIAL_SECRET_CACHE_TTL_SECONDS", "-1")
+    with pytest.raises(ValueError, match=r"CREDENTIAL_SECRET_CACHE_TTL_SECONDS"):
+        Settings.load()
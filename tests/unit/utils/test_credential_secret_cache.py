@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any, cast
+
+import pytest
+
+from app import create_app, db
+from app.models.credential import Credential
+from app.models.instance import Instance
+from app.services.connection_adapters.adapters.mysql_adapter import MySQLConnection
+from app.services.credentials.credential_write_service import CredentialWriteService
+from app.utils import credential_secret_cache as cache_module
+from app.utils.credential_secret_cache import CredentialSecretCache, credential_secret_cache
+from app.utils.password_crypto_utils import PasswordManager
+
+
+@pytest.mark.unit
+def test_credential_secret_cache_expires_and_wipes_evicted_secret(monkeypatch) -> None:
+    clock = [100.0]
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+    cache = CredentialSecretCache(ttl_seconds=30)
+    updated_at = datetime(2026, 1, 1, tzinfo=UTC)
+
+    cache.put(7, updated_at=updated_at, username="dba", password="s3cret")
+    secret = cache._entries[7].secret
+
+    assert cache.get(7, updated_at=updated_at) == ("dba", "s3cret")
+    assert cache.get(7, check_version=False) == ("dba", "s3cret")
+
+    clock[0] += 30
+    assert cache.get(7, updated_at=updated_at) is None
+    assert secret == bytearray(len(b"s3cret"))
+    assert len(cache) == 0
+
+
+@pytest.mark.unit
+def test_credential_secret_cache_rejects_changed_version_and_honours_invalidation() -> None:
+    cache = CredentialSecretCache(ttl_seconds=60)
+    updated_at = datetime(2026, 1, 1, tzinfo=UTC)
+
+    cache.put(7, updated_at=updated_at, username="dba", password="s3cret")
+    secret = cache._entries[7].secret
+    assert cache.get(7, updated_at=updated_at + timedelta(seconds=1)) is None
+    assert secret == bytearray(len(b"s3cret"))
+
+    cache.put(7, updated_at=updated_at, username="dba", password="s3cret")
+    cache.invalidate(7)
+    assert cache.get(7, check_version=False) is None
+
+    disabled = CredentialSecretCache(ttl_seconds=0)
+    disabled.put(8, updated_at=updated_at, username="dba", password="s3cret")
+    assert disabled.get(8, updated_at=updated_at) is None
+
+
+@pytest.mark.unit
+def test_credential_plain_password_decrypts_once_per_version_and_write_service_invalidates(monkeypatch) -> None:
+    app = create_app(init_scheduler_on_start=False)
+    app.config["TESTING"] = True
+    decrypt_calls: list[str] = []
+    original_decrypt = PasswordManager.decrypt_password
+
+    def _counting_decrypt(self: PasswordManager, encrypted_password: str) -> str:
+        decrypt_calls.append(encrypted_password)
+        return original_decrypt(self, encrypted_password)
+
+    monkeypatch.setattr(PasswordManager, "decrypt_password", _counting_decrypt)
+
+    with app.app_context():
+        db.metadata.create_all(
+            bind=db.engine,
+            tables=[db.metadata.tables["credentials"], db.metadata.tables["instances"]],
+        )
+        credential = Credential(name="cred-1", credential_type="database", username="root", password="Passw0rdA")
+        db.session.add(credential)
+        db.session.commit()
+
+        assert credential.get_plain_password() == "Passw0rdA"
+        assert credential.get_plain_password() == "Passw0rdA"
+        assert len(decrypt_calls) == 1
+
+        credential.set_password("Passw0rdB")
+        assert credential.get_plain_password() == "Passw0rdB"
+        assert len(decrypt_calls) == 2
+
+        CredentialWriteService().delete(int(credential.id))
+        assert credential_secret_cache.get(int(credential.id), check_version=False) is None
+
+
+@pytest.mark.unit
+def test_adapter_uses_cached_credential_without_loading_relationship() -> None:
+    class _LazyInstance:
+        id = 3
+        credential_id = 11
+
+        @property
+        def credential(self) -> Any:
+            raise AssertionError("命中缓存时不应加载 credential 关系")
+
+    credential_secret_cache.put(11, updated_at=None, username="monitor", password="Passw0rdC")
+
+    connection = MySQLConnection(cast(Instance, _LazyInstance()))
+
+    assert connection._resolve_credentials() == ("monitor", "Passw0rdC")